@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import requests
+
+# 🔹 Define the cache location (the repo is read-only on Streamlit Cloud). Responses
+# and quota spent against the offline stand-in APIs are kept apart from the real ones.
+CACHE_NAME = "api_cache_stub.sqlite" if os.environ.get("STUB_SERVER_URL") else "api_cache.sqlite"
+if "STREAMLIT_SERVER" in os.environ:
+    CACHE_PATH = os.path.join("/tmp", CACHE_NAME)
+else:
+    CACHE_PATH = os.path.join(os.path.dirname(__file__), ".cache", CACHE_NAME)
+
+# 🔹 How long a cached response is served before it is fetched again
+CACHE_TTL = int(os.environ.get("API_CACHE_TTL", 6 * 60 * 60))
+
+# 🔹 Daily quota and cost per request of each API. YouTube search.list costs
+# 100 of the default 10,000 daily units; Custom Search allows 100 free queries a day.
+QUOTAS = {
+    "youtube": {"daily_limit": int(os.environ.get("YOUTUBE_DAILY_QUOTA", 10000)), "cost": 100},
+    "google": {"daily_limit": int(os.environ.get("GOOGLE_DAILY_QUOTA", 100)), "cost": 1},
+}
+
+# 🔹 Once this share of a quota is spent, only cached responses are served
+QUOTA_RESERVE = float(os.environ.get("API_QUOTA_RESERVE", 0.9))
+
+# Request parameters that never change the response and must not be stored
+PRIVATE_PARAMS = {"key"}
+
+# Whether this process has created the cache tables yet
+_initialized = False
+_init_lock = threading.Lock()
+
+def _connect():
+    global _initialized
+    with _init_lock:
+        if not _initialized:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            with closing(sqlite3.connect(CACHE_PATH, timeout=30)) as conn, conn:
+                # WAL lets concurrent page fetches read the cache while another one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, endpoint TEXT, query TEXT, params TEXT, body TEXT, fetched_at REAL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS quota ("
+                    "day TEXT, api TEXT, units INTEGER DEFAULT 0, hits INTEGER DEFAULT 0, misses INTEGER DEFAULT 0, "
+                    "PRIMARY KEY (day, api))"
+                )
+            _initialized = True
+
+    conn = sqlite3.connect(CACHE_PATH, timeout=30)
+    # A lost cache write costs at most one refetch, so skip the fsync on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def quota_day():
+    """
+    Returns the current quota day. Google quotas reset at midnight Pacific time.
+    """
+    return datetime.now(ZoneInfo("America/Los_Angeles")).date().isoformat()
+
+def cache_key(endpoint, params):
+    """
+    Returns the cache key for a request: a hash of the endpoint and its public parameters.
+    """
+    public = {k: v for k, v in params.items() if k not in PRIVATE_PARAMS and v is not None}
+    return hashlib.sha256(json.dumps([endpoint, public], sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _record(conn, api, units=0, hits=0, misses=0):
+    conn.execute(
+        "INSERT INTO quota (day, api, units, hits, misses) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT (day, api) DO UPDATE SET units = units + excluded.units, "
+        "hits = hits + excluded.hits, misses = misses + excluded.misses",
+        (quota_day(), api, units, hits, misses),
+    )
+
+def _refund(api, units):
+    # Only successful requests stay charged against the quota
+    with closing(_connect()) as conn, conn:
+        _record(conn, api, units=-units)
+
+def units_spent(api, day=None):
+    """
+    Returns the quota units spent on an API on a day (today by default).
+    """
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT units FROM quota WHERE day = ? AND api = ?", (day or quota_day(), api)
+        ).fetchone()
+    return row[0] if row else 0
+
+def quota_usage(days=30):
+    """
+    Returns the ledger rows (day, api, units, hits, misses) for the most recent days.
+    """
+    with closing(_connect()) as conn:
+        return conn.execute(
+            "SELECT day, api, units, hits, misses FROM quota ORDER BY day DESC, api LIMIT ?",
+            (days * len(QUOTAS),),
+        ).fetchall()
+
+def cached_get(api, endpoint, params, session=None, timeout=10, ttl=CACHE_TTL):
+    """
+    GETs a JSON endpoint through the persistent response cache.
+    Returns the parsed response, or None when the request fails or the quota is
+    nearly spent with nothing cached. Near the quota limit stale responses are
+    served regardless of their age.
+    """
+    key = cache_key(endpoint, params)
+    quota = QUOTAS[api]
+
+    with closing(_connect()) as conn, conn:
+        # Take the write lock before reading the ledger, so the check and the charge
+        # below are one transaction across processes
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("SELECT body, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[1] < ttl:
+            _record(conn, api, hits=1)
+            return json.loads(row[0])
+
+        spent = conn.execute(
+            "SELECT units FROM quota WHERE day = ? AND api = ?", (quota_day(), api)
+        ).fetchone()
+        if (spent[0] if spent else 0) + quota["cost"] > quota["daily_limit"] * QUOTA_RESERVE:
+            if row:
+                _record(conn, api, hits=1)
+                return json.loads(row[0])
+            print(f"Error: daily {api} quota nearly exhausted and no cached response for this request.")
+            return None
+
+        # Charge the units before the request so concurrent requests cannot overshoot the quota
+        _record(conn, api, units=quota["cost"], misses=1)
+
+    try:
+        response = (session or requests).get(endpoint, params=params, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Error: {e}")
+        _refund(api, quota["cost"])
+        return None
+
+    if response.status_code != 200:
+        print(f"Error: {response.status_code}, {response.text}")
+        _refund(api, quota["cost"])
+        return None
+
+    try:
+        data = response.json()
+    except ValueError as e:
+        # A body that is not JSON (e.g. a proxy's error page) is no response to cache
+        print(f"Error: invalid JSON from {api}: {e}")
+        _refund(api, quota["cost"])
+        return None
+
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, endpoint, query, params, body, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                endpoint,
+                params.get("q"),
+                json.dumps({k: v for k, v in params.items() if k not in PRIVATE_PARAMS}, default=str),
+                json.dumps(data),
+                time.time(),
+            ),
+        )
+    return data
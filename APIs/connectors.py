@@ -0,0 +1,18 @@
+import os
+import sys
+
+# Add the API module directories to the system path
+api_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(api_dir, 'youtube_api'))
+sys.path.append(os.path.join(api_dir, 'google_search'))
+
+import youtubeAPI
+import googleAPI
+
+# 🔹 Every search source, keyed by the source name its records carry.
+# A connector is fetch(query, n) and returns an iterator of
+# {"source": ..., "text": ..., "query": ...} records, fetched in-process.
+CONNECTORS = {
+    youtubeAPI.SOURCE: youtubeAPI.fetch,
+    googleAPI.SOURCE: googleAPI.fetch,
+}
@@ -1,80 +1,178 @@
 import requests
 import csv
+import html
 import os
 import sys
-import streamlit as st
-
-# 🔹 Fetch API Key and CX from environment variables or Streamlit secrets
-GOOGLE_SEARCH_API_KEY = os.environ.get("GOOGLE_SEARCH_API_KEY") or st.secrets["GOOGLE_SEARCH_API_KEY"]
-CX = os.environ.get("CX") or st.secrets["CX"]
-BASE_URL = "https://www.googleapis.com/customsearch/v1"
-
-# 🔹 Ensure API Key and CX are available
-if not GOOGLE_SEARCH_API_KEY or not CX:
-    raise ValueError("Missing GOOGLE_SEARCH_API_KEY or GOOGLE_CX environment variables.")
-
-# 🔹 Define the correct output path
-if "STREAMLIT_SERVER" in os.environ:  # Detect if running on Streamlit Cloud
-    OUTPUT_PATH = os.path.join("/tmp", "google_search_results.csv")  # Use /tmp/ on Streamlit
-else:
-    OUTPUT_PATH = os.path.join("data", "google_search_csv", "google_search_results.csv")  # Local path
-
-def get_google_search_titles(query, total_results=100):
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Add the APIs directory to the system path for the shared response cache,
+# and the repository root for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from api_cache import cached_get
+from tracing import span
+
+# 🔹 STUB_SERVER_URL points the connector at the offline stand-in APIs (stubs/server.py)
+STUB_SERVER_URL = os.environ.get("STUB_SERVER_URL")
+BASE_URL = f"{STUB_SERVER_URL or 'https://www.googleapis.com'}/customsearch/v1"
+REQUEST_TIMEOUT = 10  # Seconds to wait for each page
+PAGE_SIZE = 10  # Largest num the Custom Search API accepts
+MAX_RESULTS = 100  # Custom Search never returns results past the 100th
+SOURCE = "GoogleSearch"  # Source name of the records this connector yields
+DEFAULT_RESULTS = 100  # Results fetched per query unless asked otherwise
+
+def get_credentials():
     """
-    Fetch up to 100 Google search results for a given query.
+    Fetch the API key and CX from environment variables or Streamlit secrets.
+    Read on first request, so importing the connector has no side effects.
     """
-    titles = []
-    start_index = 1  # Pagination starts at 1
-
-    while len(titles) < total_results:
-        fetch_count = min(10, total_results - len(titles))  # Google API max per request
-
-        params = {
-            "key": GOOGLE_SEARCH_API_KEY,
-            "cx": CX,
-            "q": query,
-            "start": start_index,  # Pagination index
-            "num": fetch_count  # Max is 10
-        }
-
-        response = requests.get(BASE_URL, params=params)
-
-        if response.status_code == 200:
-            data = response.json()
-            items = data.get("items", [])
-            titles.extend([item["title"] for item in items])
+    api_key = os.environ.get("GOOGLE_SEARCH_API_KEY")
+    cx = os.environ.get("CX")
+    if STUB_SERVER_URL:
+        return api_key or "stub", cx or "stub"  # The stand-in API accepts any credentials
+    if not api_key or not cx:
+        import streamlit as st  # Only needed when the keys are not in the environment
+        api_key = api_key or st.secrets.get("GOOGLE_SEARCH_API_KEY")
+        cx = cx or st.secrets.get("CX")
+
+    # 🔹 Ensure API Key and CX are available
+    if not api_key or not cx:
+        raise ValueError("Missing GOOGLE_SEARCH_API_KEY or GOOGLE_CX environment variables.")
+    return api_key, cx
+
+def get_output_path():
+    """
+    Returns the CSV path for the command-line script, based on environment.
+    """
+    if "STREAMLIT_SERVER" in os.environ:  # Detect if running on Streamlit Cloud
+        return os.path.join("/tmp", "google_search_results.csv")  # Use /tmp/ on Streamlit
+    return os.path.join("data", "google_search_csv", "google_search_results.csv")  # Local path
 
-            # Google API only allows 10 results per page, so increment by 10
-            start_index += 10
+# 🔹 One pooled session shared by every page request, so pages reuse warm connections
+_session = None
 
-            # Stop if there are no more results
-            if not items or len(items) < 10:
-                break
-        else:
-            print(f"Error: {response.status_code}, {response.text}")
-            break
+def get_session(pool_size=10):
+    """
+    Returns the shared HTTP session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+def fetch_google_page(query, start_index, fetch_count):
+    """
+    Fetch one page of Google search results. Returns the list of items, or None on error.
+    """
+    api_key, cx = get_credentials()
+    params = {
+        "key": api_key,
+        "cx": cx,
+        "q": query,
+        "start": start_index,  # Pagination index
+        "num": fetch_count  # Max is 10
+    }
+
+    # Served from the response cache when fresh, or when the daily quota is nearly spent
+    with span("google.search_page", query=query, start=start_index) as s:
+        data = cached_get("google", BASE_URL, params, session=get_session(), timeout=REQUEST_TIMEOUT)
+        s.count("items", len(data.get("items", [])) if data else 0)
+    if data is None:
+        return None
+    return data.get("items", [])
+
+def to_record(item, query):
+    """
+    Converts a search result to a source record: the unescaped title plus the
+    link, publish time (when the page declares one) and site.
+    """
+    metatags = (item.get("pagemap", {}).get("metatags") or [{}])[0]
+    return {
+        "source": SOURCE,
+        "text": html.unescape(item["title"]),
+        "query": query,
+        "id": item.get("link"),
+        "published_at": metatags.get("article:published_time"),
+        "channel": item.get("displayLink"),
+    }
+
+def get_google_search_records(query, total_results=100, max_workers=3):
+    """
+    Fetch up to 100 Google search results for a given query, as records.
+    Every page costs a unit of the daily quota, so the first page is fetched on
+    its own and later pages only while the previous ones came back full, up to
+    max_workers at a time; max_workers=1 fetches them one after another.
+    """
+    total_results = min(total_results, MAX_RESULTS)
+
+    # Missing credentials yield no results, like an exhausted quota, instead of failing the caller
+    try:
+        get_credentials()
+    except Exception as e:
+        print(f"Error: {e}")
+        return []
+
+    # Pagination starts at 1 and each page holds at most 10 results
+    pages = [
+        (start_index, min(PAGE_SIZE, total_results - start_index + 1))
+        for start_index in range(1, total_results + 1, PAGE_SIZE)
+    ]
+
+    records = []
+    get_session()  # Create the shared session before the workers race for it
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The first page is its own batch: most queries with few results end there
+        batches = [pages[:1]] + [pages[i:i + max_workers] for i in range(1, len(pages), max_workers)]
+        for batch in batches:
+            results = executor.map(lambda page: fetch_google_page(query, *page), batch)
+
+            # Merge in rank order, stopping at the first failed or short page
+            for (_, count), items in zip(batch, results):
+                if items is None:
+                    return records
+                records.extend([to_record(item, query) for item in items])
+                if len(items) < count:
+                    return records
+
+    return records
+
+def get_google_search_titles(query, total_results=100, max_workers=3):
+    """
+    Fetch up to 100 Google search result titles for a given query.
+    """
+    return [record["text"] for record in get_google_search_records(query, total_results, max_workers)]
 
-    return titles
+def fetch(query, n=DEFAULT_RESULTS):
+    """
+    Connector interface: returns an iterator over up to n records for a query, in rank order.
+    """
+    return iter(get_google_search_records(query, total_results=n))
 
 def save_titles_to_csv(titles):
     """
     Saves the Google search results to the correct path based on environment.
     """
-    directory = os.path.dirname(OUTPUT_PATH)
+    output_path = get_output_path()
+    directory = os.path.dirname(output_path)
 
     # Ensure the output directory exists (only for local use)
     if "STREAMLIT_SERVER" not in os.environ:
         os.makedirs(directory, exist_ok=True)
 
     # Save titles to a CSV file
-    with open(OUTPUT_PATH, mode="w", newline="", encoding="utf-8") as file:
+    with open(output_path, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
-        writer.writerow(["GoogleSearch"])  # Add a header
+        writer.writerow([SOURCE])  # Add a header
         for title in titles:
             writer.writerow([title])
 
-    print(f"✅ Google search titles saved to: {OUTPUT_PATH}")
-    return OUTPUT_PATH
+    print(f"✅ Google search titles saved to: {output_path}")
+    return output_path
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -82,10 +180,10 @@ if __name__ == "__main__":
         sys.exit(1)
 
     query = sys.argv[1]
-    total_results = 100  # Default to fetching 100 results
+    total_results = DEFAULT_RESULTS
 
     # Fetch Google search titles and save them to the correct path
-    titles = get_google_search_titles(query, total_results=total_results)
+    titles = (record["text"] for record in fetch(query, total_results))
     csv_file = save_titles_to_csv(titles)
 
     # If running on Streamlit, provide a download link
@@ -1,76 +1,206 @@
 import requests
 import csv
+import html
 import os
 import sys
-import streamlit as st
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
-# 🔹 Fetch API Key from environment variables
-YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY") or st.secrets["YOUTUBE_API_KEY"]
-BASE_URL = "https://www.googleapis.com/youtube/v3/search"
+# Add the APIs directory to the system path for the shared response cache,
+# and the repository root for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-# 🔹 Ensure API Key is available
-if not YOUTUBE_API_KEY:
-    raise ValueError("Missing API_KEY environment variable.")
+from api_cache import cached_get
+from tracing import span
 
-# 🔹 Define the correct output path
-if "STREAMLIT_SERVER" in os.environ:  # Detect if running on Streamlit Cloud
-    OUTPUT_PATH = os.path.join("/tmp", "youtube_titles.csv")  # Use /tmp/ on Streamlit
-else:
-    OUTPUT_PATH = os.path.join("data", "youtube_csv", "youtube_titles.csv")  # Local path
+# 🔹 STUB_SERVER_URL points the connector at the offline stand-in APIs (stubs/server.py)
+STUB_SERVER_URL = os.environ.get("STUB_SERVER_URL")
+BASE_URL = f"{STUB_SERVER_URL or 'https://www.googleapis.com'}/youtube/v3/search"
+REQUEST_TIMEOUT = 10  # Seconds to wait for each page
+MAX_PAGE_SIZE = 50  # Largest maxResults the search endpoint accepts
+SOURCE = "YouTubeSearch"  # Source name of the records this connector yields
+DEFAULT_RESULTS = 300  # Titles fetched per query unless asked otherwise
 
-def get_youtube_titles(query, max_results=50, total_results=500, order="relevance"):
+def get_api_key():
     """
-    Fetch YouTube video titles based on a search query.
+    Fetch the API key from environment variables or Streamlit secrets.
+    Read on first request, so importing the connector has no side effects.
+    """
+    api_key = os.environ.get("YOUTUBE_API_KEY")
+    if not api_key and STUB_SERVER_URL:
+        return "stub"  # The stand-in API accepts any key
+    if not api_key:
+        import streamlit as st  # Only needed when the key is not in the environment
+        api_key = st.secrets.get("YOUTUBE_API_KEY")
+
+    # 🔹 Ensure API Key is available
+    if not api_key:
+        raise ValueError("Missing YOUTUBE_API_KEY environment variable.")
+    return api_key
+
+def get_output_path():
+    """
+    Returns the CSV path for the command-line script, based on environment.
+    """
+    if "STREAMLIT_SERVER" in os.environ:  # Detect if running on Streamlit Cloud
+        return os.path.join("/tmp", "youtube_titles.csv")  # Use /tmp/ on Streamlit
+    return os.path.join("data", "youtube_csv", "youtube_titles.csv")  # Local path
+
+# 🔹 One pooled session shared by every query, so pages reuse warm connections
+_session = None
+
+def get_session(pool_size=10):
+    """
+    Returns the shared HTTP session, creating it on first use.
     """
-    titles = []
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+def to_record(item, query):
+    """
+    Converts a search result to a source record: the unescaped title plus the
+    video ID, publish time and channel.
+    """
+    snippet = item["snippet"]
+    return {
+        "source": SOURCE,
+        "text": html.unescape(snippet["title"]),
+        "query": query,
+        "id": item.get("id", {}).get("videoId"),
+        "published_at": snippet.get("publishedAt"),
+        "channel": snippet.get("channelTitle"),
+    }
+
+def iter_youtube_records(query, max_results=MAX_PAGE_SIZE, total_results=500, order="relevance"):
+    """
+    Yield YouTube video records for a search query as each page arrives.
+    Every page needs the nextPageToken of the previous one, so the pages of a
+    single query are fetched in sequence; use stream_youtube_records to overlap queries.
+    """
+    session = get_session()
+    fetched = 0
     next_page_token = None
 
-    while len(titles) < total_results:
-        fetch_count = min(max_results, total_results - len(titles))
+    while fetched < total_results:
+        fetch_count = min(max_results, total_results - fetched)
 
         params = {
             "part": "snippet",
             "q": query,
             "maxResults": fetch_count,
             "type": "video",
-            "key": YOUTUBE_API_KEY,
+            "key": get_api_key(),
             "order": order,
             "pageToken": next_page_token,
         }
 
-        response = requests.get(BASE_URL, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            items = data.get("items", [])
-            titles.extend([item["snippet"]["title"] for item in items])
-            next_page_token = data.get("nextPageToken")
-            if not items or not next_page_token:
-                break
-        else:
-            print(f"Error: {response.status_code}, {response.text}")
+        # Served from the response cache when fresh, or when the daily quota is nearly spent
+        with span("youtube.search_page", query=query) as s:
+            data = cached_get("youtube", BASE_URL, params, session=session, timeout=REQUEST_TIMEOUT)
+            s.count("items", len(data.get("items", [])) if data else 0)
+        if data is None:
+            break
+
+        items = data.get("items", [])
+        for item in items:
+            fetched += 1
+            yield to_record(item, query)
+        next_page_token = data.get("nextPageToken")
+        if not items or not next_page_token:
             break
 
-    return titles
+def iter_youtube_titles(query, max_results=MAX_PAGE_SIZE, total_results=500, order="relevance"):
+    """
+    Yield YouTube video titles for a search query as each page arrives.
+    """
+    for record in iter_youtube_records(query, max_results=max_results, total_results=total_results, order=order):
+        yield record["text"]
+
+def get_youtube_titles(query, max_results=MAX_PAGE_SIZE, total_results=500, order="relevance"):
+    """
+    Fetch YouTube video titles based on a search query.
+    """
+    return list(iter_youtube_titles(query, max_results=max_results, total_results=total_results, order=order))
+
+def stream_youtube_records(queries, total_results=500, order="relevance", max_workers=4):
+    """
+    Fetch several queries (e.g. ticker, company name, CEO) concurrently over the
+    shared session and yield their records in arrival order.
+    """
+    # Missing credentials yield no results, like an exhausted quota, instead of failing the caller
+    try:
+        get_api_key()
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    get_session()  # Create the shared session before the workers race for it
+    results = queue.Queue()
+    finished = object()
+
+    def fetch(query):
+        try:
+            for record in iter_youtube_records(query, total_results=total_results, order=order):
+                results.put(record)
+        except Exception as e:
+            print(f"Error fetching YouTube results for '{query}': {e}")
+        finally:
+            results.put(finished)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for query in queries:
+            executor.submit(fetch, query)
+
+        remaining = len(queries)
+        while remaining:
+            item = results.get()
+            if item is finished:
+                remaining -= 1
+            else:
+                yield item
+
+def stream_youtube_titles(queries, total_results=500, order="relevance", max_workers=4):
+    """
+    Fetch several queries concurrently and yield (query, title) pairs in arrival order.
+    """
+    for record in stream_youtube_records(queries, total_results=total_results, order=order, max_workers=max_workers):
+        yield record["query"], record["text"]
+
+def fetch(query, n=DEFAULT_RESULTS):
+    """
+    Connector interface: yields up to n records per query as they arrive.
+    query is a search string, or a list of them to fetch concurrently.
+    """
+    queries = [query] if isinstance(query, str) else list(query)
+    return stream_youtube_records(queries, total_results=n)
 
 def save_titles_to_csv(titles):
     """
     Saves the YouTube search results to the correct path based on environment.
     """
-    directory = os.path.dirname(OUTPUT_PATH)
+    output_path = get_output_path()
+    directory = os.path.dirname(output_path)
     
     # Ensure the output directory exists (only for local use)
     if "STREAMLIT_SERVER" not in os.environ:
         os.makedirs(directory, exist_ok=True)
 
     # Save titles to a CSV file
-    with open(OUTPUT_PATH, mode="w", newline="", encoding="utf-8") as file:
+    with open(output_path, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
-        writer.writerow(["YouTubeSearch"])  # Add a header
+        writer.writerow([SOURCE])  # Add a header
         for title in titles:
             writer.writerow([title])
     
-    print(f"✅ YouTube search titles saved to: {OUTPUT_PATH}")
-    return OUTPUT_PATH
+    print(f"✅ YouTube search titles saved to: {output_path}")
+    return output_path
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -78,10 +208,10 @@ if __name__ == "__main__":
         sys.exit(1)
 
     query = sys.argv[1]
-    total_results = 300  # Default to fetching 5 results
+    total_results = DEFAULT_RESULTS
 
-    # Fetch YouTube titles and save them to the correct path
-    titles = get_youtube_titles(query, total_results=total_results)
+    # Stream YouTube titles to the correct path as the pages arrive
+    titles = (record["text"] for record in fetch(query, total_results))
     csv_file = save_titles_to_csv(titles)
 
     # If running on Streamlit, provide a download link
@@ -2,9 +2,13 @@ import csv
 import os
 import sys
 from datetime import datetime, timedelta
-import yfinance as yf
 import math
 
+# Add the repository root to the system path for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from tracing import span
+
 # Function to parse date from string
 def parse_date(date_str):
     if not date_str or date_str.strip() == '':
@@ -16,6 +20,22 @@ def parse_date(date_str):
 
 # Function to fetch market capitalization data
 def fetch_market_cap(ticker):
+    stub_url = os.environ.get("STUB_SERVER_URL")
+    if stub_url:
+        # The offline stand-in APIs (stubs/server.py) answer in the layout of Yahoo's quote endpoint
+        import requests
+        try:
+            response = requests.get(f"{stub_url}/v7/finance/quote", params={"symbols": ticker}, timeout=10)
+        except requests.RequestException as e:
+            print(f"Error fetching market cap for {ticker}: {e}")
+            return None
+        if response.status_code != 200:
+            # Injected 503s and 429s leave the market cap unknown, as a failed live lookup does
+            print(f"Error fetching market cap for {ticker}: {response.status_code}")
+            return None
+        return response.json()['quoteResponse']['result'][0]['marketCap']
+
+    import yfinance as yf  # Only needed for live lookups
     stock = yf.Ticker(ticker)
     return stock.info['marketCap']
 
@@ -28,14 +48,17 @@ def normalize_score(score, max_score):
     return max(min(score / max_score, 1), -1)
 
 # Function to process Form 4 data and generate summary CSV
-def process_form4_data(ticker, output_csv):
+# input_csv defaults to the transactions written by read_xml.py, and as_of to now
+def process_form4_data(ticker, output_csv, input_csv=None, as_of=None):
     base_dir = os.path.dirname(__file__)
-    input_csv = os.path.join(base_dir, '..', '..', 'data', 'form4transactions', 'transactions', 'form4_data.csv')
+    if input_csv is None:
+        input_csv = os.path.join(base_dir, '..', '..', 'data', 'form4transactions', 'transactions', 'form4_data.csv')
 
     # Fetch market capitalization data for the specific company
-    market_cap = fetch_market_cap(ticker)
+    with span("market_cap.fetch", ticker=ticker):
+        market_cap = fetch_market_cap(ticker)
 
-    today = datetime.now()
+    today = as_of or datetime.now()
     six_months_ago = today - timedelta(days=183)
 
     stats = {
@@ -129,4 +152,5 @@ if __name__ == '__main__':
 
     ticker = sys.argv[1]
     output_csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'form4transactions', 'summary', 'summary_data.csv')
-    process_form4_data(ticker, output_csv_path)
\ No newline at end of file
+    with span("sec.summarize", ticker=ticker):
+        process_form4_data(ticker, output_csv_path)
\ No newline at end of file
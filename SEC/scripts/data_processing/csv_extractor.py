@@ -1,17 +1,28 @@
 import requests
 import pandas as pd
 import os
-from tickers_ciks import tickers_ciks
+import sys
 from datetime import datetime, timedelta
 
+# Add the repository root to the system path for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from tracing import span
+
+# STUB_SERVER_URL points EDGAR requests at the offline stand-in APIs (stubs/server.py)
+EDGAR_DATA_URL = os.environ.get("STUB_SERVER_URL", "https://data.sec.gov")
+
 # Define a function to fetch data from EDGAR for a given ticker's CIK
 def fetch_edgar_data(cik):
-    url = f"https://data.sec.gov/submissions/CIK{cik}.json"
+    url = f"{EDGAR_DATA_URL}/submissions/CIK{cik}.json"
     headers = {
         'User-Agent': 'Alexander Kokiauri akokiauri.ieu2022@student.ie.edu'
     }
 
-    response = requests.get(url, headers=headers)
+    with span("edgar.fetch_submissions", cik=cik) as s:
+        response = requests.get(url, headers=headers)
+        s.set(status=response.status_code)
+        s.count("bytes", len(response.content))
     if response.status_code == 200:
         data = response.json()
 
@@ -59,7 +70,7 @@ def save_filings_to_csv(stock_symbol, form_4_df):
     print(f"Saved filings for {stock_symbol} to {csv_file_path}")
 
 # # Loop through each ticker and fetch the Form 4 filings
-# for ticker, cik in tickers_ciks.items():
+# for ticker, cik, _, _ in iter_companies():
 #     form_4_df = fetch_edgar_data(cik)
 
 #     if not form_4_df.empty:
@@ -0,0 +1,166 @@
+import io
+import json
+import os
+import sys
+import zipfile
+import pandas as pd
+from datetime import datetime, timedelta
+
+# Define paths
+base_dir = os.path.dirname(__file__)
+index_dir = os.path.join(base_dir, '..', '..', 'data', 'index')
+index_csv = os.path.join(index_dir, 'form4_index.csv')
+
+INDEX_COLUMNS = ['CIK', 'filingDate', 'accessionNumber', 'primaryDocument']
+
+# Loaded indexes, keyed by path, so a portfolio run reads the index file once
+_loaded_indexes = {}
+
+def parse_idx_file(file_path):
+    """
+    Yields Form 4 rows from an EDGAR daily/quarterly index file.
+    Handles the pipe-delimited master index and the fixed-width form index.
+    """
+    with open(file_path, 'r', encoding='latin-1') as file:
+        for line in file:
+            line = line.rstrip()
+            if '|' in line:
+                # master.idx: CIK|Company Name|Form Type|Date Filed|Filename
+                parts = line.split('|')
+                if len(parts) != 5:
+                    continue
+                cik, _, form, date_filed, filename = parts
+            else:
+                # form.idx: Form Type, Company Name, CIK, Date Filed, File Name
+                parts = line.split()
+                if len(parts) < 5:
+                    continue
+                form, cik, date_filed, filename = parts[0], parts[-3], parts[-2], parts[-1]
+
+            if form != '4' or not cik.isdigit():
+                continue
+
+            # Daily indexes use YYYYMMDD, quarterly ones YYYY-MM-DD
+            if len(date_filed) == 8 and date_filed.isdigit():
+                date_filed = f"{date_filed[:4]}-{date_filed[4:6]}-{date_filed[6:]}"
+
+            # Filename looks like edgar/data/320193/0000320193-24-000084.txt
+            document = filename.split('/')[-1]
+            yield {
+                'CIK': cik.zfill(10),
+                'filingDate': date_filed,
+                'accessionNumber': os.path.splitext(document)[0],
+                # The index only knows the full submission text, not the rendered form;
+                # read_csv.py skips these rows
+                'primaryDocument': document,
+            }
+
+def parse_submissions_json(data):
+    """
+    Yields Form 4 rows from one bulk submissions JSON document.
+    Main files nest the filings under filings.recent, paged files hold the columns directly.
+    """
+    if not data.get('cik'):
+        return
+
+    cik = str(data['cik']).zfill(10)
+    filings_data = data.get('filings', {}).get('recent', data)
+
+    for form, accession, filing_date, document in zip(
+        filings_data.get('form', []),
+        filings_data.get('accessionNumber', []),
+        filings_data.get('filingDate', []),
+        filings_data.get('primaryDocument', []),
+    ):
+        if form == '4':
+            yield {
+                'CIK': cik,
+                'filingDate': filing_date,
+                'accessionNumber': accession,
+                'primaryDocument': document,
+            }
+
+def iter_submissions(path):
+    """
+    Yields parsed submissions JSON documents from a submissions.zip archive or a single JSON file.
+    """
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.endswith('.json'):
+                    with archive.open(name) as file:
+                        data = json.load(io.TextIOWrapper(file, encoding='utf-8'))
+                    # Paged files (CIK##########-submissions-001.json) carry no CIK field
+                    data.setdefault('cik', os.path.basename(name)[3:13])
+                    yield data
+    else:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        data.setdefault('cik', os.path.basename(path)[3:13])
+        yield data
+
+def build_form4_index(source_dir, output_csv=index_csv):
+    """
+    Builds an index of Form 4 filings by CIK and filing date from the EDGAR files in source_dir.
+    Reads *.idx form/master index files and submissions.zip / CIK*.json bulk submissions files.
+    Submissions entries win over index entries for the same accession, since they
+    carry the primaryDocument of the rendered form that read_xml.py parses.
+    """
+    filings = {}
+
+    for dirpath, _, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            file_path = os.path.join(dirpath, filename)
+            if filename.endswith('.idx'):
+                for row in parse_idx_file(file_path):
+                    filings.setdefault(row['accessionNumber'], row)
+            elif filename.endswith('.zip') or (filename.startswith('CIK') and filename.endswith('.json')):
+                for data in iter_submissions(file_path):
+                    for row in parse_submissions_json(data):
+                        filings[row['accessionNumber']] = row
+
+    index_df = pd.DataFrame(list(filings.values()), columns=INDEX_COLUMNS)
+    index_df = index_df.sort_values(['CIK', 'filingDate'], ascending=[True, False])
+
+    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+    index_df.to_csv(output_csv, index=False)
+    _loaded_indexes.pop(output_csv, None)
+
+    print(f"Indexed {len(index_df)} Form 4 filings for {index_df['CIK'].nunique()} CIKs to '{output_csv}'.")
+    return index_df
+
+def load_form4_index(path=index_csv):
+    """
+    Loads a Form 4 index built by build_form4_index, grouped by CIK for fast lookups.
+    """
+    if path not in _loaded_indexes:
+        index_df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        _loaded_indexes[path] = {cik: group for cik, group in index_df.groupby('CIK')}
+    return _loaded_indexes[path]
+
+def fetch_index_filings(cik, index=None, days=6*30):
+    """
+    Returns the recent Form 4 filings for a CIK from the local index,
+    in the same shape as csv_extractor.fetch_edgar_data.
+    """
+    if index is None:
+        index = load_form4_index()
+
+    filings_df = index.get(str(cik).zfill(10))
+    if filings_df is None:
+        return pd.DataFrame(columns=INDEX_COLUMNS + ['form'])
+
+    filings_df = filings_df.copy()
+    filings_df['form'] = '4'
+    filings_df['filingDate'] = pd.to_datetime(filings_df['filingDate'])
+
+    # Filter for filings in the same window as the submissions API path
+    cutoff = datetime.now() - timedelta(days=days)
+    return filings_df[filings_df['filingDate'] >= cutoff].reset_index(drop=True)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python edgar_index.py <edgar_files_dir>")
+        sys.exit(1)
+
+    build_form4_index(sys.argv[1])
@@ -1,9 +1,18 @@
 import pandas as pd
 import os
 import sys
-from tickers_ciks import tickers_ciks  # Import the ticker and CIK mapping
+from ticker_lookup import get_cik  # Import the ticker to CIK lookup
+from edgar_index import fetch_index_filings, load_form4_index
 
-def process_ticker(ticker):
+# STUB_SERVER_URL points the filing downloads at the offline stand-in APIs (stubs/server.py)
+EDGAR_ARCHIVES_URL = os.environ.get("STUB_SERVER_URL", "https://www.sec.gov")
+
+def process_ticker(ticker, index_path=None):
+    """
+    Builds the combined filings CSV with XML URLs for a ticker.
+    Filings come from the ticker's saved submissions CSV, or from a local
+    Form 4 index (see edgar_index.py) when index_path is given.
+    """
     # Define the folder containing the CSVs for each ticker
     filings_folder = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'CSV', 'raw')
 
@@ -11,18 +20,35 @@ def process_ticker(ticker):
     combined_df = pd.DataFrame()
 
     # Get the CIK for the given ticker
-    cik = tickers_ciks.get(ticker.upper())
+    cik = get_cik(ticker)
     if not cik:
-        print(f"Ticker {ticker} not found in tickers_ciks.")
+        print(f"Ticker {ticker} not found in the SEC ticker lookup.")
         return
 
     csv_file_path = os.path.join(filings_folder, f"{ticker}_form_4_filings.csv")
 
-    # Check if the file exists before attempting to load it
-    if os.path.exists(csv_file_path):
+    if index_path:
+        # Resolve the filings from the local index instead of the per-ticker CSV
+        filings_df = fetch_index_filings(cik, load_form4_index(index_path))
+        if filings_df.empty:
+            print(f"No Form 4 filings for {ticker} in index '{index_path}'")
+    elif os.path.exists(csv_file_path):
         # Load the CSV file
         filings_df = pd.read_csv(csv_file_path)
+    else:
+        filings_df = None
+
+    # Entries only found in master/form indexes point at the full submission text,
+    # not a Form 4 XML document that read_xml.py can parse
+    if filings_df is not None and not filings_df.empty:
+        is_text = filings_df['primaryDocument'].astype(str).str.endswith('.txt')
+        if is_text.any():
+            print(f"Warning: skipping {is_text.sum()} filings of {ticker} without a Form 4 XML document. "
+                  "Build the index with the submissions files to include them.")
+            filings_df = filings_df[~is_text].copy()
 
+    # Check if we have filings before attempting to process them
+    if filings_df is not None and not filings_df.empty:
         # Add the ticker and CIK to the DataFrame for identification
         filings_df['Ticker'] = ticker
         filings_df['CIK'] = cik
@@ -30,27 +56,30 @@ def process_ticker(ticker):
         # Construct the URL for each filing
         filings_df['accessionNumber'] = filings_df['accessionNumber'].str.replace("-", "")
         filings_df['xml_url'] = filings_df.apply(
-            lambda row: f"https://www.sec.gov/Archives/edgar/data/{row['CIK']}/{row['accessionNumber']}/{row['primaryDocument']}",
+            lambda row: f"{EDGAR_ARCHIVES_URL}/Archives/edgar/data/{row['CIK']}/{row['accessionNumber']}/{row['primaryDocument']}",
             axis=1
         )
 
         # Append to the combined DataFrame
         combined_df = pd.concat([combined_df, filings_df], ignore_index=True)
-    else:
+    elif filings_df is None:
         print(f"CSV file for {ticker} not found at {csv_file_path}")
 
     # Define the output file path
     output_file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'CSV', 'combined', 'filings.csv')
 
     # Save the combined DataFrame with URLs to a new CSV for further processing
-    combined_df.to_csv(output_file_path, columns=['Ticker', 'CIK', 'accessionNumber', 'xml_url'], index=False)
+    # reindex keeps the header when no filings were found
+    combined_df.reindex(columns=['Ticker', 'CIK', 'accessionNumber', 'xml_url']).to_csv(output_file_path, index=False)
 
     print(f"Combined CIK, filings data, and URLs saved to '{output_file_path}'.")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python read_csv.py <ticker>")
+    if len(sys.argv) not in (2, 4) or (len(sys.argv) == 4 and sys.argv[2] != "--index"):
+        print("Usage: python read_csv.py <ticker> [--index <form4_index.csv>]")
         sys.exit(1)
 
     ticker = sys.argv[1]
-    process_ticker(ticker)
+    index_path = sys.argv[3] if len(sys.argv) == 4 else None
+    process_ticker(ticker, index_path)
+
@@ -2,7 +2,11 @@ import os
 import csv
 import sys
 from bs4 import BeautifulSoup
-from tickers_ciks import tickers_ciks  # Import tickers_ciks
+
+# Add the repository root to the system path for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from tracing import span
 
 # Define paths
 base_dir = os.path.dirname(__file__)
@@ -118,7 +122,9 @@ def save_form4_data_to_csv(xml_dir, output_csv, ticker):
         for xml_file in os.listdir(xml_dir):
             if xml_file.endswith('.xml') and xml_file.startswith(ticker):
                 xml_path = os.path.join(xml_dir, xml_file)
-                all_transactions = extract_form4_data(xml_path)
+                with span("form4.parse", file=xml_file) as s:
+                    all_transactions = extract_form4_data(xml_path)
+                    s.count("transactions", len(all_transactions))
                 if all_transactions:
                     for tx in all_transactions:
                         writer.writerow(tx)
@@ -131,4 +137,5 @@ if __name__ == '__main__':
         sys.exit(1)
 
     ticker = sys.argv[1]
-    save_form4_data_to_csv(xml_dir, output_csv, ticker)
\ No newline at end of file
+    with span("sec.read_xml", ticker=ticker):
+        save_form4_data_to_csv(xml_dir, output_csv, ticker)
\ No newline at end of file
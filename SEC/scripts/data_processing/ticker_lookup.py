@@ -0,0 +1,188 @@
+import json
+import mmap
+import os
+import struct
+import sys
+
+# Define paths
+base_dir = os.path.dirname(__file__)
+json_path = os.path.join(base_dir, '..', '..', 'data', 'company_tickers.json')
+lookup_path = os.path.join(base_dir, '..', '..', 'data', 'company_tickers.bin')
+
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# File layout (little-endian):
+#   header: magic, record count, offset of the CIK table, offset of the titles blob
+#   ticker table: one record per ticker, sorted by ticker
+#   CIK table: (cik, ticker record index), sorted by CIK then market-cap rank
+#   titles blob: UTF-8 company titles referenced by the ticker records
+MAGIC = b'TKR1'
+HEADER = struct.Struct('<4sIII')
+TICKER_RECORD = struct.Struct('<12sIIIH')  # ticker, cik, rank, title offset, title length
+CIK_RECORD = struct.Struct('<II')  # cik, ticker record index
+
+# The memory-mapped lookup file, opened on first use
+_lookup = None
+
+def build_lookup(source_json=json_path, output_path=lookup_path):
+    """
+    Builds the binary ticker/CIK/title lookup file from SEC's company_tickers.json.
+    """
+    with open(source_json, 'r', encoding='utf-8') as file:
+        company_tickers = json.load(file)
+
+    # The JSON keys are the SEC's market-cap ranks ("0", "1", ...)
+    companies = sorted(
+        (info['ticker'].strip().upper(), int(info['cik_str']), int(rank), info['title'])
+        for rank, info in company_tickers.items()
+    )
+
+    ticker_table = bytearray()
+    titles_blob = bytearray()
+    for ticker, cik, rank, title in companies:
+        encoded_title = title.encode('utf-8')
+        ticker_table += TICKER_RECORD.pack(ticker.encode('utf-8'), cik, rank, len(titles_blob), len(encoded_title))
+        titles_blob += encoded_title
+
+    # Within a CIK the lowest rank comes first, so CIK -> ticker returns the primary listing
+    cik_order = sorted(range(len(companies)), key=lambda i: (companies[i][1], companies[i][2]))
+    cik_table = b''.join(CIK_RECORD.pack(companies[i][1], i) for i in cik_order)
+
+    cik_offset = HEADER.size + len(ticker_table)
+    titles_offset = cik_offset + len(cik_table)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(companies), cik_offset, titles_offset))
+        file.write(ticker_table)
+        file.write(cik_table)
+        file.write(titles_blob)
+
+    reset_lookup()
+    print(f"Saved lookup for {len(companies)} tickers to '{output_path}'")
+
+def refresh_lookup():
+    """
+    Downloads the latest company_tickers.json from the SEC and rebuilds the lookup file.
+    """
+    import requests
+
+    headers = {'User-Agent': 'Alexander Kokiauri akokiauri.ieu2022@student.ie.edu'}
+    response = requests.get(COMPANY_TICKERS_URL, headers=headers, timeout=30)
+    response.raise_for_status()
+
+    with open(json_path, 'wb') as file:
+        file.write(response.content)
+    build_lookup()
+
+def reset_lookup():
+    """
+    Closes the mapped lookup file so the next lookup reopens it.
+    """
+    global _lookup
+    if _lookup is not None:
+        _lookup[0].close()
+        _lookup = None
+
+def _get_lookup():
+    """
+    Opens (building it first if needed) and memory-maps the lookup file.
+    """
+    global _lookup
+    if _lookup is None:
+        if not os.path.exists(lookup_path):
+            build_lookup()
+        with open(lookup_path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, cik_offset, titles_offset = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            mapped.close()
+            raise ValueError(f"'{lookup_path}' is not a ticker lookup file.")
+        _lookup = (mapped, count, cik_offset, titles_offset)
+    return _lookup
+
+def _read_ticker_record(index):
+    mapped, _, _, titles_offset = _get_lookup()
+    ticker, cik, rank, title_offset, title_len = TICKER_RECORD.unpack_from(
+        mapped, HEADER.size + index * TICKER_RECORD.size
+    )
+    start = titles_offset + title_offset
+    title = mapped[start:start + title_len].decode('utf-8')
+    return ticker.rstrip(b'\0').decode('utf-8'), str(cik).zfill(10), title, rank
+
+def _find_ticker(ticker):
+    """
+    Binary search of the ticker table. Returns the record index, or None.
+    """
+    mapped, count, _, _ = _get_lookup()
+    key = ticker.strip().upper().encode('utf-8')
+    if not key or len(key) > 12:
+        return None
+    key = key.ljust(12, b'\0')
+
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        offset = HEADER.size + middle * TICKER_RECORD.size
+        if mapped[offset:offset + 12] < key:
+            low = middle + 1
+        else:
+            high = middle
+    offset = HEADER.size + low * TICKER_RECORD.size
+    if low < count and mapped[offset:offset + 12] == key:
+        return low
+    return None
+
+def get_cik(ticker):
+    """
+    Returns the zero-padded 10-digit CIK for a ticker, or None if unknown.
+    """
+    index = _find_ticker(ticker)
+    return _read_ticker_record(index)[1] if index is not None else None
+
+def get_title(ticker):
+    """
+    Returns the company title for a ticker, or None if unknown.
+    """
+    index = _find_ticker(ticker)
+    return _read_ticker_record(index)[2] if index is not None else None
+
+def get_ticker(cik):
+    """
+    Returns the primary (highest market-cap) ticker for a CIK, or None if unknown.
+    """
+    mapped, count, cik_offset, _ = _get_lookup()
+    cik = int(cik)
+
+    # Binary search for the first record of this CIK
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if CIK_RECORD.unpack_from(mapped, cik_offset + middle * CIK_RECORD.size)[0] < cik:
+            low = middle + 1
+        else:
+            high = middle
+    if low < count:
+        record_cik, index = CIK_RECORD.unpack_from(mapped, cik_offset + low * CIK_RECORD.size)
+        if record_cik == cik:
+            return _read_ticker_record(index)[0]
+    return None
+
+def iter_companies():
+    """
+    Yields (ticker, cik, title, rank) for every ticker in the lookup, sorted by ticker.
+    Rank is the SEC's market-cap ordering, 0 being the largest company.
+    """
+    _, count, _, _ = _get_lookup()
+    for index in range(count):
+        yield _read_ticker_record(index)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ("build", "refresh"):
+        print("Usage: python ticker_lookup.py <build|refresh>")
+        sys.exit(1)
+
+    if sys.argv[1] == "refresh":
+        refresh_lookup()
+    else:
+        build_lookup()
@@ -0,0 +1,148 @@
+import os
+import pickle
+import re
+import sys
+from array import array
+from collections import Counter
+from ticker_lookup import iter_companies, lookup_path
+
+# Define paths
+base_dir = os.path.dirname(__file__)
+index_path = os.path.join(base_dir, '..', '..', 'data', 'company_search.pkl')
+
+INDEX_VERSION = 3
+
+# Words that appear in most titles and carry no signal for matching
+STOP_WORDS = {'inc', 'corp', 'co', 'corporation', 'company', 'ltd', 'plc', 'llc', 'the', 'de', 'sa', 'ag', 'nv'}
+
+# The loaded search index, built or unpickled on first use
+_index = None
+
+def normalize(text):
+    """
+    Lowercases text and reduces it to space-separated alphanumeric words without stop words.
+    """
+    words = re.findall(r'[a-z0-9]+', text.lower().replace('&', ' and '))
+    return ' '.join(word for word in words if word not in STOP_WORDS)
+
+def trigrams(text):
+    """
+    Returns the set of character trigrams of normalized text, with each word padded
+    at its start only. Padding the end too would make a query word that is a
+    prefix of a longer word ('micro' in 'microsoft') miss its last trigram, so
+    autocomplete would favour titles where the word ends there.
+    """
+    grams = set()
+    for word in text.split():
+        padded = f" {word}"
+        if len(padded) < 3:
+            grams.add(padded)  # A one-letter word is its own gram
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def build_index(output_path=index_path):
+    """
+    Builds the trigram index over every ticker and company title in the ticker lookup.
+    """
+    companies = []
+    postings = {}
+
+    for ticker, cik, title, rank in iter_companies():
+        entry_id = len(companies)
+        name = normalize(title)
+        grams = trigrams(f"{name} {ticker.lower()}")
+        companies.append((ticker, cik, title, rank, name, len(grams)))
+        for gram in grams:
+            postings.setdefault(gram, array('I')).append(entry_id)
+
+    index = {
+        'version': INDEX_VERSION,
+        'companies': companies,
+        'postings': postings,
+        'tickers': {company[0]: entry_id for entry_id, company in enumerate(companies)},
+    }
+
+    # Caching is best effort, the index still works in memory on a read-only deploy
+    try:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as file:
+            pickle.dump(index, file, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"Saved search index for {len(companies)} companies to '{output_path}'")
+    except OSError as e:
+        print(f"Could not cache search index to '{output_path}': {e}")
+
+    return index
+
+def load_index():
+    """
+    Loads the cached search index, rebuilding it if it is missing or older than the ticker lookup.
+    """
+    global _index
+    if _index is None:
+        index = None
+        # Without the ticker lookup file the cached index cannot be stale
+        lookup_mtime = os.path.getmtime(lookup_path) if os.path.exists(lookup_path) else 0
+        if os.path.exists(index_path) and os.path.getmtime(index_path) >= lookup_mtime:
+            with open(index_path, 'rb') as file:
+                index = pickle.load(file)
+        if index is None or index.get('version') != INDEX_VERSION:
+            index = build_index()
+        _index = index
+    return _index
+
+def search(query, limit=10, index=None):
+    """
+    Resolves a ticker or (partial) company name to ranked suggestions.
+    Returns a list of dicts with ticker, cik, title and score, best match first.
+    """
+    if index is None:
+        index = load_index()
+
+    companies = index['companies']
+    name = normalize(query)
+    query_grams = trigrams(name)
+    if not query_grams:
+        return []
+
+    # Count the trigrams each candidate shares with the query
+    shared = Counter()
+    for gram in query_grams:
+        postings = index['postings'].get(gram)
+        if postings is not None:
+            shared.update(postings)
+
+    exact_id = index['tickers'].get(query.strip().upper())
+    query_words = name.split()
+    scored = []
+    for entry_id, count in shared.most_common(200):
+        ticker, cik, title, rank, company_name, gram_count = companies[entry_id]
+        company_words = company_name.split()
+
+        # Coverage of the query, with a little Dice similarity to prefer tighter titles
+        score = 0.7 * count / len(query_grams) + 0.3 * 2 * count / (len(query_grams) + gram_count)
+        if entry_id == exact_id:
+            score += 1.0
+        if company_name.startswith(name):
+            score += 0.3
+        elif all(any(word.startswith(q) for word in company_words) for q in query_words):
+            score += 0.2
+
+        # Ties go to the larger company
+        scored.append((-score, rank, ticker, cik, title))
+
+    scored.sort()
+    return [
+        {'ticker': ticker, 'cik': cik, 'title': title, 'score': round(-score, 4)}
+        for score, _, ticker, cik, title in scored[:limit]
+    ]
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python ticker_search.py <build|company name>")
+        sys.exit(1)
+
+    if sys.argv[1:] == ["build"]:
+        build_index()
+    else:
+        for match in search(' '.join(sys.argv[1:])):
+            print(f"{match['ticker']:<8} {match['cik']}  {match['score']:.2f}  {match['title']}")
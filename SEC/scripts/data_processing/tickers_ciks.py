@@ -1,9860 +0,0 @@
-# Ticker to CIK mapping
-tickers_ciks = {
-    'AAPL': '0000320193',  # Apple Inc.
-    'NVDA': '0001045810',  # NVIDIA CORP
-    'MSFT': '0000789019',  # MICROSOFT CORP
-    'GOOGL': '0001652044',  # Alphabet Inc.
-    'AMZN': '0001018724',  # AMAZON COM INC
-    'META': '0001326801',  # Meta Platforms, Inc.
-    'TSLA': '0001318605',  # Tesla, Inc.
-    'AVGO': '0001730168',  # Broadcom Inc.
-    'BRK-B': '0001067983',  # BERKSHIRE HATHAWAY INC
-    'WMT': '0000104169',  # Walmart Inc.
-    'LLY': '0000059478',  # ELI LILLY & Co
-    'JPM': '0000019617',  # JPMORGAN CHASE & CO
-    'V': '0001403161',  # VISA INC.
-    'SPY': '0000884394',  # SPDR S&P 500 ETF TRUST
-    'UNH': '0000731766',  # UNITEDHEALTH GROUP INC
-    'XOM': '0000034088',  # EXXON MOBIL CORP
-    'MA': '0001141391',  # Mastercard Inc
-    'ORCL': '0001341439',  # ORACLE CORP
-    'COST': '0000909832',  # COSTCO WHOLESALE CORP /NEW
-    'HD': '0000354950',  # HOME DEPOT, INC.
-    'NVO': '0000353278',  # NOVO NORDISK A S
-    'PG': '0000080424',  # PROCTER & GAMBLE Co
-    'NFLX': '0001065280',  # NETFLIX INC
-    'BAC': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'JNJ': '0000200406',  # JOHNSON & JOHNSON
-    'ABBV': '0001551152',  # AbbVie Inc.
-    'CRM': '0001108524',  # Salesforce, Inc.
-    'SAP': '0001000184',  # SAP SE
-    'ASML': '0000937966',  # ASML HOLDING NV
-    'RCIT': '0002008670',  # REELCAUSE INC
-    'CVX': '0000093410',  # CHEVRON CORP
-    'KO': '0000021344',  # COCA COLA CO
-    'MRK': '0000310158',  # Merck & Co., Inc.
-    'TMUS': '0001283699',  # T-Mobile US, Inc.
-    'TM': '0001094517',  # TOYOTA MOTOR CORP/
-    'CSCO': '0000858877',  # CISCO SYSTEMS, INC.
-    'WFC': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'ACN': '0001467373',  # Accenture plc
-    'NOW': '0001373715',  # ServiceNow, Inc.
-    'AZN': '0000901832',  # ASTRAZENECA PLC
-    'TMO': '0000097745',  # THERMO FISHER SCIENTIFIC INC.
-    'AXP': '0000004962',  # AMERICAN EXPRESS CO
-    'IBM': '0000051143',  # INTERNATIONAL BUSINESS MACHINES CORP
-    'MCD': '0000063908',  # MCDONALDS CORP
-    'BX': '0001393818',  # Blackstone Inc.
-    'QQQ': '0001067839',  # INVESCO QQQ TRUST, SERIES 1
-    'MS': '0000895421',  # MORGAN STANLEY
-    'NVS': '0001114448',  # NOVARTIS AG
-    'DIS': '0001744489',  # Walt Disney Co
-    'LIN': '0001707925',  # LINDE PLC
-    'SHEL': '0001306965',  # Shell plc
-    'PEP': '0000077476',  # PEPSICO INC
-    'ISRG': '0001035267',  # INTUITIVE SURGICAL INC
-    'ABT': '0000001800',  # ABBOTT LABORATORIES
-    'BABA': '0001577552',  # Alibaba Group Holding Ltd
-    'AMD': '0000002488',  # ADVANCED MICRO DEVICES INC
-    'GE': '0000040545',  # GENERAL ELECTRIC CO
-    'PM': '0001413329',  # Philip Morris International Inc.
-    'ADBE': '0000796343',  # ADOBE INC.
-    'HSBC': '0001089113',  # HSBC HOLDINGS PLC
-    'GS': '0000886982',  # GOLDMAN SACHS GROUP INC
-    'INTU': '0000896878',  # INTUIT INC.
-    'QCOM': '0000804328',  # QUALCOMM INC/DE
-    'TXN': '0000097476',  # TEXAS INSTRUMENTS INC
-    'CAT': '0000018230',  # CATERPILLAR INC
-    'DHR': '0000313616',  # DANAHER CORP /DE/
-    'RY': '0001000275',  # ROYAL BANK OF CANADA
-    'VZ': '0000732712',  # VERIZON COMMUNICATIONS INC
-    'BKNG': '0001075531',  # Booking Holdings Inc.
-    'T': '0000732717',  # AT&T INC.
-    'RTX': '0000101829',  # RTX Corp
-    'PLTR': '0001321655',  # Palantir Technologies Inc.
-    'PFE': '0000078003',  # PFIZER INC
-    'HDB': '0001144967',  # HDFC BANK LTD
-    'SPGI': '0000064040',  # S&P Global Inc.
-    'FMX': '0001061736',  # MEXICAN ECONOMIC DEVELOPMENT INC
-    'BLK': '0002012383',  # BlackRock, Inc.
-    'ARM': '0001973239',  # ARM HOLDINGS PLC /UK
-    'ANET': '0001596532',  # Arista Networks, Inc.
-    'HON': '0000773840',  # HONEYWELL INTERNATIONAL INC
-    'AMAT': '0000006951',  # APPLIED MATERIALS INC /DE
-    'AMGN': '0000318154',  # AMGEN INC
-    'BSX': '0000885725',  # BOSTON SCIENTIFIC CORP
-    'LOW': '0000060667',  # LOWES COMPANIES INC
-    'CMCSA': '0001166691',  # COMCAST CORP
-    'SYK': '0000310764',  # STRYKER CORP
-    'UBER': '0001543151',  # Uber Technologies, Inc
-    'NEE': '0000753308',  # NEXTERA ENERGY INC
-    'PGR': '0000080661',  # PROGRESSIVE CORP/OH/
-    'MUFG': '0000067088',  # MITSUBISHI UFJ FINANCIAL GROUP INC
-    'UNP': '0000100885',  # UNION PACIFIC CORP
-    'C': '0000831001',  # CITIGROUP INC
-    'ETN': '0001551182',  # Eaton Corp plc
-    'TJX': '0000109198',  # TJX COMPANIES INC /DE/
-    'SHOP': '0001594805',  # SHOPIFY INC.
-    'SCHW': '0000316709',  # SCHWAB CHARLES CORP
-    'PDD': '0001737806',  # PDD Holdings Inc.
-    'COP': '0001163165',  # CONOCOPHILLIPS
-    'KKR': '0001404912',  # KKR & Co. Inc.
-    'BA': '0000012927',  # BOEING CO
-    'TTE': '0000879764',  # TotalEnergies SE
-    'EADSY': '0001378580',  # Airbus SE/ADR
-    'BHP': '0000811809',  # BHP Group Ltd
-    'SNY': '0001121404',  # Sanofi
-    'SONY': '0000313838',  # Sony Group Corp
-    'RTNTF': '0000887028',  # RIO TINTO LTD
-    'ADP': '0000008670',  # AUTOMATIC DATA PROCESSING INC
-    'FI': '0000798354',  # FISERV INC
-    'BMY': '0000014272',  # BRISTOL MYERS SQUIBB CO
-    'PANW': '0001327567',  # Palo Alto Networks Inc
-    'DE': '0000315189',  # DEERE & CO
-    'GILD': '0000882095',  # GILEAD SCIENCES, INC.
-    'MU': '0000723125',  # MICRON TECHNOLOGY INC
-    'LMT': '0000936468',  # LOCKHEED MARTIN CORP
-    'APP': '0001751008',  # AppLovin Corp
-    'ADI': '0000006281',  # ANALOG DEVICES INC
-    'UBS': '0001610520',  # UBS Group AG
-    'NKE': '0000320187',  # NIKE, Inc.
-    'VRTX': '0000875320',  # VERTEX PHARMACEUTICALS INC / MA
-    'UPS': '0001090727',  # UNITED PARCEL SERVICE INC
-    'SBUX': '0000829224',  # STARBUCKS CORP
-    'CB': '0000896159',  # Chubb Ltd
-    'MDT': '0001613103',  # Medtronic plc
-    'MMC': '0000062709',  # MARSH & MCLENNAN COMPANIES, INC.
-    'IBN': '0001103838',  # ICICI BANK LTD
-    'GEV': '0001996810',  # GE Vernova Inc.
-    'MRVL': '0001835632',  # Marvell Technology, Inc.
-    'LRCX': '0000707549',  # LAM RESEARCH CORP
-    'CEG': '0001868275',  # Constellation Energy Corp
-    'PLD': '0001045609',  # Prologis, Inc.
-    'RIO': '0000863064',  # RIO TINTO PLC
-    'ENB': '0000895728',  # ENBRIDGE INC
-    'TD': '0000947263',  # TORONTO DOMINION BANK
-    'INFY': '0001067491',  # Infosys Ltd
-    'SPOT': '0001639920',  # Spotify Technology S.A.
-    'AIQUY': '0001161167',  # L AIR LIQUIDE SA /FI
-    'SMFG': '0001022837',  # SUMITOMO MITSUI FINANCIAL GROUP, INC.
-    'KLAC': '0000319201',  # KLA CORP
-    'BUD': '0001668717',  # Anheuser-Busch InBev SA/NV
-    'MELI': '0001099590',  # MERCADOLIBRE INC
-    'SO': '0000092122',  # SOUTHERN CO
-    'ELV': '0001156039',  # Elevance Health, Inc.
-    'APO': '0001858681',  # Apollo Global Management, Inc.
-    'CFRUY': '0000948401',  # COMPAGNIE FINANCIERE RICHEMONT AG /FI
-    'EQIX': '0001101239',  # EQUINIX INC
-    'RELX': '0000929869',  # RELX PLC
-    'CRWD': '0001535527',  # CrowdStrike Holdings, Inc.
-    'MO': '0000764180',  # ALTRIA GROUP, INC.
-    'APH': '0000820313',  # AMPHENOL CORP /DE/
-    'TT': '0001466258',  # Trane Technologies plc
-    'BN': '0001001085',  # BROOKFIELD Corp /ON/
-    'PYPL': '0001633917',  # PayPal Holdings, Inc.
-    'BP': '0000313807',  # BP PLC
-    'SHW': '0000089800',  # SHERWIN WILLIAMS CO
-    'INTC': '0000050863',  # INTEL CORP
-    'WM': '0000823768',  # WASTE MANAGEMENT INC
-    'PBR': '0001119639',  # PETROBRAS - PETROLEO BRASILEIRO SA
-    'CDNS': '0000813672',  # CADENCE DESIGN SYSTEMS INC
-    'CME': '0001156375',  # CME GROUP INC.
-    'DUK': '0001326160',  # Duke Energy CORP
-    'ICE': '0001571949',  # Intercontinental Exchange, Inc.
-    'MCO': '0001059556',  # MOODYS CORP /DE/
-    'MSTR': '0001050446',  # MICROSTRATEGY Inc
-    'ABNB': '0001559720',  # Airbnb, Inc.
-    'AMT': '0001053507',  # AMERICAN TOWER CORP /MA/
-    'PH': '0000076334',  # PARKER HANNIFIN CORP
-    'DELL': '0001571996',  # Dell Technologies Inc.
-    'BTI': '0001303523',  # British American Tobacco p.l.c.
-    'IBKR': '0001381197',  # Interactive Brokers Group, Inc.
-    'TOELY': '0001443276',  # Tokyo Electron LTD
-    'WELL': '0000766704',  # WELLTOWER INC.
-    'CI': '0001739940',  # Cigna Group
-    'CMG': '0001058090',  # CHIPOTLE MEXICAN GRILL INC
-    'RACE': '0001648416',  # Ferrari N.V.
-    'HCA': '0000860730',  # HCA Healthcare, Inc.
-    'CTAS': '0000723254',  # CINTAS CORP
-    'SNPS': '0000883241',  # SYNOPSYS INC
-    'REGN': '0000872589',  # REGENERON PHARMACEUTICALS, INC.
-    'MSI': '0000068505',  # Motorola Solutions, Inc.
-    'AON': '0000315293',  # Aon plc
-    'MDLZ': '0001103982',  # Mondelez International, Inc.
-    'MAR': '0001048286',  # MARRIOTT INTERNATIONAL INC /MD/
-    'PNC': '0000713676',  # PNC FINANCIAL SERVICES GROUP, INC.
-    'SCCO': '0001001838',  # SOUTHERN COPPER CORP/
-    'MCK': '0000927653',  # MCKESSON CORP
-    'EOG': '0000821189',  # EOG RESOURCES INC
-    'ZTS': '0001555280',  # Zoetis Inc.
-    'USB': '0000036104',  # US BANCORP \DE\
-    'FTNT': '0001262039',  # Fortinet, Inc.
-    'ITW': '0000049826',  # ILLINOIS TOOL WORKS INC
-    'AJG': '0000354190',  # Arthur J. Gallagher & Co.
-    'GD': '0000040533',  # GENERAL DYNAMICS CORP
-    'MMM': '0000066740',  # 3M CO
-    'BMO': '0000927971',  # BANK OF MONTREAL /CAN/
-    'TDG': '0001260221',  # TransDigm Group INC
-    'SAN': '0000891478',  # Banco Santander, S.A.
-    'DASH': '0001792789',  # DoorDash, Inc.
-    'CL': '0000021665',  # COLGATE PALMOLIVE CO
-    'TRI': '0001075124',  # THOMSON REUTERS CORP /CAN/
-    'BNS': '0000009631',  # BANK OF NOVA SCOTIA
-    'CP': '0000016875',  # CANADIAN PACIFIC KANSAS CITY LTD/CN
-    'EPD': '0001061219',  # ENTERPRISE PRODUCTS PARTNERS L.P.
-    'CNQ': '0001017413',  # CANADIAN NATURAL RESOURCES LTD
-    'ORLY': '0000898173',  # O REILLY AUTOMOTIVE INC
-    'EQNR': '0001140625',  # EQUINOR ASA
-    'BDX': '0000010795',  # BECTON DICKINSON & CO
-    'GSK': '0001131399',  # GSK plc
-    'WMB': '0000107263',  # WILLIAMS COMPANIES, INC.
-    'EMR': '0000032604',  # EMERSON ELECTRIC CO
-    'COF': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'NOC': '0001133421',  # NORTHROP GRUMMAN CORP /DE/
-    'WDAY': '0001327811',  # Workday, Inc.
-    'ET': '0001276187',  # Energy Transfer LP
-    'DEO': '0000835403',  # DIAGEO PLC
-    'ECL': '0000031462',  # ECOLAB INC.
-    'FDX': '0001048911',  # FEDEX CORP
-    'APD': '0000002969',  # Air Products & Chemicals, Inc.
-    'COIN': '0001679788',  # Coinbase Global, Inc.
-    'TGT': '0000027419',  # TARGET CORP
-    'RSG': '0001060391',  # REPUBLIC SERVICES, INC.
-    'GLD': '0001222333',  # SPDR GOLD TRUST
-    'SHECY': '0001442651',  # Shin-Etsu Chemical Co., Ltd.
-    'SPG': '0001063761',  # SIMON PROPERTY GROUP INC /DE/
-    'TEAM': '0001650372',  # Atlassian Corp
-    'CNI': '0000016868',  # CANADIAN NATIONAL RAILWAY CO
-    'SE': '0001703399',  # Sea Ltd
-    'KMI': '0001506307',  # KINDER MORGAN, INC.
-    'CRH': '0000849395',  # CRH PUBLIC LTD CO
-    'ADSK': '0000769397',  # Autodesk, Inc.
-    'CSX': '0000277948',  # CSX CORP
-    'MFG': '0001335730',  # MIZUHO FINANCIAL GROUP INC
-    'RCL': '0000884887',  # ROYAL CARIBBEAN CRUISES LTD
-    'CVS': '0000064803',  # CVS HEALTH Corp
-    'CARR': '0001783180',  # CARRIER GLOBAL Corp
-    'NTES': '0001110646',  # NetEase, Inc.
-    'BBVA': '0000842180',  # BANCO BILBAO VIZCAYA ARGENTARIA, S.A.
-    'CM': '0001045520',  # CANADIAN IMPERIAL BANK OF COMMERCE /CAN/
-    'HLT': '0001585689',  # Hilton Worldwide Holdings Inc.
-    'DLR': '0001297996',  # DIGITAL REALTY TRUST, INC.
-    'OKE': '0001039684',  # ONEOK INC /NEW/
-    'TTD': '0001671933',  # Trade Desk, Inc.
-    'VST': '0001692819',  # Vistra Corp.
-    'TFC': '0000092230',  # TRUIST FINANCIAL CORP
-    'AFL': '0000004977',  # AFLAC INC
-    'FCX': '0000831259',  # FREEPORT-MCMORAN INC
-    'PCAR': '0000075362',  # PACCAR INC
-    'ARES': '0001176948',  # Ares Management Corp
-    'MET': '0001099219',  # METLIFE INC
-    'BK': '0001390777',  # Bank of New York Mellon Corp
-    'GM': '0001467858',  # General Motors Co
-    'NGG': '0001004315',  # NATIONAL GRID PLC
-    'AZO': '0000866787',  # AUTOZONE INC
-    'SLB': '0000087347',  # SCHLUMBERGER LIMITED/NV
-    'MBGYY': '0001067318',  # DAIMLER AG
-    'PTCAY': '0001547873',  # PT Chandra Asri Petrochemical Tbk/ADR
-    'ROP': '0000882835',  # ROPER TECHNOLOGIES INC
-    'GLNCY': '0001524684',  # Glencore plc/ADR
-    'CPRT': '0000900075',  # COPART INC
-    'SNOW': '0001640147',  # Snowflake Inc.
-    'TRV': '0000086312',  # TRAVELERS COMPANIES, INC.
-    'NSC': '0000702165',  # NORFOLK SOUTHERN CORP
-    'NU': '0001691493',  # Nu Holdings Ltd.
-    'JD': '0001549802',  # JD.com, Inc.
-    'NXPI': '0001413447',  # NXP Semiconductors N.V.
-    'GBTC': '0001588489',  # Grayscale Bitcoin Trust ETF
-    'JCI': '0000833444',  # Johnson Controls International plc
-    'MFC': '0001086888',  # MANULIFE FINANCIAL CORP
-    'SQ': '0001512673',  # Block, Inc.
-    'GWW': '0000277135',  # W.W. GRAINGER, INC.
-    'FANG': '0001539838',  # Diamondback Energy, Inc.
-    'PSA': '0001393311',  # Public Storage
-    'LNG': '0000003570',  # Cheniere Energy, Inc.
-    'AMP': '0000820027',  # AMERIPRISE FINANCIAL INC
-    'ROST': '0000745732',  # ROSS STORES, INC.
-    'PAYX': '0000723531',  # PAYCHEX INC
-    'SRE': '0001032208',  # SEMPRA
-    'AEP': '0000004904',  # AMERICAN ELECTRIC POWER CO INC
-    'SU': '0000311337',  # SUNCOR ENERGY INC
-    'IAU': '0001278680',  # ISHARES GOLD TRUST
-    'MPLX': '0001552000',  # MPLX LP
-    'CMI': '0000026172',  # CUMMINS INC
-    'BMWKY': '0001446250',  # Bayerische Motoren Werke AG/ADR
-    'TRP': '0001232384',  # TC ENERGY CORP
-    'MNST': '0000865752',  # Monster Beverage Corp
-    'VRT': '0001674101',  # Vertiv Holdings Co
-    'OXY': '0000797468',  # OCCIDENTAL PETROLEUM CORP /DE/
-    'ING': '0001039765',  # ING GROEP NV
-    'LULU': '0001397187',  # lululemon athletica inc.
-    'ALL': '0000899051',  # ALLSTATE CORP
-    'CHTR': '0001091667',  # CHARTER COMMUNICATIONS, INC. /MO/
-    'ATEYY': '0001158838',  # ADVANTEST CORP
-    'DDOG': '0001561550',  # Datadog, Inc.
-    'CTA-PA': '0000030554',  # EIDP, Inc.
-    'FICO': '0000814547',  # FAIR ISAAC CORP
-    'PSX': '0001534701',  # Phillips 66
-    'ITUB': '0001132597',  # Itau Unibanco Holding S.A.
-    'PWR': '0001050915',  # QUANTA SERVICES, INC.
-    'BCS': '0000312069',  # BARCLAYS PLC
-    'HWM': '0000004281',  # Howmet Aerospace Inc.
-    'COR': '0001140859',  # Cencora, Inc.
-    'FLUT': '0001635327',  # Flutter Entertainment plc
-    'MPC': '0001510295',  # Marathon Petroleum Corp
-    'WCN': '0001318220',  # Waste Connections, Inc.
-    'O': '0000726728',  # REALTY INCOME CORP
-    'MSCI': '0001408198',  # MSCI Inc.
-    'D': '0000715957',  # DOMINION ENERGY, INC
-    'HMC': '0000715153',  # HONDA MOTOR CO LTD
-    'NEM': '0001164727',  # NEWMONT Corp /DE/
-    'BAESY': '0000895564',  # BAE SYSTEMS PLC /FI/
-    'AIG': '0000005272',  # AMERICAN INTERNATIONAL GROUP, INC.
-    'DHI': '0000882184',  # HORTON D R INC /DE/
-    'URI': '0001067701',  # UNITED RENTALS, INC.
-    'HES': '0000004447',  # HESS CORP
-    'E': '0001002242',  # ENI SPA
-    'NDAQ': '0001120193',  # NASDAQ, INC.
-    'EW': '0001099800',  # Edwards Lifesciences Corp
-    'AXON': '0001069183',  # AXON ENTERPRISE, INC.
-    'DAL': '0000027904',  # DELTA AIR LINES, INC.
-    'KR': '0000056873',  # KROGER CO
-    'AEM': '0000002809',  # AGNICO EAGLE MINES LTD
-    'DFS': '0001393612',  # Discover Financial Services
-    'CAIXY': '0001535628',  # CaixaBank/ADR
-    'BKR': '0001701605',  # Baker Hughes Co
-    'AMX': '0001129137',  # AMERICA MOVIL SAB DE CV/
-    'PEG': '0000788784',  # PUBLIC SERVICE ENTERPRISE GROUP INC
-    'TRGP': '0001389170',  # Targa Resources Corp.
-    'TEL': '0001385157',  # TE Connectivity plc
-    'CRARY': '0001279967',  # CREDIT AGRICOLE S A
-    'FIS': '0001136893',  # Fidelity National Information Services, Inc.
-    'KMB': '0000055785',  # KIMBERLY CLARK CORP
-    'ALC': '0001167379',  # ALCON INC
-    'HLN': '0001900304',  # Haleon plc
-    'KDP': '0001418135',  # Keurig Dr Pepper Inc.
-    'TAK': '0001395064',  # TAKEDA PHARMACEUTICAL CO LTD
-    'TCOM': '0001269238',  # Trip.com Group Ltd
-    'FAST': '0000815556',  # FASTENAL CO
-    'AME': '0001037868',  # AMETEK INC/
-    'PRU': '0001137774',  # PRUDENTIAL FINANCIAL INC
-    'SVNDY': '0001359519',  # SEVEN & I HOLDINGS CO LTD
-    'RBLX': '0001315098',  # Roblox Corp
-    'GLW': '0000024741',  # CORNING INC /NY
-    'GRMN': '0001121788',  # GARMIN LTD
-    'VLO': '0001035002',  # VALERO ENERGY CORP/TX
-    'KVUE': '0001944048',  # Kenvue Inc.
-    'WTKWY': '0000861967',  # WOLTERS KLUWER N V /FI
-    'ARGX': '0001697862',  # ARGENX SE
-    'LYG': '0001160106',  # Lloyds Banking Group plc
-    'LHX': '0000202058',  # L3HARRIS TECHNOLOGIES, INC. /DE/
-    'A': '0001090872',  # AGILENT TECHNOLOGIES, INC.
-    'CTVA': '0001755672',  # Corteva, Inc.
-    'DNZOY': '0001446598',  # Denso Corp
-    'GEHC': '0001932393',  # GE HealthCare Technologies Inc.
-    'CPNG': '0001834584',  # Coupang, Inc.
-    'F': '0000037996',  # FORD MOTOR CO
-    'NET': '0001477333',  # Cloudflare, Inc.
-    'PCG': '0001004980',  # PG&E Corp
-    'VRSK': '0001442145',  # Verisk Analytics, Inc.
-    'IT': '0000749251',  # GARTNER INC
-    'EXC': '0001109357',  # EXELON CORP
-    'ODFL': '0000878927',  # OLD DOMINION FREIGHT LINE, INC.
-    'CBRE': '0001138118',  # CBRE GROUP, INC.
-    'CTSH': '0001058290',  # COGNIZANT TECHNOLOGY SOLUTIONS CORP
-    'EA': '0000712515',  # ELECTRONIC ARTS INC.
-    'NWG': '0000844150',  # NatWest Group plc
-    'IQV': '0001478242',  # IQVIA HOLDINGS INC.
-    'WIT': '0001123799',  # WIPRO LTD
-    'CCI': '0001051470',  # CROWN CASTLE INC.
-    'XEL': '0000072903',  # XCEL ENERGY INC
-    'VALE': '0000917851',  # Vale S.A.
-    'HUBS': '0001404655',  # HUBSPOT INC
-    'STLA': '0001605484',  # Stellantis N.V.
-    'OTIS': '0001781335',  # Otis Worldwide Corp
-    'SYY': '0000096021',  # SYSCO CORP
-    'HOOD': '0001783879',  # Robinhood Markets, Inc.
-    'VEEV': '0001393052',  # VEEVA SYSTEMS INC
-    'UAL': '0000100517',  # United Airlines Holdings, Inc.
-    'LEN': '0000920760',  # LENNAR CORP /NEW/
-    'IR': '0001699150',  # Ingersoll Rand Inc.
-    'IMO': '0000049938',  # IMPERIAL OIL LTD
-    'KHC': '0001637459',  # Kraft Heinz Co
-    'YUM': '0001041061',  # YUM BRANDS INC
-    'CCEP': '0001650107',  # COCA-COLA EUROPACIFIC PARTNERS plc
-    'OLCLY': '0001545460',  # Oriental Land Co., Ltd./ADR
-    'IDXX': '0000874716',  # IDEXX LABORATORIES INC /DE
-    'RMD': '0000943819',  # RESMED INC
-    'LVS': '0001300514',  # LAS VEGAS SANDS CORP
-    'DB': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'FERG': '0002011641',  # Ferguson Enterprises Inc. /DE/
-    'DIA': '0001041130',  # SPDR DOW JONES INDUSTRIAL AVERAGE ETF TRUST
-    'ACGL': '0000947484',  # ARCH CAPITAL GROUP LTD.
-    'DKILY': '0001446519',  # Daikin Industries Ltd
-    'OWL': '0001823945',  # BLUE OWL CAPITAL INC.
-    'VMC': '0001396009',  # Vulcan Materials CO
-    'SLF': '0001097362',  # SUN LIFE FINANCIAL INC
-    'DSCSY': '0001671750',  # Disco Corporation/ADR
-    'STZ': '0000016918',  # CONSTELLATION BRANDS, INC.
-    'ETR': '0000065984',  # ENTERGY CORP /DE/
-    'HUM': '0000049071',  # HUMANA INC
-    'WAB': '0000943452',  # WESTINGHOUSE AIR BRAKE TECHNOLOGIES CORP
-    'EXR': '0001289490',  # Extra Space Storage Inc.
-    'PPERY': '0001461748',  # PT Bank Mandiri (Persero) Tbk / ADR
-    'GIS': '0000040704',  # GENERAL MILLS INC
-    'HSY': '0000047111',  # HERSHEY CO
-    'EBAY': '0001065088',  # EBAY INC
-    'CCL': '0000815097',  # CARNIVAL CORP
-    'DECK': '0000910521',  # DECKERS OUTDOOR CORP
-    'WTW': '0001140536',  # WILLIS TOWERS WATSON PLC
-    'RJF': '0000720005',  # RAYMOND JAMES FINANCIAL INC
-    'TTWO': '0000946581',  # TAKE TWO INTERACTIVE SOFTWARE INC
-    'ANYYY': '0001700171',  # Aena S.A./ADR
-    'MDY': '0000936958',  # SPDR S&P MIDCAP 400 ETF TRUST
-    'CNC': '0001071739',  # CENTENE CORP
-    'MTB': '0000036270',  # M&T BANK CORP
-    'MLM': '0000916076',  # MARTIN MARIETTA MATERIALS INC
-    'HPQ': '0000047217',  # HP INC
-    'ROK': '0001024478',  # ROCKWELL AUTOMATION, INC
-    'HIG': '0000874766',  # HARTFORD FINANCIAL SERVICES GROUP, INC.
-    'FRFHF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'ED': '0001047862',  # CONSOLIDATED EDISON INC
-    'DD': '0001666700',  # DuPont de Nemours, Inc.
-    'DXCM': '0001093557',  # DEXCOM INC
-    'ALNY': '0001178670',  # ALNYLAM PHARMACEUTICALS, INC.
-    'EFX': '0000033185',  # EQUIFAX INC
-    'GWLIF': '0000850918',  # GREAT-WEST LIFECO INC.
-    'AVB': '0000915912',  # AVALONBAY COMMUNITIES INC
-    'VICI': '0001705696',  # VICI PROPERTIES INC.
-    'IRM': '0001020569',  # IRON MOUNTAIN INC
-    'MCHP': '0000827054',  # MICROCHIP TECHNOLOGY INC
-    'HPE': '0001645590',  # Hewlett Packard Enterprise Co
-    'LYV': '0001335258',  # Live Nation Entertainment, Inc.
-    'TPL': '0001811074',  # Texas Pacific Land Corp
-    'ANSS': '0001013462',  # ANSYS INC
-    'WDS': '0000844551',  # WOODSIDE ENERGY GROUP LTD
-    'WEC': '0000783325',  # WEC ENERGY GROUP, INC.
-    'FER': '0001468522',  # Ferrovial SE
-    'RDDT': '0001713445',  # Reddit, Inc.
-    'CAH': '0000721371',  # CARDINAL HEALTH INC
-    'BSBR': '0001471055',  # Banco Santander (Brasil) S.A.
-    'TSCO': '0000916365',  # TRACTOR SUPPLY CO /DE/
-    'MRAAY': '0001450468',  # Murata Manufacturing Co., Ltd./ADR
-    'BNTX': '0001776985',  # BioNTech SE
-    'ZS': '0001713683',  # Zscaler, Inc.
-    'EQT': '0000033213',  # EQT Corp
-    'BRO': '0000079282',  # BROWN & BROWN, INC.
-    'PPRUY': '0001445465',  # Kering
-    'ABEV': '0001565025',  # AMBEV S.A.
-    'MPWR': '0001280452',  # MONOLITHIC POWER SYSTEMS INC
-    'TW': '0001758730',  # Tradeweb Markets Inc.
-    'CSGP': '0001057352',  # COSTAR GROUP, INC.
-    'FCNCA': '0000798941',  # FIRST CITIZENS BANCSHARES INC /DE/
-    'CHT': '0001132924',  # CHUNGHWA TELECOM CO LTD
-    'CUK': '0001125259',  # CARNIVAL PLC
-    'CVE': '0001475260',  # CENOVUS ENERGY INC.
-    'K': '0000055067',  # KELLANOVA
-    'KEYS': '0001601046',  # Keysight Technologies, Inc.
-    'GOLD': '0000756894',  # BARRICK GOLD CORP
-    'XYL': '0001524472',  # Xylem Inc.
-    'STT': '0000093751',  # STATE STREET CORP
-    'NUE': '0000073309',  # NUCOR CORP
-    'QSR': '0001618756',  # Restaurant Brands International Inc.
-    'FITB': '0000035527',  # FIFTH THIRD BANCORP
-    'HEI': '0000046619',  # HEICO CORP
-    'BIDU': '0001329099',  # Baidu, Inc.
-    'ERIC': '0000717826',  # ERICSSON LM TELEPHONE CO
-    'GDDY': '0001609711',  # GoDaddy Inc.
-    'DOW': '0001751788',  # DOW INC.
-    'CQP': '0001383650',  # Cheniere Energy Partners, L.P.
-    'SW': '0002005951',  # Smurfit Westrock plc
-    'GPN': '0001123360',  # GLOBAL PAYMENTS INC
-    'NTDTY': '0001446705',  # NTT Data Corp
-    'EQR': '0000906107',  # EQUITY RESIDENTIAL
-    'PPG': '0000079879',  # PPG INDUSTRIES INC
-    'WPM': '0001323404',  # Wheaton Precious Metals Corp.
-    'FTV': '0001659166',  # Fortive Corp
-    'BR': '0001383312',  # BROADRIDGE FINANCIAL SOLUTIONS, INC.
-    'PUBGY': '0001050952',  # PUBLICIS GROUPE SA
-    'EL': '0001001250',  # ESTEE LAUDER COMPANIES INC
-    'NVZMY': '0001131345',  # NOVOZYMES AS/FI
-    'MTD': '0001037646',  # METTLER TOLEDO INTERNATIONAL INC/
-    'FUJIY': '0000800365',  # FUJI PHOTO FILM CO LTD /FI
-    'EIX': '0000827052',  # EDISON INTERNATIONAL
-    'DOV': '0000029905',  # DOVER Corp
-    'SYF': '0001601712',  # Synchrony Financial
-    'CHD': '0000313927',  # CHURCH & DWIGHT CO INC /DE/
-    'VLTO': '0001967680',  # Veralto Corp
-    'LPLA': '0001397911',  # LPL Financial Holdings Inc.
-    'DTE': '0000936340',  # DTE ENERGY CO
-    'IOT': '0001642896',  # Samsara Inc.
-    'FNV': '0001456346',  # FRANCO NEVADA Corp
-    'CDW': '0001402057',  # CDW Corp
-    'ADM': '0000007084',  # Archer-Daniels-Midland Co
-    'NOK': '0000924613',  # NOKIA CORP
-    'CPAY': '0001175454',  # CORPAY, INC.
-    'WSM': '0000719955',  # WILLIAMS SONOMA INC
-    'ZM': '0001585521',  # Zoom Communications, Inc.
-    'GIB': '0001061574',  # CGI INC
-    'SMPNY': '0001669414',  # Sompo Japan Nipponkoa Holdings, Inc./ADR
-    'PHG': '0000313216',  # KONINKLIJKE PHILIPS NV
-    'NVR': '0000906163',  # NVR INC
-    'WST': '0000105770',  # WEST PHARMACEUTICAL SERVICES INC
-    'TROW': '0001113169',  # PRICE T ROWE GROUP INC
-    'VTR': '0000740260',  # Ventas, Inc.
-    'NTR': '0001725964',  # Nutrien Ltd.
-    'TYL': '0000860731',  # TYLER TECHNOLOGIES INC
-    'FANUY': '0001446596',  # Fanuc Ltd
-    'TEVA': '0000818686',  # TEVA PHARMACEUTICAL INDUSTRIES LTD
-    'WBD': '0001437107',  # Warner Bros. Discovery, Inc.
-    'HAL': '0000045012',  # HALLIBURTON CO
-    'DVN': '0001090012',  # DEVON ENERGY CORP/DE
-    'AWK': '0001410636',  # American Water Works Company, Inc.
-    'EXE': '0000895126',  # EXPAND ENERGY Corp
-    'NTAP': '0001002047',  # NetApp, Inc.
-    'LYB': '0001489393',  # LyondellBasell Industries N.V.
-    'AEE': '0001002910',  # AMEREN CORP
-    'PPL': '0000922224',  # PPL Corp
-    'RYAAY': '0001038683',  # RYANAIR HOLDINGS PLC
-    'HBAN': '0000049196',  # HUNTINGTON BANCSHARES INC /MD/
-    'EXPE': '0001324424',  # Expedia Group, Inc.
-    'NTRA': '0001604821',  # Natera, Inc.
-    'ON': '0001097864',  # ON SEMICONDUCTOR CORP
-    'TPG': '0001880661',  # TPG Inc.
-    'LI': '0001791706',  # Li Auto Inc.
-    'ASX': '0001122411',  # ASE Technology Holding Co., Ltd.
-    'GFS': '0001709048',  # GLOBALFOUNDRIES Inc.
-    'IX': '0001070304',  # ORIX CORP
-    'KB': '0001445930',  # KB Financial Group Inc.
-    'HUBB': '0000048898',  # HUBBELL INC
-    'WAT': '0001000697',  # WATERS CORP /DE/
-    'CVNA': '0001690820',  # CARVANA CO.
-    'TEF': '0000814052',  # TELEFONICA S A
-    'STM': '0000932787',  # STMicroelectronics N.V.
-    'ROL': '0000084839',  # ROLLINS INC
-    'FE': '0001031296',  # FIRSTENERGY CORP
-    'BAM': '0001937926',  # Brookfield Asset Management Ltd.
-    'PHM': '0000822416',  # PULTEGROUP INC/MI/
-    'DIDIY': '0001764757',  # DiDi Global Inc.
-    'PTC': '0000857005',  # PTC INC.
-    'TECK': '0000886986',  # TECK RESOURCES LTD
-    'LII': '0001069202',  # LENNOX INTERNATIONAL INC
-    'TER': '0000097210',  # TERADYNE, INC
-    'WDC': '0000106040',  # WESTERN DIGITAL CORP
-    'WRB': '0000011544',  # BERKLEY W R CORP
-    'BIIB': '0000875045',  # BIOGEN INC.
-    'ILMN': '0001110803',  # ILLUMINA, INC.
-    'UI': '0001511737',  # Ubiquiti Inc.
-    'FOXA': '0001754301',  # Fox Corp
-    'CCJ': '0001009001',  # CAMECO CORP
-    'EME': '0000105634',  # EMCOR Group, Inc.
-    'NJDCY': '0001158967',  # NIDEC CORP
-    'MKL': '0001096343',  # MARKEL GROUP INC.
-    'ATO': '0000731802',  # ATMOS ENERGY CORP
-    'TDY': '0001094285',  # TELEDYNE TECHNOLOGIES INC
-    'CINF': '0000020286',  # CINCINNATI FINANCIAL CORP
-    'DRI': '0000940944',  # DARDEN RESTAURANTS INC
-    'YPF': '0000904851',  # YPF SOCIEDAD ANONIMA
-    'SNAP': '0001564408',  # Snap Inc
-    'PSTG': '0001474432',  # Pure Storage, Inc.
-    'PBA': '0001546066',  # PEMBINA PIPELINE CORP
-    'TS': '0001190723',  # TENARIS SA
-    'BCE': '0000718940',  # BCE INC
-    'RF': '0001281761',  # REGIONS FINANCIAL CORP
-    'PINS': '0001506293',  # PINTEREST, INC.
-    'VOD': '0000839923',  # VODAFONE GROUP PUBLIC LTD CO
-    'IFF': '0000051253',  # INTERNATIONAL FLAVORS & FRAGRANCES INC
-    'SBAC': '0001034054',  # SBA COMMUNICATIONS CORP
-    'ZBH': '0001136869',  # ZIMMER BIOMET HOLDINGS, INC.
-    'ALAB': '0001736297',  # Astera Labs, Inc.
-    'ES': '0000072741',  # EVERSOURCE ENERGY
-    'RKT': '0001805284',  # Rocket Companies, Inc.
-    'PKG': '0000075677',  # PACKAGING CORP OF AMERICA
-    'CTRA': '0000858470',  # Coterra Energy Inc.
-    'FTS': '0001666175',  # Fortis Inc.
-    'CNP': '0001130310',  # CENTERPOINT ENERGY INC
-    'ONC': '0001651308',  # BeiGene, Ltd.
-    'TU': '0000868675',  # TELUS CORP
-    'ERIE': '0000922621',  # ERIE INDEMNITY CO
-    'STE': '0001757898',  # STERIS plc
-    'TOST': '0001650164',  # Toast, Inc.
-    'NRG': '0001013871',  # NRG ENERGY, INC.
-    'FSLR': '0001274494',  # FIRST SOLAR, INC.
-    'CBOE': '0001374310',  # Cboe Global Markets, Inc.
-    'VRSN': '0001014473',  # VERISIGN INC/CA
-    'CHKP': '0001015922',  # CHECK POINT SOFTWARE TECHNOLOGIES LTD
-    'BEKE': '0001809587',  # KE Holdings Inc.
-    'LUV': '0000092380',  # SOUTHWEST AIRLINES CO
-    'LDOS': '0001336920',  # Leidos Holdings, Inc.
-    'WY': '0000106535',  # WEYERHAEUSER CO
-    'ZBRA': '0000877212',  # ZEBRA TECHNOLOGIES CORP
-    'NTRS': '0000073124',  # NORTHERN TRUST CORP
-    'PUK': '0001116578',  # PRUDENTIAL PLC
-    'MDB': '0001441816',  # MongoDB, Inc.
-    'CLX': '0000021076',  # CLOROX CO /DE/
-    'ULTA': '0001403568',  # Ulta Beauty, Inc.
-    'CMS': '0000811156',  # CMS ENERGY CORP
-    'SGSOY': '0001069347',  # SGS SOCIETE GENERALE DE SURVEILLANCE HOLDING SA /FI
-    'LH': '0000920148',  # LABCORP HOLDINGS INC.
-    'IHG': '0000858446',  # INTERCONTINENTAL HOTELS GROUP PLC /NEW/
-    'DKNG': '0001883685',  # DraftKings Inc.
-    'TSN': '0000100493',  # TYSON FOODS, INC.
-    'MKC': '0000063754',  # MCCORMICK & CO INC
-    'CFG': '0000759944',  # CITIZENS FINANCIAL GROUP INC/RI
-    'EJPRY': '0001093028',  # EAST JAPAN RAILWAY CO /FI
-    'PODD': '0001145197',  # INSULET CORP
-    'YAHOY': '0001446437',  # Yahoo! Japan Corp
-    'SMCI': '0001375365',  # Super Micro Computer, Inc.
-    'DKS': '0001089063',  # DICK'S SPORTING GOODS, INC.
-    'VIK': '0001745201',  # Viking Holdings Ltd
-    'IP': '0000051434',  # INTERNATIONAL PAPER CO /NEW/
-    'WSO': '0000105016',  # WATSCO INC
-    'STX': '0001137789',  # Seagate Technology Holdings plc
-    'KSPI': '0001985487',  # Joint Stock Co Kaspi.kz
-    'INVH': '0001687229',  # Invitation Homes Inc.
-    'SSNC': '0001402436',  # SS&C Technologies Holdings Inc
-    'BBD': '0001160330',  # BANK BRADESCO
-    'KEY': '0000091576',  # KEYCORP /NEW/
-    'DOCU': '0001261333',  # DOCUSIGN, INC.
-    'BURL': '0001579298',  # Burlington Stores, Inc.
-    'ESS': '0000920522',  # ESSEX PROPERTY TRUST, INC.
-    'ONON': '0001858985',  # On Holding AG
-    'FTAI': '0001590364',  # FTAI Aviation Ltd.
-    'GRAB': '0001855612',  # Grab Holdings Ltd
-    'CG': '0001527166',  # Carlyle Group Inc.
-    'ICLR': '0001060955',  # ICON PLC
-    'TME': '0001744676',  # Tencent Music Entertainment Group
-    'AER': '0001378789',  # AerCap Holdings N.V.
-    'COO': '0000711404',  # COOPER COMPANIES, INC.
-    'BBY': '0000764478',  # BEST BUY CO INC
-    'MAA': '0000912595',  # MID AMERICA APARTMENT COMMUNITIES INC.
-    'JBHT': '0000728535',  # HUNT J B TRANSPORT SERVICES INC
-    'L': '0000060086',  # LOEWS CORP
-    'STLD': '0001022671',  # STEEL DYNAMICS INC
-    'RPRX': '0001802768',  # Royalty Pharma plc
-    'CJPRY': '0001334687',  # CENTRAL JAPAN RAILWAY CO
-    'SNA': '0000091440',  # Snap-on Inc
-    'GFL': '0001780232',  # GFL Environmental Inc.
-    'EC': '0001444406',  # ECOPETROL S.A.
-    'PFG': '0001126328',  # PRINCIPAL FINANCIAL GROUP INC
-    'AFRM': '0001820953',  # Affirm Holdings, Inc.
-    'PHYS': '0001477049',  # Sprott Physical Gold Trust
-    'JBL': '0000898293',  # JABIL INC
-    'FDS': '0001013237',  # FACTSET RESEARCH SYSTEMS INC
-    'MT': '0001243429',  # ArcelorMittal
-    'TRMB': '0000864749',  # TRIMBLE INC.
-    'DGX': '0001022079',  # QUEST DIAGNOSTICS INC
-    'SHG': '0001263043',  # SHINHAN FINANCIAL GROUP CO LTD
-    'CRBG': '0001889539',  # Corebridge Financial, Inc.
-    'CYBR': '0001598110',  # CyberArk Software Ltd.
-    'BAH': '0001443646',  # Booz Allen Hamilton Holding Corp
-    'TRU': '0001552033',  # TransUnion
-    'NI': '0001111711',  # NISOURCE INC.
-    'AS': '0001988894',  # Amer Sports, Inc.
-    'ZG': '0001617640',  # ZILLOW GROUP, INC.
-    'CSL': '0000790051',  # CARLISLE COMPANIES INC
-    'NTNX': '0001618732',  # Nutanix, Inc.
-    'ARE': '0001035443',  # ALEXANDRIA REAL ESTATE EQUITIES, INC.
-    'TWLO': '0001447669',  # TWILIO INC
-    'GEN': '0000849399',  # Gen Digital Inc.
-    'NMR': '0001163653',  # NOMURA HOLDINGS INC
-    'HRL': '0000048465',  # HORMEL FOODS CORP /DE/
-    'J': '0000052988',  # JACOBS SOLUTIONS INC.
-    'RBA': '0001046102',  # RB GLOBAL INC.
-    'HOLX': '0000859737',  # HOLOGIC INC
-    'MOH': '0001179929',  # MOLINA HEALTHCARE, INC.
-    'RYAN': '0001849253',  # RYAN SPECIALTY HOLDINGS, INC.
-    'UTHR': '0001082554',  # UNITED THERAPEUTICS Corp
-    'MANH': '0001056696',  # MANHATTAN ASSOCIATES INC
-    'MRNA': '0001682852',  # Moderna, Inc.
-    'BLDR': '0001316835',  # Builders FirstSource, Inc.
-    'GPC': '0000040987',  # GENUINE PARTS CO
-    'OMC': '0000029989',  # OMNICOM GROUP INC.
-    'TLK': '0001001807',  # PERUSAHAAN PERSEROAN PERSERO PT TELEKOMUNIKASI INDONESIA TBK
-    'BF-A': '0000014693',  # BROWN FORMAN CORP
-    'PNR': '0000077360',  # PENTAIR plc
-    'SUI': '0000912593',  # SUN COMMUNITIES INC
-    'NWSA': '0001564708',  # NEWS CORP
-    'YUMC': '0001673358',  # Yum China Holdings, Inc.
-    'ALGN': '0001097149',  # ALIGN TECHNOLOGY INC
-    'AZPN': '0001897982',  # Aspen Technology, Inc.
-    'USFD': '0001665918',  # US Foods Holding Corp.
-    'RCI': '0000733099',  # ROGERS COMMUNICATIONS INC
-    'DLTR': '0000935703',  # DOLLAR TREE, INC.
-    'TPR': '0001116132',  # TAPESTRY, INC.
-    'FLEX': '0000866374',  # FLEX LTD.
-    'KOF': '0000910631',  # COCA COLA FEMSA SAB DE CV
-    'FIX': '0001035983',  # COMFORT SYSTEMS USA INC
-    'DG': '0000029534',  # DOLLAR GENERAL CORP
-    'XPO': '0001166003',  # XPO, Inc.
-    'IEX': '0000832101',  # IDEX CORP /DE/
-    'BALL': '0000009389',  # BALL Corp
-    'MAS': '0000062996',  # MASCO CORP /DE/
-    'RPM': '0000110621',  # RPM INTERNATIONAL INC/DE/
-    'UMC': '0001033767',  # UNITED MICROELECTRONICS CORP
-    'CF': '0001324404',  # CF Industries Holdings, Inc.
-    'EG': '0001095073',  # EVEREST GROUP, LTD.
-    'SOFI': '0001818874',  # SoFi Technologies, Inc.
-    'EXPD': '0000746515',  # EXPEDITORS INTERNATIONAL OF WASHINGTON INC
-    'DT': '0001773383',  # Dynatrace, Inc.
-    'UDR': '0000074208',  # UDR, Inc.
-    'WMG': '0001319161',  # Warner Music Group Corp.
-    'EQH': '0001333986',  # Equitable Holdings, Inc.
-    'SYM': '0001837240',  # Symbotic Inc.
-    'ENTG': '0001101302',  # ENTEGRIS INC
-    'FFIV': '0001048695',  # F5, INC.
-    'SN': '0001957132',  # SharkNinja, Inc.
-    'WES': '0001423902',  # Western Midstream Partners, LP
-    'BAX': '0000010456',  # BAXTER INTERNATIONAL INC
-    'AVY': '0000008818',  # Avery Dennison Corp
-    'AMH': '0001562401',  # American Homes 4 Rent
-    'HACBY': '0000793742',  # HACHIJUNI BANK LTD
-    'FNF': '0001331875',  # Fidelity National Financial, Inc.
-    'ARCC': '0001287750',  # ARES CAPITAL CORP
-    'RL': '0001037038',  # RALPH LAUREN CORP
-    'AVTR': '0001722482',  # Avantor, Inc.
-    'CHWY': '0001766502',  # Chewy, Inc.
-    'KIM': '0000879101',  # KIMCO REALTY CORP
-    'JEF': '0000096223',  # Jefferies Financial Group Inc.
-    'GME': '0001326380',  # GameStop Corp.
-    'H': '0001468174',  # Hyatt Hotels Corp
-    'SWKS': '0000004127',  # SKYWORKS SOLUTIONS, INC.
-    'LNT': '0000352541',  # ALLIANT ENERGY CORP
-    'BIP': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BEP': '0001533232',  # Brookfield Renewable Partners L.P.
-    'RS': '0000861884',  # RELIANCE, INC.
-    'OKTA': '0001660134',  # Okta, Inc.
-    'OC': '0001370946',  # Owens Corning
-    'GWRE': '0001528396',  # Guidewire Software, Inc.
-    'ZTO': '0001677250',  # ZTO Express (Cayman) Inc.
-    'BAP': '0001001290',  # CREDICORP LTD
-    'NBIX': '0000914475',  # NEUROCRINE BIOSCIENCES INC
-    'WLK': '0001262823',  # WESTLAKE CORP
-    'RIVN': '0001874178',  # Rivian Automotive, Inc. / DE
-    'RGA': '0000898174',  # REINSURANCE GROUP OF AMERICA INC
-    'CNH': '0001567094',  # CNH Industrial N.V.
-    'GMAB': '0001434265',  # GENMAB A/S
-    'KKPNY': '0001001474',  # KONINKLIJKE KPN N V
-    'ACM': '0000868857',  # AECOM
-    'WLMIY': '0001449566',  # Wilmar International Ltd
-    'TXT': '0000217346',  # TEXTRON INC
-    'CASY': '0000726958',  # CASEYS GENERAL STORES INC
-    'DUOL': '0001562088',  # Duolingo, Inc.
-    'VTRS': '0001792044',  # Viatris Inc
-    'APTV': '0001521332',  # Aptiv PLC
-    'LINE': '0001868159',  # Lineage, Inc.
-    'BSY': '0001031308',  # BENTLEY SYSTEMS INC
-    'DPZ': '0001286681',  # DOMINOS PIZZA INC
-    'RVTY': '0000031791',  # REVVITY, INC.
-    'COHR': '0000820318',  # COHERENT CORP.
-    'EVRG': '0001711269',  # Evergy, Inc.
-    'SFM': '0001575515',  # Sprouts Farmers Market, Inc.
-    'DOC': '0000765880',  # HEALTHPEAK PROPERTIES, INC.
-    'GFI': '0001172724',  # GOLD FIELDS LTD
-    'AMCR': '0001748790',  # Amcor plc
-    'GGG': '0000042888',  # GRACO INC
-    'INCY': '0000879169',  # INCYTE CORP
-    'MORN': '0001289419',  # Morningstar, Inc.
-    'FTI': '0001681459',  # TechnipFMC plc
-    'AKAM': '0001086222',  # AKAMAI TECHNOLOGIES INC
-    'RKLB': '0001819994',  # Rocket Lab USA, Inc.
-    'PKX': '0000889132',  # POSCO HOLDINGS INC.
-    'JHX': '0001159152',  # James Hardie Industries plc
-    'FMS': '0001333141',  # Fresenius Medical Care AG
-    'BZLFY': '0001072397',  # BUNZL PLC
-    'CW': '0000026324',  # CURTISS WRIGHT CORP
-    'PAA': '0001070423',  # PLAINS ALL AMERICAN PIPELINE LP
-    'CAVA': '0001639438',  # CAVA GROUP, INC.
-    'PFGC': '0001618673',  # Performance Food Group Co
-    'KGC': '0000701818',  # KINROSS GOLD CORP
-    'JBAXY': '0001475011',  # Julius Baer Group Ltd.
-    'UNM': '0000005513',  # Unum Group
-    'AU': '0001973832',  # AngloGold Ashanti PLC
-    'ESLT': '0001027664',  # ELBIT SYSTEMS LTD
-    'RNR': '0000913144',  # RENAISSANCERE HOLDINGS LTD
-    'SMMT': '0001599298',  # Summit Therapeutics Inc.
-    'OMVKY': '0000882602',  # OMV AKTIENGESELLSCHAFT /FI
-    'LOGI': '0001032975',  # LOGITECH INTERNATIONAL S.A.
-    'MBLY': '0001910139',  # Mobileye Global Inc.
-    'EWBC': '0001069157',  # EAST WEST BANCORP INC
-    'RDY': '0001135951',  # DR REDDYS LABORATORIES LTD
-    'JBSAY': '0001450123',  # JBS S.A.
-    'ELS': '0000895417',  # EQUITY LIFESTYLE PROPERTIES INC
-    'EPAM': '0001352010',  # EPAM Systems, Inc.
-    'EDPFY': '0001039610',  # EDP ENERGIAS DE PORTUGAL SA
-    'BMRN': '0001048477',  # BIOMARIN PHARMACEUTICAL INC
-    'JNPR': '0001043604',  # JUNIPER NETWORKS INC
-    'BJ': '0001531152',  # BJ's Wholesale Club Holdings, Inc.
-    'DVA': '0000927066',  # DAVITA INC.
-    'RKUNY': '0001294591',  # Rakuten Group, Inc.
-    'REG': '0000910606',  # REGENCY CENTERS CORP
-    'PANDY': '0001505880',  # Pandora A/S / ADR
-    'EBR': '0001439124',  # BRAZILIAN ELECTRIC POWER CO
-    'GLPI': '0001575965',  # Gaming & Leisure Properties, Inc.
-    'CAG': '0000023217',  # CONAGRA BRANDS INC.
-    'JKHY': '0000779152',  # JACK HENRY & ASSOCIATES INC
-    'VIV': '0001066119',  # TELEFONICA BRASIL S.A.
-    'GGAL': '0001114700',  # GRUPO FINANCIERO GALICIA SA
-    'SUZ': '0000909327',  # Suzano S.A.
-    'CNA': '0000021175',  # CNA FINANCIAL CORP
-    'POOL': '0000945841',  # POOL CORP
-    'CLH': '0000822818',  # CLEAN HARBORS INC
-    'CRDO': '0001807794',  # Credo Technology Group Holding Ltd
-    'TOL': '0000794170',  # Toll Brothers, Inc.
-    'SWK': '0000093556',  # STANLEY BLACK & DECKER, INC.
-    'THC': '0000070318',  # TENET HEALTHCARE CORP
-    'CLS': '0001030894',  # CELESTICA INC
-    'LAMR': '0001090425',  # LAMAR ADVERTISING CO/NEW
-    'SGIOY': '0001281721',  # SHIONOGI & CO LTD
-    'KMX': '0001170010',  # CARMAX INC
-    'PR': '0001658566',  # Permian Resources Corp
-    'CHRW': '0001043277',  # C. H. ROBINSON WORLDWIDE, INC.
-    'HST': '0001070750',  # HOST HOTELS & RESORTS, INC.
-    'AUR': '0001828108',  # Aurora Innovation, Inc.
-    'UHS': '0000352915',  # UNIVERSAL HEALTH SERVICES INC
-    'WIX': '0001576789',  # Wix.com Ltd.
-    'AAL': '0000006201',  # American Airlines Group Inc.
-    'BXP': '0001037540',  # BXP, Inc.
-    'AR': '0001433270',  # ANTERO RESOURCES Corp
-    'TXRH': '0001289460',  # Texas Roadhouse, Inc.
-    'SAIA': '0001177702',  # SAIA INC
-    'UHAL': '0000004457',  # U-Haul Holding Co /NV/
-    'SRPT': '0000873303',  # Sarepta Therapeutics, Inc.
-    'HLI': '0001302215',  # HOULIHAN LOKEY, INC.
-    'GMED': '0001237831',  # GLOBUS MEDICAL INC
-    'WPC': '0001025378',  # W. P. Carey Inc.
-    'RTO': '0000930157',  # RENTOKIL INITIAL PLC /FI
-    'PRMB': '0002042694',  # Primo Brands Corp
-    'CIEN': '0000936395',  # CIENA CORP
-    'RBRK': '0001943896',  # Rubrik, Inc.
-    'MMYT': '0001495153',  # MakeMyTrip Ltd
-    'NDEKY': '0000353991',  # NITTO DENKO CORP / ADR/
-    'TECH': '0000842023',  # BIO-TECHNE Corp
-    'CPT': '0000906345',  # CAMDEN PROPERTY TRUST
-    'INSM': '0001104506',  # INSMED Inc
-    'SOLV': '0001964738',  # Solventum Corp
-    'PAYC': '0001590955',  # Paycom Software, Inc.
-    'RADX': '0001949257',  # Radiopharm Theranostics Ltd
-    'ACI': '0001646972',  # Albertsons Companies, Inc.
-    'ROKU': '0001428439',  # ROKU, INC
-    'BCH': '0001161125',  # BANK OF CHILE
-    'TKHVY': '0001446444',  # Turk Hava Yollari A.O.
-    'XPEV': '0001810997',  # XPENG INC.
-    'SSMXY': '0001517231',  # Sysmex Corporation/ADR
-    'TKO': '0001973266',  # TKO Group Holdings, Inc.
-    'NNGRY': '0001690981',  # NN Group NV/ADR
-    'OVV': '0001792580',  # Ovintiv Inc.
-    'MTZ': '0000015615',  # MASTEC INC
-    'SNX': '0001177394',  # TD SYNNEX CORP
-    'BG': '0001996862',  # Bunge Global SA
-    'POAHY': '0001450346',  # Porsche Automobil Holding SE / ADR
-    'ITT': '0000216228',  # ITT INC.
-    'CART': '0001579091',  # Maplebear Inc.
-    'NVT': '0001720635',  # nVent Electric plc
-    'MGA': '0000749098',  # MAGNA INTERNATIONAL INC
-    'NDSN': '0000072331',  # NORDSON CORP
-    'CPB': '0000016732',  # CAMPBELL'S Co
-    'TFII': '0001588823',  # TFI International Inc.
-    'NCLH': '0001513761',  # Norwegian Cruise Line Holdings Ltd.
-    'JLL': '0001037976',  # JONES LANG LASALLE INC
-    'PCOR': '0001611052',  # PROCORE TECHNOLOGIES, INC.
-    'SCI': '0000089089',  # SERVICE CORP INTERNATIONAL
-    'JPXGY': '0001600520',  # Japan Exchange Group, Inc./ADR
-    'DAY': '0001725057',  # Dayforce, Inc.
-    'TTEK': '0000831641',  # TETRA TECH INC
-    'COKE': '0000317540',  # Coca-Cola Consolidated, Inc.
-    'PPC': '0000802481',  # PILGRIMS PRIDE CORP
-    'ALLE': '0001579241',  # Allegion plc
-    'AFG': '0001042046',  # AMERICAN FINANCIAL GROUP INC
-    'MEDP': '0001668397',  # Medpace Holdings, Inc.
-    'YMM': '0001838413',  # Full Truck Alliance Co. Ltd.
-    'MNDY': '0001845338',  # monday.com Ltd.
-    'TAP': '0000024545',  # MOLSON COORS BEVERAGE CO
-    'SJM': '0000091419',  # J M SMUCKER Co
-    'BIRK': '0001977102',  # Birkenstock Holding plc
-    'FHN': '0000036966',  # FIRST HORIZON CORP
-    'EMRAF': '0001127248',  # EMERA INC
-    'PCTY': '0001591698',  # Paylocity Holding Corp
-    'WWD': '0000108312',  # Woodward, Inc.
-    'SF': '0000720672',  # STIFEL FINANCIAL CORP
-    'SNN': '0000845982',  # SMITH & NEPHEW PLC
-    'SKX': '0001065837',  # SKECHERS USA INC
-    'DTM': '0001842022',  # DT Midstream, Inc.
-    'PSO': '0000938323',  # PEARSON PLC
-    'BWXT': '0001486957',  # BWX Technologies, Inc.
-    'LBRDA': '0001611983',  # Liberty Broadband Corp
-    'ALLY': '0000040729',  # Ally Financial Inc.
-    'KVYO': '0001835830',  # Klaviyo, Inc.
-    'EXAS': '0001124140',  # EXACT SCIENCES CORP
-    'SQM': '0000909037',  # CHEMICAL & MINING CO OF CHILE INC
-    'FUTU': '0001754581',  # Futu Holdings Ltd
-    'TLN': '0001622536',  # Talen Energy Corp
-    'ATR': '0000896622',  # APTARGROUP, INC.
-    'VDMCY': '0001468608',  # Vodacom Group Ltd / ADR
-    'LECO': '0000059527',  # LINCOLN ELECTRIC HOLDINGS INC
-    'NICE': '0001003935',  # NICE Ltd.
-    'ALB': '0000915913',  # ALBEMARLE CORP
-    'AIZ': '0001267238',  # ASSURANT, INC.
-    'EXEL': '0000939767',  # EXELIXIS, INC.
-    'KIKOY': '0001446656',  # Kikkoman Corp
-    'FND': '0001507079',  # Floor & Decor Holdings, Inc.
-    'ITCI': '0001567514',  # Intra-Cellular Therapies, Inc.
-    'EMN': '0000915389',  # EASTMAN CHEMICAL CO
-    'NLY': '0001043219',  # ANNALY CAPITAL MANAGEMENT INC
-    'ESTC': '0001707753',  # Elastic N.V.
-    'SEIC': '0000350894',  # SEI INVESTMENTS CO
-    'OHI': '0000888491',  # OMEGA HEALTHCARE INVESTORS INC
-    'WBA': '0001618921',  # Walgreens Boots Alliance, Inc.
-    'EDU': '0001372920',  # New Oriental Education & Technology Group Inc.
-    'PAG': '0001019849',  # PENSKE AUTOMOTIVE GROUP, INC.
-    'PCVX': '0001649094',  # Vaxcyte, Inc.
-    'EVR': '0001360901',  # Evercore Inc.
-    'BEN': '0000038777',  # FRANKLIN RESOURCES INC
-    'CNM': '0001856525',  # Core & Main, Inc.
-    'AAON': '0000824142',  # AAON, INC.
-    'IPG': '0000051644',  # INTERPUBLIC GROUP OF COMPANIES, INC.
-    'MUSA': '0001573516',  # Murphy USA Inc.
-    'QGEN': '0001015820',  # QIAGEN N.V.
-    'HNGKY': '0000871464',  # HONGKONG LAND HOLDINGS LTD /FI
-    'APG': '0001796209',  # APi Group Corp
-    'PSN': '0000275880',  # PARSONS CORP
-    'VFS': '0001913510',  # VinFast Auto Ltd.
-    'MTSI': '0001493594',  # MACOM Technology Solutions Holdings, Inc.
-    'ULS': '0001901440',  # UL Solutions Inc.
-    'SBS': '0001170858',  # COMPANHIA DE SANEAMENTO BASICO DO ESTADO DE SAO PAULO-SABESP
-    'AOS': '0000091142',  # SMITH A O CORP
-    'AEG': '0000769218',  # AEGON LTD.
-    'RRX': '0000082811',  # REGAL REXNORD CORP
-    'CACI': '0000016058',  # CACI INTERNATIONAL INC /DE/
-    'GTLB': '0001653482',  # Gitlab Inc.
-    'ARMK': '0001584509',  # Aramark
-    'KNSL': '0001669162',  # Kinsale Capital Group, Inc.
-    'DOCS': '0001516513',  # Doximity, Inc.
-    'BNT': '0001837429',  # Brookfield Wealth Solutions Ltd.
-    'WPP': '0000806968',  # WPP plc
-    'DSGX': '0001050140',  # DESCARTES SYSTEMS GROUP INC
-    'HTHT': '0001483994',  # H World Group Ltd
-    'USO': '0001327068',  # United States Oil Fund, LP
-    'PEN': '0001321732',  # Penumbra Inc
-    'TPX': '0001206264',  # TEMPUR SEALY INTERNATIONAL, INC.
-    'MGM': '0000789570',  # MGM Resorts International
-    'UWMC': '0001783398',  # UWM Holdings Corp
-    'CRL': '0001100682',  # CHARLES RIVER LABORATORIES INTERNATIONAL, INC.
-    'AIT': '0000109563',  # APPLIED INDUSTRIAL TECHNOLOGIES INC
-    'AYI': '0001144215',  # ACUITY BRANDS INC
-    'BIO': '0000012208',  # BIO-RAD LABORATORIES, INC.
-    'ALSN': '0001411207',  # Allison Transmission Holdings Inc
-    'CCK': '0001219601',  # CROWN HOLDINGS, INC.
-    'SLV': '0001330568',  # iShares Silver Trust
-    'FOUR': '0001794669',  # Shift4 Payments, Inc.
-    'LKQ': '0001065696',  # LKQ CORP
-    'GL': '0000320335',  # GLOBE LIFE INC.
-    'ALTR': '0001701732',  # Altair Engineering Inc.
-    'SSB': '0000764038',  # SouthState Corp
-    'PAC': '0001347557',  # Pacific Airport Group
-    'WTRG': '0000078128',  # Essential Utilities, Inc.
-    'ALSMY': '0001062066',  # ALSTOM
-    'ONTO': '0000704532',  # ONTO INNOVATION INC.
-    'VNOM': '0001602065',  # Viper Energy, Inc.
-    'GNRC': '0001474735',  # GENERAC HOLDINGS INC.
-    'DSEEY': '0001481045',  # Daiwa Securities Group Inc.
-    'CHDN': '0000020212',  # Churchill Downs Inc
-    'DOX': '0001062579',  # AMDOCS LTD
-    'BLD': '0001633931',  # TopBuild Corp
-    'PNW': '0000764622',  # PINNACLE WEST CAPITAL CORP
-    'EDR': '0001766363',  # Endeavor Group Holdings, Inc.
-    'AA': '0001675149',  # Alcoa Corp
-    'CRS': '0000017843',  # CARPENTER TECHNOLOGY CORP
-    'RBC': '0001324948',  # RBC Bearings INC
-    'RRC': '0000315852',  # RANGE RESOURCES CORP
-    'WBS': '0000801337',  # WEBSTER FINANCIAL CORP
-    'EHC': '0000785161',  # Encompass Health Corp
-    'BRKR': '0001109354',  # BRUKER CORP
-    'LCID': '0001811210',  # Lucid Group, Inc.
-    'BRBR': '0001772016',  # BELLRING BRANDS, INC.
-    'CUBE': '0001298675',  # CubeSmart
-    'SUM': '0001621563',  # Summit Materials, Inc.
-    'ENPH': '0001463101',  # Enphase Energy, Inc.
-    'CRRFY': '0001078642',  # CARREFOUR SA
-    'LAD': '0001023128',  # LITHIA MOTORS INC
-    'CFLT': '0001699838',  # Confluent, Inc.
-    'GAP': '0000039911',  # GAP INC
-    'BPYPP': '0001545772',  # Brookfield Property Partners L.P.
-    'KAIKY': '0001447126',  # Kawasaki Kisen Kaisha Ltd
-    'PRI': '0001475922',  # Primerica, Inc.
-    'GLOB': '0001557860',  # Globant S.A.
-    'PTBRY': '0001504122',  # PT Bank Negara Indonesia (Persero) Tbk/ADR
-    'WYNN': '0001174922',  # WYNN RESORTS LTD
-    'APPF': '0001433195',  # APPFOLIO INC
-    'DBX': '0001467623',  # DROPBOX, INC.
-    'CSXXY': '0001541309',  # carsales.com Limited/ADR
-    'TTAN': '0001638826',  # ServiceTitan, Inc.
-    'MASI': '0000937556',  # MASIMO CORP
-    'RDEIY': '0001438654',  # Red Electrica Corporacion SA/ADR
-    'MLI': '0000089439',  # MUELLER INDUSTRIES INC
-    'KEP': '0000887225',  # KOREA ELECTRIC POWER CORP
-    'VFC': '0000103379',  # V F CORP
-    'GLBE': '0001835963',  # Global-E Online Ltd.
-    'RGLD': '0000085535',  # ROYAL GOLD INC
-    'BROS': '0001866581',  # Dutch Bros Inc.
-    'GKOS': '0001192448',  # GLAUKOS Corp
-    'APA': '0001841666',  # APA Corp
-    'WCC': '0000929008',  # WESCO INTERNATIONAL INC
-    'FYBR': '0000020520',  # Frontier Communications Parent, Inc.
-    'IDKOY': '0001380365',  # IDEMITSU KOSAN CO., LTD
-    'WMS': '0001604028',  # ADVANCED DRAINAGE SYSTEMS, INC.
-    'BMA': '0001347426',  # Macro Bank Inc.
-    'FRT': '0000034903',  # FEDERAL REALTY INVESTMENT TRUST
-    'DRS': '0001833756',  # Leonardo DRS, Inc.
-    'HSIC': '0001000228',  # HENRY SCHEIN INC
-    'STN': '0001131383',  # STANTEC INC
-    'PNFP': '0001115055',  # PINNACLE FINANCIAL PARTNERS INC
-    'BSAC': '0001027552',  # BANCO SANTANDER CHILE
-    'HQY': '0001428336',  # HEALTHEQUITY, INC.
-    'NIO': '0001736541',  # NIO Inc.
-    'RGEN': '0000730272',  # REPLIGEN CORP
-    'CR': '0001944013',  # Crane Co
-    'LW': '0001679273',  # Lamb Weston Holdings, Inc.
-    'U': '0001810806',  # Unity Software Inc.
-    'AES': '0000874761',  # AES CORP
-    'WAL': '0001212545',  # WESTERN ALLIANCE BANCORPORATION
-    'ALK': '0000766421',  # ALASKA AIR GROUP, INC.
-    'BILL': '0001786352',  # BILL Holdings, Inc.
-    'REXR': '0001571283',  # Rexford Industrial Realty, Inc.
-    'FBIN': '0001519751',  # Fortune Brands Innovations, Inc.
-    'INGR': '0001046257',  # Ingredion Inc
-    'KD': '0001867072',  # Kyndryl Holdings, Inc.
-    'PLNT': '0001637207',  # Planet Fitness, Inc.
-    'CFR': '0000039263',  # CULLEN/FROST BANKERS, INC.
-    'ORI': '0000074260',  # OLD REPUBLIC INTERNATIONAL CORP
-    'IHICY': '0001567526',  # IHI Corporation/ADR
-    'KNX': '0001492691',  # Knight-Swift Transportation Holdings Inc.
-    'GTLS': '0000892553',  # CHART INDUSTRIES INC
-    'NYT': '0000071691',  # NEW YORK TIMES CO
-    'AGI': '0001178819',  # ALAMOS GOLD INC
-    'FN': '0001408710',  # Fabrinet
-    'FLR': '0001124198',  # FLUOR CORP
-    'WTFC': '0001015328',  # WINTRUST FINANCIAL CORP
-    'CBSH': '0000022356',  # COMMERCE BANCSHARES INC /MO/
-    'CX': '0001076378',  # CEMEX SAB DE CV
-    'HESM': '0001789832',  # Hess Midstream LP
-    'JCYGY': '0001289688',  # Jardine Cycle & Carriage Ltd.
-    'VERX': '0001806837',  # Vertex, Inc.
-    'TFX': '0000096943',  # TELEFLEX INC
-    'LTM': '0001047716',  # LATAM AIRLINES GROUP S.A.
-    'AGNC': '0001423689',  # AGNC Investment Corp.
-    'ANF': '0001018840',  # ABERCROMBIE & FITCH CO /DE/
-    'MKTX': '0001278021',  # MARKETAXESS HOLDINGS INC
-    'PEGA': '0001013857',  # PEGASYSTEMS INC
-    'EBCOY': '0000354518',  # EBARA CORP /ADR/
-    'WING': '0001636222',  # Wingstop Inc.
-    'UUGRY': '0001440130',  # United Utilities Group plc
-    'SKM': '0001015650',  # SK TELECOM CO LTD
-    'OGE': '0001021635',  # OGE ENERGY CORP.
-    'PAAS': '0000771992',  # PAN AMERICAN SILVER CORP
-    'HAS': '0000046080',  # HASBRO, INC.
-    'DCI': '0000029644',  # DONALDSON Co INC
-    'CMA': '0000028412',  # COMERICA INC /NEW/
-    'CIB': '0001071371',  # BANCOLOMBIA SA
-    'EXP': '0000918646',  # EAGLE MATERIALS INC
-    'SMAR': '0001366561',  # SMARTSHEET INC
-    'GPK': '0001408075',  # GRAPHIC PACKAGING HOLDING CO
-    'ATI': '0001018963',  # ATI INC
-    'FSV': '0001637810',  # FirstService Corp
-    'MOS': '0001285785',  # MOSAIC CO
-    'BBWI': '0000701985',  # Bath & Body Works, Inc.
-    'BRX': '0001581068',  # Brixmor Property Group Inc.
-    'ZION': '0000109380',  # ZIONS BANCORPORATION, NATIONAL ASSOCIATION /UT/
-    'BCUCY': '0001581285',  # Brunello Cucinelli S.p.A./ADR
-    'CHE': '0000019584',  # CHEMED CORP
-    'TTC': '0000737758',  # TORO CO
-    'VNO': '0000899689',  # VORNADO REALTY TRUST
-    'FRHC': '0000924805',  # Freedom Holding Corp.
-    'WF': '0001264136',  # WOORI FINANCIAL GROUP INC.
-    'WH': '0001722684',  # WYNDHAM HOTELS & RESORTS, INC.
-    'KBR': '0001357615',  # KBR, INC.
-    'HLNE': '0001433642',  # Hamilton Lane INC
-    'ASR': '0001123452',  # SOUTHEAST AIRPORT GROUP
-    'SARO': '0002025410',  # StandardAero, Inc.
-    'MTCH': '0000891103',  # Match Group, Inc.
-    'ROIV': '0001635088',  # Roivant Sciences Ltd.
-    'RVMD': '0001628171',  # Revolution Medicines, Inc.
-    'NBIS': '0001513845',  # Nebius Group N.V.
-    'DJT': '0001849635',  # Trump Media & Technology Group Corp.
-    'EGP': '0000049600',  # EASTGROUP PROPERTIES INC
-    'X': '0001163302',  # UNITED STATES STEEL CORP
-    'FLS': '0000030625',  # FLOWSERVE CORP
-    'INFA': '0001868778',  # Informatica Inc.
-    'ASND': '0001612042',  # Ascendis Pharma A/S
-    'KT': '0000892450',  # KT CORP
-    'LSCC': '0000855658',  # LATTICE SEMICONDUCTOR CORP
-    'RH': '0001528849',  # RH
-    'G': '0001398659',  # Genpact LTD
-    'MTDR': '0001520006',  # Matador Resources Co
-    'BERY': '0001378992',  # BERRY GLOBAL GROUP, INC.
-    'CHRD': '0001486159',  # Chord Energy Corp
-    'CAE': '0001173382',  # CAE INC
-    'MNSO': '0001815846',  # MINISO Group Holding Ltd
-    'OUKPY': '0001436786',  # Outotec OYJ
-    'LNW': '0000750004',  # Light & Wonder, Inc.
-    'PARA': '0000813828',  # Paramount Global
-    'ENSG': '0001125376',  # ENSIGN GROUP, INC
-    'AM': '0001623925',  # Antero Midstream Corp
-    'MHK': '0000851968',  # MOHAWK INDUSTRIES INC
-    'GIL': '0001061894',  # Gildan Activewear Inc.
-    'ADC': '0000917251',  # AGREE REALTY CORP
-    'HII': '0001501585',  # HUNTINGTON INGALLS INDUSTRIES, INC.
-    'AXTA': '0001616862',  # Axalta Coating Systems Ltd.
-    'IVZ': '0000914208',  # Invesco Ltd.
-    'LPX': '0000060519',  # LOUISIANA-PACIFIC CORP
-    'JAZZ': '0001232524',  # Jazz Pharmaceuticals plc
-    'MKSI': '0001049502',  # MKS INSTRUMENTS INC
-    'MDGL': '0001157601',  # MADRIGAL PHARMACEUTICALS, INC.
-    'HRB': '0000012659',  # H&R BLOCK INC
-    'OTEX': '0001002638',  # OPEN TEXT CORP
-    'ALV': '0001034670',  # AUTOLIV INC
-    'DLB': '0001308547',  # Dolby Laboratories, Inc.
-    'CCCS': '0001818201',  # CCC Intelligent Solutions Holdings Inc.
-    'S': '0001583708',  # SentinelOne, Inc.
-    'EXLS': '0001297989',  # ExlService Holdings, Inc.
-    'MIDD': '0000769520',  # MIDDLEBY Corp
-    'SNV': '0000018349',  # SYNOVUS FINANCIAL CORP
-    'AXS': '0001214816',  # AXIS CAPITAL HOLDINGS LTD
-    'CE': '0001306830',  # Celanese Corp
-    'PATH': '0001734722',  # UiPath, Inc.
-    'NNN': '0000751364',  # NNN REIT, INC.
-    'SIRI': '0000908937',  # SIRIUS XM HOLDINGS INC.
-    'ELF': '0001600033',  # e.l.f. Beauty, Inc.
-    'DDS': '0000028917',  # DILLARD'S, INC.
-    'STEP': '0001796022',  # StepStone Group Inc.
-    'ONB': '0000707179',  # OLD NATIONAL BANCORP /IN/
-    'OLED': '0001005284',  # UNIVERSAL DISPLAY CORP \PA\
-    'IONQ': '0001824920',  # IonQ, Inc.
-    'HCP': '0001720671',  # HashiCorp, Inc.
-    'LEVI': '0000094845',  # LEVI STRAUSS & CO
-    'FRPT': '0001611647',  # Freshpet, Inc.
-    'ESAB': '0001877322',  # ESAB Corp
-    'PB': '0001068851',  # PROSPERITY BANCSHARES INC
-    'SUN': '0001552275',  # Sunoco LP
-    'TREX': '0001069878',  # TREX CO INC
-    'FCN': '0000887936',  # FTI CONSULTING, INC
-    'ERJ': '0001355444',  # EMBRAER S.A.
-    'BZZUY': '0001437774',  # BUZZI UNICEM S.p.A.
-    'BXSL': '0001736035',  # Blackstone Secured Lending Fund
-    'ZK': '0001954042',  # ZEEKR Intelligent Technology Holding Ltd
-    'CWST': '0000911177',  # CASELLA WASTE SYSTEMS INC
-    'LKNCY': '0001767582',  # Luckin Coffee Inc.
-    'RHI': '0000315213',  # ROBERT HALF INC.
-    'RLI': '0000084246',  # RLI CORP
-    'AN': '0000350698',  # AUTONATION, INC.
-    'QRVO': '0001604778',  # Qorvo, Inc.
-    'JOBY': '0001819848',  # Joby Aviation, Inc.
-    'BWA': '0000908255',  # BORGWARNER INC
-    'AGCO': '0000880266',  # AGCO CORP /DE
-    'CWAN': '0001866368',  # Clearwater Analytics Holdings, Inc.
-    'WEX': '0001309108',  # WEX Inc.
-    'LOAR': '0002000178',  # Loar Holdings Inc.
-    'HALO': '0001159036',  # HALOZYME THERAPEUTICS, INC.
-    'CVLT': '0001169561',  # COMMVAULT SYSTEMS INC
-    'WFG': '0001402388',  # WEST FRASER TIMBER CO., LTD
-    'ICL': '0000941221',  # ICL Group Ltd.
-    'MOG-A': '0000067887',  # MOOG INC.
-    'SPSC': '0001092699',  # SPS COMMERCE INC
-    'DINO': '0001915657',  # HF Sinclair Corp
-    'BRRLY': '0001706795',  # Barry Callebaut AG/ADR
-    'BOKF': '0000875357',  # BOK FINANCIAL CORP
-    'LNTH': '0001521036',  # Lantheus Holdings, Inc.
-    'CZR': '0001590895',  # Caesars Entertainment, Inc.
-    'VIPS': '0001529192',  # Vipshop Holdings Ltd
-    'BILI': '0001723690',  # Bilibili Inc.
-    'BFAM': '0001437578',  # BRIGHT HORIZONS FAMILY SOLUTIONS INC.
-    'SATS': '0001415404',  # EchoStar CORP
-    'MTN': '0000812011',  # VAIL RESORTS INC
-    'SSD': '0000920371',  # Simpson Manufacturing Co., Inc.
-    'CHH': '0001046311',  # CHOICE HOTELS INTERNATIONAL INC /DE
-    'UFPI': '0000912767',  # UFP INDUSTRIES INC
-    'BPOP': '0000763901',  # POPULAR, INC.
-    'FR': '0000921825',  # FIRST INDUSTRIAL REALTY TRUST INC
-    'PDI': '0001510599',  # PIMCO Dynamic Income Fund
-    'CIGI': '0000913353',  # Colliers International Group Inc.
-    'OS': '0001889956',  # OneStream, Inc.
-    'R': '0000085961',  # RYDER SYSTEM INC
-    'ENLC': '0001592000',  # EnLink Midstream, LLC
-    'WTS': '0000795403',  # WATTS WATER TECHNOLOGIES INC
-    'JHG': '0001274173',  # JANUS HENDERSON GROUP PLC
-    'WHR': '0000106640',  # WHIRLPOOL CORP /DE/
-    'WSC': '0001647088',  # WillScot Holdings Corp
-    'CMS-PB': '0000201533',  # CONSUMERS ENERGY CO
-    'OLLI': '0001639300',  # Ollie's Bargain Outlet Holdings, Inc.
-    'QXO': '0001236275',  # QXO, Inc.
-    'AZEK': '0001782754',  # AZEK Co Inc.
-    'UELMO': '0000100826',  # UNION ELECTRIC CO
-    'WAY': '0001990354',  # Waystar Holding Corp.
-    'CROX': '0001334036',  # Crocs, Inc.
-    'ASTS': '0001780312',  # AST SpaceMobile, Inc.
-    'SPXC': '0000088205',  # SPX Technologies, Inc.
-    'STWD': '0001465128',  # STARWOOD PROPERTY TRUST, INC.
-    'VOYA': '0001535929',  # Voya Financial, Inc.
-    'CELH': '0001341766',  # Celsius Holdings, Inc.
-    'BECN': '0001124941',  # BEACON ROOFING SUPPLY INC
-    'AMKR': '0001047127',  # AMKOR TECHNOLOGY, INC.
-    'NVMI': '0001109345',  # NOVA LTD.
-    'CGNX': '0000851205',  # COGNEX CORP
-    'MAT': '0000063276',  # MATTEL INC /DE/
-    'STVN': '0001849853',  # Stevanato Group S.p.A.
-    'BLCO': '0001860742',  # Bausch & Lomb Corp
-    'BYD': '0000906553',  # BOYD GAMING CORP
-    'BRFS': '0001122491',  # BRF S.A.
-    'LEGN': '0001801198',  # Legend Biotech Corp
-    'MOD': '0000067347',  # MODINE MANUFACTURING CO
-    'JXN': '0001822993',  # Jackson Financial Inc.
-    'EAT': '0000703351',  # BRINKER INTERNATIONAL, INC
-    'FMC': '0000037785',  # FMC CORP
-    'MSA': '0000066570',  # MSA Safety Inc
-    'POST': '0001530950',  # Post Holdings, Inc.
-    'CADE': '0001299939',  # Cadence Bank
-    'AWI': '0000007431',  # ARMSTRONG WORLD INDUSTRIES INC
-    'ESI': '0001590714',  # Element Solutions Inc
-    'NGKSY': '0001442655',  # NGK Spark Plug Co., Ltd.
-    'ADOOY': '0001489079',  # Adaro Energy PT/ADR/
-    'BMI': '0000009092',  # BADGER METER INC
-    'ADT': '0001703056',  # ADT Inc.
-    'INSP': '0001609550',  # Inspire Medical Systems, Inc.
-    'ZWS': '0001439288',  # Zurn Elkay Water Solutions Corp
-    'CSWI': '0001624794',  # CSW INDUSTRIALS, INC.
-    'FNMA': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'TMHC': '0001562476',  # Taylor Morrison Home Corp
-    'GNTX': '0000355811',  # GENTEX CORP
-    'OMF': '0001584207',  # OneMain Holdings, Inc.
-    'ALTM': '0001977303',  # Arcadium Lithium plc
-    'PAM': '0001469395',  # Pampa Energy Inc.
-    'NXT': '0001852131',  # Nextracker Inc.
-    'RHP': '0001040829',  # Ryman Hospitality Properties, Inc.
-    'UGI': '0000884614',  # UGI CORP /PA/
-    'PJT': '0001626115',  # PJT Partners Inc.
-    'MARA': '0001507605',  # MARA Holdings, Inc.
-    'HMY': '0001023514',  # HARMONY GOLD MINING CO LTD
-    'VMI': '0000102729',  # VALMONT INDUSTRIES INC
-    'STAG': '0001479094',  # STAG Industrial, Inc.
-    'XP': '0001787425',  # XP Inc.
-    'RMBS': '0000917273',  # RAMBUS INC
-    'KEX': '0000056047',  # KIRBY CORP
-    'FSK': '0001422183',  # FS KKR Capital Corp
-    'FAF': '0001472787',  # First American Financial Corp
-    'SPXSY': '0001518542',  # Spirax-Sarco Engineering PLC/ADR
-    'COLD': '0001455863',  # AMERICOLD REALTY TRUST
-    'ARW': '0000007536',  # ARROW ELECTRONICS, INC.
-    'TEM': '0001717115',  # Tempus AI, Inc.
-    'TKC': '0001071321',  # TURKCELL ILETISIM HIZMETLERI A S
-    'COOP': '0000933136',  # Mr. Cooper Group Inc.
-    'LFUS': '0000889331',  # LITTELFUSE INC /DE
-    'LSTR': '0000853816',  # LANDSTAR SYSTEM INC
-    'ETSY': '0001370637',  # ETSY INC
-    'WK': '0001445305',  # WORKIVA INC
-    'OSK': '0000775158',  # OSHKOSH CORP
-    'CRK': '0000023194',  # COMSTOCK RESOURCES INC
-    'BBAR': '0000913059',  # Banco BBVA Argentina S.A.
-    'COTY': '0001024305',  # COTY INC.
-    'DAR': '0000916540',  # DARLING INGREDIENTS INC.
-    'MTG': '0000876437',  # MGIC INVESTMENT CORP
-    'ESNT': '0001448893',  # Essent Group Ltd.
-    'LITE': '0001633978',  # Lumentum Holdings Inc.
-    'TRNO': '0001476150',  # Terreno Realty Corp
-    'SITE': '0001650729',  # SiteOne Landscape Supply, Inc.
-    'SLM': '0001032033',  # SLM Corp
-    'SMTC': '0000088941',  # SEMTECH CORP
-    'OBDC': '0001655888',  # Blue Owl Capital Corp
-    'SAIC': '0001571123',  # Science Applications International Corp
-    'DUFRY': '0001546354',  # Dufry AG/ADR
-    'LB': '0001995807',  # LandBridge Co LLC
-    'IDA': '0001057877',  # IDACORP INC
-    'TSEM': '0000928876',  # TOWER SEMICONDUCTOR LTD
-    'FUPBY': '0001534043',  # Fuchs Petrolub SE/ADR
-    'FSS': '0000277509',  # FEDERAL SIGNAL CORP /DE/
-    'SRAD': '0001836470',  # Sportradar Group AG
-    'NFG': '0000070145',  # NATIONAL FUEL GAS CO
-    'HR': '0001360604',  # Healthcare Realty Trust Inc
-    'ELAN': '0001739104',  # Elanco Animal Health Inc
-    'MMSI': '0000856982',  # MERIT MEDICAL SYSTEMS INC
-    'GRFS': '0001438569',  # Grifols SA
-    'QFIN': '0001741530',  # Qifu Technology, Inc.
-    'TGS': '0000931427',  # GAS TRANSPORTER OF THE SOUTH INC
-    'FIVE': '0001177609',  # FIVE BELOW, INC
-    'GPI': '0001031203',  # GROUP 1 AUTOMOTIVE INC
-    'BZ': '0001842827',  # Kanzhun Ltd
-    'NOV': '0001021860',  # NOV Inc.
-    'TX': '0001342874',  # Ternium S.A.
-    'TAL': '0001499620',  # TAL Education Group
-    'PVH': '0000078239',  # PVH CORP. /DE/
-    'RITM': '0001556593',  # Rithm Capital Corp.
-    'BPMC': '0001597264',  # Blueprint Medicines Corp
-    'AMTM': '0002011286',  # Amentum Holdings, Inc.
-    'HIMS': '0001773751',  # Hims & Hers Health, Inc.
-    'W': '0001616707',  # Wayfair Inc.
-    'GGB': '0001073404',  # GERDAU S.A.
-    'YKLTY': '0001538118',  # Yakult Honsha Co., LTD/ADR
-    'SMBMY': '0001448978',  # SembCorp Marine Ltd.
-    'CYTK': '0001061983',  # CYTOKINETICS INC
-    'COLB': '0000887343',  # COLUMBIA BANKING SYSTEM, INC.
-    'TIMB': '0001826168',  # TIM S.A.
-    'SHAK': '0001620533',  # Shake Shack Inc.
-    'BE': '0001664703',  # Bloom Energy Corp
-    'REYN': '0001786431',  # Reynolds Consumer Products Inc.
-    'CRVL': '0000874866',  # CORVEL CORP
-    'SIGI': '0000230557',  # SELECTIVE INSURANCE GROUP INC
-    'BBIO': '0001743881',  # BridgeBio Pharma, Inc.
-    'CIG': '0001157557',  # ENERGY CO OF MINAS GERAIS
-    'MEJHY': '0001558812',  # MEIJI Holdings Co Ltd/ADR
-    'LUMN': '0000018926',  # Lumen Technologies, Inc.
-    'VIRT': '0001592386',  # Virtu Financial, Inc.
-    'VNT': '0001786842',  # Vontier Corp
-    'ACIW': '0000935036',  # ACI WORLDWIDE, INC.
-    'GBCI': '0000868671',  # GLACIER BANCORP, INC.
-    'KNF': '0001955520',  # Knife River Corp
-    'SLGN': '0000849869',  # SILGAN HOLDINGS INC
-    'HOMB': '0001331520',  # HOME BANCSHARES INC
-    'ERELY': '0001454144',  # Eregli Demir ve Celik Fabrikalari TAS/ADR
-    'QTWO': '0001410384',  # Q2 Holdings, Inc.
-    'EPRT': '0001728951',  # ESSENTIAL PROPERTIES REALTY TRUST, INC.
-    'MTH': '0000833079',  # Meritage Homes CORP
-    'NUVL': '0001861560',  # Nuvalent, Inc.
-    'NSA': '0001618563',  # National Storage Affiliates Trust
-    'CMC': '0000022444',  # COMMERCIAL METALS Co
-    'SITM': '0001451809',  # SITIME Corp
-    'LYFT': '0001759509',  # Lyft, Inc.
-    'GATX': '0000040211',  # GATX CORP
-    'CRUS': '0000772406',  # CIRRUS LOGIC, INC.
-    'CACC': '0000885550',  # CREDIT ACCEPTANCE CORP
-    'UMBF': '0000101382',  # UMB FINANCIAL CORP
-    'NOVT': '0001076930',  # NOVANTA INC
-    'VG': '0002007855',  # Venture Global, Inc.
-    'THG': '0000944695',  # HANOVER INSURANCE GROUP, INC.
-    'AMG': '0001004434',  # AFFILIATED MANAGERS GROUP, INC.
-    'GDS': '0001526125',  # GDS Holdings Ltd
-    'PSLV': '0001494728',  # Sprott Physical Silver Trust
-    'UPST': '0001647639',  # Upstart Holdings, Inc.
-    'HXL': '0000717605',  # HEXCEL CORP /DE/
-    'URBN': '0000912615',  # URBAN OUTFITTERS INC
-    'IONS': '0000874015',  # IONIS PHARMACEUTICALS INC
-    'USM': '0000821130',  # UNITED STATES CELLULAR CORP
-    'CHX': '0001723089',  # ChampionX Corp
-    'PONY': '0001969302',  # Pony AI Inc.
-    'NE': '0001895262',  # Noble Corp plc
-    'CORT': '0001088856',  # CORCEPT THERAPEUTICS INC
-    'INTA': '0001565687',  # Intapp, Inc.
-    'SOUN': '0001840856',  # SOUNDHOUND AI, INC.
-    'DY': '0000067215',  # DYCOM INDUSTRIES INC
-    'GXO': '0001852244',  # GXO Logistics, Inc.
-    'FNB': '0000037808',  # FNB CORP/PA/
-    'MSGS': '0001636519',  # Madison Square Garden Sports Corp.
-    'LNC': '0000059558',  # LINCOLN NATIONAL CORP
-    'RDNT': '0000790526',  # RadNet, Inc.
-    'WFRD': '0001603923',  # Weatherford International plc
-    'MAIN': '0001396440',  # Main Street Capital CORP
-    'HRI': '0001364479',  # HERC HOLDINGS INC
-    'TKR': '0000098362',  # TIMKEN CO
-    'SOBO': '0002019061',  # South Bow Corp
-    'KRG': '0001286043',  # KITE REALTY GROUP TRUST
-    'CEF': '0001726122',  # Sprott Physical Gold & Silver Trust
-    'AL': '0001487712',  # AIR LEASE CORP
-    'NSIT': '0000932696',  # INSIGHT ENTERPRISES INC
-    'MC': '0001596967',  # Moelis & Co
-    'GTES': '0001718512',  # Gates Industrial Corp plc
-    'VRNS': '0001361113',  # VARONIS SYSTEMS INC
-    'BCPC': '0000009326',  # BALCHEM CORP
-    'FG': '0001934850',  # F&G Annuities & Life, Inc.
-    'BIPC': '0001788348',  # Brookfield Infrastructure Corp
-    'STRL': '0000874238',  # STERLING INFRASTRUCTURE, INC.
-    'CALM': '0000016160',  # CAL-MAINE FOODS INC
-    'TLX': '0002007191',  # Telix Pharmaceuticals Ltd
-    'DNB': '0001799208',  # Dun & Bradstreet Holdings, Inc.
-    'SM': '0000893538',  # SM Energy Co
-    'THO': '0000730263',  # THOR INDUSTRIES INC
-    'MAC': '0000912242',  # MACERICH CO
-    'SNDR': '0001692063',  # Schneider National, Inc.
-    'SKY': '0000090896',  # Champion Homes, Inc.
-    'PFSI': '0001745916',  # PennyMac Financial Services, Inc.
-    'CIVI': '0001509589',  # CIVITAS RESOURCES, INC.
-    'CWEN': '0001567683',  # Clearway Energy, Inc.
-    'LEA': '0000842162',  # LEAR CORP
-    'FFIN': '0000036029',  # FIRST FINANCIAL BANKSHARES INC
-    'LRN': '0001157408',  # Stride, Inc.
-    'SWX': '0001692115',  # Southwest Gas Holdings, Inc.
-    'CLF': '0000764065',  # CLEVELAND-CLIFFS INC.
-    'QLYS': '0001107843',  # QUALYS, INC.
-    'MGY': '0001698990',  # Magnolia Oil & Gas Corp
-    'LTH': '0001869198',  # Life Time Group Holdings, Inc.
-    'MYTHY': '0001437470',  # Mytilineos Holdings S.A.
-    'CTRE': '0001590717',  # CareTrust REIT, Inc.
-    'MUR': '0000717423',  # MURPHY OIL CORP
-    'BEPC': '0001791863',  # Brookfield Renewable Corp
-    'PECO': '0001476204',  # Phillips Edison & Company, Inc.
-    'SEE': '0001012100',  # SEALED AIR CORP/DE
-    'IBP': '0001580905',  # Installed Building Products, Inc.
-    'SKLTY': '0001487139',  # Seek Ltd
-    'ROAD': '0001718227',  # Construction Partners, Inc.
-    'UBSI': '0000729986',  # UNITED BANKSHARES INC/WV
-    'PHI': '0000078150',  # PLDT Inc.
-    'VLY': '0000714310',  # VALLEY NATIONAL BANCORP
-    'CUYTY': '0001437153',  # Colruyt SA
-    'CUZ': '0000025232',  # COUSINS PROPERTIES INC
-    'ESGR': '0001363829',  # Enstar Group LTD
-    'ACT': '0001823529',  # Enact Holdings, Inc.
-    'BOOT': '0001610250',  # Boot Barn Holdings, Inc.
-    'FCFS': '0000840489',  # FirstCash Holdings, Inc.
-    'KTB': '0001760965',  # Kontoor Brands, Inc.
-    'CRC': '0001609253',  # California Resources Corp
-    'IDCC': '0001405495',  # InterDigital, Inc.
-    'COLM': '0001050797',  # COLUMBIA SPORTSWEAR CO
-    'CBT': '0000016040',  # CABOT CORP
-    'OZK': '0001569650',  # Bank OZK
-    'FRSH': '0001544522',  # Freshworks Inc.
-    'AVAV': '0001368622',  # AeroVironment Inc
-    'CLBT': '0001854587',  # Cellebrite DI Ltd.
-    'LOPE': '0001434588',  # Grand Canyon Education, Inc.
-    'HWC': '0000750577',  # HANCOCK WHITNEY CORP
-    'ITRI': '0000780571',  # ITRON, INC.
-    'WTM': '0000776867',  # WHITE MOUNTAINS INSURANCE GROUP LTD
-    'NXST': '0001142417',  # NEXSTAR MEDIA GROUP, INC.
-    'INGM': '0001897762',  # Ingram Micro Holding Corp
-    'ABG': '0001144980',  # ASBURY AUTOMOTIVE GROUP INC
-    'NARI': '0001531048',  # Inari Medical, Inc.
-    'NEU': '0001282637',  # NEWMARKET CORP
-    'PAGP': '0001581990',  # PLAINS GP HOLDINGS LP
-    'PRCT': '0001588978',  # PROCEPT BioRobotics Corp
-    'TEO': '0000932470',  # TELECOM ARGENTINA SA
-    'IEP': '0000813762',  # ICAHN ENTERPRISES L.P.
-    'TENB': '0001660280',  # Tenable Holdings, Inc.
-    'FUN': '0001999001',  # Six Flags Entertainment Corporation/NEW
-    'KBH': '0000795266',  # KB HOME
-    'BGC': '0001094831',  # BGC Group, Inc.
-    'MMS': '0001032220',  # MAXIMUS, INC.
-    'ACHR': '0001824502',  # Archer Aviation Inc.
-    'BDC': '0000913142',  # BELDEN INC.
-    'AROC': '0001389050',  # Archrock, Inc.
-    'LANC': '0000057515',  # LANCASTER COLONY CORP
-    'RDN': '0000890926',  # RADIAN GROUP INC
-    'GH': '0001576280',  # Guardant Health, Inc.
-    'ITGR': '0001114483',  # Integer Holdings Corp
-    'ALKS': '0001520262',  # Alkermes plc.
-    'SON': '0000091767',  # SONOCO PRODUCTS CO
-    'EXPO': '0000851520',  # EXPONENT INC
-    'BKGFY': '0001447137',  # Berkeley Group Holdings plc
-    'MATX': '0000003453',  # Matson, Inc.
-    'NJR': '0000356309',  # NEW JERSEY RESOURCES CORP
-    'ACA': '0001739445',  # Arcosa, Inc.
-    'AVT': '0000008858',  # AVNET INC
-    'PIPR': '0001230245',  # PIPER SANDLER COMPANIES
-    'AEIS': '0000927003',  # ADVANCED ENERGY INDUSTRIES INC
-    'MSM': '0001003078',  # MSC INDUSTRIAL DIRECT CO INC
-    'IESC': '0001048268',  # IES Holdings, Inc.
-    'VVV': '0001674910',  # VALVOLINE INC
-    'KTOS': '0001069258',  # KRATOS DEFENSE & SECURITY SOLUTIONS, INC.
-    'BOX': '0001372612',  # BOX INC
-    'TGTX': '0001001316',  # TG THERAPEUTICS, INC.
-    'BRZE': '0001676238',  # Braze, Inc.
-    'TNET': '0000937098',  # TRINET GROUP, INC.
-    'SKYW': '0000793733',  # SKYWEST INC
-    'BCC': '0001328581',  # BOISE CASCADE Co
-    'CNX': '0001070412',  # CNX Resources Corp
-    'RELY': '0001782170',  # Remitly Global, Inc.
-    'SLG': '0001040971',  # SL GREEN REALTY CORP
-    'RRR': '0001653653',  # Red Rock Resorts, Inc.
-    'SFBS': '0001430723',  # ServisFirst Bancshares, Inc.
-    'SNRE': '0002021938',  # Sunrise Communications AG
-    'AGO': '0001273813',  # ASSURED GUARANTY LTD
-    'ADMA': '0001368514',  # ADMA BIOLOGICS, INC.
-    'KRYS': '0001711279',  # Krystal Biotech, Inc.
-    'VKTX': '0001607678',  # Viking Therapeutics, Inc.
-    'PLXS': '0000785786',  # PLEXUS CORP
-    'M': '0000794367',  # Macy's, Inc.
-    'ASAN': '0001477720',  # Asana, Inc.
-    'LBTYA': '0001570585',  # Liberty Global Ltd.
-    'ROYMY': '0001592438',  # Royal Mail plc/ADR
-    'GOLF': '0001672013',  # Acushnet Holdings Corp.
-    'GEO': '0000923796',  # GEO GROUP INC
-    'SLAB': '0001038074',  # SILICON LABORATORIES INC.
-    'CNS': '0001284812',  # COHEN & STEERS, INC.
-    'GLNG': '0001207179',  # GOLAR LNG LTD
-    'EEFT': '0001029199',  # EURONET WORLDWIDE, INC.
-    'POR': '0000784977',  # PORTLAND GENERAL ELECTRIC CO /OR/
-    'RUSHA': '0001012019',  # RUSH ENTERPRISES INC TX
-    'LAZ': '0001311370',  # Lazard, Inc.
-    'ALGM': '0000866291',  # ALLEGRO MICROSYSTEMS, INC.
-    'FELE': '0000038725',  # FRANKLIN ELECTRIC CO INC
-    'KRC': '0001025996',  # KILROY REALTY CORP
-    'FTDR': '0001727263',  # Frontdoor, Inc.
-    'IRT': '0001466085',  # INDEPENDENCE REALTY TRUST, INC.
-    'ACHC': '0001520697',  # Acadia Healthcare Company, Inc.
-    'SIM': '0000887153',  # GRUPO SIMEC, S.A.B. de C.V.
-    'AHR': '0001632970',  # American Healthcare REIT, Inc.
-    'TXNM': '0001108426',  # TXNM ENERGY INC
-    'AI': '0001577526',  # C3.ai, Inc.
-    'BC': '0000014930',  # BRUNSWICK CORP
-    'ZETA': '0001851003',  # Zeta Global Holdings Corp.
-    'SANM': '0000897723',  # SANMINA CORP
-    'PRIM': '0001361538',  # Primoris Services Corp
-    'OGN': '0001821825',  # Organon & Co.
-    'CBZ': '0000944148',  # CBIZ, Inc.
-    'ABCB': '0000351569',  # Ameris Bancorp
-    'RIOT': '0001167419',  # Riot Platforms, Inc.
-    'IPAR': '0000822663',  # INTERPARFUMS INC
-    'ELP': '0001041792',  # ENERGY CO OF PARANA
-    'CAMT': '0001109138',  # CAMTEK LTD
-    'ST': '0001477294',  # Sensata Technologies Holding plc
-    'UNF': '0000717954',  # UNIFIRST CORP
-    'GBTG': '0001820872',  # Global Business Travel Group, Inc.
-    'TIGO': '0000912958',  # MILLICOM INTERNATIONAL CELLULAR SA
-    'OPCH': '0001014739',  # Option Care Health, Inc.
-    'AB': '0000825313',  # ALLIANCEBERNSTEIN HOLDING L.P.
-    'NWL': '0000814453',  # NEWELL BRANDS INC.
-    'VRRM': '0001682745',  # VERRA MOBILITY Corp
-    'CRGY': '0001866175',  # Crescent Energy Co
-    'ALVO': '0001898416',  # Alvotech
-    'KMPR': '0000860748',  # KEMPER Corp
-    'ASO': '0001817358',  # Academy Sports & Outdoors, Inc.
-    'FLO': '0001128928',  # FLOWERS FOODS INC
-    'SPR': '0001364885',  # Spirit AeroSystems Holdings, Inc.
-    'KAI': '0000886346',  # KADANT INC
-    'FIZZ': '0000069891',  # NATIONAL BEVERAGE CORP
-    'BKH': '0001130464',  # BLACK HILLS CORP /SD/
-    'NOG': '0001104485',  # NORTHERN OIL & GAS, INC.
-    'PYCR': '0001839439',  # PAYCOR HCM, INC.
-    'PI': '0001114995',  # IMPINJ INC
-    'ENIC': '0001659939',  # Enel Chile S.A.
-    'VCTR': '0001570827',  # Victory Capital Holdings, Inc.
-    'ORA': '0001296445',  # ORMAT TECHNOLOGIES, INC.
-    'JWN': '0000072333',  # NORDSTROM INC
-    'WHD': '0001699136',  # Cactus, Inc.
-    'BCO': '0000078890',  # BRINKS CO
-    'CORZ': '0001839341',  # Core Scientific, Inc./tx
-    'GBDC': '0001476765',  # GOLUB CAPITAL BDC, Inc.
-    'SBRA': '0001492298',  # Sabra Health Care REIT, Inc.
-    'TAC': '0001144800',  # TRANSALTA CORP
-    'IBOC': '0000315709',  # INTERNATIONAL BANCSHARES CORP
-    'RXO': '0001929561',  # RXO, Inc.
-    'AXSM': '0001579428',  # Axsome Therapeutics, Inc.
-    'RARE': '0001515673',  # Ultragenyx Pharmaceutical Inc.
-    'JBTM': '0001433660',  # JBT Marel Corp
-    'NFE': '0001749723',  # New Fortress Energy Inc.
-    'FAURY': '0001559444',  # FORVIA SE/ADR
-    'FRO': '0000913290',  # Frontline plc
-    'ICUI': '0000883984',  # ICU MEDICAL INC/DE
-    'HAE': '0000313143',  # HAEMONETICS CORP
-    'ASB': '0000007789',  # ASSOCIATED BANC-CORP
-    'OGS': '0001587732',  # ONE Gas, Inc.
-    'NXE': '0001698535',  # NexGen Energy Ltd.
-    'SMG': '0000825542',  # SCOTTS MIRACLE-GRO CO
-    'ASGN': '0000890564',  # ASGN Inc
-    'GVA': '0000861459',  # GRANITE CONSTRUCTION INC
-    'CRNX': '0001658247',  # Crinetics Pharmaceuticals, Inc.
-    'BLKB': '0001280058',  # BLACKBAUD INC
-    'SR': '0001126956',  # SPIRE INC
-    'SG': '0001477815',  # Sweetgreen, Inc.
-    'AX': '0001299709',  # Axos Financial, Inc.
-    'PAY': '0001841156',  # Paymentus Holdings, Inc.
-    'ALE': '0000066756',  # ALLETE INC
-    'BHVN': '0001935979',  # Biohaven Ltd.
-    'HGV': '0001674168',  # Hilton Grand Vacations Inc.
-    'RYN': '0000052827',  # RAYONIER INC
-    'NCNO': '0001902733',  # nCino, Inc.
-    'TDS': '0001051512',  # TELEPHONE & DATA SYSTEMS INC /DE/
-    'DORM': '0000868780',  # Dorman Products, Inc.
-    'SRRK': '0001727196',  # Scholar Rock Holding Corp
-    'NNI': '0001258602',  # NELNET INC
-    'YOU': '0001856314',  # Clear Secure, Inc.
-    'DOOO': '0001748797',  # BRP Inc.
-    'VRNA': '0001657312',  # Verona Pharma plc
-    'CNO': '0001224608',  # CNO Financial Group, Inc.
-    'FLG': '0000910073',  # FLAGSTAR FINANCIAL, INC.
-    'CNK': '0001385280',  # Cinemark Holdings, Inc.
-    'AMRX': '0001723128',  # Amneal Pharmaceuticals, Inc.
-    'CARG': '0001494259',  # CarGurus, Inc.
-    'SHC': '0001822479',  # Sotera Health Co
-    'ACLX': '0001786205',  # Arcellx, Inc.
-    'BANF': '0000760498',  # BANCFIRST CORP /OK/
-    'GHC': '0000104889',  # Graham Holdings Co
-    'KGS': '0001767042',  # Kodiak Gas Services, Inc.
-    'GSHD': '0001726978',  # Goosehead Insurance, Inc.
-    'AGYS': '0000078749',  # AGILYSYS INC
-    'ROHCY': '0001442653',  # ROHM Co., Ltd.
-    'PBH': '0001295947',  # Prestige Consumer Healthcare Inc.
-    'OLN': '0000074303',  # OLIN Corp
-    'XRAY': '0000818479',  # DENTSPLY SIRONA Inc.
-    'MIR': '0001809987',  # Mirion Technologies, Inc.
-    'CPA': '0001345105',  # Copa Holdings, S.A.
-    'CLVT': '0001764046',  # CLARIVATE PLC
-    'ALIT': '0001809104',  # Alight, Inc. / Delaware
-    'MDU': '0000067716',  # MDU RESOURCES GROUP INC
-    'HHH': '0001981792',  # Howard Hughes Holdings Inc.
-    'GSAT': '0001366868',  # Globalstar, Inc.
-    'OR': '0001627272',  # Osisko Gold Royalties LTD
-    'KNTK': '0001692787',  # Kinetik Holdings Inc.
-    'DXC': '0001688568',  # DXC Technology Co
-    'SKT': '0000899715',  # TANGER INC.
-    'ENS': '0001289308',  # EnerSys
-    'BTDR': '0001899123',  # Bitdeer Technologies Group
-    'IAC': '0001800227',  # IAC Inc.
-    'UCB': '0000857855',  # UNITED COMMUNITY BANKS INC
-    'WRD': '0001867729',  # WeRide Inc.
-    'FROG': '0001800667',  # JFrog Ltd
-    'HOG': '0000793952',  # HARLEY-DAVIDSON, INC.
-    'IGT': '0001619762',  # International Game Technology PLC
-    'CCOI': '0001158324',  # COGENT COMMUNICATIONS HOLDINGS, INC.
-    'CVCO': '0000278166',  # CAVCO INDUSTRIES INC.
-    'HBM': '0001322422',  # Hudbay Minerals Inc.
-    'CXT': '0000025445',  # Crane NXT, Co.
-    'LBRT': '0001694028',  # Liberty Energy Inc.
-    'APLE': '0001418121',  # Apple Hospitality REIT, Inc.
-    'PAYO': '0001845815',  # Payoneer Global Inc.
-    'RIG': '0001451505',  # Transocean Ltd.
-    'ATAT': '0001853717',  # Atour Lifestyle Holdings Ltd
-    'BL': '0001666134',  # BLACKLINE, INC.
-    'TGLS': '0001534675',  # Tecnoglass Inc.
-    'AVNT': '0001122976',  # AVIENT CORP
-    'SMPL': '0001702744',  # Simply Good Foods Co
-    'WU': '0001365135',  # Western Union CO
-    'ACVA': '0001637873',  # ACV Auctions Inc.
-    'TBBB': '0001978954',  # BBB FOODS INC
-    'OMAB': '0001378239',  # Central North Airport Group
-    'ARLP': '0001086600',  # ALLIANCE RESOURCE PARTNERS LP
-    'APLS': '0001492422',  # Apellis Pharmaceuticals, Inc.
-    'ATGE': '0000730464',  # Adtalem Global Education Inc.
-    'RNA': '0001599901',  # Avidity Biosciences, Inc.
-    'FORM': '0001039399',  # FORMFACTOR INC
-    'FULT': '0000700564',  # FULTON FINANCIAL CORP
-    'OKLO': '0001849056',  # Oklo Inc.
-    'ZI': '0001794515',  # ZoomInfo Technologies Inc.
-    'RYTM': '0001649904',  # RHYTHM PHARMACEUTICALS, INC.
-    'ALKT': '0001529274',  # ALKAMI TECHNOLOGY, INC.
-    'BTG': '0001429937',  # B2GOLD CORP
-    'JGSMY': '0001567172',  # JG Summit Holdings, Inc./ADR
-    'OSCR': '0001568651',  # Oscar Health, Inc.
-    'IMVT': '0001764013',  # Immunovant, Inc.
-    'CRSP': '0001674416',  # CRISPR Therapeutics AG
-    'POWI': '0000833640',  # POWER INTEGRATIONS INC
-    'DNP': '0000806628',  # DNP SELECT INCOME FUND INC
-    'TNL': '0001361658',  # Travel & Leisure Co.
-    'USLM': '0000082020',  # UNITED STATES LIME & MINERALS INC
-    'BRC': '0000746598',  # BRADY CORP
-    'TFSL': '0001381668',  # TFS Financial CORP
-    'MWA': '0001350593',  # Mueller Water Products, Inc.
-    'NPO': '0001164863',  # Enpro Inc.
-    'RLX': '0001828365',  # RLX Technology Inc.
-    'KFY': '0000056679',  # KORN FERRY
-    'MHO': '0000799292',  # M/I HOMES, INC.
-    'HP': '0000046765',  # Helmerich & Payne, Inc.
-    'VRN': '0001545851',  # Veren Inc.
-    'PTCT': '0001070081',  # PTC THERAPEUTICS, INC.
-    'TCBI': '0001077428',  # TEXAS CAPITAL BANCSHARES INC/TX
-    'BVN': '0001013131',  # BUENAVENTURA MINING CO INC
-    'GFF': '0000050725',  # GRIFFON CORP
-    'SSL': '0000314590',  # SASOL LTD
-    'CDP': '0000860546',  # COPT DEFENSE PROPERTIES
-    'NEA': '0001195737',  # Nuveen AMT-Free Quality Municipal Income Fund
-    'EPR': '0001045450',  # EPR PROPERTIES
-    'FUL': '0000039368',  # FULLER H B CO
-    'PRGO': '0001585364',  # PERRIGO Co plc
-    'ECG': '0002015845',  # Everus Construction Group, Inc.
-    'GPOR': '0000874499',  # GULFPORT ENERGY CORP
-    'ESE': '0000866706',  # ESCO TECHNOLOGIES INC
-    'UAA': '0001336917',  # Under Armour, Inc.
-    'EGO': '0000918608',  # ELDORADO GOLD CORP /FI
-    'FMCC': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'HL': '0000719413',  # HECLA MINING CO/DE/
-    'AESI': '0001984060',  # Atlas Energy Solutions Inc.
-    'HTGC': '0001280784',  # Hercules Capital, Inc.
-    'PTEN': '0000889900',  # PATTERSON UTI ENERGY INC
-    'EBC': '0001810546',  # Eastern Bankshares, Inc.
-    'SIG': '0000832988',  # SIGNET JEWELERS LTD
-    'IAG': '0001203464',  # IAMGOLD CORP
-    'PTON': '0001639825',  # PELOTON INTERACTIVE, INC.
-    'AQN': '0001174169',  # ALGONQUIN POWER & UTILITIES CORP.
-    'IFS': '0001615903',  # Intercorp Financial Services Inc.
-    'HASI': '0001561894',  # HA Sustainable Infrastructure Capital, Inc.
-    'DV': '0001819928',  # DoubleVerify Holdings, Inc.
-    'ASH': '0001674862',  # ASHLAND INC.
-    'ATMU': '0001921963',  # Atmus Filtration Technologies Inc.
-    'WDFC': '0000105132',  # WD 40 CO
-    'REZI': '0001740332',  # RESIDEO TECHNOLOGIES, INC.
-    'SLVYY': '0000930826',  # SOLVAY S A /ADR/
-    'CATY': '0000861842',  # CATHAY GENERAL BANCORP
-    'MP': '0001801368',  # MP Materials Corp. / DE
-    'SWTX': '0001773427',  # SpringWorks Therapeutics, Inc.
-    'VAL': '0000314808',  # Valaris Ltd
-    'VCYT': '0001384101',  # VERACYTE, INC.
-    'STR': '0001949543',  # Sitio Royalties Corp.
-    'YETI': '0001670592',  # YETI Holdings, Inc.
-    'IRDM': '0001418819',  # Iridium Communications Inc.
-    'TPH': '0001561680',  # Tri Pointe Homes, Inc.
-    'DLO': '0001846832',  # dLocal Ltd
-    'MEOH': '0000886977',  # METHANEX CORP
-    'FIBK': '0000860413',  # FIRST INTERSTATE BANCSYSTEM INC
-    'VEON': '0001468091',  # VEON Ltd.
-    'MGEE': '0001161728',  # MGE ENERGY INC
-    'DEI': '0001364250',  # Douglas Emmett Inc
-    'LIF': '0001581760',  # Life360, Inc.
-    'HGTY': '0001840776',  # Hagerty, Inc.
-    'NVST': '0001757073',  # Envista Holdings Corp
-    'LPL': '0001290109',  # LG Display Co., Ltd.
-    'TFPM': '0001829726',  # Triple Flag Precious Metals Corp.
-    'PBF': '0001534504',  # PBF Energy Inc.
-    'FHB': '0000036377',  # FIRST HAWAIIAN, INC.
-    'AMBA': '0001280263',  # AMBARELLA INC
-    'PTVE': '0001527508',  # Pactiv Evergreen Inc.
-    'RUM': '0001830081',  # Rumble Inc.
-    'SNEX': '0000913760',  # StoneX Group Inc.
-    'ATHM': '0001527636',  # Autohome Inc.
-    'BSM': '0001621434',  # Black Stone Minerals, L.P.
-    'RSI': '0001793659',  # Rush Street Interactive, Inc.
-    'DOCN': '0001582961',  # DigitalOcean Holdings, Inc.
-    'EE': '0001888447',  # Excelerate Energy, Inc.
-    'ABM': '0000771497',  # ABM INDUSTRIES INC /DE/
-    'NWE': '0001993004',  # NorthWestern Energy Group, Inc.
-    'FHI': '0001056288',  # FEDERATED HERMES, INC.
-    'IPGP': '0001111928',  # IPG PHOTONICS CORP
-    'AEO': '0000919012',  # AMERICAN EAGLE OUTFITTERS INC
-    'AUB': '0000883948',  # Atlantic Union Bankshares Corp
-    'GMS': '0001600438',  # GMS Inc.
-    'HAYW': '0001834622',  # Hayward Holdings, Inc.
-    'SLVM': '0001856485',  # Sylvamo Corp
-    'CBU': '0000723188',  # COMMUNITY FINANCIAL SYSTEM, INC.
-    'SYNA': '0000817720',  # SYNAPTICS Inc
-    'HIW': '0000921082',  # HIGHWOODS PROPERTIES, INC.
-    'PRKS': '0001564902',  # United Parks & Resorts Inc.
-    'CAAP': '0001717393',  # CORPORACION AMERICA AIRPORTS S.A.
-    'WEN': '0000030697',  # Wendy's Co
-    'IRTC': '0001388658',  # iRhythm Technologies, Inc.
-    'AVPT': '0001777921',  # AvePoint, Inc.
-    'MRUS': '0001651311',  # Merus N.V.
-    'QDEL': '0001906324',  # QuidelOrtho Corp
-    'PCH': '0001338749',  # POTLATCHDELTIC CORP
-    'AMED': '0000896262',  # AMEDISYS INC
-    'PII': '0000931015',  # Polaris Inc.
-    'OTTR': '0001466593',  # Otter Tail Corp
-    'WRBY': '0001504776',  # Warby Parker Inc.
-    'BTSG': '0001865782',  # BrightSpring Health Services, Inc.
-    'FA': '0001210677',  # FIRST ADVANTAGE CORP
-    'BNL': '0001424182',  # Broadstone Net Lease, Inc.
-    'CEIX': '0001710366',  # CONSOL Energy Inc.
-    'NHI': '0000877860',  # NATIONAL HEALTH INVESTORS INC
-    'HAFN': '0001815779',  # Hafnia Ltd
-    'FBP': '0001057706',  # FIRST BANCORP /PR/
-    'GRP-UN': '0001564538',  # GRANITE REAL ESTATE INVESTMENT TRUST
-    'NVCR': '0001645113',  # NovoCure Ltd
-    'GRND': '0001820144',  # Grindr Inc.
-    'BHC': '0000885590',  # Bausch Health Companies Inc.
-    'UEC': '0001334933',  # URANIUM ENERGY CORP
-    'WSFS': '0000828944',  # WSFS FINANCIAL CORP
-    'VSCO': '0001856437',  # Victoria's Secret & Co.
-    'CNXC': '0001803599',  # Concentrix Corp
-    'CAR': '0000723612',  # AVIS BUDGET GROUP, INC.
-    'SHOO': '0000913241',  # STEVEN MADDEN, LTD.
-    'RNG': '0001384905',  # RingCentral, Inc.
-    'BXMT': '0001061630',  # BLACKSTONE MORTGAGE TRUST, INC.
-    'WD': '0001497770',  # Walker & Dunlop, Inc.
-    'LFST': '0001845257',  # LifeStance Health Group, Inc.
-    'TEX': '0000097216',  # TEREX CORP
-    'SAM': '0000949870',  # BOSTON BEER CO INC
-    'ALRM': '0001459200',  # Alarm.com Holdings, Inc.
-    'MLTX': '0001821586',  # MoonLake Immunotherapeutics
-    'FLNC': '0001868941',  # Fluence Energy, Inc.
-    'HBI': '0001359841',  # Hanesbrands Inc.
-    'XENE': '0001582313',  # Xenon Pharmaceuticals Inc.
-    'OUT': '0001579877',  # OUTFRONT Media Inc.
-    'TDC': '0000816761',  # TERADATA CORP /DE/
-    'VAC': '0001524358',  # MARRIOTT VACATIONS WORLDWIDE Corp
-    'DIOD': '0000029002',  # DIODES INC /DEL/
-    'PENN': '0000921738',  # PENN Entertainment, Inc.
-    'TDW': '0000098222',  # TIDEWATER INC
-    'VCEL': '0000887359',  # Vericel Corp
-    'EQX': '0001756607',  # Equinox Gold Corp.
-    'TGNA': '0000039899',  # TEGNA INC
-    'ACAD': '0001070494',  # ACADIA PHARMACEUTICALS INC
-    'NMRK': '0001690680',  # NEWMARK GROUP, INC.
-    'QS': '0001811414',  # QuantumScape Corp
-    'AKR': '0000899629',  # ACADIA REALTY TRUST
-    'TRN': '0000099780',  # TRINITY INDUSTRIES INC
-    'SHZNY': '0001454480',  # Shenzhen Expressway Co. / ADR
-    'APAM': '0001517302',  # Artisan Partners Asset Management Inc.
-    'BFH': '0001101215',  # BREAD FINANCIAL HOLDINGS, INC.
-    'ATKR': '0001666138',  # Atkore Inc.
-    'SXT': '0000310142',  # SENSIENT TECHNOLOGIES CORP
-    'CLSK': '0000827876',  # CLEANSPARK, INC.
-    'GEF': '0000043920',  # GREIF, INC
-    'PK': '0001617406',  # Park Hotels & Resorts Inc.
-    'FIVN': '0001288847',  # Five9, Inc.
-    'CSQ': '0001275214',  # CALAMOS STRATEGIC TOTAL RETURN FUND
-    'HUN': '0001307954',  # Huntsman CORP
-    'UTG': '0001263994',  # REAVES UTILITY INCOME FUND
-    'SGHC': '0001878057',  # Super Group (SGHC) Ltd
-    'NSP': '0001000753',  # INSPERITY, INC.
-    'ZLAB': '0001704292',  # Zai Lab Ltd
-    'UGP': '0001094972',  # ULTRAPAR HOLDINGS INC
-    'PATK': '0000076605',  # PATRICK INDUSTRIES INC
-    'GNW': '0001276520',  # GENWORTH FINANCIAL INC
-    'POWL': '0000080420',  # POWELL INDUSTRIES INC
-    'CPRI': '0001530721',  # Capri Holdings Ltd
-    'USAC': '0001522727',  # USA Compression Partners, LP
-    'AVA': '0000104918',  # AVISTA CORP
-    'AAP': '0001158449',  # ADVANCE AUTO PARTS INC
-    'STNG': '0001483934',  # Scorpio Tankers Inc.
-    'PSMT': '0001041803',  # PRICESMART INC
-    'NMIH': '0001547903',  # NMI Holdings, Inc.
-    'JJSF': '0000785956',  # J&J SNACK FOODS CORP
-    'BUR': '0001714174',  # Burford Capital Ltd
-    'ESRT': '0001541401',  # Empire State Realty Trust, Inc.
-    'BKU': '0001504008',  # BankUnited, Inc.
-    'CVBF': '0000354647',  # CVB FINANCIAL CORP
-    'MANU': '0001549107',  # Manchester United plc
-    'COMP': '0001563190',  # Compass, Inc.
-    'MGRC': '0000752714',  # MCGRATH RENTCORP
-    'PDCO': '0000891024',  # PATTERSON COMPANIES, INC.
-    'NAD': '0001083839',  # Nuveen Quality Municipal Income Fund
-    'LAUR': '0000912766',  # LAUREATE EDUCATION, INC.
-    'BHF': '0001685040',  # Brighthouse Financial, Inc.
-    'DNLI': '0001714899',  # Denali Therapeutics Inc.
-    'RXRX': '0001601830',  # RECURSION PHARMACEUTICALS, INC.
-    'JANX': '0001817713',  # Janux Therapeutics, Inc.
-    'CWK': '0001628369',  # Cushman & Wakefield plc
-    'OII': '0000073756',  # OCEANEERING INTERNATIONAL INC
-    'PLMR': '0001761312',  # Palomar Holdings, Inc.
-    'AWR': '0001056903',  # AMERICAN STATES WATER CO
-    'NAMS': '0001936258',  # NewAmsterdam Pharma Co N.V.
-    'UE': '0001611547',  # Urban Edge Properties
-    'JBLU': '0001158463',  # JETBLUE AIRWAYS CORP
-    'PRGS': '0000876167',  # PROGRESS SOFTWARE CORP /MA
-    'FOLD': '0001178879',  # AMICUS THERAPEUTICS, INC.
-    'BOH': '0000046195',  # BANK OF HAWAII CORP
-    'KC': '0001795589',  # Kingsoft Cloud Holdings Ltd
-    'HCC': '0001691303',  # WARRIOR MET COAL, INC.
-    'BTSGY': '0001546538',  # BTS Group Holdings Public Co Limited/ADR
-    'AKO-A': '0000925261',  # ANDINA BOTTLING CO INC
-    'CC': '0001627223',  # Chemours Co
-    'PRK': '0000805676',  # PARK NATIONAL CORP /OH/
-    'PLUG': '0001093691',  # PLUG POWER INC
-    'MCY': '0000064996',  # MERCURY GENERAL CORP
-    'HUBG': '0000940942',  # Hub Group, Inc.
-    'HCM': '0001648257',  # HUTCHMED (China) Ltd
-    'CPK': '0000019745',  # CHESAPEAKE UTILITIES CORP
-    'IOSP': '0001054905',  # INNOSPEC INC.
-    'ATS': '0001394832',  # ATS Corp /ATS
-    'SFNC': '0000090498',  # SIMMONS FIRST NATIONAL CORP
-    'NEOG': '0000711377',  # NEOGEN CORP
-    'NVG': '0001090116',  # Nuveen AMT-Free Municipal Credit Income Fund
-    'SGRY': '0001638833',  # Surgery Partners, Inc.
-    'RGTI': '0001838359',  # Rigetti Computing, Inc.
-    'CPRX': '0001369568',  # CATALYST PHARMACEUTICALS, INC.
-    'TWST': '0001581280',  # Twist Bioscience Corp
-    'HTLF': '0000920112',  # HEARTLAND FINANCIAL USA INC
-    'SBSW': '0001786909',  # Sibanye Stillwater Ltd
-    'MAN': '0000871763',  # ManpowerGroup Inc.
-    'BKE': '0000885245',  # BUCKLE INC
-    'OSIS': '0001039065',  # OSI SYSTEMS INC
-    'INDB': '0000776901',  # INDEPENDENT BANK CORP
-    'JOE': '0000745308',  # ST JOE Co
-    'PAR': '0000708821',  # PAR TECHNOLOGY CORP
-    'ESBA': '0001553079',  # Empire State Realty OP, L.P.
-    'JPC': '0001216583',  # Nuveen Preferred & Income Opportunities Fund
-    'LIVN': '0001639691',  # LivaNova PLC
-    'FCPT': '0001650132',  # Four Corners Property Trust, Inc.
-    'YELP': '0001345016',  # YELP INC
-    'CON': '0002014596',  # Concentra Group Holdings Parent, Inc.
-    'BANC': '0001169770',  # BANC OF CALIFORNIA, INC.
-    'DRVN': '0001804745',  # Driven Brands Holdings Inc.
-    'PLTK': '0001828016',  # Playtika Holding Corp.
-    'ENOV': '0001420800',  # Enovis CORP
-    'TTMI': '0001116942',  # TTM TECHNOLOGIES INC
-    'LCII': '0000763744',  # LCI INDUSTRIES
-    'GT': '0000042582',  # GOODYEAR TIRE & RUBBER CO /OH/
-    'EXG': '0001379438',  # Eaton Vance Tax-Managed Global Diversified Equity Income Fund
-    'NOMD': '0001651717',  # Nomad Foods Ltd
-    'CDE': '0000215466',  # Coeur Mining, Inc.
-    'CWT': '0001035201',  # CALIFORNIA WATER SERVICE GROUP
-    'ENR': '0001632790',  # ENERGIZER HOLDINGS, INC.
-    'WGS': '0001818331',  # GeneDx Holdings Corp.
-    'KLIC': '0000056978',  # KULICKE & SOFFA INDUSTRIES INC
-    'ENVA': '0001529864',  # Enova International, Inc.
-    'AZZ': '0000008947',  # AZZ INC
-    'MRCY': '0001049521',  # MERCURY SYSTEMS INC
-    'CAKE': '0000887596',  # CHEESECAKE FACTORY INC
-    'WAFD': '0000936528',  # WAFD INC
-    'APPN': '0001441683',  # APPIAN CORP
-    'DBC': '0001328237',  # Invesco DB Commodity Index Tracking Fund
-    'ABR': '0001253986',  # ARBOR REALTY TRUST INC
-    'KYMR': '0001815442',  # Kymera Therapeutics, Inc.
-    'PSNY': '0001884082',  # Polestar Automotive Holding UK PLC
-    'RPD': '0001560327',  # Rapid7, Inc.
-    'CSAN': '0001430162',  # Cosan S.A.
-    'ODD': '0001907085',  # Oddity Tech Ltd
-    'RNW': '0001848763',  # ReNew Energy Global plc
-    'ARCH': '0001037676',  # ARCH RESOURCES, INC.
-    'AIN': '0000819793',  # ALBANY INTERNATIONAL CORP /DE/
-    'CXW': '0001070985',  # CoreCivic, Inc.
-    'CURB': '0002027317',  # Curbline Properties Corp.
-    'FFBC': '0000708955',  # FIRST FINANCIAL BANCORP /OH/
-    'GRBK': '0001373670',  # Green Brick Partners, Inc.
-    'AVAL': '0001504764',  # Grupo Aval Acciones Y Valores S.A.
-    'BWIN': '0001781755',  # Baldwin Insurance Group, Inc.
-    'CALX': '0001406666',  # CALIX, INC
-    'B': '0000009984',  # BARNES GROUP INC
-    'BB': '0001070235',  # BLACKBERRY Ltd
-    'TBBK': '0001295401',  # Bancorp, Inc.
-    'PRVA': '0001759655',  # Privia Health Group, Inc.
-    'AYR': '0001362988',  # Aircastle LTD
-    'AIR': '0000001750',  # AAR CORP
-    'VERA': '0001831828',  # Vera Therapeutics, Inc.
-    'LOT': '0001962746',  # Lotus Technology Inc.
-    'SMR': '0001822966',  # NUSCALE POWER Corp
-    'AZTA': '0000933974',  # Azenta, Inc.
-    'MRRTY': '0001496919',  # MARFRIG GLOBAL FOODS S.A.
-    'GCMG': '0001819796',  # GCM Grosvenor Inc.
-    'SEB': '0000088121',  # SEABOARD CORP /DE/
-    'SDRL': '0001737706',  # Seadrill Ltd
-    'SEM': '0001320414',  # SELECT MEDICAL HOLDINGS CORP
-    'IREN': '0001878848',  # IREN Ltd
-    'SHO': '0001295810',  # Sunstone Hotel Investors, Inc.
-    'TNDM': '0001438133',  # TANDEM DIABETES CARE INC
-    'SWI': '0001739942',  # SolarWinds Corp
-    'SPB': '0000109177',  # Spectrum Brands Holdings, Inc.
-    'NZF': '0001137887',  # Nuveen Municipal Credit Income Fund
-    'PTY': '0001190935',  # PIMCO CORPORATE & INCOME OPPORTUNITY FUND
-    'STNE': '0001745431',  # StoneCo Ltd.
-    'SPNT': '0001576018',  # SiriusPoint Ltd
-    'PFS': '0001178970',  # PROVIDENT FINANCIAL SERVICES INC
-    'ETY': '0001340736',  # Eaton Vance Tax-Managed Diversified Equity Income Fund
-    'APGE': '0001974640',  # Apogee Therapeutics, Inc.
-    'AMR': '0001704715',  # Alpha Metallurgical Resources, Inc.
-    'NATL': '0001974138',  # NCR Atleos Corp
-    'MYRG': '0000700923',  # MYR GROUP INC.
-    'LMND': '0001691421',  # Lemonade, Inc.
-    'HWKN': '0000046250',  # HAWKINS INC
-    'MLCO': '0001381640',  # Melco Resorts & Entertainment LTD
-    'UTF': '0001275617',  # COHEN & STEERS INFRASTRUCTURE FUND INC
-    'ALHC': '0001832466',  # Alignment Healthcare, Inc.
-    'EWTX': '0001710072',  # Edgewise Therapeutics, Inc.
-    'MPW': '0001287865',  # MEDICAL PROPERTIES TRUST INC
-    'ZIM': '0001654126',  # ZIM Integrated Shipping Services Ltd.
-    'BATRA': '0001958140',  # Atlanta Braves Holdings, Inc.
-    'MTX': '0000891014',  # MINERALS TECHNOLOGIES INC
-    'ARWR': '0000879407',  # ARROWHEAD PHARMACEUTICALS, INC.
-    'CGON': '0001991792',  # CG Oncology, Inc.
-    'LXP': '0000910108',  # LXP Industrial Trust
-    'VC': '0001111335',  # VISTEON CORP
-    'ADUS': '0001468328',  # Addus HomeCare Corp
-    'ICFI': '0001362004',  # ICF International, Inc.
-    'FBK': '0001649749',  # FB Financial Corp
-    'ACLS': '0001113232',  # AXCELIS TECHNOLOGIES INC
-    'CEPU': '0001717161',  # CENTRAL PUERTO S.A.
-    'ARDT': '0001756655',  # Ardent Health Partners, Inc.
-    'TMDX': '0001756262',  # TransMedics Group, Inc.
-    'ADX': '0000002230',  # ADAMS DIVERSIFIED EQUITY FUND, INC.
-    'WLY': '0000107140',  # JOHN WILEY & SONS, INC.
-    'MCW': '0001853513',  # Mister Car Wash, Inc.
-    'EXTR': '0001078271',  # EXTREME NETWORKS INC
-    'STRA': '0001013934',  # Strategic Education, Inc.
-    'LSPD': '0001823306',  # Lightspeed Commerce Inc.
-    'ROIC': '0001407623',  # RETAIL OPPORTUNITY INVESTMENTS CORP
-    'KWR': '0000081362',  # QUAKER CHEMICAL CORP
-    'RUN': '0001469367',  # Sunrun Inc.
-    'EPAC': '0000006955',  # ENERPAC TOOL GROUP CORP
-    'HNI': '0000048287',  # HNI CORP
-    'HURN': '0001289848',  # Huron Consulting Group Inc.
-    'BANR': '0000946673',  # BANNER CORP
-    'VSH': '0000103730',  # VISHAY INTERTECHNOLOGY INC
-    'FRME': '0000712534',  # FIRST MERCHANTS CORP
-    'IVT': '0001307748',  # InvenTrust Properties Corp.
-    'MRX': '0001997464',  # Marex Group plc
-    'ZD': '0001084048',  # ZIFF DAVIS, INC.
-    'CCU': '0000888746',  # UNITED BREWERIES CO INC
-    'FLYW': '0001580560',  # Flywire Corp
-    'MGNI': '0001595974',  # MAGNITE, INC.
-    'ENVX': '0001828318',  # Enovix Corp
-    'VIAV': '0000912093',  # VIAVI SOLUTIONS INC.
-    'PPBI': '0001028918',  # PACIFIC PREMIER BANCORP INC
-    'BEAM': '0001745999',  # Beam Therapeutics Inc.
-    'BTU': '0001064728',  # PEABODY ENERGY CORP
-    'GOF': '0001380936',  # GUGGENHEIM STRATEGIC OPPORTUNITIES FUND
-    'NGD': '0000800166',  # New Gold Inc. /FI
-    'HUT': '0001964789',  # Hut 8 Corp.
-    'PTGX': '0001377121',  # Protagonist Therapeutics, Inc
-    'KYN': '0001293613',  # Kayne Anderson Energy Infrastructure Fund, Inc.
-    'SBCF': '0000730708',  # SEACOAST BANKING CORP OF FLORIDA
-    'CCS': '0001576940',  # Century Communities, Inc.
-    'ARCB': '0000894405',  # ARCBEST CORP /DE/
-    'SAH': '0001043509',  # SONIC AUTOMOTIVE INC
-    'VICR': '0000751978',  # VICOR CORP
-    'DKL': '0001552797',  # Delek Logistics Partners, LP
-    'LION': '0002006191',  # Lionsgate Studios Corp.
-    'TRMD': '0001655891',  # TORM plc
-    'NHNKY': '0001543726',  # Nihon Kohden Corporation/ADR
-    'BTE': '0001279495',  # BAYTEX ENERGY CORP.
-    'CMBT': '0001604481',  # CMB.TECH NV
-    'WB': '0001595761',  # WEIBO Corp
-    'HI': '0001417398',  # Hillenbrand, Inc.
-    'CNMD': '0000816956',  # CONMED Corp
-    'RNST': '0000715072',  # RENASANT CORP
-    'AGX': '0000100591',  # ARGAN INC
-    'SXI': '0000310354',  # STANDEX INTERNATIONAL CORP/DE/
-    'GDV': '0001260729',  # GABELLI DIVIDEND & INCOME TRUST
-    'KLC': '0001873529',  # KinderCare Learning Companies, Inc.
-    'WERN': '0000793074',  # WERNER ENTERPRISES INC
-    'NBTB': '0000790359',  # NBT BANCORP INC
-    'KAR': '0001395942',  # OPENLANE, Inc.
-    'CXM': '0001569345',  # Sprinklr, Inc.
-    'LMAT': '0001158895',  # LEMAITRE VASCULAR INC
-    'CLM': '0000814083',  # CORNERSTONE STRATEGIC VALUE FUND INC
-    'VSTS': '0001967649',  # Vestis Corp
-    'LU': '0001816007',  # Lufax Holding Ltd
-    'UPWK': '0001627475',  # UPWORK, INC
-    'YY': '0001530238',  # JOYY Inc.
-    'IDYA': '0001676725',  # IDEAYA Biosciences, Inc.
-    'ALG': '0000897077',  # ALAMO GROUP INC
-    'RVLV': '0001746618',  # Revolve Group, Inc.
-    'BKV': '0001838406',  # BKV Corp
-    'CNTA': '0001847903',  # Centessa Pharmaceuticals plc
-    'SOC': '0001831481',  # Sable Offshore Corp.
-    'PLUS': '0001022408',  # EPLUS INC
-    'VTMX': '0001969373',  # Vesta Real Estate Corporation, S.A.B. de C.V.
-    'WULF': '0001083301',  # TERAWULF INC.
-    'SUPN': '0001356576',  # SUPERNUS PHARMACEUTICALS, INC.
-    'CRTO': '0001576427',  # Criteo S.A.
-    'DFH': '0001825088',  # Dream Finders Homes, Inc.
-    'NEXT': '0001612720',  # NextDecade Corp.
-    'TRMK': '0000036146',  # TRUSTMARK CORP
-    'TARS': '0001819790',  # Tarsus Pharmaceuticals, Inc.
-    'EVTC': '0001559865',  # EVERTEC, Inc.
-    'CENT': '0000887733',  # CENTRAL GARDEN & PET CO
-    'WSBC': '0000203596',  # WESBANCO INC
-    'DBRG': '0001679688',  # DigitalBridge Group, Inc.
-    'EFSC': '0001025835',  # ENTERPRISE FINANCIAL SERVICES CORP
-    'MESO': '0001345099',  # MESOBLAST LTD
-    'LGND': '0000886163',  # LIGAND PHARMACEUTICALS INC
-    'PINC': '0001577916',  # Premier, Inc.
-    'CABO': '0001632127',  # Cable One, Inc.
-    'INSW': '0001679049',  # International Seaways, Inc.
-    'PWP': '0001777835',  # Perella Weinberg Partners
-    'PHIN': '0001968915',  # PHINIA INC.
-    'MIRM': '0001759425',  # Mirum Pharmaceuticals, Inc.
-    'ENLT': '0001922641',  # Enlight Renewable Energy Ltd.
-    'WOR': '0000108516',  # WORTHINGTON ENTERPRISES, INC.
-    'AVDX': '0001858257',  # AvidXchange Holdings, Inc.
-    'AFLYY': '0001110452',  # AIR FRANCE-KLM /FI
-    'PACS': '0002001184',  # PACS Group, Inc.
-    'PAGS': '0001712807',  # PagSeguro Digital Ltd.
-    'USA': '0000799195',  # LIBERTY ALL STAR EQUITY FUND
-    'GBX': '0000923120',  # GREENBRIER COMPANIES INC
-    'SYBT': '0000835324',  # Stock Yards Bancorp, Inc.
-    'LGIH': '0001580670',  # LGI Homes, Inc.
-    'FL': '0000850209',  # FOOT LOCKER, INC.
-    'OMCL': '0000926326',  # OMNICELL, INC.
-    'ZGN': '0001877787',  # Ermenegildo Zegna N.V.
-    'AGIO': '0001439222',  # AGIOS PHARMACEUTICALS, INC.
-    'OSW': '0001758488',  # ONESPAWORLD HOLDINGS Ltd
-    'TSLX': '0001508655',  # Sixth Street Specialty Lending, Inc.
-    'TRIP': '0001526520',  # TripAdvisor, Inc.
-    'MTRN': '0001104657',  # MATERION Corp
-    'TFIN': '0001539638',  # Triumph Financial, Inc.
-    'CHEF': '0001517175',  # Chefs' Warehouse, Inc.
-    'NXRT': '0001620393',  # NexPoint Residential Trust, Inc.
-    'EDN': '0001395213',  # EDENOR
-    'SUPV': '0001517399',  # Grupo Supervielle S.A.
-    'GERN': '0000886744',  # GERON CORP
-    'GOGL': '0001029145',  # Golden Ocean Group Ltd
-    'HSAI': '0001861737',  # Hesai Group
-    'ORLA': '0001680056',  # Orla Mining Ltd.
-    'COCO': '0001482981',  # Vita Coco Company, Inc.
-    'HG': '0001593275',  # Hamilton Insurance Group, Ltd.
-    'RAMP': '0000733269',  # LiveRamp Holdings, Inc.
-    'IOVA': '0001425205',  # IOVANCE BIOTHERAPEUTICS, INC.
-    'HRMY': '0001802665',  # Harmony Biosciences Holdings, Inc.
-    'MBC': '0001941365',  # MasterBrand, Inc.
-    'AGM': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'NDOI': '0002008861',  # Endo, Inc.
-    'GTX': '0001735707',  # Garrett Motion Inc.
-    'CDLR': '0001978867',  # Cadeler A/S
-    'CVI': '0001376139',  # CVR ENERGY INC
-    'TALO': '0001724965',  # TALOS ENERGY INC.
-    'NEO': '0001077183',  # NEOGENOMICS INC
-    'VYX': '0000070866',  # NCR Voyix Corp
-    'TXG': '0001770787',  # 10x Genomics, Inc.
-    'VSEC': '0000102752',  # VSE CORP
-    'CLMT': '0002013745',  # Calumet, Inc. /DE
-    'WNS': '0001356570',  # WNS (HOLDINGS) LTD
-    'INTR': '0001864163',  # Inter & Co, Inc.
-    'GENI': '0001834489',  # Genius Sports Ltd
-    'EVCM': '0001853145',  # EverCommerce Inc.
-    'OXLC': '0001495222',  # Oxford Lane Capital Corp.
-    'CRI': '0001060822',  # CARTERS INC
-    'SLNO': '0001484565',  # SOLENO THERAPEUTICS INC
-    'TRUP': '0001371285',  # TRUPANION, INC.
-    'FTF': '0001233087',  # FRANKLIN LTD DURATION INCOME TRUST
-    'KMT': '0000055242',  # KENNAMETAL INC
-    'DAVA': '0001656081',  # Endava plc
-    'UFPT': '0000914156',  # UFP TECHNOLOGIES INC
-    'BWLP': '0001649313',  # BW LPG Ltd
-    'ALGT': '0001362468',  # Allegiant Travel CO
-    'PRM': '0001880319',  # Perimeter Solutions, Inc.
-    'ULCC': '0001670076',  # Frontier Group Holdings, Inc.
-    'WWW': '0000110471',  # WOLVERINE WORLD WIDE INC /DE/
-    'MQ': '0001522540',  # Marqeta, Inc.
-    'OFG': '0001030469',  # OFG BANCORP
-    'IBTA': '0001538379',  # Ibotta, Inc.
-    'PSEC': '0001287032',  # PROSPECT CAPITAL CORP
-    'PEGRY': '0001455633',  # Pennon Group Plc / ADR
-    'LGF-A': '0000929351',  # LIONS GATE ENTERTAINMENT CORP /CN/
-    'HPK': '0001792849',  # HighPeak Energy, Inc.
-    'HLMN': '0001822492',  # Hillman Solutions Corp.
-    'DRH': '0001298946',  # DiamondRock Hospitality Co
-    'AAT': '0001500217',  # American Assets Trust, Inc.
-    'CNXN': '0001050377',  # PC CONNECTION INC
-    'CLOV': '0001801170',  # CLOVER HEALTH INVESTMENTS, CORP. /DE
-    'FIHL': '0001636639',  # Fidelis Insurance Holdings Ltd
-    'IQ': '0001722608',  # iQIYI, Inc.
-    'MSDL': '0001782524',  # Morgan Stanley Direct Lending Fund
-    'RVT': '0000804116',  # ROYCE SMALL-CAP TRUST, INC.
-    'SBLK': '0001386716',  # Star Bulk Carriers Corp.
-    'SIMO': '0001329394',  # Silicon Motion Technology CORP
-    'LZB': '0000057131',  # LA-Z-BOY INC
-    'AG': '0001308648',  # FIRST MAJESTIC SILVER CORP
-    'EVT': '0001253327',  # Eaton Vance Tax-Advantaged Dividend Income Fund
-    'IIPR': '0001677576',  # INNOVATIVE INDUSTRIAL PROPERTIES INC
-    'NUV': '0000812801',  # NUVEEN MUNICIPAL VALUE FUND INC
-    'ROG': '0000084748',  # ROGERS CORP
-    'AILIH': '0000018654',  # Ameren Illinois Co
-    'CENX': '0000949157',  # CENTURY ALUMINUM CO
-    'JAMF': '0001721947',  # Jamf Holding Corp.
-    'WMK': '0000105418',  # WEIS MARKETS INC
-    'IBRX': '0001326110',  # ImmunityBio, Inc.
-    'SID': '0001049659',  # NATIONAL STEEL CO
-    'SONO': '0001314727',  # Sonos Inc
-    'IRON': '0001816736',  # Disc Medicine, Inc.
-    'MNR': '0001980088',  # MACH NATURAL RESOURCES LP
-    'JAG': '0002009460',  # Job Aire Group Inc.
-    'SPT': '0001517375',  # Sprout Social, Inc.
-    'HTH': '0001265131',  # Hilltop Holdings Inc.
-    'OBDE': '0001807427',  # Blue Owl Capital Corp III
-    'APLD': '0001144879',  # Applied Digital Corp.
-    'MBUMY': '0001534281',  # Mabuchi Motor Co., Ltd./ADR
-    'DNN': '0001063259',  # DENISON MINES CORP.
-    'CASH': '0000907471',  # PATHWARD FINANCIAL, INC.
-    'FINV': '0001691445',  # FinVolution Group
-    'KOS': '0001509991',  # Kosmos Energy Ltd.
-    'VITL': '0001579733',  # Vital Farms, Inc.
-    'DHT': '0001331284',  # DHT Holdings, Inc.
-    'CIFR': '0001819989',  # Cipher Mining Inc.
-    'BLTE': '0001889109',  # BELITE BIO, INC
-    'BBUC': '0001871130',  # Brookfield Business Corp
-    'MXL': '0001288469',  # MAXLINEAR, INC
-    'GDRX': '0001809519',  # GoodRx Holdings, Inc.
-    'GTBIF': '0001795139',  # Green Thumb Industries Inc.
-    'AMPH': '0001297184',  # Amphastar Pharmaceuticals, Inc.
-    'FUBO': '0001484769',  # fuboTV Inc. /FL
-    'LOMA': '0001711375',  # Loma Negra Compania Industrial Argentina Sociedad Anonima
-    'CTRI': '0001981599',  # Centuri Holdings, Inc.
-    'CERT': '0001827090',  # Certara, Inc.
-    'CMPR': '0001262976',  # CIMPRESS plc
-    'PAX': '0001825570',  # Patria Investments Ltd
-    'AKRO': '0001744659',  # Akero Therapeutics, Inc.
-    'TDOC': '0001477449',  # Teladoc Health, Inc.
-    'PROK': '0001850270',  # PROKIDNEY CORP.
-    'KN': '0001587523',  # Knowles Corp
-    'GLPG': '0001421876',  # GALAPAGOS NV
-    'THS': '0001320695',  # TreeHouse Foods, Inc.
-    'NABL': '0001834488',  # N-able, Inc.
-    'ROCK': '0000912562',  # GIBRALTAR INDUSTRIES, INC.
-    'GDYN': '0001743725',  # GRID DYNAMICS HOLDINGS, INC.
-    'IART': '0000917520',  # INTEGRA LIFESCIENCES HOLDINGS CORP
-    'WVE': '0001631574',  # Wave Life Sciences Ltd.
-    'PRDO': '0001046568',  # PERDOCEO EDUCATION Corp
-    'LC': '0001409970',  # LendingClub Corp
-    'SEMR': '0001831840',  # SEMrush Holdings, Inc.
-    'SKWD': '0001519449',  # Skyward Specialty Insurance Group, Inc.
-    'REVG': '0001687221',  # REV Group, Inc.
-    'VIR': '0001706431',  # Vir Biotechnology, Inc.
-    'VRE': '0000924901',  # Veris Residential, Inc.
-    'FBNC': '0000811589',  # FIRST BANCORP /NC/
-    'NEP': '0001603145',  # NEXTERA ENERGY PARTNERS, LP
-    'MNKD': '0000899460',  # MANNKIND CORP
-    'ECAT': '0001864843',  # BlackRock ESG Capital Allocation Term Trust
-    'UCTT': '0001275014',  # Ultra Clean Holdings, Inc.
-    'SAND': '0001434614',  # SANDSTORM GOLD LTD
-    'LKFN': '0000721994',  # LAKELAND FINANCIAL CORP
-    'CHCO': '0000726854',  # CITY HOLDING CO
-    'XMTR': '0001657573',  # Xometry, Inc.
-    'EXPI': '0001495932',  # EXP World Holdings, Inc.
-    'DFIN': '0001669811',  # Donnelley Financial Solutions, Inc.
-    'WBTN': '0001997859',  # WEBTOON Entertainment Inc.
-    'PRG': '0001808834',  # PROG Holdings, Inc.
-    'DAN': '0000026780',  # DANA INC
-    'BCAT': '0001809541',  # BlackRock Capital Allocation Term Trust
-    'GNL': '0001526113',  # Global Net Lease, Inc.
-    'PCT': '0001830033',  # PureCycle Technologies, Inc.
-    'STC': '0000094344',  # STEWART INFORMATION SERVICES CORP
-    'MSGE': '0001952073',  # Madison Square Garden Entertainment Corp.
-    'LOB': '0001462120',  # Live Oak Bancshares, Inc.
-    'ETV': '0001322436',  # Eaton Vance Tax-Managed Buy-Write Opportunities Fund
-    'BBU': '0001654795',  # Brookfield Business Partners L.P.
-    'DVAX': '0001029142',  # DYNAVAX TECHNOLOGIES CORP
-    'UNFI': '0001020859',  # UNITED NATURAL FOODS INC
-    'KEN': '0001611005',  # Kenon Holdings Ltd.
-    'LUNR': '0001844452',  # Intuitive Machines, Inc.
-    'GAB': '0000794685',  # GABELLI EQUITY TRUST INC
-    'SVV': '0001883313',  # Savers Value Village, Inc.
-    'AMBP': '0001845097',  # Ardagh Metal Packaging S.A.
-    'CLDX': '0000744218',  # Celldex Therapeutics, Inc.
-    'WTTR': '0001693256',  # Select Water Solutions, Inc.
-    'NAC': '0001074952',  # Nuveen California Quality Municipal Income Fund
-    'BHE': '0000863436',  # BENCHMARK ELECTRONICS INC
-    'TY': '0000099614',  # TRI-CONTINENTAL Corp
-    'ARQT': '0001787306',  # Arcutis Biotherapeutics, Inc.
-    'FTRE': '0001965040',  # Fortrea Holdings Inc.
-    'RQI': '0001157842',  # COHEN & STEERS QUALITY INCOME REALTY FUND INC
-    'GO': '0001771515',  # Grocery Outlet Holding Corp.
-    'HEES': '0001339605',  # H&E Equipment Services, Inc.
-    'BIGZ': '0001836057',  # BlackRock Innovation & Growth Term Trust
-    'BCRX': '0000882796',  # BIOCRYST PHARMACEUTICALS INC
-    'FCF': '0000712537',  # FIRST COMMONWEALTH FINANCIAL CORP /PA/
-    'XPRO': '0001575828',  # EXPRO GROUP HOLDINGS N.V.
-    'QBTS': '0001907982',  # D-Wave Quantum Inc.
-    'DESP': '0001703141',  # Despegar.com, Corp.
-    'DMLP': '0001172358',  # DORCHESTER MINERALS, L.P.
-    'GTY': '0001052752',  # GETTY REALTY CORP /MD/
-    'IAS': '0001842718',  # INTEGRAL AD SCIENCE HOLDING CORP.
-    'BMEZ': '0001785971',  # BlackRock Health Sciences Term Trust
-    'UPBD': '0000933036',  # UPBOUND GROUP, INC.
-    'PGNY': '0001551306',  # Progyny, Inc.
-    'NWBI': '0001471265',  # Northwest Bancshares, Inc.
-    'PD': '0001568100',  # PagerDuty, Inc.
-    'VET': '0001293135',  # VERMILION ENERGY INC.
-    'PDO': '0001798618',  # PIMCO Dynamic Income Opportunities Fund
-    'MBIN': '0001629019',  # Merchants Bancorp
-    'CODI': '0001345126',  # Compass Diversified Holdings
-    'VRNT': '0001166388',  # VERINT SYSTEMS INC
-    'OI': '0000812074',  # O-I Glass, Inc. /DE/
-    'XHR': '0001616000',  # Xenia Hotels & Resorts, Inc.
-    'DSGR': '0000703604',  # Distribution Solutions Group, Inc.
-    'PEB': '0001474098',  # Pebblebrook Hotel Trust
-    'DYN': '0001818794',  # Dyne Therapeutics, Inc.
-    'ARCO': '0001508478',  # Arcos Dorados Holdings Inc.
-    'GLP': '0001323468',  # GLOBAL PARTNERS LP
-    'MTTR': '0001819394',  # Matterport, Inc./DE
-    'AAOI': '0001158114',  # APPLIED OPTOELECTRONICS, INC.
-    'DNUT': '0001857154',  # Krispy Kreme, Inc.
-    'TVTX': '0001438533',  # Travere Therapeutics, Inc.
-    'NBHC': '0001475841',  # National Bank Holdings Corp
-    'CLBK': '0001723596',  # Columbia Financial, Inc.
-    'WKC': '0000789460',  # WORLD KINECT CORP
-    'TNK': '0001419945',  # TEEKAY TANKERS LTD.
-    'INFN': '0001138639',  # Infinera Corp
-    'BSTZ': '0001768666',  # BlackRock Science & Technology Term Trust
-    'EVO': '0001412558',  # Evotec SE
-    'ATRC': '0001323885',  # AtriCure, Inc.
-    'PHR': '0001412408',  # Phreesia, Inc.
-    'NTB': '0001653242',  # Bank of N.T. Butterfield & Son Ltd
-    'OPRA': '0001737450',  # Opera Ltd
-    'STGW': '0000876883',  # Stagwell Inc
-    'MODG': '0000837465',  # Topgolf Callaway Brands Corp.
-    'DBD': '0000028823',  # DIEBOLD NIXDORF, Inc
-    'ARHS': '0001875444',  # Arhaus, Inc.
-    'NWN': '0001733998',  # Northwest Natural Holding Co
-    'EPC': '0001096752',  # EDGEWELL PERSONAL CARE Co
-    'ZUO': '0001423774',  # ZUORA INC
-    'NN': '0001865631',  # NEXTNAV INC.
-    'SVMB': '0001647822',  # Jingbo Technology, Inc.
-    'HDL': '0001995306',  # SUPER HI INTERNATIONAL HOLDING LTD.
-    'LUCK': '0001840572',  # Lucky Strike Entertainment Corp
-    'BDJ': '0001332283',  # BlackRock Enhanced Equity Dividend Trust
-    'NTCT': '0001078075',  # NETSCOUT SYSTEMS INC
-    'NIC': '0001174850',  # NICOLET BANKSHARES INC
-    'SSRM': '0000921638',  # SSR MINING INC.
-    'KSS': '0000885639',  # KOHLS Corp
-    'STEW': '0000102426',  # SRH Total Return Fund, Inc.
-    'VECO': '0000103145',  # VEECO INSTRUMENTS INC
-    'LTC': '0000887905',  # LTC PROPERTIES INC
-    'CSTM': '0001563411',  # CONSTELLIUM SE
-    'RLJ': '0001511337',  # RLJ Lodging Trust
-    'CTS': '0000026058',  # CTS CORP
-    'PLYA': '0001692412',  # Playa Hotels & Resorts N.V.
-    'GB': '0001799983',  # Global Blue Group Holding AG
-    'SJW': '0000766829',  # SJW GROUP
-    'TNC': '0000097134',  # TENNANT CO
-    'ERO': '0001853860',  # Ero Copper Corp.
-    'DAC': '0001369241',  # Danaos Corp
-    'BAK': '0001071438',  # BRASKEM SA
-    'SILV': '0001659520',  # SilverCrest Metals Inc.
-    'INDV': '0001625297',  # INDIVIOR PLC
-    'PLAB': '0000810136',  # PHOTRONICS INC
-    'IMCR': '0001671927',  # Immunocore Holdings plc
-    'SHCO': '0001846510',  # Soho House & Co Inc.
-    'NHC': '0001047335',  # NATIONAL HEALTHCARE CORP
-    'KARO': '0001828102',  # Karooooo Ltd.
-    'CMRE': '0001503584',  # Costamare Inc.
-    'SPHR': '0001795250',  # Sphere Entertainment Co.
-    'KRP': '0001657788',  # Kimbell Royalty Partners, LP
-    'HMN': '0000850141',  # HORACE MANN EDUCATORS CORP /DE/
-    'EVEX': '0001823652',  # Eve Holding, Inc.
-    'NVAX': '0001000694',  # NOVAVAX INC
-    'MAG': '0001230992',  # MAG SILVER CORP
-    'VNET': '0001508475',  # VNET Group, Inc.
-    'VVX': '0001601548',  # V2X, Inc.
-    'MLKN': '0000066382',  # MILLERKNOLL, INC.
-    'HLIT': '0000851310',  # HARMONIC INC
-    'HLIO': '0001024795',  # HELIOS TECHNOLOGIES, INC.
-    'XNCR': '0001326732',  # Xencor Inc
-    'FDP': '0001047340',  # FRESH DEL MONTE PRODUCE INC
-    'WS': '0001968487',  # Worthington Steel, Inc.
-    'TICA': '0002032966',  # ACUREN CORP
-    'AMC': '0001411579',  # AMC ENTERTAINMENT HOLDINGS, INC.
-    'SFL': '0001289877',  # SFL Corp Ltd.
-    'DXPE': '0001020710',  # DXP ENTERPRISES INC
-    'ATSG': '0000894081',  # Air Transport Services Group, Inc.
-    'ARIS': '0001865187',  # Aris Water Solutions, Inc.
-    'SEI': '0001697500',  # Solaris Energy Infrastructure, Inc.
-    'EVH': '0001628908',  # Evolent Health, Inc.
-    'CSGS': '0001005757',  # CSG SYSTEMS INTERNATIONAL INC
-    'ANDE': '0000821026',  # Andersons, Inc.
-    'GPCR': '0001888886',  # Structure Therapeutics Inc.
-    'ADEA': '0001803696',  # Adeia Inc.
-    'MCRI': '0000907242',  # MONARCH CASINO & RESORT INC
-    'VRDN': '0001590750',  # Viridian Therapeutics, Inc.DE
-    'KNSA': '0001730430',  # Kiniksa Pharmaceuticals International, plc
-    'TROX': '0001530804',  # Tronox Holdings plc
-    'VRTS': '0000883237',  # VIRTUS INVESTMENT PARTNERS, INC.
-    'HE': '0000354707',  # HAWAIIAN ELECTRIC INDUSTRIES INC
-    'KRNT': '0001625791',  # Kornit Digital Ltd.
-    'CUBI': '0001488813',  # Customers Bancorp, Inc.
-    'GSG': '0001332174',  # iShares S&P GSCI Commodity-Indexed Trust
-    'BV': '0001734713',  # BrightView Holdings, Inc.
-    'BXMX': '0001298699',  # Nuveen S&P 500 BuyWrite Income Fund
-    'HYT': '0001222401',  # BLACKROCK CORPORATE HIGH YIELD FUND, INC.
-    'PX': '0001841968',  # P10, Inc.
-    'SPNS': '0000885740',  # SAPIENS INTERNATIONAL CORP N V
-    'TGI': '0001021162',  # TRIUMPH GROUP INC
-    'MLNK': '0001834494',  # MeridianLink, Inc.
-    'HELE': '0000916789',  # HELEN OF TROY LTD
-    'ADNT': '0001670541',  # Adient plc
-    'STEL': '0001473844',  # Stellar Bancorp, Inc.
-    'SDGR': '0001490978',  # Schrodinger, Inc.
-    'GSBD': '0001572694',  # Goldman Sachs BDC, Inc.
-    'FSM': '0001341335',  # FORTUNA MINING CORP.
-    'FLNG': '0001772253',  # Flex LNG Ltd.
-    'NAVI': '0001593538',  # NAVIENT CORP
-    'ETG': '0001270523',  # Eaton Vance Tax-Advantaged Global Dividend Income Fund
-    'UMH': '0000752642',  # UMH PROPERTIES, INC.
-    'ATEC': '0001350653',  # Alphatec Holdings, Inc.
-    'DSL': '0001566388',  # DoubleLine Income Solutions Fund
-    'SSII': '0001676163',  # SS Innovations International, Inc.
-    'SASR': '0000824410',  # SANDY SPRING BANCORP INC
-    'GIII': '0000821002',  # G III APPAREL GROUP LTD /DE/
-    'LADR': '0001577670',  # Ladder Capital Corp
-    'HOPE': '0001128361',  # HOPE BANCORP INC
-    'NGVT': '0001653477',  # Ingevity Corp
-    'NMM': '0001415921',  # Navios Maritime Partners L.P.
-    'NRP': '0001171486',  # NATURAL RESOURCE PARTNERS LP
-    'ATEN': '0001580808',  # A10 Networks, Inc.
-    'WLFC': '0001018164',  # WILLIS LEASE FINANCE CORP
-    'RES': '0000742278',  # RPC INC
-    'CARCY': '0001484515',  # China Resources Cement Holdings Limited/ADR/
-    'VTLE': '0001528129',  # Vital Energy, Inc.
-    'CMPO': '0001823144',  # CompoSecure, Inc.
-    'TASK': '0001829864',  # TaskUs, Inc.
-    'DNOW': '0001599617',  # DNOW Inc.
-    'ASTH': '0001083446',  # Astrana Health, Inc.
-    'BLBD': '0001589526',  # Blue Bird Corp
-    'SCL': '0000094049',  # STEPAN CO
-    'FSCO': '0001568194',  # FS Credit Opportunities Corp.
-    'BTT': '0001528437',  # BlackRock Municipal 2030 Target Term Trust
-    'MYGN': '0000899923',  # MYRIAD GENETICS INC
-    'AFYA': '0001771007',  # Afya Ltd
-    'STBA': '0000719220',  # S&T BANCORP INC
-    'KLG': '0001959348',  # WK Kellogg Co
-    'AHCO': '0001725255',  # AdaptHealth Corp.
-    'OXM': '0000075288',  # OXFORD INDUSTRIES INC
-    'AMRC': '0001488139',  # Ameresco, Inc.
-    'SRCE': '0000034782',  # 1ST SOURCE CORP
-    'WT': '0000880631',  # WisdomTree, Inc.
-    'TCBK': '0000356171',  # TRICO BANCSHARES /
-    'UTI': '0001261654',  # UNIVERSAL TECHNICAL INSTITUTE INC
-    'TILE': '0000715787',  # INTERFACE INC
-    'RXST': '0001111485',  # RxSight, Inc.
-    'LNN': '0000836157',  # LINDSAY CORP
-    'IRS': '0000933267',  # IRSA INVESTMENTS & REPRESENTATIONS INC
-    'VBTX': '0001501570',  # Veritex Holdings, Inc.
-    'HIMX': '0001342338',  # Himax Technologies, Inc.
-    'HLX': '0000866829',  # HELIX ENERGY SOLUTIONS GROUP INC
-    'CMRF': '0001498547',  # CIM REAL ESTATE FINANCE TRUST, INC.
-    'WINA': '0000908315',  # WINMARK CORP
-    'BLX': '0000890541',  # FOREIGN TRADE BANK OF LATIN AMERICA, INC.
-    'COUR': '0001651562',  # Coursera, Inc.
-    'ESTA': '0001688757',  # ESTABLISHMENT LABS HOLDINGS INC.
-    'MMI': '0001578732',  # Marcus & Millichap, Inc.
-    'LZ': '0001286139',  # LEGALZOOM.COM, INC.
-    'SGML': '0001848309',  # Sigma Lithium Corp
-    'UNIT': '0001620280',  # Uniti Group Inc.
-    'WABC': '0000311094',  # WESTAMERICA BANCORPORATION
-    'CWH': '0001669779',  # Camping World Holdings, Inc.
-    'TTGT': '0002018064',  # TechTarget, Inc.
-    'AMPL': '0001866692',  # Amplitude, Inc.
-    'USPH': '0000885978',  # U S PHYSICAL THERAPY INC /NV
-    'HROW': '0001360214',  # HARROW, INC.
-    'WGO': '0000107687',  # WINNEBAGO INDUSTRIES INC
-    'CDRE': '0001860543',  # Cadre Holdings, Inc.
-    'QQQX': '0001608741',  # Nuveen NASDAQ 100 Dynamic Overwrite Fund
-    'CBRL': '0001067294',  # CRACKER BARREL OLD COUNTRY STORE, INC
-    'SYRE': '0001636282',  # Spyre Therapeutics, Inc.
-    'DCOM': '0000846617',  # Dime Community Bancshares, Inc. /NY/
-    'RCUS': '0001724521',  # Arcus Biosciences, Inc.
-    'LEG': '0000058492',  # LEGGETT & PLATT INC
-    'QCRH': '0000906465',  # QCR HOLDINGS INC
-    'CET': '0000018748',  # CENTRAL SECURITIES CORP
-    'CDNA': '0001217234',  # CareDx, Inc.
-    'BST': '0001616678',  # BlackRock Science & Technology Trust
-    'OCUL': '0001393434',  # OCULAR THERAPEUTIX, INC
-    'DCBO': '0001829959',  # Docebo Inc.
-    'SABR': '0001597033',  # Sabre Corp
-    'MDXG': '0001376339',  # MIMEDX GROUP, INC.
-    'ARVN': '0001655759',  # ARVINAS, INC.
-    'FORTY': '0001045986',  # FORMULA SYSTEMS (1985) LTD
-    'PBI': '0000078814',  # PITNEY BOWES INC /DE/
-    'LILA': '0001712184',  # Liberty Latin America Ltd.
-    'FOR': '0001406587',  # Forestar Group Inc.
-    'AIV': '0000922864',  # APARTMENT INVESTMENT & MANAGEMENT CO
-    'FSLY': '0001517413',  # Fastly, Inc.
-    'BFS': '0000907254',  # SAUL CENTERS, INC.
-    'SILA': '0001567925',  # Sila Realty Trust, Inc.
-    'DQ': '0001477641',  # DAQO NEW ENERGY CORP.
-    'ELME': '0000104894',  # Elme Communities
-    'SEZL': '0001662991',  # Sezzle Inc.
-    'NRIX': '0001549595',  # Nurix Therapeutics, Inc.
-    'TR': '0000098677',  # TOOTSIE ROLL INDUSTRIES INC
-    'TPC': '0000077543',  # TUTOR PERINI CORP
-    'GEL': '0001022321',  # GENESIS ENERGY LP
-    'OUTKY': '0000920822',  # OUTOKUMPU OY /FI
-    'ACDC': '0001881487',  # ProFrac Holding Corp.
-    'SCS': '0001050825',  # STEELCASE INC
-    'AAPI': '0001134982',  # Apple iSports Group, Inc.
-    'AORT': '0000784199',  # ARTIVION, INC.
-    'RBCAA': '0000921557',  # REPUBLIC BANCORP INC /KY/
-    'BUSE': '0000314489',  # FIRST BUSEY CORP /NV/
-    'UVV': '0000102037',  # UNIVERSAL CORP /VA/
-    'MRTN': '0000799167',  # MARTEN TRANSPORT LTD
-    'EOS': '0001308335',  # Eaton Vance Enhanced Equity Income Fund II
-    'CGAU': '0001854640',  # Centerra Gold Inc.
-    'AGLY': '0001673504',  # Atlantis Glory Inc.
-    'NSSC': '0000069633',  # NAPCO SECURITY TECHNOLOGIES, INC
-    'BLFS': '0000834365',  # BIOLIFE SOLUTIONS INC
-    'GRDN': '0001802255',  # Guardian Pharmacy Services, Inc.
-    'MFIC': '0001278752',  # MidCap Financial Investment Corp
-    'OCSL': '0001414932',  # Oaktree Specialty Lending Corp
-    'ALEX': '0001545654',  # Alexander & Baldwin, Inc.
-    'KW': '0001408100',  # Kennedy-Wilson Holdings, Inc.
-    'NVEE': '0001532961',  # NV5 Global, Inc.
-    'JKS': '0001481513',  # JinkoSolar Holding Co., Ltd.
-    'EVGO': '0001821159',  # EVgo Inc.
-    'INMD': '0001742692',  # InMode Ltd.
-    'EFXT': '0001904856',  # Enerflex Ltd.
-    'NMZ': '0001266585',  # NUVEEN MUNICIPAL HIGH INCOME OPPORTUNITY FUND
-    'IMAX': '0000921582',  # IMAX CORP
-    'PRAX': '0001689548',  # Praxis Precision Medicines, Inc.
-    'DK': '0001694426',  # Delek US Holdings, Inc.
-    'CCB': '0001437958',  # COASTAL FINANCIAL CORP
-    'UDMY': '0001607939',  # Udemy, Inc.
-    'JBGS': '0001689796',  # JBG SMITH Properties
-    'CRAI': '0001053706',  # CRA INTERNATIONAL, INC.
-    'ARDX': '0001437402',  # ARDELYX, INC.
-    'QNST': '0001117297',  # QUINSTREET, INC
-    'CRCT': '0001828962',  # Cricut, Inc.
-    'DEA': '0001622194',  # Easterly Government Properties, Inc.
-    'BMBL': '0001830043',  # Bumble Inc.
-    'THRM': '0000903129',  # Gentherm Inc
-    'BY': '0001702750',  # BYLINE BANCORP, INC.
-    'OLO': '0001431695',  # Olo Inc.
-    'COHU': '0000021535',  # COHU INC
-    'TBLA': '0001840502',  # Taboola.com Ltd.
-    'IMKTA': '0000050493',  # INGLES MARKETS INC
-    'SMWB': '0001842731',  # SIMILARWEB LTD.
-    'DAWN': '0001845337',  # Day One Biopharmaceuticals, Inc.
-    'GAM': '0000040417',  # GENERAL AMERICAN INVESTORS CO INC
-    'NG': '0001173420',  # NOVAGOLD RESOURCES INC
-    'MRVI': '0001823239',  # MARAVAI LIFESCIENCES HOLDINGS, INC.
-    'KBDC': '0001747172',  # Kayne Anderson BDC, Inc.
-    'PZZA': '0000901491',  # PAPA JOHNS INTERNATIONAL INC
-    'ARI': '0001467760',  # Apollo Commercial Real Estate Finance, Inc.
-    'NVGS': '0001581804',  # Navigator Holdings Ltd.
-    'QUBT': '0001758009',  # Quantum Computing Inc.
-    'JFR': '0001276533',  # NUVEEN FLOATING RATE INCOME FUND
-    'RCKT': '0001281895',  # ROCKET PHARMACEUTICALS, INC.
-    'NYAX': '0001901279',  # Nayax Ltd.
-    'NFJ': '0001260563',  # Virtus Dividend, Interest & Premium Strategy Fund
-    'NMFC': '0001496099',  # New Mountain Finance Corp
-    'EIG': '0001379041',  # Employers Holdings, Inc.
-    'SDHC': '0001982518',  # Smith Douglas Homes Corp.
-    'CNNE': '0001704720',  # Cannae Holdings, Inc.
-    'DOLE': '0001857475',  # Dole plc
-    'EVRI': '0001318568',  # Everi Holdings Inc.
-    'BHLB': '0001108134',  # BERKSHIRE HILLS BANCORP INC
-    'HCI': '0001400810',  # HCI Group, Inc.
-    'LEU': '0001065059',  # CENTRUS ENERGY CORP
-    'FOXF': '0001424929',  # FOX FACTORY HOLDING CORP
-    'FWRG': '0001789940',  # First Watch Restaurant Group, Inc.
-    'PDX': '0001756908',  # PIMCO Dynamic Income Strategy Fund
-    'MOMO': '0001610601',  # Hello Group Inc.
-    'SPH': '0001005210',  # SUBURBAN PROPANE PARTNERS LP
-    'EVV': '0001222922',  # Eaton Vance Ltd Duration Income Fund
-    'ROOT': '0001788882',  # Root, Inc.
-    'IDT': '0001005731',  # IDT CORP
-    'TWO': '0001465740',  # TWO HARBORS INVESTMENT CORP.
-    'SAFT': '0001172052',  # SAFETY INSURANCE GROUP INC
-    'CNCK': '0001913847',  # Coincheck Group N.V.
-    'HTZ': '0001657853',  # HERTZ GLOBAL HOLDINGS, INC
-    'FVRR': '0001762301',  # Fiverr International Ltd.
-    'PLSE': '0001625101',  # PULSE BIOSCIENCES, INC.
-    'ANIP': '0001023024',  # ANI PHARMACEUTICALS INC
-    'ARLO': '0001736946',  # Arlo Technologies, Inc.
-    'KOZAY': '0001532173',  # Koza Altin Isletmeleri A.S./ADR
-    'XRX': '0001770450',  # Xerox Holdings Corp
-    'SBH': '0001368458',  # Sally Beauty Holdings, Inc.
-    'WEAV': '0001609151',  # Weave Communications, Inc.
-    'SAFE': '0001095651',  # Safehold Inc.
-    'EMBC': '0001872789',  # Embecta Corp.
-    'APOG': '0000006845',  # APOGEE ENTERPRISES, INC.
-    'KALU': '0000811596',  # KAISER ALUMINUM CORP
-    'VSAT': '0000797721',  # VIASAT INC
-    'SCSC': '0000918965',  # SCANSOURCE, INC.
-    'AUPH': '0001600620',  # Aurinia Pharmaceuticals Inc.
-    'UP': '0001819516',  # Wheels Up Experience Inc.
-    'NTST': '0001798100',  # NETSTREIT Corp.
-    'UTZ': '0001739566',  # Utz Brands, Inc.
-    'LPG': '0001596993',  # DORIAN LPG LTD.
-    'AMWD': '0000794619',  # AMERICAN WOODMARK CORP
-    'ATUS': '0001702780',  # Altice USA, Inc.
-    'PENG': '0001616533',  # Penguin Solutions, Inc.
-    'MRC': '0001439095',  # MRC GLOBAL INC.
-    'TLRY': '0001731348',  # Tilray Brands, Inc.
-    'PL': '0001836833',  # Planet Labs PBC
-    'COMM': '0001517228',  # CommScope Holding Company, Inc.
-    'CIM': '0001409493',  # CHIMERA INVESTMENT CORP
-    'GABC': '0000714395',  # GERMAN AMERICAN BANCORP, INC.
-    'SNDX': '0001395937',  # Syndax Pharmaceuticals Inc
-    'SA': '0001231346',  # SEABRIDGE GOLD INC
-    'STAA': '0000718937',  # STAAR SURGICAL CO
-    'DSP': '0001828791',  # Viant Technology Inc.
-    'EFC': '0001411342',  # Ellington Financial Inc.
-    'PRSU': '0000884219',  # Pursuit Attractions & Hospitality, Inc.
-    'FPF': '0001567569',  # First Trust Intermediate Duration Preferred & Income Fund
-    'VTEX': '0001793663',  # VTEX
-    'PGRE': '0001605607',  # Paramount Group, Inc.
-    'BCSF': '0001655050',  # Bain Capital Specialty Finance, Inc.
-    'PLAY': '0001525769',  # Dave & Buster's Entertainment, Inc.
-    'CECO': '0000003197',  # CECO ENVIRONMENTAL CORP
-    'BGM': '0001779578',  # BGM Group Ltd.
-    'ULH': '0001308208',  # UNIVERSAL LOGISTICS HOLDINGS, INC.
-    'SEVCF': '0001840416',  # Sono Group N.V.
-    'OMI': '0000075252',  # OWENS & MINOR INC/VA/
-    'LMB': '0001606163',  # Limbach Holdings, Inc.
-    'GETY': '0001898496',  # Getty Images Holdings, Inc.
-    'ICHR': '0001652535',  # ICHOR HOLDINGS, LTD.
-    'CARS': '0001683606',  # Cars.com Inc.
-    'INVA': '0001080014',  # Innoviva, Inc.
-    'EOSE': '0001805077',  # Eos Energy Enterprises, Inc.
-    'SPRY': '0001671858',  # ARS Pharmaceuticals, Inc.
-    'RC': '0001527590',  # Ready Capital Corp
-    'TUYA': '0001829118',  # Tuya Inc.
-    'TIGR': '0001756699',  # UP Fintech Holding Ltd
-    'PTA': '0001793882',  # Cohen & Steers Tax-Advantaged Preferred Securities & Income Fund
-    'BBSI': '0000902791',  # BARRETT BUSINESS SERVICES INC
-    'DAVE': '0001841408',  # Dave Inc./DE
-    'ECPG': '0001084961',  # ENCORE CAPITAL GROUP INC
-    'PFBC': '0001492165',  # Preferred Bank
-    'SSTK': '0001549346',  # Shutterstock, Inc.
-    'XPEL': '0001767258',  # XPEL, Inc.
-    'MD': '0000893949',  # Pediatrix Medical Group, Inc.
-    'CCEC': '0001392326',  # Capital Clean Energy Carriers Corp.
-    'PEBO': '0000318300',  # PEOPLES BANCORP INC
-    'PDFS': '0001120914',  # PDF SOLUTIONS INC
-    'IGIC': '0001794338',  # International General Insurance Holdings Ltd.
-    'AMSC': '0000880807',  # AMERICAN SUPERCONDUCTOR CORP /DE/
-    'PSFE': '0001833835',  # Paysafe Ltd
-    'PMT': '0001464423',  # PennyMac Mortgage Investment Trust
-    'COLL': '0001267565',  # COLLEGIUM PHARMACEUTICAL, INC
-    'IHS': '0001876183',  # IHS Holding Ltd
-    'CTOS': '0001709682',  # Custom Truck One Source, Inc.
-    'AOSL': '0001387467',  # ALPHA & OMEGA SEMICONDUCTOR Ltd
-    'ELVN': '0001672619',  # Enliven Therapeutics, Inc.
-    'SII': '0001512920',  # SPROTT INC.
-    'DGII': '0000854775',  # DIGI INTERNATIONAL INC
-    'WOOF': '0001826470',  # Petco Health & Wellness Company, Inc.
-    'AMTD': '0001769731',  # AMTD IDEA GROUP
-    'OPEN': '0001801169',  # Opendoor Technologies Inc.
-    'NTLA': '0001652130',  # Intellia Therapeutics, Inc.
-    'PUMP': '0001680247',  # ProPetro Holding Corp.
-    'GOLLQ': '0001291733',  # Gol Intelligent Airlines Inc.
-    'CURLF': '0001756770',  # Curaleaf Holdings, Inc.
-    'INVX': '0001042893',  # Innovex International, Inc.
-    'LQDA': '0001819576',  # Liquidia Corp
-    'CSWC': '0000017313',  # CAPITAL SOUTHWEST CORP
-    'UUUU': '0001385849',  # ENERGY FUELS INC
-    'SBGI': '0001971213',  # Sinclair, Inc.
-    'CSR': '0000798359',  # CENTERSPACE
-    'MDRX': '0001124804',  # Veradigm Inc.
-    'ASPN': '0001145986',  # ASPEN AEROGELS INC
-    'NRDS': '0001625278',  # NERDWALLET, INC.
-    'FBMS': '0000947559',  # FIRST BANCSHARES INC /MS/
-    'FSUN': '0001709442',  # FIRSTSUN CAPITAL BANCORP
-    'SKE': '0001713748',  # Skeena Resources Ltd
-    'KRUS': '0001772177',  # KURA SUSHI USA, INC.
-    'BOW': '0002002473',  # Bowhead Specialty Holdings Inc.
-    'PRO': '0001392972',  # PROS Holdings, Inc.
-    'KFRC': '0000930420',  # KFORCE INC
-    'GATO': '0001517006',  # Gatos Silver, Inc.
-    'PDM': '0001042776',  # Piedmont Office Realty Trust, Inc.
-    'INOD': '0000903651',  # INNODATA INC
-    'RDW': '0001819810',  # Redwire Corp
-    'NX': '0001423221',  # Quanex Building Products CORP
-    'KRO': '0001257640',  # KRONOS WORLDWIDE INC
-    'AMN': '0001142750',  # AMN HEALTHCARE SERVICES INC
-    'OLPX': '0001868726',  # OLAPLEX HOLDINGS, INC.
-    'OCFC': '0001004702',  # OCEANFIRST FINANCIAL CORP
-    'ARR': '0001428205',  # Armour Residential REIT, Inc.
-    'FIGS': '0001846576',  # FIGS, Inc.
-    'OPFI': '0001818502',  # OppFi Inc.
-    'VMEO': '0001837686',  # Vimeo, Inc.
-    'LQDT': '0001235468',  # LIQUIDITY SERVICES INC
-    'BRKL': '0001049782',  # BROOKLINE BANCORP INC
-    'NBXG': '0001843181',  # Neuberger Berman Next Generation Connectivity Fund Inc.
-    'CRF': '0000033934',  # CORNERSTONE TOTAL RETURN FUND INC
-    'MUC': '0001051004',  # BLACKROCK MUNIHOLDINGS CALIFORNIA QUALITY FUND, INC.
-    'SHLS': '0001831651',  # Shoals Technologies Group, Inc.
-    'OBK': '0001516912',  # Origin Bancorp, Inc.
-    'AGL': '0001831097',  # agilon health, inc.
-    'OPK': '0000944809',  # OPKO HEALTH, INC.
-    'EXOD': '0001821534',  # Exodus Movement, Inc.
-    'AGRO': '0001499505',  # Adecoagro S.A.
-    'BBN': '0001493683',  # BlackRock Taxable Municipal Bond Trust
-    'JBSS': '0000880117',  # SANFILIPPO JOHN B & SON INC
-    'AMAL': '0001823608',  # Amalgamated Financial Corp.
-    'BBDC': '0001379785',  # Barings BDC, Inc.
-    'FBRT': '0001562528',  # Franklin BSP Realty Trust, Inc.
-    'JBI': '0001839839',  # Janus International Group, Inc.
-    'BELFA': '0000729580',  # BEL FUSE INC /NJ
-    'VTOL': '0001525221',  # Bristow Group Inc.
-    'CMCO': '0001005229',  # COLUMBUS MCKINNON CORP
-    'BORR': '0001715497',  # Borr Drilling Ltd
-    'BKD': '0001332349',  # Brookdale Senior Living Inc.
-    'HEPS': '0001850235',  # D-MARKET Electronic Services & Trading
-    'ACMR': '0001680062',  # ACM Research, Inc.
-    'BTZ': '0001379384',  # BLACKROCK CREDIT ALLOCATION INCOME TRUST
-    'ARRY': '0001820721',  # Array Technologies, Inc.
-    'EAI': '0000007323',  # ENTERGY ARKANSAS, LLC
-    'MFA': '0001055160',  # MFA FINANCIAL, INC.
-    'DX': '0000826675',  # DYNEX CAPITAL INC
-    'AHH': '0001569187',  # Armada Hoffler Properties, Inc.
-    'TV': '0000912892',  # GRUPO TELEVISA, S.A.B.
-    'RNP': '0001224450',  # COHEN & STEERS REIT & PREFERRED & INCOME FUND INC
-    'ML': '0001807846',  # MONEYLION INC.
-    'BLMN': '0001546417',  # Bloomin' Brands, Inc.
-    'PARR': '0000821483',  # PAR PACIFIC HOLDINGS, INC.
-    'TPB': '0001290677',  # Turning Point Brands, Inc.
-    'ECC': '0001604174',  # Eagle Point Credit Co Inc.
-    'AVXL': '0001314052',  # ANAVEX LIFE SCIENCES CORP.
-    'ALX': '0000003499',  # ALEXANDERS INC
-    'RTGN': '0001836295',  # RetinalGenix Technologies Inc.
-    'SDA': '0001936804',  # SunCar Technology Group Inc.
-    'REAL': '0001573221',  # TheRealReal, Inc.
-    'ENFN': '0001868912',  # Enfusion, Inc.
-    'HSTM': '0001095565',  # HEALTHSTREAM INC
-    'GOGO': '0001537054',  # Gogo Inc.
-    'CVAC': '0001809122',  # CureVac N.V.
-    'ADPT': '0001478320',  # Adaptive Biotechnologies Corp
-    'PHVS': '0001830487',  # Pharvaris N.V.
-    'TRNS': '0000099302',  # TRANSCAT INC
-    'PCRX': '0001396814',  # Pacira BioSciences, Inc.
-    'GOOS': '0001690511',  # Canada Goose Holdings Inc.
-    'DCO': '0000030305',  # DUCOMMUN INC /DE/
-    'MSC': '0001713334',  # STUDIO CITY INTERNATIONAL HOLDINGS Ltd
-    'EEX': '0001579214',  # Emerald Holding, Inc.
-    'NNE': '0001923891',  # Nano Nuclear Energy Inc.
-    'AIUG': '0001932244',  # AI Unlimited Group, Inc.
-    'DLX': '0000027996',  # DELUXE CORP
-    'GRC': '0000042682',  # GORMAN RUPP CO
-    'EXK': '0001277866',  # ENDEAVOUR SILVER CORP
-    'TH': '0001712189',  # Target Hospitality Corp.
-    'SBR': '0000710752',  # SABINE ROYALTY TRUST
-    'CRESY': '0001034957',  # CRESUD INC
-    'BFC': '0001746109',  # Bank First Corp
-    'LVWR': '0001898795',  # LiveWire Group, Inc.
-    'AMSF': '0001018979',  # AMERISAFE INC
-    'LX': '0001708259',  # LexinFintech Holdings Ltd.
-    'NUVB': '0001811063',  # Nuvation Bio Inc.
-    'THR': '0001489096',  # Thermon Group Holdings, Inc.
-    'SERV': '0001832483',  # Serve Robotics Inc. /DE/
-    'TCNNF': '0001754195',  # Trulieve Cannabis Corp.
-    'VLRS': '0001520504',  # Controladora Vuela Compania de Aviacion, S.A.B. de C.V.
-    'FWRD': '0000912728',  # FORWARD AIR CORP
-    'TRS': '0000842633',  # TRIMAS CORP
-    'BCYC': '0001761612',  # BICYCLE THERAPEUTICS PLC
-    'MATW': '0000063296',  # MATTHEWS INTERNATIONAL CORP
-    'IPX': '0001898601',  # IPERIONX Ltd
-    'EH': '0001759783',  # EHang Holdings Ltd
-    'AWF': '0000906013',  # ALLIANCEBERNSTEIN GLOBAL HIGH INCOME FUND INC
-    'DMRC': '0001438231',  # Digimarc CORP
-    'ETW': '0001322435',  # Eaton Vance Tax-Managed Global Buy-Write Opportunities Fund
-    'SEAT': '0001856031',  # Vivid Seats Inc.
-    'CGBD': '0001544206',  # Carlyle Secured Lending, Inc.
-    'PFLT': '0001504619',  # PennantPark Floating Rate Capital Ltd.
-    'RDFN': '0001382821',  # Redfin Corp
-    'FIP': '0001899883',  # FTAI Infrastructure Inc.
-    'NRK': '0001195739',  # NUVEEN NEW YORK AMT-FREE QUALITY MUNICIPAL INCOME FUND
-    'KIND': '0001846069',  # Nextdoor Holdings, Inc.
-    'SBSI': '0000705432',  # SOUTHSIDE BANCSHARES INC
-    'TMP': '0001005817',  # TOMPKINS FINANCIAL CORP
-    'ZYME': '0001937653',  # Zymeworks Inc.
-    'GIC': '0000945114',  # GLOBAL INDUSTRIAL Co
-    'GRNT': '0001928446',  # Granite Ridge Resources, Inc.
-    'CTBI': '0000350852',  # COMMUNITY TRUST BANCORP INC /KY/
-    'RDWR': '0001094366',  # RADWARE LTD
-    'HSII': '0001066605',  # HEIDRICK & STRUGGLES INTERNATIONAL INC
-    'PDS': '0001013605',  # PRECISION DRILLING Corp
-    'PRLB': '0001443669',  # Proto Labs Inc
-    'BLND': '0001855747',  # Blend Labs, Inc.
-    'CBL': '0000910612',  # CBL & ASSOCIATES PROPERTIES INC
-    'AAMI': '0001748824',  # Acadian Asset Management Inc.
-    'AOD': '0001379400',  # abrdn Total Dynamic Dividend Fund
-    'PNTG': '0001766400',  # Pennant Group, Inc.
-    'OCS': '0001953530',  # Oculis Holding AG
-    'NGVC': '0001547459',  # Natural Grocers by Vitamin Cottage, Inc.
-    'TIXT': '0001825155',  # TELUS International (Cda) Inc.
-    'NCDL': '0001737924',  # Nuveen Churchill Direct Lending Corp.
-    'FNA': '0001531978',  # Paragon 28, Inc.
-    'ACEL': '0001698991',  # Accel Entertainment, Inc.
-    'CTKB': '0001831915',  # Cytek Biosciences, Inc.
-    'SLRC': '0001418076',  # SLR Investment Corp.
-    'COGT': '0001622229',  # Cogent Biosciences, Inc.
-    'HY': '0001173514',  # HYSTER-YALE, INC.
-    'CHY': '0001222719',  # CALAMOS CONVERTIBLE & HIGH INCOME FUND
-    'ABCL': '0001703057',  # AbCellera Biologics Inc.
-    'MSEX': '0000066004',  # MIDDLESEX WATER CO
-    'AVAH': '0001832332',  # Aveanna Healthcare Holdings, Inc.
-    'ECVT': '0001708035',  # Ecovyst Inc.
-    'MUI': '0001232860',  # BLACKROCK MUNICIPAL INCOME FUND, INC.
-    'BRDG': '0001854401',  # Bridge Investment Group Holdings Inc.
-    'CII': '0001278895',  # BlackRock Enhanced Large Cap Core Fund, Inc.
-    'HQH': '0000805267',  # abrdn Healthcare Investors
-    'IE': '0001879016',  # Ivanhoe Electric Inc.
-    'CHI': '0001171471',  # CALAMOS CONVERTIBLE OPPORTUNITIES & INCOME FUND
-    'AVO': '0001802974',  # Mission Produce, Inc.
-    'ASTL': '0001860805',  # Algoma Steel Group Inc.
-    'STKL': '0000351834',  # SunOpta Inc.
-    'FUFU': '0001921158',  # Bitfufu Inc.
-    'GYRE': '0001124105',  # GYRE THERAPEUTICS, INC.
-    'BDN': '0000790816',  # BRANDYWINE REALTY TRUST
-    'PPTA': '0001526243',  # PERPETUA RESOURCES CORP.
-    'DRD': '0001023512',  # DRDGOLD LTD
-    'GDEN': '0001071255',  # GOLDEN ENTERTAINMENT, INC.
-    'PFC': '0000946647',  # PREMIER FINANCIAL CORP
-    'SNCY': '0001743907',  # Sun Country Airlines Holdings, Inc.
-    'REAX': '0001862461',  # Real Brokerage Inc
-    'TSAT': '0001845840',  # Telesat Corp
-    'NEXA': '0001713930',  # Nexa Resources S.A.
-    'DEC': '0001922446',  # Diversified Energy Co PLC
-    'CAPL': '0001538849',  # CrossAmerica Partners LP
-    'AVBP': '0001868279',  # ArriVent BioPharma, Inc.
-    'BHRB': '0001964333',  # Burke & Herbert Financial Services Corp.
-    'CLB': '0001958086',  # Core Laboratories Inc. /DE/
-    'AMTB': '0001734342',  # Amerant Bancorp Inc.
-    'MRNO': '0001988776',  # Murano Global Investments Plc
-    'SEDG': '0001419612',  # SOLAREDGE TECHNOLOGIES, INC.
-    'UTL': '0000755001',  # UNITIL CORP
-    'REPL': '0001737953',  # Replimune Group, Inc.
-    'HCSG': '0000731012',  # HEALTHCARE SERVICES GROUP INC
-    'TRIN': '0001786108',  # Trinity Capital Inc.
-    'HTLD': '0000799233',  # HEARTLAND EXPRESS INC
-    'SXC': '0001514705',  # SunCoke Energy, Inc.
-    'YEXT': '0001614178',  # Yext, Inc.
-    'MTAL': '0001950246',  # MAC Copper Ltd
-    'BASE': '0001845022',  # Couchbase, Inc.
-    'MQY': '0000890196',  # BLACKROCK MUNIYIELD QUALITY FUND, INC.
-    'OEC': '0001609804',  # Orion S.A.
-    'SKYH': '0001823587',  # Sky Harbour Group Corp
-    'CSTL': '0001447362',  # CASTLE BIOSCIENCES INC
-    'EOI': '0001300391',  # Eaton Vance Enhanced Equity Income Fund
-    'EYE': '0001710155',  # National Vision Holdings, Inc.
-    'PRTH': '0001653558',  # Priority Technology Holdings, Inc.
-    'SCVL': '0000895447',  # SHOE CARNIVAL INC
-    'CNOB': '0000712771',  # ConnectOne Bancorp, Inc.
-    'SANA': '0001770121',  # Sana Biotechnology, Inc.
-    'FMBH': '0000700565',  # FIRST MID BANCSHARES, INC.
-    'SPLP': '0001452857',  # STEEL PARTNERS HOLDINGS L.P.
-    'ERII': '0001421517',  # Energy Recovery, Inc.
-    'BBAI': '0001836981',  # BigBear.ai Holdings, Inc.
-    'UXIN': '0001729173',  # Uxin Ltd
-    'RWT': '0000930236',  # REDWOOD TRUST INC
-    'WLKP': '0001604665',  # Westlake Chemical Partners LP
-    'NESR': '0001698514',  # National Energy Services Reunited Corp.
-    'PAHC': '0001069899',  # PHIBRO ANIMAL HEALTH CORP
-    'AIO': '0001778114',  # Virtus Artificial Intelligence & Technology Opportunities Fund
-    'ETWO': '0001800347',  # E2open Parent Holdings, Inc.
-    'PSIX': '0001137091',  # POWER SOLUTIONS INTERNATIONAL, INC.
-    'BXC': '0001301787',  # BlueLinx Holdings Inc.
-    'ADTN': '0000926282',  # ADTRAN Holdings, Inc.
-    'BZH': '0000915840',  # BEAZER HOMES USA INC
-    'CSIQ': '0001375877',  # Canadian Solar Inc.
-    'UVSP': '0000102212',  # UNIVEST FINANCIAL Corp
-    'HCKT': '0001057379',  # HACKETT GROUP, INC.
-    'RCAT': '0000748268',  # Red Cat Holdings, Inc.
-    'SEPN': '0001984086',  # Septerna, Inc.
-    'BFLY': '0001804176',  # Butterfly Network, Inc.
-    'DAO': '0001781753',  # Youdao, Inc.
-    'CDMO': '0000704562',  # Avid Bioservices, Inc.
-    'CINT': '0001868995',  # CI&T Inc
-    'THQ': '0001604522',  # abrdn Healthcare Opportunities Fund
-    'UAN': '0001425292',  # CVR PARTNERS, LP
-    'BCAX': '0002023658',  # Bicara Therapeutics Inc.
-    'CRSR': '0001743759',  # Corsair Gaming, Inc.
-    'ATLC': '0001464343',  # Atlanticus Holdings Corp
-    'AXGN': '0000805928',  # Axogen, Inc.
-    'GCT': '0001857816',  # GigaCloud Technology Inc
-    'HFWA': '0001046025',  # HERITAGE FINANCIAL CORP /WA/
-    'BJRI': '0001013488',  # BJs RESTAURANTS INC
-    'IIIV': '0001728688',  # i3 Verticals, Inc.
-    'INDI': '0001841925',  # indie Semiconductor, Inc.
-    'ECO': '0001964954',  # Okeanis Eco Tankers Corp.
-    'HTD': '0001260041',  # JOHN HANCOCK TAX-ADVANTAGED DIVIDEND INCOME FUND
-    'IMTX': '0001809196',  # Immatics N.V.
-    'PCN': '0001160990',  # PIMCO CORPORATE & INCOME STRATEGY FUND
-    'GHLD': '0001821160',  # Guild Holdings Co
-    'VTS': '0001944558',  # Vitesse Energy, Inc.
-    'SITC': '0000894315',  # SITE Centers Corp.
-    'NOAH': '0001499543',  # Noah Holdings Ltd
-    'ADV': '0001776661',  # Advantage Solutions Inc.
-    'FNKO': '0001704711',  # Funko, Inc.
-    'GSL': '0001430725',  # Global Ship Lease, Inc.
-    'OSBC': '0000357173',  # OLD SECOND BANCORP INC
-    'ADSE': '0001879248',  # Ads-Tec Energy Public Ltd Co
-    'PRAA': '0001185348',  # PRA GROUP INC
-    'PHK': '0001219360',  # PIMCO HIGH INCOME FUND
-    'JQC': '0001227476',  # Nuveen Credit Strategies Income Fund
-    'ECX': '0001861974',  # ECARX Holdings Inc.
-    'ANGI': '0001705110',  # Angi Inc.
-    'RSKD': '0001851112',  # RISKIFIED LTD.
-    'DLY': '0001788399',  # DoubleLine Yield Opportunities Fund
-    'MGPI': '0000835011',  # MGP INGREDIENTS INC
-    'AIOT': '0001774170',  # Powerfleet, Inc.
-    'PLYM': '0001515816',  # Plymouth Industrial REIT, Inc.
-    'TYRA': '0001863127',  # Tyra Biosciences, Inc.
-    'FFC': '0001174164',  # Flaherty & Crumrine PREFERRED & INCOME SECURITIES FUND INC
-    'DAKT': '0000915779',  # DAKTRONICS INC /SD/
-    'CRON': '0001656472',  # Cronos Group Inc.
-    'MIESY': '0001567924',  # Mitsui E&S Holdings Co., Ltd./ADR
-    'AVDL': '0001012477',  # AVADEL PHARMACEUTICALS PLC
-    'NTGR': '0001122904',  # NETGEAR, INC.
-    'MCBS': '0001747068',  # MetroCity Bankshares, Inc.
-    'HOV': '0000357294',  # HOVNANIAN ENTERPRISES INC
-    'CEVA': '0001173489',  # CEVA INC
-    'UPB': '0002022626',  # Upstream Bio, Inc.
-    'BITF': '0001812477',  # Bitfarms Ltd
-    'ETNB': '0001785173',  # 89bio, Inc.
-    'WDI': '0001819559',  # Western Asset Diversified Income Fund (WDI)
-    'SCWX': '0001468666',  # SecureWorks Corp
-    'REX': '0000744187',  # REX AMERICAN RESOURCES Corp
-    'GLDD': '0001372020',  # Great Lakes Dredge & Dock CORP
-    'GCI': '0001579684',  # Gannett Co., Inc.
-    'SWIM': '0001833197',  # Latham Group, Inc.
-    'NPWR': '0001845437',  # NET Power Inc.
-    'MEG': '0001643615',  # Montrose Environmental Group, Inc.
-    'ARKO': '0001823794',  # ARKO Corp.
-    'MLAB': '0000724004',  # MESA LABORATORIES INC /CO/
-    'GSM': '0001639877',  # Ferroglobe PLC
-    'CBLL': '0001861107',  # Ceribell, Inc.
-    'PLRX': '0001746473',  # PLIANT THERAPEUTICS, INC.
-    'TCPC': '0001370755',  # BlackRock TCP Capital Corp.
-    'DBA': '0001383082',  # INVESCO DB AGRICULTURE FUND
-    'BALY': '0001747079',  # Bally's Corp
-    'FMCB': '0001085913',  # FARMERS & MERCHANTS BANCORP
-    'RA': '0001655099',  # Brookfield Real Assets Income Fund Inc.
-    'MYI': '0000883412',  # BLACKROCK MUNIYIELD QUALITY FUND III, INC.
-    'NXP': '0000883618',  # NUVEEN SELECT TAX FREE INCOME PORTFOLIO
-    'PRA': '0001127703',  # PROASSURANCE CORP
-    'MLR': '0000924822',  # MILLER INDUSTRIES INC /TN/
-    'CFFN': '0001490906',  # Capitol Federal Financial, Inc.
-    'RLAY': '0001812364',  # Relay Therapeutics, Inc.
-    'ASTE': '0000792987',  # ASTEC INDUSTRIES INC
-    'BCX': '0001506289',  # BlackRock Resources & Commodities Strategy Trust
-    'CAL': '0000014707',  # CALERES INC
-    'IRMD': '0001325618',  # IRADIMED CORP
-    'DJCO': '0000783412',  # DAILY JOURNAL CORP
-    'BRSP': '0001717547',  # BrightSpire Capital, Inc.
-    'INN': '0001497645',  # Summit Hotel Properties, Inc.
-    'REPX': '0001001614',  # Riley Exploration Permian, Inc.
-    'MVST': '0001760689',  # Microvast Holdings, Inc.
-    'CPF': '0000701347',  # CENTRAL PACIFIC FINANCIAL CORP
-    'NBBK': '0001979330',  # NB Bancorp, Inc.
-    'FDUS': '0001513363',  # FIDUS INVESTMENT Corp
-    'XPOF': '0001802156',  # Xponential Fitness, Inc.
-    'AVNS': '0001606498',  # AVANOS MEDICAL, INC.
-    'DNTH': '0001690585',  # Dianthus Therapeutics, Inc. /DE/
-    'TXO': '0001559432',  # TXO Partners, L.P.
-    'ASIX': '0001673985',  # AdvanSix Inc.
-    'WNC': '0000879526',  # WABASH NATIONAL Corp
-    'NGL': '0001504461',  # NGL Energy Partners LP
-    'ETD': '0000896156',  # ETHAN ALLEN INTERIORS INC
-    'CCO': '0001334978',  # Clear Channel Outdoor Holdings, Inc.
-    'JACK': '0000807882',  # JACK IN THE BOX INC
-    'PRTA': '0001559053',  # PROTHENA CORP PUBLIC LTD CO
-    'AC': '0001642122',  # Associated Capital Group, Inc.
-    'FCBC': '0000859070',  # FIRST COMMUNITY BANKSHARES INC /VA/
-    'GES': '0000912463',  # GUESS INC
-    'CFB': '0001458412',  # CROSSFIRST BANKSHARES, INC.
-    'DDL': '0001854545',  # Dingdong (Cayman) Ltd
-    'EGBN': '0001050441',  # EAGLE BANCORP INC
-    'ERAS': '0001761918',  # Erasca, Inc.
-    'CAC': '0000750686',  # CAMDEN NATIONAL CORP
-    'GOOD': '0001234006',  # GLADSTONE COMMERCIAL CORP
-    'CRML': '0001951089',  # Critical Metals Corp.
-    'TIPT': '0001393726',  # TIPTREE INC.
-    'OSPN': '0001044777',  # OneSpan Inc.
-    'CLNE': '0001368265',  # Clean Energy Fuels Corp.
-    'CVLG': '0000928658',  # COVENANT LOGISTICS GROUP, INC.
-    'RBBN': '0001708055',  # Ribbon Communications Inc.
-    'PAXS': '0001886878',  # PIMCO Access Income Fund
-    'MAX': '0001818383',  # MediaAlpha, Inc.
-    'EQBK': '0001227500',  # EQUITY BANCSHARES INC
-    'CCAP': '0001633336',  # Crescent Capital BDC, Inc.
-    'BFST': '0001624322',  # Business First Bancshares, Inc.
-    'LAC': '0001966983',  # LITHIUM AMERICAS CORP.
-    'AACT': '0001853138',  # Ares Acquisition Corp II
-    'QURE': '0001590560',  # uniQure N.V.
-    'SCGX': '0001277575',  # SAXON CAPITAL GROUP INC
-    'KREF': '0001631596',  # KKR Real Estate Finance Trust Inc.
-    'IBCP': '0000039311',  # INDEPENDENT BANK CORP /MI/
-    'SLQT': '0001794783',  # SelectQuote, Inc.
-    'TGB': '0000878518',  # TASEKO MINES LTD
-    'WSR': '0001175535',  # Whitestone REIT
-    'NPK': '0000080172',  # NATIONAL PRESTO INDUSTRIES INC
-    'PUBM': '0001422930',  # PubMatic, Inc.
-    'CRMD': '0001410098',  # CorMedix Inc.
-    'IGR': '0001268884',  # CBRE GLOBAL REAL ESTATE INCOME FUND
-    'TRTX': '0001630472',  # TPG RE Finance Trust, Inc.
-    'RPAY': '0001720592',  # Repay Holdings Corp
-    'NVRI': '0000045876',  # ENVIRI Corp
-    'MBWM': '0001042729',  # MERCANTILE BANK CORP
-    'MBUU': '0001590976',  # MALIBU BOATS, INC.
-    'BH-A': '0001726173',  # Biglari Holdings Inc.
-    'BTO': '0000925683',  # JOHN HANCOCK FINANCIAL OPPORTUNITIES FUND
-    'SVM': '0001340677',  # SILVERCORP METALS INC
-    'IMOS': '0001123134',  # CHIPMOS TECHNOLOGIES INC
-    'GSBC': '0000854560',  # GREAT SOUTHERN BANCORP, INC.
-    'ODP': '0000800240',  # ODP Corp
-    'MNRO': '0000876427',  # MONRO, INC.
-    'ZIP': '0001617553',  # ZIPRECRUITER, INC.
-    'NIE': '0001383441',  # Virtus Equity & Convertible Income Fund
-    'PFN': '0001296250',  # PIMCO Income Strategy Fund II
-    'PHAR': '0001828316',  # Pharming Group N.V.
-    'HLF': '0001180262',  # HERBALIFE LTD.
-    'TK': '0000911971',  # TEEKAY CORP LTD
-    'GDLC': '0001729997',  # Grayscale Digital Large Cap Fund LLC
-    'CRNC': '0001768267',  # Cerence Inc.
-    'HBT': '0000775215',  # HBT Financial, Inc.
-    'WOLF': '0000895419',  # WOLFSPEED, INC.
-    'ORRF': '0000826154',  # ORRSTOWN FINANCIAL SERVICES INC
-    'AXL': '0001062231',  # AMERICAN AXLE & MANUFACTURING HOLDINGS INC
-    'IRWD': '0001446847',  # IRONWOOD PHARMACEUTICALS INC
-    'HKHC': '0000088000',  # Horizon Kinetics Holding Corp
-    'SHEN': '0000354963',  # SHENANDOAH TELECOMMUNICATIONS CO/VA/
-    'ORC': '0001518621',  # Orchid Island Capital, Inc.
-    'HBNC': '0000706129',  # HORIZON BANCORP INC /IN/
-    'AMRK': '0001591588',  # A-Mark Precious Metals, Inc.
-    'NEXN': '0001849396',  # Nexxen International Ltd.
-    'JELD': '0001674335',  # JELD-WEN Holding, Inc.
-    'IMNM': '0001472012',  # Immunome Inc.
-    'ESQ': '0001531031',  # Esquire Financial Holdings, Inc.
-    'MAGN': '0000041719',  # Magnera Corp
-    'UFCS': '0000101199',  # UNITED FIRE GROUP INC
-    'OPY': '0000791963',  # OPPENHEIMER HOLDINGS INC
-    'HUYA': '0001728190',  # HUYA Inc.
-    'VMO': '0000884152',  # Invesco Municipal Opportunity Trust
-    'ABL': '0001814287',  # Abacus Life, Inc.
-    'OFIX': '0000884624',  # Orthofix Medical Inc.
-    'NIPG': '0001966233',  # NIP Group Inc.
-    'SSYS': '0001517396',  # STRATASYS LTD.
-    'CCD': '0001602584',  # Calamos Dynamic Convertible & Income Fund
-    'CGEM': '0001789972',  # Cullinan Therapeutics, Inc.
-    'LENZ': '0001815776',  # LENZ Therapeutics, Inc.
-    'HAFC': '0001109242',  # HANMI FINANCIAL CORP
-    'USNA': '0000896264',  # USANA HEALTH SCIENCES INC
-    'SVA': '0001084201',  # SINOVAC BIOTECH LTD
-    'SMP': '0000093389',  # STANDARD MOTOR PRODUCTS, INC.
-    'ARMN': '0001964504',  # Aris Mining Corp
-    'PGY': '0001883085',  # Pagaya Technologies Ltd.
-    'EZPW': '0000876523',  # EZCORP INC
-    'EVER': '0001640428',  # EverQuote, Inc.
-    'LIND': '0001512499',  # LINDBLAD EXPEDITIONS HOLDINGS, INC.
-    'AMPS': '0001828723',  # Altus Power, Inc.
-    'BOE': '0001320375',  # BlackRock Enhanced Global Dividend Trust
-    'MEGI': '0001855066',  # NYLI CBRE Global Infrastructure Megatrends Term Fund
-    'HBIA': '0000732417',  # HILLS BANCORPORATION
-    'GLAD': '0001143513',  # GLADSTONE CAPITAL CORP
-    'MYTE': '0001831907',  # MYT Netherlands Parent B.V.
-    'WRLD': '0000108385',  # WORLD ACCEPTANCE CORP
-    'EOLS': '0001570562',  # Evolus, Inc.
-    'CGNT': '0001824814',  # Cognyte Software Ltd.
-    'ITRN': '0001337117',  # Ituran Location & Control Ltd.
-    'AUTL': '0001730463',  # Autolus Therapeutics plc
-    'MCB': '0001476034',  # Metropolitan Bank Holding Corp.
-    'MCS': '0000062234',  # MARCUS CORP
-    'EVOH': '0001700844',  # EvoAir Holdings Inc.
-    'NPKI': '0000071829',  # NPK International Inc.
-    'YALA': '0001794350',  # Yalla Group Ltd
-    'EU': '0001500881',  # enCore Energy Corp.
-    'ABUS': '0001447028',  # Arbutus Biopharma Corp
-    'CRGX': '0001966494',  # CARGO Therapeutics, Inc.
-    'RUPRF': '0001010000',  # RUPERT RESOURCES LTD
-    'ETJ': '0001395325',  # Eaton Vance Risk-Managed Diversified Equity Income Fund
-    'EVTL': '0001867102',  # Vertical Aerospace Ltd.
-    'PDT': '0000855886',  # JOHN HANCOCK PREMIUM DIVIDEND FUND
-    'IMXI': '0001683695',  # International Money Express, Inc.
-    'PTLO': '0001871509',  # Portillo's Inc.
-    'VEL': '0001692376',  # Velocity Financial, Inc.
-    'STRW': '0001782430',  # Strawberry Fields REIT, Inc.
-    'FAX': '0000790500',  # ABRDN ASIA-PACIFIC INCOME FUND, INC.
-    'GNK': '0001326200',  # GENCO SHIPPING & TRADING LTD
-    'HNOI': '0001342916',  # HNO International, Inc.
-    'LPRO': '0001806201',  # Open Lending Corp
-    'GGN': '0001313510',  # GAMCO Global Gold, Natural Resources & Income Trust
-    'NVTS': '0001821769',  # Navitas Semiconductor Corp
-    'MHD': '0001034665',  # BLACKROCK MUNIHOLDINGS FUND, INC.
-    'CNDT': '0001677703',  # CONDUENT Inc
-    'FSBC': '0001275168',  # FIVE STAR BANCORP
-    'PACB': '0001299130',  # PACIFIC BIOSCIENCES OF CALIFORNIA, INC.
-    'THRY': '0001556739',  # Thryv Holdings, Inc.
-    'GPRE': '0001309402',  # Green Plains Inc.
-    'BVS': '0001665988',  # Bioventus Inc.
-    'BYRN': '0001354866',  # Byrna Technologies Inc.
-    'CTLP': '0000896429',  # CANTALOUPE, INC.
-    'VHI': '0000059255',  # VALHI INC /DE/
-    'NDMO': '0001793129',  # Nuveen Dynamic Municipal Opportunities Fund
-    'IFN': '0000917100',  # INDIA FUND, INC.
-    'HZO': '0001057060',  # MARINEMAX INC
-    'DXYZ': '0001843974',  # Destiny Tech100 Inc.
-    'EMO': '0001517518',  # ClearBridge Energy Midstream Opportunity Fund Inc.
-    'CURV': '0001792781',  # Torrid Holdings Inc.
-    'NKX': '0001195738',  # NUVEEN CALIFORNIA AMT-FREE QUALITY MUNICIPAL INCOME FUND
-    'VINP': '0001826286',  # Vinci Partners Investments Ltd.
-    'VVR': '0001059386',  # Invesco Senior Income Trust
-    'NIKA': '0001145604',  # NIKA PHARMACEUTICALS, INC
-    'NAT': '0001000177',  # NORDIC AMERICAN TANKERS Ltd
-    'PLPC': '0000080035',  # PREFORMED LINE PRODUCTS CO
-    'ODC': '0000074046',  # Oil-Dri Corp of America
-    'RXT': '0001810019',  # Rackspace Technology, Inc.
-    'KIDS': '0001425450',  # ORTHOPEDIATRICS CORP
-    'KOP': '0001315257',  # Koppers Holdings Inc.
-    'LAB': '0001162194',  # STANDARD BIOTOOLS INC.
-    'KUBR': '0001081834',  # Kuber Resources Corp
-    'HIPO': '0001828105',  # Hippo Holdings Inc.
-    'EUBG': '0001171326',  # ENTREPRENEUR UNIVERSE BRIGHT GROUP
-    'SMBC': '0000916907',  # SOUTHERN MISSOURI BANCORP, INC.
-    'GRAL': '0001699031',  # GRAIL, Inc.
-    'TECX': '0001681087',  # Tectonic Therapeutic, Inc.
-    'HNST': '0001530979',  # Honest Company, Inc.
-    'NBR': '0001163739',  # NABORS INDUSTRIES LTD
-    'SPTN': '0000877422',  # SpartanNash Co
-    'SFIX': '0001576942',  # Stitch Fix, Inc.
-    'KROS': '0001664710',  # Keros Therapeutics, Inc.
-    'HUMA': '0001818382',  # Humacyte, Inc.
-    'CSV': '0001016281',  # CARRIAGE SERVICES INC
-    'MUJ': '0001053988',  # BLACKROCK MUNIHOLDINGS NEW JERSEY QUALITY FUND, INC.
-    'EIM': '0001176984',  # Eaton Vance Municipal Bond Fund
-    'LDP': '0001548717',  # Cohen & Steers Ltd Duration Preferred & Income Fund, Inc.
-    'CAPR': '0001133869',  # CAPRICOR THERAPEUTICS, INC.
-    'CCRN': '0001141103',  # CROSS COUNTRY HEALTHCARE INC
-    'MNTK': '0001826600',  # Montauk Renewables, Inc.
-    'NMCO': '0001774342',  # Nuveen Municipal Credit Opportunities Fund
-    'OUST': '0001816581',  # Ouster, Inc.
-    'CION': '0001534254',  # CION Investment Corp
-    'ZKH': '0001862044',  # ZKH Group Ltd
-    'RGR': '0000095029',  # STURM RUGER & CO INC
-    'RERE': '0001838957',  # ATRenew Inc.
-    'TRST': '0000357301',  # TRUSTCO BANK CORP N Y
-    'ACIC': '0001401521',  # AMERICAN COASTAL INSURANCE Corp
-    'VZLA': '0001796073',  # Vizsla Silver Corp.
-    'ZJK': '0001941506',  # ZJK Industrial Co., Ltd.
-    'SIBN': '0001459839',  # SI-BONE, Inc.
-    'KULR': '0001662684',  # KULR Technology Group, Inc.
-    'SKYT': '0001819974',  # SkyWater Technology, Inc
-    'DNA': '0001830214',  # Ginkgo Bioworks Holdings, Inc.
-    'WEST': '0001806347',  # Westrock Coffee Co
-    'ALTI': '0001838615',  # AlTi Global, Inc.
-    'CTO': '0000023795',  # CTO Realty Growth, Inc.
-    'NCMI': '0001377630',  # National CineMedia, Inc.
-    'RYI': '0001481582',  # Ryerson Holding Corp
-    'MTUS': '0001598428',  # Metallus Inc.
-    'ORIC': '0001796280',  # Oric Pharmaceuticals, Inc.
-    'CCBG': '0000726601',  # CAPITAL CITY BANK GROUP INC
-    'MOFG': '0001412665',  # MidWestOne Financial Group, Inc.
-    'PEO': '0000216851',  # ADAMS NATURAL RESOURCES FUND, INC.
-    'BIT': '0001562818',  # BlackRock Multi-Sector Income Trust
-    'BBW': '0001113809',  # BUILD-A-BEAR WORKSHOP INC
-    'GPRK': '0001464591',  # GeoPark Ltd
-    'TEN': '0001166663',  # TSAKOS ENERGY NAVIGATION LTD
-    'WASH': '0000737468',  # WASHINGTON TRUST BANCORP INC
-    'SLP': '0001023459',  # Simulations Plus, Inc.
-    'CLMB': '0000945983',  # Climb Global Solutions, Inc.
-    'OPAL': '0001842279',  # OPAL Fuels Inc.
-    'EMD': '0001227862',  # WESTERN ASSET EMERGING MARKETS DEBT FUND INC.
-    'MGIC': '0000876779',  # MAGIC SOFTWARE ENTERPRISES LTD
-    'RZLV': '0001920294',  # REZOLVE AI Ltd
-    'ATRO': '0000008063',  # ASTRONICS CORP
-    'FLGT': '0001674930',  # Fulgent Genetics, Inc.
-    'QDMI': '0001094032',  # QDM International Inc.
-    'ASC': '0001577437',  # Ardmore Shipping Corp
-    'FPI': '0001591670',  # Farmland Partners Inc.
-    'KRT': '0001758021',  # Karat Packaging Inc.
-    'KURA': '0001422143',  # Kura Oncology, Inc.
-    'IIM': '0000885601',  # Invesco Value Municipal Income Trust
-    'CAN': '0001780652',  # Canaan Inc.
-    'GFR': '0001966287',  # Greenfire Resources Ltd.
-    'ACCD': '0001481646',  # Accolade, Inc.
-    'EYPT': '0001314102',  # EyePoint Pharmaceuticals, Inc.
-    'INV': '0002001557',  # Innventure, Inc.
-    'MMU': '0000886043',  # WESTERN ASSET MANAGED MUNICIPALS FUND INC.
-    'VREX': '0001681622',  # Varex Imaging Corp
-    'LAES': '0001951222',  # SEALSQ Corp
-    'HTBI': '0001538263',  # HomeTrust Bancshares, Inc.
-    'NOA': '0001368519',  # North American Construction Group Ltd.
-    'BHK': '0001160864',  # BLACKROCK CORE BOND TRUST
-    'SRDX': '0000924717',  # SURMODICS INC
-    'FLX': '0001858724',  # BingEx Ltd
-    'ORKA': '0000907654',  # Oruka Therapeutics, Inc.
-    'TRDA': '0001689375',  # Entrada Therapeutics, Inc.
-    'FRPH': '0000844059',  # FRP HOLDINGS, INC.
-    'NOTR': '0001784440',  # Nowtransit Inc
-    'GEVO': '0001392380',  # Gevo, Inc.
-    'LYTS': '0000763532',  # LSI INDUSTRIES INC
-    'LEGH': '0001436208',  # Legacy Housing Corp
-    'PBT': '0000319654',  # PERMIAN BASIN ROYALTY TRUST
-    'BGB': '0001546429',  # Blackstone Strategic Credit 2027 Term Fund
-    'FPH': '0001574197',  # Five Point Holdings, LLC
-    'DOGZ': '0001707303',  # Dogness (International) Corp
-    'DIAX': '0001608742',  # Nuveen Dow 30sm Dynamic Overwrite Fund
-    'PLOW': '0001287213',  # DOUGLAS DYNAMICS, INC
-    'RAPP': '0002012593',  # Rapport Therapeutics, Inc.
-    'OPT': '0001815620',  # Opthea Ltd
-    'VGM': '0000880892',  # Invesco Trust for Investment Grade Municipals
-    'FCCN': '0001131903',  # SPECTRAL CAPITAL Corp
-    'LDI': '0001831631',  # loanDepot, Inc.
-    'PML': '0001170299',  # PIMCO MUNICIPAL INCOME FUND II
-    'EBS': '0001367644',  # Emergent BioSolutions Inc.
-    'UVE': '0000891166',  # UNIVERSAL INSURANCE HOLDINGS, INC.
-    'LZM': '0001958217',  # Lifezone Metals Ltd
-    'LASR': '0001124796',  # NLIGHT, INC.
-    'OLP': '0000712770',  # ONE LIBERTY PROPERTIES INC
-    'HTBK': '0001053352',  # HERITAGE COMMERCE CORP
-    'MREO': '0001719714',  # Mereo BioPharma Group plc
-    'ELTP': '0001053369',  # ELITE PHARMACEUTICALS INC /NV/
-    'VKQ': '0000877463',  # Invesco Municipal Trust
-    'CMTG': '0001666291',  # Claros Mortgage Trust, Inc.
-    'SBC': '0001930313',  # SBC Medical Group Holdings Inc
-    'STK': '0001471420',  # Columbia Seligman Premium Technology Growth Fund, Inc.
-    'ATEX': '0001304492',  # Anterix Inc.
-    'VCV': '0000895531',  # Invesco California Value Municipal Income Trust
-    'CASS': '0000708781',  # CASS INFORMATION SYSTEMS INC
-    'CHCT': '0001631569',  # Community Healthcare Trust Inc
-    'SPFI': '0001163668',  # SOUTH PLAINS FINANCIAL, INC.
-    'FTHY': '0001810523',  # FIRST TRUST HIGH YIELD OPPORTUNITIES 2027 TERM FUND
-    'SCHL': '0000866729',  # SCHOLASTIC CORP
-    'LXU': '0000060714',  # LSB INDUSTRIES, INC.
-    'GHY': '0001554697',  # PGIM Global High Yield Fund, Inc.
-    'BME': '0001314966',  # BlackRock Health Sciences Trust
-    'BLDP': '0001453015',  # Ballard Power Systems Inc.
-    'AUNA': '0001799207',  # AUNA S.A.
-    'EBF': '0000033002',  # ENNIS, INC.
-    'OMER': '0001285819',  # OMEROS CORP
-    'BUI': '0001528988',  # BlackRock Utilities, Infrastructure & Power Opportunities Trust
-    'AHG': '0001702318',  # Akso Health Group
-    'MPB': '0000879635',  # MID PENN BANCORP INC
-    'DDI': '0001799567',  # DoubleDown Interactive Co., Ltd.
-    'TBLD': '0001820378',  # Thornburg Income Builder Opportunities Trust
-    'MATV': '0001000623',  # Mativ Holdings, Inc.
-    'CRD-A': '0000025475',  # CRAWFORD & CO
-    'PACK': '0001712463',  # Ranpak Holdings Corp.
-    'AVK': '0001219120',  # ADVENT CONVERTIBLE & INCOME FUND
-    'BGY': '0001393299',  # BlackRock Enhanced International Dividend Trust
-    'GOTU': '0001768259',  # Gaotu Techedu Inc.
-    'NNDM': '0001643303',  # Nano Dimension Ltd.
-    'AMBC': '0000874501',  # AMBAC FINANCIAL GROUP INC
-    'NYMT': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'SLSR': '0002019103',  # Solaris Resources Inc.
-    'PGC': '0001050743',  # PEAPACK GLADSTONE FINANCIAL CORP
-    'IQI': '0000885125',  # Invesco Quality Municipal Income Trust
-    'RSVR': '0001824403',  # Reservoir Media, Inc.
-    'GMRE': '0001533615',  # Global Medical REIT Inc.
-    'TTI': '0000844965',  # TETRA TECHNOLOGIES INC
-    'BGS': '0001278027',  # B&G Foods, Inc.
-    'ANNX': '0001528115',  # Annexon, Inc.
-    'BTBT': '0001710350',  # Bit Digital, Inc
-    'THFF': '0000714562',  # FIRST FINANCIAL CORP /IN/
-    'XERS': '0001867096',  # Xeris Biopharma Holdings, Inc.
-    'DSU': '0001051003',  # BLACKROCK DEBT STRATEGIES FUND, INC.
-    'BLW': '0001233681',  # BLACKROCK Ltd DURATION INCOME TRUST
-    'CMP': '0001227654',  # COMPASS MINERALS INTERNATIONAL INC
-    'HKD': '0001809691',  # AMTD Digital Inc.
-    'TRML': '0001827506',  # Tourmaline Bio, Inc.
-    'NML': '0001562051',  # Neuberger Berman Energy Infrastructure & Income Fund Inc.
-    'HNRG': '0000788965',  # HALLADOR ENERGY CO
-    'WIW': '0001267902',  # WESTERN ASSET INFLATION-LINKED OPPORTUNITIES & INCOME FUND
-    'ASGI': '0001793855',  # abrdn Global Infrastructure Income Fund
-    'DHC': '0001075415',  # DIVERSIFIED HEALTHCARE TRUST
-    'SENEA': '0000088948',  # Seneca Foods Corp
-    'WLDN': '0001370450',  # Willdan Group, Inc.
-    'FISI': '0000862831',  # FINANCIAL INSTITUTIONS INC
-    'INNV': '0001834376',  # InnovAge Holding Corp.
-    'PSBD': '0001794776',  # Palmer Square Capital BDC Inc.
-    'MNMD': '0001813814',  # Mind Medicine (MindMed) Inc.
-    'BLE': '0001176194',  # BLACKROCK MUNICIPAL INCOME TRUST II
-    'KODK': '0000031235',  # EASTMAN KODAK CO
-    'RYAM': '0001597672',  # RAYONIER ADVANCED MATERIALS INC.
-    'QD': '0001692705',  # Qudian Inc.
-    'GUG': '0001864208',  # Guggenheim Active Allocation Fund
-    'NXJ': '0001087786',  # NUVEEN NEW JERSEY QUALITY MUNICIPAL INCOME FUND
-    'SMBK': '0001038773',  # SMARTFINANCIAL INC.
-    'CHPT': '0001777393',  # ChargePoint Holdings, Inc.
-    'HONE': '0001769617',  # HarborOne Bancorp, Inc.
-    'TALK': '0001803901',  # Talkspace, Inc.
-    'ALT': '0001326190',  # Altimmune, Inc.
-    'ANGO': '0001275187',  # ANGIODYNAMICS INC
-    'RMT': '0000912147',  # ROYCE MICRO-CAP TRUST, INC.
-    'SNDL': '0001766600',  # SNDL Inc.
-    'CLFD': '0000796505',  # Clearfield, Inc.
-    'EVLV': '0001805385',  # Evolv Technologies Holdings, Inc.
-    'ARCT': '0001768224',  # Arcturus Therapeutics Holdings Inc.
-    'GRPN': '0001490281',  # Groupon, Inc.
-    'SHBI': '0001035092',  # SHORE BANCSHARES INC
-    'GBLI': '0001494904',  # Global Indemnity Group, LLC
-    'AEHR': '0001040470',  # AEHR TEST SYSTEMS
-    'DH': '0001861795',  # Definitive Healthcare Corp.
-    'CANG': '0001725123',  # Cango Inc.
-    'UHT': '0000798783',  # UNIVERSAL HEALTH REALTY INCOME TRUST
-    'GAMB': '0001839799',  # Gambling.com Group Ltd
-    'CCNE': '0000736772',  # CNB FINANCIAL CORP/PA
-    'AGS': '0001593548',  # PlayAGS, Inc.
-    'TREE': '0001434621',  # LendingTree, Inc.
-    'RICK': '0000935419',  # RCI HOSPITALITY HOLDINGS, INC.
-    'FMNB': '0000709337',  # FARMERS NATIONAL BANC CORP /OH/
-    'MSBI': '0001466026',  # Midland States Bancorp, Inc.
-    'DGICA': '0000800457',  # DONEGAL GROUP INC
-    'GDOT': '0001386278',  # GREEN DOT CORP
-    'FFIC': '0000923139',  # FLUSHING FINANCIAL CORP
-    'BCAL': '0001795815',  # California BanCorp \ CA
-    'MYD': '0000879361',  # BLACKROCK MUNIYIELD FUND, INC.
-    'SVRA': '0001160308',  # Savara Inc
-    'CYRB': '0001851048',  # Cyber App Solutions Corp.
-    'KELYA': '0000055135',  # KELLY SERVICES INC
-    'FARO': '0000917491',  # FARO TECHNOLOGIES INC
-    'CLW': '0001441236',  # Clearwater Paper Corp
-    'BIGC': '0001626450',  # BigCommerce Holdings, Inc.
-    'PHAT': '0001783183',  # Phathom Pharmaceuticals, Inc.
-    'SMLR': '0001554859',  # Semler Scientific, Inc.
-    'GLRE': '0001385613',  # GREENLIGHT CAPITAL RE, LTD.
-    'MGTX': '0001735438',  # MeiraGTx Holdings plc
-    'STOK': '0001623526',  # Stoke Therapeutics, Inc.
-    'METC': '0001687187',  # Ramaco Resources, Inc.
-    'LVRO': '0001945711',  # Lavoro Ltd
-    'TYG': '0001268533',  # TORTOISE ENERGY INFRASTRUCTURE CORP
-    'HPS': '0001215913',  # JOHN HANCOCK PREFERRED INCOME FUND III
-    'NNOX': '0001795251',  # Nano-X Imaging Ltd.
-    'IVR': '0001437071',  # Invesco Mortgage Capital Inc.
-    'RDVT': '0001720116',  # Red Violet, Inc.
-    'FRA': '0001259708',  # BLACKROCK FLOATING RATE INCOME STRATEGIES FUND, INC.
-    'SES': '0001819142',  # SES AI Corp
-    'ALRS': '0000903419',  # ALERUS FINANCIAL CORP
-    'MLYS': '0001933414',  # Mineralys Therapeutics, Inc.
-    'ACCO': '0000712034',  # ACCO BRANDS Corp
-    'GAIN': '0001321741',  # GLADSTONE INVESTMENT CORPORATION\DE
-    'CPAC': '0001221029',  # CEMENTOS PACASMAYO SAA
-    'EGY': '0000894627',  # VAALCO ENERGY INC /DE/
-    'PFIS': '0001056943',  # PEOPLES FINANCIAL SERVICES CORP.
-    'IIIN': '0000764401',  # INSTEEL INDUSTRIES INC
-    'FFWM': '0001413837',  # First Foundation Inc.
-    'PNNT': '0001383414',  # PENNANTPARK INVESTMENT CORP
-    'JMIA': '0001756708',  # Jumia Technologies AG
-    'LAAC': '0001440972',  # Lithium Americas (Argentina) Corp.
-    'VERV': '0001840574',  # Verve Therapeutics, Inc.
-    'MITK': '0000807863',  # MITEK SYSTEMS INC
-    'VLGEA': '0000103595',  # VILLAGE SUPER MARKET INC
-    'EBTC': '0001018399',  # ENTERPRISE BANCORP INC /MA/
-    'ISD': '0001534880',  # PGIM High Yield Bond Fund, Inc.
-    'PSNL': '0001527753',  # Personalis, Inc.
-    'GCO': '0000018498',  # GENESCO INC
-    'XFLT': '0001703079',  # XAI Octagon Floating Rate & Alternative Income Trust
-    'MXCT': '0001287098',  # MAXCYTE, INC.
-    'NFBK': '0001493225',  # Northfield Bancorp, Inc.
-    'CGBS': '0001991946',  # Crown LNG Holdings Ltd
-    'VALU': '0000717720',  # VALUE LINE INC
-    'CLCO': '0001944057',  # Cool Co Ltd.
-    'PRCH': '0001784535',  # Porch Group, Inc.
-    'SD': '0001349436',  # SANDRIDGE ENERGY INC
-    'LINC': '0001286613',  # LINCOLN EDUCATIONAL SERVICES CORP
-    'CTV': '0001835378',  # Innovid Corp.
-    'TMCI': '0001630627',  # TREACE MEDICAL CONCEPTS, INC.
-    'CCSI': '0001866633',  # Consensus Cloud Solutions, Inc.
-    'AIRJ': '0001855474',  # AirJoule Technologies Corp.
-    'ESPR': '0001434868',  # Esperion Therapeutics, Inc.
-    'ANSC': '0001854149',  # Agriculture & Natural Solutions Acquisition Corp
-    'FLWS': '0001084869',  # 1 800 FLOWERS COM INC
-    'NPFD': '0001865389',  # Nuveen Variable Rate Preferred & Income Fund
-    'HAIN': '0000910406',  # HAIN CELESTIAL GROUP INC
-    'NBB': '0001478888',  # Nuveen Taxable Municipal Income Fund
-    'OBE': '0001334388',  # OBSIDIAN ENERGY LTD.
-    'GHM': '0000716314',  # GRAHAM CORP
-    'MBX': '0001776111',  # MBX Biosciences, Inc.
-    'AIP': '0001667011',  # Arteris, Inc.
-    'SCGY': '0001276531',  # SCIENTIFIC ENERGY, INC
-    'NWPX': '0001001385',  # NORTHWEST PIPE CO
-    'KE': '0001606757',  # Kimball Electronics, Inc.
-    'EQV': '0002021042',  # EQV Ventures Acquisition Corp.
-    'AAM': '0002012964',  # AA Mission Acquisition Corp.
-    'GLASF': '0001848731',  # Glass House Brands Inc.
-    'GCBC': '0001070524',  # GREENE COUNTY BANCORP INC
-    'HPI': '0001176199',  # JOHN HANCOCK PREFERRED INCOME FUND
-    'MUX': '0000314203',  # McEwen Mining Inc.
-    'CBNK': '0001419536',  # Capital Bancorp Inc
-    'MVF': '0000835948',  # BLACKROCK MUNIVEST FUND, INC.
-    'DDD': '0000910638',  # 3D SYSTEMS CORP
-    'CLDT': '0001476045',  # Chatham Lodging Trust
-    'BHB': '0000743367',  # BAR HARBOR BANKSHARES
-    'BAND': '0001514416',  # Bandwidth Inc.
-    'VBNK': '0001690639',  # VersaBank
-    'GHRS': '0001855129',  # GH Research PLC
-    'ALLO': '0001737287',  # Allogene Therapeutics, Inc.
-    'YORW': '0000108985',  # YORK WATER CO
-    'SIGA': '0001010086',  # SIGA TECHNOLOGIES INC
-    'ETB': '0001308927',  # Eaton Vance Tax-Managed Buy-Write Income Fund
-    'KMDA': '0001567529',  # KAMADA LTD
-    'FUSE': '0002033383',  # CSLM Holdings Inc.
-    'UIS': '0000746838',  # UNISYS CORP
-    'SWBI': '0001092796',  # SMITH & WESSON BRANDS, INC.
-    'WDH': '0001823986',  # Waterdrop Inc.
-    'URGN': '0001668243',  # UroGen Pharma Ltd.
-    'BFK': '0001137393',  # BLACKROCK MUNICIPAL INCOME TRUST
-    'DBO': '0001383058',  # Invesco DB Oil Fund
-    'THW': '0001635977',  # abrdn World Healthcare Fund
-    'RNAC': '0001453687',  # Cartesian Therapeutics, Inc.
-    'KOD': '0001468748',  # Kodiak Sciences Inc.
-    'TBPH': '0001583107',  # Theravance Biopharma, Inc.
-    'ZVRA': '0001434647',  # ZEVRA THERAPEUTICS, INC.
-    'NLOP': '0001952976',  # Net Lease Office Properties
-    'CELC': '0001603454',  # Celcuity Inc.
-    'CHW': '0001396277',  # Calamos Global Dynamic Income Fund
-    'KRNY': '0001617242',  # Kearny Financial Corp.
-    'MTLS': '0001091223',  # MATERIALISE NV
-    'AROW': '0000717538',  # ARROW FINANCIAL CORP
-    'DPG': '0001515671',  # Duff & Phelps Utility & Infrastructure Fund Inc.
-    'TKNO': '0001850902',  # Alpha Teknova, Inc.
-    'ATXS': '0001454789',  # Astria Therapeutics, Inc.
-    'SVC': '0000945394',  # Service Properties Trust
-    'ANAB': '0001370053',  # ANAPTYSBIO, INC
-    'NOVA': '0001772695',  # Sunnova Energy International Inc.
-    'BOC': '0001494582',  # BOSTON OMAHA Corp
-    'TWFG': '0002007596',  # TWFG, Inc.
-    'URG': '0001375205',  # UR-ENERGY INC
-    'GRVY': '0001313310',  # GRAVITY Co., Ltd.
-    'TERN': '0001831363',  # Terns Pharmaceuticals, Inc.
-    'MERC': '0001333274',  # MERCER INTERNATIONAL INC.
-    'HCAT': '0001636422',  # Health Catalyst, Inc.
-    'MOV': '0000072573',  # MOVADO GROUP INC
-    'TWI': '0000899751',  # TITAN INTERNATIONAL INC
-    'QSI': '0001816431',  # Quantum-Si Inc
-    'VRNOF': '0001848416',  # Verano Holdings Corp.
-    'TCBX': '0001781730',  # Third Coast Bancshares, Inc.
-    'ABVX': '0001956827',  # Abivax S.A.
-    'CYRX': '0001124524',  # Cryoport, Inc.
-    'FC': '0000886206',  # FRANKLIN COVEY CO
-    'IGD': '0001285890',  # Voya GLOBAL EQUITY DIVIDEND & PREMIUM OPPORTUNITY FUND
-    'BWMN': '0001847590',  # Bowman Consulting Group Ltd.
-    'SPMC': '0001930147',  # Sound Point Meridian Capital, Inc.
-    'XPER': '0001788999',  # Xperi Inc.
-    'ASA': '0001230869',  # ASA Gold & Precious Metals Ltd
-    'OABI': '0001846253',  # OmniAb, Inc.
-    'MUA': '0000901243',  # BLACKROCK MUNIASSETS FUND, INC.
-    'NQP': '0000870780',  # NUVEEN PENNSYLVANIA QUALITY MUNICIPAL INCOME FUND
-    'LMNR': '0001342423',  # Limoneira CO
-    'PRTC': '0001782999',  # PureTech Health plc
-    'USAP': '0000931584',  # UNIVERSAL STAINLESS & ALLOY PRODUCTS INC
-    'DCGO': '0001822359',  # DocGo Inc.
-    'EAF': '0000931148',  # GRAFTECH INTERNATIONAL LTD
-    'JILL': '0001687932',  # J.Jill, Inc.
-    'CVGW': '0001133470',  # CALAVO GROWERS INC
-    'BACQ': '0002028707',  # Bleichroeder Acquisition Corp. I
-    'TCMD': '0001027838',  # TACTILE SYSTEMS TECHNOLOGY INC
-    'LESL': '0001821806',  # Leslie's, Inc.
-    'AMPX': '0001899287',  # Amprius Technologies, Inc.
-    'CYH': '0001108109',  # COMMUNITY HEALTH SYSTEMS INC
-    'CRNT': '0001119769',  # CERAGON NETWORKS LTD
-    'FLYX': '0001843973',  # FLYEXCLUSIVE INC.
-    'EAD': '0001210123',  # ALLSPRING INCOME OPPORTUNITIES FUND
-    'ETO': '0001281926',  # Eaton Vance Tax-Advantaged Global Dividend Opportunities Fund
-    'NETD': '0001975218',  # Nabors Energy Transition Corp. II
-    'GUT': '0001080720',  # GABELLI UTILITY TRUST
-    'LSAK': '0001041514',  # LESAKA TECHNOLOGIES INC
-    'ACTG': '0000934549',  # ACACIA RESEARCH CORP
-    'DFP': '0001559991',  # Flaherty & Crumrine Dynamic Preferred & Income Fund Inc
-    'MCI': '0000275694',  # BARINGS CORPORATE INVESTORS
-    'TRC': '0000096869',  # TEJON RANCH CO
-    'LOVE': '0001701758',  # Lovesac Co
-    'YRD': '0001631761',  # Yiren Digital Ltd.
-    'PERI': '0001338940',  # Perion Network Ltd.
-    'CLPT': '0001285550',  # ClearPoint Neuro, Inc.
-    'FFA': '0001291334',  # FIRST TRUST ENHANCED EQUITY INCOME FUND
-    'RWAY': '0001653384',  # Runway Growth Finance Corp.
-    'DIN': '0000049754',  # Dine Brands Global, Inc.
-    'ITIC': '0000720858',  # INVESTORS TITLE CO
-    'CDXC': '0001386570',  # ChromaDex Corp.
-    'GNE': '0001528356',  # Genie Energy Ltd.
-    'AENT': '0001823584',  # ALLIANCE ENTERTAINMENT HOLDING CORP
-    'CWCO': '0000928340',  # Consolidated Water Co. Ltd.
-    'BWMX': '0001788257',  # BETTERWARE DE MEXICO, S.A.P.I. DE C.V
-    'CDZI': '0000727273',  # CADIZ INC
-    'SMC': '0002024218',  # Summit Midstream Corp
-    'LE': '0000799288',  # LANDS' END, INC.
-    'SNDA': '0001043000',  # SONIDA SENIOR LIVING, INC.
-    'SDHY': '0001812923',  # PGIM Short Duration High Yield Opportunities Fund
-    'IPXX': '0001970622',  # Inflection Point Acquisition Corp. II
-    'UNTY': '0000920427',  # UNITY BANCORP INC /NJ/
-    'NMAI': '0001861115',  # Nuveen Multi-Asset Income Fund
-    'INRE': '0001528985',  # Inland Real Estate Income Trust, Inc.
-    'EVN': '0001074540',  # EATON VANCE MUNICIPAL INCOME TRUST
-    'BIOX': '0001769484',  # Bioceres Crop Solutions Corp.
-    'NRC': '0000070487',  # NATIONAL RESEARCH CORP
-    'BSVN': '0001746129',  # Bank7 Corp.
-    'DHIL': '0000909108',  # DIAMOND HILL INVESTMENT GROUP INC
-    'MYE': '0000069488',  # MYERS INDUSTRIES INC
-    'BSRR': '0001130144',  # SIERRA BANCORP
-    'BBCP': '0001703956',  # Concrete Pumping Holdings, Inc.
-    'ALNT': '0000046129',  # ALLIENT INC
-    'HIVE': '0001720424',  # HIVE Digital Technologies Ltd.
-    'SOHU': '0001734107',  # Sohu.com Ltd
-    'MEI': '0000065270',  # METHODE ELECTRONICS INC
-    'OFLX': '0001317945',  # Omega Flex, Inc.
-    'SGU': '0001002590',  # STAR GROUP, L.P.
-    'AMCX': '0001514991',  # AMC Networks Inc.
-    'NRIM': '0001163370',  # NORTHRIM BANCORP INC
-    'OTLY': '0001843586',  # Oatly Group AB
-    'EHAB': '0001803737',  # Enhabit, Inc.
-    'ILLR': '0001769624',  # Triller Group Inc.
-    'NFGC': '0001840616',  # New Found Gold Corp.
-    'DCTH': '0000872912',  # DELCATH SYSTEMS, INC.
-    'HYLN': '0001759631',  # Hyliion Holdings Corp.
-    'MYN': '0000882150',  # BLACKROCK MUNIYIELD NEW YORK QUALITY FUND, INC.
-    'GBAB': '0001495825',  # Guggenheim Taxable Municipal Bond & Investment Grade Debt Trust
-    'KALV': '0001348911',  # KalVista Pharmaceuticals, Inc.
-    'VKI': '0000908993',  # Invesco Advantage Municipal Income Trust II
-    'AKBA': '0001517022',  # Akebia Therapeutics, Inc.
-    'HIX': '0001058239',  # WESTERN ASSET HIGH INCOME FUND II INC.
-    'PRME': '0001894562',  # Prime Medicine, Inc.
-    'CCIX': '0002006291',  # Churchill Capital Corp IX/Cayman
-    'NVEC': '0000724910',  # NVE CORP /NEW/
-    'ORGO': '0001661181',  # Organogenesis Holdings Inc.
-    'WOW': '0001701051',  # WideOpenWest, Inc.
-    'POET': '0001437424',  # POET TECHNOLOGIES INC.
-    'EFR': '0001258623',  # Eaton Vance Senior Floating-Rate Trust
-    'TRAK': '0000050471',  # ReposiTrak, Inc.
-    'ALMS': '0001847367',  # ALUMIS INC.
-    'HPP': '0001482512',  # Hudson Pacific Properties, Inc.
-    'CYD': '0000932695',  # CHINA YUCHAI INTERNATIONAL LTD
-    'SENS': '0001616543',  # Senseonics Holdings, Inc.
-    'PKST': '0001600626',  # Peakstone Realty Trust
-    'AURA': '0001501796',  # Aura Biosciences, Inc.
-    'LEO': '0000818972',  # BNY MELLON STRATEGIC MUNICIPALS, INC.
-    'SB': '0001434754',  # SAFE BULKERS, INC.
-    'LGTY': '0000713425',  # LOGILITY SUPPLY CHAIN SOLUTIONS, INC
-    'MLP': '0000063330',  # MAUI LAND & PINEAPPLE CO INC
-    'LAND': '0001495240',  # GLADSTONE LAND Corp
-    'VENU': '0001770501',  # Venu Holding Corp
-    'VALN': '0001836564',  # Valneva SE
-    'CARE': '0001829576',  # Carter Bankshares, Inc.
-    'HQL': '0000884121',  # abrdn Life Sciences Investors
-    'RGNX': '0001590877',  # REGENXBIO Inc.
-    'ZIMV': '0001876588',  # ZimVie Inc.
-    'HIO': '0000910068',  # WESTERN ASSET HIGH INCOME OPPORTUNITY FUND INC.
-    'ARBE': '0001861841',  # Arbe Robotics Ltd.
-    'GNTY': '0001058867',  # GUARANTY BANCSHARES INC /TX/
-    'CADL': '0001841387',  # Candel Therapeutics, Inc.
-    'ENGN': '0001980845',  # enGene Holdings Inc.
-    'PSTL': '0001759774',  # Postal Realty Trust, Inc.
-    'CRMT': '0000799850',  # AMERICAS CARMART INC
-    'KTF': '0000839533',  # DWS MUNICIPAL INCOME TRUST
-    'JFIN': '0001743102',  # Jiayin Group Inc.
-    'SCM': '0001551901',  # Stellus Capital Investment Corp
-    'OLMA': '0001750284',  # Olema Pharmaceuticals, Inc.
-    'VCIC': '0002025396',  # Vine Hill Capital Investment Corp.
-    'TMC': '0001798562',  # TMC the metals Co Inc.
-    'GTN': '0000043196',  # GRAY TELEVISION INC
-    'KIO': '0001515940',  # KKR Income Opportunities Fund
-    'OOMA': '0001327688',  # OOMA INC
-    'THRD': '0001923840',  # Third Harmonic Bio, Inc.
-    'BRY': '0001705873',  # Berry Corp (bry)
-    'ALF': '0002010930',  # Centurion Acquisition Corp.
-    'NL': '0000072162',  # NL INDUSTRIES INC
-    'GPAT': '0001834526',  # GP-Act III Acquisition Corp.
-    'HRZN': '0001487428',  # Horizon Technology Finance Corp
-    'LND': '0001499849',  # BrasilAgro - Brazilian Agricultural Real Estate Co
-    'MBAV': '0002016072',  # M3-Brigade Acquisition V Corp.
-    'BARK': '0001819574',  # Bark, Inc.
-    'CGC': '0001737927',  # Canopy Growth Corp
-    'GILT': '0000897322',  # GILAT SATELLITE NETWORKS LTD
-    'CDXS': '0001200375',  # CODEXIS, INC.
-    'HFRO': '0001710680',  # HIGHLAND OPPORTUNITIES & INCOME FUND
-    'ZUMZ': '0001318008',  # Zumiez Inc
-    'TSHA': '0001806310',  # Taysha Gene Therapies, Inc.
-    'QTRX': '0001503274',  # Quanterix Corp
-    'NPCE': '0001528287',  # NeuroPace Inc
-    'BMRC': '0001403475',  # Bank of Marin Bancorp
-    'PNRG': '0000056868',  # PRIMEENERGY RESOURCES CORP
-    'WALD': '0001840199',  # Waldencast plc
-    'API': '0001802883',  # Agora, Inc.
-    'CNL': '0001953575',  # Collective Mining Ltd.
-    'SHYF': '0000743238',  # SHYFT GROUP, INC.
-    'HPF': '0001189740',  # JOHN HANCOCK PREFERRED INCOME FUND II
-    'NMRA': '0001885522',  # Neumora Therapeutics, Inc.
-    'FBIZ': '0001521951',  # FIRST BUSINESS FINANCIAL SERVICES, INC.
-    'HVT': '0000216085',  # HAVERTY FURNITURE COMPANIES INC
-    'RNGR': '0001699039',  # Ranger Energy Services, Inc.
-    'PAMT': '0000798287',  # PAMT CORP
-    'NWBO': '0001072379',  # NORTHWEST BIOTHERAPEUTICS INC
-    'MSB': '0000065172',  # MESABI TRUST
-    'SOR': '0000091847',  # SOURCE CAPITAL INC /DE/
-    'NYXH': '0001857190',  # Nyxoah SA
-    'PANL': '0001606909',  # Pangaea Logistics Solutions Ltd.
-    'XYF': '0001725033',  # X Financial
-    'FOF': '0001375340',  # Cohen & Steers Closed-End Opportunity Fund, Inc.
-    'AIRS': '0001870940',  # Airsculpt Technologies, Inc.
-    'MFH': '0001527762',  # Mercurity Fintech Holding Inc.
-    'NAN': '0001074769',  # NUVEEN NEW YORK QUALITY MUNICIPAL INCOME FUND
-    'GLUE': '0001826457',  # Monte Rosa Therapeutics, Inc.
-    'EWCZ': '0001856236',  # European Wax Center, Inc.
-    'PFL': '0001244183',  # PIMCO INCOME STRATEGY FUND
-    'SAR': '0001377936',  # SARATOGA INVESTMENT CORP.
-    'BGR': '0001306550',  # BlackRock Energy & Resources Trust
-    'NLCP': '0001854964',  # NewLake Capital Partners, Inc.
-    'APEI': '0001201792',  # AMERICAN PUBLIC EDUCATION INC
-    'ARDC': '0001515324',  # Ares Dynamic Credit Allocation Fund, Inc.
-    'TBCH': '0001493761',  # Turtle Beach Corp
-    'PGEN': '0001356090',  # PRECIGEN, INC.
-    'RVNC': '0001479290',  # Revance Therapeutics, Inc.
-    'ETON': '0001710340',  # Eton Pharmaceuticals, Inc.
-    'CVRX': '0001235912',  # CVRx, Inc.
-    'BWB': '0001341317',  # Bridgewater Bancshares Inc
-    'EFT': '0001288992',  # Eaton Vance Floating-Rate Income Trust
-    'FMAO': '0000792966',  # FARMERS & MERCHANTS BANCORP INC
-    'TRVI': '0001563880',  # Trevi Therapeutics, Inc.
-    'CRVS': '0001626971',  # Corvus Pharmaceuticals, Inc.
-    'HLLY': '0001822928',  # Holley Inc.
-    'JOUT': '0000788329',  # JOHNSON OUTDOORS INC
-    'SEG': '0002009684',  # Seaport Entertainment Group Inc.
-    'CTNM': '0001855175',  # Contineum Therapeutics, Inc.
-    'ASG': '0000786035',  # LIBERTY ALL STAR GROWTH FUND INC.
-    'ZEUS': '0000917470',  # OLYMPIC STEEL INC
-    'PPT': '0000827773',  # PUTNAM PREMIER INCOME TRUST
-    'HBCP': '0001436425',  # HOME BANCORP, INC.
-    'EGHT': '0001023731',  # 8X8 INC /DE/
-    'BFZ': '0001137391',  # BLACKROCK CALIFORNIA MUNICIPAL INCOME TRUST
-    'ASLE': '0001754170',  # AerSale Corp
-    'VLN': '0001863006',  # Valens Semiconductor Ltd.
-    'WTBA': '0001166928',  # WEST BANCORPORATION INC
-    'NREF': '0001786248',  # NexPoint Real Estate Finance, Inc.
-    'SAGE': '0001597553',  # Sage Therapeutics, Inc.
-    'ZBIO': '0001953926',  # Zenas BioPharma, Inc.
-    'SNBR': '0000827187',  # Sleep Number Corp
-    'ABSI': '0001672688',  # Absci Corp
-    'RRBI': '0001071236',  # RED RIVER BANCSHARES INC
-    'LWAY': '0000814586',  # Lifeway Foods, Inc.
-    'GIG': '0002023730',  # GigCapital7 Corp.
-    'CWBC': '0001127371',  # Community West Bancshares
-    'HRTG': '0001598665',  # Heritage Insurance Holdings, Inc.
-    'RBB': '0001499422',  # RBB Bancorp
-    'RFMZ': '0001817159',  # RiverNorth Flexible Municipal Income Fund II, Inc.
-    'DOYU': '0001762417',  # DouYu International Holdings Ltd
-    'FREY': '0001992243',  # FREYR Battery, Inc. /DE/
-    'GOCO': '0001808220',  # GoHealth, Inc.
-    'JRI': '0001539337',  # Nuveen Real Asset Income & Growth Fund
-    'PMTS': '0001641614',  # CPI Card Group Inc.
-    'CVEO': '0001590584',  # Civeo Corp
-    'NGS': '0001084991',  # NATURAL GAS SERVICES GROUP INC
-    'PKOH': '0000076282',  # PARK OHIO HOLDINGS CORP
-    'MTRX': '0000866273',  # MATRIX SERVICE CO
-    'USCB': '0001901637',  # USCB FINANCIAL HOLDINGS, INC.
-    'LNZA': '0001843724',  # LanzaTech Global, Inc.
-    'MIY': '0000890393',  # BLACKROCK MUNIYIELD MICHIGAN QUALITY FUND, INC.
-    'WEYS': '0000106532',  # WEYCO GROUP INC
-    'LOCO': '0001606366',  # El Pollo Loco Holdings, Inc.
-    'FINS': '0001745059',  # Angel Oak Financial Strategies Income Term Trust
-    'NTPIF': '0000829365',  # NAM TAI PROPERTY INC.
-    'QUAD': '0001481792',  # Quad/Graphics, Inc.
-    'BRW': '0000826020',  # Saba Capital Income & Opportunities Fund
-    'KRRO': '0001703647',  # Korro Bio, Inc.
-    'ATOM': '0001420520',  # Atomera Inc
-    'OIS': '0001121484',  # OIL STATES INTERNATIONAL, INC
-    'LPA': '0001997711',  # Logistic Properties of the Americas
-    'LXFR': '0001096056',  # LUXFER HOLDINGS PLC
-    'GAU': '0001377757',  # Galiano Gold Inc.
-    'RMR': '0001644378',  # RMR GROUP INC.
-    'HOUS': '0001398987',  # Anywhere Real Estate Inc.
-    'DADA': '0001793862',  # Dada Nexus Ltd
-    'AWP': '0001390195',  # abrdn Global Premier Properties Fund
-    'NAK': '0001164771',  # NORTHERN DYNASTY MINERALS LTD
-    'CRLBF': '0001832928',  # Cresco Labs Inc.
-    'AMBI': '0001937441',  # Ambipar Emergency Response
-    'RM': '0001519401',  # Regional Management Corp.
-    'EB': '0001475115',  # Eventbrite, Inc.
-    'GDEV': '0001848739',  # GDEV Inc.
-    'IRBT': '0001159167',  # IROBOT CORP
-    'TBRG': '0001169445',  # TruBridge, Inc.
-    'VACH': '0002006815',  # Voyager Acquisition Corp./Cayman Islands
-    'BLZE': '0001462056',  # Backblaze, Inc.
-    'HYAC': '0001970509',  # Haymaker Acquisition Corp. 4
-    'BRT': '0000014846',  # BRT Apartments Corp.
-    'NEWT': '0001587987',  # NewtekOne, Inc.
-    'SPIR': '0001816017',  # Spire Global, Inc.
-    'ASPI': '0001921865',  # ASP Isotopes Inc.
-    'BDMD': '0001982444',  # Baird Medical Investment Holdings Ltd
-    'CCIR': '0001894176',  # Cohen Circle Acquisition Corp. I
-    'BGH': '0001521404',  # BARINGS GLOBAL SHORT DURATION HIGH YIELD FUND
-    'SPOK': '0001289945',  # Spok Holdings, Inc
-    'SSBK': '0001689731',  # Southern States Bancshares, Inc.
-    'MHN': '0001038186',  # BLACKROCK MUNIHOLDINGS NEW YORK QUALITY FUND, INC.
-    'TITN': '0001409171',  # Titan Machinery Inc.
-    'SLI': '0001537137',  # STANDARD LITHIUM LTD.
-    'ACNB': '0000715579',  # ACNB CORP
-    'NATH': '0000069733',  # NATHANS FAMOUS, INC.
-    'TNGX': '0001819133',  # Tango Therapeutics, Inc.
-    'XHG': '0001769256',  # XChange TEC.INC
-    'YMAB': '0001722964',  # Y-mAbs Therapeutics, Inc.
-    'KLTR': '0001432133',  # KALTURA INC
-    'UROY': '0001711570',  # Uranium Royalty Corp.
-    'SLDP': '0001844862',  # Solid Power, Inc.
-    'YSG': '0001819580',  # Yatsen Holding Ltd
-    'NUS': '0001021561',  # NU SKIN ENTERPRISES, INC.
-    'SPXX': '0001338561',  # Nuveen S&P 500 Dynamic Overwrite Fund
-    'CUB': '0002015955',  # Lionheart Holdings
-    'SMRT': '0001837014',  # SmartRent, Inc.
-    'NCV': '0001214935',  # Virtus Convertible & Income Fund
-    'RDUS': '0000912603',  # RADIUS RECYCLING, INC.
-    'BEAG': '0001852207',  # Bold Eagle Acquisition Corp.
-    'SIMA': '0002014982',  # SIM Acquisition Corp. I
-    'ACP': '0001503290',  # abrdn Income Credit Strategies Fund
-    'AFB': '0001162027',  # ALLIANCEBERNSTEIN NATIONAL MUNICIPAL INCOME FUND
-    'OB': '0001454938',  # Outbrain Inc.
-    'MBI': '0000814585',  # MBIA INC
-    'VMD': '0001729149',  # VIEMED HEALTHCARE, INC.
-    'ARTNA': '0000863110',  # ARTESIAN RESOURCES CORP
-    'MIN': '0000826735',  # MFS INTERMEDIATE INCOME TRUST
-    'NMG': '0001649752',  # Nouveau Monde Graphite Inc.
-    'TPVG': '0001580345',  # TriplePoint Venture Growth BDC Corp.
-    'CPZ': '0001717457',  # Calamos Long/Short Equity & Dynamic Income Trust
-    'GRO': '0001472326',  # Brazil Potash Corp.
-    'RFI': '0000891290',  # COHEN & STEERS TOTAL RETURN REALTY FUND INC
-    'JAKK': '0001009829',  # JAKKS PACIFIC INC
-    'MEC': '0001766368',  # Mayville Engineering Company, Inc.
-    'RMAX': '0001581091',  # RE/MAX Holdings, Inc.
-    'EIC': '0001754836',  # Eagle Point Income Co Inc.
-    'MPX': '0001129155',  # MARINE PRODUCTS CORP
-    'PDLB': '0001874071',  # Ponce Financial Group, Inc.
-    'NODK': '0001681206',  # NI Holdings, Inc.
-    'RLGT': '0001171155',  # RADIANT LOGISTICS, INC
-    'BNED': '0001634117',  # Barnes & Noble Education, Inc.
-    'NBH': '0001178839',  # NEUBERGER BERMAN MUNICIPAL FUND INC.
-    'FSBW': '0001530249',  # FS Bancorp, Inc.
-    'NPCT': '0001835068',  # Nuveen Core Plus Impact Fund
-    'BKSY': '0001753539',  # BlackSky Technology Inc.
-    'IOCJY': '0000922357',  # IOCHPE-MAXION SA /FI
-    'BTMD': '0001819253',  # biote Corp.
-    'BLDE': '0001779128',  # Blade Air Mobility, Inc.
-    'ATYR': '0001339970',  # aTYR PHARMA INC
-    'ASUR': '0000884144',  # ASURE SOFTWARE INC
-    'JGH': '0001615905',  # Nuveen Global High Income Fund
-    'MCFT': '0001638290',  # MasterCraft Boat Holdings, Inc.
-    'TBN': '0001997652',  # Tamboran Resources Corp
-    'COOK': '0001857853',  # Traeger, Inc.
-    'ACRE': '0001529377',  # Ares Commercial Real Estate Corp
-    'CERS': '0001020214',  # CERUS CORP
-    'IPI': '0001421461',  # Intrepid Potash, Inc.
-    'TTSH': '0001552800',  # TILE SHOP HOLDINGS, INC.
-    'INVZ': '0001835654',  # Innoviz Technologies Ltd.
-    'CIVB': '0000944745',  # CIVISTA BANCSHARES, INC.
-    'REFI': '0001867949',  # Chicago Atlantic Real Estate Finance, Inc.
-    'ZH': '0001835724',  # Zhihu Inc.
-    'MTW': '0000061986',  # MANITOWOC CO INC
-    'IMMP': '0001506184',  # IMMUTEP Ltd
-    'ALDF': '0002031561',  # Aldel Financial II Inc.
-    'LAW': '0001625641',  # CS Disco, Inc.
-    'REI': '0001384195',  # RING ENERGY, INC.
-    'CMRX': '0001117480',  # CHIMERIX INC
-    'PMO': '0000900422',  # PUTNAM MUNICIPAL OPPORTUNITIES TRUST
-    'VYGR': '0001640266',  # Voyager Therapeutics, Inc.
-    'POLE': '0002025341',  # Andretti Acquisition Corp. II
-    'NRGV': '0001828536',  # Energy Vault Holdings, Inc.
-    'VPG': '0001487952',  # Vishay Precision Group, Inc.
-    'NECB': '0001847398',  # NorthEast Community Bancorp, Inc./MD/
-    'COFS': '0000803164',  # CHOICEONE FINANCIAL SERVICES INC
-    'NGNE': '0001404644',  # Neurogene Inc.
-    'CIX': '0001049606',  # COMPX INTERNATIONAL INC
-    'ALLT': '0001365767',  # Allot Ltd.
-    'OBT': '0001754226',  # Orange County Bancorp, Inc. /DE/
-    'ALDX': '0001341235',  # Aldeyra Therapeutics, Inc.
-    'XOMA': '0000791908',  # XOMA Royalty Corp
-    'RMM': '0001771226',  # RiverNorth Managed Duration Municipal Income Fund, Inc.
-    'ABIT': '0001095146',  # Athena Bitcoin Global
-    'NEN': '0000746514',  # NEW ENGLAND REALTY ASSOCIATES LIMITED PARTNERSHIP
-    'DENN': '0000852772',  # DENNY'S Corp
-    'GRAF': '0001897463',  # Graf Global Corp.
-    'RCS': '0000916183',  # PIMCO STRATEGIC INCOME FUND, INC.
-    'SLN': '0001479615',  # Silence Therapeutics plc
-    'GSRT': '0002029023',  # GSR III Acquisition Corp.
-    'LPAA': '0002015502',  # Launch One Acquisition Corp.
-    'EXFY': '0001476840',  # Expensify, Inc.
-    'HOND': '0002019804',  # HCM II Acquisition Corp.
-    'TRUE': '0001327318',  # TrueCar, Inc.
-    'PCOK': '0001452936',  # Pacific Oak Strategic Opportunity REIT, Inc.
-    'LPBB': '0002023676',  # Launch Two Acquisition Corp.
-    'ATGL': '0001967621',  # Alpha Technology Group Ltd
-    'JWSMF': '0001831359',  # Jaws Mustang Acquisition Corp
-    'DSM': '0000855887',  # BNY MELLON STRATEGIC MUNICIPAL BOND FUND, INC.
-    'BGT': '0001287480',  # BLACKROCK FLOATING RATE INCOME TRUST
-    'GTE': '0001273441',  # GRAN TIERRA ENERGY INC.
-    'RIGL': '0001034842',  # RIGEL PHARMACEUTICALS INC
-    'SCD': '0001270131',  # LMP CAPITAL & INCOME FUND INC.
-    'EHTH': '0001333493',  # eHealth, Inc.
-    'JUNS': '0001679628',  # JUPITER NEUROSCIENCES, INC.
-    'OIA': '0000835333',  # Invesco Municipal Income Opportunities Trust
-    'SATL': '0001874315',  # Satellogic Inc.
-    'UNTC': '0000798949',  # UNIT CORP
-    'EDD': '0001388141',  # Morgan Stanley Emerging Markets Domestic Debt Fund, Inc.
-    'SMTI': '0000714256',  # Sanara MedTech Inc.
-    'USAS': '0001286973',  # Americas Gold & Silver Corp
-    'DBL': '0001525201',  # DoubleLine Opportunistic Credit Fund
-    'ITOS': '0001808865',  # iTeos Therapeutics, Inc.
-    'IBEX': '0001720420',  # IBEX Ltd
-    'ABXXF': '0001971975',  # Abaxx Technologies Inc.
-    'CDRO': '0001866782',  # Codere Online Luxembourg, S.A.
-    'LSEA': '0001721386',  # Landsea Homes Corp
-    'ARQQ': '0001859690',  # Arqit Quantum Inc.
-    'PBFS': '0001769663',  # Pioneer Bancorp, Inc./MD
-    'ZVIA': '0001854139',  # Zevia PBC
-    'HIT': '0002019505',  # Health In Tech, Inc.
-    'BYM': '0001181187',  # BLACKROCK MUNICIPAL INCOME QUALITY TRUST
-    'SNFCA': '0000318673',  # SECURITY NATIONAL FINANCIAL CORP
-    'NCA': '0000818851',  # NUVEEN CALIFORNIA MUNICIPAL VALUE FUND
-    'FNLC': '0000765207',  # First Bancorp, Inc /ME/
-    'AUDC': '0001086434',  # AUDIOCODES LTD
-    'CZNC': '0000810958',  # CITIZENS & NORTHERN CORP
-    'MVIS': '0000065770',  # MICROVISION, INC.
-    'SDSYA': '0001163609',  # SOUTH DAKOTA SOYBEAN PROCESSORS LLC
-    'BYON': '0001130713',  # BEYOND, INC.
-    'PCYO': '0000276720',  # PURE CYCLE CORP
-    'JPI': '0001547994',  # Nuveen Preferred Securities & Income Opportunities Fund
-    'RZLT': '0001509261',  # Rezolute, Inc.
-    'ZEO': '0001865506',  # Zeo Energy Corp.
-    'AVIR': '0001593899',  # Atea Pharmaceuticals, Inc.
-    'DRUG': '0001827401',  # BRIGHT MINDS BIOSCIENCES INC.
-    'AQST': '0001398733',  # Aquestive Therapeutics, Inc.
-    'INBK': '0001562463',  # First Internet Bancorp
-    'MG': '0001436126',  # Mistras Group, Inc.
-    'EBFI': '0001919182',  # Eco Bright Future, Inc.
-    'MMD': '0001518557',  # NYLI MacKay DefinedTerm Muni Opportunities Fund
-    'TATT': '0000808439',  # TAT TECHNOLOGIES LTD
-    'RGP': '0001084765',  # RESOURCES CONNECTION, INC.
-    'MNDR': '0001976695',  # Mobile-health Network Solutions
-    'PERF': '0001899830',  # Perfect Corp.
-    'FOA': '0001828937',  # Finance of America Companies Inc.
-    'SFST': '0001090009',  # SOUTHERN FIRST BANCSHARES INC
-    'LXRX': '0001062822',  # LEXICON PHARMACEUTICALS, INC.
-    'ZTR': '0000836412',  # Virtus Total Return Fund Inc.
-    'IHRT': '0001400891',  # iHeartMedia, Inc.
-    'LFVN': '0000849146',  # Lifevantage Corp
-    'BCML': '0001730984',  # BayCom Corp
-    'PKE': '0000076267',  # PARK AEROSPACE CORP
-    'FSTR': '0000352825',  # FOSTER L B CO
-    'DBI': '0001319947',  # Designer Brands Inc.
-    'SSCC': '0001881767',  # Spirits Capital Corp
-    'PBPB': '0001195734',  # POTBELLY CORP
-    'RR': '0001963685',  # RICHTECH ROBOTICS INC.
-    'OSUR': '0001116463',  # ORASURE TECHNOLOGIES INC
-    'GWRS': '0001434728',  # Global Water Resources, Inc.
-    'HYI': '0001497186',  # Western Asset High Yield Defined Opportunity Fund Inc.
-    'FORR': '0001023313',  # FORRESTER RESEARCH, INC.
-    'BRBS': '0000842717',  # BLUE RIDGE BANKSHARES, INC.
-    'NAMI': '0001967631',  # Jinxin Technology Holding Co
-    'PMM': '0000844790',  # PUTNAM MANAGED MUNICIPAL INCOME TRUST
-    'VNDA': '0001347178',  # Vanda Pharmaceuticals Inc.
-    'DOMO': '0001505952',  # DOMO, INC.
-    'IMMR': '0001058811',  # IMMERSION CORP
-    'FCT': '0001282850',  # FIRST TRUST SENIOR FLOATING RATE INCOME FUND II
-    'ACIU': '0001651625',  # AC Immune SA
-    'AFRI': '0001903870',  # Forafric Global PLC
-    'LEGT': '0002002038',  # Legato Merger Corp. III
-    'SLAMF': '0001838162',  # Slam Corp.
-    'PAL': '0001998768',  # Proficient Auto Logistics, Inc
-    'GHI': '0001059142',  # Greystone Housing Impact Investors LP
-    'CZFS': '0000739421',  # CITIZENS FINANCIAL SERVICES INC
-    'MCR': '0000851170',  # MFS CHARTER INCOME TRUST
-    'PCB': '0001423869',  # PCB BANCORP
-    'ARQ': '0001515156',  # Arq, Inc.
-    'TWN': '0000804123',  # TAIWAN FUND INC
-    'LUNG': '0001127537',  # Pulmonx Corp
-    'NVX': '0001859795',  # NOVONIX Ltd
-    'DSGN': '0001807120',  # Design Therapeutics, Inc.
-    'ORN': '0001402829',  # Orion Group Holdings Inc
-    'AEF': '0000846676',  # ABRDN EMERGING MARKETS EQUITY INCOME FUND, INC.
-    'NATR': '0000275053',  # NATURES SUNSHINE PRODUCTS INC
-    'ONTF': '0001110611',  # ON24 INC.
-    'LNKB': '0001756701',  # LINKBANCORP, Inc.
-    'FTK': '0000928054',  # FLOTEK INDUSTRIES INC/CN/
-    'FRST': '0001325670',  # Primis Financial Corp.
-    'EM': '0001834253',  # Smart Share Global Ltd
-    'HDSN': '0000925528',  # HUDSON TECHNOLOGIES INC /NY
-    'JMSB': '0001710482',  # John Marshall Bancorp, Inc.
-    'GFLT': '0001796949',  # GenFlat Holdings, Inc.
-    'EOT': '0001454741',  # Eaton Vance National Municipal Opportunities Trust
-    'CBAN': '0000711669',  # COLONY BANKCORP INC
-    'ACRS': '0001557746',  # Aclaris Therapeutics, Inc.
-    'PRQR': '0001612940',  # ProQR Therapeutics N.V.
-    'HAWEL': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'SBXD': '0002015947',  # SilverBox Corp IV
-    'CDTX': '0001610618',  # Cidara Therapeutics, Inc.
-    'LIEN': '0001843162',  # Chicago Atlantic BDC, Inc.
-    'MMT': '0000809173',  # MFS MULTIMARKET INCOME TRUST
-    'HTCO': '0001928948',  # Caravelle International Group
-    'ERC': '0001227073',  # ALLSPRING MULTI-SECTOR INCOME FUND
-    'TG': '0000850429',  # TREDEGAR CORP
-    'PINE': '0001786117',  # Alpine Income Property Trust, Inc.
-    'GMGI': '0001437925',  # Golden Matrix Group, Inc.
-    'RIV': '0001501072',  # RIVERNORTH OPPORTUNITIES FUND, INC.
-    'SABA': '0000828803',  # Saba Capital Income & Opportunities Fund II
-    'ATLN': '0001605888',  # ATLANTIC INTERNATIONAL CORP.
-    'WTI': '0001288403',  # W&T OFFSHORE INC
-    'ATAI': '0001840904',  # ATAI Life Sciences N.V.
-    'ISPR': '0001948455',  # Ispire Technology Inc.
-    'CMPS': '0001816590',  # COMPASS Pathways plc
-    'CCCC': '0001662579',  # C4 Therapeutics, Inc.
-    'HLXB': '0001869105',  # Helix Acquisition Corp. II
-    'FVR': '0001988494',  # FrontView REIT, Inc.
-    'FDMT': '0001650648',  # 4D Molecular Therapeutics, Inc.
-    'JCE': '0001385763',  # Nuveen Core Equity Alpha Fund
-    'VLDX': '0001825079',  # Velo3D, Inc.
-    'ELMD': '0001488917',  # Electromed, Inc.
-    'BNTC': '0001808898',  # Benitec Biopharma Inc.
-    'LAZR': '0001758057',  # Luminar Technologies, Inc./DE
-    'HITI': '0001847409',  # High Tide Inc.
-    'VUZI': '0001463972',  # Vuzix Corp
-    'ESGH': '0001883835',  # ESG Inc.
-    'AMPY': '0001533924',  # Amplify Energy Corp.
-    'ZYXI': '0000846475',  # ZYNEX INC
-    'NHIC': '0002043699',  # NewHold Investment Corp. III
-    'FLXS': '0000037472',  # FLEXSTEEL INDUSTRIES INC
-    'PLBC': '0001168455',  # PLUMAS BANCORP
-    'FACT': '0002028935',  # FACT II Acquisition Corp.
-    'ESEA': '0001341170',  # EUROSEAS LTD.
-    'SGC': '0000095574',  # SUPERIOR GROUP OF COMPANIES, INC.
-    'FLIC': '0000740663',  # FIRST OF LONG ISLAND CORP
-    'VSTM': '0001526119',  # Verastem, Inc.
-    'TSSI': '0001320760',  # TSS, Inc.
-    'MTA': '0001722606',  # Metalla Royalty & Streaming Ltd.
-    'BSEM': '0001658678',  # BIOSTEM TECHNOLOGIES
-    'BNY': '0001137390',  # BLACKROCK NEW YORK MUNICIPAL INCOME TRUST
-    'OACC': '0002029769',  # Oaktree Acquisition Corp. III Life Sciences
-    'ICG': '0001895597',  # Intchains Group Ltd
-    'MAMA': '0001520358',  # Mama's Creations, Inc.
-    'NWTN': '0001932737',  # NWTN, Inc.
-    'GHG': '0001724755',  # GreenTree Hospitality Group Ltd.
-    'SANG': '0001753368',  # Sangoma Technologies Corp
-    'CMPX': '0001738021',  # Compass Therapeutics, Inc.
-    'NUW': '0001450445',  # Nuveen AMT-Free Municipal Value Fund
-    'ONEW': '0001772921',  # OneWater Marine Inc.
-    'AGD': '0001362481',  # abrdn Global Dynamic Dividend Fund
-    'IIF': '0000916618',  # MORGAN STANLEY INDIA INVESTMENT FUND, INC.
-    'SERA': '0001534969',  # SERA PROGNOSTICS, INC.
-    'TEI': '0000909112',  # TEMPLETON EMERGING MARKETS INCOME FUND
-    'AEVA': '0001789029',  # Aeva Technologies, Inc.
-    'ELDN': '0001404281',  # Eledon Pharmaceuticals, Inc.
-    'BKT': '0000832327',  # BLACKROCK INCOME TRUST, INC.
-    'CRDF': '0001213037',  # Cardiff Oncology, Inc.
-    'FDBC': '0001098151',  # FIDELITY D & D BANCORP INC
-    'ABEO': '0000318306',  # ABEONA THERAPEUTICS INC.
-    'BRCC': '0001891101',  # BRC Inc.
-    'RBTK': '0001594204',  # ZHEN DING RESOURCES INC.
-    'PMX': '0001181506',  # PIMCO MUNICIPAL INCOME FUND III
-    'GENK': '0001891856',  # GEN Restaurant Group, Inc.
-    'UHG': '0001830188',  # United Homes Group, Inc.
-    'RLTY': '0001866874',  # Cohen & Steers Real Estate Opportunities & Income Fund
-    'RCEL': '0001762303',  # AVITA Medical, Inc.
-    'CPSS': '0000889609',  # CONSUMER PORTFOLIO SERVICES, INC.
-    'JRS': '0001158289',  # NUVEEN REAL ESTATE INCOME FUND
-    'NRDY': '0001819404',  # Nerdy Inc.
-    'RLEA': '0001893657',  # Rubber Leaf Inc
-    'IAUX': '0001853962',  # i-80 Gold Corp.
-    'DSX': '0001318885',  # DIANA SHIPPING INC.
-    'AMLX': '0001658551',  # Amylyx Pharmaceuticals, Inc.
-    'SKIL': '0001774675',  # Skillsoft Corp.
-    'TCI': '0000733590',  # TRANSCONTINENTAL REALTY INVESTORS INC
-    'PSF': '0001498612',  # Cohen & Steers Select Preferred & Income Fund, Inc.
-    'SGMO': '0001001233',  # SANGAMO THERAPEUTICS, INC
-    'WEWA': '0001616156',  # WEWARDS, INC.
-    'AZUL': '0001432364',  # AZUL SA
-    'EVI': '0000065312',  # EVI INDUSTRIES, INC.
-    'FHTX': '0001822462',  # Foghorn Therapeutics Inc.
-    'INSE': '0001615063',  # Inspired Entertainment, Inc.
-    'ONIT': '0000873860',  # ONITY GROUP INC.
-    'LWLG': '0001325964',  # Lightwave Logic, Inc.
-    'SBT': '0001680379',  # Sterling Bancorp, Inc.
-    'NCZ': '0001227857',  # Virtus Convertible & Income Fund II
-    'WSBF': '0001569994',  # Waterstone Financial, Inc.
-    'EVC': '0001109116',  # ENTRAVISION COMMUNICATIONS CORP
-    'TVGN': '0001860871',  # Tevogen Bio Holdings Inc.
-    'CATX': '0000728387',  # Perspective Therapeutics, Inc.
-    'OZ': '0001807046',  # Belpointe PREP, LLC
-    'MAPS': '0001779474',  # WM TECHNOLOGY, INC.
-    'NWFL': '0001013272',  # NORWOOD FINANCIAL CORP
-    'ILPT': '0001717307',  # Industrial Logistics Properties Trust
-    'MVBF': '0001277902',  # MVB FINANCIAL CORP
-    'FULC': '0001680581',  # Fulcrum Therapeutics, Inc.
-    'HRTX': '0000818033',  # HERON THERAPEUTICS, INC. /DE/
-    'RMNI': '0001635282',  # Rimini Street, Inc.
-    'AVNW': '0001377789',  # AVIAT NETWORKS, INC.
-    'TLS': '0000320121',  # TELOS CORP
-    'TZOO': '0001133311',  # TRAVELZOO
-    'LRMR': '0001374690',  # Larimar Therapeutics, Inc.
-    'AMRN': '0000897448',  # AMARIN CORP PLC\UK
-    'ARTV': '0001817241',  # Artiva Biotherapeutics, Inc.
-    'HSHP': '0001959455',  # Himalaya Shipping Ltd.
-    'ATNI': '0000879585',  # ATN International, Inc.
-    'CLBR': '0001995413',  # COLOMBIER ACQUISITION CORP. II
-    'CPS': '0001320461',  # Cooper-Standard Holdings Inc.
-    'TSI': '0000809559',  # TCW STRATEGIC INCOME FUND INC
-    'PMF': '0001140392',  # PIMCO MUNICIPAL INCOME FUND
-    'OCGN': '0001372299',  # Ocugen, Inc.
-    'EVM': '0001177161',  # Eaton Vance California Municipal Bond Fund
-    'DRTS': '0001871321',  # Alpha Tau Medical Ltd.
-    'LFCR': '0001005286',  # LIFECORE BIOMEDICAL, INC. \DE\
-    'PHT': '0001166258',  # PIONEER HIGH INCOME FUND, INC.
-    'BYND': '0001655210',  # BEYOND MEAT, INC.
-    'PROF': '0001628808',  # Profound Medical Corp.
-    'CTRN': '0001318484',  # Citi Trends Inc
-    'ZSPC': '0001637147',  # zSpace, Inc.
-    'ACV': '0001636289',  # Virtus Diversified Income & Convertible Fund
-    'NPV': '0000897421',  # NUVEEN VIRGINIA QUALITY MUNICIPAL INCOME FUND
-    'ANIK': '0000898437',  # Anika Therapeutics, Inc.
-    'INGN': '0001294133',  # Inogen Inc
-    'GRRR': '0001903145',  # Gorilla Technology Group Inc.
-    'LTCN': '0001732406',  # Grayscale Litecoin Trust (LTC)
-    'NXDT': '0001356115',  # NEXPOINT DIVERSIFIED REAL ESTATE TRUST
-    'WHF': '0001552198',  # WhiteHorse Finance, Inc.
-    'EP': '0000887396',  # EMPIRE PETROLEUM CORP
-    'NHS': '0001487610',  # Neuberger Berman High Yield Strategies Fund Inc.
-    'IONR': '0001896084',  # ioneer Ltd
-    'ACB': '0001683541',  # AURORA CANNABIS INC
-    'GENC': '0000064472',  # GENCOR INDUSTRIES INC
-    'SRG': '0001628063',  # Seritage Growth Properties
-    'EVBN': '0000842518',  # EVANS BANCORP INC
-    'WYHG': '0001999860',  # Wing Yip Food Holdings Group Ltd
-    'NC': '0000789933',  # NACCO INDUSTRIES INC
-    'TSBK': '0001046050',  # TIMBERLAND BANCORP INC
-    'WRN': '0001364125',  # Western Copper & Gold Corp
-    'FF': '0001337298',  # FutureFuel Corp.
-    'SNWV': '0001417663',  # SANUWAVE Health, Inc.
-    'KGEI': '0001477081',  # Kolibri Global Energy Inc.
-    'AOMR': '0001766478',  # Angel Oak Mortgage REIT, Inc.
-    'PKBK': '0001315399',  # PARKE BANCORP, INC.
-    'CFNB': '0000803016',  # CALIFORNIA FIRST LEASING CORP
-    'ZYBT': '0001975641',  # Zhengye Biotechnology Holding Ltd
-    'UNG': '0001376227',  # United States Natural Gas Fund, LP
-    'ODV': '0001431852',  # Osisko Development Corp.
-    'NLST': '0001282631',  # NETLIST INC
-    'DMAC': '0001401040',  # DiaMedica Therapeutics Inc.
-    'VRSSF': '0001879001',  # Verses AI Inc.
-    'BPRN': '0001913971',  # Princeton Bancorp, Inc.
-    'DHY': '0001061353',  # CREDIT SUISSE HIGH YIELD BOND FUND
-    'PWOD': '0000716605',  # PENNS WOODS BANCORP INC
-    'MUE': '0001071899',  # BLACKROCK MUNIHOLDINGS QUALITY FUND II, INC.
-    'BWFG': '0001505732',  # Bankwell Financial Group, Inc.
-    'OVLY': '0001431567',  # Oak Valley Bancorp
-    'HBB': '0001709164',  # Hamilton Beach Brands Holding Co
-    'KFS': '0001072627',  # KINGSWAY FINANCIAL SERVICES INC
-    'ALCO': '0000003545',  # ALICO, INC.
-    'GOSS': '0001728117',  # Gossamer Bio, Inc.
-    'MVT': '0000897269',  # BLACKROCK MUNIVEST FUND II, INC.
-    'GLO': '0001350869',  # Clough Global Opportunities Fund
-    'MFM': '0000801961',  # MFS MUNICIPAL INCOME TRUST
-    'HWBK': '0000893847',  # HAWTHORN BANCSHARES, INC.
-    'FCEL': '0000886128',  # FUELCELL ENERGY INC
-    'MYPS': '0001823878',  # PLAYSTUDIOS, Inc.
-    'FBLA': '0002013639',  # FB Bancorp, Inc. /MD/
-    'ARL': '0001102238',  # AMERICAN REALTY INVESTORS INC
-    'PDYN': '0001826681',  # Palladyne AI Corp.
-    'RITR': '0001951229',  # Reitar Logtech Holdings Ltd
-    'NAUT': '0001808805',  # Nautilus Biotechnology, Inc.
-    'CFFI': '0000913341',  # C & F FINANCIAL CORP
-    'MACI': '0002016221',  # Melar Acquisition Corp. I/Cayman
-    'FUND': '0000825202',  # SPROTT FOCUS TRUST INC.
-    'MQT': '0000887394',  # BLACKROCK MUNIYIELD QUALITY FUND II, INC.
-    'OPBK': '0001722010',  # OP Bancorp
-    'GASS': '0001328919',  # StealthGas Inc.
-    'DC': '0001852353',  # Dakota Gold Corp.
-    'MYO': '0001369290',  # MYOMO, INC.
-    'WILC': '0001030997',  # G WILLI FOOD INTERNATIONAL LTD
-    'VRDR': '0001506929',  # VERDE RESOURCES, INC.
-    'TBI': '0000768899',  # TrueBlue, Inc.
-    'REEMF': '0001419806',  # RARE ELEMENT RESOURCES LTD
-    'SVCO': '0001943289',  # Silvaco Group, Inc.
-    'RDCM': '0001016838',  # RADCOM LTD
-    'NEWP': '0001369085',  # NEW PACIFIC METALS CORP
-    'ZUUS': '0001687926',  # ZEUUS, INC.
-    'KVAC': '0001889983',  # Keen Vision Acquisition Corp.
-    'MHI': '0001223026',  # PIONEER MUNICIPAL HIGH INCOME FUND, INC.
-    'IVA': '0001756594',  # Inventiva S.A.
-    'GROY': '0001834026',  # Gold Royalty Corp.
-    'JOF': '0000859796',  # JAPAN SMALLER CAPITALIZATION FUND INC
-    'FVCB': '0001675644',  # FVCBankcorp, Inc.
-    'ALTG': '0001759824',  # ALTA EQUIPMENT GROUP INC.
-    'FINW': '0001856365',  # Finwise Bancorp
-    'ONL': '0001873923',  # Orion Office REIT Inc.
-    'SIFY': '0001094324',  # SIFY TECHNOLOGIES LTD
-    'CHMG': '0000763563',  # CHEMUNG FINANCIAL CORP
-    'AVR': '0002011514',  # Anteris Technologies Global Corp.
-    'ELLO': '0000946394',  # Ellomay Capital Ltd.
-    'ARAY': '0001138723',  # ACCURAY INC
-    'HURA': '0001498382',  # TuHURA Biosciences, Inc./NV
-    'CAF': '0001368493',  # Morgan Stanley China A Share Fund, Inc.
-    'HPAI': '0002001699',  # Helport AI Ltd
-    'LANV': '0001922097',  # Lanvin Group Holdings Ltd
-    'OBIO': '0001814114',  # Orchestra BioMed Holdings, Inc.
-    'CIA': '0000024090',  # CITIZENS, INC.
-    'WNW': '0001787803',  # Meiwu Technology Co Ltd
-    'MRT': '0001852767',  # Marti Technologies, Inc.
-    'EOD': '0001386067',  # ALLSPRING GLOBAL DIVIDEND OPPORTUNITY FUND
-    'FTEL': '0001928581',  # Fitell Corp
-    'MFIN': '0001000209',  # MEDALLION FINANCIAL CORP
-    'UTMD': '0000706698',  # UTAH MEDICAL PRODUCTS INC
-    'LXEO': '0001907108',  # Lexeo Therapeutics, Inc.
-    'FET': '0001401257',  # FORUM ENERGY TECHNOLOGIES, INC.
-    'SLRN': '0001962918',  # ACELYRIN, Inc.
-    'TDF': '0000919893',  # TEMPLETON DRAGON FUND INC
-    'LFMD': '0000948320',  # LifeMD, Inc.
-    'CEPO': '0002027708',  # Cantor Equity Partners I, Inc.
-    'FXNC': '0000719402',  # FIRST NATIONAL CORP /VA/
-    'KNOP': '0001564180',  # KNOT Offshore Partners LP
-    'SSP': '0000832428',  # E.W. SCRIPPS Co
-    'SMID': '0000924719',  # SMITH MIDLAND CORP
-    'LGI': '0001278211',  # LAZARD GLOBAL TOTAL RETURN & INCOME FUND INC
-    'FUNC': '0000763907',  # FIRST UNITED CORP/MD/
-    'MPLN': '0001793229',  # MultiPlan Corp
-    'AERG': '0000879911',  # APPLIED ENERGETICS, INC.
-    'INBX': '0002007919',  # Inhibrx Biosciences, Inc.
-    'MAV': '0001258943',  # PIONEER MUNICIPAL HIGH INCOME ADVANTAGE FUND, INC.
-    'BLFY': '0001846017',  # Blue Foundry Bancorp
-    'LCNB': '0001074902',  # LCNB CORP
-    'VREOF': '0001771706',  # Vireo Growth Inc.
-    'ONDS': '0001646188',  # Ondas Holdings Inc.
-    'MIO': '0001864290',  # Pioneer Municipal High Income Opportunities Fund, Inc.
-    'EMX': '0001285786',  # EMX Royalty Corp
-    'MOLN': '0001745114',  # MOLECULAR PARTNERS AG
-    'CIO': '0001593222',  # City Office REIT, Inc.
-    'BHR': '0001574085',  # Braemar Hotels & Resorts Inc.
-    'CORBF': '0001467808',  # Global Cord Blood Corp
-    'MBCN': '0000836147',  # MIDDLEFIELD BANC CORP
-    'DBP': '0001383057',  # Invesco DB Precious Metals Fund
-    'RGCO': '0001069533',  # RGC RESOURCES INC
-    'FGPR': '0000922358',  # FERRELLGAS PARTNERS L P
-    'OPP': '0001678130',  # RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.
-    'IKT': '0001750149',  # Inhibikase Therapeutics, Inc.
-    'BCOV': '0001313275',  # BRIGHTCOVE INC
-    'DBB': '0001383084',  # INVESCO DB BASE METALS FUND
-    'KGNR': '0001593773',  # AMJ Global Technology
-    'ESCA': '0000033488',  # ESCALADE INC
-    'MGNX': '0001125345',  # MACROGENICS INC
-    'DLNG': '0001578453',  # Dynagas LNG Partners LP
-    'OGI': '0001620737',  # ORGANIGRAM HOLDINGS INC.
-    'BAER': '0001941536',  # Bridger Aerospace Group Holdings, Inc.
-    'TSNDF': '0001778129',  # TerrAscend Corp.
-    'SKIN': '0001818093',  # Beauty Health Co
-    'SJT': '0000319655',  # SAN JUAN BASIN ROYALTY TRUST
-    'GPJA': '0000041091',  # GEORGIA POWER CO
-    'ZNTL': '0001725160',  # Zentalis Pharmaceuticals, Inc.
-    'MXF': '0000065433',  # MEXICO FUND INC
-    'AZ': '0001866030',  # A2Z CUST2MATE SOLUTIONS CORP.
-    'TROO': '0001412095',  # Troops, Inc. /Cayman Islands/
-    'PHLT': '0001550695',  # Performant Healthcare Inc
-    'BVFL': '0001302387',  # BV Financial, Inc.
-    'PLL': '0001728205',  # Piedmont Lithium Inc.
-    'AOUT': '0001808997',  # American Outdoor Brands, Inc.
-    'GAUZ': '0001781446',  # Gauzy Ltd.
-    'SWKH': '0001089907',  # SWK Holdings Corp
-    'ETX': '0001563696',  # Eaton Vance Municipal Income 2028 Term Trust
-    'SOPH': '0001840706',  # SOPHiA GENETICS SA
-    'FXE': '0001328598',  # Invesco CurrencyShares Euro Trust
-    'UMAC': '0001956955',  # Unusual Machines, Inc.
-    'NKTR': '0000906709',  # NEKTAR THERAPEUTICS
-    'VOR': '0001817229',  # Vor Biopharma Inc.
-    'PESI': '0000891532',  # PERMA FIX ENVIRONMENTAL SERVICES INC
-    'HYB': '0000825345',  # NEW AMERICA HIGH INCOME FUND INC
-    'BNIGF': '0001851651',  # Beroni Group Ltd
-    'TARA': '0001359931',  # Protara Therapeutics, Inc.
-    'KOPN': '0000771266',  # KOPIN CORP
-    'ESSA': '0001382230',  # ESSA Bancorp, Inc.
-    'BKN': '0000894242',  # BLACKROCK INVESTMENT QUALITY MUNICIPAL TRUST, INC.
-    'LAKE': '0000798081',  # LAKELAND INDUSTRIES INC
-    'TTEC': '0001013880',  # TTEC Holdings, Inc.
-    'ESOA': '0001357971',  # Energy Services of America CORP
-    'FFNW': '0001401564',  # First Financial Northwest, Inc.
-    'DMB': '0001565381',  # BNY Mellon Municipal Bond Infrastructure Fund, Inc.
-    'APPS': '0000317788',  # Digital Turbine, Inc.
-    'BSII': '0002025065',  # Black Spade Acquisition II Co
-    'IVCBF': '0001857410',  # Investcorp Europe Acquisition Corp I
-    'RELL': '0000355948',  # RICHARDSON ELECTRONICS, LTD.
-    'PVBC': '0001778784',  # Provident Bancorp, Inc. /MD/
-    'DHF': '0001057861',  # BNY MELLON HIGH YIELD STRATEGIES FUND
-    'EARN': '0001560672',  # Ellington Credit Co
-    'GOAI': '0001983736',  # Eva Live Inc
-    'ISBA': '0000842517',  # ISABELLA BANK Corp
-    'HMST': '0001518715',  # HomeStreet, Inc.
-    'CLLS': '0001627281',  # Cellectis S.A.
-    'EGAN': '0001066194',  # EGAIN Corp
-    'RAIL': '0001320854',  # FreightCar America, Inc.
-    'JYD': '0001938186',  # Jayud Global Logistics Ltd
-    'SMHI': '0001690334',  # SEACOR Marine Holdings Inc.
-    'BSL': '0001486298',  # Blackstone Senior Floating Rate 2027 Term Fund
-    'WIA': '0001254370',  # WESTERN ASSET INFLATION-LINKED INCOME FUND
-    'BDSX': '0001439725',  # BIODESIX INC
-    'BCBP': '0001228454',  # BCB BANCORP INC
-    'EMP': '0000066901',  # ENTERGY MISSISSIPPI, LLC
-    'VSTA': '0001792829',  # Vasta Platform Ltd
-    'BRLT': '0001866757',  # Brilliant Earth Group, Inc.
-    'DSY': '0001999297',  # Big Tree Cloud Holdings Ltd
-    'ISTR': '0001602658',  # Investar Holding Corp
-    'FT': '0000833040',  # FRANKLIN UNIVERSAL TRUST
-    'NOTE': '0001823466',  # FiscalNote Holdings, Inc.
-    'MITT': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'VABK': '0001572334',  # Virginia National Bankshares Corp
-    'SEVN': '0001452477',  # Seven Hills Realty Trust
-    'FSP': '0001031316',  # FRANKLIN STREET PROPERTIES CORP /MA/
-    'INSI': '0000030125',  # Insight Select Income Fund
-    'HQI': '0001140102',  # HireQuest, Inc.
-    'ELA': '0000701719',  # Envela Corp
-    'PCK': '0001170300',  # PIMCO CALIFORNIA MUNICIPAL INCOME FUND II
-    'AEYE': '0001362190',  # AUDIOEYE INC
-    'KRMD': '0000704440',  # KORU Medical Systems, Inc.
-    'PROC': '0001863362',  # Procaps Group, S.A.
-    'CCRD': '0000320340',  # CoreCard Corp
-    'EQC': '0000803649',  # Equity Commonwealth
-    'VPV': '0000895528',  # Invesco Pennsylvania Value Municipal Income Trust
-    'AFCG': '0001822523',  # Advanced Flower Capital Inc.
-    'CHGG': '0001364954',  # CHEGG, INC
-    'STXS': '0001289340',  # Stereotaxis, Inc.
-    'AKA': '0001865107',  # A.K.A. BRANDS HOLDING CORP.
-    'ADCT': '0001771910',  # ADC Therapeutics SA
-    'CYDY': '0001175680',  # CytoDyn Inc.
-    'WNEB': '0001157647',  # Western New England Bancorp, Inc.
-    'GNFT': '0001757064',  # Genfit S.A.
-    'EPM': '0001006655',  # EVOLUTION PETROLEUM CORP
-    'MDWD': '0001593984',  # MediWound Ltd.
-    'EMF': '0000809708',  # TEMPLETON EMERGING MARKETS FUND
-    'NTWO': '0002028027',  # Newbury Street II Acquisition Corp
-    'MRCC': '0001512931',  # MONROE CAPITAL Corp
-    'RMBL': '0001596961',  # RumbleOn, Inc.
-    'LYEL': '0001806952',  # Lyell Immunopharma, Inc.
-    'BWAY': '0001505065',  # Brainsway Ltd.
-    'VXRT': '0000072444',  # Vaxart, Inc.
-    'EACO': '0000784539',  # EACO CORP
-    'CYBN': '0001833141',  # CYBIN INC.
-    'TCX': '0000909494',  # TUCOWS INC /PA/
-    'MPV': '0000831655',  # BARINGS PARTICIPATION INVESTORS
-    'NHHS': '0001503707',  # NorthStar Healthcare Income, Inc.
-    'IGI': '0001462586',  # Western Asset Investment Grade Opportunity Trust Inc.
-    'JRVR': '0001620459',  # James River Group Holdings, Ltd.
-    'KINS': '0000033992',  # KINGSTONE COMPANIES, INC.
-    'CMCL': '0000766011',  # Caledonia Mining Corp Plc
-    'WBX': '0001866501',  # Wallbox N.V.
-    'VBF': '0000005094',  # Invesco Bond Fund
-    'SPKL': '0001884046',  # Spark I Acquisition Corp
-    'NEGG': '0001474627',  # Newegg Commerce, Inc.
-    'BIOA': '0001709941',  # BioAge Labs, Inc.
-    'FLC': '0001245648',  # FLAHERTY & CRUMRINE TOTAL RETURN FUND INC
-    'SKGR': '0001912461',  # SK Growth Opportunities Corp
-    'TMQ': '0001543418',  # Trilogy Metals Inc.
-    'SLND': '0001883814',  # Southland Holdings, Inc.
-    'LOGC': '0001822250',  # ContextLogic Inc.
-    'OXSQ': '0001259429',  # Oxford Square Capital Corp.
-    'ENJ': '0000071508',  # ENTERGY NEW ORLEANS, LLC
-    'ALEC': '0001653087',  # Alector, Inc.
-    'FSFG': '0001435508',  # First Savings Financial Group, Inc.
-    'ABAT': '0001576873',  # AMERICAN BATTERY TECHNOLOGY Co
-    'MED': '0000910329',  # MEDIFAST INC
-    'ACRV': '0001781174',  # Acrivon Therapeutics, Inc.
-    'FCCO': '0000932781',  # FIRST COMMUNITY CORP /SC/
-    'ADUR': '0001863934',  # ADURO CLEAN TECHNOLOGIES INC.
-    'NKSH': '0000796534',  # NATIONAL BANKSHARES INC
-    'BRKH': '0001871638',  # BurTech Acquisition Corp.
-    'SCPH': '0001604950',  # scPharmaceuticals Inc.
-    'FATE': '0001434316',  # FATE THERAPEUTICS INC
-    'CLPR': '0001649096',  # Clipper Realty Inc.
-    'BCHG': '0001732409',  # Grayscale Bitcoin Cash Trust (BCH)
-    'HGLB': '0001622148',  # HIGHLAND GLOBAL ALLOCATION FUND
-    'BEEP': '0001847874',  # Mobile Infrastructure Corp
-    'PCQ': '0001140411',  # PIMCO CALIFORNIA MUNICIPAL INCOME FUND
-    'YIBO': '0001868395',  # Planet Image International Ltd
-    'ENX': '0001177162',  # Eaton Vance New York Municipal Bond Fund
-    'KEQU': '0000055529',  # KEWAUNEE SCIENTIFIC CORP /DE/
-    'TDAC': '0001926599',  # Translational Development Acquisition Corp.
-    'NUTX': '0001479681',  # Nutex Health, Inc.
-    'SAMG': '0001549966',  # Silvercrest Asset Management Group Inc.
-    'RRACF': '0001860879',  # Rigel Resource Acquisition Corp.
-    'CHRS': '0001512762',  # Coherus BioSciences, Inc.
-    'SPCE': '0001706946',  # Virgin Galactic Holdings, Inc
-    'GPRO': '0001500435',  # GoPro, Inc.
-    'UBFO': '0001137547',  # UNITED SECURITY BANCSHARES
-    'MYFW': '0001327607',  # First Western Financial Inc
-    'PSQH': '0001847064',  # PSQ Holdings, Inc.
-    'CLAR': '0000913277',  # Clarus Corp
-    'REKR': '0001697851',  # Rekor Systems, Inc.
-    'NRO': '0001261166',  # NEUBERGER BERMAN REAL ESTATE SECURITIES INCOME FUND INC
-    'EUDA': '0001847846',  # EUDA Health Holdings Ltd
-    'INSG': '0001022652',  # INSEEGO CORP.
-    'ORGN': '0001802457',  # Origin Materials, Inc.
-    'UAMY': '0000101538',  # UNITED STATES ANTIMONY CORP
-    'NKTX': '0001787400',  # Nkarta, Inc.
-    'CSPI': '0000356037',  # CSP INC /MA/
-    'PLX': '0001006281',  # Protalix BioTherapeutics, Inc.
-    'GBUX': '0001169138',  # GIVBUX, INC.
-    'FENC': '0001211583',  # FENNEC PHARMACEUTICALS INC.
-    'VOXX': '0000807707',  # VOXX International Corp
-    'RCKY': '0000895456',  # ROCKY BRANDS, INC.
-    'SGHT': '0001531177',  # Sight Sciences, Inc.
-    'FLL': '0000891482',  # FULL HOUSE RESORTS INC
-    'GLSI': '0001799788',  # Greenwich LifeSciences, Inc.
-    'DYNX': '0002028699',  # Dynamix Corp
-    'PBYI': '0001401667',  # PUMA BIOTECHNOLOGY, INC.
-    'SGMT': '0001400118',  # Sagimet Biosciences Inc.
-    'MHH': '0001437226',  # Mastech Digital, Inc.
-    'OPTT': '0001378140',  # Ocean Power Technologies, Inc.
-    'BKKT': '0001820302',  # Bakkt Holdings, Inc.
-    'CDLX': '0001666071',  # Cardlytics, Inc.
-    'TRVG': '0001683825',  # trivago N.V.
-    'INFU': '0001337013',  # InfuSystem Holdings, Inc
-    'ACTU': '0001652935',  # ACTUATE THERAPEUTICS, INC.
-    'BGX': '0001504234',  # Blackstone Long-Short Credit Income Fund
-    'NANX': '0000883107',  # NANOPHASE TECHNOLOGIES Corp
-    'NXG': '0001506488',  # NXG NextGen Infrastructure Income Fund
-    'TEAF': '0001704299',  # TORTOISE SUSTAINABLE & SOCIAL IMPACT TERM FUND
-    'FEIM': '0000039020',  # FREQUENCY ELECTRONICS INC
-    'BTOC': '0001972529',  # Armlogi Holding Corp.
-    'DRTTF': '0001340476',  # DIRTT ENVIRONMENTAL SOLUTIONS LTD
-    'IBAC': '0001998781',  # IB Acquisition Corp.
-    'REE': '0001843588',  # REE Automotive Ltd.
-    'TOYO': '0001985273',  # TOYO Co., Ltd
-    'VYEY': '0000700764',  # VICTORY CLEAN ENERGY, INC.
-    'GLDG': '0001538847',  # GoldMining Inc.
-    'EML': '0000031107',  # EASTERN CO
-    'FLDD': '0001889123',  # FTAC Emerald Acquisition Corp.
-    'PTLE': '0002016337',  # PTL Ltd
-    'GDRZF': '0001072725',  # GOLD RESERVE LTD
-    'SPE': '0000897802',  # SPECIAL OPPORTUNITIES FUND, INC.
-    'BLNK': '0001429764',  # Blink Charging Co.
-    'TAVI': '0002020385',  # Tavia Acquisition Corp.
-    'CRGO': '0001927719',  # Freightos Ltd
-    'SSTI': '0001351636',  # SOUNDTHINKING, INC.
-    'MNPR': '0001645469',  # Monopar Therapeutics
-    'PIM': '0000830622',  # PUTNAM MASTER INTERMEDIATE INCOME TRUST
-    'CBNA': '0001392272',  # CHAIN BRIDGE BANCORP INC
-    'POWW': '0001015383',  # AMMO, INC.
-    'BMN': '0001832871',  # BlackRock 2037 Municipal Target Term Trust
-    'TWIN': '0000100378',  # TWIN DISC INC
-    'TLSI': '0001826667',  # TriSalus Life Sciences, Inc.
-    'STRT': '0000933034',  # STRATTEC SECURITY CORP
-    'SDST': '0001831979',  # Stardust Power Inc.
-    'BXSY': '0001059213',  # BEXIL INVESTMENT TRUST
-    'TCRX': '0001783328',  # TScan Therapeutics, Inc.
-    'HNVR': '0001828588',  # Hanover Bancorp, Inc. /NY
-    'HCVI': '0001842937',  # Hennessy Capital Investment Corp. VI
-    'MSD': '0000904112',  # MORGAN STANLEY EMERGING MARKETS DEBT FUND INC
-    'QRTEA': '0001355096',  # Qurate Retail, Inc.
-    'CZWI': '0001367859',  # Citizens Community Bancorp Inc.
-    'CIK': '0000810766',  # CREDIT SUISSE ASSET MANAGEMENT INCOME FUND, INC.
-    'BZUN': '0001625414',  # Baozun Inc.
-    'MRBK': '0001750735',  # Meridian Corp
-    'PDEX': '0000788920',  # PRO DEX INC
-    'PVLA': '0001583648',  # PALVELLA THERAPEUTICS, INC.
-    'BFACF': '0001880441',  # Battery Future Acquisition Corp.
-    'HFFG': '0001680873',  # HF Foods Group Inc.
-    'RFAI': '0002012807',  # RF Acquisition Corp II
-    'CKPT': '0001651407',  # Checkpoint Therapeutics, Inc.
-    'CRAWA': '0000047307',  # CRAWFORD UNITED Corp
-    'NORD': '0001011060',  # Nordicus Partners Corp
-    'PAYS': '0001496443',  # Paysign, Inc.
-    'TSE': '0001519061',  # Trinseo PLC
-    'NNY': '0000818850',  # NUVEEN NEW YORK MUNICIPAL VALUE FUND
-    'IPHA': '0001598599',  # Innate Pharma SA
-    'STFS': '0002003061',  # Star Fashion Culture Holdings Ltd
-    'STRO': '0001382101',  # SUTRO BIOPHARMA, INC.
-    'PZC': '0001181504',  # PIMCO CALIFORNIA MUNICIPAL INCOME FUND III
-    'RENE': '0001889112',  # Cartesian Growth Corp II
-    'AXR': '0000006207',  # AMREP CORP.
-    'STRS': '0000885508',  # STRATUS PROPERTIES INC
-    'PROP': '0001162896',  # Prairie Operating Co.
-    'RCMT': '0000700841',  # RCM TECHNOLOGIES, INC.
-    'MPA': '0000891038',  # BLACKROCK MUNIYIELD PENNSYLVANIA QUALITY FUND
-    'EHI': '0001228509',  # WESTERN ASSET GLOBAL HIGH INCOME FUND INC.
-    'AKYA': '0001711933',  # Akoya Biosciences, Inc.
-    'IDE': '0001417802',  # Voya Infrastructure, Industrials & Materials Fund
-    'MHF': '0000830487',  # WESTERN ASSET MUNICIPAL HIGH INCOME FUND INC.
-    'JYNT': '0001612630',  # JOINT Corp
-    'CCFN': '0000731122',  # MUNCY COLUMBIA FINANCIAL Corp
-    'BW': '0001630805',  # Babcock & Wilcox Enterprises, Inc.
-    'VTN': '0000883265',  # Invesco Trust for Investment Grade New York Municipals
-    'FNRN': '0001114927',  # FIRST NORTHERN COMMUNITY BANCORP
-    'VIRC': '0000751365',  # VIRCO MFG CORPORATION
-    'ICTSF': '0001010134',  # ICTS INTERNATIONAL N V
-    'III': '0001371489',  # Information Services Group Inc.
-    'MX': '0001325702',  # MAGNACHIP SEMICONDUCTOR Corp
-    'PTMN': '0001372807',  # Portman Ridge Finance Corp
-    'NEOV': '0001748137',  # NeoVolta Inc.
-    'TDUP': '0001484778',  # ThredUp Inc.
-    'AWCA': '0001021917',  # Awaysis Capital, Inc.
-    'GRX': '0001391437',  # Gabelli Healthcare & WellnessRx Trust
-    'ADAP': '0001621227',  # Adaptimmune Therapeutics PLC
-    'CGEN': '0001119774',  # COMPUGEN LTD
-    'VTYX': '0001851194',  # Ventyx Biosciences, Inc.
-    'PHX': '0000315131',  # PHX MINERALS INC.
-    'PEBK': '0001093672',  # PEOPLES BANCORP OF NORTH CAROLINA INC
-    'EDF': '0001501103',  # Virtus Stone Harbor Emerging Markets Income Fund
-    'SRI': '0001043337',  # STONERIDGE INC
-    'ISSC': '0000836690',  # INNOVATIVE SOLUTIONS & SUPPORT INC
-    'KYTX': '0001994702',  # Kyverna Therapeutics, Inc.
-    'BANX': '0001578987',  # ArrowMark Financial Corp.
-    'LDDD': '0001892316',  # Longduoduo Co Ltd
-    'BOOM': '0000034067',  # DMC Global Inc.
-    'CRBU': '0001619856',  # Caribou Biosciences, Inc.
-    'EVG': '0001287498',  # Eaton Vance Short Duration Diversified Income Fund
-    'PLBY': '0001803914',  # PLBY Group, Inc.
-    'OCCI': '0001716951',  # OFS Credit Company, Inc.
-    'SHIP': '0001448397',  # Seanergy Maritime Holdings Corp.
-    'DMF': '0000839122',  # BNY MELLON MUNICIPAL INCOME, INC.
-    'IDR': '0001030192',  # Idaho Strategic Resources, Inc.
-    'HYSR': '0001481028',  # SUNHYDROGEN, INC.
-    'ISRL': '0001915328',  # Israel Acquisitions Corp
-    'ATLO': '0001132651',  # AMES NATIONAL CORP
-    'ITRG': '0001722387',  # Integra Resources Corp.
-    'KNIT': '0001696195',  # KINETIC GROUP INC.
-    'LTRX': '0001114925',  # LANTRONIX INC
-    'BFIN': '0001303942',  # BankFinancial CORP
-    'CXDO': '0001075736',  # Crexendo, Inc.
-    'DXLG': '0000813298',  # DESTINATION XL GROUP, INC.
-    'MPTI': '0001902314',  # M-tron Industries, Inc.
-    'MCRB': '0001609809',  # Seres Therapeutics, Inc.
-    'BMEA': '0001840439',  # Biomea Fusion, Inc.
-    'PFD': '0000868578',  # FLAHERTY & CRUMRINE PREFERRED & INCOME FUND INC
-    'ASM': '0000316888',  # AVINO SILVER & GOLD MINES LTD
-    'SLDB': '0001707502',  # Solid Biosciences Inc.
-    'NBTX': '0001760854',  # Nanobiotix S.A.
-    'IGA': '0001332943',  # Voya Global Advantage & Premium Opportunity Fund
-    'CRBP': '0001595097',  # Corbus Pharmaceuticals Holdings, Inc.
-    'EPSN': '0001726126',  # Epsilon Energy Ltd.
-    'NOTV': '0000720154',  # Inotiv, Inc.
-    'MDV': '0001645873',  # MODIV INDUSTRIAL, INC.
-    'SEER': '0001726445',  # Seer, Inc.
-    'SPPP': '0001539190',  # SPROTT PHYSICAL PLATINUM & PALLADIUM TRUST
-    'CFBK': '0001070680',  # CF BANKSHARES INC.
-    'AMTX': '0000738214',  # AEMETIS, INC
-    'ZURA': '0001855644',  # Zura Bio Ltd
-    'CHSN': '0001825349',  # Chanson International Holding
-    'SKYX': '0001598981',  # SKYX Platforms Corp.
-    'MCN': '0001289868',  # XAI Madison Equity Premium Income Fund
-    'CSTE': '0001504379',  # Caesarstone Ltd.
-    'TUSK': '0001679268',  # MAMMOTH ENERGY SERVICES, INC.
-    'DOUG': '0001878897',  # Douglas Elliman Inc.
-    'GGR': '0001886190',  # Gogoro Inc.
-    'IFRX': '0001708688',  # InflaRx N.V.
-    'MPAA': '0000918251',  # MOTORCAR PARTS OF AMERICA INC
-    'HOFT': '0001077688',  # HOOKER FURNISHINGS Corp
-    'PDCC': '0001998043',  # Pearl Diver Credit Co Inc.
-    'SRV': '0001400897',  # NXG Cushing Midstream Energy Fund
-    'NCTY': '0001296774',  # The9 LTD
-    'CBFV': '0001605301',  # CB Financial Services, Inc.
-    'GRUSF': '0001463000',  # Grown Rogue International Inc.
-    'RILY': '0001464790',  # B. Riley Financial, Inc.
-    'WKEY': '0001738699',  # Wisekey International Holding S.A.
-    'SAVA': '0001069530',  # CASSAVA SCIENCES INC
-    'BROG': '0001774983',  # Brooge Energy Ltd
-    'FTLF': '0001374328',  # FITLIFE BRANDS, INC.
-    'NEON': '0000087050',  # Neonode Inc.
-    'TSQ': '0001499832',  # Townsquare Media, Inc.
-    'CLYM': '0001768446',  # Climb Bio, Inc.
-    'MRAM': '0001438423',  # EVERSPIN TECHNOLOGIES INC
-    'NAZ': '0000892992',  # NUVEEN ARIZONA QUALITY MUNICIPAL INCOME FUND
-    'FRGE': '0001827821',  # Forge Global Holdings, Inc.
-    'ZENV': '0001836934',  # Zenvia Inc.
-    'QMCO': '0000709283',  # QUANTUM CORP /DE/
-    'UNB': '0000706863',  # UNION BANKSHARES INC
-    'WHG': '0001165002',  # WESTWOOD HOLDINGS GROUP INC
-    'CURR': '0001862935',  # Currenc Group Inc.
-    'ACR': '0001332551',  # ACRES Commercial Realty Corp.
-    'SSSS': '0001509470',  # SURO CAPITAL CORP.
-    'SBFG': '0000767405',  # SB FINANCIAL GROUP, INC.
-    'PLG': '0001095052',  # PLATINUM GROUP METALS LTD
-    'BWG': '0001504545',  # BrandywineGLOBAL-Global Income Opportunities Fund Inc
-    'STEM': '0001758766',  # STEM, INC.
-    'RSSS': '0001386301',  # Research Solutions, Inc.
-    'SUAC': '0001885461',  # ShoulderUP Technology Acquisition Corp.
-    'ACU': '0000002098',  # ACME UNITED CORP
-    'GPMT': '0001703644',  # Granite Point Mortgage Trust Inc.
-    'LARK': '0001141688',  # LANDMARK BANCORP INC
-    'TDTH': '0001983550',  # Trident Digital Tech Holdings Ltd
-    'NIU': '0001744781',  # Niu Technologies
-    'VGAS': '0001841425',  # Verde Clean Fuels, Inc.
-    'RPMT': '0001437283',  # REGO PAYMENT ARCHITECTURES, INC.
-    'VERI': '0001615165',  # Veritone, Inc.
-    'VEEA': '0001840317',  # VEEA INC.
-    'ECF': '0000793040',  # ELLSWORTH GROWTH & INCOME FUND LTD
-    'BRLS': '0001852973',  # Borealis Foods Inc.
-    'SATX': '0001915403',  # SatixFy Communications Ltd.
-    'DMO': '0001478102',  # Western Asset Mortgage Opportunity Fund Inc.
-    'PLCE': '0001041859',  # Childrens Place, Inc.
-    'AVD': '0000005981',  # AMERICAN VANGUARD CORP
-    'FGBI': '0001408534',  # First Guaranty Bancshares, Inc.
-    'VGES': '0001746119',  # Vanguard Green Investment Ltd
-    'INZY': '0001693011',  # Inozyme Pharma, Inc.
-    'CMT': '0001026655',  # CORE MOLDING TECHNOLOGIES INC
-    'BTA': '0001343793',  # BlackRock Long-Term Municipal Advantage Trust
-    'FREVS': '0000036840',  # FIRST REAL ESTATE INVESTMENT TRUST OF NEW JERSEY
-    'ZLSSF': '0001853397',  # Zalatoris II Acquisition Corp
-    'LILMF': '0001855756',  # Lilium N.V.
-    'ALTO': '0000778164',  # Alto Ingredients, Inc.
-    'DBE': '0001383062',  # Invesco DB Energy Fund
-    'RMBI': '0001767837',  # Richmond Mutual Bancorporation, Inc.
-    'GGT': '0000921671',  # GABELLI MULTIMEDIA TRUST INC.
-    'OPRT': '0001538716',  # Oportun Financial Corp
-    'UEIC': '0000101984',  # UNIVERSAL ELECTRONICS INC
-    'PHYTF': '0001848756',  # Pyrophyte Acquisition Corp.
-    'QUIK': '0000882508',  # QUICKLOGIC Corp
-    'DIBS': '0001600641',  # 1stdibs.com, Inc.
-    'ZOM': '0001684144',  # Zomedica Corp.
-    'MNSB': '0001693577',  # MainStreet Bancshares, Inc.
-    'JHS': '0000759866',  # JOHN HANCOCK INCOME SECURITIES TRUST
-    'YXT': '0001872090',  # YXT.COM GROUP HOLDING Ltd
-    'MAMO': '0001952853',  # Massimo Group
-    'TIL': '0001789769',  # Instil Bio, Inc.
-    'LPSN': '0001102993',  # LIVEPERSON INC
-    'CSLR': '0001838987',  # Complete Solaria, Inc.
-    'EFSI': '0000880641',  # EAGLE FINANCIAL SERVICES INC
-    'ZJYL': '0001837821',  # Jin Medical International Ltd.
-    'XNET': '0001510593',  # Xunlei Ltd
-    'CSBR': '0000771856',  # CHAMPIONS ONCOLOGY, INC.
-    'BETR': '0001835856',  # Better Home & Finance Holding Co
-    'TSVT': '0001860782',  # 2seventy bio, Inc.
-    'SFBC': '0001541119',  # Sound Financial Bancorp, Inc.
-    'RMMZ': '0001870833',  # RiverNorth Managed Duration Municipal Income Fund II, Inc.
-    'PHH': '0001986247',  # Park Ha Biological Technology Co., Ltd.
-    'GF': '0000858706',  # NEW GERMANY FUND INC
-    'GEOS': '0001001115',  # GEOSPACE TECHNOLOGIES CORP
-    'OPOF': '0000740971',  # OLD POINT FINANCIAL CORP
-    'AISP': '0001842566',  # Airship AI Holdings, Inc.
-    'WEA': '0001163792',  # WESTERN ASSET PREMIER BOND FUND
-    'LFT': '0001547546',  # Lument Finance Trust, Inc.
-    'CGTL': '0001967822',  # Creative Global Technology Holdings Ltd
-    'MMLP': '0001176334',  # MARTIN MIDSTREAM PARTNERS L.P.
-    'RDZN': '0001868640',  # Roadzen Inc.
-    'GLQ': '0001316463',  # Clough Global Equity Fund
-    'PIII': '0001832511',  # P3 Health Partners Inc.
-    'TLYS': '0001524025',  # TILLY'S, INC.
-    'VFL': '0000895574',  # abrdn National Municipal Income Fund
-    'IGMS': '0001496323',  # IGM Biosciences, Inc.
-    'QIPT': '0001540013',  # Quipt Home Medical Corp.
-    'NTCL': '0001927578',  # NetClass Technology Inc
-    'QNBC': '0000750558',  # QNB CORP
-    'CWGL': '0001562151',  # Crimson Wine Group, Ltd
-    'RPT': '0001614806',  # Rithm Property Trust Inc.
-    'WLAC': '0002032379',  # Willow Lane Acquisition Corp.
-    'ECBK': '0001914605',  # ECB Bancorp, Inc. /MD/
-    'NTIC': '0000875582',  # NORTHERN TECHNOLOGIES INTERNATIONAL CORP
-    'FMN': '0001199004',  # Federated Hermes Premier Municipal Income Fund
-    'CTGO': '0001502377',  # Contango ORE, Inc.
-    'NNBR': '0000918541',  # NN INC
-    'QH': '0001781193',  # QUHUO Ltd
-    'RMGCF': '0001838108',  # RMG Acquisition Corp. III
-    'HEQ': '0001496749',  # John Hancock Hedged Equity & Income Fund
-    'TELO': '0001971532',  # Telomir Pharmaceuticals, Inc.
-    'LPTH': '0000889971',  # LIGHTPATH TECHNOLOGIES INC
-    'FRAF': '0000723646',  # FRANKLIN FINANCIAL SERVICES CORP /PA/
-    'PCF': '0000810943',  # HIGH INCOME SECURITIES FUND
-    'INMB': '0001711754',  # Inmune Bio, Inc.
-    'JHI': '0000759828',  # JOHN HANCOCK INVESTORS TRUST
-    'ULBI': '0000875657',  # ULTRALIFE CORP
-    'ASFH': '0001828748',  # ASIAFIN HOLDINGS CORP.
-    'FTCO': '0001828377',  # Fortitude Gold Corp
-    'BSET': '0000010329',  # BASSETT FURNITURE INDUSTRIES INC
-    'CCIF': '0001517767',  # Carlyle Credit Income Fund
-    'HFUS': '0001482554',  # Hartford Creative Group, Inc.
-    'EMYB': '0001449794',  # Embassy Bancorp, Inc.
-    'WIMI': '0001770088',  # WiMi Hologram Cloud Inc.
-    'ALGS': '0001799448',  # Aligos Therapeutics, Inc.
-    'SIEB': '0000065596',  # SIEBERT FINANCIAL CORP
-    'FBRX': '0001419041',  # Forte Biosciences, Inc.
-    'LCUT': '0000874396',  # LIFETIME BRANDS, INC
-    'NVRO': '0001444380',  # NEVRO CORP
-    'LCTX': '0000876343',  # Lineage Cell Therapeutics, Inc.
-    'GNSS': '0000924383',  # Genasys Inc.
-    'YAAS': '0001964946',  # Youxin Technology Ltd
-    'QRHC': '0001442236',  # Quest Resource Holding Corp
-    'NUKK': '0001787518',  # Nukkleus Inc.
-    'PPIH': '0000914122',  # Perma-Pipe International Holdings, Inc.
-    'RENB': '0001527728',  # RENOVARO INC.
-    'PLAO': '0001849737',  # Patria Latin American Opportunity Acquisition Corp.
-    'PHD': '0001305767',  # Pioneer Floating Rate Fund, Inc.
-    'FXY': '0001353613',  # Invesco CurrencyShares Japanese Yen Trust
-    'CSTAF': '0001834032',  # Constellation Acquisition Corp I
-    'CHEB': '0002016420',  # Chenghe Acquisition II Co.
-    'VOXR': '0001907909',  # VOX ROYALTY CORP.
-    'CMTL': '0000023197',  # COMTECH TELECOMMUNICATIONS CORP /DE/
-    'SRL': '0000016859',  # Scully Royalty Ltd.
-    'FGFH': '0000786298',  # FORESIGHT FINANCIAL GROUP INC
-    'AZI': '0001959726',  # Autozi Internet Technology (Global) Ltd.
-    'CMCM': '0001597835',  # Cheetah Mobile Inc.
-    'XBIT': '0001626878',  # XBiotech Inc.
-    'LPTX': '0001509745',  # LEAP THERAPEUTICS, INC.
-    'AOAO': '0002042320',  # Alpha One Inc.
-    'BUKS': '0000015847',  # BUTLER NATIONAL CORP
-    'HURC': '0000315374',  # HURCO COMPANIES INC
-    'FNWD': '0000919864',  # Finward Bancorp
-    'GCTS': '0001851961',  # GCT Semiconductor Holding, Inc.
-    'VIVC': '0001703073',  # VIVIC CORP.
-    'PFO': '0000882071',  # Flaherty & Crumrine PREFERRED & INCOME OPPORTUNITY FUND INC
-    'GIFI': '0001031623',  # GULF ISLAND FABRICATION INC
-    'VBFC': '0001290476',  # Village Bank & Trust Financial Corp.
-    'MHLD': '0001412100',  # Maiden Holdings, Ltd.
-    'TNYA': '0001858848',  # Tenaya Therapeutics, Inc.
-    'TOUR': '0001597095',  # Tuniu Corp
-    'ACHV': '0000949858',  # ACHIEVE LIFE SCIENCES, INC.
-    'GECC': '0001675033',  # Great Elm Capital Corp.
-    'LVO': '0001491419',  # LiveOne, Inc.
-    'HTLM': '0002023153',  # HomesToLife Ltd
-    'RVSB': '0001041368',  # RIVERVIEW BANCORP INC
-    'GATE': '0001838513',  # Marblegate Acquisition Corp.
-    'PAI': '0000075398',  # Western Asset Investment Grade Income Fund Inc.
-    'TNMG': '0002013186',  # TNL Mediagene
-    'EBMT': '0001478454',  # Eagle Bancorp Montana, Inc.
-    'UPLD': '0001505155',  # Upland Software, Inc.
-    'PLNH': '0001813452',  # Planet 13 Holdings Inc.
-    'LODE': '0001120970',  # Comstock Inc.
-    'CAAS': '0001157762',  # CHINA AUTOMOTIVE SYSTEMS INC
-    'DTI': '0001884516',  # Drilling Tools International Corp
-    'MTWO': '0001753373',  # M2i Global, Inc.
-    'MGX': '0001785279',  # Metagenomi, Inc.
-    'CXE': '0000845606',  # MFS HIGH INCOME MUNICIPAL TRUST
-    'ACNT': '0000095953',  # ASCENT INDUSTRIES CO.
-    'ELUT': '0001708527',  # ELUTIA INC.
-    'ATOS': '0001488039',  # ATOSSA THERAPEUTICS, INC.
-    'CHMX': '0001657045',  # NEXT-ChemX Corporation.
-    'COE': '0001659494',  # 51Talk Online Education Group
-    'PLMJ': '0001845550',  # Plum Acquisition Corp. III
-    'VCSA': '0001874944',  # Vacasa, Inc.
-    'BMBN': '0000804563',  # BENCHMARK BANKSHARES INC
-    'COPR': '0001263364',  # Idaho Copper Corp
-    'IAF': '0000779336',  # ABRDN AUSTRALIA EQUITY FUND, INC.
-    'NA': '0001872302',  # Nano Labs Ltd
-    'IZTC': '0002010788',  # Invizyne Technologies Inc
-    'SHMD': '0001987240',  # SCHMID Group N.V.
-    'ALYAF': '0001734520',  # Alithya Group inc
-    'PCSC': '0002017526',  # Perceptive Capital Solutions Corp
-    'NVCT': '0001875558',  # Nuvectis Pharma, Inc.
-    'ZTEK': '0001904501',  # Zentek Ltd.
-    'CGO': '0001285650',  # CALAMOS GLOBAL TOTAL RETURN FUND
-    'AFBI': '0001823406',  # Affinity Bancshares, Inc.
-    'STHO': '0001953366',  # Star Holdings
-    'ANRO': '0001999480',  # Alto Neuroscience, Inc.
-    'SLNG': '0001043186',  # Stabilis Solutions, Inc.
-    'KVHI': '0001007587',  # KVH INDUSTRIES INC \DE\
-    'IMPP': '0001876581',  # Imperial Petroleum Inc./Marshall Islands
-    'SVII': '0001843477',  # Spring Valley Acquisition Corp. II
-    'OVBC': '0000894671',  # OHIO VALLEY BANC CORP
-    'LGO': '0001400438',  # Largo Inc.
-    'TLGYF': '0001879814',  # TLGY ACQUISITION CORP
-    'BKTI': '0000002186',  # BK Technologies Corp
-    'EVF': '0001070732',  # Eaton Vance Senior Income Trust
-    'XCH': '0001979887',  # XCHG Ltd
-    'LVPA': '0000831378',  # LVPAI GROUP Ltd
-    'AMWL': '0001393584',  # American Well Corp
-    'WW': '0000105319',  # WW INTERNATIONAL, INC.
-    'TELA': '0001561921',  # TELA Bio, Inc.
-    'MIST': '0001408443',  # Milestone Pharmaceuticals Inc.
-    'SBI': '0000882300',  # WESTERN ASSET INTERMEDIATE MUNI FUND INC.
-    'NIM': '0000890119',  # NUVEEN SELECT MATURITIES MUNICIPAL FUND
-    'PPYA': '0001894057',  # Papaya Growth Opportunity Corp. I
-    'INTT': '0001036262',  # INTEST CORP
-    'BDTX': '0001701541',  # Black Diamond Therapeutics, Inc.
-    'YSXT': '0001993463',  # YSX Tech Co., Ltd
-    'TAYD': '0000096536',  # TAYLOR DEVICES, INC.
-    'CHN': '0000845379',  # China Fund, Inc.
-    'ZENA': '0001997403',  # ZenaTech, Inc.
-    'DLHC': '0000785557',  # DLH Holdings Corp.
-    'BDCC': '0001495648',  # Blackwell 3D Construction Corp.
-    'FCAP': '0001070296',  # FIRST CAPITAL INC
-    'ENTA': '0001177648',  # ENANTA PHARMACEUTICALS INC
-    'MAXN': '0001796898',  # Maxeon Solar Technologies, Ltd.
-    'ODYS': '0001577445',  # Odysight.ai Inc.
-    'OFS': '0001487918',  # OFS Capital Corp
-    'NMT': '0000897419',  # NUVEEN MASSACHUSETTS QUALITY MUNICIPAL INCOME FUND
-    'EPRX': '0001581178',  # EUPRAXIA PHARMACEUTICALS INC.
-    'ANNA': '0001845123',  # AleAnna, Inc.
-    'SRTS': '0001494891',  # Sensus Healthcare, Inc.
-    'ECOR': '0001560258',  # electroCore, Inc.
-    'CEP': '0001865602',  # Cantor Equity Partners, Inc.
-    'BHST': '0001723464',  # BIOHARVEST SCIENCES INC.
-    'VERU': '0000863894',  # VERU INC.
-    'RBKB': '0001751783',  # Rhinebeck Bancorp, Inc.
-    'UFI': '0000100726',  # UNIFI INC
-    'JSPR': '0001788028',  # Jasper Therapeutics, Inc.
-    'OSTX': '0001795091',  # OS Therapies Inc
-    'LGCY': '0001836754',  # Legacy Education Inc.
-    'SOL': '0001417892',  # Emeren Group Ltd
-    'SILC': '0000916793',  # SILICOM LTD.
-    'BCV': '0000009521',  # BANCROFT FUND LTD
-    'EDIT': '0001650664',  # Editas Medicine, Inc.
-    'CRDL': '0001702123',  # Cardiol Therapeutics Inc.
-    'CPHC': '0001672909',  # Canterbury Park Holding Corp
-    'KBLB': '0001413119',  # Kraig Biocraft Laboratories, Inc
-    'WMPN': '0001828376',  # William Penn Bancorporation
-    'PHUN': '0001665300',  # Phunware, Inc.
-    'PROV': '0001010470',  # PROVIDENT FINANCIAL HOLDINGS INC
-    'THCH': '0001877333',  # TH International Ltd
-    'USGO': '0001947244',  # U.S. GoldMining Inc.
-    'GAIA': '0001089872',  # GAIA, INC
-    'CABA': '0001759138',  # Cabaletta Bio, Inc.
-    'ATLX': '0001540684',  # Atlas Lithium Corp
-    'NKLA': '0001731289',  # Nikola Corp
-    'OKUR': '0001637715',  # OnKure Therapeutics, Inc.
-    'FRD': '0000039092',  # FRIEDMAN INDUSTRIES INC
-    'VIOT': '0001742770',  # Viomi Technology Co., Ltd
-    'IVFH': '0000312257',  # INNOVATIVE FOOD HOLDINGS INC
-    'SRBK': '0001951276',  # SR Bancorp, Inc.
-    'DHX': '0001393883',  # DHI GROUP, INC.
-    'ME': '0001804591',  # 23andMe Holding Co.
-    'HLVX': '0001888012',  # HilleVax, Inc.
-    'DLTH': '0001649744',  # DULUTH HOLDINGS INC.
-    'VRA': '0001495320',  # Vera Bradley, Inc.
-    'BBXIA': '0001814974',  # BBX Capital, Inc.
-    'FOSL': '0000883569',  # Fossil Group, Inc.
-    'DBVT': '0001613780',  # DBV Technologies S.A.
-    'ABOS': '0001576885',  # Acumen Pharmaceuticals, Inc.
-    'MDXH': '0001872529',  # MDxHealth SA
-    'BSBK': '0001787414',  # Bogota Financial Corp.
-    'CODA': '0001334325',  # Coda Octopus Group, Inc.
-    'CLEU': '0001775085',  # China Liberal Education Holdings Ltd
-    'BZFD': '0001828972',  # BuzzFeed, Inc.
-    'TBMC': '0001934945',  # Trailblazer Merger Corp I
-    'HNW': '0001388126',  # Pioneer Diversified High Income Fund, Inc.
-    'ASMB': '0001426800',  # ASSEMBLY BIOSCIENCES, INC.
-    'BRIA': '0002000230',  # BrilliA Inc
-    'BOWN': '0001973056',  # Bowen Acquisition Corp
-    'MGF': '0000811922',  # MFS GOVERNMENT MARKETS INCOME TRUST
-    'JLS': '0001472215',  # Nuveen Mortgage & Income Fund/MA/
-    'QSG': '0001932770',  # QuantaSing Group Ltd
-    'ERH': '0001279014',  # ALLSPRING UTILITIES & HIGH INCOME FUND
-    'SWZ': '0000813623',  # SWISS HELVETIA FUND, INC.
-    'PFX': '0001490349',  # PhenixFIN Corp
-    'OPRX': '0001448431',  # OptimizeRx Corp
-    'COYA': '0001835022',  # Coya Therapeutics, Inc.
-    'ELVA': '0001844450',  # Electrovaya Inc.
-    'CSBB': '0000880417',  # CSB Bancorp, Inc.
-    'PETS': '0001040130',  # PETMED EXPRESS INC
-    'OCFT': '0001780531',  # ONECONNECT FINANCIAL TECHNOLOGY CO., LTD.
-    'NOBH': '0000072205',  # NOBILITY HOMES INC
-    'XFOR': '0001501697',  # X4 Pharmaceuticals, Inc
-    'FONR': '0000355019',  # FONAR CORP
-    'LNSR': '0001320350',  # LENSAR, Inc.
-    'RMI': '0001746967',  # RiverNorth Opportunistic Municipal Income Fund, Inc.
-    'MODV': '0001220754',  # ModivCare Inc
-    'RECT': '0001995116',  # Rectitude Holdings Ltd.
-    'PEPG': '0001835597',  # PepGen Inc.
-    'AFJK': '0001979005',  # Aimei Health Technology Co., Ltd.
-    'MVO': '0001371782',  # MV Oil Trust
-    'OPTX': '0001866816',  # SYNTEC OPTICS HOLDINGS, INC.
-    'ACOG': '0001655923',  # Alpha Cognition Inc.
-    'GGZ': '0001585855',  # Gabelli Global Small & Mid Cap Value Trust
-    'ORMP': '0001176309',  # ORAMED PHARMACEUTICALS INC.
-    'AE': '0000002178',  # ADAMS RESOURCES & ENERGY, INC.
-    'CNDA': '0001851959',  # Concord Acquisition Corp II
-    'SND': '0001529628',  # Smart Sand, Inc.
-    'MNOV': '0001226616',  # MEDICINOVA INC
-    'PBHC': '0001609065',  # Pathfinder Bancorp, Inc.
-    'EVGR': '0001900402',  # Evergreen Corp
-    'NMI': '0000830271',  # NUVEEN MUNICIPAL INCOME FUND INC
-    'ENBP': '0001437479',  # ENB Financial Corp
-    'IVAC': '0001001902',  # INTEVAC INC
-    'TRX': '0001173643',  # TRX GOLD Corp
-    'LSE': '0001985139',  # Leishen Energy Holding Co., Ltd.
-    'GRWG': '0001604868',  # GrowGeneration Corp.
-    'GLAC': '0001897971',  # Global Lights Acquisition Corp
-    'CUE': '0001645460',  # Cue Biopharma, Inc.
-    'BRID': '0000014177',  # BRIDGFORD FOODS CORP
-    'GORV': '0001721741',  # Lazydays Holdings, Inc.
-    'TLSA': '0001723069',  # Tiziana Life Sciences Ltd
-    'DSAQ': '0001871745',  # Direct Selling Acquisition Corp.
-    'GDL': '0001378701',  # GDL FUND
-    'WRAP': '0001702924',  # WRAP TECHNOLOGIES, INC.
-    'KF': '0000748691',  # KOREA FUND INC
-    'HLP': '0001855557',  # Hongli Group Inc.
-    'SY': '0001758530',  # So-Young International Inc.
-    'ALXO': '0001810182',  # ALX ONCOLOGY HOLDINGS INC
-    'AXTI': '0001051627',  # AXT INC
-    'UTGN': '0000832480',  # UTG INC
-    'BEOB': '0001480170',  # BEO BANCORP
-    'QETA': '0001978528',  # Quetta Acquisition Corp
-    'STIM': '0001227636',  # Neuronetics, Inc.
-    'CMTV': '0000718413',  # COMMUNITY BANCORP /VT
-    'SUNS': '0002012706',  # Sunrise Realty Trust, Inc.
-    'CVVUF': '0001023109',  # CANALASKA URANIUM LTD
-    'IVCA': '0001852889',  # Investcorp AI Acquisition Corp.
-    'DYCQ': '0001944212',  # DT Cloud Acquisition Corp
-    'ARAT': '0001566243',  # Arax Holdings Corp
-    'CURI': '0001776909',  # CuriosityStream Inc.
-    'MGYR': '0001337068',  # Magyar Bancorp, Inc.
-    'RRGB': '0001171759',  # RED ROBIN GOURMET BURGERS INC
-    'SNCR': '0001131554',  # SYNCHRONOSS TECHNOLOGIES INC
-    'THM': '0001134115',  # INTERNATIONAL TOWER HILL MINES LTD
-    'IMUX': '0001280776',  # IMMUNIC, INC.
-    'BKHA': '0002000775',  # Black Hawk Acquisition Corp
-    'SKLZ': '0001801661',  # Skillz Inc.
-    'HNNA': '0001145255',  # HENNESSY ADVISORS INC
-    'BCRD': '0001496690',  # BlueOne Card, Inc.
-    'SCWO': '0000933972',  # 374Water Inc.
-    'RFM': '0001790177',  # RiverNorth Flexible Municipal Income Fund, Inc.
-    'RGLS': '0001505512',  # Regulus Therapeutics Inc.
-    'ENTX': '0001638097',  # Entera Bio Ltd.
-    'LTBR': '0001084554',  # LIGHTBRIDGE Corp
-    'IROH': '0001901203',  # Iron Horse Acquisitions Corp.
-    'PRPL': '0001643953',  # Purple Innovation, Inc.
-    'PYXS': '0001782223',  # Pyxis Oncology, Inc.
-    'PMHG': '0001586454',  # Prime Meridian Holding Co
-    'MLSS': '0000855683',  # MILESTONE SCIENTIFIC INC.
-    'MRSN': '0001442836',  # Mersana Therapeutics, Inc.
-    'ALOT': '0000008146',  # AstroNova, Inc.
-    'ATRA': '0001604464',  # Atara Biotherapeutics, Inc.
-    'FKYS': '0000737875',  # FIRST KEYSTONE CORP
-    'FFMGF': '0001641229',  # First Mining Gold Corp.
-    'FSHP': '0001850059',  # Flag Ship Acquisition Corp
-    'ALMU': '0001828805',  # Aeluma, Inc.
-    'ADVM': '0001501756',  # Adverum Biotechnologies, Inc.
-    'IHD': '0001496292',  # Voya Emerging Markets High Dividend Equity Fund
-    'PRKR': '0000914139',  # PARKERVISION INC
-    'DTSQ': '0002017950',  # DT Cloud Star Acquisition Corp
-    'DM': '0001754820',  # Desktop Metal, Inc.
-    'EAXR': '0000832370',  # Ealixir, Inc.
-    'GNLX': '0001231457',  # GENELUX Corp
-    'CMU': '0000809844',  # MFS HIGH YIELD MUNICIPAL TRUST
-    'GNT': '0001438893',  # GAMCO Natural Resources, Gold & Income Trust
-    'MSW': '0001956166',  # Ming Shing Group Holdings Ltd
-    'PGP': '0001318025',  # PIMCO Global StocksPLUS & Income Fund
-    'PAVS': '0001751876',  # Paranovus Entertainment Technology Ltd.
-    'HSPO': '0001946021',  # Horizon Space Acquisition I Corp.
-    'KPTI': '0001503802',  # Karyopharm Therapeutics Inc.
-    'CHMI': '0001571776',  # Cherry Hill Mortgage Investment Corp
-    'PWUP': '0001847345',  # PowerUp Acquisition Corp.
-    'GUTS': '0001572616',  # FRACTYL HEALTH, INC.
-    'FNWB': '0001556727',  # First Northwest Bancorp
-    'BLGO': '0000880242',  # BIOLARGO, INC.
-    'ZNOG': '0001131312',  # ZION OIL & GAS INC
-    'FAT': '0001705012',  # Fat Brands, Inc
-    'MAYS': '0000054187',  # MAYS J W INC
-    'KLXE': '0001738827',  # KLX Energy Services Holdings, Inc.
-    'GNTA': '0001838716',  # Genenta Science S.p.A.
-    'GLU': '0001282957',  # GABELLI GLOBAL UTILITY & INCOME TRUST
-    'TGLO': '0001066684',  # THEGLOBE COM INC
-    'MHGU': '0000808219',  # MERITAGE HOSPITALITY GROUP INC
-    'CNTY': '0000911147',  # CENTURY CASINOS INC /CO/
-    'KNDI': '0001720250',  # Kandi Technologies Group, Inc.
-    'AADI': '0001422142',  # Aadi Bioscience, Inc.
-    'RVPH': '0001742927',  # REVIVA PHARMACEUTICALS HOLDINGS, INC.
-    'LEE': '0000058361',  # LEE ENTERPRISES, Inc
-    'THTX': '0001512717',  # Theratechnologies Inc.
-    'HUHU': '0001945415',  # HUHUTECH International Group Inc.
-    'SFDL': '0000818677',  # SECURITY FEDERAL CORP
-    'BYNO': '0001801417',  # byNordic Acquisition Corp
-    'ALTS': '0000862861',  # ALT5 Sigma Corp
-    'STKS': '0001399520',  # ONE Group Hospitality, Inc.
-    'IMAB': '0001778016',  # I-Mab
-    'VGI': '0001528811',  # Virtus Global Multi-Sector Income Fund
-    'MCHX': '0001224133',  # MARCHEX INC
-    'AAWH': '0001756390',  # Ascend Wellness Holdings, Inc.
-    'PFBX': '0000770460',  # PEOPLES FINANCIAL CORP /MS/
-    'BRAG': '0001867834',  # Bragg Gaming Group Inc.
-    'SFWL': '0001863218',  # SHENGFENG DEVELOPMENT Ltd
-    'ADAG': '0001818838',  # Adagene Inc.
-    'PTHL': '0001970544',  # Pheton Holdings Ltd
-    'DIT': '0000928465',  # AMCON DISTRIBUTING CO
-    'IXAQF': '0001852019',  # IX Acquisition Corp.
-    'BLUAF': '0001831006',  # BlueRiver Acquisition Corp.
-    'ALLK': '0001564824',  # Allakos Inc.
-    'VMCA': '0001892747',  # Valuence Merger Corp. I
-    'AIRE': '0001859199',  # reAlpha Tech Corp.
-    'UNIB': '0000811211',  # UNIVERSITY BANCORP INC /DE/
-    'EHGO': '0001879754',  # EShallGo Inc.
-    'CBAT': '0001117171',  # CBAK Energy Technology, Inc.
-    'VFF': '0001584549',  # Village Farms International, Inc.
-    'INVE': '0001036044',  # Identiv, Inc.
-    'CDAQF': '0001851909',  # Compass Digital Acquisition Corp.
-    'IPSC': '0001850119',  # Century Therapeutics, Inc.
-    'AITR': '0001966734',  # AI Transportation Acquisition Corp
-    'IH': '0001814423',  # iHuman Inc.
-    'MGRM': '0001769759',  # Monogram Technologies Inc.
-    'VOC': '0001505413',  # VOC Energy Trust
-    'GAN': '0001799332',  # GAN Ltd
-    'NWPP': '0001163389',  # NEW PEOPLES BANKSHARES INC
-    'GDO': '0001472341',  # WESTERN ASSET GLOBAL CORPORATE OPPORTUNITY FUND INC.
-    'IMAQ': '0001846235',  # International Media Acquisition Corp.
-    'RSKIA': '0000084112',  # GEORGE RISK INDUSTRIES, INC.
-    'HBIO': '0001123494',  # HARVARD BIOSCIENCE INC
-    'CAMP': '0001736730',  # Camp4 Therapeutics Corp
-    'BLUE': '0001293971',  # bluebird bio, Inc.
-    'NXC': '0000885732',  # NUVEEN CALIFORNIA SELECT TAX FREE INCOME PORTFOLIO
-    'VTGN': '0001411685',  # Vistagen Therapeutics, Inc.
-    'SKYE': '0001516551',  # Skye Bioscience, Inc.
-    'SPWH': '0001132105',  # SPORTSMAN'S WAREHOUSE HOLDINGS, INC.
-    'PUCK': '0001836100',  # Goal Acquisitions Corp.
-    'PCM': '0000908187',  # PCM FUND, INC.
-    'MYND': '0001708441',  # Mynd.ai, Inc.
-    'SHIM': '0001887944',  # Shimmick Corp
-    'TGAAF': '0001847355',  # Target Global Acquisition I Corp.
-    'CNF': '0001733868',  # CNFinance Holdings Ltd.
-    'CTOR': '0001851484',  # CITIUS ONCOLOGY, INC.
-    'CHCI': '0001299969',  # Comstock Holding Companies, Inc.
-    'JVSA': '0001866001',  # JVSPAC Acquisition Corp.
-    'PTZH': '0001627469',  # Photozou Holdings, Inc.
-    'ASPC': '0001890361',  # ASPAC III Acquisition Corp.
-    'NIXX': '0001462223',  # Nixxy, Inc.
-    'YHNA': '0002020987',  # YHN Acquisition I Ltd
-    'SQNS': '0001383395',  # SEQUANS COMMUNICATIONS
-    'IRAA': '0001831874',  # Iris Acquisition Corp
-    'DERM': '0001867066',  # Journey Medical Corp
-    'EURK': '0002000410',  # Eureka Acquisition Corp
-    'SPGX': '0001500305',  # Sustainable Projects Group Inc.
-    'ICLK': '0001697818',  # iClick Interactive Asia Group Ltd
-    'UBCP': '0000731653',  # UNITED BANCORP INC /OH/
-    'CNTX': '0001842952',  # Context Therapeutics Inc.
-    'EDAP': '0001041934',  # EDAP TMS SA
-    'PNI': '0001170311',  # PIMCO NEW YORK MUNICIPAL INCOME FUND II
-    'MASS': '0001555279',  # 908 Devices Inc.
-    'BKRRF': '0001699906',  # BLACKROCK SILVER CORP.
-    'AUBN': '0000750574',  # AUBURN NATIONAL BANCORPORATION, INC
-    'ITMSF': '0001285170',  # INTERMAP TECHNOLOGIES CORP
-    'MNTN': '0001863719',  # Everest Consolidator Acquisition Corp
-    'APLT': '0001697532',  # Applied Therapeutics, Inc.
-    'CAPN': '0002024203',  # Cayson Acquisition Corp
-    'FBYD': '0001937987',  # Falcon's Beyond Global, Inc.
-    'FCO': '0000876717',  # ABRDN GLOBAL INCOME FUND, INC.
-    'DTF': '0000879535',  # DTF TAX-FREE INCOME 2028 TERM FUND INC
-    'EPIX': '0001633932',  # ESSA Pharma Inc.
-    'SCTH': '0001703157',  # Securetech Innovations, Inc.
-    'JEQ': '0000866095',  # ABRDN JAPAN EQUITY FUND, INC.
-    'QNCX': '0001662774',  # Quince Therapeutics, Inc.
-    'ASRT': '0001808665',  # Assertio Holdings, Inc.
-    'ATMC': '0001889106',  # ALPHATIME ACQUISITION CORP
-    'PED': '0001141197',  # PEDEVCO CORP
-    'INCR': '0001857030',  # Intercure Ltd.
-    'OCAX': '0001820175',  # OCA Acquisition Corp.
-    'ORKT': '0001979407',  # ORANGEKLOUD TECHNOLOGY INC.
-    'CEE': '0000860489',  # CENTRAL & EASTERN EUROPE FUND, INC.
-    'INUV': '0000829323',  # Inuvo, Inc.
-    'HOUR': '0001874875',  # Hour Loop, Inc
-    'MSSA': '0001882464',  # Metal Sky Star Acquisition Corp
-    'LSBK': '0001341318',  # LAKE SHORE BANCORP, INC.
-    'USAU': '0000027093',  # U.S. GOLD CORP.
-    'IRRX': '0001854795',  # INTEGRATED RAIL & RESOURCES ACQUISITION CORP
-    'SNT': '0001993727',  # Senstar Technologies Corp
-    'ELTK': '0001024672',  # ELTEK LTD
-    'PYRGF': '0001743344',  # PyroGenesis Canada Inc.
-    'ESP': '0000033533',  # ESPEY MFG & ELECTRONICS CORP
-    'MGLD': '0001005101',  # Marygold Companies, Inc.
-    'IROQ': '0001514743',  # IF Bancorp, Inc.
-    'FVN': '0002010653',  # Future Vision II Acquisition Corp.
-    'AUGG': '0001448597',  # AUGUSTA GOLD CORP.
-    'ASYS': '0000720500',  # AMTECH SYSTEMS INC
-    'GSIT': '0001126741',  # GSI TECHNOLOGY INC
-    'IKNA': '0001835579',  # Ikena Oncology, Inc.
-    'DMA': '0001523289',  # Destra Multi-Alternative Fund
-    'RANI': '0001856725',  # Rani Therapeutics Holdings, Inc.
-    'RDAC': '0002018145',  # Rising Dragon Acquisition Corp.
-    'ACET': '0001720580',  # Adicet Bio, Inc.
-    'CTM': '0001877939',  # Castellum, Inc.
-    'PMVP': '0001699382',  # PMV Pharmaceuticals, Inc.
-    'TPIC': '0001455684',  # TPI COMPOSITES, INC
-    'GCV': '0000845611',  # GABELLI CONVERTIBLE & INCOME SECURITIES FUND INC
-    'LASE': '0001807887',  # Laser Photonics Corp
-    'RCFAF': '0001870143',  # Perception Capital Corp. IV
-    'AVTX': '0001534120',  # Avalo Therapeutics, Inc.
-    'EZOO': '0001752372',  # Ezagoo Ltd
-    'ALAR': '0001725332',  # Alarum Technologies Ltd.
-    'PHCI': '0001620749',  # Panamera Holdings Corp
-    'AIRG': '0001272842',  # AIRGAIN INC
-    'CLSD': '0001539029',  # Clearside Biomedical, Inc.
-    'STG': '0001723935',  # Sunlands Technology Group
-    'TETE': '0001900679',  # Technology & Telecommunication Acquisition Corp
-    'AVAI': '0001740797',  # AVANT TECHNOLOGIES INC.
-    'IOR': '0000949961',  # INCOME OPPORTUNITY REALTY INVESTORS INC /TX/
-    'VTSI': '0001085243',  # VirTra, Inc
-    'AVTE': '0001798749',  # Aerovate Therapeutics, Inc.
-    'FUSB': '0000717806',  # FIRST US BANCSHARES, INC.
-    'AGEN': '0001098972',  # AGENUS INC
-    'ELRE': '0001438461',  # Yinfu Gold Corp.
-    'VIGL': '0001827087',  # Vigil Neuroscience, Inc.
-    'NSPR': '0001433607',  # InspireMD, Inc.
-    'FFIE': '0001805521',  # FARADAY FUTURE INTELLIGENT ELECTRIC INC.
-    'ACRG': '0000773717',  # American Clean Resources Group, Inc.
-    'ANL': '0001944552',  # Adlai Nortye Ltd.
-    'CVGI': '0001290900',  # Commercial Vehicle Group, Inc.
-    'RBOT': '0001812173',  # Vicarious Surgical Inc.
-    'ARMP': '0000921114',  # Armata Pharmaceuticals, Inc.
-    'AURX': '0001091596',  # Nuo Therapeutics, Inc.
-    'ICCM': '0001584371',  # IceCure Medical Ltd.
-    'STBX': '0001914818',  # Starbox Group Holdings Ltd.
-    'BNR': '0001792267',  # Burning Rock Biotech Ltd
-    'OWLT': '0001816708',  # Owlet, Inc.
-    'HGBL': '0000849145',  # Heritage Global Inc.
-    'AEAE': '0001852016',  # AltEnergy Acquisition Corp
-    'CATO': '0000018255',  # CATO CORP
-    'CULP': '0000723603',  # CULP INC
-    'CSLM': '0001875493',  # CSLM ACQUISITION CORP.
-    'VLT': '0000846671',  # Invesco High Income Trust II
-    'ANIX': '0000715446',  # Anixa Biosciences Inc
-    'SGA': '0000886136',  # SAGA COMMUNICATIONS INC
-    'CAHO': '0001678105',  # Caro Holdings Inc.
-    'ABP': '0001893219',  # Abpro Holdings, Inc.
-    'NMS': '0001607997',  # Nuveen Minnesota Quality Municipal Income Fund
-    'VANI': '0001266806',  # Vivani Medical, Inc.
-    'TBNK': '0001447051',  # Territorial Bancorp Inc.
-    'SST': '0001805833',  # System1, Inc.
-    'LSF': '0001650696',  # Laird Superfood, Inc.
-    'SCLX': '0001820190',  # Scilex Holding Co
-    'CEV': '0001074692',  # EATON VANCE CALIFORNIA MUNICIPAL INCOME TRUST
-    'INO': '0001055726',  # INOVIO PHARMACEUTICALS, INC.
-    'DWNX': '0000927719',  # DELHI BANK CORP
-    'FAAS': '0001844981',  # DIGIASIA CORP.
-    'CBUS': '0001705843',  # Cibus, Inc.
-    'STI': '0001881551',  # Solidion Technology Inc.
-    'GALT': '0001133416',  # GALECTIN THERAPEUTICS INC
-    'KANP': '0001230058',  # KAANAPALI LAND LLC
-    'GGROU': '0001489874',  # Golden Growers Cooperative
-    'CTMX': '0001501989',  # CytomX Therapeutics, Inc.
-    'MSCLF': '0001421642',  # Satellos Bioscience Inc.
-    'UNCY': '0001766140',  # Unicycive Therapeutics, Inc.
-    'USIO': '0001088034',  # Usio, Inc.
-    'OSS': '0001394056',  # ONE STOP SYSTEMS, INC.
-    'XTNT': '0001453593',  # Xtant Medical Holdings, Inc.
-    'HYPR': '0001833769',  # Hyperfine, Inc.
-    'GLXZ': '0000013156',  # Galaxy Gaming, Inc.
-    'ICCH': '0001681903',  # ICC Holdings, Inc.
-    'FMBM': '0000740806',  # F&M BANK CORP
-    'VNJA': '0001532383',  # VANJIA CORP
-    'VGZ': '0000783324',  # VISTA GOLD CORP
-    'FDSB': '0002012726',  # Fifth District Bancorp, Inc.
-    'NVAC': '0001859807',  # NorthView Acquisition Corp
-    'FBLG': '0001958777',  # FibroBiologics, Inc.
-    'OAKU': '0001945422',  # Oak Woods Acquisition Corp
-    'ANVS': '0001477845',  # Annovis Bio, Inc.
-    'SPHL': '0002002236',  # SPRINGVIEW HOLDINGS LTD
-    'TISI': '0000318833',  # TEAM INC
-    'GSHRF': '0001961592',  # GOLDSHORE RESOURCES INC.
-    'BYFC': '0001001171',  # BROADWAY FINANCIAL CORP DE
-    'NCSM': '0001692427',  # NCS Multistage Holdings, Inc.
-    'MKFG': '0001816613',  # Markforged Holding Corp
-    'INLF': '0001991592',  # INLIF Ltd
-    'CCG': '0001965473',  # Cheche Group Inc.
-    'GCEH': '0000748790',  # Global Clean Energy Holdings, Inc.
-    'YTRA': '0001516899',  # Yatra Online, Inc.
-    'HAIAF': '0001848861',  # Healthcare AI Acquisition Corp.
-    'SLBK': '0001657642',  # Skyline Bankshares, Inc.
-    'RGT': '0001514490',  # ROYCE GLOBAL TRUST, INC.
-    'SRFM': '0001936224',  # SURF AIR MOBILITY INC.
-    'AIRRF': '0001476573',  # Aurion Resources Ltd.
-    'KOSS': '0000056701',  # KOSS CORP
-    'ONCY': '0001129928',  # ONCOLYTICS BIOTECH INC
-    'ORRCF': '0001390352',  # OROCO RESOURCE CORP
-    'GLV': '0001288795',  # Clough Global Dividend & Income Fund
-    'VATE': '0001006837',  # INNOVATE Corp.
-    'RMTI': '0001041024',  # ROCKWELL MEDICAL, INC.
-    'IQST': '0001527702',  # iQSTEL Inc
-    'SNAL': '0001886894',  # Snail, Inc.
-    'TGEN': '0001537435',  # TECOGEN INC.
-    'MDBH': '0001934642',  # MDB Capital Holdings, LLC
-    'GTI': '0001879373',  # GRAPHJET TECHNOLOGY
-    'RFL': '0001713863',  # Rafael Holdings, Inc.
-    'PRE': '0001876431',  # Prenetics Global Ltd
-    'NVA': '0001852551',  # Nova Minerals Ltd
-    'GWH': '0001819438',  # ESS Tech, Inc.
-    'PGZ': '0001557523',  # Principal Real Estate Income Fund
-    'ELTX': '0001601485',  # Elicio Therapeutics, Inc.
-    'IAE': '0001385632',  # Voya Asia Pacific High Dividend Equity Income Fund
-    'SLS': '0001390478',  # SELLAS Life Sciences Group, Inc.
-    'WPRT': '0001370416',  # WESTPORT FUEL SYSTEMS INC.
-    'OPAD': '0001825024',  # Offerpad Solutions Inc.
-    'HPH': '0001750264',  # Highest Performances Holdings Inc.
-    'BYSI': '0001677940',  # BeyondSpring Inc.
-    'NB': '0001512228',  # NIOCORP DEVELOPMENTS LTD
-    'LONCF': '0001472619',  # Loncor Gold Inc.
-    'IMRX': '0001790340',  # Immuneering Corp
-    'GSVRF': '0000865400',  # GUANAJUATO SILVER CO LTD
-    'CPTP': '0000202947',  # CAPITAL PROPERTIES INC /RI/
-    'FNGR': '0001602409',  # FingerMotion, Inc.
-    'PYYX': '0000939930',  # PYXUS INTERNATIONAL, INC.
-    'ANEB': '0001815974',  # Anebulo Pharmaceuticals, Inc.
-    'CXH': '0000847411',  # MFS INVESTMENT GRADE MUNICIPAL TRUST
-    'LRFC': '0001571329',  # Logan Ridge Finance Corp.
-    'SUUN': '0002011053',  # SolarBank Corp
-    'FMFG': '0001698022',  # Farmers & Merchants Bancshares, Inc.
-    'PORT': '0001865200',  # Southport Acquisition Corp
-    'GBIO': '0001733294',  # Generation Bio Co.
-    'VNRX': '0000093314',  # VOLITIONRX LTD
-    'QSEP': '0001103795',  # QS Energy, Inc.
-    'MURA': '0001971543',  # Mural Oncology plc
-    'MATH': '0001682241',  # Metalpha Technology Holding Ltd
-    'HANNF': '0001123267',  # Hannan Metals Ltd.
-    'WFCF': '0001360565',  # Where Food Comes From, Inc.
-    'AUID': '0001534154',  # authID Inc.
-    'WOK': '0001929783',  # WORK Medical Technology Group LTD
-    'RCON': '0001442620',  # Recon Technology, Ltd
-    'NEUP': '0001191070',  # Neuphoria Therapeutics Inc.
-    'JUVF': '0000714712',  # JUNIATA VALLEY FINANCIAL CORP
-    'FGEN': '0000921299',  # FIBROGEN INC
-    'XTGRF': '0001288770',  # XTRA-GOLD RESOURCES CORP
-    'RGC': '0001829667',  # Regencell Bioscience Holdings Ltd
-    'FTCI': '0001828161',  # FTC Solar, Inc.
-    'ASCBF': '0001876716',  # ASPAC II Acquisition Corp.
-    'DTC': '0001870600',  # Solo Brands, Inc.
-    'SMXT': '0001519472',  # SolarMax Technology, Inc.
-    'LOAN': '0001080340',  # MANHATTAN BRIDGE CAPITAL, INC
-    'FNVTF': '0001857855',  # Finnovate Acquisition Corp.
-    'SOTK': '0000806172',  # SONO TEK CORP
-    'APT': '0000884269',  # ALPHA PRO TECH LTD
-    'FORA': '0001829280',  # Forian Inc.
-    'LINK': '0000828146',  # INTERLINK ELECTRONICS INC
-    'HLEO': '0001953988',  # Helio Corp /FL/
-    'CLOE': '0001849058',  # Clover Leaf Capital Corp.
-    'OPI': '0001456772',  # OFFICE PROPERTIES INCOME TRUST
-    'SSHT': '0001975222',  # SSHT S&T Group Ltd.
-    'NEUE': '0001671284',  # NeueHealth, Inc.
-    'AOGO': '0001881741',  # Arogo Capital Acquisition Corp.
-    'AREN': '0000894871',  # Arena Group Holdings, Inc.
-    'PRTS': '0001378950',  # CarParts.com, Inc.
-    'NVNI': '0001965143',  # Nvni Group Ltd
-    'CRT': '0000881787',  # CROSS TIMBERS ROYALTY TRUST
-    'IPWR': '0001507957',  # Ideal Power Inc.
-    'MIMI': '0001998560',  # Mint Inc Ltd
-    'APYX': '0000719135',  # Apyx Medical Corp
-    'GANX': '0001819411',  # Gain Therapeutics, Inc.
-    'GBBK': '0001894951',  # Global Blockchain Acquisition Corp.
-    'VRCA': '0001660334',  # Verrica Pharmaceuticals Inc.
-    'FGB': '0001392994',  # FIRST TRUST SPECIALTY FINANCE & FINANCIAL OPPORTUNITIES FUND
-    'BMR': '0001899005',  # Beamr Imaging Ltd.
-    'CNTB': '0001835268',  # Connect Biopharma Holdings Ltd
-    'CCEL': '0000862692',  # CRYO CELL INTERNATIONAL INC
-    'BGSF': '0001474903',  # BGSF, INC.
-    'NSTS': '0001881592',  # NSTS Bancorp, Inc.
-    'IMMX': '0001873835',  # Immix Biopharma, Inc.
-    'BMTX': '0001725872',  # BM Technologies, Inc.
-    'HOWL': '0001785530',  # Werewolf Therapeutics, Inc.
-    'LBGJ': '0001896425',  # Li Bang International Corp Inc.
-    'WAI': '0001938865',  # Top KingWin Ltd
-    'TORO': '0001941131',  # TORO CORP.
-    'MAQC': '0001844419',  # Maquia Capital Acquisition Corp
-    'CIIT': '0001557798',  # Tianci International, Inc.
-    'SUP': '0000095552',  # SUPERIOR INDUSTRIES INTERNATIONAL INC
-    'BRAC': '0001865120',  # Broad Capital Acquisition Corp
-    'ISPO': '0001820566',  # Inspirato Inc
-    'FURY': '0001514597',  # FURY GOLD MINES LTD
-    'OVID': '0001636651',  # Ovid Therapeutics Inc.
-    'CBKM': '0001006830',  # CONSUMERS BANCORP INC /OH/
-    'RSF': '0001644771',  # RiverNorth Capital & Income Fund, Inc.
-    'LSB': '0001946399',  # LakeShore Biopharma Co., Ltd.
-    'BAYA': '0001969475',  # Bayview Acquisition Corp
-    'FKWL': '0000722572',  # FRANKLIN WIRELESS CORP
-    'PNF': '0001140410',  # PIMCO NEW YORK MUNICIPAL INCOME FUND
-    'PODC': '0001940177',  # PodcastOne, Inc.
-    'AVNI': '0001113313',  # ARVANA INC
-    'PRLD': '0001678660',  # Prelude Therapeutics Inc
-    'KRON': '0001741830',  # Kronos Bio, Inc.
-    'LOMLF': '0001509397',  # Lion One Metals Ltd.
-    'BOTJ': '0001275101',  # BANK OF THE JAMES FINANCIAL GROUP INC
-    'REFR': '0000793524',  # RESEARCH FRONTIERS INC
-    'LOOP': '0001504678',  # Loop Industries, Inc.
-    'JUSHF': '0001909747',  # Jushi Holdings Inc.
-    'RAND': '0000081955',  # RAND CAPITAL CORP
-    'SELF': '0001031235',  # Global Self Storage, Inc.
-    'RPTX': '0001808158',  # Repare Therapeutics Inc.
-    'BEAT': '0001779372',  # HeartBeam, Inc.
-    'ESGL': '0001957538',  # ESGL Holdings Ltd
-    'STCB': '0001539850',  # Starco Brands, Inc.
-    'OTLK': '0001649989',  # Outlook Therapeutics, Inc.
-    'UWHR': '0000898171',  # UWHARRIE CAPITAL CORP
-    'CNVS': '0001173204',  # Cineverse Corp.
-    'NVNO': '0001661053',  # enVVeno Medical Corp
-    'JMM': '0000838131',  # Nuveen Multi-Market Income Fund
-    'NRXP': '0001719406',  # NRX Pharmaceuticals, Inc.
-    'UCL': '0001775898',  # uCloudlink Group Inc.
-    'STTK': '0001680367',  # Shattuck Labs, Inc.
-    'GROV': '0001841761',  # Grove Collaborative Holdings, Inc.
-    'RDGL': '0001449349',  # VIVOS INC
-    'FBIO': '0001429260',  # Fortress Biotech, Inc.
-    'ANLDF': '0001519469',  # ANFIELD ENERGY INC.
-    'CLIR': '0001434524',  # ClearSign Technologies Corp
-    'CPBI': '0001979332',  # Central Plains Bancshares, Inc.
-    'SELX': '0001990950',  # Semilux International Ltd.
-    'CCTSF': '0001865861',  # Cactus Acquisition Corp. 1 Ltd
-    'IOBT': '0001865494',  # IO Biotech, Inc.
-    'ELPW': '0002015691',  # Elong Power Holding Ltd.
-    'YYGH': '0001985337',  # YY Group Holding Ltd.
-    'TYGO': '0001855447',  # TIGO ENERGY, INC.
-    'SEOVF': '0001491434',  # SERNOVA CORP.
-    'CVU': '0000889348',  # CPI AEROSTRUCTURES INC
-    'XGN': '0001274737',  # EXAGEN INC.
-    'SPRU': '0001772720',  # SPRUCE POWER HOLDING CORP
-    'RTC': '0001381074',  # Baijiayun Group Ltd
-    'SDIG': '0001856028',  # Stronghold Digital Mining, Inc.
-    'MAIA': '0001878313',  # MAIA Biotechnology, Inc.
-    'BUJA': '0001956055',  # Bukit Jalil Global Acquisition 1 Ltd.
-    'MIND': '0000926423',  # MIND TECHNOLOGY, INC
-    'AGFY': '0001800637',  # Agrify Corp
-    'UMEWF': '0001114936',  # UMeWorld Ltd
-    'RGS': '0000716643',  # REGIS CORP
-    'GTMAY': '0001163560',  # GRUPO TMM SAB
-    'MESA': '0000810332',  # MESA AIR GROUP INC
-    'EEA': '0000791718',  # EUROPEAN EQUITY FUND, INC / MD
-    'IVVD': '0001832038',  # Invivyd, Inc.
-    'BCOW': '0001847360',  # 1895 Bancorp of Wisconsin, Inc. /MD/
-    'INLX': '0001081745',  # INTELLINETICS, INC.
-    'WAVE': '0001846715',  # Eco Wave Power Global AB (publ)
-    'UONE': '0001041657',  # URBAN ONE, INC.
-    'AIRT': '0000353184',  # AIR T INC
-    'OPTN': '0001494650',  # OptiNose, Inc.
-    'SACH': '0001682220',  # Sachem Capital Corp.
-    'HCIL': '0001086303',  # Hongchang International Co., Ltd
-    'BIRD': '0001653909',  # Allbirds, Inc.
-    'BOLD': '0001782303',  # Boundless Bio, Inc.
-    'TOP': '0001848275',  # TOP Financial Group Ltd
-    'MOBQ': '0001084267',  # Mobiquity Technologies, Inc.
-    'BEST': '0001709505',  # BEST Inc.
-    'USEG': '0000101594',  # US ENERGY CORP
-    'CLRC': '0001903392',  # ClimateRock
-    'SAVEQ': '0001498710',  # Spirit Airlines, Inc.
-    'SPRO': '0001701108',  # Spero Therapeutics, Inc.
-    'BAFN': '0001649739',  # BayFirst Financial Corp.
-    'PITA': '0001995194',  # Heramba Electric plc
-    'LEVGQ': '0001834974',  # Lion Electric Co
-    'AIXI': '0001935172',  # Xiao-I Corp
-    'LITM': '0001769697',  # Snow Lake Resources Ltd.
-    'WHEN': '0000943535',  # WORLD HEALTH ENERGY HOLDINGS, INC.
-    'EMCG': '0001869601',  # Embrace Change Acquisition Corp.
-    'MODD': '0001074871',  # Modular Medical, Inc.
-    'NHTC': '0000912061',  # NATURAL HEALTH TRENDS CORP
-    'RFAC': '0001847607',  # RF Acquisition Corp.
-    'NINE': '0001532286',  # Nine Energy Service, Inc.
-    'BHM': '0001903382',  # Bluerock Homes Trust, Inc.
-    'GEG': '0001831096',  # Great Elm Group, Inc.
-    'PDSB': '0001472091',  # PDS Biotechnology Corp
-    'HRBR': '0000899394',  # HARBOR DIVERSIFIED, INC.
-    'NUVR': '0000071557',  # Nuvera Communications, Inc.
-    'AYRWF': '0001847462',  # Ayr Wellness Inc.
-    'VNCE': '0001579157',  # VINCE HOLDING CORP.
-    'BCHT': '0000728385',  # Birchtech Corp.
-    'SWVL': '0001875609',  # Swvl Holdings Corp
-    'ANGH': '0001871983',  # Anghami Inc
-    'FTII': '0001889450',  # FutureTech II Acquisition Corp.
-    'CTSO': '0001175151',  # Cytosorbents Corp
-    'KSCP': '0001600983',  # Knightscope, Inc.
-    'MDIA': '0001784254',  # Mediaco Holding Inc.
-    'HYMC': '0001718405',  # HYCROFT MINING HOLDING CORP
-    'BEDU': '0001696355',  # Bright Scholar Education Holdings Ltd
-    'VYNE': '0001566044',  # VYNE Therapeutics Inc.
-    'TNXP': '0001430306',  # Tonix Pharmaceuticals Holding Corp.
-    'WWR': '0000839470',  # WESTWATER RESOURCES, INC.
-    'AREC': '0001590715',  # American Resources Corp
-    'MSAI': '0001863990',  # MultiSensor AI Holdings, Inc.
-    'IDN': '0001040896',  # Intellicheck, Inc.
-    'SPAI': '0002011208',  # Safe Pro Group Inc.
-    'GODN': '0001895144',  # Golden Star Acquisition Corp
-    'ALVR': '0001754068',  # Allovir, Inc.
-    'FLNT': '0001460329',  # Fluent, Inc.
-    'MPU': '0001953021',  # Mega Matrix Inc
-    'GGAAF': '0001865697',  # NeuroMind AI Corp.
-    'LATG': '0001868269',  # Chenghe Acquisition I Co.
-    'ARKR': '0000779544',  # ARK RESTAURANTS CORP
-    'AHT': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'SYHBF': '0001541190',  # SKYHARBOUR RESOURCES LTD
-    'BTTC': '0001066764',  # Bitech Technologies Corp
-    'CLST': '0001849867',  # Catalyst Bancorp, Inc.
-    'GEDC': '0001174891',  # CalEthos, Inc.
-    'ACHL': '0001830749',  # Achilles Therapeutics plc
-    'ALCY': '0001901336',  # Alchemy Investments Acquisition Corp 1
-    'NTZ': '0000900391',  # NATUZZI S P A
-    'DYAI': '0001213809',  # DYADIC INTERNATIONAL INC
-    'XLO': '0001840233',  # Xilio Therapeutics, Inc.
-    'OMIC': '0001850906',  # Singular Genomics Systems, Inc.
-    'DHAI': '0001883788',  # DIH HOLDING US, INC.
-    'LICY': '0001828811',  # Li-Cycle Holdings Corp.
-    'BEEM': '0001398805',  # Beam Global
-    'XPL': '0000917225',  # SOLITARIO RESOURCES CORP.
-    'DGHI': '0001854368',  # Digihost Technology Inc.
-    'INTZ': '0000736012',  # INTRUSION INC
-    'MPIR': '0000815577',  # Empire Diversified Energy Inc
-    'ICAD': '0000749660',  # ICAD INC
-    'SYPR': '0000864240',  # SYPRIS SOLUTIONS INC
-    'LUCD': '0001799011',  # Lucid Diagnostics Inc.
-    'OM': '0001484612',  # Outset Medical, Inc.
-    'FMY': '0001319183',  # FIRST TRUST MORTGAGE INCOME FUND
-    'CCLD': '0001582982',  # CareCloud, Inc.
-    'PVL': '0001520048',  # Permianville Royalty Trust
-    'SHLT': '0001166834',  # SHL TELEMEDICINE LTD
-    'MOBX': '0001855467',  # MOBIX LABS, INC
-    'CLGN': '0001631487',  # CollPlant Biotechnologies Ltd
-    'GLST': '0001922331',  # Global Star Acquisition Inc.
-    'CELU': '0001752828',  # Celularity Inc
-    'PVCT': '0000315545',  # PROVECTUS BIOPHARMACEUTICALS, INC.
-    'PRT': '0001724009',  # PermRock Royalty Trust
-    'TCBS': '0001849466',  # Texas Community Bancshares, Inc.
-    'KZR': '0001645666',  # Kezar Life Sciences, Inc.
-    'JANL': '0001133062',  # JANEL CORP
-    'UG': '0000101295',  # UNITED GUARDIAN INC
-    'FSI': '0001069394',  # FLEXIBLE SOLUTIONS INTERNATIONAL INC
-    'NCEW': '0001968043',  # New Century Logistics (BVI) Ltd
-    'ACFN': '0000880984',  # ACORN ENERGY, INC.
-    'AP': '0000006176',  # AMPCO PITTSBURGH CORP
-    'ZBAO': '0001966750',  # Zhibao Technology Inc.
-    'AKOM': '0001590496',  # Aerkomm Inc.
-    'DUOT': '0001396536',  # DUOS TECHNOLOGIES GROUP, INC.
-    'FCUV': '0001590418',  # FOCUS UNIVERSAL INC.
-    'NTRB': '0001676047',  # NutriBand Inc.
-    'STAI': '0001994624',  # ScanTech AI Systems Inc.
-    'AMPG': '0001518461',  # AmpliTech Group, Inc.
-    'BDL': '0000012040',  # FLANIGANS ENTERPRISES INC
-    'NRT': '0000072633',  # NORTH EUROPEAN OIL ROYALTY TRUST
-    'SCYX': '0001178253',  # SCYNEXIS INC
-    'RAPT': '0001673772',  # RAPT Therapeutics, Inc.
-    'CDIX': '0000811222',  # Cardiff Lexington Corp
-    'ITRM': '0001659323',  # Iterum Therapeutics plc
-    'CRWS': '0000025895',  # CROWN CRAFTS INC
-    'FPAY': '0001397047',  # FlexShopper, Inc.
-    'VIVK': '0001450704',  # Vivakor, Inc.
-    'ICCC': '0000811641',  # IMMUCELL CORP /DE/
-    'BLAC': '0001840425',  # Bellevue Life Sciences Acquisition Corp.
-    'WELNF': '0001877557',  # Integrated Wellness Acquisition Corp
-    'NEHC': '0002028336',  # NEW ERA HELIUM INC.
-    'HRGN': '0001563665',  # Harvard Apparatus Regenerative Technology, Inc.
-    'OPHC': '0001288855',  # OptimumBank Holdings, Inc.
-    'MNY': '0001974044',  # MoneyHero Ltd
-    'FSEA': '0001943802',  # First Seacoast Bancorp, Inc.
-    'MRMD': '0001522767',  # MARIMED INC.
-    'MDAI': '0001833498',  # Spectral AI, Inc.
-    'CFSB': '0001879103',  # CFSB Bancorp, Inc. /MA/
-    'ZCMD': '0001785566',  # Zhongchao Inc.
-    'LGCL': '0001954694',  # Lucas GC Ltd
-    'FORL': '0001936255',  # Four Leaf Acquisition Corp
-    'NXN': '0000885731',  # NUVEEN NEW YORK SELECT TAX -FREE INCOME PORTFOLIO
-    'IGTA': '0001866838',  # Inception Growth Acquisition Ltd
-    'LVLU': '0001780201',  # Lulu's Fashion Lounge Holdings, Inc.
-    'HOLO': '0001841209',  # MicroCloud Hologram Inc.
-    'IRD': '0001228627',  # Opus Genetics, Inc.
-    'JUNE': '0001897087',  # Junee Ltd
-    'SGRP': '0001004989',  # SPAR Group, Inc.
-    'PPSI': '0001449792',  # PIONEER POWER SOLUTIONS, INC.
-    'SER': '0001708599',  # Serina Therapeutics, Inc.
-    'OPXS': '0001397016',  # Optex Systems Holdings Inc
-    'INDO': '0001757840',  # Indonesia Energy Corp Ltd
-    'LEAT': '0001456189',  # Leatt Corp
-    'SYT': '0001946216',  # SYLA Technologies Co., Ltd.
-    'BDCO': '0000793306',  # BLUE DOLPHIN ENERGY CO
-    'ETST': '0001538495',  # Earth Science Tech, Inc.
-    'KTCC': '0000719733',  # KEY TRONIC CORP
-    'RPID': '0001380106',  # RAPID MICRO BIOSYSTEMS, INC.
-    'ESHA': '0001918661',  # ESH Acquisition Corp.
-    'TACT': '0001017303',  # TRANSACT TECHNOLOGIES INC
-    'ATMV': '0001937891',  # AlphaVest Acquisition Corp.
-    'GLLI': '0001888734',  # GLOBALINK INVESTMENT INC.
-    'UNXP': '0001751707',  # United Express Inc.
-    'GRCE': '0001444192',  # Grace Therapeutics, Inc.
-    'ZEPP': '0001720446',  # Zepp Health Corp
-    'ICMB': '0001578348',  # Investcorp Credit Management BDC, Inc.
-    'PRMLF': '0000795800',  # Premium Resources Ltd.
-    'YCQH': '0001794276',  # YCQH Agricultural Technology Co. Ltd
-    'PXS': '0001640043',  # Pyxis Tankers Inc.
-    'ASRV': '0000707605',  # AMERISERV FINANCIAL INC /PA/
-    'YI': '0001738906',  # 111, Inc.
-    'DTIL': '0001357874',  # PRECISION BIOSCIENCES INC
-    'MLAC': '0002029492',  # Mountain Lake Acquisition Corp.
-    'BTCS': '0001436229',  # BTCS Inc.
-    'SSVFF': '0001397616',  # SOUTHERN SILVER EXPLORATION CORP
-    'ESLA': '0001844417',  # Estrella Immunopharma, Inc.
-    'BCG': '0001953984',  # Binah Capital Group, Inc.
-    'OMCC': '0001000045',  # OLD MARKET CAPITAL Corp
-    'INVU': '0000862651',  # Investview, Inc.
-    'BRZH': '0001817640',  # Breeze Holdings Acquisition Corp.
-    'VRAR': '0001854445',  # Glimpse Group, Inc.
-    'WSTRF': '0001621906',  # Western Uranium & Vanadium Corp.
-    'BODI': '0001826889',  # Beachbody Company, Inc.
-    'PXLW': '0001040161',  # PIXELWORKS, INC
-    'TECTP': '0001766526',  # Tectonic Financial, Inc.
-    'BRNS': '0001828185',  # Barinthus Biotherapeutics plc.
-    'DWSN': '0000799165',  # DAWSON GEOPHYSICAL CO
-    'LDTC': '0001981462',  # LeddarTech Holdings Inc.
-    'JRSH': '0001696558',  # Jerash Holdings (US), Inc.
-    'DMYY': '0001915380',  # dMY Squared Technology Group, Inc.
-    'TPST': '0001544227',  # Tempest Therapeutics, Inc.
-    'WAVS': '0001868419',  # Western Acquisition Ventures Corp.
-    'RNLXY': '0001811115',  # Renalytix plc
-    'AITX': '0001498148',  # Artificial Intelligence Technology Solutions Inc.
-    'LTRN': '0001763950',  # Lantern Pharma Inc.
-    'BGFV': '0001156388',  # BIG 5 SPORTING GOODS Corp
-    'ARBK': '0001841675',  # Argo Blockchain Plc
-    'YOTA': '0001907730',  # Yotta Acquisition Corp
-    'IZEA': '0001495231',  # IZEA Worldwide, Inc.
-    'CLNN': '0001822791',  # Clene Inc.
-    'BWEN': '0001120370',  # BROADWIND, INC.
-    'MNDO': '0001119083',  # MIND CTI LTD
-    'WYY': '0001034760',  # WIDEPOINT CORP
-    'CALC': '0001534133',  # CalciMedica, Inc.
-    'ONEG': '0002030834',  # OneConstruction Group Ltd
-    'AGAE': '0001708341',  # Allied Gaming & Entertainment Inc.
-    'SHOT': '0001760903',  # Safety Shot, Inc.
-    'PASG': '0001787297',  # Passage BIO, Inc.
-    'CASI': '0001962738',  # CASI Pharmaceuticals, Inc.
-    'FGNV': '0001687919',  # FORGE INNOVATION DEVELOPMENT CORP.
-    'RFIL': '0000740664',  # R F INDUSTRIES LTD
-    'RDI': '0000716634',  # READING INTERNATIONAL INC
-    'RIVF': '0001342936',  # Rivulet Entertainment, Inc.
-    'ATNM': '0001388320',  # Actinium Pharmaceuticals, Inc.
-    'ABLV': '0001957489',  # Able View Global Inc.
-    'WINV': '0001854463',  # WinVest Acquisition Corp.
-    'QTTB': '0001661998',  # Q32 Bio Inc.
-    'DECA': '0001913577',  # Denali Capital Acquisition Corp.
-    'CMMB': '0001534248',  # Chemomab Therapeutics Ltd.
-    'WTMA': '0001866226',  # Welsbach Technology Metals Acquisition Corp.
-    'FEAM': '0001888654',  # 5E Advanced Materials, Inc.
-    'HSTC': '0000797564',  # HST Global, Inc.
-    'DXR': '0000027367',  # DAXOR CORP
-    'MALG': '0001309251',  # MICROALLIANCE GROUP INC.
-    'SCNX': '0001382574',  # Scienture Holdings, Inc.
-    'HFBL': '0001500375',  # Home Federal Bancorp, Inc. of Louisiana
-    'OMGA': '0001850838',  # Omega Therapeutics, Inc.
-    'BIVI': '0001580149',  # BIOVIE INC.
-    'ELEV': '0001783032',  # Elevation Oncology, Inc.
-    'SIDU': '0001879726',  # Sidus Space Inc.
-    'GDST': '0001858007',  # Goldenstone Acquisition Ltd.
-    'UURAF': '0001495651',  # Ucore Rare Metals Inc.
-    'HKIT': '0001742341',  # HiTek Global Inc.
-    'MCAG': '0001859035',  # Mountain Crest Acquisition Corp. V
-    'OKYO': '0001849296',  # OKYO Pharma Ltd
-    'TLF': '0000909724',  # TANDY LEATHER FACTORY INC
-    'RLYB': '0001739410',  # Rallybio Corp
-    'BHLL': '0001407583',  # Bunker Hill Mining Corp.
-    'DSWL': '0000946936',  # DESWELL INDUSTRIES INC
-    'BTCM': '0001517496',  # BIT Mining Ltd
-    'LEXX': '0001348362',  # Lexaria Bioscience Corp.
-    'RAYA': '0001825875',  # Erayak Power Solution Group Inc.
-    'OCC': '0001000230',  # OPTICAL CABLE CORP
-    'RAVE': '0000718332',  # RAVE RESTAURANT GROUP, INC.
-    'ANTX': '0001880438',  # AN2 Therapeutics, Inc.
-    'GIFT': '0001760233',  # GIFTIFY, INC.
-    'HHS': '0000045919',  # HARTE HANKS INC
-    'GRF': '0000850027',  # EAGLE CAPITAL GROWTH FUND, INC.
-    'DALN': '0001413898',  # DallasNews Corp
-    'LQMT': '0001141240',  # LIQUIDMETAL TECHNOLOGIES INC
-    'NXL': '0001527352',  # Nexalin Technology, Inc.
-    'ITHUF': '0001643154',  # iANTHUS CAPITAL HOLDINGS, INC.
-    'SOHO': '0001301236',  # Sotherly Hotels Inc.
-    'FARM': '0000034563',  # FARMER BROTHERS CO
-    'SRZN': '0001824893',  # Surrozen, Inc./DE
-    'SJ': '0001753673',  # Scienjoy Holding Corp
-    'SNYR': '0001562733',  # Synergy CHC Corp.
-    'HTCR': '0001892322',  # HeartCore Enterprises, Inc.
-    'CENN': '0001707919',  # Cenntro Inc.
-    'MOVE': '0001734750',  # Movano Inc.
-    'CUBA': '0000880406',  # HERZFELD CARIBBEAN BASIN FUND INC
-    'MKZR': '0001550913',  # MacKenzie Realty Capital, Inc.
-    'EBON': '0001799290',  # Ebang International Holdings Inc.
-    'FRLA': '0001849294',  # Fortune Rise Acquisition Corp
-    'BRFH': '0001487197',  # BARFRESH FOOD GROUP INC.
-    'SABS': '0001833214',  # SAB Biotherapeutics, Inc.
-    'RAIN': '0002028293',  # Rain Enhancement Technologies Holdco, Inc.
-    'HSON': '0001210708',  # Hudson Global, Inc.
-    'SFRX': '0001106213',  # SEAFARER EXPLORATION CORP
-    'TURN': '0000893739',  # 180 DEGREE CAPITAL CORP. /NY/
-    'AERT': '0001853044',  # Aeries Technology, Inc.
-    'JG': '0001737339',  # Aurora Mobile Ltd
-    'OCX': '0001642380',  # Oncocyte Corp
-    'DIST': '0001818605',  # Distoken Acquisition Corp
-    'INTE': '0001850262',  # Integral Acquisition Corp 1
-    'MXE': '0000863900',  # MEXICO EQUITY & INCOME FUND INC
-    'DEFG': '0001874907',  # Grayscale Decentralized Finance (DeFi) Fund LLC
-    'ORIS': '0001964664',  # ORIENTAL RISE HOLDINGS Ltd
-    'SOND': '0001819395',  # Sonder Holdings Inc.
-    'VTVT': '0001641489',  # vTv Therapeutics Inc.
-    'ENZ': '0000316253',  # ENZO BIOCHEM INC
-    'VSTE': '0001964630',  # Vast Renewables Ltd
-    'EGF': '0001336050',  # BlackRock Enhanced Government Fund, Inc.
-    'CRCUF': '0000868822',  # Canagold Resources Ltd.
-    'ZDGE': '0001667313',  # Zedge, Inc.
-    'MTC': '0001742518',  # MMTec, Inc.
-    'ECDA': '0001922858',  # ECD Automotive Design, Inc.
-    'NMTC': '0001500198',  # NEUROONE MEDICAL TECHNOLOGIES Corp
-    'LGL': '0000061004',  # LGL GROUP INC
-    'PBBK': '0001849670',  # PB Bankshares, Inc.
-    'WBQNL': '0001785494',  # Woodbridge Liquidation Trust
-    'SVRSF': '0001682056',  # Silver Storm Mining Ltd.
-    'KORE': '0001855457',  # KORE Group Holdings, Inc.
-    'FOXX': '0002013807',  # Foxx Development Holdings Inc.
-    'AUSI': '0000826253',  # AURA SYSTEMS INC
-    'HBUV': '0001639068',  # Hubilu Venture Corp
-    'SVMH': '0001973368',  # SRIVARU Holding Ltd
-    'BIOF': '0001549145',  # BLUE BIOFUELS, INC.
-    'SURG': '0001392694',  # SurgePays, Inc.
-    'ISDR': '0000843006',  # ISSUER DIRECT CORP
-    'PMN': '0001374339',  # ProMIS Neurosciences Inc.
-    'CLOQ': '0001437517',  # CYBERLOQ TECHNOLOGIES, INC.
-    'MASK': '0001993097',  # 3 E Network Technology Group Ltd
-    'MTEN': '0001948099',  # Mingteng International Corp Inc.
-    'CXAI': '0001820875',  # CXApp Inc.
-    'AWRE': '0001015739',  # AWARE INC /MA/
-    'CBSTF': '0001776738',  # Cannabist Co Holdings Inc.
-    'TZUP': '0001853825',  # THUMZUP MEDIA Corp
-    'CWPE': '0001741220',  # CW Petroleum Corp
-    'SKKY': '0001546853',  # Skkynet Cloud Systems, Inc.
-    'GDTC': '0001873093',  # CytoMed Therapeutics Ltd
-    'FGL': '0001989930',  # Founder Group Ltd
-    'CPIX': '0001087294',  # CUMBERLAND PHARMACEUTICALS INC
-    'FTHM': '0001753162',  # Fathom Holdings Inc.
-    'AGMH': '0001705402',  # AGM GROUP HOLDINGS, INC.
-    'MBOT': '0000883975',  # Microbot Medical Inc.
-    'GFGSF': '0001684888',  # GFG Resources Inc.
-    'GLE': '0001908705',  # Global Engine Group Holding Ltd
-    'TRSG': '0001943444',  # Tungray Technologies Inc
-    'MLEC': '0001937737',  # Moolec Science SA
-    'WCT': '0001990251',  # Wellchange Holdings Co Ltd
-    'DTST': '0001419951',  # Data Storage Corp
-    'GROW': '0000754811',  # U S GLOBAL INVESTORS INC
-    'BTM': '0001901799',  # Bitcoin Depot Inc.
-    'PYN': '0001181505',  # PIMCO NEW YORK MUNICIPAL INCOME FUND III
-    'TOPS': '0001296484',  # TOP SHIPS INC.
-    'AXREF': '0001175596',  # AMARC RESOURCES LTD
-    'RENT': '0001468327',  # Rent the Runway, Inc.
-    'RNXT': '0001574094',  # RenovoRx, Inc.
-    'NXPL': '0001058307',  # NextPlat Corp
-    'NTIP': '0001065078',  # NETWORK-1 TECHNOLOGIES, INC.
-    'BNIX': '0001845942',  # Bannix Acquisition Corp.
-    'IXHL': '0001873875',  # Incannex Healthcare Inc.
-    'SODI': '0000091668',  # SOLITRON DEVICES INC
-    'KALA': '0001479419',  # KALA BIO, Inc.
-    'PXPC': '0001785493',  # Phoenix Plus Corp.
-    'DRIO': '0001533998',  # DarioHealth Corp.
-    'INTS': '0001567264',  # INTENSITY THERAPEUTICS, INC.
-    'CRMZ': '0000315958',  # CREDITRISKMONITOR COM INC
-    'BNGO': '0001411690',  # Bionano Genomics, Inc.
-    'AKTX': '0001541157',  # Akari Therapeutics Plc
-    'RVSN': '0001743905',  # Rail Vision Ltd.
-    'KPEA': '0001502557',  # Kun Peng International Ltd.
-    'XBP': '0001839530',  # XBP Europe Holdings, Inc.
-    'MDCX': '0001997296',  # Medicus Pharma Ltd.
-    'MTBLY': '0001509223',  # Moatable, Inc.
-    'AAQL': '0001672571',  # Antiaging Quantum Living Inc.
-    'CGTX': '0001455365',  # COGNITION THERAPEUTICS INC
-    'ONMD': '0001849380',  # OneMedNet Corp
-    'LSTA': '0000320017',  # LISATA THERAPEUTICS, INC.
-    'CIF': '0000833021',  # MFS INTERMEDIATE HIGH INCOME FUND
-    'GEVI': '0000894556',  # General Enterprise Ventures, Inc.
-    'WKHS': '0001425287',  # Workhorse Group Inc.
-    'MOGO': '0001602842',  # Mogo Inc.
-    'FTEK': '0000846913',  # FUEL TECH, INC.
-    'BCAB': '0001826892',  # BioAtla, Inc.
-    'NTWK': '0001039280',  # NETSOL TECHNOLOGIES INC
-    'LUNA': '0001239819',  # LUNA INNOVATIONS INC
-    'NDLS': '0001275158',  # NOODLES & Co
-    'AACG': '0001420529',  # ATA Creativity Global
-    'AAME': '0000008177',  # ATLANTIC AMERICAN CORP
-    'CTXR': '0001506251',  # Citius Pharmaceuticals, Inc.
-    'SCOR': '0001158172',  # COMSCORE, INC.
-    'POCI': '0000867840',  # PRECISION OPTICS CORPORATION, INC.
-    'CLPS': '0001724542',  # CLPS Inc
-    'EDRY': '0001731388',  # EuroDry Ltd.
-    'APWC': '0001026980',  # ASIA PACIFIC WIRE & CABLE CORP LTD
-    'PRKA': '0001297937',  # PARKS AMERICA, INC
-    'AXDX': '0000727207',  # Accelerate Diagnostics, Inc
-    'TPCS': '0001328792',  # TECHPRECISION CORP
-    'JETMF': '0001846084',  # Global Crossing Airlines Group Inc.
-    'SWIN': '0001959224',  # Solowin Holdings, Ltd.
-    'COCH': '0001840877',  # Envoy Medical, Inc.
-    'VPLM': '0001410738',  # Voip-pal.com Inc
-    'CVM': '0000725363',  # CEL SCI CORP
-    'IGXT': '0001098880',  # IntelGenx Technologies Corp.
-    'ZOOZ': '0001992818',  # ZOOZ Power Ltd.
-    'MRNS': '0001267813',  # MARINUS PHARMACEUTICALS, INC.
-    'GVXXF': '0001490596',  # GoviEx Uranium Inc.
-    'UBX': '0001463361',  # Unity Biotechnology, Inc.
-    'MRKR': '0001094038',  # Marker Therapeutics, Inc.
-    'SLGL': '0001684693',  # Sol-Gel Technologies Ltd.
-    'XCUR': '0001698530',  # EXICURE, INC.
-    'IPW': '0001830072',  # iPower Inc.
-    'HYFM': '0001695295',  # HYDROFARM HOLDINGS GROUP, INC.
-    'AQU': '0001861063',  # Aquaron Acquisition Corp.
-    'SPAZF': '0001337090',  # SPANISH MOUNTAIN GOLD LTD.
-    'MTEK': '0001872964',  # Maris Tech Ltd.
-    'SFCO': '0001831523',  # Southern Financial Corp
-    'BATL': '0001282648',  # BATTALION OIL CORP
-    'GP': '0001584547',  # GREENPOWER MOTOR Co INC.
-    'PCSV': '0001122020',  # PCS Edventures!, Inc.
-    'VVOS': '0001716166',  # Vivos Therapeutics, Inc.
-    'ATHE': '0001131343',  # ALTERITY THERAPEUTICS LTD
-    'CVKD': '0001937993',  # Cadrenal Therapeutics, Inc.
-    'PGHL': '0001966678',  # Primega Group Holdings Ltd
-    'PMEC': '0001891944',  # Primech Holdings Ltd
-    'MBBC': '0001835385',  # Marathon Bancorp, Inc. /MD/
-    'WKSP': '0001096275',  # Worksport Ltd
-    'INTG': '0000069422',  # INTERGROUP CORP
-    'BGI': '0001179821',  # BIRKS GROUP INC.
-    'XOS': '0001819493',  # Xos, Inc.
-    'BNAI': '0001838163',  # Brand Engagement Network Inc.
-    'HUIZ': '0001778982',  # Huize Holding Ltd
-    'ITXXF': '0001677912',  # Itaconix Plc
-    'FENG': '0001509646',  # Phoenix New Media Ltd
-    'CRIS': '0001108205',  # CURIS INC
-    'KPLT': '0001785424',  # Katapult Holdings, Inc.
-    'LIVE': '0001045742',  # LIVE VENTURES Inc
-    'GORO': '0001160791',  # GOLD RESOURCE CORP
-    'INKT': '0001840229',  # MiNK Therapeutics, Inc.
-    'GLGI': '0001088413',  # GREYSTONE LOGISTICS, INC.
-    'JZ': '0001852440',  # Jianzhi Education Technology Group Co Ltd
-    'FLUX': '0001083743',  # Flux Power Holdings, Inc.
-    'TURB': '0001963439',  # Turbo Energy, S.A.
-    'XAIR': '0001641631',  # Beyond Air, Inc.
-    'CDIO': '0001870144',  # Cardio Diagnostics Holdings, Inc.
-    'VRME': '0001104038',  # VerifyMe, Inc.
-    'AGXPF': '0001482436',  # SILVER X MINING CORP.
-    'CREX': '0001356093',  # CREATIVE REALITIES, INC.
-    'GAME': '0001714562',  # GameSquare Holdings, Inc.
-    'SVT': '0000089140',  # SERVOTRONICS INC /DE/
-    'GLBS': '0001499780',  # GLOBUS MARITIME LTD
-    'ROLR': '0001947210',  # High Roller Technologies, Inc.
-    'PWM': '0001765850',  # Prestige Wealth Inc.
-    'MTEX': '0001056358',  # MANNATECH INC
-    'GFAI': '0001804469',  # Guardforce AI Co., Ltd.
-    'ANY': '0001591956',  # Sphere 3D Corp.
-    'VWFB': '0001913838',  # VWF Bancorp, Inc.
-    'SPI': '0001210618',  # SPI Energy Co., Ltd.
-    'DTCK': '0001949478',  # DAVIS COMMODITIES Ltd
-    'QNTO': '0001391933',  # QUAINT OAK BANCORP INC
-    'DYNR': '0001111741',  # DYNARESOURCE, INC.
-    'OESX': '0001409375',  # ORION ENERGY SYSTEMS, INC.
-    'CNXX': '0001823000',  # CONX Corp.
-    'MDWK': '0001295514',  # MDWerks, Inc.
-    'BANL': '0001914805',  # CBL International Ltd
-    'COOT': '0001959994',  # Australian Oilseeds Holdings Ltd
-    'HUDA': '0001853047',  # Hudson Acquisition I Corp.
-    'VHC': '0001082324',  # VirnetX Holding Corp
-    'EMKR': '0000808326',  # EMCORE CORP
-    'NSYS': '0000722313',  # NORTECH SYSTEMS INC
-    'HMBL': '0001119190',  # HUMBL, INC.
-    'DZSI': '0001101680',  # DZS INC.
-    'PMAX': '0002012096',  # Powell Max Ltd
-    'SAG': '0001933951',  # SAG Holdings Ltd
-    'CNFN': '0001352952',  # CFN Enterprises Inc.
-    'NOM': '0000899782',  # NUVEEN MISSOURI QUALITY MUNICIPAL INCOME FUND
-    'IRME': '0001839133',  # IR-Med, Inc.
-    'DARE': '0001401914',  # Dare Bioscience, Inc.
-    'LIDR': '0001818644',  # AEye, Inc.
-    'AXIL': '0001718500',  # Axil Brands, Inc.
-    'CMBM': '0001738177',  # Cambium Networks Corp
-    'IRIX': '0001006045',  # IRIDEX CORP
-    'NISN': '0001603993',  # Nisun International Enterprise Development Group Co., Ltd
-    'APHP': '0001771995',  # American Picture House Corp
-    'EQMEF': '0001792554',  # Equity Metals Corp
-    'SKYQ': '0001812447',  # Sky Quarry Inc.
-    'CTRM': '0001720161',  # Castor Maritime Inc.
-    'MOB': '0001898643',  # Mobilicom Ltd
-    'IGC': '0001326205',  # IGC Pharma, Inc.
-    'NAHD': '0001485029',  # New Asia Holdings, Inc.
-    'ABCP': '0000020639',  # AmBase Corp
-    'CODX': '0001692415',  # Co-Diagnostics, Inc.
-    'LITB': '0001523836',  # LightInTheBox Holding Co., Ltd.
-    'LGVN': '0001721484',  # Longeveron Inc.
-    'BLRX': '0001498403',  # BioLineRx Ltd.
-    'SFHG': '0001926792',  # SAMFINE CREATION HOLDINGS GROUP Ltd
-    'JOB': '0000040570',  # GEE Group Inc.
-    'IEHC': '0000050292',  # IEH Corp
-    'PTN': '0000911216',  # PALATIN TECHNOLOGIES INC
-    'MXC': '0000066418',  # MEXCO ENERGY CORP
-    'GTIM': '0000825324',  # Good Times Restaurants Inc.
-    'FCCI': '0001807689',  # FAST CASUAL CONCEPTS, INC.
-    'NAII': '0000787253',  # NATURAL ALTERNATIVES INTERNATIONAL INC
-    'MHUBF': '0001869137',  # MineHub Technologies Inc.
-    'AMOD': '0001862463',  # ALPHA MODUS HOLDINGS, INC.
-    'LPCN': '0001535955',  # Lipocine Inc.
-    'LRE': '0001888980',  # LEAD REAL ESTATE CO., LTD
-    'CETI': '0001935092',  # Cyber Enviro-Tech, Inc.
-    'PAYD': '0001017655',  # PAID INC
-    'NAAS': '0001712178',  # NaaS Technology Inc.
-    'UTSI': '0001030471',  # UTSTARCOM HOLDINGS CORP.
-    'GTEC': '0001735041',  # Greenland Technologies Holding Corp.
-    'SOWG': '0001490161',  # Sow Good Inc.
-    'LVTX': '0001840748',  # LAVA Therapeutics NV
-    'HOOK': '0001760542',  # HOOKIPA Pharma Inc.
-    'EPOW': '0001780731',  # Sunrise New Energy Co., Ltd.
-    'ENLV': '0001596812',  # Enlivex Therapeutics Ltd.
-    'DRCT': '0001880613',  # Direct Digital Holdings, Inc.
-    'FGF': '0001591890',  # Fundamental Global Inc.
-    'DAIO': '0000351998',  # DATA I/O CORP
-    'TMRC': '0001445942',  # Texas Mineral Resources Corp.
-    'EQ': '0001746466',  # Equillium, Inc.
-    'TRT': '0000732026',  # TRIO-TECH INTERNATIONAL
-    'OXBR': '0001584831',  # OXBRIDGE RE HOLDINGS Ltd
-    'ELBM': '0001907184',  # Electra Battery Materials Corp
-    'LCGMF': '0001339688',  # LION COPPER & GOLD CORP.
-    'FEMY': '0001339005',  # FEMASYS INC
-    'IBIO': '0001420720',  # iBio, Inc.
-    'DRRX': '0001082038',  # DURECT CORP
-    'MSS': '0001892292',  # Maison Solutions Inc.
-    'CHR': '0001738758',  # Cheer Holding, Inc.
-    'NGLD': '0001605481',  # Nevada Canyon Gold Corp.
-    'BNRG': '0001901215',  # Brenmiller Energy Ltd.
-    'PZG': '0001629210',  # Paramount Gold Nevada Corp.
-    'HGTXU': '0000862022',  # HUGOTON ROYALTY TRUST
-    'TRAW': '0001130598',  # Traws Pharma, Inc.
-    'NYC': '0001595527',  # American Strategic Investment Co.
-    'UCAR': '0001939780',  # U Power Ltd
-    'PRZO': '0001916241',  # ParaZero Technologies Ltd.
-    'NRSN': '0001875091',  # NeuroSense Therapeutics Ltd.
-    'KFFB': '0001297341',  # Kentucky First Federal Bancorp
-    'HUDI': '0001791725',  # Huadi International Group Co., Ltd.
-    'CVV': '0000766792',  # CVD EQUIPMENT CORP
-    'MMTIF': '0001085921',  # MICROMEM TECHNOLOGIES INC
-    'HCMC': '0000844856',  # Healthier Choices Management Corp.
-    'SMSI': '0000948708',  # SMITH MICRO SOFTWARE, INC.
-    'CNTM': '0001895249',  # ConnectM Technology Solutions, Inc.
-    'RAY': '0001948443',  # Raytech Holding Ltd
-    'KLNG': '0001110607',  # Koil Energy Solutions, Inc.
-    'CKX': '0000352955',  # CKX LANDS, INC.
-    'CPSH': '0000814676',  # CPS TECHNOLOGIES CORP/DE/
-    'SCIA': '0000830616',  # SCI Engineered Materials, Inc.
-    'WLGS': '0001899658',  # WANG & LEE GROUP, Inc.
-    'LRDC': '0001442492',  # Laredo Oil, Inc.
-    'LUDG': '0001960262',  # LUDWIG ENTERPRISES, INC.
-    'RSRV': '0000083350',  # RESERVE PETROLEUM CO
-    'HOVR': '0001930021',  # New Horizon Aircraft Ltd.
-    'PSHG': '0001481241',  # Performance Shipping Inc.
-    'NRDE': '0001759546',  # NU RIDE INC.
-    'XELA': '0001620179',  # Exela Technologies, Inc.
-    'BSGM': '0001530766',  # BioSig Technologies, Inc.
-    'TOON': '0001355848',  # Kartoon Studios, Inc.
-    'PLUR': '0001158780',  # Pluri Inc.
-    'VCIG': '0001930510',  # VCI Global Ltd
-    'NXGL': '0001468929',  # NEXGEL, INC.
-    'REED': '0001140215',  # REED'S, INC.
-    'COCP': '0001412486',  # Cocrystal Pharma, Inc.
-    'IINN': '0001837493',  # Inspira Technologies OXY B.H.N. Ltd
-    'GRYP': '0001755953',  # Gryphon Digital Mining, Inc.
-    'TRIB': '0000888721',  # TRINITY BIOTECH PLC
-    'OCG': '0001776067',  # Oriental Culture Holding LTD
-    'MKTW': '0001805651',  # MARKETWISE, INC.
-    'IHT': '0000082473',  # INNSUITES HOSPITALITY TRUST
-    'ONEI': '0001388295',  # OneMeta Inc.
-    'ZKIN': '0001687451',  # ZK International Group Co., Ltd.
-    'SYNX': '0001976443',  # Silynxcom Ltd.
-    'TOI': '0001799191',  # Oncology Institute, Inc.
-    'TOMZ': '0000314227',  # TOMI Environmental Solutions, Inc.
-    'AIFU': '0001413855',  # AIX Inc.
-    'INAB': '0001740279',  # IN8BIO, INC.
-    'SIF': '0000090168',  # SIFCO INDUSTRIES INC
-    'HUSA': '0001156041',  # HOUSTON AMERICAN ENERGY CORP
-    'CRVW': '0001377149',  # CareView Communications Inc
-    'NXTC': '0001661059',  # NextCure, Inc.
-    'FRSX': '0001691221',  # Foresight Autonomous Holdings Ltd.
-    'DFLI': '0001847986',  # Dragonfly Energy Holdings Corp.
-    'RVP': '0000946563',  # RETRACTABLE TECHNOLOGIES INC
-    'KENS': '0000055234',  # KENILWORTH SYSTEMS CORP
-    'SHFS': '0001854963',  # SHF Holdings, Inc.
-    'CHKR': '0001524769',  # CHESAPEAKE GRANITE WASH TRUST
-    'ZBAI': '0001755058',  # ATIF Holdings Ltd
-    'PULM': '0001574235',  # Pulmatrix, Inc.
-    'OCEA': '0001869974',  # Ocean Biomedical, Inc.
-    'GDC': '0001641398',  # GD Culture Group Ltd
-    'MFON': '0001447380',  # MOBIVITY HOLDINGS CORP.
-    'CARA': '0001346830',  # Cara Therapeutics, Inc.
-    'BTCT': '0001796514',  # BTC Digital Ltd.
-    'GELS': '0001920092',  # Gelteq Ltd
-    'SLNH': '0000064463',  # Soluna Holdings, Inc
-    'JSDA': '0001083522',  # JONES SODA CO
-    'ATHA': '0001620463',  # Athira Pharma, Inc.
-    'BKUCF': '0001463978',  # BLUE SKY URANIUM CORP.
-    'LSH': '0001996192',  # Lakeside Holding Ltd
-    'HUBC': '0001905660',  # Hub Cyber Security Ltd.
-    'GOVX': '0000832489',  # GeoVax Labs, Inc.
-    'TENX': '0000034956',  # TENAX THERAPEUTICS, INC.
-    'JVA': '0001007019',  # COFFEE HOLDING CO INC
-    'MCVT': '0001425355',  # Mill City Ventures III, Ltd
-    'KIRK': '0001056285',  # KIRKLAND'S, INC
-    'BOSC': '0001005516',  # BOS BETTER ONLINE SOLUTIONS LTD
-    'CETY': '0001329606',  # Clean Energy Technologies, Inc.
-    'FEDU': '0001709819',  # Four Seasons Education (Cayman) Inc.
-    'INIS': '0001038277',  # INTERNATIONAL ISOTOPES INC
-    'KUKE': '0001809158',  # Kuke Music Holding Ltd
-    'PYPD': '0001611842',  # PolyPid Ltd.
-    'LTCH': '0001826000',  # Latch, Inc.
-    'CCTG': '0001931717',  # CCSC Technology International Holdings Ltd
-    'EZFL': '0001817004',  # EzFill Holdings Inc
-    'RMCF': '0001616262',  # Rocky Mountain Chocolate Factory, Inc.
-    'ASPS': '0001462418',  # ALTISOURCE PORTFOLIO SOLUTIONS S.A.
-    'RNGE': '0001438943',  # RANGE IMPACT, INC.
-    'STEC': '0001785680',  # Santech Holdings Ltd
-    'PGTK': '0001553404',  # Pacific Green Technologies Inc.
-    'FEBO': '0001957001',  # Fenbo Holdings Ltd
-    'CDTG': '0001793895',  # CDT Environmental Technology Investment Holdings Ltd
-    'INHD': '0001961847',  # INNO HOLDINGS INC.
-    'VSEE': '0001864531',  # VSEE HEALTH, INC.
-    'MLGO': '0001800392',  # MicroAlgo Inc.
-    'GNRV': '0001418489',  # GRAND RIVER COMMERCE INC
-    'YTFD': '0001311673',  # Yale Transaction Finders, Inc.
-    'KITT': '0001849820',  # Nauticus Robotics, Inc.
-    'IBO': '0001834105',  # IMPACT BIOMEDICAL INC.
-    'MIRA': '0001904286',  # MIRA PHARMACEUTICALS, INC.
-    'BOLT': '0001641281',  # Bolt Biotherapeutics, Inc.
-    'WRPT': '0001842138',  # WARPSPEED TAXI INC.
-    'ATER': '0001757715',  # Aterian, Inc.
-    'NMEX': '0001415744',  # NORTHERN MINERALS & EXPLORATION LTD.
-    'CXXIF': '0000831609',  # C21 Investments Inc.
-    'CCM': '0001472072',  # Concord Medical Services Holdings Ltd
-    'RMSG': '0001983324',  # Real Messenger Corp
-    'LTRPA': '0001606745',  # Liberty TripAdvisor Holdings, Inc.
-    'CYTH': '0000922247',  # Cyclo Therapeutics, Inc.
-    'APRE': '0001781983',  # Aprea Therapeutics, Inc.
-    'WETH': '0001826660',  # Wetouch Technology Inc.
-    'BASA': '0001448705',  # BASANITE, INC.
-    'AMS': '0000744825',  # AMERICAN SHARED HOSPITAL SERVICES
-    'PUBC': '0001575858',  # PureBase Corp
-    'VASO': '0000839087',  # VASO Corp
-    'DPRO': '0001786286',  # Draganfly Inc.
-    'GYRO': '0001589061',  # Gyrodyne, LLC
-    'EQTRF': '0001635729',  # Altamira Gold Corp.
-    'GWSO': '0001430300',  # Global Warming Solutions, Inc.
-    'MOGU': '0001743971',  # MOGU Inc.
-    'XITO': '0001651932',  # Xenous Holdings, Inc.
-    'PETV': '0001512922',  # PetVivo Holdings, Inc.
-    'LNBY': '0001672572',  # Landbay Inc
-    'AIFF': '0000803578',  # FIREFLY NEUROSCIENCE, INC.
-    'SUND': '0001171838',  # Sundance Strategies, Inc.
-    'EVTV': '0001563568',  # Envirotech Vehicles, Inc.
-    'NNVC': '0001379006',  # NANOVIRICIDES, INC.
-    'AFMD': '0001608390',  # Affimed N.V.
-    'BLIN': '0001378590',  # Bridgeline Digital, Inc.
-    'OMEX': '0000798528',  # ODYSSEY MARINE EXPLORATION INC
-    'WNDW': '0001071840',  # SolarWindow Technologies, Inc.
-    'COHN': '0001270436',  # Cohen & Co Inc.
-    'SOS': '0001346610',  # SOS Ltd
-    'SDOT': '0001701756',  # Sadot Group Inc.
-    'CLRO': '0000840715',  # CLEARONE INC
-    'SPCB': '0001291855',  # SuperCom Ltd
-    'CARM': '0001485003',  # Carisma Therapeutics Inc.
-    'GREE': '0001844971',  # Greenidge Generation Holdings Inc.
-    'CAPT': '0001967478',  # Captivision Inc.
-    'ELSE': '0000351789',  # ELECTRO SENSORS INC
-    'GIGM': '0001105101',  # GIGAMEDIA Ltd
-    'EDTK': '0001782309',  # Skillful Craftsman Education Technology Ltd
-    'RAPH': '0001415397',  # Raphael Pharmaceutical Inc.
-    'NITO': '0001789192',  # N2OFF, Inc.
-    'CWBHF': '0001750155',  # Charlotte's Web Holdings, Inc.
-    'IZM': '0001854572',  # ICZOOM Group Inc.
-    'PFSB': '0001967656',  # PFS Bancorp, Inc.
-    'YYAI': '0001674440',  # Connexa Sports Technologies Inc.
-    'PLAG': '0001117057',  # Planet Green Holdings Corp.
-    'BTAI': '0001720893',  # BioXcel Therapeutics, Inc.
-    'NWGL': '0001948294',  # Nature Wood Group Ltd
-    'BFRG': '0001829247',  # BullFrog AI Holdings, Inc.
-    'YHC': '0001843165',  # LQR House Inc.
-    'NXTT': '0001784970',  # Next Technology Holding Inc.
-    'CLIK': '0002020027',  # Click Holdings Ltd.
-    'LOCL': '0001840780',  # Local Bounti Corporation/DE
-    'SNTI': '0001854270',  # Senti Biosciences, Inc.
-    'JFU': '0001619544',  # 9F Inc.
-    'AASP': '0000930245',  # GLOBAL ACQUISITIONS Corp
-    'XTKG': '0001754323',  # X3 Holdings Co., Ltd.
-    'NNUP': '0000888981',  # NOCOPI TECHNOLOGIES INC/MD/
-    'IPM': '0001355839',  # INTELLIGENT PROTECTION MANAGEMENT CORP.
-    'WVVI': '0000838875',  # WILLAMETTE VALLEY VINEYARDS INC
-    'RCG': '0000919567',  # RENN Fund, Inc.
-    'ZEOX': '0001557376',  # Zeo ScientifiX, Inc.
-    'BCTX': '0001610820',  # BriaCell Therapeutics Corp.
-    'MTVA': '0001638287',  # MetaVia Inc.
-    'MEIP': '0001262104',  # MEI Pharma, Inc.
-    'WNLV': '0001558740',  # Winvest Group Ltd
-    'RETO': '0001687277',  # ReTo Eco-Solutions, Inc.
-    'BHV': '0001169034',  # BLACKROCK VIRGINIA MUNICIPAL BOND TRUST
-    'JDZG': '0001976908',  # JIADE Ltd
-    'MGIH': '0001903995',  # Millennium Group International Holdings Ltd
-    'GLXG': '0001905920',  # Galaxy Payroll Group Ltd
-    'AIEV': '0001912582',  # Thunder Power Holdings, Inc.
-    'RLBY': '0000034285',  # RELIABILITY INC
-    'GEBRF': '0001570843',  # Greenbriar Sustainable Living Inc.
-    'DUO': '0001750593',  # Fangdd Network Group Ltd.
-    'SONM': '0001178697',  # SONIM TECHNOLOGIES INC
-    'EKSO': '0001549084',  # EKSO BIONICS HOLDINGS, INC.
-    'NRXS': '0001933567',  # Neuraxis, INC
-    'HITC': '0001584693',  # Healthcare Integrated Technologies Inc.
-    'NXU': '0001722969',  # Nxu, Inc.
-    'CRVO': '0001053691',  # CervoMed Inc.
-    'LIQT': '0001307579',  # LIQTECH INTERNATIONAL INC
-    'SPPL': '0001948697',  # SIMPPLE LTD.
-    'GRFX': '0001816723',  # Graphex Group Ltd
-    'DEVS': '0001854480',  # DevvStream Corp.
-    'CRTG': '0001375195',  # CORETEC GROUP INC.
-    'JCTC': '0000885307',  # JEWETT CAMERON TRADING CO LTD
-    'GLYC': '0001253689',  # GLYCOMIMETICS INC
-    'MNTS': '0001781162',  # Momentus Inc.
-    'CLDI': '0001855485',  # Calidi Biotherapeutics, Inc.
-    'HCWC': '0001948864',  # HEALTHY CHOICE WELLNESS CORP.
-    'MDRR': '0001654595',  # Medalist Diversified REIT, Inc.
-    'NKGN': '0001845459',  # NKGen Biotech, Inc.
-    'SAIH': '0001847075',  # SAIHEAT Ltd
-    'SGLA': '0001433551',  # Sino Green Land Corp.
-    'GLAI': '0001473490',  # Global AI, Inc.
-    'CPOP': '0001807389',  # Pop Culture Group Co., Ltd
-    'HCWB': '0001828673',  # HCW Biologics Inc.
-    'TBTC': '0001090396',  # TABLE TRAC INC
-    'SYBX': '0001527599',  # SYNLOGIC, INC.
-    'MIGI': '0001218683',  # Mawson Infrastructure Group Inc.
-    'BBGI': '0001099160',  # BEASLEY BROADCAST GROUP INC
-    'LOBO': '0001932072',  # LOBO EV TECHNOLOGIES LTD
-    'BFNH': '0001310488',  # BIOFORCE NANOSCIENCES HOLDINGS, INC.
-    'JL': '0001948436',  # J-Long Group Ltd
-    'LFWD': '0001607962',  # Lifeward Ltd.
-    'LYT': '0001816319',  # Lytus Technologies Holdings PTV. Ltd.
-    'GOEV': '0001750153',  # Canoo Inc.
-    'GLBZ': '0000890066',  # GLEN BURNIE BANCORP
-    'FLGC': '0001790169',  # Flora Growth Corp.
-    'LNKS': '0001972074',  # Linkers Industries Ltd
-    'PNST': '0001852633',  # Pinstripes Holdings, Inc.
-    'AQMS': '0001621832',  # Aqua Metals, Inc.
-    'SUGP': '0001969863',  # SU Group Holdings Ltd
-    'ABTS': '0001864055',  # Abits Group Inc
-    'EXDW': '0001634293',  # Exceed World, Inc.
-    'DTSS': '0001631282',  # DATASEA INC.
-    'IPA': '0001715925',  # ImmunoPrecise Antibodies Ltd.
-    'SKK': '0001991261',  # SKK Holdings Ltd
-    'CLNV': '0001391426',  # Clean Vision Corp
-    'DMN': '0002000640',  # Damon Inc.
-    'YHGJ': '0001042187',  # YUNHONG GREEN CTI LTD.
-    'NEPH': '0001196298',  # NEPHROS INC
-    'PRPH': '0000868278',  # ProPhase Labs, Inc.
-    'QMMM': '0001971542',  # QMMM Holdings Ltd
-    'BRN': '0000010048',  # BARNWELL INDUSTRIES INC
-    'CING': '0001862150',  # Cingulate Inc.
-    'GNOLF': '0001261002',  # GENOIL INC
-    'AUST': '0001817740',  # Austin Gold Corp.
-    'KNW': '0001074828',  # KNOW LABS, INC.
-    'DATS': '0001648960',  # DatChat, Inc.
-    'CFOO': '0001310630',  # China Foods Holdings Ltd.
-    'QZMRF': '0000811522',  # QUARTZ MOUNTAIN RESOURCES LTD
-    'SRLZF': '0000861972',  # Salazar Resources Ltd
-    'PIAC': '0000845385',  # PRINCETON CAPITAL CORP
-    'PMNT': '0001849221',  # Perfect Moment Ltd.
-    'ILAG': '0001814963',  # Intelligent Living Application Group Inc.
-    'CDT': '0001896212',  # CONDUIT PHARMACEUTICALS INC.
-    'SANW': '0001477246',  # S&W Seed Co
-    'NCL': '0001923780',  # Northann Corp.
-    'WISA': '0001682149',  # WISA TECHNOLOGIES, INC.
-    'GXAI': '0001895618',  # GAXOS.AI INC.
-    'LICN': '0001876766',  # Lichen China Ltd
-    'QSJC': '0001753391',  # TANCHENG GROUP CO., LTD.
-    'GUER': '0001832487',  # Guerrilla RF, Inc.
-    'ENMI': '0001300781',  # DH ENCHANTMENT, INC.
-    'TAIT': '0000942126',  # TAITRON COMPONENTS INC
-    'SPRB': '0001683553',  # SPRUCE BIOSCIENCES, INC.
-    'PT': '0001716338',  # Pintec Technology Holdings Ltd
-    'CVR': '0000019871',  # CHICAGO RIVET & MACHINE CO
-    'ERNA': '0000748592',  # Eterna Therapeutics Inc.
-    'MEGL': '0001881472',  # Magic Empire Global Ltd
-    'COEP': '0001759186',  # Coeptis Therapeutics Holdings, Inc.
-    'NERV': '0001598646',  # Minerva Neurosciences, Inc.
-    'ENFY': '0000857949',  # Enlightify Inc.
-    'TETOF': '0001783432',  # Tectonic Metals Inc.
-    'MSPR': '0001802450',  # MSP Recovery, Inc.
-    'CISO': '0001777319',  # CISO Global, Inc.
-    'STRM': '0001008586',  # STREAMLINE HEALTH SOLUTIONS INC.
-    'XIN': '0001398453',  # Xinyuan Real Estate Co., Ltd.
-    'XTLB': '0001023549',  # XTL BIOPHARMACEUTICALS LTD
-    'FMST': '0001935418',  # Foremost Clean Energy Ltd.
-    'HTOO': '0001819794',  # Fusion Fuel Green PLC
-    'USEA': '0001912847',  # United Maritime Corp
-    'RMCO': '0001843656',  # Royalty Management Holding Corp
-    'QYOUF': '0001650287',  # QYOU Media Inc.
-    'SWAG': '0001872525',  # Stran & Company, Inc.
-    'CHHE': '0001309057',  # China Health Industries Holdings, Inc.
-    'COSM': '0001474167',  # Cosmos Health Inc.
-    'ARBB': '0001930179',  # ARB IOT Group Ltd
-    'MYNA': '0001850453',  # Mynaric AG
-    'UPYY': '0001677897',  # UPAY
-    'AEON': '0001837607',  # AEON Biopharma, Inc.
-    'APCX': '0001070050',  # AppTech Payments Corp.
-    'RMSL': '0001412126',  # RemSleep Holdings Inc.
-    'ADN': '0001744494',  # ADVENT TECHNOLOGIES HOLDINGS, INC.
-    'NZERF': '0001509705',  # New Zealand Energy Corp.
-    'AWX': '0001061069',  # AVALON HOLDINGS CORP
-    'MSBB': '0001967306',  # Mercer Bancorp, Inc.
-    'TKLF': '0001836242',  # Tokyo Lifestyle Co., Ltd.
-    'CWD': '0001627282',  # CaliberCos Inc.
-    'CHUC': '0001134765',  # Charlie's Holdings, Inc.
-    'UEEC': '0001096938',  # United Health Products, Inc.
-    'FLYE': '0001975940',  # Fly-E Group, Inc.
-    'JZXN': '0001816172',  # Jiuzi Holdings, Inc.
-    'AIRI': '0001009891',  # AIR INDUSTRIES GROUP
-    'JRSS': '0001597892',  # JRSIS HEALTH CARE Corp
-    'PHIL': '0000704172',  # PHI GROUP INC
-    'GNS': '0001847806',  # Genius Group Ltd
-    'EQS': '0000878932',  # EQUUS TOTAL RETURN, INC.
-    'JBDI': '0001964314',  # JBDI Holdings Ltd
-    'MRAI': '0001844392',  # Marpai, Inc.
-    'USNU': '0001089815',  # Elite Health Systems Inc.
-    'MAPPF': '0001493130',  # PROSTAR HOLDINGS INC. /BC
-    'UAVS': '0000008504',  # AgEagle Aerial Systems Inc.
-    'BOF': '0001962481',  # BranchOut Food Inc.
-    'EDUC': '0000031667',  # EDUCATIONAL DEVELOPMENT CORP
-    'QURT': '0001549631',  # Quarta-Rad, Inc.
-    'SRRE': '0001083490',  # SUNRISE REAL ESTATE GROUP INC
-    'KDOZF': '0001318482',  # KIDOZ INC.
-    'LUCY': '0001808377',  # Innovative Eyewear Inc
-    'STLY': '0000797465',  # HG Holdings, Inc.
-    'JGLDF': '0001686000',  # Japan Gold Corp.
-    'HOTH': '0001711786',  # Hoth Therapeutics, Inc.
-    'DUKR': '0001638911',  # DUKE Robotics Corp.
-    'LBCMF': '0001580110',  # Libero Copper & Gold Corp
-    'SPND': '0000867038',  # SPINDLETOP OIL & GAS CO
-    'VAUCF': '0001723047',  # Viva Gold Corp.
-    'PHGE': '0001739174',  # BiomX Inc.
-    'SNTW': '0001619096',  # Summit Networks Inc.
-    'ADGM': '0002006986',  # Adagio Medical Holdings, Inc.
-    'TIRX': '0001782941',  # TIAN RUIXIANG HOLDINGS LTD
-    'CMLS': '0001058623',  # CUMULUS MEDIA INC
-    'ACXP': '0001736243',  # Acurx Pharmaceuticals, Inc.
-    'GRNQ': '0001597846',  # Greenpro Capital Corp.
-    'YQ': '0001821468',  # 17 Education & Technology Group Inc.
-    'PSIG': '0001997201',  # PS International Group Ltd.
-    'MMA': '0001981519',  # MIXED MARTIAL ARTS GROUP LTD
-    'AIM': '0000946644',  # AIM ImmunoTech Inc.
-    'APTO': '0000882361',  # Aptose Biosciences Inc.
-    'DDC': '0001808110',  # DDC Enterprise Ltd
-    'KWIK': '0001884164',  # KwikClick, Inc.
-    'GOVB': '0001978811',  # Gouverneur Bancorp, Inc./MD/
-    'LCFY': '0001875547',  # Locafy Ltd
-    'PAIYY': '0001757143',  # Aesthetic Medical International Holdings Group Ltd
-    'MBIO': '0001680048',  # MUSTANG BIO, INC.
-    'NCI': '0001916331',  # Neo-Concept International Group Holdings Ltd
-    'SBEV': '0001553788',  # SPLASH BEVERAGE GROUP, INC.
-    'PET': '0001842356',  # Wag! Group Co.
-    'CNFR': '0001502292',  # Conifer Holdings, Inc.
-    'BIAF': '0001712762',  # bioAffinity Technologies, Inc.
-    'LYRA': '0001327273',  # Lyra Therapeutics, Inc.
-    'IMNN': '0000749647',  # Imunon, Inc.
-    'ABVE': '0001979484',  # Above Food Ingredients Inc.
-    'CJJD': '0001856084',  # China Jo-Jo Drugstores, Inc.
-    'GWTI': '0001572386',  # GREENWAY TECHNOLOGIES INC
-    'TRUG': '0001857086',  # TruGolf Holdings, Inc.
-    'RYDE': '0001971115',  # Ryde Group Ltd
-    'EEIQ': '0001781397',  # EpicQuest Education Group International Ltd
-    'RLMD': '0001553643',  # RELMADA THERAPEUTICS, INC.
-    'SNSE': '0001829802',  # Sensei Biotherapeutics, Inc.
-    'CRWE': '0001103833',  # Crown Equity Holdings, Inc.
-    'BGXX': '0001886799',  # Bright Green Corp
-    'ALUR': '0001964979',  # ALLURION TECHNOLOGIES, INC.
-    'CLEV': '0001414382',  # Concrete Leveling Systems Inc
-    'PETZ': '0001684425',  # TDH Holdings, Inc.
-    'RIME': '0000923601',  # Algorhythm Holdings, Inc.
-    'TXMD': '0000025743',  # TherapeuticsMD, Inc.
-    'JUPGF': '0001684688',  # Jupiter Gold Corp
-    'HWH': '0001897245',  # HWH International Inc.
-    'SMTK': '0001817760',  # SmartKem, Inc.
-    'TWG': '0001978057',  # Top Wealth Group Holding Ltd
-    'SSKN': '0001051514',  # STRATA Skin Sciences, Inc.
-    'LGCB': '0001969401',  # Linkage Global Inc
-    'BHIL': '0001830210',  # Benson Hill, Inc.
-    'SPRS': '0000747540',  # SURGE COMPONENTS INC
-    'XERI': '0001481504',  # XERIANT, INC.
-    'OTLC': '0000908259',  # Oncotelic Therapeutics, Inc.
-    'CEIN': '0001309082',  # CAMBER ENERGY, INC.
-    'PCST': '0001406434',  # PURE CAPITAL SOLUTIONS, INC.
-    'IVDA': '0001397183',  # Iveda Solutions, Inc.
-    'AGSS': '0001514443',  # AMERIGUARD SECURITY SERVICES, INC.
-    'BMNR': '0001829311',  # BITMINE IMMERSION TECHNOLOGIES, INC.
-    'EYEN': '0001682639',  # EYENOVIA, INC.
-    'BNET': '0000875729',  # BION ENVIRONMENTAL TECHNOLOGIES INC
-    'GWAV': '0001589149',  # Greenwave Technology Solutions, Inc.
-    'JAGX': '0001585608',  # Jaguar Health, Inc.
-    'KAPA': '0001962011',  # Kairos Pharma, LTD.
-    'DLPN': '0001282224',  # Dolphin Entertainment, Inc.
-    'APLM': '0001944885',  # Apollomics Inc.
-    'QMCI': '0001101433',  # QUOTEMEDIA INC
-    'MTR': '0000313364',  # MESA ROYALTY TRUST/TX
-    'SEED': '0001321851',  # Origin Agritech LTD
-    'UBXG': '0001888525',  # U-BX Technology Ltd.
-    'KNGRF': '0001191832',  # Kingsmen Resources Ltd.
-    'WBUY': '0001946703',  # WEBUY GLOBAL LTD
-    'BPT': '0000850033',  # BP PRUDHOE BAY ROYALTY TRUST
-    'BSLK': '0001841125',  # Bolt Projects Holdings, Inc.
-    'CLRB': '0001279704',  # Cellectar Biosciences, Inc.
-    'MI': '0001958713',  # NFT Ltd
-    'CYN': '0001874097',  # Cyngn Inc.
-    'GMM': '0001913749',  # Global Mofy AI Ltd
-    'GITS': '0001911545',  # Global Interactive Technologies, Inc.
-    'PGFF': '0001902700',  # Pioneer Green Farms, Inc.
-    'PC': '0001998056',  # Premium Catering (Holdings) Ltd
-    'IMTH': '0001331612',  # INNOVATIVE MEDTECH, INC.
-    'UGRO': '0001706524',  # urban-gro, Inc.
-    'ASTC': '0001001907',  # ASTROTECH Corp
-    'BCLI': '0001137883',  # BRAINSTORM CELL THERAPEUTICS INC.
-    'IVDN': '0001190370',  # INNOVATIVE DESIGNS INC
-    'NCRA': '0001756180',  # NOCERA, INC.
-    'IMRN': '0001660046',  # Immuron Ltd
-    'INDP': '0001857044',  # Indaptus Therapeutics, Inc.
-    'TSBX': '0001764974',  # Turnstone Biologics Corp.
-    'BRTX': '0001505497',  # BioRestorative Therapies, Inc.
-    'CSCI': '0001113423',  # COSCIENS Biopharma Inc.
-    'NTRP': '0000788611',  # NextTrip, Inc.
-    'CMCT': '0000908311',  # Creative Media & Community Trust Corp
-    'ENZN': '0000727510',  # ENZON PHARMACEUTICALS, INC.
-    'AIMD': '0001014763',  # Ainos, Inc.
-    'PEV': '0001879848',  # PHOENIX MOTOR INC.
-    'ATIP': '0001815849',  # ATI Physical Therapy, Inc.
-    'GTII': '0000356590',  # GLOBAL TECH INDUSTRIES GROUP, INC.
-    'XELB': '0001083220',  # XCel Brands, Inc.
-    'BNZI': '0001826011',  # Banzai International, Inc.
-    'BETRF': '0001464165',  # BetterLife Pharma Inc.
-    'FFNTF': '0001783875',  # 4Front Ventures Corp.
-    'SCND': '0000087802',  # SCIENTIFIC INDUSTRIES INC
-    'KTEL': '0000845819',  # KonaTel, Inc.
-    'GVH': '0001978527',  # Globavend Holdings Ltd
-    'CJET': '0001957413',  # Chijet Motor Company, Inc.
-    'VVPR': '0001681348',  # VivoPower International PLC
-    'KLTO': '0001907223',  # Klotho Neurosciences, Inc.
-    'ZONE': '0001956741',  # CleanCore Solutions, Inc.
-    'CYCA': '0001383088',  # CYTTA CORP.
-    'YERBF': '0001978133',  # YERBAE BRANDS CORP.
-    'HAO': '0001954594',  # Haoxi Health Technology Ltd
-    'PPBT': '0001614744',  # PURPLE BIOTECH LTD.
-    'LMFA': '0001640384',  # LM FUNDING AMERICA, INC.
-    'AWH': '0000926617',  # Aspira Women's Health Inc.
-    'CUBT': '0001400271',  # Curative Biotechnology Inc
-    'CLWT': '0001026662',  # EURO TECH HOLDINGS CO LTD
-    'WMLLF': '0001077640',  # Wealth Minerals Ltd.
-    'FDCT': '0001722731',  # FDCTECH, INC.
-    'AYTU': '0001385818',  # AYTU BIOPHARMA, INC
-    'GDHG': '0001928340',  # GOLDEN HEAVEN GROUP HOLDINGS LTD.
-    'PMCB': '0001157075',  # PharmaCyte Biotech, Inc.
-    'SCKT': '0000944075',  # SOCKET MOBILE, INC.
-    'VRAX': '0001885827',  # Virax Biolabs Group Ltd
-    'SGMA': '0000915358',  # SIGMATRON INTERNATIONAL INC
-    'VRMMQ': '0001580864',  # Vroom, Inc.
-    'CTCX': '0001842939',  # Carmell Corp
-    'BURU': '0001814215',  # Nuburu, Inc.
-    'ZCAR': '0001854275',  # Zoomcar Holdings, Inc.
-    'TLPH': '0001427925',  # TALPHERA, INC.
-    'EVGN': '0001574565',  # Evogene Ltd.
-    'ILAL': '0001657214',  # International Land Alliance Inc.
-    'INTI': '0001042418',  # Inhibitor Therapeutics, Inc.
-    'BTCY': '0001630113',  # BIOTRICITY INC.
-    'AEI': '0001750106',  # Alset Inc.
-    'APDN': '0000744452',  # APPLIED DNA SCIENCES INC
-    'MHUA': '0001835615',  # Meihua International Medical Technologies Co., Ltd.
-    'SOAR': '0001853070',  # Volato Group, Inc.
-    'BMNM': '0001275477',  # BIMINI CAPITAL MANAGEMENT, INC.
-    'BHAT': '0001759136',  # Blue Hat Interactive Entertainment Technology
-    'BTBD': '0001718224',  # BT Brands, Inc.
-    'KPRX': '0001372514',  # KIORA PHARMACEUTICALS INC
-    'ROMA': '0001945240',  # Roma Green Finance Ltd
-    'OMH': '0001944902',  # Ohmyhome Ltd
-    'LILIF': '0001689448',  # Argentina Lithium & Energy Corp.
-    'CANF': '0001536196',  # Can-Fite BioPharma Ltd.
-    'ATEK': '0001882198',  # Athena Technology Acquisition Corp. II
-    'BCDA': '0000925741',  # BioCardia, Inc.
-    'AIHS': '0001711012',  # Senmiao Technology Ltd
-    'BREA': '0001939965',  # Brera Holdings PLC
-    'ARTW': '0000007623',  # ARTS WAY MANUFACTURING CO INC
-    'VS': '0001701963',  # Versus Systems Inc.
-    'RVYL': '0001419275',  # RYVYL Inc.
-    'QTI': '0001844505',  # QT IMAGING HOLDINGS, INC.
-    'MSN': '0000032621',  # EMERSON RADIO CORP
-    'MFI': '0001940941',  # mF International Ltd
-    'MYNZ': '0001874252',  # MAINZ BIOMED N.V.
-    'MKDW': '0001991332',  # MKDWELL Tech Inc.
-    'MSTH': '0001790320',  # Mystic Holdings Inc./NV
-    'APM': '0001734005',  # Aptorum Group Ltd
-    'PFHO': '0001138476',  # PACIFIC HEALTH CARE ORGANIZATION INC
-    'ACPS': '0001133116',  # AC Partners, Inc.
-    'CREV': '0001960208',  # Carbon Revolution Public Ltd Co
-    'LRHC': '0001879403',  # La Rosa Holdings Corp.
-    'GHST': '0001121795',  # GHST World Inc.
-    'TCRI': '0001481443',  # TechCom, Inc.
-    'VINE': '0001880343',  # Fresh Vine Wine, Inc.
-    'LISMF': '0001643715',  # LITHIUM SOUTH DEVELOPMENT Corp
-    'INBP': '0001016504',  # INTEGRATED BIOPHARMA INC
-    'HWNI': '0001413891',  # HIGH WIRE NETWORKS, INC.
-    'VISL': '0001565228',  # Vislink Technologies, Inc.
-    'MMTRS': '0000066496',  # MILLS MUSIC TRUST
-    'PURE': '0001006028',  # PURE BIOSCIENCE, INC.
-    'MOJO': '0001414953',  # EQUATOR Beverage Co
-    'ENSC': '0001716947',  # Ensysce Biosciences, Inc.
-    'TIKK': '0000096885',  # TEL INSTRUMENT ELECTRONICS CORP
-    'MWG': '0001941500',  # Multi Ways Holdings Ltd
-    'AMST': '0001807166',  # Amesite Inc.
-    'CUTR': '0001162461',  # CUTERA INC
-    'AEMD': '0000882291',  # AETHLON MEDICAL INC
-    'XCRT': '0001138586',  # Xcelerate, Inc.
-    'DXYN': '0000029332',  # DIXIE GROUP INC
-    'CARV': '0001016178',  # CARVER BANCORP INC
-    'SLE': '0001621672',  # Super League Enterprise, Inc.
-    'CBDS': '0001360442',  # Dogecoin Cash, Inc.
-    'BOXL': '0001624512',  # Boxlight Corp
-    'PBSV': '0001304161',  # Pharma-Bio Serv, Inc.
-    'IONI': '0001580490',  # I-ON Digital Corp.
-    'POAI': '0001446159',  # Predictive Oncology Inc.
-    'OP': '0001869467',  # OceanPal Inc.
-    'DFCO': '0000725394',  # DALRADA FINANCIAL CORP
-    'NYMXF': '0001018735',  # NYMOX PHARMACEUTICAL CORP
-    'SQFT': '0001080657',  # Presidio Property Trust, Inc.
-    'WINSF': '0001640251',  # Wins Finance Holdings Inc.
-    'SPRC': '0001611746',  # SciSparc Ltd.
-    'NROM': '0000709005',  # NOBLE ROMANS INC
-    'GIPR': '0001651721',  # GENERATION INCOME PROPERTIES, INC.
-    'GTHP': '0000924515',  # GUIDED THERAPEUTICS INC
-    'STME': '0001493712',  # Stimcell Energetics Inc.
-    'ORGS': '0001460602',  # Orgenesis Inc.
-    'INTJ': '0001916416',  # Intelligent Group Ltd
-    'WATT': '0001575793',  # Energous Corp
-    'DPLS': '0000866439',  # DarkPulse, Inc.
-    'LEDS': '0001333822',  # SemiLEDs Corp
-    'PRPO': '0001043961',  # Precipio, Inc.
-    'SRM': '0001956744',  # SRM Entertainment, Inc.
-    'JPOTF': '0001061612',  # Jackpot Digital Inc.
-    'SDCH': '0001022505',  # SideChannel, Inc.
-    'EONR': '0001842556',  # EON Resources Inc.
-    'KAVL': '0001762239',  # Kaival Brands Innovations Group, Inc.
-    'CYCN': '0001755237',  # Cyclerion Therapeutics, Inc.
-    'IDAI': '0001718939',  # T Stamp Inc
-    'CTNT': '0001951667',  # CHEETAH NET SUPPLY CHAIN SERVICE INC.
-    'VGFCQ': '0001878835',  # Very Good Food Co Inc.
-    'ICU': '0001831868',  # SeaStar Medical Holding Corp
-    'BRGX': '0001593184',  # BIOREGENX, INC.
-    'CHEK': '0001610590',  # Check-Cap Ltd
-    'GSIW': '0001954269',  # Garden Stage Ltd
-    'NSFDF': '0001009922',  # NXT Energy Solutions Inc.
-    'CNSP': '0001729427',  # CNS Pharmaceuticals, Inc.
-    'MARPS': '0000062362',  # MARINE PETROLEUM TRUST
-    'SOGP': '0001783407',  # Sound Group Inc.
-    'BFRI': '0001858685',  # Biofrontera Inc.
-    'GV': '0001892274',  # Visionary Holdings Inc.
-    'HIHO': '0001026785',  # HIGHWAY HOLDINGS LTD
-    'SILO': '0001514183',  # Silo Pharma, Inc.
-    'HLGN': '0001840292',  # Heliogen, Inc.
-    'ASNS': '0001141284',  # ACTELIS NETWORKS INC
-    'YJ': '0001759614',  # Yunji Inc.
-    'TRLEF': '0001648636',  # Trillion Energy International Inc.
-    'ELWS': '0001944399',  # Earlyworks Co., Ltd.
-    'TGCB': '0001815632',  # Tego Cyber, Inc.
-    'PBMLF': '0001319150',  # Pacific Booker Minerals Inc.
-    'LCTC': '0001493137',  # Lifeloc Technologies, Inc
-    'ADXN': '0001574232',  # Addex Therapeutics Ltd.
-    'CAUD': '0001854583',  # Collective Audience, Inc.
-    'ICDX': '0001818550',  # Incordex Corp.
-    'KDLY': '0001946573',  # Kindly MD, Inc.
-    'NMGX': '0000891417',  # Nano Magic Inc.
-    'MRM': '0001819704',  # Medirom Healthcare Technologies Inc.
-    'MOND': '0001828852',  # Mondee Holdings, Inc.
-    'ELVG': '0001741489',  # Elvictor Group, Inc.
-    'ECTM': '0001487798',  # ECA Marcellus Trust I
-    'GRAM': '0001876945',  # Gold Flora Corp.
-    'PKKFF': '0001558924',  # Tenet Fintech Group Inc.
-    'WTO': '0001789299',  # UTime Ltd
-    'HLRTF': '0001418149',  # Hillcrest Energy Technologies Ltd.
-    'KSEZ': '0001945619',  # Kinetic Seas Inc.
-    'POLA': '0001622345',  # Polar Power, Inc.
-    'BLMZ': '0001984014',  # BloomZ Inc.
-    'SNGX': '0000812796',  # SOLIGENIX, INC.
-    'GLVT': '0001693687',  # GREENLIT VENTURES INC.
-    'IMG': '0001527613',  # CIMG Inc.
-    'NURO': '0001289850',  # NeuroMetrix, Inc.
-    'FXBY': '0001068897',  # FOXBY CORP.
-    'LWLW': '0000723533',  # Longwen Group Corp.
-    'NUVI': '0001410708',  # Emo Capital Corp.
-    'TESI': '0001514056',  # Titan Environmental Solutions Inc.
-    'CERO': '0001870404',  # CERO THERAPEUTICS HOLDINGS, INC.
-    'IBG': '0001924482',  # Innovation Beverage Group Ltd
-    'GURE': '0000885462',  # GULF RESOURCES, INC.
-    'FGI': '0001864943',  # FGI Industries Ltd.
-    'OPGN': '0001293818',  # OPGEN INC
-    'AIAD': '0000743758',  # AiAdvertising, Inc.
-    'THMG': '0000711034',  # THUNDER MOUNTAIN GOLD INC
-    'LDWY': '0000875355',  # LENDWAY, INC.
-    'JNVR': '0001805526',  # Janover Inc.
-    'SKAS': '0001128281',  # Saker Aviation Services, Inc.
-    'AHNR': '0001304409',  # ATHENA GOLD CORP
-    'TPET': '0001898766',  # Trio Petroleum Corp.
-    'RDHL': '0001553846',  # RedHill Biopharma Ltd.
-    'IMCC': '0001792030',  # IM Cannabis Corp.
-    'PBM': '0001985062',  # PSYENCE BIOMEDICAL LTD.
-    'RDGA': '0000812152',  # RIDGEFIELD ACQUISITION CORP
-    'DSNY': '0001099369',  # DESTINY MEDIA TECHNOLOGIES INC
-    'QNTM': '0001771885',  # Quantum Biopharma Ltd.
-    'HOFV': '0001708176',  # Hall of Fame Resort & Entertainment Co
-    'ECRO': '0001300317',  # ECC Capital CORP
-    'MITQ': '0001770236',  # MOVING iMAGE TECHNOLOGIES INC.
-    'OTRK': '0001136174',  # Ontrak, Inc.
-    'XWEL': '0001410428',  # XWELL, Inc.
-    'NFTN': '0001544400',  # NFiniTi inc.
-    'WAFU': '0001716770',  # Wah Fu Education Group Ltd
-    'IPDN': '0001546296',  # Professional Diversity Network, Inc.
-    'SGLY': '0001422892',  # Singularity Future Technology Ltd.
-    'SRAX': '0001538217',  # SRAX, Inc.
-    'MTPP': '0001658521',  # MOUNTAIN TOP PROPERTIES, INC.
-    'TCTM': '0001592560',  # TCTM Kids IT Education Inc.
-    'NBIO': '0001622057',  # Nascent Biotech Inc.
-    'DSS': '0000771999',  # DSS, INC.
-    'JCSE': '0001905511',  # JE Cleantech Holdings Ltd
-    'HYZN': '0001716583',  # Hyzon Motors Inc.
-    'DOMH': '0000012239',  # Dominari Holdings Inc.
-    'FHLD': '0001386044',  # Freedom Holdings, Inc.
-    'APVO': '0001671584',  # Aptevo Therapeutics Inc.
-    'PTOP': '0001421981',  # Peer To Peer Network
-    'STRR': '0000707388',  # STAR EQUITY HOLDINGS, INC.
-    'VIRX': '0001061027',  # Viracta Therapeutics, Inc.
-    'AAUAF': '0001015647',  # ALMADEN MINERALS LTD
-    'CASK': '0001788230',  # Heritage Distilling Holding Company, Inc.
-    'PNBK': '0001098146',  # PATRIOT NATIONAL BANCORP INC
-    'SMREF': '0001480313',  # SUN SUMMIT MINERALS CORP.
-    'BTOG': '0001735556',  # BIT ORIGIN Ltd
-    'VINC': '0001796129',  # Vincerx Pharma, Inc.
-    'SLTN': '0001508786',  # SILVERTON ENERGY, INC.
-    'LIFD': '0001391135',  # LFTD PARTNERS INC.
-    'VMAR': '0001813783',  # Vision Marine Technologies Inc.
-    'BLTH': '0001487718',  # AMERICAN BATTERY MATERIALS, INC.
-    'GLTO': '0001800315',  # Galecto, Inc.
-    'GOGR': '0001378866',  # Go Green Global Technologies Corp.
-    'LXEH': '0001814067',  # Lixiang Education Holding Co. Ltd.
-    'TNLX': '0000099106',  # TRANS LUX Corp
-    'RKDA': '0001469443',  # Arcadia Biosciences, Inc.
-    'MFBI': '0002024899',  # Monroe Federal Bancorp, Inc.
-    'TIGCF': '0001387473',  # Triumph Gold Corp.
-    'EFOI': '0000924168',  # ENERGY FOCUS, INC/DE
-    'KZIA': '0001075880',  # KAZIA THERAPEUTICS LTD
-    'TGL': '0001905956',  # TREASURE GLOBAL INC
-    'TTOO': '0001492674',  # T2 Biosystems, Inc.
-    'SRNW': '0001321517',  # Stratos Renewables Corp
-    'ANTE': '0001413745',  # AIRNET TECHNOLOGY INC.
-    'PSTV': '0001095981',  # PLUS THERAPEUTICS, INC.
-    'PCMC': '0001141964',  # PUBLIC CO MANAGEMENT CORP
-    'SSY': '0000096793',  # SUNLINK HEALTH SYSTEMS INC
-    'VBIX': '0000797542',  # Viewbix Inc.
-    'PAVM': '0001624326',  # PAVmed Inc.
-    'GRI': '0001824293',  # GRI Bio, Inc.
-    'VEEE': '0001855509',  # Twin Vee PowerCats, Co.
-    'MGRX': '0001938046',  # MANGOCEUTICALS, INC.
-    'GNPX': '0001595248',  # Genprex, Inc.
-    'GULTU': '0001565146',  # Gulf Coast Ultra Deep Royalty Trust
-    'BON': '0001816815',  # Bon Natural Life Ltd
-    'CMND': '0001892500',  # Clearmind Medicine Inc.
-    'MRIN': '0001389002',  # MARIN SOFTWARE INC
-    'CRKN': '0001761696',  # Crown Electrokinetics Corp.
-    'BZYR': '0000724445',  # BURZYNSKI RESEARCH INSTITUTE INC
-    'KRKR': '0001779476',  # 36Kr Holdings Inc.
-    'BLBX': '0001567900',  # BLACKBOXSTOCKS INC.
-    'JWEL': '0001805594',  # Jowell Global Ltd.
-    'ULY': '0001603652',  # Urgent.ly Inc.
-    'ADIL': '0001513525',  # ADIAL PHARMACEUTICALS, INC.
-    'RSMXF': '0001858994',  # Regency Silver Corp.
-    'TWOH': '0001494413',  # Two Hands Corp
-    'CHNR': '0000793628',  # CHINA NATURAL RESOURCES INC
-    'FFLO': '0001543652',  # Free Flow USA, Inc.
-    'CEAD': '0001482541',  # CEA Industries Inc.
-    'NLSP': '0001783036',  # NLS Pharmaceutics Ltd.
-    'EVOK': '0001403708',  # Evoke Pharma Inc
-    'TRXA': '0001437750',  # T-REX Acquisition Corp.
-    'ELAB': '0001840563',  # PMGC Holdings Inc.
-    'AMBO': '0001494558',  # Ambow Education Holding Ltd.
-    'CBIH': '0001411057',  # Cannabis Bioscience International Holdings, Inc.
-    'ABVC': '0001173313',  # ABVC BIOPHARMA, INC.
-    'FOXO': '0001812360',  # FOXO TECHNOLOGIES INC.
-    'VERB': '0001566610',  # Verb Technology Company, Inc.
-    'QIND': '0001393781',  # Quality Industrial Corp.
-    'MCUJF': '0001133519',  # MEDICURE INC
-    'EGTYF': '0001629632',  # Eguana Technologies Inc.
-    'ONVO': '0001497253',  # ORGANOVO HOLDINGS, INC.
-    'ONFO': '0001825452',  # Onfolio Holdings, Inc
-    'GBR': '0000105744',  # New Concept Energy, Inc.
-    'VSMR': '0001370292',  # VERIFY SMART CORP.
-    'XBIO': '0001534525',  # Xenetic Biosciences, Inc.
-    'EDSA': '0001540159',  # Edesa Biotech, Inc.
-    'AEHL': '0001470683',  # Antelope Enterprise Holdings Ltd
-    'PNYG': '0001784058',  # Pony Group Inc.
-    'ALZN': '0001677077',  # Alzamend Neuro, Inc.
-    'CVSI': '0001510964',  # CV Sciences, Inc.
-    'BGLC': '0001737523',  # BioNexus Gene Lab Corp
-    'BABB': '0001123596',  # BAB, INC.
-    'JTAI': '0001861622',  # Jet.AI Inc.
-    'LIMX': '0001803977',  # Limitless X Holdings Inc.
-    'PLRZ': '0001893645',  # Polyrizon Ltd.
-    'SYRS': '0001556263',  # Syros Pharmaceuticals, Inc.
-    'FTFT': '0001066923',  # Future FinTech Group Inc.
-    'CREG': '0000721693',  # Smart Powerr Corp.
-    'HCTI': '0001839285',  # Healthcare Triangle, Inc.
-    'FORD': '0000038264',  # Forward Industries, Inc.
-    'ANVI': '0001570132',  # ANVI GLOBAL HOLDINGS, INC.
-    'BMTM': '0001568385',  # Bright Mountain Media, Inc.
-    'KLYG': '0001372114',  # Kelyniam Global, Inc.
-    'GRHI': '0000894501',  # GOLD ROCK HOLDINGS, INC.
-    'GTBP': '0000109657',  # GT Biopharma, Inc.
-    'BKYI': '0001019034',  # BIO KEY INTERNATIONAL INC
-    'APYP': '0001568969',  # APPYEA, INC
-    'TRBMF': '0001406944',  # TORQ RESOURCES INC.
-    'SBFM': '0001402328',  # Sunshine Biopharma Inc.
-    'EDBL': '0001809750',  # Edible Garden AG Inc
-    'VMNT': '0001605057',  # Vemanti Group, Inc.
-    'BENF': '0001775734',  # Beneficient
-    'CNEY': '0001780785',  # CN ENERGY GROUP. INC.
-    'VEST': '0001594968',  # Vestiage, Inc.
-    'BRQSF': '0001650575',  # Borqs Technologies, Inc.
-    'INBS': '0001725430',  # INTELLIGENT BIO SOLUTIONS INC.
-    'TNON': '0001560293',  # Tenon Medical, Inc.
-    'BMRA': '0000073290',  # BIOMERICA INC
-    'LBSR': '0001172178',  # LIBERTY STAR URANIUM & METALS CORP.
-    'ASRE': '0001231339',  # Astra Energy, Inc.
-    'SPFX': '0001807893',  # STANDARD PREMIUM FINANCE HOLDINGS, INC.
-    'PALI': '0001357459',  # PALISADE BIO, INC.
-    'BIGGQ': '0000768835',  # BIG LOTS INC
-    'CHRO': '0001919246',  # Channel Therapeutics Corp
-    'UNQL': '0001281845',  # Unique Logistics International, Inc.
-    'SYRA': '0001922335',  # Syra Health Corp
-    'HSTA': '0001813603',  # Hestia Insight Inc.
-    'VRPX': '0001708331',  # Virpax Pharmaceuticals, Inc.
-    'YGMZ': '0001782037',  # MingZhu Logistics Holdings Ltd
-    'KIQSF': '0001161814',  # KELSO TECHNOLOGIES INC
-    'EJH': '0001769768',  # E-Home Household Service Holdings Ltd
-    'GSUN': '0001826376',  # Golden Sun Health Technology Group Ltd
-    'LTRY': '0001673481',  # Lottery.com Inc.
-    'OVTZ': '0001107280',  # OCULUS VISIONTECH INC.
-    'MBRX': '0001659617',  # Moleculin Biotech, Inc.
-    'REBN': '0001707910',  # Reborn Coffee, Inc.
-    'AIJTY': '0001713923',  # Jianpu Technology Inc.
-    'ZDPY': '0001279620',  # Zoned Properties, Inc.
-    'ADMT': '0000849401',  # ADM TRONICS UNLIMITED, INC.
-    'IVP': '0001939365',  # INSPIRE VETERINARY PARTNERS, INC.
-    'BLMH': '0001996210',  # BLUM HOLDINGS, INC.
-    'ECIA': '0000930775',  # ENCISION INC
-    'UUU': '0000102109',  # UNIVERSAL SECURITY INSTRUMENTS INC
-    'CISS': '0001951067',  # C3is Inc.
-    'CETX': '0001435064',  # CEMTREX INC
-    'VSME': '0001951294',  # VS MEDIA Holdings Ltd
-    'MGOL': '0001902794',  # MGO Global Inc.
-    'VADP': '0001700849',  # Vado Corp.
-    'DROR': '0001282980',  # Dror Ortho-Design, Inc.
-    'NMREF': '0001519457',  # Namibia Critical Metals Inc.
-    'BAOS': '0001811216',  # Baosheng Media Group Holdings Ltd
-    'JXG': '0001546383',  # JX Luxventure Group Inc.
-    'BICX': '0001443863',  # BioCorRx Inc.
-    'LIXT': '0001335105',  # LIXTE BIOTECHNOLOGY HOLDINGS, INC.
-    'EVAX': '0001828253',  # Evaxion Biotech A/S
-    'AGTX': '0001603345',  # Agentix Corp.
-    'LKCO': '0001487839',  # Luokung Technology Corp.
-    'QWTR': '0001487091',  # Quest Water Global, Inc.
-    'STEK': '0001511820',  # Stemtech Corp
-    'MSGM': '0001821175',  # Motorsport Games Inc.
-    'FWFW': '0001492617',  # FLYWHEEL ADVANCED TECHNOLOGY, INC.
-    'BBLR': '0001873722',  # Bubblr Inc.
-    'MARK': '0001368365',  # REMARK HOLDINGS, INC.
-    'VIPZ': '0001832161',  # VIP Play, Inc.
-    'SNTG': '0001810467',  # Sentage Holdings Inc.
-    'SIGY': '0001642159',  # Sigyn Therapeutics, Inc.
-    'KANT': '0001445283',  # KINETA, INC./DE
-    'CLSH': '0001522222',  # CLS Holdings USA, Inc.
-    'MVNC': '0001439264',  # Marvion Inc.
-    'AMIX': '0001617867',  # Autonomix Medical, Inc.
-    'LEBGF': '0001935688',  # Legible Inc.
-    'ATPC': '0001713210',  # Agape ATP Corp
-    'QNRX': '0001671502',  # Quoin Pharmaceuticals, Ltd.
-    'ZAPP': '0001955104',  # Zapp Electric Vehicles Group Ltd
-    'OLKR': '0000924396',  # OpenLocker Holdings, Inc.
-    'GLMD': '0001595353',  # Galmed Pharmaceuticals Ltd.
-    'EFSH': '0001599407',  # 1847 Holdings LLC
-    'RBTC': '0001862068',  # Rubicon Technologies, Inc.
-    'PRTG': '0001095435',  # PORTAGE BIOTECH INC.
-    'KWE': '0001889823',  # KWESST Micro Systems Inc.
-    'NMHI': '0001947861',  # Nature's Miracle Holding Inc.
-    'DNMR': '0001779020',  # Danimer Scientific, Inc.
-    'ROYL': '0001694617',  # Royale Energy, Inc.
-    'STKH': '0001828098',  # Steakholder Foods Ltd.
-    'INTV': '0001520118',  # INTEGRATED VENTURES, INC.
-    'XYLB': '0001577351',  # XY Labs, Inc.
-    'AYRO': '0001086745',  # AYRO, Inc.
-    'NIVF': '0001981662',  # NewGenIvf Group Ltd
-    'SONN': '0001106838',  # Sonnet BioTherapeutics Holdings, Inc.
-    'ATNF': '0001690080',  # 180 Life Sciences Corp.
-    'EDXC': '0001109486',  # Endexx Corp
-    'PNXP': '0001710495',  # PINEAPPLE EXPRESS CANNABIS Co
-    'FOMI': '0001885336',  # FORMATION MINERALS, INC.
-    'PRSO': '0000890394',  # Peraso Inc.
-    'FVTI': '0001626745',  # Fortune Valley Treasures, Inc.
-    'JFBR': '0001885408',  # Jeffs' Brands Ltd
-    'BMXI': '0001122993',  # BROOKMOUNT EXPLORATIONS INC
-    'GARWF': '0001403870',  # Golden Arrow Resources Corp
-    'CTHR': '0001015155',  # CHARLES & COLVARD LTD
-    'CPMD': '0001081938',  # CANNAPHARMARX, INC.
-    'GPUS': '0000896493',  # Hyperscale Data, Inc.
-    'ALLR': '0001860657',  # Allarity Therapeutics, Inc.
-    'BLNC': '0001632121',  # Balance Labs, Inc.
-    'MITI': '0000802257',  # Mitesco, Inc.
-    'IFBD': '0001815566',  # Infobird Co., Ltd
-    'SHMY': '0001766267',  # Synergy Empire Ltd
-    'ASST': '0001920406',  # Asset Entities Inc.
-    'LNTO': '0002006925',  # LELANTOS HOLDINGS INC.
-    'OHCS': '0001892025',  # Optimus Healthcare Services, Inc.
-    'SINT': '0001269026',  # Sintx Technologies, Inc.
-    'BKUH': '0001440153',  # Bakhu Holdings, Corp.
-    'LFLY': '0001785592',  # Leafly Holdings, Inc. /DE
-    'CRYM': '0001533030',  # Cryomass Technologies, Inc.
-    'NUWE': '0001506492',  # Nuwellis, Inc.
-    'YJGJ': '0001699709',  # YIJIA GROUP CORP.
-    'XPON': '0001894954',  # Expion360 Inc.
-    'ILUS': '0001496383',  # Ilustrato Pictures International Inc.
-    'HYEX': '0001630176',  # HEALTHY EXTRACTS INC.
-    'RYES': '0001424864',  # Rise Gold Corp.
-    'NCNA': '0001709626',  # NuCana plc
-    'NVFY': '0001473334',  # Nova Lifestyle, Inc.
-    'AAMTF': '0001327899',  # Armada Mercantile Ltd
-    'KNOS': '0001108248',  # KRONOS ADVANCED TECHNOLOGIES INC
-    'ATXG': '0001650101',  # ADDENTAX GROUP CORP.
-    'INKW': '0001585380',  # Greene Concepts, Inc
-    'GTLL': '0000932021',  # GLOBAL TECHNOLOGIES LTD
-    'IMTE': '0001668438',  # Integrated Media Technology Ltd
-    'LVRLF': '0001168981',  # CordovaCann Corp.
-    'BWMG': '0001166708',  # Brownie's Marine Group, Inc
-    'ABTI': '0001442999',  # ALTEROLA BIOTECH INC.
-    'HLYK': '0001680139',  # HealthLynked Corp
-    'CPMV': '0000836564',  # Mosaic ImmunoEngineering Inc.
-    'OST': '0001803407',  # Ostin Technology Group Co., Ltd.
-    'PW': '0001532619',  # Power REIT
-    'SNPX': '0001571934',  # Synaptogenix, Inc.
-    'PSYCF': '0001847706',  # Psyched Wellness Ltd.
-    'ITP': '0001358190',  # IT TECH PACKAGING, INC.
-    'MGON': '0001144392',  # MEGOLA INC
-    'VTAK': '0001716621',  # Catheter Precision, Inc.
-    'MDCE': '0001404593',  # Medical Care Technologies Inc.
-    'URZEF': '0001398713',  # URZ3 ENERGY CORP.
-    'RSCF': '0001103090',  # REFLECT SCIENTIFIC, INC.
-    'YOSH': '0001898604',  # Yoshiharu Global Co.
-    'CVAT': '0001376793',  # Cavitation Technologies, Inc.
-    'REVB': '0001810560',  # REVELATION BIOSCIENCES, INC.
-    'WLDS': '0001887673',  # Wearable Devices Ltd.
-    'STSS': '0001737995',  # Sharps Technology Inc.
-    'ENVB': '0000890821',  # Enveric Biosciences, Inc.
-    'SRCO': '0000318299',  # SPARTA COMMERCIAL SERVICES, INC.
-    'OGEN': '0001174940',  # ORAGENICS INC
-    'MYCB': '0001556801',  # My City Builders, Inc.
-    'YBGJ': '0000895464',  # Yubo International Biotech Ltd
-    'CBMJ': '0001452583',  # CONSERVATIVE BROADCAST MEDIA & PUBLISHING, INC.
-    'OCTO': '0001892492',  # Eightco Holdings Inc.
-    'RHE': '0001004724',  # REGIONAL HEALTH PROPERTIES, INC
-    'TOVX': '0000894158',  # Theriva Biologics, Inc.
-    'OBLG': '0000746210',  # Oblong, Inc.
-    'XRTX': '0001729214',  # XORTX Therapeutics Inc.
-    'DQWS': '0001652561',  # DSwiss Inc
-    'BPTH': '0001133818',  # BIO-PATH HOLDINGS, INC.
-    'XONI': '0002040753',  # Xtreme One Entertainment, Inc.
-    'SUNE': '0000022701',  # SUNation Energy, Inc.
-    'ACUT': '0001850767',  # Accustem Sciences Inc.
-    'OCLN': '0001419793',  # ORIGINCLEAR, INC.
-    'MULN': '0001499961',  # MULLEN AUTOMOTIVE INC.
-    'UPXI': '0001775194',  # UPEXI, INC.
-    'OZSC': '0001679817',  # OZOP ENERGY SOLUTIONS, INC.
-    'ONCO': '0001782107',  # Onconetix, Inc.
-    'RNVA': '0000931059',  # Rennova Health, Inc.
-    'LMRMF': '0001588837',  # Lomiko Metals Inc.
-    'CPHI': '0001106644',  # CHINA PHARMA HOLDINGS, INC.
-    'TPHS': '0000724742',  # Trinity Place Holdings Inc.
-    'LGHL': '0001806524',  # Lion Group Holding Ltd
-    'CELZ': '0001187953',  # CREATIVE MEDICAL TECHNOLOGY HOLDINGS, INC.
-    'SBIG': '0001801602',  # SpringBig Holdings, Inc.
-    'LTUM': '0001415332',  # Lithium Corp
-    'BTTR': '0001471727',  # Better Choice Co Inc.
-    'TRNR': '0001785056',  # Interactive Strength, Inc.
-    'PAPL': '0001938109',  # Pineapple Financial Inc.
-    'IDXG': '0001054102',  # INTERPACE BIOSCIENCES, INC.
-    'FAMI': '0001701261',  # Farmmi, Inc.
-    'EAST': '0001534708',  # Eastside Distilling, Inc.
-    'HIRU': '0000925779',  # HIRU Corp
-    'GETR': '0001839608',  # Getaround, Inc
-    'THAR': '0001861657',  # Tharimmune, Inc.
-    'AVCRF': '0001355736',  # Avricore Health Inc.
-    'GRST': '0000792935',  # ETHEMA HEALTH Corp
-    'RGFC': '0001871149',  # Real Good Food Company, Inc.
-    'ALID': '0001575295',  # Allied Corp.
-    'TRCC': '0001843875',  # TRACCOM INC.
-    'LUVU': '0001374567',  # Luvu Brands, Inc.
-    'TBLT': '0001668370',  # Toughbuilt Industries, Inc
-    'ZVSA': '0001859007',  # ZyVersa Therapeutics, Inc.
-    'HEPA': '0001583771',  # Hepion Pharmaceuticals, Inc.
-    'ALRTF': '0001930419',  # ALR Technologies SG Ltd.
-    'ATXI': '0001644963',  # AVENUE THERAPEUTICS, INC.
-    'SVBL': '0001031093',  # SILVER BULL RESOURCES, INC.
-    'CNTGF': '0001757097',  # Centogene N.V.
-    'ALBT': '0001630212',  # Avalon GloboCare Corp.
-    'BUDZ': '0001393772',  # WEED, INC.
-    'BQ': '0001815021',  # Boqii Holding Ltd
-    'OLB': '0001314196',  # OLB GROUP, INC.
-    'SHMP': '0001465470',  # NaturalShrimp Inc
-    'PTPI': '0001815903',  # Petros Pharmaceuticals, Inc.
-    'SEAV': '0001763660',  # SEATech Ventures Corp.
-    'ABCFF': '0001284237',  # ABACUS MINING & EXPLORATION CORP
-    'CCCP': '0001696411',  # Crona Corp.
-    'SMX': '0001940674',  # SMX (Security Matters) Public Ltd Co
-    'PKTX': '0001128189',  # ProtoKinetix, Inc.
-    'IGEX': '0001442853',  # Indo Global Exchange(s) Pte, Ltd.
-    'HGYN': '0001324759',  # HONG YUAN HOLDING GROUP
-    'NAYA': '0001417926',  # NAYA Biosciences, Inc.
-    'CNET': '0001376321',  # ZW Data Action Technologies Inc.
-    'FUST': '0001636051',  # FUSE GROUP HOLDING INC.
-    'AGRI': '0001826397',  # AGRIFORCE GROWING SYSTEMS LTD.
-    'AREB': '0001648087',  # AMERICAN REBEL HOLDINGS INC
-    'LIPO': '0001347242',  # LIPELLA PHARMACEUTICALS INC.
-    'ARTL': '0001621221',  # ARTELO BIOSCIENCES, INC.
-    'UCLE': '0001543623',  # US NUCLEAR CORP.
-    'LGMK': '0001566826',  # LogicMark, Inc.
-    'IWSH': '0001279715',  # Wright Investors Service Holdings, Inc.
-    'BRST': '0000764897',  # Broad Street Realty, Inc.
-    'ASTI': '0001350102',  # Ascent Solar Technologies, Inc.
-    'MYSZ': '0001211805',  # My Size, Inc.
-    'TNFA': '0001321834',  # TNF Pharmaceuticals, Inc.
-    'SGD': '0001959023',  # Safe & Green Development Corp
-    'SNOA': '0001367083',  # Sonoma Pharmaceuticals, Inc.
-    'VRVR': '0001536089',  # VIRTUAL INTERACTIVE TECHNOLOGIES CORP.
-    'HCNWF': '0001887603',  # Hypercharge Networks Corp.
-    'STAF': '0001499717',  # Staffing 360 Solutions, Inc.
-    'GESI': '0001955083',  # General European Strategic Investments, Inc.
-    'ORMNF': '0001458057',  # OREX MINERALS INC
-    'TOFB': '0000730349',  # TOFUTTI BRANDS INC
-    'NCNCF': '0001964021',  # noco-noco Inc.
-    'AAUGF': '0001905688',  # AERO ENERGY Ltd
-    'NBY': '0001389545',  # NovaBay Pharmaceuticals, Inc.
-    'SOPA': '0001817511',  # SOCIETY PASS INCORPORATED.
-    'HSCS': '0001468492',  # HeartSciences Inc.
-    'PTIX': '0001022899',  # Protagenic Therapeutics, Inc.\new
-    'GEGP': '0001081188',  # GOLD ENTERTAINMENT GROUP INC
-    'KTTA': '0001841330',  # Pasithea Therapeutics Corp.
-    'NCPL': '0001414767',  # Netcapital Inc.
-    'ICON': '0001995574',  # Icon Energy Corp
-    'FRGT': '0001687542',  # Freight Technologies, Inc.
-    'LGIQ': '0001335112',  # LOGIQ, INC.
-    'LPTV': '0001643988',  # Loop Media, Inc.
-    'CANN': '0001477009',  # TREES Corp (Colorado)
-    'DHCC': '0000844887',  # DIAMONDHEAD CASINO CORP
-    'SHPH': '0001757499',  # Shuttle Pharmaceuticals Holdings, Inc.
-    'TCBP': '0001872812',  # TC BioPharm (Holdings) plc
-    'WHLR': '0001527541',  # Wheeler Real Estate Investment Trust, Inc.
-    'BITTF': '0001028357',  # BITTERROOT RESOURCES LTD
-    'INM': '0001728328',  # InMed Pharmaceuticals Inc.
-    'MTNB': '0001582554',  # Matinas BioPharma Holdings, Inc.
-    'SENR': '0001576197',  # Strategic Environmental & Energy Resources, Inc.
-    'RELI': '0001812727',  # Reliance Global Group, Inc.
-    'ATCH': '0001963088',  # AtlasClear Holdings, Inc.
-    'RSLS': '0001427570',  # ReShape Lifesciences Inc.
-    'WORX': '0001674227',  # SCWorx Corp.
-    'ALTX': '0000775057',  # ALTEX INDUSTRIES INC
-    'BCAN': '0001888151',  # Femto Technologies Inc.
-    'DWTX': '0001818844',  # Dogwood Therapeutics, Inc.
-    'SNES': '0001680378',  # SenesTech, Inc.
-    'NUGN': '0001593549',  # Livento Group, Inc.
-    'SLXN': '0002022416',  # Silexion Therapeutics Corp
-    'QLGN': '0001460702',  # Qualigen Therapeutics, Inc.
-    'NDRA': '0001681682',  # ENDRA Life Sciences Inc.
-    'SISI': '0001300734',  # SHINECO, INC.
-    'CIPI': '0001108645',  # Correlate Energy Corp.
-    'GNLN': '0001743745',  # Greenlane Holdings, Inc.
-    'XYLO': '0001618500',  # XYLO TECHNOLOGIES LTD
-    'SYTA': '0001649009',  # Siyata Mobile Inc.
-    'CBLO': '0001882781',  # C2 Blockchain,Inc.
-    'NEWH': '0001371128',  # NewHydrogen, Inc.
-    'AQB': '0001603978',  # AQUABOUNTY TECHNOLOGIES INC
-    'EOSS': '0001651958',  # EOS INC.
-    'FUNI': '0001502966',  # Hypha Labs, Inc.
-    'SCNI': '0001611747',  # Scinai Immunotherapeutics Ltd.
-    'YCBD': '0001644903',  # cbdMD, Inc.
-    'STTDF': '0001815128',  # Standard Uranium Ltd.
-    'UOKA': '0001741534',  # MDJM LTD
-    'SNAX': '0001691936',  # STRYVE FOODS, INC.
-    'BMMJ': '0001715611',  # BODY & MIND INC.
-    'TTNP': '0000910267',  # TITAN PHARMACEUTICALS INC
-    'VERO': '0001409269',  # Venus Concept Inc.
-    'LUXH': '0001893311',  # LUXURBAN HOTELS INC.
-    'CLRI': '0001362516',  # Cleartronic, Inc.
-    'AUUD': '0001554818',  # AUDDIA INC.
-    'PHIO': '0001533040',  # Phio Pharmaceuticals Corp.
-    'TIVC': '0001787740',  # Tivic Health Systems, Inc.
-    'WOLV': '0001424404',  # Wolverine Resources Corp.
-    'CYAN': '0000768408',  # CYANOTECH CORP
-    'BRVO': '0001444839',  # Bravo Multinational Inc.
-    'FHSEY': '0001786182',  # First High-School Education Group Co., Ltd.
-    'KXIN': '0001713539',  # Kaixin Holdings
-    'ICCT': '0001906133',  # iCoreConnect Inc.
-    'NRRWF': '0001680637',  # Nuran Wireless Inc.
-    'ENTO': '0001604191',  # Entero Therapeutics, Inc.
-    'ALCE': '0001883984',  # Alternus Clean Energy, Inc.
-    'GRTX': '0001563577',  # Galera Therapeutics, Inc.
-    'EBYH': '0001666657',  # Strainsforpains, Inc.
-    'CNNN': '0001182731',  # ConneXionONE Corp.
-    'PRFX': '0001801834',  # PAINREFORM LTD.
-    'XXII': '0001347858',  # 22nd Century Group, Inc.
-    'SPGC': '0001934245',  # Sacks Parente Golf, Inc.
-    'AZTR': '0001701478',  # Azitra, Inc.
-    'TARSF': '0001409036',  # Silver North Resources Ltd.
-    'TCRT': '0001107421',  # Alaunos Therapeutics, Inc.
-    'LDSN': '0001737193',  # Luduson G Inc.
-    'ALDA': '0001062506',  # ATLANTICA INC
-    'EGMCF': '0001199392',  # EMERGENT METALS CORP.
-    'PCSA': '0001533743',  # Processa Pharmaceuticals, Inc.
-    'CYCC': '0001130166',  # Cyclacel Pharmaceuticals, Inc.
-    'VYND': '0001745078',  # Vynleads, Inc.
-    'QRON': '0001689084',  # Qrons Inc.
-    'BLFR': '0001547705',  # Bluefire Equipment Corp
-    'GPOX': '0001673475',  # GPO Plus, Inc.
-    'SGBX': '0001023994',  # SAFE & GREEN HOLDINGS CORP.
-    'BACK': '0001729944',  # IMAC Holdings, Inc.
-    'NVVE': '0001836875',  # Nuvve Holding Corp.
-    'ISPC': '0001558569',  # iSpecimen Inc.
-    'HWKE': '0001750777',  # Hawkeye Systems, Inc.
-    'NULGF': '0001502758',  # NuLegacy Gold Corp
-    'SNRG': '0001652539',  # SusGlobal Energy Corp.
-    'AVRW': '0001643301',  # Avenir Wellness Solutions, Inc.
-    'DRMA': '0001853816',  # Dermata Therapeutics, Inc.
-    'BLIS': '0001703625',  # NAPC Defense, Inc.
-    'BDRX': '0001643918',  # Biodexa Pharmaceuticals Plc
-    'VEVMQ': '0001834975',  # VICINITY MOTOR CORP
-    'TLLTF': '0001761510',  # TILT Holdings Inc.
-    'SVRE': '0001894693',  # SaverOne 2014 Ltd.
-    'ADTX': '0001726711',  # Aditxt, Inc.
-    'ODYY': '0001626644',  # Odyssey Health, Inc.
-    'TC': '0001743340',  # TuanChe Ltd
-    'ENSV': '0000319458',  # Enservco Corp
-    'BBLG': '0001419554',  # Bone Biologics Corp
-    'VIRA': '0001130781',  # NEURALBASE AI LTD.
-    'HSDT': '0001610853',  # HELIUS MEDICAL TECHNOLOGIES, INC.
-    'DGLY': '0001342958',  # DIGITAL ALLY, INC.
-    'SXTP': '0001946563',  # 60 DEGREES PHARMACEUTICALS, INC.
-    'VCNX': '0001205922',  # VACCINEX, INC.
-    'WHLT': '0001025771',  # CHASE PACKAGING CORP
-    'SUIC': '0001394108',  # SUIC Worldwide Holdings Ltd.
-    'WINT': '0000946486',  # WINDTREE THERAPEUTICS INC /DE/
-    'STQN': '0000847942',  # STRATEGIC ACQUISITIONS INC /NV/
-    'VYCO': '0001424768',  # VYCOR MEDICAL INC
-    'FERN': '0001880419',  # Fernhill Corp
-    'SMCE': '0001497230',  # SMC Entertainment, Inc.
-    'VPRB': '0001376231',  # VPR Brands, LP.
-    'SLRX': '0001615219',  # Salarius Pharmaceuticals, Inc.
-    'TAOP': '0001552670',  # Taoping Inc.
-    'RNAZ': '0001829635',  # Transcode Therapeutics, Inc.
-    'TRCK': '0001045942',  # Track Group, Inc.
-    'AHRO': '0001338929',  # Authentic Holdings, Inc.
-    'OMQS': '0000278165',  # OMNIQ Corp.
-    'VLCN': '0001829794',  # Volcon, Inc.
-    'HGAS': '0001817232',  # Global Gas Corp
-    'BPTSY': '0001768946',  # Biophytis SA
-    'FMNJ': '0001304077',  # Franklin Mining, Inc.
-    'AKAN': '0001888014',  # AKANDA CORP.
-    'MAGE': '0001515317',  # MAGELLAN COPPER & GOLD INC.
-    'ZPHYF': '0001613979',  # ZEPHYR MINERALS LTD.
-    'LOGQ': '0000768216',  # Coyni, Inc.
-    'AAGH': '0001098009',  # America Great Health
-    'USAQ': '0000856984',  # QHSLab, Inc.
-    'FEMFF': '0001066130',  # FE Battery Metals Corp.
-    'SBET': '0001981535',  # SharpLink Gaming, Inc.
-    'FRES': '0001786511',  # Fresh2 Group Ltd
-    'CHEV': '0001459188',  # Charging Robotics Inc.
-    'OWPC': '0001622244',  # One World Products, Inc.
-    'HMMR': '0001539680',  # HAMMER FIBER OPTICS HOLDINGS CORP
-    'TOGI': '0001349706',  # TurnOnGreen, Inc.
-    'KCRD': '0001696025',  # Kindcard, Inc.
-    'VPER': '0001133192',  # VIPER NETWORKS INC
-    'BJDX': '0001704287',  # Bluejay Diagnostics, Inc.
-    'ALDS': '0001755101',  # APPlife Digital Solutions Inc
-    'SXTC': '0001723980',  # China SXT Pharmaceuticals, Inc.
-    'CRCE': '0001911467',  # Circle Energy, Inc./NV
-    'NAOV': '0001326706',  # NanoVibronix, Inc.
-    'SGN': '0001898474',  # Signing Day Sports, Inc.
-    'BRWC': '0001873213',  # Birdie Win Corp
-    'AVGR': '0001506928',  # Avinger Inc
-    'GCTK': '0001506983',  # Glucotrack, Inc.
-    'SRSG': '0001434737',  # SPIRITS TIME INTERNATIONAL, INC.
-    'SCPX': '0001476963',  # Scorpius Holdings, Inc.
-    'ENGC': '0000933738',  # ENGLOBAL CORP
-    'WLYW': '0001555214',  # Wally World Media, Inc
-    'VTNRQ': '0000890447',  # Vertex Energy Inc.
-    'ABQQ': '0001605331',  # AB INTERNATIONAL GROUP CORP.
-    'LBUY': '0001643721',  # LEAFBUYER TECHNOLOGIES, INC.
-    'ATMH': '0001484674',  # ALL THINGS MOBILE ANALYTIC, INC.
-    'SNBH': '0001358633',  # SENTIENT BRANDS HOLDINGS INC.
-    'RAASY': '0001804583',  # Cloopen Group Holding Ltd
-    'MINM': '0001467761',  # MINIM, INC.
-    'BGAVF': '0001500620',  # Bravada Gold Corp
-    'NVOS': '0001138978',  # Novo Integrated Sciences, Inc.
-    'ILST': '0001100788',  # INTERNATIONAL STAR INC
-    'PBLA': '0001029125',  # Panbela Therapeutics, Inc.
-    'KRFG': '0000774415',  # OneSolution Technology Inc.
-    'MMND': '0001088638',  # MASTERMIND, INC.
-    'JEWL': '0001884072',  # Adamas One Corp.
-    'EEGI': '0001043150',  # Eline Entertainment Group, Inc.
-    'YBCN': '0001284454',  # Yong Bai Chao New Retail Corp
-    'GTCH': '0001471781',  # GBT Technologies Inc.
-    'RMESF': '0001358654',  # RED METAL RESOURCES, LTD.
-    'UK': '0001821424',  # Ucommune International Ltd
-    'OILCF': '0001922639',  # Permex Petroleum Corp
-    'CRGH': '0001798458',  # Carriage House Event Center, Inc.
-    'EAWD': '0001563298',  # Energy & Water Development Corp
-    'CMGR': '0001389518',  # Clubhouse Media Group, Inc.
-    'GBLX': '0001165320',  # GB SCIENCES INC
-    'TRVN': '0001429560',  # TREVENA INC
-    'SHWZ': '0001622879',  # Medicine Man Technologies, Inc.
-    'REOS': '0001335288',  # ReoStar Energy CORP
-    'HUML': '0002041890',  # Humble Energy, Inc./FL
-    'SONG': '0001671132',  # Music Licensing Inc.
-    'CRCW': '0001688126',  # Crypto Co
-    'TSOI': '0001419051',  # THERAPEUTIC SOLUTIONS INTERNATIONAL, INC.
-    'EZGO': '0001806904',  # EZGO Technologies Ltd.
-    'MNTR': '0001599117',  # Mentor Capital, Inc.
-    'MRNJ': '0001607004',  # METATRON APPS, INC.
-    'NRIS': '0001603793',  # Norris Industries, Inc.
-    'AUMN': '0001011509',  # Golden Minerals Co
-    'AFIB': '0001522860',  # Acutus Medical, Inc.
-    'ATYG': '0001093636',  # Saxon Capital Group, Inc./DE
-    'PMVC': '0001807765',  # PMV Consumer Acquisition Corp.
-    'SKVI': '0001085277',  # SKINVISIBLE, INC.
-    'NVSGF': '0001415758',  # Nevada Sunrise Metals Corp.
-    'KRBP': '0001792581',  # Kiromic Biopharma, Inc.
-    'EQOSQ': '0001790515',  # EQONEX Ltd
-    'FECOF': '0000849997',  # FEC Resources Inc.
-    'GMER': '0001454742',  # GOOD GAMING, INC.
-    'HHHEF': '0000825171',  # 37 CAPITAL INC
-    'TANH': '0001588084',  # TANTECH HOLDINGS LTD
-    'MRPT': '0001143994',  # MACREPORT NET INC
-    'ASII': '0001464865',  # Accredited Solutions, Inc.
-    'UPC': '0001809616',  # Universe Pharmaceuticals INC
-    'ACON': '0001635077',  # Aclarion, Inc.
-    'BEGI': '0001483646',  # BLACKSTAR ENTERPRISE GROUP, INC.
-    'PRSI': '0000079661',  # PORTSMOUTH SQUARE INC
-    'LAAB': '0001584480',  # Startech Labs, Inc.
-    'ARRT': '0001530425',  # Artisan Consumer Goods, Inc.
-    'AETHF': '0001639142',  # Aether Global Innovations Corp.
-    'HLLK': '0001331421',  # HALLMARK VENTURE GROUP, INC.
-    'KAYS': '0001530746',  # Kaya Holdings, Inc.
-    'CAPC': '0000814926',  # CAPSTONE COMPANIES, INC.
-    'LQWC': '0001060888',  # LIFEQUEST WORLD CORP.
-    'GLFH': '0001574676',  # Galenfeha, Inc.
-    'IMII': '0001416090',  # INCEPTION MINING INC.
-    'VYST': '0001308027',  # Vystar Corp
-    'CWBR': '0001522602',  # CohBar, Inc.
-    'PLSH': '0001552189',  # PANACEA LIFE SCIENCES HOLDINGS, INC.
-    'GNTOF': '0001346917',  # GENTOR RESOURCES INC.
-    'PGOL': '0001080448',  # PATRIOT GOLD CORP
-    'SRGZ': '0001401835',  # Star Gold Corp.
-    'SONX': '0001407973',  # Sonendo, Inc.
-    'PTCO': '0001609258',  # PetroGas Co
-    'BSPK': '0001409197',  # Bespoke Extracts, Inc.
-    'VEII': '0001417664',  # Value Exchange International, Inc.
-    'PAXH': '0001350156',  # PREAXIA HEALTH CARE PAYMENT SYSTEMS INC.
-    'AVPMF': '0001445467',  # AVRUPA MINERALS LTD.
-    'NGTF': '0001593001',  # NightFood Holdings, Inc.
-    'SPEV': '0000764630',  # SHOREPOWER TECHNOLOGIES INC.
-    'CBDL': '0001776073',  # CBD Life Sciences Inc.
-    'ADD': '0001747661',  # Color Star Technology Co., Ltd.
-    'ENRT': '0001346022',  # Enertopia Corp.
-    'DREM': '0001518336',  # Dream Homes & Development Corp.
-    'NWCN': '0000934796',  # NETWORK CN INC
-    'DBGI': '0001668010',  # Digital Brands Group, Inc.
-    'CSUI': '0001680132',  # CANNABIS SUISSE CORP.
-    'RGBP': '0001589150',  # Regen BioPharma Inc
-    'ASFT': '0001651992',  # Appsoft Technologies, Inc.
-    'MVLA': '0001839132',  # Movella Holdings Inc.
-    'DYNT': '0000720875',  # DYNATRONICS CORP
-    'ATAO': '0001570937',  # ALTAIR INTERNATIONAL CORP.
-    'GRTSQ': '0001656634',  # Gritstone bio, Inc.
-    'BSFC': '0001730773',  # Blue Star Foods Corp.
-    'MMEX': '0001440799',  # MMEX Resources Corp
-    'EBZT': '0001730869',  # Everything Blockchain, Inc.
-    'ESMC': '0000862668',  # ESCALON MEDICAL CORP
-    'ISCO': '0001355790',  # International Stem Cell CORP
-    'LADX': '0000799698',  # LadRx Corp
-    'EVFM': '0001618835',  # Evofem Biosciences, Inc.
-    'WAST': '0001515139',  # WASTE ENERGY CORP.
-    'FMHS': '0001811999',  # FARMHOUSE, INC. /NV
-    'MCOM': '0001788841',  # micromobility.com Inc.
-    'CAMG': '0001419559',  # CAM GROUP, INC.
-    'MLRT': '0001375793',  # Metalert, Inc.
-    'BOTY': '0001407704',  # LINGERIE FIGHTING CHAMPIONSHIPS, INC.
-    'EMMA': '0000822370',  # Emmaus Life Sciences, Inc.
-    'JPPYY': '0001616291',  # Jupai Holdings Ltd
-    'CONC': '0000790273',  # CONECTISYS CORP
-    'VNUE': '0001376804',  # VNUE, Inc.
-    'AKTSQ': '0001584754',  # Akoustis Technologies, Inc.
-    'CBDY': '0001586554',  # Target Group Inc.
-    'ADIA': '0001160420',  # Adia Nutrition, Inc.
-    'JFIL': '0001517389',  # Jubilant Flame International, Ltd
-    'SOBR': '0001425627',  # SOBR Safe, Inc.
-    'RGTPQ': '0001076682',  # POLARITYTE, INC.
-    'YCRM': '0001624517',  # Yuenglings Ice Cream Corp
-    'GLAE': '0001014111',  # GlassBridge Enterprises, Inc.
-    'FRCB': '0001132979',  # FIRST REPUBLIC BANK
-    'PIKM': '0001861522',  # KIDPIK CORP.
-    'WDDD': '0000001961',  # WORLDS INC
-    'NUMD': '0001543637',  # Nu-Med Plus, Inc.
-    'CMGO': '0001346655',  # CMG HOLDINGS GROUP, INC.
-    'NXEN': '0001625288',  # NEXIEN BIOPHARMA, INC.
-    'GRLF': '0000915661',  # GREEN LEAF INNOVATIONS INC
-    'ACAN': '0001508348',  # AmeriCann, Inc.
-    'ARTH': '0001537561',  # Arch Therapeutics, Inc.
-    'BTAX': '0001559356',  # Biostax Corp.
-    'MEXGF': '0001609436',  # Mexican Gold Mining Corp.
-    'VHAI': '0001880431',  # Vocodia Holdings Corp
-    'CBDW': '0001877461',  # 1606 CORP.
-    'SYIN': '0001292490',  # Synbio International, Inc.
-    'SAML': '0001530163',  # Samsara Luggage, Inc.
-    'PXMD': '0001811623',  # PaxMedica, Inc.
-    'GSPI': '0001461708',  # Green Star Products, Inc.
-    'IPSI': '0001591913',  # Innovative Payment Solutions, Inc.
-    'KDCE': '0001049011',  # KID CASTLE EDUCATIONAL CORP
-    'CLOW': '0001619227',  # Cloudweb, Inc.
-    'QPRC': '0000824416',  # QUEST PATENT RESEARCH CORP
-    'FRZT': '0001485074',  # Freeze Tag, Inc.
-    'TPTW': '0001661039',  # TPT GLOBAL TECH, INC.
-    'DBMM': '0001127475',  # Digital Brand Media & Marketing Group, Inc.
-    'VNTH': '0001497130',  # Nano Mobile Healthcare, Inc.
-    'GCAN': '0001695473',  # Greater Cannabis Company, Inc.
-    'BOTH': '0000894560',  # BIOETHICS LTD
-    'GSTX': '0001497649',  # Graphene & Solar Technologies Ltd
-    'DTII': '0001533357',  # DEFENSE TECHNOLOGIES INTERNATIONAL CORP.
-    'CLDVF': '0001971260',  # Web3 Ventures Inc.
-    'GRVE': '0000918573',  # GROOVE BOTANICALS INC.
-    'PAPA': '0002024283',  # Papa Medical Inc.
-    'TLSS': '0001463208',  # Transportation & Logistics Systems, Inc.
-    'NRHI': '0001680689',  # Natural Resource Holdings, Inc.
-    'EMDF': '0000894552',  # E Med Future, Inc.
-    'CCTC': '0001477960',  # Catalyst Crew Technologies Corp.
-    'GFMH': '0000820771',  # Goliath Film & Media Holdings
-    'SSOK': '0001559157',  # Sunstock, Inc.
-    'LEJUY': '0001596856',  # Leju Holdings Ltd
-    'KATX': '0001474558',  # KAT EXPLORATION, INC.
-    'MRZM': '0001413754',  # MARIZYME, INC.
-    'KEGS': '0000884380',  # 1812 Brewing Company, Inc.
-    'MTLK': '0001098462',  # METALINK LTD
-    'CBNT': '0001421636',  # C-Bond Systems, Inc
-    'NBND': '0001725911',  # NetBrands Corp.
-    'CYTOF': '0001601936',  # Altamira Therapeutics Ltd.
-    'RWGI': '0001867589',  # Rodedawg International Industries, Inc.
-    'VISM': '0001082733',  # VISIUM TECHNOLOGIES, INC.
-    'HIGR': '0001807616',  # Hi-Great Group Holding Co
-    'MGTI': '0001001601',  # MGT CAPITAL INVESTMENTS, INC.
-    'ZRFY': '0001285543',  # Zerify, Inc.
-    'BLPG': '0001416697',  # Blue Line Protection Group, Inc.
-    'BDPT': '0001575142',  # BIOADAPTIVES, INC.
-    'SLDC': '0001427644',  # Telco Cuba, Inc.
-    'TBIO': '0001850079',  # Telesis Bio Inc.
-    'NSTM': '0000912544',  # NovelStem International Corp.
-    'TUPBQ': '0001008654',  # TUPPERWARE BRANDS CORP
-    'SATT': '0001661600',  # SATIVUS TECH CORP.
-    'AAGR': '0001848898',  # African Agriculture Holdings Inc.
-    'VSOLF': '0001547660',  # THREE SIXTY SOLAR LTD.
-    'VINOQ': '0001559998',  # Gaucho Group Holdings, Inc.
-    'AIXN': '0000835662',  # AiXin Life International, Inc.
-    'USLG': '0001536394',  # U.S. Lighting Group, Inc.
-    'MHTX': '0001099132',  # MANHATTAN SCIENTIFICS INC
-    'ITOX': '0001290658',  # IIOT-OXYS, Inc.
-    'BISA': '0000918545',  # BALTIC INTERNATIONAL USA INC
-    'OMTK': '0001404804',  # Omnitek Engineering Corp
-    'SKFG': '0001794942',  # Stark Focus Group, Inc.
-    'NIHK': '0001084475',  # Video River Networks, Inc.
-    'CAPS': '0000887151',  # Capstone Holding Corp.
-    'LGCP': '0001661166',  # Legion Capital Corp
-    'GMPW': '0001064722',  # GIVEMEPOWER CORP
-    'EMAX': '0001008653',  # Ecomax, Inc
-    'NNAX': '0001132509',  # New Momentum Corp.
-    'SPEC': '0001844149',  # Spectaire Holdings Inc.
-    'LSMG': '0001319643',  # Lode-Star Mining Inc.
-    'QTTOY': '0001733298',  # Qutoutiao Inc.
-    'STAL': '0001614556',  # Star Alliance International Corp.
-    'TMGI': '0001434601',  # Marquie Group, Inc.
-    'ATVK': '0001530185',  # Ameritek Ventures, Inc.
-    'GSAC': '0000890725',  # GELSTAT CORP
-    'ECPL': '0001356914',  # ECOPLUS INC
-    'GSTC': '0001502152',  # GlobeStar Therapeutics Corp
-    'DLOC': '0001407878',  # Digital Locations, Inc.
-    'NIMU': '0000720762',  # NON INVASIVE MONITORING SYSTEMS INC /FL/
-    'BFYW': '0001852707',  # Better For You Wellness, Inc.
-    'RMTG': '0001760026',  # Regenerative Medical Technology Group Inc.
-    'PDPG': '0001902930',  # Performance Drink Group, Inc.
-    'SMME': '0001301991',  # SmartMetric, Inc.
-    'GRPS': '0001990446',  # Trans American Aquaculture, Inc
-    'GAHC': '0001138724',  # Global Arena Holding, Inc.
-    'RSPI': '0000849636',  # RespireRx Pharmaceuticals Inc.
-    'BIOLQ': '0000811240',  # BIOLASE, INC
-    'DCLT': '0001321828',  # Data Call Technologies
-    'KOAN': '0000897078',  # Resonate Blends, Inc.
-    'INQD': '0001572565',  # Indoor Harvest Corp
-    'BETSF': '0001543268',  # Bit Brother Ltd
-    'BRGO': '0001431074',  # Bergio International, Inc.
-    'FLXT': '0000925660',  # FLEXPOINT SENSOR SYSTEMS INC
-    'KITL': '0001608092',  # Kisses From Italy Inc.
-    'JKSM': '0000860543',  # Jacksam Corp
-    'CBIA': '0001404356',  # Blue Heaven Coffee, Inc.
-    'DXFFY': '0001499494',  # Dunxin Financial Holdings Ltd
-    'LOWLF': '0001838128',  # Lowell Farms Inc.
-    'CTKYY': '0001734262',  # CooTek(Cayman)Inc.
-    'PLTYF': '0001433309',  # Plastec Technologies, Ltd.
-    'EMED': '0001715819',  # Electromedical Technologies, Inc
-    'RAKR': '0001872292',  # Rainmaker Worldwide Inc.
-    'VRTC': '0000773318',  # VERITEC INC
-    'SEELQ': '0001017491',  # SEELOS THERAPEUTICS, INC.
-    'PPCB': '0001517681',  # Propanc Biopharma, Inc.
-    'CNBX': '0001343009',  # CNBX Pharmaceuticals Inc.
-    'LEEN': '0001230524',  # Leopard Energy, Inc.
-    'AOXY': '0000352991',  # ADVANCED OXYGEN TECHNOLOGIES INC
-    'VMHG': '0000895287',  # VICTORY MARINE HOLDINGS CORP
-    'TLCC': '0001590695',  # TWINLAB CONSOLIDATED HOLDINGS, INC.
-    'NTBLQ': '0001603207',  # Notable Labs, Ltd.
-    'FINR': '0001623590',  # Fintech Scion Ltd
-    'PTOS': '0001172069',  # P2 Solar, Inc.
-    'GPAK': '0001948884',  # Gamer Pakistan Inc
-    'INND': '0001609139',  # INNERSCOPE HEARING TECHNOLOGIES, INC.
-    'SANP': '0001499275',  # SANTO MINING CORP.
-    'BRSHF': '0001913210',  # Bruush Oral Care Inc.
-    'USCTF': '0001860514',  # Roth CH Acquisition Co.
-    'DGWR': '0001637866',  # Deep Green Waste & Recycling, Inc.
-    'MTEM': '0001183765',  # Molecular Templates, Inc.
-    'SPOWF': '0001227282',  # Strata Power Corp
-    'YTENQ': '0001121702',  # YIELD10 BIOSCIENCE, INC.
-    'TMPOQ': '0001813658',  # Tempo Automation Holdings, Inc.
-    'PBIO': '0000830656',  # PRESSURE BIOSCIENCES INC
-    'NEXI': '0001538210',  # NexImmune, Inc.
-    'FCHS': '0001416876',  # First Choice Healthcare Solutions, Inc.
-    'SHRG': '0001644488',  # SHARING SERVICES GLOBAL Corp
-    'CWNOF': '0001145898',  # CHINESEWORLDNET COM INC
-    'SING': '0001443611',  # SinglePoint Inc.
-    'GTRL': '0001762546',  # Get Real USA, Inc.
-    'IONM': '0001798270',  # Assure Holdings Corp.
-    'CMAXQ': '0001813914',  # CareMax, Inc.
-    'BOMO': '0001381871',  # bowmo, Inc.
-    'SDCCQ': '0001775625',  # SmileDirectClub, Inc.
-    'MGAM': '0001886362',  # Mobile Global Esports, Inc.
-    'AMMJ': '0000945617',  # American Cannabis Company, Inc.
-    'NUVOQ': '0001990145',  # Holdco Nuvo Group D.G Ltd.
-    'TPIA': '0001763329',  # Mycotopia Therapies, Inc.
-    'XTIA': '0001529113',  # XTI Aerospace, Inc.
-    'ATDS': '0001068689',  # Data443 Risk Mitigation, Inc.
-    'IPIX': '0001355250',  # Innovation Pharmaceuticals Inc.
-    'CIRX': '0000813716',  # CIRTRAN CORP
-    'BANT': '0001704795',  # Bantec, Inc.
-    'FSTJ': '0001525306',  # First America Resources Corp
-    'DBRM': '0001164256',  # DAYBREAK OIL & GAS, INC.
-    'DCFCQ': '0001862490',  # Tritium DCFC Ltd
-    'STRG': '0001803096',  # STARGUIDE GROUP, INC.
-    'CUEN': '0001424657',  # Cuentas Inc.
-    'ELYS': '0001080319',  # Elys BMG Group, Inc.
-    'GGEI': '0001158420',  # Green Giant Inc.
-    'ACUR': '0000786947',  # ACURA PHARMACEUTICALS, INC
-    'XSNX': '0001039466',  # NovAccess Global Inc.
-    'EBET': '0001829966',  # EBET, Inc.
-    'TTCFQ': '0001741231',  # Tattooed Chef, Inc.
-    'ISUNQ': '0001634447',  # ISUN, INC.
-    'GPLDF': '0001300050',  # GREAT PANTHER MINING Ltd
-    'GROM': '0001662574',  # Grom Social Enterprises, Inc.
-    'ELIQQ': '0001827871',  # Electriq Power Holdings, Inc.
-    'NMRD': '0001602078',  # Nemaura Medical Inc.
-    'UPHL': '0001770141',  # UpHealth, Inc.
-    'ARVLF': '0001835059',  # Arrival
-    'DMTKQ': '0001651944',  # DermTech, Inc.
-    'BFICQ': '0001723580',  # BurgerFi International, Inc.
-    'BBIG': '0001717556',  # Vinco Ventures, Inc.
-    'RIBT': '0001063537',  # RiceBran Technologies
-    'BIMI': '0001213660',  # BIMI Holdings Inc.
-    'FUVV': '0001558583',  # Arcimoto Inc
-    'DLAPQ': '0001101396',  # DELTA APPAREL, INC
-    'MMATQ': '0001431959',  # META MATERIALS INC.
-    'WTRV': '0001589361',  # White River Energy Corp.
-    'SUNWQ': '0001172631',  # Sunworks, Inc.
-    'ELOX': '0001035354',  # Eloxx Pharmaceuticals, Inc.
-    'NTHI': '0001979414',  # NEONC TECHNOLOGIES HOLDINGS, INC.
-    'DGNX': '0002010499',  # Diginex Ltd
-    'HLTHQ': '0001628945',  # Cue Health Inc.
-    'IGOT': '0000867028',  # FOMO WORLDWIDE, INC.
-    'NICH': '0000772263',  # NITCHES INC
-    'COTI': '0001624140',  # CORETAG, INC.
-    'BABY': '0001611282',  # PishPosh, Inc.
-    'AAAU': '0001708646',  # Goldman Sachs Physical Gold ETF
-    'AIDG': '0001702015',  # AIS Holdings Group, Inc.
-    'TFSA': '0001577134',  # Terra Income Fund 6, LLC
-    'BIORQ': '0001580063',  # BIORA THERAPEUTICS, INC.
-    'CAST': '0001633369',  # FreeCast, Inc.
-    'MOMC': '0001619174',  # BLOCKHOLD CAPITAL CORP
-    'BBNX': '0001674632',  # Beta Bionics, Inc
-    'AAGO': '0001805092',  # Aspargo Labs, Inc.
-    'BAR': '0001690437',  # GraniteShares Gold Trust
-    'ARAI': '0001818274',  # Arrive AI Inc.
-    'AILEQ': '0001835972',  # iLearningEngines, Inc.
-    'OAK-PA': '0001403528',  # Brookfield Oaktree Holdings, LLC
-    'UNL': '0001405513',  # United States 12 Month Natural Gas Fund, LP
-    'GLNS': '0001375348',  # Golden Star Resource Corp.
-    'UDN': '0001383149',  # INVESCO DB US DOLLAR INDEX BEARISH FUND
-    'UUP': '0001383151',  # Invesco DB US Dollar Index Bullish Fund
-    'GJT': '0001357660',  # STRATS(SM) Trust for Allstate Corp Securities, Series 2006-3
-    'GJO': '0001340909',  # STRATS SM TRUST FOR WAL-MART STORES, INC. SECURITIES, SERIES 2005-4
-    'BNO': '0001472494',  # United States Brent Oil Fund, LP
-    'LVDW': '0001503658',  # LiquidValue Development Inc.
-    'JTGEY': '0001472033',  # Citibank,N.A./ADR
-    'PALL': '0001459862',  # abrdn Palladium ETF Trust
-    'FETH': '0002000046',  # Fidelity Ethereum Fund
-    'PRGY': '0001997698',  # IGTA Merger Sub Ltd
-    'IOTR': '0001997637',  # iOThree Ltd
-    'TLIH': '0001982012',  # Ten-League International Holdings Ltd
-    'ENGS': '0001971828',  # Energys Group Ltd
-    'MTSR': '0002040807',  # Metsera, Inc.
-    'YZRY': '0002048394',  # Gansu Yunzhao Ruyi Technology Development Co., Ltd.
-    'LOKV': '0002048951',  # Live Oak Acquisition Corp. V
-    'KFII': '0002029976',  # K&F GROWTH ACQUISITION CORP. II
-    'LFS': '0002030277',  # LEIFRAS Co., Ltd.
-    'AACB': '0002034334',  # Artius II Acquisition Inc.
-    'LGPS': '0002040290',  # LOGPROSTYLE INC.
-    'DLXY': '0002025218',  # Delixy Holdings Ltd
-    'RYOJ': '0002012600',  # rYojbaba Co., Ltd.
-    'AURS': '0002025049',  # Aurous Resources
-    'WXM': '0001979610',  # WF International Ltd.
-    'NUTR': '0002006468',  # NUSATRIP Inc
-    'JFB': '0002024306',  # JFB Construction Holdings
-    'FCHL': '0002023796',  # Fitness Champs Holdings Ltd
-    'TGHL': '0002024114',  # GrowHub Ltd
-    'DMNT': '0001996450',  # DMINT, Inc.
-    'BTC': '0002015034',  # Grayscale Bitcoin Mini Trust ETF
-    'TMDE': '0002009714',  # TMD Energy Ltd
-    'SDM': '0002014955',  # Smart Digital Group Ltd
-    'COLA': '0002028201',  # Columbus Acquisition Corp/Cayman Islands
-    'POAS': '0002024258',  # Phaos Technology (Cayman) Holdings Ltd
-    'TOPW': '0002033515',  # Top Win International Ltd
-    'SVCC': '0002033593',  # Stellar V Capital Corp. (Cayman Islands)
-    'MAYA': '0002028355',  # Maywood Acquisition Corp.
-    'MGRT': '0002033377',  # Mega Fortune Co Ltd
-    'JACS': '0002039058',  # Jackson Acquisition Co II
-    'AHJK': '0002045931',  # Aimei Health Technology II Co., Ltd.
-    'MJID': '0001897532',  # Majestic Ideal Holdings Ltd
-    'FBGL': '0001938534',  # FBS Global Ltd
-    'CRGT': '0001958489',  # Cortigent, Inc.
-    'TOPP': '0001960847',  # Toppoint Holdings Inc.
-    'SLRA': '0001880189',  # SOLERA CORP.
-    'EIIA': '0001896036',  # Eagle Point Institutional Income Fund
-    'MANA': '0001852023',  # Grayscale Decentraland Trust (MANA)
-    'GLIV': '0001852024',  # Grayscale Livepeer Trust (LPT)
-    'GLNK': '0001852025',  # Grayscale Chainlink Trust (LINK)
-    'ETHV': '0001860788',  # VanEck Ethereum ETF
-    'TSLVF': '0001852753',  # TIER ONE SILVER INC.
-    'HVII': '0001846416',  # Hennessy Capital Investment Corp. VII
-    'HODL': '0001838028',  # VanEck Bitcoin ETF
-    'PYT': '0001294808',  # PPLUS Trust Series GSC-2
-    'KTN': '0001283337',  # STRUCTURED PRODUCTS CORP CRED ENHANCE CORTS TR FOR AON CAP A
-    'PMHS': '0001265521',  # Polomar Health Services, Inc.
-    'CHSCP': '0000823277',  # CHS INC
-    'CDRPB': '0000761648',  # CEDAR REALTY TRUST, INC.
-    'ULVR': '0000217410',  # UNILEVER PLC
-    'CTBB': '0000068622',  # QWEST CORP
-    'GMCG': '0001983897',  # GLAMOORE Capital Group Co Ltd.
-    'DXST': '0001958133',  # Decent Holding Inc.
-    'RCT': '0002027360',  # RedCloud Holdings plc
-    'GRAN': '0002027722',  # Grande Group Ltd/HK
-    'XHLD': '0002030954',  # TEN Holdings, Inc.
-    'SKBL': '0002031009',  # Skyline Builders Group Holding Ltd
-    'TTG': '0002018836',  # Transten Global Group Ltd
-    'YDES': '0002011674',  # YD Bio Ltd
-    'TWNP': '0002011954',  # Twin Hospitality Group Inc.
-    'WTF': '0001987363',  # Waton Financial Ltd
-    'PN': '0002001288',  # Skycorp Solar Group Ltd
-    'LBRJ': '0001999119',  # Libera Gaming Operations, Inc
-    'DEFI': '0001985840',  # Tidal Commodities Trust I
-    'IBIT': '0001980994',  # iShares Bitcoin Trust ETF
-    'PICW': '0001983022',  # Pictureworks International Holdings Ltd
-    'MRP': '0002017206',  # Millrose Properties, Inc.
-    'UFG': '0002021688',  # Uni-Fuels Holdings Ltd
-    'ATHR': '0002026353',  # Aether Holdings, Inc.
-    'NAMM': '0002026514',  # Namib Minerals
-    'WGRX': '0002030763',  # Wellgistics Health, Inc.
-    'EZBC': '0001992870',  # Franklin Templeton Digital Holdings Trust
-    'KMYGY': '0002003770',  # Kumyang Co., Ltd./ADR
-    'CRE': '0002003977',  # Cre8 Enterprise Ltd
-    'ETHW': '0002013744',  # Bitwise Ethereum ETF
-    'EWSB': '0002013792',  # EWSB Bancorp, Inc. /MD/
-    'SFDX': '0002035964',  # SFIDA X, Inc.
-    'KYTFY': '0002042187',  # Kyoto Financial Group Inc/ADR
-    'YTTA': '0002042648',  # Nidar Infrastructure Ltd
-    'BELR': '0001980034',  # Bell Rose Capital, Inc.
-    'STAK': '0002002453',  # STAK Inc.
-    'YB': '0001995520',  # Yuanbao Inc.
-    'SPHA': '0002030829',  # Shepherd Ave Capital Acquisition Corp
-    'BLIV': '0001982448',  # BeLive Holdings
-    'TMGX': '0001991879',  # Thoughtful Media Group Inc.
-    'AAPG': '0002023311',  # ASCENTAGE PHARMA GROUP INTERNATIONAL
-    'SNDK': '0002023554',  # Sandisk Corp
-    'GFTTY': '0002023719',  # GFT Technologies SE/ADR
-    'ATII': '0002028516',  # Archimedes Tech SPAC Partners II Co.
-    'DMAA': '0002028614',  # Drugs Made In America Acquisition Corp.
-    'CGGJ': '0002028891',  # Guo Jin Sheng Shi Gold Jewelry Group Holding Ltd
-    'GTSG': '0002033738',  # GATES GROUP Inc.
-    'DAIC ': '0002033770',  # CID Holdco, Inc.
-    'RHLD': '0002039497',  # Resolute Holdings Management, Inc.
-    'WSBK': '0002047235',  # Winchester Bancorp, Inc./MD/
-    'ELOG': '0002013320',  # Eastern International Ltd.
-    'FTRK': '0002027262',  # Fast Track Group
-    'MB': '0002027265',  # MASTERBEEF GROUP
-    'DRDB': '0002032528',  # Roman DBDR Acquisition Corp. II
-    'MTNE': '0002044817',  # CH4 Natural Solutions Acquisition Corp
-    'JHKC': '0002045489',  # JuHe KC Holdings Ltd
-    'CJMB': '0002032545',  # CALLAN JMB INC.
-    'EHLD': '0002032779',  # Euroholdings Ltd.
-    'HSPT': '0002032950',  # Horizon Space Acquisition II Corp.
-    'MAMK': '0002008007',  # MaxsMaking Inc.
-    'EZET': '0002011535',  # Franklin Ethereum Trust
-    'ZGM': '0002011458',  # Zenta Group Co Ltd
-    'MKR': '0002018222',  # 707 Cayman Holdings Ltd.
-    'PCLA': '0002018462',  # PicoCELA Inc.
-    'NCT': '0002018529',  # Intercont (Cayman) Ltd
-    'KIDZ': '0002022308',  # Classover Holdings, Inc.
-    'HPOT': '0001990643',  # Great Restaurant Development Holdings Ltd
-    'CABI': '0001987101',  # EL-0713 Fund I, a series of Roll Up Vehicles, LP
-    'SLGB': '0001987189',  # Smart Logistics Global Ltd
-    'SYNSY': '0002004340',  # Syensqo SA/ADR
-    'FGO': '0002004385',  # FG Holdings Ltd
-    'BMGL': '0002004489',  # Basel Medical Group Ltd
-    'HKPD': '0002007702',  # Hong Kong Pharma Digital Technology Holdings Ltd
-    'GMHS': '0002000530',  # Gamehaus Holdings Inc.
-    'ETHA': '0002000638',  # iShares Ethereum Trust ETF
-    'SCAG': '0002000366',  # Scage Future
-    'ICR-PA': '0001690012',  # InPoint Commercial Real Estate Income, Inc.
-    'OUNZ': '0001546652',  # VanEck Merk Gold ETF
-    'CBGGF': '0001845149',  # Chain Bridge I
-    'CUPR': '0001995704',  # Cuprina Holdings (Cayman) LTD
-    'KWM': '0002000756',  # K Wave Media Ltd.
-    'CETH': '0001992508',  # 21Shares Core Ethereum ETF
-    'QETH': '0001995569',  # Invesco Galaxy Ethereum ETF
-    'LHAI': '0002017758',  # Linkhome Holdings Inc.
-    'AGH': '0002009312',  # Aureus Greenway Holdings Inc
-    'SYH': '0002014245',  # Mountain&Sea Health Inc.
-    'KBSX': '0002014254',  # FST Corp.
-    'MOLD': '0002043749',  # Molida Holding Group Co., Ltd
-    'CFND': '0002044327',  # C1 Fund Inc.
-    'NCG': '0002021364',  # HTL Capital Ltd.
-    'ALPS': '0002025774',  # Alps Global Holding Pubco
-    'CURX': '0002025942',  # Curanex Pharmaceuticals Inc
-    'MDER': '0002037646',  # KVAC (Cayman) Ltd
-    'MCTR': '0001969928',  # CTRL GROUP Ltd
-    'WFF': '0001980210',  # WF Holding Ltd
-    'HWEP': '0001980262',  # HW Electro Co., Ltd.
-    'NNNN': '0001982708',  # Anbio Biotechnology
-    'KNRX': '0001982960',  # KNOREX LTD.
-    'FBIC': '0001837254',  # Functional Brands Inc.
-    'KACLF': '0001865468',  # Kairous Acquisition Corp. Ltd
-    'APXIF': '0001868573',  # APx Acquisition Corp. I
-    'ESPA': '0001861371',  # Expectation Acquisition Corp
-    'MAZE': '0001842295',  # Maze Therapeutics, Inc.
-    'BTCO': '0001855781',  # Invesco Galaxy Bitcoin ETF
-    'GSOL': '0001896677',  # Grayscale Solana Trust (SOL)
-    'GACW': '0001872421',  # GACW Inc
-    'FGDL': '0001858258',  # Franklin Templeton Holdings Trust
-    'FFSH': '0001859225',  # Flag Fish Acquisition Corp
-    'SUNH': '0001946025',  # Xuhang Holdings Ltd
-    'AIMA': '0001903464',  # Aimfinity Investment Corp. I
-    'MMCP': '0001879293',  # Mag Mile Capital, Inc.
-    'PIF': '0001851322',  # North Haven Private Income Fund LLC
-    'BTCW': '0001850391',  # WisdomTree Bitcoin Fund
-    'XSIAX': '0001124959',  # VOYA CREDIT INCOME FUND
-    'NRUC': '0000070502',  # NATIONAL RURAL UTILITIES COOPERATIVE FINANCE CORP /DC/
-    'FXB': '0001353611',  # Invesco CurrencyShares British Pound Sterling Trust
-    'FXC': '0001353612',  # Invesco CurrencyShares Canadian Dollar Trust
-    'ELC': '0001348952',  # ENTERGY LOUISIANA, LLC
-    'GEHDF': '0001291313',  # Great Eastern Holdings Ltd
-    'ZCSH': '0001720265',  # Grayscale Zcash Trust (ZEC)
-    'TSM': '0001046179',  # TAIWAN SEMICONDUCTOR MANUFACTURING CO LTD
-    'CGEH': '0001009759',  # Capstone Green Energy Holdings, Inc.
-    'CNCL': '0001130889',  # CANCER CAPITAL CORP
-    'GJH': '0001286405',  # STRATS SM TRUST FOR U S CELL CORP SEC SERIES 2004 6
-    'QVCD': '0001254699',  # QVC INC
-    'MIFF': '0000779227',  # MIFFLINBURG BANCORP INC
-    'IVHI': '0001009919',  # Invech Holdings, Inc.
-    'ZLME': '0001489300',  # Zhanling International Ltd
-    'GLTR': '0001483386',  # abrdn Precious Metals Basket ETF Trust
-    'SFD': '0000091388',  # SMITHFIELD FOODS INC
-    'BNPZY': '0000310732',  # BNP PARIBAS
-    'NHPAP': '0001561032',  # National Healthcare Properties, Inc.
-    'KTH': '0001283464',  # STRUCTURED PRODUCTS CORP CORTS TR FOR PECO ENERGY CAP TR III
-    'GJP': '0001343491',  # STRATS(SM) TRUST FOR DOMINION RESOURCES, INC. SECURITIES, SERIES 2005-6
-    'GJS': '0001356284',  # STRATS(SM) Trust for Goldman Sachs Group Securities, Series 2006-2
-    'RNTX': '0001420565',  # Rein Therapeutics, Inc.
-    'GPLB': '0001392449',  # Green Planet Bio Engineering Co. Ltd.
-    'UGA': '0001396878',  # United States Gasoline Fund, LP
-    'ODRS': '0001610718',  # Outdoor Specialty Products, Inc.
-    'CSAI': '0001709628',  # CLOUDASTRUCTURE, INC.
-    'ETCG': '0001705181',  # Grayscale Ethereum Classic Trust (ETC)
-    'SIVR': '0001450922',  # abrdn Silver ETF Trust
-    'SGOL': '0001450923',  # abrdn Gold ETF Trust
-    'ETI-P': '0001427437',  # ENTERGY TEXAS, INC.
-    'FXA': '0001353614',  # Invesco CurrencyShares Australian Dollar Trust
-    'FXF': '0001353615',  # Invesco CurrencyShares Swiss Franc Trust
-    'HDLMY': '0001400691',  # HeidelbergCement AG
-    'IPB': '0001267332',  # MERRILL LYNCH DEPOSITOR INC INDEXPLUS TRUST SERIES 2003-1
-    'JBK': '0001284143',  # LEHMAN ABS CORP GOLDMAN SACHS CAP 1 SEC BACKED SER 2004-6
-    'HZEN': '0001748945',  # Grayscale Horizen Trust (ZEN)
-    'TCSGQ': '0001411688',  # Container Store Group, Inc.
-    'BITB': '0001763415',  # Bitwise Bitcoin ETF
-    'IAUM': '0001759124',  # iShares Gold Trust Micro
-    'GJR': '0001353226',  # STRATS(SM) Trust for Procter & Gamble Securities, Series 2006-1
-    'USL': '0001405528',  # United States 12 Month Oil Fund, LP
-    'PPLT': '0001460235',  # abrdn Platinum ETF Trust
-    'ICDIQ': '0001537028',  # Independence Contract Drilling, Inc.
-    'CPXTF': '0001555812',  # Siam Makro Public Co Limited/ADR
-    'WETO': '0001941158',  # Webus International Ltd.
-    'HXHX': '0001936817',  # Haoxin Holdings Ltd
-    'ETHE': '0001725210',  # Grayscale Ethereum Trust ETF
-    'TPTA': '0001674356',  # Terra Property Trust, Inc.
-    'GLDM': '0001618181',  # World Gold Trust
-    'NOEM': '0001956648',  # CO2 Energy Transition Corp.
-    'PDSRX': '0001756404',  # Principal Real Asset Fund
-    'GXLM': '0001761325',  # Grayscale Stellar Lumens Trust (XLM)
-    'BYLT': '0001753681',  # Elite Performance Holding Corp
-    'XPTFX': '0001677615',  # Federated Hermes Project & Trade Finance Tender Fund
-    'ARKB': '0001869699',  # Ark 21Shares Bitcoin ETF
-    'DDCIU': '0001867506',  # Diffuse Digital 30, LP
-    'YMAT': '0001875016',  # J-Star Holding Co., Ltd.
-    'FBTC': '0001852317',  # Fidelity Wise Origin Bitcoin Fund
-    'ALSAF': '0001865111',  # Alpha Star Acquisition Corp
-    'FPAQ': '0001946485',  # FPA ENERGY ACQUISITION CORP.
-    'OCAC': '0001926314',  # Ocean Capital Acquisition Corp
-    'EPWK': '0001900720',  # EPWK Holdings Ltd.
-    'RYET': '0001873454',  # Ruanyun Edai Technology Inc.
-    'APUS': '0001894525',  # Apimeds Pharmaceuticals US, Inc.
-    'DIMR': '0001621459',  # DIAMIR BIOSCIENCES CORP.
-    'PLTM': '0001690842',  # GraniteShares Platinum Trust
-    'BITW': '0001723788',  # Bitwise 10 Crypto Index Fund
-    'VISTA': '0001762506',  # Vista Energy, S.A.B. de C.V.
-    'WDSP': '0001813744',  # World Scan Project, Inc.
-    'ITRE': '0001861448',  # IntriEnergy, Inc.
-    'GBAT': '0001852040',  # Grayscale Basic Attention Token Trust (BAT)
-    'BRRR': '0001841175',  # CoinShares Valkyrie Bitcoin Fund
-    'CRTAF': '0001848437',  # Cartica Acquisition Corp
-    'LIMN': '0001971387',  # Iris Parent Holding Corp.
-    'FFFZ': '0001954705',  # Fuxing China Group Ltd
-    'MGN': '0001995075',  # Megan Holdings Ltd.
-    'EFB': '0002001611',  # Everfront Biotech Holding Co Ltd
-    'CIGL': '0002001794',  # Concorde International Group Ltd.
-    'USIC': '0001940366',  # Uncle's Ice Cream
-    'FOFA': '0001871181',  # Qualis Innovations, Inc.
-    'MMVVF': '0001874074',  # MultiMetaVerse Holdings Ltd
-    'OHHH': '0001878371',  # Orion Haus Homes & Hotels Inc.
-    'TREO': '0002041208',  # Plum III Merger Corp.
-    'RIBB': '0002035016',  # Ribbon Acquisition Corp.
-    'FLOC': '0002035149',  # Flowco Holdings Inc.
-    'RANG': '0002035644',  # Range Capital Acquisition Corp.
-    'INR': '0002029118',  # INFINITY NATURAL RESOURCES, INC.
-    'SAGT': '0002029138',  # SAGTEC GLOBAL Ltd
-    'HMR': '0002029471',  # Heidmar Maritime Holdings Corp.
-    'CHPG': '0002024460',  # ChampionsGate Acquisition Corp
-    'FMFC': '0002024656',  # Kandal M Venture Ltd
-    'ETH': '0002020455',  # Grayscale Ethereum Mini Trust ETF
-    'CHAR': '0002024459',  # Charlton Aria Acquisition Corp
-    'MSGY': '0002020228',  # Masonglory Ltd
-    'OMSE': '0002012219',  # OMS Energy Technologies Inc.
-    'IPCX': '0002012318',  # Inflection Point Acquisition Corp. III
-    'GCL': '0002002045',  # GCL Global Holdings Ltd
-    'EMPG': '0002005569',  # Empro Group Inc.
-    'GOOG': '0001652044',  # Alphabet Inc.
-    'BMYMP': '0000014272',  # BRISTOL MYERS SQUIBB CO
-    'USB-PA': '0000036104',  # US BANCORP \DE\
-    'BRK-A': '0001067983',  # BERKSHIRE HATHAWAY INC
-    'TSMWF': '0001046179',  # TAIWAN SEMICONDUCTOR MANUFACTURING CO LTD
-    'NONOF': '0000353278',  # NOVO NORDISK A S
-    'JPM-PC': '0000019617',  # JPMORGAN CHASE & CO
-    'JPM-PD': '0000019617',  # JPMORGAN CHASE & CO
-    'BML-PH': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BML-PG': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'ASMLF': '0000937966',  # ASML HOLDING NV
-    'SAPGF': '0001000184',  # SAP SE
-    'BAC-PE': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BML-PJ': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BML-PL': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PB': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'TOYOF': '0001094517',  # TOYOTA MOTOR CORP/
-    'BAC-PK': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'PCCYF': '0001108329',  # PETROCHINA CO LTD
-    'AZNCF': '0000901832',  # ASTRAZENECA PLC
-    'NVSEF': '0001114448',  # NOVARTIS AG
-    'RYDAF': '0001306965',  # Shell plc
-    'WFC-PY': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'BABAF': '0001577552',  # Alibaba Group Holding Ltd
-    'WFC-PL': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'HBCYF': '0001089113',  # HSBC HOLDINGS PLC
-    'TBB': '0000732717',  # AT&T INC.
-    'MBFJF': '0000067088',  # MITSUBISHI UFJ FINANCIAL GROUP INC
-    'UL': '0000217410',  # UNILEVER PLC
-    'UNLYF': '0000217410',  # UNILEVER PLC
-    'BUDFF': '0001668717',  # Anheuser-Busch InBev SA/NV
-    'EADSF': '0001378580',  # Airbus SE/ADR
-    'TTFNF': '0000879764',  # TotalEnergies SE
-    'SNEJF': '0000313838',  # Sony Group Corp
-    'SNYNF': '0001121404',  # Sanofi
-    'BHPLF': '0000811809',  # BHP Group Ltd
-    'WFC-PC': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'CILJF': '0001268896',  # CHINA LIFE INSURANCE CO LTD
-    'BPAQF': '0000313807',  # BP PLC
-    'RTPPF': '0000863064',  # RIO TINTO PLC
-    'NCRRP': '0000070866',  # NCR Voyix Corp
-    'NTTYY': '0000769594',  # NIPPON TELEGRAPH & TELEPHONE CORP
-    'ABLZF': '0001091587',  # ABB LTD
-    'ABBNY': '0001091587',  # ABB LTD
-    'SMFNF': '0001022837',  # SUMITOMO MITSUI FINANCIAL GROUP, INC.
-    'AIQUF': '0001161167',  # L AIR LIQUIDE SA /FI
-    'CFRHF': '0000948401',  # COMPAGNIE FINANCIERE RICHEMONT AG /FI
-    'STOHF': '0001140625',  # EQUINOR ASA
-    'SNPMF': '0001123658',  # CHINA PETROLEUM & CHEMICAL CORP
-    'GS-PA': '0000886982',  # GOLDMAN SACHS GROUP INC
-    'MBGAF': '0001067318',  # DAIMLER AG
-    'MS-PA': '0000895421',  # MORGAN STANLEY
-    'GS-PD': '0000886982',  # GOLDMAN SACHS GROUP INC
-    'BTAFF': '0001303523',  # British American Tobacco p.l.c.
-    'USB-PH': '0000036104',  # US BANCORP \DE\
-    'EBBNF': '0000895728',  # ENBRIDGE INC
-    'TOELF': '0001443276',  # Tokyo Electron LTD
-    'BNPQF': '0000310732',  # BNP PARIBAS
-    'CTA-PB': '0000030554',  # EIDP, Inc.
-    'USB-PP': '0000036104',  # US BANCORP \DE\
-    'PPRUF': '0001445465',  # Kering
-    'BCDRF': '0000891478',  # Banco Santander, S.A.
-    'AMXOF': '0001129137',  # AMERICA MOVIL SAB DE CV/
-    'GLCNF': '0001524684',  # Glencore plc/ADR
-    'GLAXF': '0001131399',  # GSK plc
-    'BNPQY': '0000310732',  # BNP PARIBAS
-    'MS-PK': '0000895421',  # MORGAN STANLEY
-    'DGEAF': '0000835403',  # DIAGEO PLC
-    'MS-PI': '0000895421',  # MORGAN STANLEY
-    'PBR-A': '0001119639',  # PETROBRAS - PETROLEO BRASILEIRO SA
-    'MS-PF': '0000895421',  # MORGAN STANLEY
-    'MS-PE': '0000895421',  # MORGAN STANLEY
-    'FMCCT': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'RLXXF': '0000929869',  # RELX PLC
-    'DUK-PA': '0001326160',  # Duke Energy CORP
-    'NETTF': '0001110646',  # NetEase, Inc.
-    'EIPAF': '0001002242',  # ENI SPA
-    'JDCMF': '0001549802',  # JD.com, Inc.
-    'CCZ': '0001166691',  # COMCAST CORP
-    'BSQKZ': '0001512673',  # Block, Inc.
-    'WEBNF': '0000719245',  # WESTPAC BANKING CORP
-    'MZHOF': '0001335730',  # MIZUHO FINANCIAL GROUP INC
-    'SCHW-PD': '0000316709',  # SCHWAB CHARLES CORP
-    'PPWLM': '0000075594',  # PACIFICORP /OR/
-    'NGGTF': '0001004315',  # NATIONAL GRID PLC
-    'BYMOF': '0001446250',  # Bayerische Motoren Werke AG/ADR
-    'BAMXF': '0001446250',  # Bayerische Motoren Werke AG/ADR
-    'DKILF': '0001446519',  # Daikin Industries Ltd
-    'BECEF': '0000718940',  # BCE INC
-    'SPG-PJ': '0001063761',  # SIMON PROPERTY GROUP INC /DE/
-    'TNCAF': '0001232384',  # TC ENERGY CORP
-    'INGVF': '0001039765',  # ING GROEP NV
-    'MET-PA': '0001099219',  # METLIFE INC
-    'HNDAF': '0000715153',  # HONDA MOTOR CO LTD
-    'BAESF': '0000895564',  # BAE SYSTEMS PLC /FI/
-    'MET-PE': '0001099219',  # METLIFE INC
-    'TKPHF': '0001395064',  # TAKEDA PHARMACEUTICAL CO LTD
-    'TRPCF': '0001269238',  # Trip.com Group Ltd
-    'LLDTF': '0001160106',  # Lloyds Banking Group plc
-    'PLDGP': '0001045609',  # Prologis, Inc.
-    'WOPEF': '0000844551',  # WOODSIDE ENERGY GROUP LTD
-    'BBVXF': '0000842180',  # BANCO BILBAO VIZCAYA ARGENTARIA, S.A.
-    'HLNCF': '0001900304',  # Haleon plc
-    'DNZOF': '0001446598',  # Denso Corp
-    'TCANF': '0001232384',  # TC ENERGY CORP
-    'PSA-PH': '0001393311',  # Public Storage
-    'PPWLO': '0000075594',  # PACIFICORP /OR/
-    'SVNDF': '0001359519',  # SEVEN & I HOLDINGS CO LTD
-    'PUKPF': '0001116578',  # PRUDENTIAL PLC
-    'BAMGF': '0001001085',  # BROOKFIELD Corp /ON/
-    'MRAAF': '0001450468',  # Murata Manufacturing Co., Ltd./ADR
-    'TCKRF': '0000886986',  # TECK RESOURCES LTD
-    'CRARF': '0001279967',  # CREDIT AGRICOLE S A
-    'ALL-PH': '0000899051',  # ALLSTATE CORP
-    'PSA-PK': '0001393311',  # Public Storage
-    'RBSPF': '0000844150',  # NatWest Group plc
-    'ALL-PB': '0000899051',  # ALLSTATE CORP
-    'FNCTF': '0001038143',  # ORANGE
-    'FUJIF': '0000800365',  # FUJI PHOTO FILM CO LTD /FI
-    'LEN-B': '0000920760',  # LENNAR CORP /NEW/
-    'CAJPY': '0000016988',  # CANON INC
-    'CIXPF': '0001535628',  # CaixaBank/ADR
-    'FCNCB': '0000798941',  # FIRST CITIZENS BANCSHARES INC /DE/
-    'BCLYF': '0000312069',  # BARCLAYS PLC
-    'RSMDF': '0000943819',  # RESMED INC
-    'ERIXF': '0000717826',  # ERICSSON LM TELEPHONE CO
-    'HEI-A': '0000046619',  # HEICO CORP
-    'LAAOF': '0001791706',  # Li Auto Inc.
-    'ORXCF': '0001070304',  # ORIX CORP
-    'TEFOF': '0000814052',  # TELEFONICA S A
-    'BBDO': '0001160330',  # BANK BRADESCO
-    'GNMSF': '0001434265',  # GENMAB A/S
-    'BAIDF': '0001329099',  # Baidu, Inc.
-    'ANNSF': '0001700171',  # Aena S.A./ADR
-    'DLR-PK': '0001297996',  # DIGITAL REALTY TRUST, INC.
-    'RCIAF': '0000733099',  # ROGERS COMMUNICATIONS INC
-    'NOKBF': '0000924613',  # NOKIA CORP
-    'HDELY': '0001400691',  # HeidelbergCement AG
-    'CJPRF': '0001334687',  # CENTRAL JAPAN RAILWAY CO
-    'AMSYF': '0001243429',  # ArcelorMittal
-    'STMEF': '0000932787',  # STMicroelectronics N.V.
-    'DLR-PJ': '0001297996',  # DIGITAL REALTY TRUST, INC.
-    'RYAOF': '0001038683',  # RYANAIR HOLDINGS PLC
-    'MKC-V': '0000063754',  # MCCORMICK & CO INC
-    'TNRSF': '0001190723',  # TENARIS SA
-    'RSTRF': '0001618755',  # Restaurant Brands International Limited Partnership
-    'FWONK': '0001560385',  # Liberty Media Corp
-    'FWONA': '0001560385',  # Liberty Media Corp
-    'CAJFF': '0000016988',  # CANON INC
-    'SOJC': '0000092122',  # SOUTHERN CO
-    'YAHOF': '0001446437',  # Yahoo! Japan Corp
-    'VODPF': '0000839923',  # VODAFONE GROUP PUBLIC LTD CO
-    'FOX': '0001754301',  # Fox Corp
-    'COCSF': '0000910631',  # COCA COLA FEMSA SAB DE CV
-    'STT-PG': '0000093751',  # STATE STREET CORP
-    'PGPEF': '0001050952',  # PUBLICIS GROUPE SA
-    'WLMIF': '0001449566',  # Wilmar International Ltd
-    'EJPRF': '0001093028',  # EAST JAPAN RAILWAY CO /FI
-    'FWONB': '0001560385',  # Liberty Media Corp
-    'HIG-PG': '0000874766',  # HARTFORD FINANCIAL SERVICES GROUP, INC.
-    'FITBI': '0000035527',  # FIFTH THIRD BANCORP
-    'DUKH': '0001326160',  # Duke Energy CORP
-    'POAHF': '0001450346',  # Porsche Automobil Holding SE / ADR
-    'RKLIF': '0000930157',  # RENTOKIL INITIAL PLC /FI
-    'HRNNF': '0001712356',  # Hydro One Ltd
-    'OMVJF': '0000882602',  # OMV AKTIENGESELLSCHAFT /FI
-    'NRSCF': '0001163653',  # NOMURA HOLDINGS INC
-    'SGSOF': '0001069347',  # SGS SOCIETE GENERALE DE SURVEILLANCE HOLDING SA /FI
-    'Z': '0001617640',  # ZILLOW GROUP, INC.
-    'JHIUF': '0001159152',  # James Hardie Industries plc
-    'PPERF': '0001461748',  # PT Bank Mandiri (Persero) Tbk / ADR
-    'SPXSF': '0001518542',  # Spirax-Sarco Engineering PLC/ADR
-    'RYLPF': '0000313216',  # KONINKLIJKE PHILIPS NV
-    'AMCCF': '0001748790',  # Amcor plc
-    'FAXXF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'NWS': '0001564708',  # NEWS CORP
-    'BF-B': '0000014693',  # BROWN FORMAN CORP
-    'BIO-B': '0000012208',  # BIO-RAD LABORATORIES, INC.
-    'CHEAF': '0001030475',  # CHINA EASTERN AIRLINES CORP LTD
-    'FNMAS': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'CHKIF': '0001041668',  # CHINA SOUTHERN AIRLINES CO LTD
-    'ADTTF': '0001158838',  # ADVANTEST CORP
-    'HLBZF': '0001400691',  # HeidelbergCement AG
-    'KEY-PK': '0000091576',  # KEYCORP /NEW/
-    'KKPNF': '0001001474',  # KONINKLIJKE KPN N V
-    'TEVJF': '0000818686',  # TEVA PHARMACEUTICAL INDUSTRIES LTD
-    'SSMXF': '0001517231',  # Sysmex Corporation/ADR
-    'CRERF': '0001078642',  # CARREFOUR SA
-    'FRFGF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'FNMAJ': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'KEY-PJ': '0000091576',  # KEYCORP /NEW/
-    'FNMAH': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'NLY-PG': '0001043219',  # ANNALY CAPITAL MANAGEMENT INC
-    'JBARF': '0001475011',  # Julius Baer Group Ltd.
-    'SGIOF': '0001281721',  # SHIONOGI & CO LTD
-    'NHOLF': '0001669414',  # Sompo Japan Nipponkoa Holdings, Inc./ADR
-    'FRFFF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'PTPIF': '0001547873',  # PT Chandra Asri Petrochemical Tbk/ADR
-    'NLY-PF': '0001043219',  # ANNALY CAPITAL MANAGEMENT INC
-    'HKHGF': '0000871464',  # HONGKONG LAND HOLDINGS LTD /FI
-    'NVZMF': '0001131345',  # NOVOZYMES AS/FI
-    'APO-PA': '0001858681',  # Apollo Global Management, Inc.
-    'KEY-PI': '0000091576',  # KEYCORP /NEW/
-    'FNGD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'GFIOF': '0001172724',  # GOLD FIELDS LTD
-    'FRFXF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'NCSYF': '0001003935',  # NICE Ltd.
-    'SVYSF': '0000930826',  # SOLVAY S A /ADR/
-    'EBR-B': '0001439124',  # BRAZILIAN ELECTRIC POWER CO
-    'ACGLO': '0000947484',  # ARCH CAPITAL GROUP LTD.
-    'WSO-B': '0000105016',  # WATSCO INC
-    'FMCQF': '0001333141',  # Fresenius Medical Care AG
-    'MAA-PI': '0000912595',  # MID AMERICA APARTMENT COMMUNITIES INC.
-    'LBRDB': '0001611983',  # Liberty Broadband Corp
-    'RF-PC': '0001281761',  # REGIONS FINANCIAL CORP
-    'SNNUF': '0000845982',  # SMITH & NEPHEW PLC
-    'SHECF': '0001442651',  # Shin-Etsu Chemical Co., Ltd.
-    'HUNGF': '0000929058',  # HUANENG POWER INTERNATIONAL INC
-    'LBRDK': '0001611983',  # Liberty Broadband Corp
-    'BZLFF': '0001072397',  # BUNZL PLC
-    'ALMMF': '0001161611',  # ALUMINUM CORP OF CHINA LTD
-    'ERRAF': '0001127248',  # EMERA INC
-    'XPNGF': '0001810997',  # XPENG INC.
-    'OLCLF': '0001545460',  # Oriental Land Co., Ltd./ADR
-    'UHAL-B': '0000004457',  # U-Haul Holding Co /NV/
-    'TAP-A': '0000024545',  # MOLSON COORS BEVERAGE CO
-    'PBNNF': '0001504122',  # PT Bank Negara Indonesia (Persero) Tbk/ADR
-    'WPPGF': '0000806968',  # WPP plc
-    'NNGPF': '0001690981',  # NN Group NV/ADR
-    'AOMFF': '0001062066',  # ALSTOM
-    'KIKOF': '0001446656',  # Kikkoman Corp
-    'AEGOF': '0000769218',  # AEGON LTD.
-    'CUKPF': '0001125259',  # CARNIVAL PLC
-    'FREJO': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'YAMHF': '0001447100',  # Yamaha Motor Co., Ltd.
-    'NDEKF': '0000353991',  # NITTO DENKO CORP / ADR/
-    'RDEIF': '0001438654',  # Red Electrica Corporacion SA/ADR
-    'JGSHF': '0001567172',  # JG Summit Holdings, Inc./ADR
-    'LBTYB': '0001570585',  # Liberty Global Ltd.
-    'GS-PC': '0000886982',  # GOLDMAN SACHS GROUP INC
-    'GPAEF': '0001347557',  # Pacific Airport Group
-    'UEPCN': '0000100826',  # UNION ELECTRIC CO
-    'CXMSF': '0001076378',  # CEMEX SAB DE CV
-    'OUKPF': '0001436786',  # Outotec OYJ
-    'NIOIF': '0001736541',  # NIO Inc.
-    'PSORF': '0000938323',  # PEARSON PLC
-    'AGNCM': '0001423689',  # AGNC Investment Corp.
-    'AGNCN': '0001423689',  # AGNC Investment Corp.
-    'RZB': '0000898174',  # REINSURANCE GROUP OF AMERICA INC
-    'UEPEO': '0000100826',  # UNION ELECTRIC CO
-    'UEPEP': '0000100826',  # UNION ELECTRIC CO
-    'FRT-PC': '0000034903',  # FEDERAL REALTY INVESTMENT TRUST
-    'PSNYW': '0001884082',  # Polestar Automotive Holding UK PLC
-    'SASOF': '0000314590',  # SASOL LTD
-    'VNORP': '0000899689',  # VORNADO REALTY TRUST
-    'ROHCF': '0001442653',  # ROHM Co., Ltd.
-    'AMH-PH': '0001562401',  # American Homes 4 Rent
-    'OSCUF': '0001600520',  # Japan Exchange Group, Inc./ADR
-    'AMH-PG': '0001562401',  # American Homes 4 Rent
-    'VNO-PL': '0000899689',  # VORNADO REALTY TRUST
-    'ASRMF': '0001123452',  # SOUTHEAST AIRPORT GROUP
-    'UEPCP': '0000100826',  # UNION ELECTRIC CO
-    'VNO-PM': '0000899689',  # VORNADO REALTY TRUST
-    'FMCCI': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'ATH-PA': '0001527469',  # Athene Holding Ltd.
-    'PARAA': '0000813828',  # Paramount Global
-    'RKUNF': '0001294591',  # Rakuten Group, Inc.
-    'FMCKI': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'UEPEM': '0000100826',  # UNION ELECTRIC CO
-    'UEPEN': '0000100826',  # UNION ELECTRIC CO
-    'GIFLF': '0001438569',  # Grifols SA
-    'PADEF': '0001489079',  # Adaro Energy PT/ADR/
-    'GIFOF': '0001438569',  # Grifols SA
-    'RNR-PF': '0000913144',  # RENAISSANCERE HOLDINGS LTD
-    'VOYA-PB': '0001535929',  # Voya Financial, Inc.
-    'BLBLF': '0001723690',  # Bilibili Inc.
-    'KIM-PM': '0000879101',  # KIMCO REALTY CORP
-    'JCYCF': '0001289688',  # Jardine Cycle & Carriage Ltd.
-    'DSECF': '0001481045',  # Daiwa Securities Group Inc.
-    'CMSA': '0000811156',  # CMS ENERGY CORP
-    'MEJHF': '0001558812',  # MEIJI Holdings Co Ltd/ADR
-    'KIM-PL': '0000879101',  # KIMCO REALTY CORP
-    'SLG-PI': '0001040971',  # SL GREEN REALTY CORP
-    'FANUF': '0001446596',  # Fanuc Ltd
-    'BCUCF': '0001581285',  # Brunello Cucinelli S.p.A./ADR
-    'KAKKF': '0001447126',  # Kawasaki Kisen Kaisha Ltd
-    'PCG-PA': '0001004980',  # PG&E Corp
-    'FUPEF': '0001534043',  # Fuchs Petrolub SE/ADR
-    'GIKLY': '0001438569',  # Grifols SA
-    'QBCRF': '0001156831',  # QUEBECOR MEDIA INC
-    'QBCAF': '0001156831',  # QUEBECOR MEDIA INC
-    'CIG-C': '0001157557',  # ENERGY CO OF MINAS GERAIS
-    'PCG-PB': '0001004980',  # PG&E Corp
-    'VIST': '0001762506',  # Vista Energy, S.A.B. de C.V.
-    'OAK-PB': '0001403528',  # Brookfield Oaktree Holdings, LLC
-    'UNMA': '0000005513',  # Unum Group
-    'BKGFF': '0001447137',  # Berkeley Group Holdings plc
-    'BPOPO': '0000763901',  # POPULAR, INC.
-    'SNV-PD': '0000018349',  # SYNOVUS FINANCIAL CORP
-    'JSM': '0001593538',  # NAVIENT CORP
-    'PCG-PE': '0001004980',  # PG&E Corp
-    'HGMCF': '0001023514',  # HARMONY GOLD MINING CO LTD
-    'CWEN-A': '0001567683',  # Clearway Energy, Inc.
-    'PHTCF': '0000078150',  # PLDT Inc.
-    'THNPY': '0001792045',  # Technip Energies N.V.
-    'ATGFF': '0001695519',  # AltaGas Ltd.
-    'PPENF': '0001469395',  # Pampa Energy Inc.
-    'TCMFF': '0000932470',  # TELECOM ARGENTINA SA
-    'BHFAL': '0001685040',  # Brighthouse Financial, Inc.
-    'GAB-PG': '0000794685',  # GABELLI EQUITY TRUST INC
-    'PCG-PD': '0001004980',  # PG&E Corp
-    'EPR-PG': '0001045450',  # EPR PROPERTIES
-    'PCG-PC': '0001004980',  # PG&E Corp
-    'FNMFN': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'AFRAF': '0001110452',  # AIR FRANCE-KLM /FI
-    'PCG-PH': '0001004980',  # PG&E Corp
-    'BZZUF': '0001437774',  # BUZZI UNICEM S.p.A.
-    'TKAYF': '0001792627',  # Just Eat Takeaway.com N.V.
-    'FURCF': '0001559444',  # FORVIA SE/ADR
-    'LBTYK': '0001570585',  # Liberty Global Ltd.
-    'PCG-PG': '0001004980',  # PG&E Corp
-    'GAERF': '0001378239',  # Central North Airport Group
-    'RUSHB': '0001012019',  # RUSH ENTERPRISES INC TX
-    'AXS-PE': '0001214816',  # AXIS CAPITAL HOLDINGS LTD
-    'DTW': '0000936340',  # DTE ENERGY CO
-    'SR-PA': '0001126956',  # SPIRE INC
-    'DFRYF': '0001546354',  # Dufry AG/ADR
-    'PCG-PI': '0001004980',  # PG&E Corp
-    'JBT': '0001433660',  # JBT Marel Corp
-    'DISPF': '0001671750',  # Disco Corporation/ADR
-    'SLMBP': '0001032033',  # SLM Corp
-    'REXR-PB': '0001571283',  # Rexford Industrial Realty, Inc.
-    'THNPF': '0001792045',  # Technip Energies N.V.
-    'SF-PB': '0000720672',  # STIFEL FINANCIAL CORP
-    'TWO-PC': '0001465740',  # TWO HARBORS INVESTMENT CORP.
-    'BHFAP': '0001685040',  # Brighthouse Financial, Inc.
-    'JTKWY': '0001792627',  # Just Eat Takeaway.com N.V.
-    'WTFCM': '0001015328',  # WINTRUST FINANCIAL CORP
-    'PBI-PB': '0000078814',  # PITNEY BOWES INC /DE/
-    'CIM-PD': '0001409493',  # CHIMERA INVESTMENT CORP
-    'CIM-PB': '0001409493',  # CHIMERA INVESTMENT CORP
-    'UA': '0001336917',  # Under Armour, Inc.
-    'CIM-PC': '0001409493',  # CHIMERA INVESTMENT CORP
-    'LIFX': '0001581760',  # Life360, Inc.
-    'MOG-B': '0000067887',  # MOOG INC.
-    'ESGRP': '0001363829',  # Enstar Group LTD
-    'TWO-PB': '0001465740',  # TWO HARBORS INVESTMENT CORP.
-    'MYTHF': '0001437470',  # Mytilineos Holdings S.A.
-    'TWO-PA': '0001465740',  # TWO HARBORS INVESTMENT CORP.
-    'CIXXF': '0001829948',  # CI Financial Corp.
-    'VLYPP': '0000714310',  # VALLEY NATIONAL BANCORP
-    'SPTJF': '0000908732',  # SINOPEC SHANGHAI PETROCHEMICAL CO LTD
-    'WRB-PE': '0000011544',  # BERKLEY W R CORP
-    'WBS-PF': '0000801337',  # WEBSTER FINANCIAL CORP
-    'ESGRO': '0001363829',  # Enstar Group LTD
-    'GEF-B': '0000043920',  # GREIF, INC
-    'VLYPO': '0000714310',  # VALLEY NATIONAL BANCORP
-    'RLJ-PA': '0001511337',  # RLJ Lodging Trust
-    'PEB-PF': '0001474098',  # Pebblebrook Hotel Trust
-    'PEB-PE': '0001474098',  # Pebblebrook Hotel Trust
-    'ASB-PE': '0000007789',  # ASSOCIATED BANC-CORP
-    'CIM-PA': '0001409493',  # CHIMERA INVESTMENT CORP
-    'ROYMF': '0001592438',  # Royal Mail plc/ADR
-    'PEGRF': '0001455633',  # Pennon Group Plc / ADR
-    'MFA-PB': '0001055160',  # MFA FINANCIAL, INC.
-    'AKO-B': '0000925261',  # ANDINA BOTTLING CO INC
-    'TY-P': '0000099614',  # TRI-CONTINENTAL Corp
-    'GNGYF': '0001012139',  # GUANGSHEN RAILWAY CO LTD
-    'HOVNP': '0000357294',  # HOVNANIAN ENTERPRISES INC
-    'HMDCF': '0001648257',  # HUTCHMED (China) Ltd
-    'FMCCG': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'SBYSF': '0001786909',  # Sibanye Stillwater Ltd
-    'FNMAM': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'SOCGP': '0000092108',  # SOUTHERN CALIFORNIA GAS CO
-    'AILLI': '0000018654',  # Ameren Illinois Co
-    'NSA-PA': '0001618563',  # National Storage Affiliates Trust
-    'BATRB': '0001958140',  # Atlanta Braves Holdings, Inc.
-    'WELPP': '0000107815',  # WISCONSIN ELECTRIC POWER CO
-    'TRTN-PA': '0001660734',  # Triton International Ltd
-    'AILLM': '0000018654',  # Ameren Illinois Co
-    'AILLN': '0000018654',  # Ameren Illinois Co
-    'BATRK': '0001958140',  # Atlanta Braves Holdings, Inc.
-    'FNMAN': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'TROLB': '0000098677',  # TOOTSIE ROLL INDUSTRIES INC
-    'SRG-PA': '0001628063',  # Seritage Growth Properties
-    'AILIM': '0000018654',  # Ameren Illinois Co
-    'FMCCJ': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FNMAI': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'NHNKF': '0001543726',  # Nihon Kohden Corporation/ADR
-    'CODQL': '0001770561',  # Coronado Global Resources Inc.
-    'AILLO': '0000018654',  # Ameren Illinois Co
-    'LXP-PC': '0000910108',  # LXP Industrial Trust
-    'TKCM': '0001683252',  # TOKEN COMMUNITIES LTD.
-    'CENTA': '0000887733',  # CENTRAL GARDEN & PET CO
-    'FNMAT': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'AILIN': '0000018654',  # Ameren Illinois Co
-    'FNMAK': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'FNMAL': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'IVR-PC': '0001437071',  # Invesco Mortgage Capital Inc.
-    'FNMFM': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'AILLP': '0000018654',  # Ameren Illinois Co
-    'AGM-A': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'GLPGF': '0001421876',  # GALAPAGOS NV
-    'WLYB': '0000107140',  # JOHN WILEY & SONS, INC.
-    'FNMAO': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'FNMAG': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'FNMFO': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'LGF-B': '0000929351',  # LIONS GATE ENTERTAINMENT CORP /CN/
-    'ALTB': '0001642365',  # Alpine Auto Brokers Inc.
-    'NGL-PB': '0001504461',  # NGL Energy Partners LP
-    'GDV-PH': '0001260729',  # GABELLI DIVIDEND & INCOME TRUST
-    'FISK': '0001553079',  # Empire State Realty OP, L.P.
-    'GRPFF': '0000912892',  # GRUPO TELEVISA, S.A.B.
-    'EVOTF': '0001412558',  # Evotec SE
-    'NGL-PC': '0001504461',  # NGL Energy Partners LP
-    'BFS-PD': '0000907254',  # SAUL CENTERS, INC.
-    'FMCCL': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'OGCP': '0001553079',  # Empire State Realty OP, L.P.
-    'FMCKL': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'PMT-PA': '0001464423',  # PennyMac Mortgage Investment Trust
-    'GNL-PA': '0001526113',  # Global Net Lease, Inc.
-    'PMT-PB': '0001464423',  # PennyMac Mortgage Investment Trust
-    'STSFF': '0001585389',  # SmartStop Self Storage REIT, Inc.
-    'GAB-PH': '0000794685',  # GABELLI EQUITY TRUST INC
-    'HCXY': '0001280784',  # Hercules Capital, Inc.
-    'LILAB': '0001712184',  # Liberty Latin America Ltd.
-    'FMCCS': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'LILAK': '0001712184',  # Liberty Latin America Ltd.
-    'MHLA': '0001412100',  # Maiden Holdings, Ltd.
-    'ASAI': '0001834048',  # Sendas Distributor S.A.
-    'FMCCO': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'AHL-PD': '0001267395',  # ASPEN INSURANCE HOLDINGS LTD
-    'CODI-PA': '0001345126',  # Compass Diversified Holdings
-    'NYMTN': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'GEAR': '0001943705',  # Revelyst, Inc.
-    'CODI-PB': '0001345126',  # Compass Diversified Holdings
-    'FMCKN': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FREJN': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FMCCN': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FMCKO': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'GLOP-PB': '0001598655',  # GasLog Partners LP
-    'FMCKJ': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FMCKM': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'GLOP-PC': '0001598655',  # GasLog Partners LP
-    'FREGP': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'GLOP-PA': '0001598655',  # GasLog Partners LP
-    'FMCCH': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FMCCK': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'HL-PB': '0000719413',  # HECLA MINING CO/DE/
-    'FMCCP': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FMCCM': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'INN-PE': '0001497645',  # Summit Hotel Properties, Inc.
-    'AHH-PA': '0001569187',  # Armada Hoffler Properties, Inc.
-    'FMCKP': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'BELFB': '0000729580',  # BEL FUSE INC /NJ
-    'PLLTL': '0001728205',  # Piedmont Lithium Inc.
-    'GRAF-UN': '0001897463',  # Graf Global Corp.
-    'KBSR': '0001482430',  # KBS Real Estate Investment Trust III, Inc.
-    'PSTX': '0001661460',  # Poseida Therapeutics, Inc.
-    'IIPR-PA': '0001677576',  # INNOVATIVE INDUSTRIAL PROPERTIES INC
-    'IRET': '0000798359',  # CENTERSPACE
-    'GAM-PB': '0000040417',  # GENERAL AMERICAN INVESTORS CO INC
-    'DEFTF': '0001888274',  # Defi Technologies, Inc.
-    'HOVVB': '0000357294',  # HOVNANIAN ENTERPRISES INC
-    'GTN-A': '0000043196',  # GRAY TELEVISION INC
-    'SMBMF': '0001448978',  # SembCorp Marine Ltd.
-    'MEOBF': '0001345099',  # MESOBLAST LTD
-    'DRDGF': '0001023512',  # DRDGOLD LTD
-    'BH': '0001726173',  # Biglari Holdings Inc.
-    'KELYB': '0000055135',  # KELLY SERVICES INC
-    'CMRE-PB': '0001503584',  # Costamare Inc.
-    'AGM-PD': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'CMRE-PC': '0001503584',  # Costamare Inc.
-    'CMRE-PD': '0001503584',  # Costamare Inc.
-    'CELJF': '0001385145',  # Cellcom Israel Ltd.
-    'EXTO': '0001957146',  # Almacenes Exito S.A.
-    'HLTC': '0001561032',  # National Healthcare Properties, Inc.
-    'HVT-A': '0000216085',  # HAVERTY FURNITURE COMPANIES INC
-    'GGT-PE': '0000921671',  # GABELLI MULTIMEDIA TRUST INC.
-    'GAMI': '0001060349',  # GAMCO INVESTORS, INC. ET AL
-    'ATROB': '0000008063',  # ASTRONICS CORP
-    'GGN-PB': '0001313510',  # GAMCO Global Gold, Natural Resources & Income Trust
-    'ARTNB': '0000863110',  # ARTESIAN RESOURCES CORP
-    'DGICB': '0000800457',  # DONEGAL GROUP INC
-    'BRSYF': '0001505065',  # Brainsway Ltd.
-    'UMH-PD': '0000752642',  # UMH PROPERTIES, INC.
-    'MITT-PA': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'CUBI-PE': '0001488813',  # Customers Bancorp, Inc.
-    'ECCX': '0001604174',  # Eagle Point Credit Co Inc.
-    'CUBI-PF': '0001488813',  # Customers Bancorp, Inc.
-    'MITT-PB': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'NEWTI': '0001587987',  # NewtekOne, Inc.
-    'OXLCO': '0001495222',  # Oxford Lane Capital Corp.
-    'AIRTP': '0000353184',  # AIR T INC
-    'CRD-B': '0000025475',  # CRAWFORD & CO
-    'PTCHF': '0001782999',  # PureTech Health plc
-    'NCV-PA': '0001214935',  # Virtus Convertible & Income Fund
-    'GMRE-PA': '0001533615',  # Global Medical REIT Inc.
-    'WBHC': '0000885275',  # WILSON BANK HOLDING CO
-    'LANDM': '0001495240',  # GLADSTONE LAND Corp
-    'SENEB': '0000088948',  # Seneca Foods Corp
-    'SPLP-PA': '0001452857',  # STEEL PARTNERS HOLDINGS L.P.
-    'ERLFF': '0001271554',  # Entree Resources Ltd.
-    'CIO-PA': '0001593222',  # City Office REIT, Inc.
-    'THPTF': '0001556898',  # Techpoint, Inc.
-    'GAINL': '0001321741',  # GLADSTONE INVESTMENT CORPORATION\DE
-    'AVHHL': '0001762303',  # AVITA Medical, Inc.
-    'GUT-PC': '0001080720',  # GABELLI UTILITY TRUST
-    'VSOGF': '0001762506',  # Vista Energy, S.A.B. de C.V.
-    'HEAR': '0001493761',  # Turtle Beach Corp
-    'CKDXF': '0001815620',  # Opthea Ltd
-    'CNTHP': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'IHRTB': '0001400891',  # iHeartMedia, Inc.
-    'CNLPL': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'NCZ-PA': '0001227857',  # Virtus Convertible & Income Fund II
-    'DFPH': '0001799191',  # Oncology Institute, Inc.
-    'DSX-PB': '0001318885',  # DIANA SHIPPING INC.
-    'CNTHO': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'CHMI-PB': '0001571776',  # Cherry Hill Mortgage Investment Corp
-    'HAWLN': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'BHR-PD': '0001574085',  # Braemar Hotels & Resorts Inc.
-    'CNTHN': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'SLNCF': '0001479615',  # Silence Therapeutics plc
-    'HAWEN': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'BHR-PB': '0001574085',  # Braemar Hotels & Resorts Inc.
-    'NVNXF': '0001859795',  # NOVONIX Ltd
-    'CNLHO': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'APLMW': '0001944885',  # Apollomics Inc.
-    'CNLHP': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'ARCXF': '0001243429',  # ArcelorMittal
-    'CNLTP': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'AHT-PF': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'MIESF': '0001567924',  # Mitsui E&S Holdings Co., Ltd./ADR
-    'GSCCF': '0001896084',  # ioneer Ltd
-    'CNLTL': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'IPHYF': '0001598599',  # Innate Pharma SA
-    'CNPWM': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'PRTHU': '0001653558',  # Priority Technology Holdings, Inc.
-    'CHMI-PA': '0001571776',  # Cherry Hill Mortgage Investment Corp
-    'AHT-PI': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'CNPWP': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'AHT-PH': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'LANDP': '0001495240',  # GLADSTONE LAND Corp
-    'CNLPM': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'RVRF': '0001641601',  # River Financial Corp
-    'AHT-PG': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'CNLTN': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'AHT-PD': '0001232582',  # ASHFORD HOSPITALITY TRUST INC
-    'MVXM': '0001685766',  # MOVEIX INC.
-    'ENO': '0000071508',  # ENTERGY NEW ORLEANS, LLC
-    'FGPRB': '0000922358',  # FERRELLGAS PARTNERS L P
-    'CNLHN': '0000023426',  # CONNECTICUT LIGHT & POWER CO
-    'IVEVF': '0001756594',  # Inventiva S.A.
-    'PIIVX': '0001557265',  # Private Shares Fund
-    'SB-PC': '0001434754',  # SAFE BULKERS, INC.
-    'SB-PD': '0001434754',  # SAFE BULKERS, INC.
-    'EBRCZ': '0001347123',  # EBR Systems, Inc.
-    'SRNE': '0000850261',  # Sorrento Therapeutics, Inc.
-    'QRTEB': '0001355096',  # Qurate Retail, Inc.
-    'DLNG-PA': '0001578453',  # Dynagas LNG Partners LP
-    'AONC': '0001839998',  # American Oncology Network, Inc.
-    'MOYFF': '0001850453',  # Mynaric AG
-    'CDR-PC': '0000761648',  # CEDAR REALTY TRUST, INC.
-    'LTRPB': '0001606745',  # Liberty TripAdvisor Holdings, Inc.
-    'CDR-PB': '0000761648',  # CEDAR REALTY TRUST, INC.
-    'BBXIB': '0001814974',  # BBX Capital, Inc.
-    'LKCRU': '0001156174',  # LAKE AREA CORN PROCESSORS LLC
-    'VOLT': '0000103872',  # VOLT INFORMATION SCIENCES, INC.
-    'WONDF': '0001882839',  # WonderFi Technologies Inc.
-    'TDACU': '0001926599',  # Translational Development Acquisition Corp.
-    'RTNXF': '0001811115',  # Renalytix plc
-    'PFIE': '0001289636',  # PROFIRE ENERGY INC
-    'ECF-PA': '0000793040',  # ELLSWORTH GROWTH & INCOME FUND LTD
-    'RDIB': '0000716634',  # READING INTERNATIONAL INC
-    'FATBB': '0001705012',  # Fat Brands, Inc
-    'SOHOO': '0001301236',  # Sotherly Hotels Inc.
-    'NSRCF': '0001302084',  # NextSource Materials Inc.
-    'BCV-PA': '0000009521',  # BANCROFT FUND LTD
-    'LGYV': '0001616788',  # LEGACY VENTURES INTERNATIONAL INC.
-    'RGBPP': '0001589150',  # Regen BioPharma Inc
-    'GLU-PB': '0001282957',  # GABELLI GLOBAL UTILITY & INCOME TRUST
-    'CITE': '0001848437',  # Cartica Acquisition Corp
-    'GNTLF': '0001166272',  # GENETIC TECHNOLOGIES LTD
-    'RLFTF': '0001854078',  # Relief Therapeutics Holding SA
-    'ZHYBF': '0001672886',  # Zhong Yuan Bio-Technology Holdings Ltd
-    'OFSTF': '0001875931',  # Carbon Streaming Corp
-    'GSL-PB': '0001430725',  # Global Ship Lease, Inc.
-    'BCTF': '0001668340',  # Bancorp 34, Inc.
-    'DLNG-PB': '0001578453',  # Dynagas LNG Partners LP
-    'MPVDF': '0001004530',  # Mountain Province Diamonds Inc.
-    'ILLMF': '0001861233',  # illumin Holdings Inc.
-    'STCN': '0000914712',  # Steel Connect, Inc.
-    'SOHON': '0001301236',  # Sotherly Hotels Inc.
-    'SOHOB': '0001301236',  # Sotherly Hotels Inc.
-    'MDNAF': '0001807983',  # Medicenna Therapeutics Corp.
-    'BKSC': '0001007273',  # BANK OF SOUTH CAROLINA CORP
-    'BHAC': '0001851612',  # Focus Impact BH3 Acquisition Co
-    'TCBC': '0001850398',  # TC Bancshares, Inc.
-    'ZIVO': '0001101026',  # Zivo Bioscience, Inc.
-    'CULL': '0001845799',  # Cullman Bancorp, Inc. /MD/
-    'KLDI': '0001752474',  # KLDiscovery Inc.
-    'GWIN': '0001515114',  # GLORYWIN ENTERTAINMENT GROUP, INC.
-    'OFED': '0001501078',  # Oconee Federal Financial Corp.
-    'UBOH': '0001087456',  # UNITED BANCSHARES INC/OH
-    'MTMV': '0001393044',  # Motomova Inc
-    'FFBW': '0001787384',  # FFBW, Inc. /MD/
-    'RLFTY': '0001854078',  # Relief Therapeutics Holding SA
-    'GFASY': '0001389207',  # Gafisa S.A.
-    'UONEK': '0001041657',  # URBAN ONE, INC.
-    'HAFG': '0001367993',  # Holistic Asset Finance Group Co., Ltd.
-    'CIZN': '0001075706',  # CITIZENS HOLDING CO /MS/
-    'CPTN': '0001498233',  # Cepton, Inc.
-    'LCHD': '0001715433',  # Leader Capital Holdings Corp.
-    'MPAD': '0000065759',  # MICROPAC INDUSTRIES INC
-    'YELLQ': '0000716006',  # Yellow Corp
-    'SMTSF': '0001705259',  # Sierra Metals Inc.
-    'AZREF': '0001633438',  # Azure Power Global Ltd
-    'NZEOF': '0001445654',  # New Zealand Oil & Gas Ltd/ADR
-    'ALRN': '0001420565',  # Rein Therapeutics, Inc.
-    'CHTH': '0001496454',  # CNL Healthcare Properties, Inc.
-    'AATC': '0000943034',  # AUTOSCOPE TECHNOLOGIES CORP
-    'MSVB': '0001734875',  # Mid-Southern Bancorp, Inc.
-    'AVLNF': '0001362898',  # Avalon Advanced Materials Inc.
-    'IDWM': '0001463833',  # IDW MEDIA HOLDINGS, INC.
-    'WSKEF': '0001738699',  # Wisekey International Holding S.A.
-    'FBIOP': '0001429260',  # Fortress Biotech, Inc.
-    'YQAI': '0001976923',  # YOUNEEQAI TECHNICAL SERVICES, INC.
-    'GBNY': '0001823365',  # Generations Bancorp NY, Inc.
-    'BIOE': '0001723059',  # Bio Essence Corp
-    'ARBKF': '0001841675',  # Argo Blockchain Plc
-    'DSHK': '0001175483',  # Drive Shack Inc.
-    'ACMB': '0001598323',  # AGRO CAPITAL MANAGEMENT CORP.
-    'GWLL': '0001800373',  # GOLDENWELL BIOTECH, INC.
-    'ENDI': '0001908984',  # ENDI Corp.
-    'TETAA': '0001444874',  # Teton Advisors, Inc.
-    'OSBK': '0001076691',  # OCONEE FINANCIAL CORP
-    'HSTI': '0001365388',  # High Sierra Technologies, Inc.
-    'XTXXF': '0001891512',  # Adastra Holdings Ltd.
-    'RSCI': '0001634394',  # Redwood Scientific Technologies, Inc.
-    'WVVIP': '0000838875',  # WILLAMETTE VALLEY VINEYARDS INC
-    'INFT': '0001962911',  # Infinity Bancorp
-    'FIGI': '0001791325',  # Freedom Internet Group Inc.
-    'PGID': '0001061164',  # PEREGRINE INDUSTRIES INC
-    'BQST': '0001568628',  # Bioquest Corp
-    'SKYI': '0001555017',  # Sky Century Investment, Inc.
-    'TBBA': '0001751700',  # TEB Bancorp, Inc.
-    'AFGC': '0001042046',  # AMERICAN FINANCIAL GROUP INC
-    'RGF': '0001871149',  # Real Good Food Company, Inc.
-    'WVFC': '0000910679',  # WVS FINANCIAL CORP
-    'SALM': '0001050606',  # SALEM MEDIA GROUP, INC. /DE/
-    'IMUC': '0000822411',  # EOM Pharmaceutical Holdings, Inc.
-    'PWCO': '0000733337',  # PwrCor, Inc.
-    'WHLM': '0001013706',  # Wilhelmina International, Inc.
-    'PALT': '0001355839',  # INTELLIGENT PROTECTION MANAGEMENT CORP.
-    'TETAB': '0001444874',  # Teton Advisors, Inc.
-    'ARRKF': '0001855743',  # ARRAS MINERALS CORP.
-    'SGTM': '0001895251',  # Sustainable Green Team, Ltd.
-    'GLACU': '0001897971',  # Global Lights Acquisition Corp
-    'MMV': '0001874074',  # MultiMetaVerse Holdings Ltd
-    'FNCH': '0001733257',  # Finch Therapeutics Group, Inc.
-    'OWVI': '0001763657',  # One World Ventures Inc
-    'NPLS': '0001781726',  # NP Life Sciences Health Industry Group Inc.
-    'CSSI': '0001178660',  # Standard Dental Labs Inc.
-    'CATG': '0001470129',  # Capstone Technologies Group Inc.
-    'CYCCP': '0001130166',  # Cyclacel Pharmaceuticals, Inc.
-    'WHLRD': '0001527541',  # Wheeler Real Estate Investment Trust, Inc.
-    'EGLXF': '0001854233',  # Enthusiast Gaming Holdings Inc. / Canada
-    'GBCS': '0000727346',  # SELECTIS HEALTH, INC.
-    'SFWJ': '0001919847',  # Software Effective Solutions, Corp.
-    'ODDAF': '0001949766',  # Odd Burger Corp
-    'SFES': '0000086115',  # SAFEGUARD SCIENTIFICS INC
-    'SPTY': '0001840102',  # SPECIFICITY, INC.
-    'PMDI': '0000806517',  # PSYCHEMEDICS CORP
-    'ZKGCF': '0001896511',  # ZKGC New Energy Ltd
-    'PRNAF': '0001131343',  # ALTERITY THERAPEUTICS LTD
-    'WBSR': '0001645155',  # Webstar Technology Group Inc.
-    'FZMD': '0000319016',  # Fuse Medical, Inc.
-    'ERKH': '0001769725',  # Eureka Homestead Bancorp, Inc.
-    'MCLE': '0001827855',  # Medicale Corp.
-    'BNSOF': '0000846546',  # BONSO ELECTRONICS INTERNATIONAL INC
-    'TVE': '0001376986',  # Tennessee Valley Authority
-    'TVC': '0001376986',  # Tennessee Valley Authority
-    'LNDZF': '0001617765',  # EVOME MEDICAL TECHNOLOGIES INC.
-    'MARX': '0001892922',  # Mars Acquisition Corp.
-    'BRCNF': '0001158399',  # Burcon NutraScience Corp
-    'SGLDF': '0001318482',  # KIDOZ INC.
-    'ARMC': '0001415813',  # Un Monde International Ltd.
-    'EXNRF': '0001263011',  # EXCELLON RESOURCES INC
-    'EVTK': '0001816554',  # EVENTIKO INC.
-    'FGCO': '0001377167',  # Financial Gravity Companies, Inc.
-    'EGRX': '0000827871',  # EAGLE PHARMACEUTICALS, INC.
-    'EVOL': '0001052054',  # Symbolic Logic, Inc.
-    'CJAX': '0001763925',  # CoJax Oil & Gas Corp
-    'PQEFF': '0001561180',  # PETROTEQ ENERGY INC.
-    'VQSSF': '0001777765',  # VIQ Solutions Inc.
-    'FULO': '0001092570',  # FULLNET COMMUNICATIONS INC
-    'SHVLF': '0001301713',  # STARCORE INTERNATIONAL MINES LTD.
-    'SGIC': '0001446371',  # Strategic Realty Trust, Inc.
-    'NEXCF': '0001737270',  # Nextech3D.AI Corp.
-    'HGLD': '0001551206',  # Patagonia Gold Corp.
-    'BIXT': '0001445815',  # BIOXYTRAN, INC
-    'FBDS': '0000926844',  # Fuss Brands Corp.
-    'FALC': '0000922521',  # FALCONSTOR SOFTWARE INC
-    'SILEF': '0001545224',  # Silver Elephant Mining Corp.
-    'ADMQ': '0001588014',  # ADM ENDEAVORS, INC.
-    'UCASU': '0001723517',  # UC Asset LP
-    'SITS': '0001468978',  # SOUTHERN ITS INTERNATIONAL, INC.
-    'VIDE': '0000758743',  # VIDEO DISPLAY CORP
-    'MVCO': '0000924095',  # Metavesco, Inc.
-    'GLUC': '0001420108',  # Glucose Health, Inc.
-    'BLYQ': '0001591565',  # BALLY, CORP.
-    'SIPN': '0001128252',  # SIPP International Industries, Inc.
-    'JETR': '0001908054',  # Star Jets International Inc.
-    'FXLV': '0001788717',  # F45 Training Holdings Inc.
-    'FRTX': '0000819050',  # Fresh Tracks Therapeutics, Inc.
-    'NVDEF': '0001398713',  # URZ3 ENERGY CORP.
-    'PNPL': '0001654672',  # PINEAPPLE, INC.
-    'UCIX': '0001358099',  # Umbra Companies, Inc.
-    'PRPI': '0001395445',  # PERPETUAL INDUSTRIES INC.
-    'ZPTA': '0001843714',  # Zapata Computing Holdings Inc.
-    'CMOT': '0001346346',  # Curtiss Motorcycle Company, Inc.
-    'SCYYF': '0001408146',  # SCANDIUM INTERNATIONAL MINING CORP.
-    'SNNC': '0001313938',  # Sibannac, Inc.
-    'WDLF': '0001281984',  # Decentral Life, Inc.
-    'RBCN': '0001410172',  # Rubicon Technology, Inc.
-    'RSHN': '0001087329',  # RushNet, Inc.
-    'SWISF': '0001771755',  # Sekur Private Data Ltd.
-    'AMTY': '0000945828',  # AMERITYRE CORP
-    'TLIS': '0001584751',  # Talis Biomedical Corp
-    'CANB': '0001509957',  # Can B Corp
-    'MTTCF': '0001828098',  # Steakholder Foods Ltd.
-    'AMMX': '0001776048',  # Ameramex International Inc
-    'HALB': '0001458631',  # Halberd Corp
-    'JSHG': '0001475430',  # JOSHUA GOLD RESOURCES INC
-    'GRDAF': '0001804469',  # Guardforce AI Co., Ltd.
-    'GEMZ': '0001104023',  # Gemxx Corp.
-    'TGNT': '0000846377',  # Totaligent, Inc.
-    'MCOA': '0001078799',  # Marijuana Co of America, Inc.
-    'SMKG': '0000900475',  # SmartCard Marketing Systems Inc
-    'ACRL': '0001584618',  # Atacama Resources International, Inc.
-    'JFTH': '0001857910',  # Japan Food Tech Holdings, Inc.
-    'FTRS': '0001041633',  # Futuris Co
-    'LTES': '0001586495',  # Leet Technology Inc.
-    'CETXP': '0001435064',  # CEMTREX INC
-    'DTGI': '0001014052',  # Digerati Technologies, Inc.
-    'SRMX': '0000841533',  # SADDLE RANCH MEDIA, INC.
-    'MRGE': '0001623360',  # Mirage Energy Corp
-    'CAPV': '0001127007',  # CABO VERDE CAPITAL INC.
-    'SPQS': '0000803097',  # SportsQuest, Inc.
-    'CRTD': '0001357671',  # Creatd, Inc.
-    'RTON': '0001580262',  # Right On Brands, Inc.
-    'ELRA': '0001402371',  # ELRAY RESOURCES, INC.
-    'GPFT': '0001205181',  # Grapefruit USA, Inc
-    'TKOI': '0001094084',  # TELKONET INC
-    'SVVC': '0001495584',  # Firsthand Technology Value Fund, Inc.
-    'SNWR': '0001096759',  # Sanwire Corp
-    'PWDY': '0001435617',  # POWERDYNE INTERNATIONAL, INC.
-    'BYOC': '0001386049',  # Beyond Commerce, Inc.
-    'DCSX': '0001779303',  # Direct Communication Solutions, Inc.
-    'PMEDF': '0001868079',  # Predictmedix Inc.
-    'PCYN': '0000812306',  # PROCYON CORP
-    'PAANF': '0001953588',  # Pan American Energy Corp. (Canada)
-    'RDAR': '0001384365',  # RAADR, INC.
-    'AGNPF': '0001642178',  # Algernon Pharmaceuticals Inc.
-    'IGPK': '0001002771',  # Integrated Cannabis Solutions, Inc.
-    'WHLRP': '0001527541',  # Wheeler Real Estate Investment Trust, Inc.
-    'RELT': '0001682265',  # Reliant Holdings, Inc.
-    'BDRL': '0001000683',  # BLONDER TONGUE LABORATORIES INC
-    'TNBI': '0001452011',  # Tanke Biosciences Corp
-    'USDP': '0001610682',  # USD Partners LP
-    'BMXC': '0001613895',  # Bemax, Inc.
-    'BRLL': '0001631463',  # Barrel Energy Inc.
-    'MOBBW': '0001898643',  # Mobilicom Ltd
-    'CNNC': '0001410187',  # Cannonau Corp.
-    'DROP': '0000842722',  # Fuse Science, Inc.
-    'IMPM': '0001000298',  # IMPAC MORTGAGE HOLDINGS INC
-    'CGAC': '0001444403',  # CODE GREEN APPAREL CORP
-    'ADXS': '0001100397',  # Ayala Pharmaceuticals, Inc.
-    'GYST': '0001510524',  # GRAYSTONE COMPANY, INC.
-    'KGKG': '0001802546',  # KONA GOLD BEVERAGE, INC.
-    'WNFT': '0001528188',  # Worldwide NFT Inc.
-    'ANDR': '0000006494',  # ANDREA ELECTRONICS CORP
-    'MMMW': '0001117228',  # MASS MEGAWATTS WIND POWER INC
-    'RHE-PA': '0001004724',  # REGIONAL HEALTH PROPERTIES, INC
-    'SIRC': '0001756704',  # SOLAR INTEGRATED ROOFING CORP.
-    'RKFL': '0000823546',  # ROCKETFUEL BLOCKCHAIN, INC.
-    'WCUI': '0001516887',  # Wellness Center USA, Inc.
-    'NSTC': '0001835817',  # Northern Star Investment Corp. III
-    'GMZP': '0001973160',  # GEMZ Corp. NV
-    'MGHL': '0001162283',  # MORGAN GROUP HOLDING CO
-    'EHVVF': '0001653606',  # Ehave, Inc.
-    'VIVE': '0000879682',  # VIVEVE MEDICAL, INC.
-    'AXIM': '0001514946',  # AXIM BIOTECHNOLOGIES, INC.
-    'ELST': '0000752294',  # ELECTRONIC SYSTEMS TECHNOLOGY INC
-    'IWAL': '0001498372',  # iWallet Corp
-    'CNCT': '0001346287',  # China Teletech Holding Inc
-    'TLIF': '0001633273',  # TOCCA LIFE HOLDINGS, INC.
-    'GMBL': '0001451448',  # ESPORTS ENTERTAINMENT GROUP, INC.
-    'FKST': '0001458023',  # Flowerkist Skin Care & Cosmetics, Inc.
-    'COUV': '0001450307',  # CORPORATE UNIVERSE INC
-    'INNI': '0001098482',  # Innovaro, Inc.
-    'TKMO': '0001946585',  # Tekumo, Inc.
-    'PHBI': '0001435181',  # Pharmagreen Biotech Inc.
-    'CBGL': '0001413488',  # CANNABIS GLOBAL, INC.
-    'CDSG': '0000946112',  # China Dongsheng International, Inc.
-    'SNPW': '0001343465',  # Sun Pacific Holding Corp.
-    'NHMD': '0001409446',  # NATE'S FOOD CO.
-    'GYGC': '0001983389',  # Guyana Gold Corp
-    'SLHGF': '0001839730',  # Skylight Health Group Inc.
-    'SCPS': '0001772028',  # Scopus BioPharma Inc.
-    'NTRR': '0001512886',  # NEUTRA CORP.
-    'APSI': '0001553264',  # AQUA POWER SYSTEMS INC.
-    'RLBD': '0001084133',  # Real Brands, Inc.
-    'DCAC': '0001498291',  # Daniels Corporate Advisory Company, Inc.
-    'SHGI': '0001874138',  # Sparx Holdings Group, Inc.
-    'FORZ': '0001683131',  # Forza Innovations Inc
-    'ENDV': '0001528172',  # ENDONOVO THERAPEUTICS, INC.
-    'CALA': '0001496671',  # Calithera Biosciences, Inc.
-    'PLPL': '0001317880',  # Plandai Biotechnology, Inc.
-    'PVNNF': '0001627480',  # PV Nano Cell, Ltd.
-    'OXBRW': '0001584831',  # OXBRIDGE RE HOLDINGS Ltd
-    'ALPP': '0001606698',  # ALPINE 4 HOLDINGS, INC.
-    'EFTR': '0001828522',  # eFFECTOR Therapeutics, Inc.
-    'BTZI': '0001525852',  # BOTS, Inc./PR
-    'BZWR': '0001830503',  # Business Warrior Corp
-    'MASN': '0001486452',  # Maison Luxe, Inc.
-    'DPUI': '0001791929',  # DISCOUNT PRINT USA, INC.
-    'CLRD': '0000895665',  # Clearday, Inc.
-    'MMNFQ': '0001776932',  # MedMen Enterprises, Inc.
-    'AERS': '0001863116',  # Aerius International Inc.
-    'PRST': '0001822145',  # Presto Automation Inc.
-    'LCCN': '0001472998',  # LeapCharger Corp
-    'TMNA': '0001648365',  # AGRI-FINTECH HOLDINGS, INC.
-    'LFAP': '0001510247',  # LGBTQ Loyalty Holdings, Inc.
-    'ECOX': '0001144169',  # ECO INNOVATION GROUP, INC.
-    'MLLOF': '0001370496',  # Medallion Resources Ltd
-    'CLCS': '0001569340',  # Cell Source, Inc.
-    'THCT': '0001404935',  # THC Therapeutics, Inc.
-    'WTII': '0001715032',  # Water Technologies International,Inc.
-    'SNHO': '0001927077',  # SHONGHOYA INTERNATIONAL GROUP INC.
-    'GZIC': '0001286648',  # GZ6G Technologies Corp.
-    'SUWN': '0000806592',  # SUNWIN STEVIA INTERNATIONAL, INC.
-    'FAVO': '0001795851',  # Favo Capital, Inc.
-    'GIPL': '0001837774',  # Global Innovative Platforms Inc.
-    'TIOG': '0000854800',  # Tingo Group, Inc.
-    'HPCO': '0001892480',  # Hempacco Co., Inc.
-    'DWAY': '0001394638',  # Driveitaway Holdings, Inc.
-    'JMTM': '0000889353',  # James Maritime Holdings Inc.
-    'AMIH': '0001300524',  # AMERICAN INTERNATIONAL HOLDINGS CORP.
-    'RENO': '0001590383',  # RENOVARE ENVIRONMENTAL, INC.
-    'LBTI': '0001384135',  # Lithium & Boron Technology, Inc.
-    'SFRT': '0001821075',  # Appreciate Holdings, Inc.
-    'RTSL': '0001575659',  # Rapid Therapeutic Science Laboratories, Inc.
-    'GMVDF': '0001760764',  # G Medical Innovations Holdings Ltd.
-    'ESSI': '0001490873',  # ECO SCIENCE SOLUTIONS, INC.
-    'EWLL': '0001550020',  # eWELLNESS HEALTHCARE Corp
-    'ADGO': '0000869531',  # Advantego Corp
-    'DSGT': '0001413909',  # DSG Global Inc.
-    'QBIO': '0001596062',  # Q BioMed Inc.
-    'VBIVQ': '0000764195',  # VBI Vaccines Inc/BC
-    'VAXX': '0001851657',  # Vaxxinity, Inc.
-    'BTIM': '0001622231',  # BOATIM INC.
-    'THMO': '0000811212',  # ThermoGenesis Holdings, Inc.
-    'ICNB': '0001350073',  # Iconic Brands, Inc.
-    'TKLS': '0001429393',  # Trutankless, Inc.
-    'INLB': '0001500123',  # Item 9 Labs Corp.
-    'ECXJ': '0001823635',  # CXJ GROUP CO., Ltd
-    'EGOXF': '0001942808',  # Next.e.GO N.V.
-    'INFIQ': '0001113148',  # INFINITY PHARMACEUTICALS, INC.
-    'SINC': '0001532595',  # Sincerity Applied Materials Holdings Corp.
-    'RNGC': '0001434740',  # Ranger Gold Corp.
-    'MAXD': '0001353499',  # Max Sound Corp
-    'ASPU': '0001487198',  # ASPEN GROUP, INC.
-    'STAB': '0001318641',  # Statera Biopharma, Inc.
-    'ARDS': '0001614067',  # Aridis Pharmaceuticals, Inc.
-    'BXRXQ': '0001780097',  # Baudax Bio, Inc.
-    'PLYN': '0001612851',  # Palayan Resources, Inc.
-    'FDBL': '0001414043',  # Friendable, Inc.
-    'KBNT': '0001729750',  # Kubient, Inc.
-    'WINR': '0001708410',  # SIMPLICITY ESPORTS & GAMING Co
-    'WEIDY': '0001734902',  # Weidai Ltd.
-    'VRUS': '0001430523',  # VERUS INTERNATIONAL, INC.
-    'MOTS': '0001686850',  # Motus GI Holdings, Inc.
-    'SECOY': '0001633441',  # Secoo Holding Ltd
-    'JUVAF': '0001778651',  # JUVA LIFE INC./Canada
-    'ALFIQ': '0001833908',  # Alfi, Inc.
-    'BZRD': '0001765826',  # Blubuzzard, Inc.
-    'WTER': '0001532390',  # ALKALINE WATER Co INC
-    'SMFL': '0001851860',  # SMART FOR LIFE, INC.
-    'AUVIQ': '0001811109',  # Applied UV, Inc.
-    'CSSEQ': '0001679063',  # Chicken Soup for the Soul Entertainment, Inc.
-    'AEYGQ': '0000874292',  # ADDVANTAGE TECHNOLOGIES GROUP INC
-    'NAVB': '0000810509',  # NAVIDEA BIOPHARMACEUTICALS, INC.
-    'ATHXQ': '0001368148',  # ATHERSYS, INC / NEW
-    'BAC-PL': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'MER-PK': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BACRP': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PM': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PN': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PO': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PP': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PQ': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'BAC-PS': '0000070858',  # BANK OF AMERICA CORP /DE/
-    'MNESP': '0000066570',  # MSA Safety Inc
-    'INPAP': '0000051434',  # INTERNATIONAL PAPER CO /NEW/
-    'CTO-PA': '0000023795',  # CTO Realty Growth, Inc.
-    'FHN-PB': '0000036966',  # FIRST HORIZON CORP
-    'FHN-PC': '0000036966',  # FIRST HORIZON CORP
-    'FHN-PE': '0000036966',  # FIRST HORIZON CORP
-    'FHN-PF': '0000036966',  # FIRST HORIZON CORP
-    'USB-PQ': '0000036104',  # US BANCORP \DE\
-    'USB-PR': '0000036104',  # US BANCORP \DE\
-    'USB-PS': '0000036104',  # US BANCORP \DE\
-    'FACTU': '0002028935',  # FACT II Acquisition Corp.
-    'FACTW': '0002028935',  # FACT II Acquisition Corp.
-    'GSRTU': '0002029023',  # GSR III Acquisition Corp.
-    'GSRTR': '0002029023',  # GSR III Acquisition Corp.
-    'GIGGU': '0002023730',  # GigCapital7 Corp.
-    'GIGGW': '0002023730',  # GigCapital7 Corp.
-    'BACQR': '0002028707',  # Bleichroeder Acquisition Corp. I
-    'BACQU': '0002028707',  # Bleichroeder Acquisition Corp. I
-    'DMAAU': '0002028614',  # Drugs Made In America Acquisition Corp.
-    'DYNXW': '0002028699',  # Dynamix Corp
-    'DYNXU': '0002028699',  # Dynamix Corp
-    'LPBBW': '0002023676',  # Launch Two Acquisition Corp.
-    'LPBBU': '0002023676',  # Launch Two Acquisition Corp.
-    'HONDW': '0002019804',  # HCM II Acquisition Corp.
-    'HONDU': '0002019804',  # HCM II Acquisition Corp.
-    'CGBSW': '0001991946',  # Crown LNG Holdings Ltd
-    'PITAW': '0001995194',  # Heramba Electric plc
-    'MRNOW': '0001988776',  # Murano Global Investments Plc
-    'BDMDW': '0001982444',  # Baird Medical Investment Holdings Ltd
-    'CCIXU': '0002006291',  # Churchill Capital Corp IX/Cayman
-    'CCIXW': '0002006291',  # Churchill Capital Corp IX/Cayman
-    'LPAAU': '0002015502',  # Launch One Acquisition Corp.
-    'LPAAW': '0002015502',  # Launch One Acquisition Corp.
-    'SPHIF': '0001995306',  # SUPER HI INTERNATIONAL HOLDING LTD.
-    'IBACR': '0001998781',  # IB Acquisition Corp.
-    'CLBR-UN': '0001995413',  # COLOMBIER ACQUISITION CORP. II
-    'CLBR-WT': '0001995413',  # COLOMBIER ACQUISITION CORP. II
-    'BUJAW': '0001956055',  # Bukit Jalil Global Acquisition 1 Ltd.
-    'BUJAU': '0001956055',  # Bukit Jalil Global Acquisition 1 Ltd.
-    'BUJAR': '0001956055',  # Bukit Jalil Global Acquisition 1 Ltd.
-    'LZM-WT': '0001958217',  # Lifezone Metals Ltd
-    'CREVW': '0001960208',  # Carbon Revolution Public Ltd Co
-    'LDTCW': '0001981462',  # LeddarTech Holdings Inc.
-    'QETAU': '0001978528',  # Quetta Acquisition Corp
-    'QETAR': '0001978528',  # Quetta Acquisition Corp
-    'GFRWF': '0001966287',  # Greenfire Resources Ltd.
-    'ATCHW': '0001963088',  # AtlasClear Holdings, Inc.
-    'ALDFU': '0002031561',  # Aldel Financial II Inc.
-    'ALDFW': '0002031561',  # Aldel Financial II Inc.
-    'INVLW': '0002001557',  # Innventure, Inc.
-    'PDPA': '0001998043',  # Pearl Diver Credit Co Inc.
-    'SHMDW': '0001987240',  # SCHMID Group N.V.
-    'ACZT': '0001994373',  # Aceztech Corp
-    'MKDWW': '0001991332',  # MKDWELL Tech Inc.
-    'NETDW': '0001975218',  # Nabors Energy Transition Corp. II
-    'NETDU': '0001975218',  # Nabors Energy Transition Corp. II
-    'HYAC-UN': '0001970509',  # Haymaker Acquisition Corp. 4
-    'HYAC-WT': '0001970509',  # Haymaker Acquisition Corp. 4
-    'KYFGF': '0002042187',  # Kyoto Financial Group Inc/ADR
-    'TLPPF': '0002007191',  # Telix Pharmaceuticals Ltd
-    'SPHAU': '0002030829',  # Shepherd Ave Capital Acquisition Corp
-    'FOXXW': '0002013807',  # Foxx Development Holdings Inc.
-    'RMSGW': '0001983324',  # Real Messenger Corp
-    'BAYAR': '0001969475',  # Bayview Acquisition Corp
-    'BAYAU': '0001969475',  # Bayview Acquisition Corp
-    'AITRU': '0001966734',  # AI Transportation Acquisition Corp
-    'AITRR': '0001966734',  # AI Transportation Acquisition Corp
-    'GAFC': '0001989788',  # Guru App Factory Corp
-    'DSYWW': '0001999297',  # Big Tree Cloud Holdings Ltd
-    'ZOOZW': '0001992818',  # ZOOZ Power Ltd.
-    'MGSD': '0002003750',  # Maitong Sunshine Cultural Development Co., Ltd
-    'ALFUW': '0002010930',  # Centurion Acquisition Corp.
-    'ALFUU': '0002010930',  # Centurion Acquisition Corp.
-    'AEFC': '0000769218',  # AEGON LTD.
-    'PAASF': '0000771992',  # PAN AMERICAN SILVER CORP
-    'FCNCO': '0000798941',  # FIRST CITIZENS BANCSHARES INC /DE/
-    'FCNCP': '0000798941',  # FIRST CITIZENS BANCSHARES INC /DE/
-    'WOLTF': '0000861967',  # WOLTERS KLUWER N V /FI
-    'IDEXQ': '0000837852',  # IDEANOMICS, INC.
-    'CHSCL': '0000823277',  # CHS INC
-    'CHSCM': '0000823277',  # CHS INC
-    'CHSCN': '0000823277',  # CHS INC
-    'CHSCO': '0000823277',  # CHS INC
-    'WSBCP': '0000203596',  # WESBANCO INC
-    'T-PA': '0000732717',  # AT&T INC.
-    'T-PC': '0000732717',  # AT&T INC.
-    'CDZIP': '0000727273',  # CADIZ INC
-    'FITBO': '0000035527',  # FIFTH THIRD BANCORP
-    'FITBP': '0000035527',  # FIFTH THIRD BANCORP
-    'CFR-PB': '0000039263',  # CULLEN/FROST BANKERS, INC.
-    'CTDD': '0000068622',  # QWEST CORP
-    'RONN': '0000058411',  # Lee Pharmaceuticals, Inc.
-    'LGL-WT': '0000061004',  # LGL GROUP INC
-    'LNC-PD': '0000059558',  # LINCOLN NATIONAL CORP
-    'SNV-PE': '0000018349',  # SYNOVUS FINANCIAL CORP
-    'KIM-PN': '0000879101',  # KIMCO REALTY CORP
-    'AP-WT': '0000006176',  # AMPCO PITTSBURGH CORP
-    'FNMAP': '0000310522',  # FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE
-    'UEPCO': '0000100826',  # UNION ELECTRIC CO
-    'PNMXO': '0000081023',  # PUBLIC SERVICE CO OF NEW MEXICO
-    'TDDWW': '0000098222',  # TIDEWATER INC
-    'TDGMW': '0000098222',  # TIDEWATER INC
-    'FRMEP': '0000712534',  # FIRST MERCHANTS CORP
-    'SF-PD': '0000720672',  # STIFEL FINANCIAL CORP
-    'SFB': '0000720672',  # STIFEL FINANCIAL CORP
-    'BCEFF': '0000718940',  # BCE INC
-    'BCEPF': '0000718940',  # BCE INC
-    'BCEXF': '0000718940',  # BCE INC
-    'BCAEF': '0000718940',  # BCE INC
-    'BCEIF': '0000718940',  # BCE INC
-    'BCPPF': '0000718940',  # BCE INC
-    'OTRKP': '0001136174',  # Ontrak, Inc.
-    'RHEPB': '0001004724',  # REGIONAL HEALTH PROPERTIES, INC
-    'AFGD': '0001042046',  # AMERICAN FINANCIAL GROUP INC
-    'AFGE': '0001042046',  # AMERICAN FINANCIAL GROUP INC
-    'AFGB': '0001042046',  # AMERICAN FINANCIAL GROUP INC
-    'SWKHL': '0001089907',  # SWK Holdings Corp
-    'MOBQW': '0001084267',  # Mobiquity Technologies, Inc.
-    'STNDF': '0001087711',  # Santander UK plc
-    'SNTUF': '0001087711',  # Santander UK plc
-    'IRS-WT': '0000933267',  # IRSA INVESTMENTS & REPRESENTATIONS INC
-    'COF-PK': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'COF-PL': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'COF-PN': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'COF-PI': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'COF-PJ': '0000927628',  # CAPITAL ONE FINANCIAL CORP
-    'WCC-PA': '0000929008',  # WESCO INTERNATIONAL INC
-    'SPE-PC': '0000897802',  # SPECIAL OPPORTUNITIES FUND, INC.
-    'SF-PC': '0000720672',  # STIFEL FINANCIAL CORP
-    'NPPXF': '0000769594',  # NIPPON TELEGRAPH & TELEPHONE CORP
-    'WBS-PG': '0000801337',  # WEBSTER FINANCIAL CORP
-    'GOVXW': '0000832489',  # GeoVax Labs, Inc.
-    'UCB-PI': '0000857855',  # UNITED COMMUNITY BANKS INC
-    'MFA-PC': '0001055160',  # MFA FINANCIAL, INC.
-    'MFAN': '0001055160',  # MFA FINANCIAL, INC.
-    'MFAO': '0001055160',  # MFA FINANCIAL, INC.
-    'ZIVOW': '0001101026',  # Zivo Bioscience, Inc.
-    'MET-PF': '0001099219',  # METLIFE INC
-    'TEN-PE': '0001166663',  # TSAKOS ENERGY NAVIGATION LTD
-    'TEN-PF': '0001166663',  # TSAKOS ENERGY NAVIGATION LTD
-    'ARES-PB': '0001176948',  # Ares Management Corp
-    'CNO-PA': '0001224608',  # CNO Financial Group, Inc.
-    'ABR-PD': '0001253986',  # ARBOR REALTY TRUST INC
-    'ABR-PE': '0001253986',  # ARBOR REALTY TRUST INC
-    'ABR-PF': '0001253986',  # ARBOR REALTY TRUST INC
-    'RF-PE': '0001281761',  # REGIONS FINANCIAL CORP
-    'RF-PF': '0001281761',  # REGIONS FINANCIAL CORP
-    'DLR-PL': '0001297996',  # DIGITAL REALTY TRUST, INC.
-    'CADE-PA': '0001299939',  # Cadence Bank
-    'PREJF': '0000911421',  # PARTNERRE LTD
-    'ADC-PA': '0000917251',  # AGREE REALTY CORP
-    'VNO-PN': '0000899689',  # VORNADO REALTY TRUST
-    'VNO-PO': '0000899689',  # VORNADO REALTY TRUST
-    'MS-PQ': '0000895421',  # MORGAN STANLEY
-    'MSTLW': '0000895421',  # MORGAN STANLEY
-    'MS-PL': '0000895421',  # MORGAN STANLEY
-    'MS-PO': '0000895421',  # MORGAN STANLEY
-    'MS-PP': '0000895421',  # MORGAN STANLEY
-    'FCELB': '0000886128',  # FUELCELL ENERGY INC
-    'GERNW': '0000886744',  # GERON CORP
-    'BNH': '0001001085',  # BROOKFIELD Corp /ON/
-    'BNJ': '0001001085',  # BROOKFIELD Corp /ON/
-    'BROXF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BXDIF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BAMKF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BKAMF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BKFAF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BKFPF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BRCFF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BKFDF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BKFOF': '0001001085',  # BROOKFIELD Corp /ON/
-    'BRPSF': '0001001085',  # BROOKFIELD Corp /ON/
-    'POWWP': '0001015383',  # AMMO, INC.
-    'CHNEY': '0001030475',  # CHINA EASTERN AIRLINES CORP LTD
-    'SREA': '0001032208',  # SEMPRA
-    'CRESW': '0001034957',  # CRESUD INC
-    'ML-WT': '0001807846',  # MONEYLION INC.
-    'NLSPW': '0001783036',  # NLS Pharmaceutics Ltd.
-    'NUKKW': '0001787518',  # Nukkleus Inc.
-    'ATCOL': '0001794846',  # Atlas Corp.
-    'ATCO-PD': '0001794846',  # Atlas Corp.
-    'ATCO-PH': '0001794846',  # Atlas Corp.
-    'BENFW': '0001775734',  # Beneficient
-    'BEATW': '0001779372',  # HeartBeam, Inc.
-    'OUSTZ': '0001816581',  # Ouster, Inc.
-    'OUSTW': '0001816581',  # Ouster, Inc.
-    'ATIPW': '0001815849',  # ATI Physical Therapy, Inc.
-    'MSOGF': '0001815846',  # MINISO Group Holding Ltd
-    'HGASW': '0001817232',  # Global Gas Corp
-    'RDW-WT': '0001819810',  # Redwire Corp
-    'EVGOW': '0001821159',  # EVgo Inc.
-    'JOBY-WT': '0001819848',  # Joby Aviation, Inc.
-    'AENTW': '0001823584',  # ALLIANCE ENTERTAINMENT HOLDING CORP
-    'SKYH-WT': '0001823587',  # Sky Harbour Group Corp
-    'TSPH': '0001823593',  # TuSimple Holdings Inc.
-    'PVOZ': '0001824204',  # Park View OZ REIT Inc
-    'IONQ-WT': '0001824920',  # IonQ, Inc.
-    'SVMHW': '0001973368',  # SRIVARU Holding Ltd
-    'ARLTF': '0001977303',  # Arcadium Lithium plc
-    'LGSP': '0001970129',  # LEGEND SPICES, INC.
-    'SEPSF': '0001969766',  # Asep Medical Holdings Inc.
-    'LOTWW': '0001962746',  # Lotus Technology Inc.
-    'VSTEW': '0001964630',  # Vast Renewables Ltd
-    'TLSIW': '0001826667',  # TriSalus Life Sciences, Inc.
-    'IINNW': '0001837493',  # Inspira Technologies OXY B.H.N. Ltd
-    'WALDW': '0001840199',  # Waldencast plc
-    'GEGGL': '0001831096',  # Great Elm Group, Inc.
-    'BLUAW': '0001831006',  # BlueRiver Acquisition Corp.
-    'BLUVF': '0001831006',  # BlueRiver Acquisition Corp.
-    'ZPTAW': '0001843714',  # Zapata Computing Holdings Inc.
-    'SOUNW': '0001840856',  # SOUNDHOUND AI, INC.
-    'COCHW': '0001840877',  # Envoy Medical, Inc.
-    'ESLAW': '0001844417',  # Estrella Immunopharma, Inc.
-    'LNZAW': '0001843724',  # LanzaTech Global, Inc.
-    'CBRRF': '0001845149',  # Chain Bridge I
-    'CBRGF': '0001845149',  # Chain Bridge I
-    'ANNAW': '0001845123',  # AleAnna, Inc.
-    'MAQCU': '0001844419',  # Maquia Capital Acquisition Corp
-    'MAQCW': '0001844419',  # Maquia Capital Acquisition Corp
-    'LUNRW': '0001844452',  # Intuitive Machines, Inc.
-    'OPFI-WT': '0001818502',  # OppFi Inc.
-    'CXAIW': '0001820875',  # CXApp Inc.
-    'SCLXW': '0001820190',  # Scilex Holding Co
-    'ONFOW': '0001825452',  # Onfolio Holdings, Inc
-    'ONFOP': '0001825452',  # Onfolio Holdings, Inc
-    'SSRT': '0001822372',  # Streetex Corp.
-    'UHGWW': '0001830188',  # United Homes Group, Inc.
-    'GFAIW': '0001804469',  # Guardforce AI Co., Ltd.
-    'TMCWW': '0001798562',  # TMC the metals Co Inc.
-    'FFIEW': '0001805521',  # FARADAY FUTURE INTELLIGENT ELECTRIC INC.
-    'DTSQU': '0002017950',  # DT Cloud Star Acquisition Corp
-    'DTSQR': '0002017950',  # DT Cloud Star Acquisition Corp
-    'EQV-WT': '0002021042',  # EQV Ventures Acquisition Corp.
-    'EQV-UN': '0002021042',  # EQV Ventures Acquisition Corp.
-    'BKHAU': '0002000775',  # Black Hawk Acquisition Corp
-    'BKHAR': '0002000775',  # Black Hawk Acquisition Corp
-    'FREY-WT': '0001992243',  # FREYR Battery, Inc. /DE/
-    'GMTH': '0002000762',  # GMTech Inc.
-    'AFBL': '0001995648',  # AFB Ltd
-    'HYMCL': '0001718405',  # HYCROFT MINING HOLDING CORP
-    'FROPX': '0001732078',  # Flat Rock Opportunity Fund
-    'STSSW': '0001737995',  # Sharps Technology Inc.
-    'ASCIX': '0001716885',  # Angel Oak Strategic Credit Fund
-    'HYMCW': '0001718405',  # HYCROFT MINING HOLDING CORP
-    'SLXNW': '0002022416',  # Silexion Therapeutics Corp
-    'TNMWF': '0002013186',  # TNL Mediagene
-    'AAM-WT': '0002012964',  # AA Mission Acquisition Corp.
-    'AAM-UN': '0002012964',  # AA Mission Acquisition Corp.
-    'HSPTU': '0002032950',  # Horizon Space Acquisition II Corp.
-    'ADMWF': '0002032966',  # ACUREN CORP
-    'DRDBU': '0002032528',  # Roman DBDR Acquisition Corp. II
-    'WLACU': '0002032379',  # Willow Lane Acquisition Corp.
-    'WLACW': '0002032379',  # Willow Lane Acquisition Corp.
-    'RDACR': '0002018145',  # Rising Dragon Acquisition Corp.
-    'RDACU': '0002018145',  # Rising Dragon Acquisition Corp.
-    'MNSBP': '0001693577',  # MainStreet Bancshares, Inc.
-    'IPXXW': '0001970622',  # Inflection Point Acquisition Corp. II
-    'IPXXU': '0001970622',  # Inflection Point Acquisition Corp. II
-    'ENGNW': '0001980845',  # enGene Holdings Inc.
-    'BOWNR': '0001973056',  # Bowen Acquisition Corp
-    'BOWNU': '0001973056',  # Bowen Acquisition Corp
-    'RMXI': '0001970743',  # Reticulate Micro, Inc.
-    'MRKY': '0001973047',  # MARKY CORP.
-    'EURKR': '0002000410',  # Eureka Acquisition Corp
-    'EURKU': '0002000410',  # Eureka Acquisition Corp
-    'MDCXW': '0001997296',  # Medicus Pharma Ltd.
-    'BEIGF': '0001651308',  # BeiGene, Ltd.
-    'ICRP': '0001690012',  # InPoint Commercial Real Estate Income, Inc.
-    'LMND-WT': '0001691421',  # Lemonade, Inc.
-    'LBRDP': '0001611983',  # Liberty Broadband Corp
-    'PAVMZ': '0001624326',  # PAVmed Inc.
-    'SYF-PA': '0001601712',  # Synchrony Financial
-    'SYF-PB': '0001601712',  # Synchrony Financial
-    'NXLIW': '0001527352',  # Nexalin Technology, Inc.
-    'SKILW': '0001774675',  # Skillsoft Corp.
-    'NUWEW': '0001506492',  # Nuwellis, Inc.
-    'OZKAP': '0001569650',  # Bank OZK
-    'PPLOF': '0001546066',  # PEMBINA PIPELINE CORP
-    'PBNAF': '0001546066',  # PEMBINA PIPELINE CORP
-    'PMBPF': '0001546066',  # PEMBINA PIPELINE CORP
-    'PMMBF': '0001546066',  # PEMBINA PIPELINE CORP
-    'PPLAF': '0001546066',  # PEMBINA PIPELINE CORP
-    'LFT-PA': '0001547546',  # Lument Finance Trust, Inc.
-    'WHFCL': '0001552198',  # WhiteHorse Finance, Inc.
-    'PNSTW': '0001852633',  # Pinstripes Holdings, Inc.
-    'RFACW': '0001847607',  # RF Acquisition Corp.
-    'BRQL': '0001854526',  # brooqLy, Inc.
-    'AIRJW': '0001855474',  # AirJoule Technologies Corp.
-    'ICUCW': '0001831868',  # SeaStar Medical Holding Corp
-    'CLDWW': '0001855485',  # Calidi Biotherapeutics, Inc.
-    'BHACU': '0001851612',  # Focus Impact BH3 Acquisition Co
-    'BHACW': '0001851612',  # Focus Impact BH3 Acquisition Co
-    'GDEVW': '0001848739',  # GDEV Inc.
-    'PHYUF': '0001848756',  # Pyrophyte Acquisition Corp.
-    'PHYWF': '0001848756',  # Pyrophyte Acquisition Corp.
-    'SAIHW': '0001847075',  # SAIHEAT Ltd
-    'PSQH-WT': '0001847064',  # PSQ Holdings, Inc.
-    'RFACR': '0001847607',  # RF Acquisition Corp.
-    'RFACU': '0001847607',  # RF Acquisition Corp.
-    'GDLG': '0001848672',  # Glidelogic Corp.
-    'GHBWF': '0001848731',  # Glass House Brands Inc.
-    'BZFDW': '0001828972',  # BuzzFeed, Inc.
-    'ASAIY': '0001834048',  # Sendas Distributor S.A.
-    'INVZW': '0001835654',  # Innoviz Technologies Ltd.
-    'LEVWQ': '0001834974',  # Lion Electric Co
-    'LEGWQ': '0001834974',  # Lion Electric Co
-    'GSLR': '0001838876',  # GeoSolar Technologies, Inc.
-    'SVIIR': '0001843477',  # Spring Valley Acquisition Corp. II
-    'SVIIU': '0001843477',  # Spring Valley Acquisition Corp. II
-    'SPECW': '0001844149',  # Spectaire Holdings Inc.
-    'SVIIW': '0001843477',  # Spring Valley Acquisition Corp. II
-    'JETBF': '0001846084',  # Global Crossing Airlines Group Inc.
-    'SBIGW': '0001801602',  # SpringBig Holdings, Inc.
-    'SST-WT': '0001805833',  # System1, Inc.
-    'EOSEW': '0001805077',  # Eos Energy Enterprises, Inc.
-    'TRINZ': '0001786108',  # Trinity Capital Inc.
-    'TRINL': '0001786108',  # Trinity Capital Inc.
-    'TRINI': '0001786108',  # Trinity Capital Inc.
-    'PMVCW': '0001807765',  # PMV Consumer Acquisition Corp.
-    'PMVCD': '0001807765',  # PMV Consumer Acquisition Corp.
-    'BURUW': '0001814215',  # Nuburu, Inc.
-    'BRZHW': '0001817640',  # Breeze Holdings Acquisition Corp.
-    'BRZHR': '0001817640',  # Breeze Holdings Acquisition Corp.
-    'BARK-WT': '0001819574',  # Bark, Inc.
-    'CIFRW': '0001819989',  # Cipher Mining Inc.
-    'CLNNW': '0001822791',  # Clene Inc.
-    'OPADW': '0001825024',  # Offerpad Solutions Inc.
-    'ARKOW': '0001823794',  # ARKO Corp.
-    'BNZIW': '0001826011',  # Banzai International, Inc.
-    'PDYNW': '0001826681',  # Palladyne AI Corp.
-    'ISRLU': '0001915328',  # Israel Acquisitions Corp
-    'ISRLW': '0001915328',  # Israel Acquisitions Corp
-    'GRRRW': '0001903145',  # Gorilla Technology Group Inc.
-    'JOCM': '0001907425',  # JOCOM HOLDINGS CORP.
-    'ALCYW': '0001901336',  # Alchemy Investments Acquisition Corp 1
-    'ALCYU': '0001901336',  # Alchemy Investments Acquisition Corp 1
-    'AMPX-WT': '0001899287',  # Amprius Technologies, Inc.
-    'GGROW': '0001886190',  # Gogoro Inc.
-    'KWESW': '0001889823',  # KWESST Micro Systems Inc.
-    'PGYWW': '0001883085',  # Pagaya Technologies Ltd.
-    'VHAIW': '0001880431',  # Vocodia Holdings Corp
-    'VHABW': '0001880431',  # Vocodia Holdings Corp
-    'CINGW': '0001862150',  # Cingulate Inc.
-    'VLN-WT': '0001863006',  # Valens Semiconductor Ltd.
-    'KACRF': '0001865468',  # Kairous Acquisition Corp. Ltd
-    'KACUF': '0001865468',  # Kairous Acquisition Corp. Ltd
-    'KACWF': '0001865468',  # Kairous Acquisition Corp. Ltd
-    'EMCGW': '0001869601',  # Embrace Change Acquisition Corp.
-    'EVTWF': '0001867102',  # Vertical Aerospace Ltd.
-    'WAVSU': '0001868419',  # Western Acquisition Ventures Corp.
-    'WAVSW': '0001868419',  # Western Acquisition Ventures Corp.
-    'ALLGF': '0001874474',  # Allego N.V.
-    'EMCGR': '0001869601',  # Embrace Change Acquisition Corp.
-    'EMCGU': '0001869601',  # Embrace Change Acquisition Corp.
-    'LILWF': '0001855756',  # Lilium N.V.
-    'SHFSW': '0001854963',  # SHF Holdings, Inc.
-    'MINR': '0001854816',  # Minerva Gold Inc.
-    'IVCAU': '0001852889',  # Investcorp AI Acquisition Corp.
-    'IVCAW': '0001852889',  # Investcorp AI Acquisition Corp.
-    'BRLSW': '0001852973',  # Borealis Foods Inc.
-    'NPWR-WT': '0001845437',  # NET Power Inc.
-    'QTIWW': '0001844505',  # QT IMAGING HOLDINGS, INC.
-    'NKGNW': '0001845459',  # NKGen Biotech, Inc.
-    'DFLIW': '0001847986',  # Dragonfly Energy Holdings Corp.
-    'OABIW': '0001846253',  # OmniAb, Inc.
-    'IMAQR': '0001846235',  # International Media Acquisition Corp.
-    'IMAQU': '0001846235',  # International Media Acquisition Corp.
-    'IMAQW': '0001846235',  # International Media Acquisition Corp.
-    'PETWW': '0001842356',  # Wag! Group Co.
-    'FLYX-WT': '0001843973',  # FLYEXCLUSIVE INC.
-    'RGTIW': '0001838359',  # Rigetti Computing, Inc.
-    'HLGNW': '0001840292',  # Heliogen, Inc.
-    'MDAIW': '0001833498',  # Spectral AI, Inc.
-    'CTV-WT': '0001835378',  # Innovid Corp.
-    'NVVEW': '0001836875',  # Nuvve Holding Corp.
-    'CPPTL': '0001837671',  # Copper Property CTL Pass Through Trust
-    'BETRW': '0001835856',  # Better Home & Finance Holding Co
-    'PL-WT': '0001836833',  # Planet Labs PBC
-    'AQUNR': '0001861063',  # Aquaron Acquisition Corp.
-    'AQUNU': '0001861063',  # Aquaron Acquisition Corp.
-    'ARBEW': '0001861841',  # Arbe Robotics Ltd.
-    'ZEOWW': '0001865506',  # Zeo Energy Corp.
-    'RDZNW': '0001868640',  # Roadzen Inc.
-    'ARQQW': '0001859690',  # Arqit Quantum Inc.
-    'MACT': '0001957783',  # MachTen, Inc.
-    'COOTW': '0001959994',  # Australian Oilseeds Holdings Ltd
-    'ALVOW': '0001898416',  # Alvotech
-    'RENEU': '0001889112',  # Cartesian Growth Corp II
-    'RENEW': '0001889112',  # Cartesian Growth Corp II
-    'ATMCR': '0001889106',  # ALPHATIME ACQUISITION CORP
-    'ATMCU': '0001889106',  # ALPHATIME ACQUISITION CORP
-    'ATMCW': '0001889106',  # ALPHATIME ACQUISITION CORP
-    'SSUNF': '0001869858',  # SIGNA Sports United N.V.
-    'IMPPP': '0001876581',  # Imperial Petroleum Inc./Marshall Islands
-    'SUACU': '0001885461',  # ShoulderUP Technology Acquisition Corp.
-    'SUACW': '0001885461',  # ShoulderUP Technology Acquisition Corp.
-    'LANV-WT': '0001922097',  # Lanvin Group Holdings Ltd
-    'SKGRU': '0001912461',  # SK Growth Opportunities Corp
-    'SKGRW': '0001912461',  # SK Growth Opportunities Corp
-    'BTMWW': '0001901799',  # Bitcoin Depot Inc.
-    'AFRIW': '0001903870',  # Forafric Global PLC
-    'GLSTR': '0001922331',  # Global Star Acquisition Inc.
-    'GLSTU': '0001922331',  # Global Star Acquisition Inc.
-    'GLSTW': '0001922331',  # Global Star Acquisition Inc.
-    'RLNDF': '0001924064',  # RoyaLand Co Ltd.
-    'FORLW': '0001936255',  # Four Leaf Acquisition Corp
-    'FORLU': '0001936255',  # Four Leaf Acquisition Corp
-    'NAMSW': '0001936258',  # NewAmsterdam Pharma Co N.V.
-    'OCSAW': '0001953530',  # Oculis Holding AG
-    'SMXWW': '0001940674',  # SMX (Security Matters) Public Ltd Co
-    'LVROW': '0001945711',  # Lavoro Ltd
-    'ZAPPW': '0001955104',  # Zapp Electric Vehicles Group Ltd
-    'EXTOY': '0001957146',  # Almacenes Exito S.A.
-    'ITOR': '0001852536',  # Intorio, Corp.
-    'RNWWW': '0001848763',  # ReNew Energy Global plc
-    'DJTWW': '0001849635',  # Trump Media & Technology Group Corp.
-    'APOS': '0001858681',  # Apollo Global Management, Inc.
-    'GRABW': '0001855612',  # Grab Holdings Ltd
-    'IVCUF': '0001857410',  # Investcorp Europe Acquisition Corp I
-    'IVCWF': '0001857410',  # Investcorp Europe Acquisition Corp I
-    'NVAWW': '0001852551',  # Nova Minerals Ltd
-    'NVAAF': '0001852551',  # Nova Minerals Ltd
-    'WINVR': '0001854463',  # WinVest Acquisition Corp.
-    'WINVU': '0001854463',  # WinVest Acquisition Corp.
-    'WINVW': '0001854463',  # WinVest Acquisition Corp.
-    'NRSNW': '0001875091',  # NeuroSense Therapeutics Ltd.
-    'CDIOW': '0001870144',  # Cardio Diagnostics Holdings, Inc.
-    'ANGHW': '0001871983',  # Anghami Inc
-    'MIBE': '0001872066',  # MIAMI BREEZE CAR CARE INC
-    'ADSEW': '0001879248',  # Ads-Tec Energy Public Ltd Co
-    'TCRG': '0001879270',  # Cannaisseur Group Inc.
-    'ASCWF': '0001876716',  # ASPAC II Acquisition Corp.
-    'ASCRF': '0001876716',  # ASPAC II Acquisition Corp.
-    'ASUUF': '0001876716',  # ASPAC II Acquisition Corp.
-    'FGIWW': '0001864943',  # FGI Industries Ltd.
-    'GGAWF': '0001865697',  # NeuroMind AI Corp.
-    'GGAUF': '0001865697',  # NeuroMind AI Corp.
-    'BTSGU': '0001865782',  # BrightSpring Health Services, Inc.
-    'RCFUF': '0001870143',  # Perception Capital Corp. IV
-    'RCFWF': '0001870143',  # Perception Capital Corp. IV
-    'CDTTW': '0001896212',  # CONDUIT PHARMACEUTICALS INC.
-    'AIMAU': '0001903464',  # Aimfinity Investment Corp. I
-    'AIMAW': '0001903464',  # Aimfinity Investment Corp. I
-    'AIMBU': '0001903464',  # Aimfinity Investment Corp. I
-    'PERF-WT': '0001899830',  # Perfect Corp.
-    'YOTAU': '0001907730',  # Yotta Acquisition Corp
-    'YOTAW': '0001907730',  # Yotta Acquisition Corp
-    'TPGXL': '0001880661',  # TPG Inc.
-    'DHAIW': '0001883788',  # DIH HOLDING US, INC.
-    'MSSAR': '0001882464',  # Metal Sky Star Acquisition Corp
-    'MSSAU': '0001882464',  # Metal Sky Star Acquisition Corp
-    'MSSAW': '0001882464',  # Metal Sky Star Acquisition Corp
-    'GBBKR': '0001894951',  # Global Blockchain Acquisition Corp.
-    'GBBKW': '0001894951',  # Global Blockchain Acquisition Corp.
-    'VMCAU': '0001892747',  # Valuence Merger Corp. I
-    'VMCAW': '0001892747',  # Valuence Merger Corp. I
-    'FLDDW': '0001889123',  # FTAC Emerald Acquisition Corp.
-    'FLDDU': '0001889123',  # FTAC Emerald Acquisition Corp.
-    'SLND-WT': '0001883814',  # Southland Holdings, Inc.
-    'RAJAF': '0001885680',  # Cordyceps Sunshine Biotech Holdings Co., Ltd.
-    'NMHIW': '0001947861',  # Nature's Miracle Holding Inc.
-    'HSPOR': '0001946021',  # Horizon Space Acquisition I Corp.
-    'HSPOU': '0001946021',  # Horizon Space Acquisition I Corp.
-    'HSPOW': '0001946021',  # Horizon Space Acquisition I Corp.
-    'BAERW': '0001941536',  # Bridger Aerospace Group Holdings, Inc.
-    'KMFG': '0001935033',  # KEEMO Fashion Group Ltd
-    'AMBI-WT': '0001937441',  # Ambipar Emergency Response
-    'YOTAR': '0001907730',  # Yotta Acquisition Corp
-    'CNCKW': '0001913847',  # Coincheck Group N.V.
-    'SBCWW': '0001930313',  # SBC Medical Group Holdings Inc
-    'TBMCR': '0001934945',  # Trailblazer Merger Corp I
-    'SPMA': '0001930147',  # Sound Point Meridian Capital, Inc.
-    'ESHAR': '0001918661',  # ESH Acquisition Corp.
-    'PSA-PR': '0001393311',  # Public Storage
-    'PSA-PS': '0001393311',  # Public Storage
-    'PSA-PL': '0001393311',  # Public Storage
-    'PSA-PM': '0001393311',  # Public Storage
-    'PSA-PN': '0001393311',  # Public Storage
-    'PSA-PO': '0001393311',  # Public Storage
-    'PSA-PP': '0001393311',  # Public Storage
-    'PSA-PQ': '0001393311',  # Public Storage
-    'PSA-PF': '0001393311',  # Public Storage
-    'PSA-PG': '0001393311',  # Public Storage
-    'PSA-PI': '0001393311',  # Public Storage
-    'PSA-PJ': '0001393311',  # Public Storage
-    'CODI-PC': '0001345126',  # Compass Diversified Holdings
-    'BWBBP': '0001341317',  # Bridgewater Bancshares Inc
-    'DRH-PA': '0001298946',  # DiamondRock Hospitality Co
-    'NBRWF': '0001163739',  # NABORS INDUSTRIES LTD
-    'TCEYF': '0001232384',  # TC ENERGY CORP
-    'TRPPF': '0001232384',  # TC ENERGY CORP
-    'TRPEF': '0001232384',  # TC ENERGY CORP
-    'TCENF': '0001232384',  # TC ENERGY CORP
-    'TCNCF': '0001232384',  # TC ENERGY CORP
-    'TRPRF': '0001232384',  # TC ENERGY CORP
-    'NCPLW': '0001414767',  # Netcapital Inc.
-    'PNFPP': '0001115055',  # PINNACLE FINANCIAL PARTNERS INC
-    'ARR-PC': '0001428205',  # Armour Residential REIT, Inc.
-    'GLADZ': '0001143513',  # GLADSTONE CAPITAL CORP
-    'DEENF': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'ADZCF': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'OLOXF': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'DGP': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'DGZ': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'DZZ': '0001159508',  # DEUTSCHE BANK AKTIENGESELLSCHAFT
-    'BXNCP': '0001372612',  # BOX INC
-    'GRBK-PA': '0001373670',  # Green Brick Partners, Inc.
-    'IVDAW': '0001397183',  # Iveda Solutions, Inc.
-    'HROWL': '0001360214',  # HARROW, INC.
-    'HROWM': '0001360214',  # HARROW, INC.
-    'TOGIW': '0001349706',  # TurnOnGreen, Inc.
-    'TFINP': '0001539638',  # Triumph Financial, Inc.
-    'MBUMF': '0001534281',  # Mabuchi Motor Co., Ltd./ADR
-    'NIOBW': '0001512228',  # NIOCORP DEVELOPMENTS LTD
-    'CGABL': '0001527166',  # Carlyle Group Inc.
-    'RCD': '0001527590',  # Ready Capital Corp
-    'RCB': '0001527590',  # Ready Capital Corp
-    'RCC': '0001527590',  # Ready Capital Corp
-    'RC-PC': '0001527590',  # Ready Capital Corp
-    'RC-PE': '0001527590',  # Ready Capital Corp
-    'NEWTG': '0001587987',  # NewtekOne, Inc.
-    'NEWTH': '0001587987',  # NewtekOne, Inc.
-    'WYTC': '0001560143',  # WYTEC INTERNATIONAL INC
-    'TIPLX': '0001551047',  # Bluerock Total Income (plus) Real Estate Fund
-    'OXLCL': '0001495222',  # Oxford Lane Capital Corp.
-    'OXLCN': '0001495222',  # Oxford Lane Capital Corp.
-    'OXLCI': '0001495222',  # Oxford Lane Capital Corp.
-    'OXLCP': '0001495222',  # Oxford Lane Capital Corp.
-    'OXLCZ': '0001495222',  # Oxford Lane Capital Corp.
-    'CIVII': '0001509589',  # CIVITAS RESOURCES, INC.
-    'CIVIW': '0001509589',  # CIVITAS RESOURCES, INC.
-    'EP-PC': '0001506307',  # KINDER MORGAN, INC.
-    'ACP-PA': '0001503290',  # abrdn Income Credit Strategies Fund
-    'GNT-PA': '0001438893',  # GAMCO Natural Resources, Gold & Income Trust
-    'PEB-PG': '0001474098',  # Pebblebrook Hotel Trust
-    'PEB-PH': '0001474098',  # Pebblebrook Hotel Trust
-    'HSCSW': '0001468492',  # HeartSciences Inc.
-    'CPTNW': '0001498233',  # Cepton, Inc.
-    'MAJI': '0001492448',  # GRN Holding Corp
-    'CEADW': '0001482541',  # CEA Industries Inc.
-    'PMT-PC': '0001464423',  # PennyMac Mortgage Investment Trust
-    'JTGLF': '0001472033',  # Citibank,N.A./ADR
-    'PMTU': '0001464423',  # PennyMac Mortgage Investment Trust
-    'VODAF': '0001468608',  # Vodacom Group Ltd / ADR
-    'YMHAY': '0001447100',  # Yamaha Motor Co., Ltd.
-    'CIMO': '0001409493',  # CHIMERA INVESTMENT CORP
-    'CIMN': '0001409493',  # CHIMERA INVESTMENT CORP
-    'BDRY': '0001610940',  # Amplify Commodity Trust
-    'BWET': '0001610940',  # Amplify Commodity Trust
-    'NEWTZ': '0001587987',  # NewtekOne, Inc.
-    'CUYTF': '0001437153',  # Colruyt SA
-    'ODVWZ': '0001431852',  # Osisko Development Corp.
-    'BBLGW': '0001419554',  # Bone Biologics Corp
-    'UWMC-WT': '0001783398',  # UWM Holdings Corp
-    'CURIW': '0001776909',  # CuriosityStream Inc.
-    'CMXWQ': '0001813914',  # CareMax, Inc.
-    'FOXOW': '0001812360',  # FOXO TECHNOLOGIES INC.
-    'MKFGW': '0001816613',  # Markforged Holding Corp
-    'GB-WT': '0001799983',  # Global Blue Group Holding AG
-    'AEVA-WT': '0001789029',  # Aeva Technologies, Inc.
-    'CNROX': '0001737936',  # City National Rochdale Strategic Credit Fund
-    'TMEF': '0001726079',  # Tipmefast, Inc.
-    'PMFAX': '0001723701',  # PIMCO Flexible Municipal Income Fund
-    'KARX': '0001729637',  # Karbon-X Corp.
-    'XALCX': '0001729678',  # BNY Mellon Alcentra Global Multi-Strategy Credit Fund, Inc.
-    'RVSNW': '0001743905',  # Rail Vision Ltd.
-    'GOEVW': '0001750153',  # Canoo Inc.
-    'NEOVW': '0001748137',  # NeoVolta Inc.
-    'BALY-T': '0001747079',  # Bally's Corp
-    'SNAXW': '0001691936',  # STRYVE FOODS, INC.
-    'OPP-PA': '0001678130',  # RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.
-    'OPP-PB': '0001678130',  # RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.
-    'DBRG-PH': '0001679688',  # DigitalBridge Group, Inc.
-    'DBRG-PI': '0001679688',  # DigitalBridge Group, Inc.
-    'DBRG-PJ': '0001679688',  # DigitalBridge Group, Inc.
-    'ENSCW': '0001716947',  # Ensysce Biosciences, Inc.
-    'OCCIM': '0001716951',  # OFS Credit Company, Inc.
-    'OCCIN': '0001716951',  # OFS Credit Company, Inc.
-    'OCCIO': '0001716951',  # OFS Credit Company, Inc.
-    'VGASW': '0001841425',  # Verde Clean Fuels, Inc.
-    'GRDV': '0001761534',  # Golden Royal Development Inc.
-    'LVCE': '0001762400',  # LiveCare, Inc.
-    'ANKM': '0001781629',  # Ankam, Inc.
-    'AVPTW': '0001777921',  # AvePoint, Inc.
-    'RBOT-WT': '0001812173',  # Vicarious Surgical Inc.
-    'EDBLW': '0001809750',  # Edible Garden AG Inc
-    'REVBW': '0001810560',  # REVELATION BIOSCIENCES, INC.
-    'ORGNW': '0001802457',  # Origin Materials, Inc.
-    'KCLHF': '0001795589',  # Kingsoft Cloud Holdings Ltd
-    'SVIX': '0001793497',  # VS Trust
-    'UVIX': '0001793497',  # VS Trust
-    'MSPRW': '0001802450',  # MSP Recovery, Inc.
-    'MSPRZ': '0001802450',  # MSP Recovery, Inc.
-    'BTCTW': '0001796514',  # BTC Digital Ltd.
-    'BYNOU': '0001801417',  # byNordic Acquisition Corp
-    'BYNOW': '0001801417',  # byNordic Acquisition Corp
-    'BBAI-WT': '0001836981',  # BigBear.ai Holdings, Inc.
-    'SABSW': '0001833214',  # SAB Biotherapeutics, Inc.
-    'LOCLW': '0001840780',  # Local Bounti Corporation/DE
-    'AONCW': '0001839998',  # American Oncology Network, Inc.
-    'CORZW': '0001839341',  # Core Scientific, Inc./tx
-    'CORZZ': '0001839341',  # Core Scientific, Inc./tx
-    'CORZR': '0001839341',  # Core Scientific, Inc./tx
-    'DAVEW': '0001841408',  # Dave Inc./DE
-    'HCVIU': '0001842937',  # Hennessy Capital Investment Corp. VI
-    'HCVIW': '0001842937',  # Hennessy Capital Investment Corp. VI
-    'NOTE-WT': '0001823466',  # FiscalNote Holdings, Inc.
-    'ACHR-WT': '0001824502',  # Archer Aviation Inc.
-    'HIPOW': '0001828105',  # Hippo Holdings Inc.
-    'RUMBW': '0001830081',  # Rumble Inc.
-    'WGSWW': '0001818331',  # GeneDx Holdings Corp.
-    'XOSWW': '0001819493',  # Xos, Inc.
-    'WSUPW': '0001819516',  # Wheels Up Experience Inc.
-    'ISPOW': '0001820566',  # Inspirato Inc
-    'SSST': '0001585389',  # SmartStop Self Storage REIT, Inc.
-    'SRRIX': '0001581005',  # Stone Ridge Trust II
-    'CCLDO': '0001582982',  # CareCloud, Inc.
-    'CCLDP': '0001582982',  # CareCloud, Inc.
-    'PETVW': '0001512922',  # PetVivo Holdings, Inc.
-    'UNOV': '0001538495',  # Earth Science Tech, Inc.
-    'MSCF': '0001535778',  # MSC INCOME FUND, INC.
-    'TRTX-PC': '0001630472',  # TPG RE Finance Trust, Inc.
-    'BHLD': '0001619174',  # BLOCKHOLD CAPITAL CORP
-    'FCRX': '0001633336',  # Crescent Capital BDC, Inc.
-    'YCBD-PA': '0001644903',  # cbdMD, Inc.
-    'MDV-PA': '0001645873',  # MODIV INDUSTRIAL, INC.
-    'GIPRW': '0001651721',  # GENERATION INCOME PROPERTIES, INC.
-    'PXSAW': '0001640043',  # Pyxis Tankers Inc.
-    'KREF-PA': '0001631596',  # KKR Real Estate Finance Trust Inc.
-    'OPP-PC': '0001678130',  # RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.
-    'MDRRP': '0001654595',  # Medalist Diversified REIT, Inc.
-    'NSA-PB': '0001618563',  # National Storage Affiliates Trust
-    'DTEAF': '0001627606',  # DAVIDsTEA Inc.
-    'AMJT': '0001593773',  # AMJ Global Technology
-    'CEDAX': '0001722837',  # BlueBay Destra International Event-Driven Credit Fund
-    'NICHX': '0001736510',  # Variant Alternative Income Fund
-    'FTCHQ': '0001740915',  # Farfetch Ltd
-    'TCMEF': '0001744676',  # Tencent Music Entertainment Group
-    'EIOAX': '0001751156',  # ELLINGTON INCOME OPPORTUNITIES FUND
-    'TRSO': '0001758699',  # TRANSUITE.ORG INC.
-    'EICB': '0001754836',  # Eagle Point Income Co Inc.
-    'EICC': '0001754836',  # Eagle Point Income Co Inc.
-    'EICA': '0001754836',  # Eagle Point Income Co Inc.
-    'ATGAF': '0001695519',  # AltaGas Ltd.
-    'ATGPF': '0001695519',  # AltaGas Ltd.
-    'HFRO-PA': '0001710680',  # HIGHLAND OPPORTUNITIES & INCOME FUND
-    'CDAWF': '0001851909',  # Compass Digital Acquisition Corp.
-    'CDAUF': '0001851909',  # Compass Digital Acquisition Corp.
-    'CNDAW': '0001851959',  # Concord Acquisition Corp II
-    'CNDAU': '0001851959',  # Concord Acquisition Corp II
-    'KITTW': '0001849820',  # Nauticus Robotics, Inc.
-    'CLOER': '0001849058',  # Clover Leaf Capital Corp.
-    'CLOEU': '0001849058',  # Clover Leaf Capital Corp.
-    'DRMAW': '0001853816',  # Dermata Therapeutics, Inc.
-    'HMELF': '0001853630',  # Hold Me Ltd
-    'BFRIW': '0001858685',  # Biofrontera Inc.
-    'TVGNW': '0001860871',  # Tevogen Bio Holdings Inc.
-    'RRAWF': '0001860879',  # Rigel Resource Acquisition Corp.
-    'RRAUF': '0001860879',  # Rigel Resource Acquisition Corp.
-    'BRACR': '0001865120',  # Broad Capital Acquisition Corp
-    'BRACU': '0001865120',  # Broad Capital Acquisition Corp
-    'LATGF': '0001868269',  # Chenghe Acquisition I Co.
-    'LATGU': '0001868269',  # Chenghe Acquisition I Co.
-    'TCBPW': '0001872812',  # TC BioPharm (Holdings) plc
-    'BRKHU': '0001871638',  # BurTech Acquisition Corp.
-    'BRKHW': '0001871638',  # BurTech Acquisition Corp.
-    'MTEKW': '0001872964',  # Maris Tech Ltd.
-    'SATLW': '0001874315',  # Satellogic Inc.
-    'OFSWF': '0001875931',  # Carbon Streaming Corp
-    'ASTLW': '0001860805',  # Algoma Steel Group Inc.
-    'MSAIW': '0001863990',  # MultiSensor AI Holdings, Inc.
-    'WTMAR': '0001866226',  # Welsbach Technology Metals Acquisition Corp.
-    'WTMAU': '0001866226',  # Welsbach Technology Metals Acquisition Corp.
-    'OPTXW': '0001866816',  # SYNTEC OPTICS HOLDINGS, INC.
-    'IGTAR': '0001866838',  # Inception Growth Acquisition Ltd
-    'IGTAU': '0001866838',  # Inception Growth Acquisition Ltd
-    'IGTAW': '0001866838',  # Inception Growth Acquisition Ltd
-    'XBPEW': '0001839530',  # XBP Europe Holdings, Inc.
-    'DMXCF': '0001839586',  # District Metals Corp.
-    'GETRW': '0001839608',  # Getaround, Inc
-    'BLACR': '0001840425',  # Bellevue Life Sciences Acquisition Corp.
-    'BLACU': '0001840425',  # Bellevue Life Sciences Acquisition Corp.
-    'BLACW': '0001840425',  # Bellevue Life Sciences Acquisition Corp.
-    'HOLOW': '0001841209',  # MicroCloud Hologram Inc.
-    'TBLAW': '0001840502',  # Taboola.com Ltd.
-    'KTTAW': '0001841330',  # Pasithea Therapeutics Corp.
-    'CTCXW': '0001842939',  # Carmell Corp
-    'LIDRW': '0001818644',  # AEye, Inc.
-    'MYPSW': '0001823878',  # PLAYSTUDIOS, Inc.
-    'DISTR': '0001818605',  # Distoken Acquisition Corp
-    'DISTW': '0001818605',  # Distoken Acquisition Corp
-    'BODYW': '0001826889',  # Beachbody Company, Inc.
-    'FOACW': '0001828937',  # Finance of America Companies Inc.
-    'SDSTW': '0001831979',  # Stardust Power Inc.
-    'LIANY': '0001831283',  # LianBio
-    'JWSWF': '0001831359',  # Jaws Mustang Acquisition Corp
-    'JWSUF': '0001831359',  # Jaws Mustang Acquisition Corp
-    'QBTS-WT': '0001907982',  # D-Wave Quantum Inc.
-    'CRGOW': '0001927719',  # Freightos Ltd
-    'FMSTW': '0001935418',  # Foremost Clean Energy Ltd.
-    'GREEL': '0001844971',  # Greenidge Generation Holdings Inc.
-    'FRLAU': '0001849294',  # Fortune Rise Acquisition Corp
-    'FRLAW': '0001849294',  # Fortune Rise Acquisition Corp
-    'TGAWF': '0001847355',  # Target Global Acquisition I Corp.
-    'PWUPU': '0001847345',  # PowerUp Acquisition Corp.
-    'TGAUF': '0001847355',  # Target Global Acquisition I Corp.
-    'PWUPW': '0001847345',  # PowerUp Acquisition Corp.
-    'AOGOU': '0001881741',  # Arogo Capital Acquisition Corp.
-    'AOGOW': '0001881741',  # Arogo Capital Acquisition Corp.
-    'WLSS': '0001887912',  # Welsis Corp.
-    'CCIRU': '0001894176',  # Cohen Circle Acquisition Corp. I
-    'CCIRW': '0001894176',  # Cohen Circle Acquisition Corp. I
-    'GLACR': '0001897971',  # Global Lights Acquisition Corp
-    'PPYAU': '0001894057',  # Papaya Growth Opportunity Corp. I
-    'PPYAW': '0001894057',  # Papaya Growth Opportunity Corp. I
-    'FTIIU': '0001889450',  # FutureTech II Acquisition Corp.
-    'FTIIW': '0001889450',  # FutureTech II Acquisition Corp.
-    'CRBD': '0001889539',  # Corebridge Financial, Inc.
-    'HUDAR': '0001853047',  # Hudson Acquisition I Corp.
-    'HUDAU': '0001853047',  # Hudson Acquisition I Corp.
-    'AERTW': '0001853044',  # Aeries Technology, Inc.
-    'GCTS-WT': '0001851961',  # GCT Semiconductor Holding, Inc.
-    'AEAEU': '0001852016',  # AltEnergy Acquisition Corp
-    'AEAEW': '0001852016',  # AltEnergy Acquisition Corp
-    'IXQUF': '0001852019',  # IX Acquisition Corp.
-    'IXQWF': '0001852019',  # IX Acquisition Corp.
-    'USTWF': '0001860514',  # Roth CH Acquisition Co.
-    'PORTU': '0001865200',  # Southport Acquisition Corp
-    'ECXWW': '0001861974',  # ECARX Holdings Inc.
-    'SOARW': '0001853070',  # Volato Group, Inc.
-    'GDSTR': '0001858007',  # Goldenstone Acquisition Ltd.
-    'GDSTU': '0001858007',  # Goldenstone Acquisition Ltd.
-    'GDSTW': '0001858007',  # Goldenstone Acquisition Ltd.
-    'WELWF': '0001877557',  # Integrated Wellness Acquisition Corp
-    'WELUF': '0001877557',  # Integrated Wellness Acquisition Corp
-    'PRENW': '0001876431',  # Prenetics Global Ltd
-    'CEROW': '0001870404',  # CERO THERAPEUTICS HOLDINGS, INC.
-    'PORTW': '0001865200',  # Southport Acquisition Corp
-    'JFBRW': '0001885408',  # Jeffs' Brands Ltd
-    'KVACU': '0001889983',  # Keen Vision Acquisition Corp.
-    'KVACW': '0001889983',  # Keen Vision Acquisition Corp.
-    'ATEKW': '0001882198',  # Athena Technology Acquisition Corp. II
-    'BFQUF': '0001880441',  # Battery Future Acquisition Corp.
-    'BFQWF': '0001880441',  # Battery Future Acquisition Corp.
-    'JACS-UN': '0002039058',  # Jackson Acquisition Co II
-    'RAINW': '0002028293',  # Rain Enhancement Technologies Holdco, Inc.
-    'NEHCW': '0002028336',  # NEW ERA HELIUM INC.
-    'ABLVW': '0001957489',  # Able View Global Inc.
-    'ESGLW': '0001957538',  # ESGL Holdings Ltd
-    'NCNWF': '0001964021',  # noco-noco Inc.
-    'CCGWW': '0001965473',  # Cheche Group Inc.
-    'ABVEW': '0001979484',  # Above Food Ingredients Inc.
-    'NUVWQ': '0001990145',  # Holdco Nuvo Group D.G Ltd.
-    'SIMAW': '0002014982',  # SIM Acquisition Corp. I
-    'SIMAU': '0002014982',  # SIM Acquisition Corp. I
-    'CAPNU': '0002024203',  # Cayson Acquisition Corp
-    'CAPNR': '0002024203',  # Cayson Acquisition Corp
-    'NTWOW': '0002028027',  # Newbury Street II Acquisition Corp
-    'NTWOU': '0002028027',  # Newbury Street II Acquisition Corp
-    'RPDL': '0001910975',  # Rapid Line Inc.
-    'MLECW': '0001937737',  # Moolec Science SA
-    'GLTK': '0001938338',  # GlobalTech Corp
-    'GRAF-WT': '0001897463',  # Graf Global Corp.
-    'IROHR': '0001901203',  # Iron Horse Acquisitions Corp.
-    'IROHW': '0001901203',  # Iron Horse Acquisitions Corp.
-    'IROHU': '0001901203',  # Iron Horse Acquisitions Corp.
-    'BAKR': '0001904616',  # Baker Global Asset Management Inc.
-    'CRMLW': '0001951089',  # Critical Metals Corp.
-    'ALUR-WT': '0001964979',  # ALLURION TECHNOLOGIES, INC.
-    'NVNIW': '0001965143',  # Nvni Group Ltd
-    'NXNT': '0001976663',  # Nexscient, Inc.
-    'LSBPW': '0001946399',  # LakeShore Biopharma Co., Ltd.
-    'ALMP': '0001956237',  # Almco Plumbing Inc
-    'JAGL': '0001951051',  # JAAG Enterprises Ltd.
-    'DYCQU': '0001944212',  # DT Cloud Acquisition Corp
-    'DYCQR': '0001944212',  # DT Cloud Acquisition Corp
-    'CAPTW': '0001967478',  # Captivision Inc.
-    'PBMWW': '0001985062',  # PSYENCE BIOMEDICAL LTD.
-    'TBNRL': '0001997652',  # Tamboran Resources Corp
-    'VACHU': '0002006815',  # Voyager Acquisition Corp./Cayman Islands
-    'VACHW': '0002006815',  # Voyager Acquisition Corp./Cayman Islands
-    'FVNNU': '0002010653',  # Future Vision II Acquisition Corp.
-    'FVNNR': '0002010653',  # Future Vision II Acquisition Corp.
-    'BSIIW': '0002025065',  # Black Spade Acquisition II Co
-    'BSIIU': '0002025065',  # Black Spade Acquisition II Co
-    'YHNAR': '0002020987',  # YHN Acquisition I Ltd
-    'YHNAU': '0002020987',  # YHN Acquisition I Ltd
-    'RFAIU': '0002012807',  # RF Acquisition Corp II
-    'RFAIR': '0002012807',  # RF Acquisition Corp II
-    'CHEB-WT': '0002016420',  # Chenghe Acquisition II Co.
-    'CHEB-UN': '0002016420',  # Chenghe Acquisition II Co.
-    'POLEU': '0002025341',  # Andretti Acquisition Corp. II
-    'POLEW': '0002025341',  # Andretti Acquisition Corp. II
-    'VCICU': '0002025396',  # Vine Hill Capital Investment Corp.
-    'VCICW': '0002025396',  # Vine Hill Capital Investment Corp.
-    'OACCU': '0002029769',  # Oaktree Acquisition Corp. III Life Sciences
-    'OACCW': '0002029769',  # Oaktree Acquisition Corp. III Life Sciences
-    'HWM-P': '0000004281',  # Howmet Aerospace Inc.
-    'SENEM': '0000088948',  # Seneca Foods Corp
-    'SENEL': '0000088948',  # Seneca Foods Corp
-    'MOVAA': '0000072573',  # MOVADO GROUP INC
-    'CSWCZ': '0000017313',  # CAPITAL SOUTHWEST CORP
-    'BA-PA': '0000012927',  # BOEING CO
-    'AMJB': '0000019617',  # JPMORGAN CHASE & CO
-    'JPM-PJ': '0000019617',  # JPMORGAN CHASE & CO
-    'JPM-PK': '0000019617',  # JPMORGAN CHASE & CO
-    'JPM-PL': '0000019617',  # JPMORGAN CHASE & CO
-    'JPM-PM': '0000019617',  # JPMORGAN CHASE & CO
-    'UZD': '0000821130',  # UNITED STATES CELLULAR CORP
-    'UZE': '0000821130',  # UNITED STATES CELLULAR CORP
-    'UZF': '0000821130',  # UNITED STATES CELLULAR CORP
-    'FRBKQ': '0000834285',  # REPUBLIC FIRST BANCORP INC
-    'DX-PC': '0000826675',  # DYNEX CAPITAL INC
-    'GSCE': '0000886982',  # GOLDMAN SACHS GROUP INC
-    'HWCPZ': '0000750577',  # HANCOCK WHITNEY CORP
-    'GL-PD': '0000320335',  # GLOBE LIFE INC.
-    'VLYPN': '0000714310',  # VALLEY NATIONAL BANCORP
-    'CNOBP': '0000712771',  # ConnectOne Bancorp, Inc.
-    'STRRP': '0000707388',  # STAR EQUITY HOLDINGS, INC.
-    'EBCOF': '0000354518',  # EBARA CORP /ADR/
-    'PCG-PX': '0001004980',  # PG&E Corp
-    'PTIXW': '0001022899',  # Protagenic Therapeutics, Inc.\new
-    'APCXW': '0001070050',  # AppTech Payments Corp.
-    'CYTHW': '0000922247',  # Cyclo Therapeutics, Inc.
-    'HTLFP': '0000920112',  # HEARTLAND FINANCIAL USA INC
-    'XXAAU': '0000931755',  # AEI INCOME & GROWTH FUND XXI LTD PARTNERSHIP
-    'MBNKP': '0001000209',  # MEDALLION FINANCIAL CORP
-    'TDBKF': '0000947263',  # TORONTO DOMINION BANK
-    'TDOMF': '0000947263',  # TORONTO DOMINION BANK
-    'TDOPF': '0000947263',  # TORONTO DOMINION BANK
-    'TDBCP': '0000947263',  # TORONTO DOMINION BANK
-    'RZC': '0000898174',  # REINSURANCE GROUP OF AMERICA INC
-    'FLG-PU': '0000910073',  # FLAGSTAR FINANCIAL, INC.
-    'FLG-PA': '0000910073',  # FLAGSTAR FINANCIAL, INC.
-    'FRSPF': '0001490078',  # First Phosphate Corp.
-    'CJRCF': '0001484515',  # China Resources Cement Holdings Limited/ADR/
-    'KUSA': '0001467845',  # Kashin, Inc.
-    'RMHI': '0001452804',  # Retrieve Medical Holdings, Inc.
-    'NIXXW': '0001462223',  # Nixxy, Inc.
-    'NZEOY': '0001445654',  # New Zealand Oil & Gas Ltd/ADR
-    'UUGWF': '0001440130',  # United Utilities Group plc
-    'IHETW': '0001400891',  # iHeartMedia, Inc.
-    'FGBIP': '0001408534',  # First Guaranty Bancshares, Inc.
-    'ICCRW': '0001408057',  # iCoreConnect Inc.
-    'ICNP': '0001408057',  # iCoreConnect Inc.
-    'DTSTW': '0001419951',  # Data Storage Corp
-    'DSX-WT': '0001318885',  # DIANA SHIPPING INC.
-    'EQH-PA': '0001333986',  # Equitable Holdings, Inc.
-    'EQH-PC': '0001333986',  # Equitable Holdings, Inc.
-    'GLP-PB': '0001323468',  # GLOBAL PARTNERS LP
-    'NMPRY': '0001333172',  # Navios Maritime Holdings Inc.
-    'NMPGY': '0001333172',  # Navios Maritime Holdings Inc.
-    'AIZN': '0001267238',  # ASSURANT, INC.
-    'ZNOGW': '0001131312',  # ZION OIL & GAS INC
-    'SNCRL': '0001131554',  # SYNCHRONOSS TECHNOLOGIES INC
-    'BANC-PF': '0001169770',  # BANC OF CALIFORNIA, INC.
-    'EMRJF': '0001127248',  # EMERA INC
-    'EMICF': '0001127248',  # EMERA INC
-    'EMRPF': '0001127248',  # EMERA INC
-    'ARGD': '0001091748',  # Argo Group International Holdings, Inc.
-    'ARGO-PA': '0001091748',  # Argo Group International Holdings, Inc.
-    'INVUP': '0000862651',  # Investview, Inc.
-    'NXGLW': '0001468929',  # NEXGEL, INC.
-    'XCAPX': '0001467631',  # ACAP Strategic Fund
-    'CUBB': '0001488813',  # Customers Bancorp, Inc.
-    'UNTCW': '0000798949',  # UNIT CORP
-    'SOCGM': '0000092108',  # SOUTHERN CALIFORNIA GAS CO
-    'VAL-WT': '0000314808',  # Valaris Ltd
-    'LTSV': '0001619312',  # Lightstone Value Plus REIT IV, Inc.
-    'VIASP': '0001606268',  # Via Renewables, Inc.
-    'BAFBF': '0001506721',  # Balfour Beatty plc/ADR
-    'BLFBY': '0001506721',  # Balfour Beatty plc/ADR
-    'CTTRF': '0001520504',  # Controladora Vuela Compania de Aviacion, S.A.B. de C.V.
-    'AAMCF': '0001555074',  # Altisource Asset Management Corp
-    'SBEV-WT': '0001553788',  # SPLASH BEVERAGE GROUP, INC.
-    'MPLXP': '0001552000',  # MPLX LP
-    'LGNZZ': '0000886163',  # LIGAND PHARMACEUTICALS INC
-    'LGNDZ': '0000886163',  # LIGAND PHARMACEUTICALS INC
-    'LGNXZ': '0000886163',  # LIGAND PHARMACEUTICALS INC
-    'LGNYZ': '0000886163',  # LIGAND PHARMACEUTICALS INC
-    'CLSKW': '0000827876',  # CLEANSPARK, INC.
-    'ALL-PI': '0000899051',  # ALLSTATE CORP
-    'ALL-PJ': '0000899051',  # ALLSTATE CORP
-    'SOJD': '0000092122',  # SOUTHERN CO
-    'SOJE': '0000092122',  # SOUTHERN CO
-    'HAWLI': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'HAWLL': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'HAWLM': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'HAWEM': '0000046207',  # HAWAIIAN ELECTRIC CO INC
-    'ASB-PF': '0000007789',  # ASSOCIATED BANC-CORP
-    'WRB-PF': '0000011544',  # BERKLEY W R CORP
-    'WRB-PG': '0000011544',  # BERKLEY W R CORP
-    'WRB-PH': '0000011544',  # BERKLEY W R CORP
-    'ASBA': '0000007789',  # ASSOCIATED BANC-CORP
-    'CELG-RI': '0000014272',  # BRISTOL MYERS SQUIBB CO
-    'NSARO': '0000013372',  # NSTAR ELECTRIC CO
-    'NSARP': '0000013372',  # NSTAR ELECTRIC CO
-    'AILIO': '0000018654',  # Ameren Illinois Co
-    'AILIP': '0000018654',  # Ameren Illinois Co
-    'WFC-PD': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'HBANP': '0000049196',  # HUNTINGTON BANCSHARES INC /MD/
-    'HBANL': '0000049196',  # HUNTINGTON BANCSHARES INC /MD/
-    'HBANM': '0000049196',  # HUNTINGTON BANCSHARES INC /MD/
-    'HACBF': '0000793742',  # HACHIJUNI BANK LTD
-    'WFC-PZ': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'WFCNP': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'WFC-PA': '0000072971',  # WELLS FARGO & COMPANY/MN
-    'SIGIP': '0000230557',  # SELECTIVE INSURANCE GROUP INC
-    'ATMP': '0000312070',  # BARCLAYS BANK PLC
-    'BWVTF': '0000312070',  # BARCLAYS BANK PLC
-    'COWTF': '0000312070',  # BARCLAYS BANK PLC
-    'DJP': '0000312070',  # BARCLAYS BANK PLC
-    'VXX': '0000312070',  # BARCLAYS BANK PLC
-    'VXZ': '0000312070',  # BARCLAYS BANK PLC
-    'PGMFF': '0000312070',  # BARCLAYS BANK PLC
-    'GRN': '0000312070',  # BARCLAYS BANK PLC
-    'JJCTF': '0000312070',  # BARCLAYS BANK PLC
-    'JJETF': '0000312070',  # BARCLAYS BANK PLC
-    'JJGTF': '0000312070',  # BARCLAYS BANK PLC
-    'OXY-WT': '0000797468',  # OCCIDENTAL PETROLEUM CORP /DE/
-    'MHGUP': '0000808219',  # MERITAGE HOSPITALITY GROUP INC
-    'LAWIL': '0000750004',  # Light & Wonder, Inc.
-    'BANFP': '0000760498',  # BANCFIRST CORP /OK/
-    'BPOPM': '0000763901',  # POPULAR, INC.
-    'FULTP': '0000700564',  # FULTON FINANCIAL CORP
-    'KGCRF': '0000701818',  # KINROSS GOLD CORP
-    'SCHW-PJ': '0000316709',  # SCHWAB CHARLES CORP
-    'KEY-PL': '0000091576',  # KEYCORP /NEW/
-    'TFC-PI': '0000092230',  # TRUIST FINANCIAL CORP
-    'TFC-PO': '0000092230',  # TRUIST FINANCIAL CORP
-    'TFC-PR': '0000092230',  # TRUIST FINANCIAL CORP
-    'DDT': '0000028917',  # DILLARD'S, INC.
-    'SLNHP': '0000064463',  # Soluna Holdings, Inc
-    'KMPB': '0000860748',  # KEMPER Corp
-    'AERGP': '0000879911',  # APPLIED ENERGETICS, INC.
-    'GTLS-PB': '0000892553',  # CHART INDUSTRIES INC
-    'CTLPP': '0000896429',  # CANTALOUPE, INC.
-    'GPUS-PD': '0000896493',  # Hyperscale Data, Inc.
-    'FXFHF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'RNR-PG': '0000913144',  # RENAISSANCERE HOLDINGS LTD
-    'FAXRF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'FFHPF': '0000915191',  # FAIRFAX FINANCIAL HOLDINGS LTD/ CAN
-    'NMPWP': '0001004315',  # NATIONAL GRID PLC
-    'NMKCP': '0001004315',  # NATIONAL GRID PLC
-    'NMKBP': '0001004315',  # NATIONAL GRID PLC
-    'NEWEN': '0001004315',  # NATIONAL GRID PLC
-    'MHNC': '0001412100',  # Maiden Holdings, Ltd.
-    'AGQ': '0001415311',  # ProShares Trust II
-    'BOIL': '0001415311',  # ProShares Trust II
-    'EUO': '0001415311',  # ProShares Trust II
-    'GLL': '0001415311',  # ProShares Trust II
-    'UVXY': '0001415311',  # ProShares Trust II
-    'VIXM': '0001415311',  # ProShares Trust II
-    'VIXY': '0001415311',  # ProShares Trust II
-    'YCL': '0001415311',  # ProShares Trust II
-    'YCS': '0001415311',  # ProShares Trust II
-    'ZSL': '0001415311',  # ProShares Trust II
-    'SCO': '0001415311',  # ProShares Trust II
-    'SVXY': '0001415311',  # ProShares Trust II
-    'UCO': '0001415311',  # ProShares Trust II
-    'UGL': '0001415311',  # ProShares Trust II
-    'ULE': '0001415311',  # ProShares Trust II
-    'KOLD': '0001415311',  # ProShares Trust II
-    'LEXXW': '0001348362',  # Lexaria Bioscience Corp.
-    'NFTM': '0001345865',  # Buildablock Corp.
-    'RGPX': '0001357878',  # REGENEREX PHARMA, INC.
-    'IDKOF': '0001380365',  # IDEMITSU KOSAN CO., LTD
-    'GFSAY': '0001389207',  # Gafisa S.A.
-    'BIPJ': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BRIPF': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BIPH': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BIPI': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BIP-PA': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'BIP-PB': '0001406234',  # Brookfield Infrastructure Partners L.P.
-    'PTNRF': '0001096691',  # PARTNER COMMUNICATIONS CO LTD
-    'TCBIO': '0001077428',  # TEXAS CAPITAL BANCSHARES INC/TX
-    'NXPLW': '0001058307',  # NextPlat Corp
-    'TDS-PU': '0001051512',  # TELEPHONE & DATA SYSTEMS INC /DE/
-    'TDS-PV': '0001051512',  # TELEPHONE & DATA SYSTEMS INC /DE/
-    'ELCPF': '0001039610',  # EDP ENERGIAS DE PORTUGAL SA
-    'HNNAZ': '0001145255',  # HENNESSY ADVISORS INC
-    'GLU-PA': '0001282957',  # GABELLI GLOBAL UTILITY & INCOME TRUST
-    'ET-PI': '0001276187',  # Energy Transfer LP
-    'NYMTL': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'NYMTM': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'OXSQG': '0001259429',  # Oxford Square Capital Corp.
-    'OXSQZ': '0001259429',  # Oxford Square Capital Corp.
-    'NYMTZ': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'NYMTI': '0001273685',  # NEW YORK MORTGAGE TRUST, INC.
-    'QVCC': '0001254699',  # QVC INC
-    'VCRRX': '0001687898',  # Versus Capital Real Assets Fund LLC
-    'FSREI': '0001690536',  # FS Credit Real Estate Income Trust, Inc.
-    'FSREM': '0001690536',  # FS Credit Real Estate Income Trust, Inc.
-    'XFLT-PA': '0001703079',  # XAI Octagon Floating Rate & Alternative Income Trust
-    'BYCBF': '0001706795',  # Barry Callebaut AG/ADR
-    'COBA': '0001727255',  # Chilean Cobalt Corp.
-    'BAZNF': '0001625414',  # Baozun Inc.
-    'ACONW': '0001635077',  # Aclarion, Inc.
-    'BSTT': '0001662972',  # Blackstone Real Estate Income Trust, Inc.
-    'FRTSF': '0001666175',  # Fortis Inc.
-    'FTPSF': '0001666175',  # Fortis Inc.
-    'FORFF': '0001666175',  # Fortis Inc.
-    'FTRSF': '0001666175',  # Fortis Inc.
-    'AIMDW': '0001014763',  # Ainos, Inc.
-    'XAEIU': '0001023458',  # AEI INCOME & GROWTH FUND XXII LTD PARTNERSHIP
-    'ORANY': '0001038143',  # ORANGE
-    'CBDBY': '0001038572',  # BRAZILIAN DISTRIBUTION CO COMPANHIA BRASILEIRA DE DISTR CBD
-    'EFSCP': '0001025835',  # ENTERPRISE FINANCIAL SERVICES CORP
-    'EPR-PC': '0001045450',  # EPR PROPERTIES
-    'EPR-PE': '0001045450',  # EPR PROPERTIES
-    'EPDU': '0001061219',  # ENTERPRISE PRODUCTS PARTNERS L.P.
-    'GGT-PG': '0000921671',  # GABELLI MULTIMEDIA TRUST INC.
-    'BERZ': '0000927971',  # BANK OF MONTREAL /CAN/
-    'FNGO': '0000927971',  # BANK OF MONTREAL /CAN/
-    'FNGS': '0000927971',  # BANK OF MONTREAL /CAN/
-    'WINTW': '0000946486',  # WINDTREE THERAPEUTICS INC /DE/
-    'MGRE': '0001004434',  # AFFILIATED MANAGERS GROUP, INC.
-    'MGR': '0001004434',  # AFFILIATED MANAGERS GROUP, INC.
-    'MGRB': '0001004434',  # AFFILIATED MANAGERS GROUP, INC.
-    'MGRD': '0001004434',  # AFFILIATED MANAGERS GROUP, INC.
-    'BULZ': '0000927971',  # BANK OF MONTREAL /CAN/
-    'DULL': '0000927971',  # BANK OF MONTREAL /CAN/
-    'JETU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'JETD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'CARD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'CARU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'WTID': '0000927971',  # BANK OF MONTREAL /CAN/
-    'WTIU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'OILD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'OILU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'SHNY': '0000927971',  # BANK OF MONTREAL /CAN/
-    'FNGU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'GDXD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'GDXU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'FLYD': '0000927971',  # BANK OF MONTREAL /CAN/
-    'FLYU': '0000927971',  # BANK OF MONTREAL /CAN/
-    'LHTV': '0001296884',  # Lightstone Value Plus REIT I, Inc.
-    'SHO-PH': '0001295810',  # Sunstone Hotel Investors, Inc.
-    'SHO-PI': '0001295810',  # Sunstone Hotel Investors, Inc.
-    'DUKB': '0001326160',  # Duke Energy CORP
-    'ISMCF': '0001332174',  # iShares S&P GSCI Commodity-Indexed Trust
-    'FOSLL': '0000883569',  # Fossil Group, Inc.
-    'FIISO': '0000862831',  # FINANCIAL INSTITUTIONS INC
-    'FIISP': '0000862831',  # FINANCIAL INSTITUTIONS INC
-    'BUCRF': '0001158399',  # Burcon NutraScience Corp
-    'LLOBF': '0001160106',  # Lloyds Banking Group plc
-    'NEMCL': '0001164727',  # NEWMONT Corp /DE/
-    'TRNTF': '0001144800',  # TRANSALTA CORP
-    'TSLTF': '0001144800',  # TRANSALTA CORP
-    'TACPF': '0001144800',  # TRANSALTA CORP
-    'VIRAD': '0001130781',  # NEURALBASE AI LTD.
-    'GDV-PK': '0001260729',  # GABELLI DIVIDEND & INCOME TRUST
-    'RCKTW': '0001281895',  # ROCKET PHARMACEUTICALS, INC.
-    'VRMEW': '0001104038',  # VerifyMe, Inc.
-    'CSDX': '0001106861',  # CS DIAGNOSTICS CORP.
-    'SLFQF': '0001097362',  # SUN LIFE FINANCIAL INC
-    'SLFIF': '0001097362',  # SUN LIFE FINANCIAL INC
-    'SUNFF': '0001097362',  # SUN LIFE FINANCIAL INC
-    'AMUB': '0001114446',  # UBS AG
-    'BDCX': '0001114446',  # UBS AG
-    'BDCZ': '0001114446',  # UBS AG
-    'CEFD': '0001114446',  # UBS AG
-    'UCIB': '0001114446',  # UBS AG
-    'USML': '0001114446',  # UBS AG
-    'SCDL': '0001114446',  # UBS AG
-    'SMHB': '0001114446',  # UBS AG
-    'MVRL': '0001114446',  # UBS AG
-    'PFFL': '0001114446',  # UBS AG
-    'QULL': '0001114446',  # UBS AG
-    'MLPB': '0001114446',  # UBS AG
-    'MLPR': '0001114446',  # UBS AG
-    'MTUL': '0001114446',  # UBS AG
-    'IWDL': '0001114446',  # UBS AG
-    'IWFL': '0001114446',  # UBS AG
-    'IWML': '0001114446',  # UBS AG
-    'HDLB': '0001114446',  # UBS AG
-    'IFED': '0001114446',  # UBS AG
-    'NLY-PI': '0001043219',  # ANNALY CAPITAL MANAGEMENT INC
-    'SQFTP': '0001080657',  # Presidio Property Trust, Inc.
-    'SQFTW': '0001080657',  # Presidio Property Trust, Inc.
-    'MNLCF': '0001086888',  # MANULIFE FINANCIAL CORP
-    'MNQFF': '0001086888',  # MANULIFE FINANCIAL CORP
-    'MNUFF': '0001086888',  # MANULIFE FINANCIAL CORP
-    'CWLXF': '0000831609',  # C21 Investments Inc.
-    'C-PN': '0000831001',  # CITIGROUP INC
-    'AGM-PE': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'AGM-PF': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'AGM-PG': '0000845877',  # FEDERAL AGRICULTURAL MORTGAGE CORP
-    'ALIV': '0001034670',  # AUTOLIV INC
-    'ANG-PB': '0001039828',  # American National Group Inc.
-    'ANG-PA': '0001039828',  # American National Group Inc.
-    'AMNGL': '0001039828',  # American National Group Inc.
-    'GELPP': '0001022321',  # GENESIS ENERGY LP
-    'EXEEZ': '0000895126',  # EXPAND ENERGY Corp
-    'EXEEW': '0000895126',  # EXPAND ENERGY Corp
-    'EXEEL': '0000895126',  # EXPAND ENERGY Corp
-    'DCOMP': '0000846617',  # Dime Community Bancshares, Inc. /NY/
-    'DCOMG': '0000846617',  # Dime Community Bancshares, Inc. /NY/
-    'GRWTF': '0000850918',  # GREAT-WEST LIFECO INC.
-    'GWLPF': '0000850918',  # GREAT-WEST LIFECO INC.
-    'GRWLF': '0000850918',  # GREAT-WEST LIFECO INC.
-    'ENBNF': '0000895728',  # ENBRIDGE INC
-    'ENBHF': '0000895728',  # ENBRIDGE INC
-    'ENBMF': '0000895728',  # ENBRIDGE INC
-    'ENBOF': '0000895728',  # ENBRIDGE INC
-    'ENBSF': '0000895728',  # ENBRIDGE INC
-    'EBRZF': '0000895728',  # ENBRIDGE INC
-    'EBGEF': '0000895728',  # ENBRIDGE INC
-    'EBRGF': '0000895728',  # ENBRIDGE INC
-    'ENBFF': '0000895728',  # ENBRIDGE INC
-    'ENBGF': '0000895728',  # ENBRIDGE INC
-    'ENBRF': '0000895728',  # ENBRIDGE INC
-    'ENNPF': '0000895728',  # ENBRIDGE INC
-    'EBBGF': '0000895728',  # ENBRIDGE INC
-    'ALB-PA': '0000915913',  # ALBEMARLE CORP
-    'OUTFF': '0000920822',  # OUTOKUMPU OY /FI
-    'REGCO': '0000910606',  # REGENCY CENTERS CORP
-    'REGCP': '0000910606',  # REGENCY CENTERS CORP
-    'WAFDP': '0000936528',  # WAFD INC
-    'DTB': '0000936340',  # DTE ENERGY CO
-    'DTG': '0000936340',  # DTE ENERGY CO
-    'ACGLN': '0000947484',  # ARCH CAPITAL GROUP LTD.
-    'LFMDP': '0000948320',  # LifeMD, Inc.
-    'OCFCP': '0001004702',  # OCEANFIRST FINANCIAL CORP
-    'XOMAO': '0000791908',  # XOMA Royalty Corp
-    'XOMAP': '0000791908',  # XOMA Royalty Corp
-    'NEE-PS': '0000753308',  # NEXTERA ENERGY INC
-    'NEE-PT': '0000753308',  # NEXTERA ENERGY INC
-    'NEE-PN': '0000753308',  # NEXTERA ENERGY INC
-    'NEE-PR': '0000753308',  # NEXTERA ENERGY INC
-    'MSEXP': '0000066004',  # MIDDLESEX WATER CO
-    'BOH-PA': '0000046195',  # BANK OF HAWAII CORP
-    'BOH-PB': '0000046195',  # BANK OF HAWAII CORP
-    'MTB-PJ': '0000036270',  # M&T BANK CORP
-    'MTB-PH': '0000036270',  # M&T BANK CORP
-    'CMSC': '0000811156',  # CMS ENERGY CORP
-    'CMSD': '0000811156',  # CMS ENERGY CORP
-    'CMS-PC': '0000811156',  # CMS ENERGY CORP
-    'GAB-PK': '0000794685',  # GABELLI EQUITY TRUST INC
-    'CCNEP': '0000736772',  # CNB FINANCIAL CORP/PA
-    'CFG-PE': '0000759944',  # CITIZENS FINANCIAL GROUP INC/RI
-    'CFG-PH': '0000759944',  # CITIZENS FINANCIAL GROUP INC/RI
-    'ONBPO': '0000707179',  # OLD NATIONAL BANCORP /IN/
-    'ONBPP': '0000707179',  # OLD NATIONAL BANCORP /IN/
-    'RJF-PB': '0000720005',  # RAYMOND JAMES FINANCIAL INC
-    'ZIONP': '0000109380',  # ZIONS BANCORPORATION, NATIONAL ASSOCIATION /UT/
-    'WELPM': '0000107815',  # WISCONSIN ELECTRIC POWER CO
-    'NTRSO': '0000073124',  # NORTHERN TRUST CORP
-    'SCE-PN': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'SCE-PM': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'SCE-PL': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'SCE-PG': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'SCE-PJ': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'SCE-PK': '0000092103',  # SOUTHERN CALIFORNIA EDISON Co
-    'F-PB': '0000037996',  # FORD MOTOR CO
-    'F-PC': '0000037996',  # FORD MOTOR CO
-    'F-PD': '0000037996',  # FORD MOTOR CO
-    'DHCNI': '0001075415',  # DIVERSIFIED HEALTHCARE TRUST
-    'DHCNL': '0001075415',  # DIVERSIFIED HEALTHCARE TRUST
-    'FCUL': '0001076262',  # Golden Star Enterprises Ltd.
-    'BC-PA': '0000014930',  # BRUNSWICK CORP
-    'BC-PB': '0000014930',  # BRUNSWICK CORP
-    'BC-PC': '0000014930',  # BRUNSWICK CORP
-    'GLDI': '0001053092',  # CREDIT SUISSE AG
-    'SLVO': '0001053092',  # CREDIT SUISSE AG
-    'USOI': '0001053092',  # CREDIT SUISSE AG
-    'FMCKK': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'FREJP': '0001026214',  # FEDERAL HOME LOAN MORTGAGE CORP
-    'HPKEW': '0001792849',  # HighPeak Energy, Inc.
-    'MCOMW': '0001788841',  # micromobility.com Inc.
-    'LFLYW': '0001785592',  # Leafly Holdings, Inc. /DE
-    'QSIAW': '0001816431',  # Quantum-Si Inc
-    'RELIW': '0001812727',  # Reliance Global Group, Inc.
-    'EVLVW': '0001805385',  # Evolv Technologies Holdings, Inc.
-    'SKLTF': '0001487139',  # Seek Ltd
-    'HPP-PC': '0001482512',  # Hudson Pacific Properties, Inc.
-    'CPER': '0001479247',  # United States Commodity Index Funds Trust
-    'USCI': '0001479247',  # United States Commodity Index Funds Trust
-    'PFXNZ': '0001490349',  # PhenixFIN Corp
-    'NMFCZ': '0001496099',  # New Mountain Finance Corp
-    'LSEAW': '0001721386',  # Landsea Homes Corp
-    'BMTX-WT': '0001725872',  # BM Technologies, Inc.
-    'BKSY-WT': '0001753539',  # BlackSky Technology Inc.
-    'HMLPF': '0001603016',  # Hoegh LNG Partners LP
-    'HSDTW': '0001610853',  # HELIUS MEDICAL TECHNOLOGIES, INC.
-    'BCTXW': '0001610820',  # BriaCell Therapeutics Corp.
-    'WAL-PA': '0001212545',  # WESTERN ALLIANCE BANCORPORATION
-    'PSEC-PA': '0001287032',  # PROSPECT CAPITAL CORP
-    'SEAL-PA': '0001308106',  # Seapeak LLC
-    'SEAL-PB': '0001308106',  # Seapeak LLC
-    'MSBIP': '0001466026',  # Midland States Bancorp, Inc.
-    'NWOEF': '0001372920',  # New Oriental Education & Technology Group Inc.
-    'SAT': '0001377936',  # SARATOGA INVESTMENT CORP.
-    'SAY': '0001377936',  # SARATOGA INVESTMENT CORP.
-    'SAZ': '0001377936',  # SARATOGA INVESTMENT CORP.
-    'SAJ': '0001377936',  # SARATOGA INVESTMENT CORP.
-    'NGKSF': '0001442655',  # NGK Spark Plug Co., Ltd.
-    'ATLEW': '0001621221',  # ARTELO BIOSCIENCES, INC.
-    'FBRT-PE': '0001562528',  # Franklin BSP Realty Trust, Inc.
-    'GLFHD': '0001574676',  # Galenfeha, Inc.
-    'VCMIX': '0001515001',  # Versus Capital Real Estate Fund LLC
-    'AMPGW': '0001518461',  # AmpliTech Group, Inc.
-    'RIV-PA': '0001501072',  # RIVERNORTH OPPORTUNITIES FUND, INC.
-    'SSSSL': '0001509470',  # SURO CAPITAL CORP.
-    'TAX': '0001528930',  # Franchise Group, Inc.
-    'GNL-PE': '0001526113',  # Global Net Lease, Inc.
-    'GNL-PD': '0001526113',  # Global Net Lease, Inc.
-    'GNL-PB': '0001526113',  # Global Net Lease, Inc.
-    'ATHS': '0001527469',  # Athene Holding Ltd.
-    'ATH-PB': '0001527469',  # Athene Holding Ltd.
-    'ATH-PC': '0001527469',  # Athene Holding Ltd.
-    'ATH-PD': '0001527469',  # Athene Holding Ltd.
-    'ATH-PE': '0001527469',  # Athene Holding Ltd.
-    'CICB': '0001534254',  # CION Investment Corp
-    'TRIC': '0001550453',  # TriLinc Global Impact Fund LLC
-    'TRLC': '0001550453',  # TriLinc Global Impact Fund LLC
-    'WHLRL': '0001527541',  # Wheeler Real Estate Investment Trust, Inc.
-    'GDHLF': '0001526125',  # GDS Holdings Ltd
-    'PNDZF': '0001505880',  # Pandora A/S / ADR
-    'GMBLP': '0001451448',  # ESPORTS ENTERTAINMENT GROUP, INC.
-    'GMBLW': '0001451448',  # ESPORTS ENTERTAINMENT GROUP, INC.
-    'GMBLZ': '0001451448',  # ESPORTS ENTERTAINMENT GROUP, INC.
-    'OPINL': '0001456772',  # OFFICE PROPERTIES INCOME TRUST
-    'LTAFX': '0001496254',  # Alternative Strategies Income Fund
-    'LTCFX': '0001496254',  # Alternative Strategies Income Fund
-    'CLDT-PA': '0001476045',  # Chatham Lodging Trust
-    'FGFPP': '0001591890',  # Fundamental Global Inc.
-    'FTAIM': '0001590364',  # FTAI Aviation Ltd.
-    'FTAIN': '0001590364',  # FTAI Aviation Ltd.
-    'FTAIO': '0001590364',  # FTAI Aviation Ltd.
-    'REXR-PC': '0001571283',  # Rexford Industrial Realty, Inc.
-    'FUPEY': '0001534043',  # Fuchs Petrolub SE/ADR
-    'FUPPF': '0001534043',  # Fuchs Petrolub SE/ADR
-    'PW-PA': '0001532619',  # Power REIT
-    'CGBDL': '0001544206',  # Carlyle Secured Lending, Inc.
-    'BPYPM': '0001545772',  # Brookfield Property Partners L.P.
-    'BPYPN': '0001545772',  # Brookfield Property Partners L.P.
-    'BPYPO': '0001545772',  # Brookfield Property Partners L.P.
-    'CPAXF': '0001555812',  # Siam Makro Public Co Limited/ADR
-    'AUUDW': '0001554818',  # AUDDIA INC.
-    'INBKZ': '0001562463',  # First Internet Bancorp
-    'KDLYW': '0001946573',  # Kindly MD, Inc.
-    'SXTPW': '0001946563',  # 60 DEGREES PHARMACEUTICALS, INC.
-    'LMMY': '0001939937',  # LAMY
-    'LVWR-WT': '0001898795',  # LiveWire Group, Inc.
-    'FEAV': '0001888654',  # 5E Advanced Materials, Inc.
-    'ASPCU': '0001890361',  # ASPAC III Acquisition Corp.
-    'ASPCR': '0001890361',  # ASPAC III Acquisition Corp.
-    'GLLIR': '0001888734',  # GLOBALINK INVESTMENT INC.
-    'GLLIU': '0001888734',  # GLOBALINK INVESTMENT INC.
-    'GLLIW': '0001888734',  # GLOBALINK INVESTMENT INC.
-    'TETEU': '0001900679',  # Technology & Telecommunication Acquisition Corp
-    'TETEW': '0001900679',  # Technology & Telecommunication Acquisition Corp
-    'KLTOW': '0001907223',  # Klotho Neurosciences, Inc.
-    'FUFUW': '0001921158',  # Bitfufu Inc.
-    'DMYY-UN': '0001915380',  # dMY Squared Technology Group, Inc.
-    'DMYY-WT': '0001915380',  # dMY Squared Technology Group, Inc.
-    'STXYF': '0001915403',  # SatixFy Communications Ltd.
-    'EUDAW': '0001847846',  # EUDA Health Holdings Ltd
-    'HAIUF': '0001848861',  # Healthcare AI Acquisition Corp.
-    'HAIWF': '0001848861',  # Healthcare AI Acquisition Corp.
-    'BLDEW': '0001779128',  # Blade Air Mobility, Inc.
-    'SLDPW': '0001844862',  # Solid Power, Inc.
-    'PLMJW': '0001845550',  # Plum Acquisition Corp. III
-    'PLMJU': '0001845550',  # Plum Acquisition Corp. III
-    'AOMN': '0001766478',  # Angel Oak Mortgage REIT, Inc.
-    'ZCARW': '0001854275',  # Zoomcar Holdings, Inc.
-    'DC-WT': '0001852353',  # Dakota Gold Corp.
-    'ALSUF': '0001865111',  # Alpha Star Acquisition Corp
-    'ALSTF': '0001865111',  # Alpha Star Acquisition Corp
-    'ALSWF': '0001865111',  # Alpha Star Acquisition Corp
-    'DSAQW': '0001871745',  # Direct Selling Acquisition Corp.
-    'GLEI': '0001871890',  # Galaxy Enterprises Inc. /WY/
-    'RBTCW': '0001862068',  # Rubicon Technologies, Inc.
-    'DSAQU': '0001871745',  # Direct Selling Acquisition Corp.
-    'LARAX': '0001753712',  # Lord Abbett Credit Opportunities Fund
-    'CELUW': '0001752828',  # Celularity Inc
-    'PSPX': '0001765651',  # Pacific Sports Exchange Inc.
-    'PDSKX': '0001756404',  # Principal Real Asset Fund
-    'NRXPW': '0001719406',  # NRX Pharmaceuticals, Inc.
-    'FATBP': '0001705012',  # Fat Brands, Inc
-    'FATBW': '0001705012',  # Fat Brands, Inc
-    'GPMT-PA': '0001703644',  # Granite Point Mortgage Trust Inc.
-    'NVNBW': '0001661053',  # enVVeno Medical Corp
-    'HTZWW': '0001657853',  # HERTZ GLOBAL HOLDINGS, INC
-    'LENDX': '0001658645',  # Stone Ridge Trust V
-    'METCZ': '0001687187',  # Ramaco Resources, Inc.
-    'METCB': '0001687187',  # Ramaco Resources, Inc.
-    'LTRYW': '0001673481',  # Lottery.com Inc.
-    'METCL': '0001687187',  # Ramaco Resources, Inc.
-    'NESRW': '0001698514',  # National Energy Services Reunited Corp.
-    'TFLM': '0001885849',  # Tofla Megaline Inc.
-    'LSEB': '0001888740',  # LSEB Creative Corp.
-    'UHGI': '0001888846',  # Ultimate Holdings Group, Inc.
-    'PLSAY': '0001884082',  # Polestar Automotive Holding UK PLC
-    'ACLEW': '0001883984',  # Alternus Clean Energy, Inc.
-    'SPKLU': '0001884046',  # Spark I Acquisition Corp
-    'SPKLW': '0001884046',  # Spark I Acquisition Corp
-    'DRTSW': '0001871321',  # Alpha Tau Medical Ltd.
-    'GRAMW': '0001876945',  # Gold Flora Corp.
-    'SWVLW': '0001875609',  # Swvl Holdings Corp
-    'CDROW': '0001866782',  # Codere Online Luxembourg, S.A.
-    'FGN': '0001934850',  # F&G Annuities & Life, Inc.
-    'SDAWW': '0001936804',  # SunCar Technology Group Inc.
-    'HOVRW': '0001930021',  # New Horizon Aircraft Ltd.
-    'TANAF': '0001941189',  # Tian'an Technology Group Ltd
-    'OAKUW': '0001945422',  # Oak Woods Acquisition Corp
-    'OAKUR': '0001945422',  # Oak Woods Acquisition Corp
-    'SVREW': '0001894693',  # SaverOne 2014 Ltd.
-    'EVGRU': '0001900402',  # Evergreen Corp
-    'EVGRW': '0001900402',  # Evergreen Corp
-    'PGDE': '0001919191',  # PGD ECO SOLUTIONS
-    'MCAGR': '0001859035',  # Mountain Crest Acquisition Corp. V
-    'MCAGU': '0001859035',  # Mountain Crest Acquisition Corp. V
-    'FNVWF': '0001857855',  # Finnovate Acquisition Corp.
-    'FNVUF': '0001857855',  # Finnovate Acquisition Corp.
-    'DCFWQ': '0001862490',  # Tritium DCFC Ltd
-    'AMODW': '0001862463',  # ALPHA MODUS HOLDINGS, INC.
-    'CTSUF': '0001865861',  # Cactus Acquisition Corp. 1 Ltd
-    'CTSWF': '0001865861',  # Cactus Acquisition Corp. 1 Ltd
-    'JVSAU': '0001866001',  # JVSPAC Acquisition Corp.
-    'JVSAR': '0001866001',  # JVSPAC Acquisition Corp.
-    'SEATW': '0001856031',  # Vivid Seats Inc.
-    'PUCKU': '0001836100',  # Goal Acquisitions Corp.
-    'PUCKW': '0001836100',  # Goal Acquisitions Corp.
-    'GATEU': '0001838513',  # Marblegate Acquisition Corp.
-    'GATEW': '0001838513',  # Marblegate Acquisition Corp.
-    'UKOMW': '0001821424',  # Ucommune International Ltd
-    'HLLY-WT': '0001822928',  # Holley Inc.
-    'FRBP': '0001825248',  # Franklin BSP Capital Corp
-    'OCAXU': '0001820175',  # OCA Acquisition Corp.
-    'OCAXW': '0001820175',  # OCA Acquisition Corp.
-    'GRND-WT': '0001820144',  # Grindr Inc.
-    'SES-WT': '0001819142',  # SES AI Corp
-    'BFRGW': '0001829247',  # BullFrog AI Holdings, Inc.
-    'AUROW': '0001828108',  # Aurora Innovation, Inc.
-    'PCTTU': '0001830033',  # PureCycle Technologies, Inc.
-    'PCTTW': '0001830033',  # PureCycle Technologies, Inc.
-    'IRAAU': '0001831874',  # Iris Acquisition Corp
-    'IRAAW': '0001831874',  # Iris Acquisition Corp
-    'GLCP': '0001830696',  # GLOBAL LEADERS CORP
-    'RCIAX': '0001628040',  # Alternative Credit Income Fund
-    'QTZM': '0001663038',  # Quantumzyme Corp.
-    'NOEMU': '0001956648',  # CO2 Energy Transition Corp.
-    'BCGWW': '0001953984',  # Binah Capital Group, Inc.
-    'QLUNF': '0001951378',  # Qilun Group Inc.
-    'OAKUU': '0001945422',  # Oak Woods Acquisition Corp
-    'SRKKS': '0001947158',  # Public Shrek Royalties LLC
-    'USGOW': '0001947244',  # U.S. GoldMining Inc.
-    'RDPTF': '0001949257',  # Radiopharm Theranostics Ltd
-    'CLGDF': '0001964504',  # Aris Mining Corp
-    'BHFAM': '0001685040',  # Brighthouse Financial, Inc.
-    'BHFAN': '0001685040',  # Brighthouse Financial, Inc.
-    'BHFAO': '0001685040',  # Brighthouse Financial, Inc.
-    'HHEGF': '0001680935',  # Huahui Education Group Ltd
-    'VFLEX': '0001681717',  # FIRST TRUST ALTERNATIVE OPPORTUNITIES FUND
-    'FCREX': '0001688897',  # FS Credit Income Fund
-    'STSR': '0001698538',  # Strategic Student & Senior Housing Trust, Inc.
-    'AMLIF': '0001699880',  # American Lithium Corp.
-    'OWSCX': '0001748680',  # 1WS Credit Income Fund
-    'GSMGW': '0001738758',  # Cheer Holding, Inc.
-    'HOFVW': '0001708176',  # Hall of Fame Resort & Entertainment Co
-    'AGNCO': '0001423689',  # AGNC Investment Corp.
-    'AGNCP': '0001423689',  # AGNC Investment Corp.
-    'AGNCL': '0001423689',  # AGNC Investment Corp.
-    'KPHMW': '0001372514',  # KIORA PHARMACEUTICALS INC
-    'SBFMW': '0001402328',  # Sunshine Biopharma Inc.
-    'GNRSQ': '0001790665',  # Greenrose Holding Co Inc.
-    'KPLTW': '0001785424',  # Katapult Holdings, Inc.
-    'VENAF': '0001800392',  # MicroAlgo Inc.
-    'BFLY-WT': '0001804176',  # Butterfly Network, Inc.
-    'LGHLW': '0001806524',  # Lion Group Holding Ltd
-    'LUCYW': '0001808377',  # Innovative Eyewear Inc
-    'ABLLL': '0001814287',  # Abacus Life, Inc.
-    'ABLLW': '0001814287',  # Abacus Life, Inc.
-    'IMTXW': '0001809196',  # Immatics N.V.
-    'OWLTW': '0001816708',  # Owlet, Inc.
-    'GWH-WT': '0001819438',  # ESS Tech, Inc.
-    'HUMAW': '0001818382',  # Humacyte, Inc.
-    'JXN-PA': '0001822993',  # Jackson Financial Inc.
-    'QRTEP': '0001355096',  # Qurate Retail, Inc.
-    'GIGGF': '0001336364',  # Giga Metals Corp
-    'DESLF': '0001340476',  # DIRTT ENVIRONMENTAL SOLUTIONS LTD
-    'GAINN': '0001321741',  # GLADSTONE INVESTMENT CORPORATION\DE
-    'GAINZ': '0001321741',  # GLADSTONE INVESTMENT CORPORATION\DE
-    'GAINI': '0001321741',  # GLADSTONE INVESTMENT CORPORATION\DE
-    'BKDT': '0001332349',  # Brookdale Senior Living Inc.
-    'LIXTW': '0001335105',  # LIXTE BIOTECHNOLOGY HOLDINGS, INC.
-    'AQNB': '0001174169',  # ALGONQUIN POWER & UTILITIES CORP.
-    'AGQPF': '0001174169',  # ALGONQUIN POWER & UTILITIES CORP.
-    'PFH': '0001137774',  # PRUDENTIAL FINANCIAL INC
-    'NHPBP': '0001561032',  # National Healthcare Properties, Inc.
-    'TNONW': '0001560293',  # Tenon Medical, Inc.
-    'PRH': '0001137774',  # PRUDENTIAL FINANCIAL INC
-    'PRS': '0001137774',  # PRUDENTIAL FINANCIAL INC
-    'RITM-PA': '0001556593',  # Rithm Capital Corp.
-    'RITM-PB': '0001556593',  # Rithm Capital Corp.
-    'RITM-PC': '0001556593',  # Rithm Capital Corp.
-    'RITM-PD': '0001556593',  # Rithm Capital Corp.
-    'PRIF-PJ': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PK': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PL': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PD': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PF': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PH': '0001554625',  # Priority Income Fund, Inc.
-    'PRIF-PI': '0001554625',  # Priority Income Fund, Inc.
-    'VSSYW': '0001701963',  # Versus Systems Inc.
-    'BTBDW': '0001718224',  # BT Brands, Inc.
-    'ATNFW': '0001690080',  # 180 Life Sciences Corp.
-    'PFFLX': '0001688554',  # PIMCO Flexible Credit Income Fund
-    'SACH-PA': '0001682220',  # Sachem Capital Corp.
-    'SCCC': '0001682220',  # Sachem Capital Corp.
-    'SCCD': '0001682220',  # Sachem Capital Corp.
-    'SCCE': '0001682220',  # Sachem Capital Corp.
-    'SCCF': '0001682220',  # Sachem Capital Corp.
-    'SCCG': '0001682220',  # Sachem Capital Corp.
-    'TRTN-PB': '0001660734',  # Triton International Ltd
-    'NRSAX': '0001663712',  # NEXPOINT REAL ESTATE STRATEGIES FUND
-    'GECCI': '0001675033',  # Great Elm Capital Corp.
-    'GECCH': '0001675033',  # Great Elm Capital Corp.
-    'GECCZ': '0001675033',  # Great Elm Capital Corp.
-    'NTRBW': '0001676047',  # NutriBand Inc.
-    'GECCO': '0001675033',  # Great Elm Capital Corp.
-    'CVE-WT': '0001475260',  # CENOVUS ENERGY INC.
-    'CNVEF': '0001475260',  # CENOVUS ENERGY INC.
-    'SBBA': '0001483934',  # Scorpio Tankers Inc.
-    'WLLBW': '0001486159',  # Chord Energy Corp
-    'LANDO': '0001495240',  # GLADSTONE LAND Corp
-    'CANE': '0001471824',  # Teucrium Commodity Trust
-    'TAGS': '0001471824',  # Teucrium Commodity Trust
-    'WEAT': '0001471824',  # Teucrium Commodity Trust
-    'SOYB': '0001471824',  # Teucrium Commodity Trust
-    'CORN': '0001471824',  # Teucrium Commodity Trust
-    'ATLCL': '0001464343',  # Atlanticus Holdings Corp
-    'ATLCP': '0001464343',  # Atlanticus Holdings Corp
-    'ATLCZ': '0001464343',  # Atlanticus Holdings Corp
-    'NTTDF': '0001446705',  # NTT Data Corp
-    'HYZNW': '0001716583',  # Hyzon Motors Inc.
-    'IHICF': '0001567526',  # IHI Corporation/ADR
-    'FSHPU': '0001850059',  # Flag Ship Acquisition Corp
-    'FSHPR': '0001850059',  # Flag Ship Acquisition Corp
-    'BEAGR': '0001852207',  # Bold Eagle Acquisition Corp.
-    'BEAGU': '0001852207',  # Bold Eagle Acquisition Corp.
-    'TTTPF': '0001849396',  # Nexxen International Ltd.
-    'ONMDW': '0001849380',  # OneMedNet Corp
-    'AYWWF': '0001847462',  # Ayr Wellness Inc.
-    'OKMN': '0001848334',  # OKMIN RESOURCES, INC.
-    'MITAU': '0001847440',  # Coliseum Acquisition Corp.
-    'CSTUF': '0001834032',  # Constellation Acquisition Corp I
-    'CSTWF': '0001834032',  # Constellation Acquisition Corp I
-    'GROY-WT': '0001834026',  # Gold Royalty Corp.
-    'SLMUF': '0001838162',  # Slam Corp.
-    'SLMWF': '0001838162',  # Slam Corp.
-    'ARBKL': '0001841675',  # Argo Blockchain Plc
-    'BNAIW': '0001838163',  # Brand Engagement Network Inc.
-    'CSLRW': '0001838987',  # Complete Solaria, Inc.
-    'FIGP': '0001846702',  # Forge Group, Inc.
-    'AISPW': '0001842566',  # Airship AI Holdings, Inc.
-    'FAASW': '0001844981',  # DIGIASIA CORP.
-    'GROVW': '0001841761',  # Grove Collaborative Holdings, Inc.
-    'EONR-WT': '0001842556',  # EON Resources Inc.
-    'SQLLW': '0001605888',  # ATLANTIC INTERNATIONAL CORP.
-    'PSOIX': '0001608016',  # Palmer Square Opportunistic Income Fund
-    'ECCC': '0001604174',  # Eagle Point Credit Co Inc.
-    'ECC-PD': '0001604174',  # Eagle Point Credit Co Inc.
-    'ECCV': '0001604174',  # Eagle Point Credit Co Inc.
-    'ECCF': '0001604174',  # Eagle Point Credit Co Inc.
-    'ECCU': '0001604174',  # Eagle Point Credit Co Inc.
-    'ECCW': '0001604174',  # Eagle Point Credit Co Inc.
-    'CTRVP': '0001583771',  # Hepion Pharmaceuticals, Inc.
-    'RWAYL': '0001653384',  # Runway Growth Finance Corp.
-    'TRTN-PC': '0001660734',  # Triton International Ltd
-    'TRTN-PD': '0001660734',  # Triton International Ltd
-    'TRTN-PE': '0001660734',  # Triton International Ltd
-    'RWAYZ': '0001653384',  # Runway Growth Finance Corp.
-    'RVMDW': '0001628171',  # Revolution Medicines, Inc.
-    'CRTDW': '0001357671',  # Creatd, Inc.
-    'NXDT-PA': '0001356115',  # NEXPOINT DIVERSIFIED REAL ESTATE TRUST
-    'ACR-PC': '0001332551',  # ACRES Commercial Realty Corp.
-    'ACR-PD': '0001332551',  # ACRES Commercial Realty Corp.
-    'AHL-PE': '0001267395',  # ASPEN INSURANCE HOLDINGS LTD
-    'AHL-PF': '0001267395',  # ASPEN INSURANCE HOLDINGS LTD
-    'MFICL': '0001278752',  # MidCap Financial Investment Corp
-    'DSHKN': '0001175483',  # Drive Shack Inc.
-    'DSHKO': '0001175483',  # Drive Shack Inc.
-    'DSHKP': '0001175483',  # Drive Shack Inc.
-    'DNMRW': '0001779020',  # Danimer Scientific, Inc.
-    'GOODN': '0001234006',  # GLADSTONE COMMERCIAL CORP
-    'GOODO': '0001234006',  # GLADSTONE COMMERCIAL CORP
-    'ADNWW': '0001744494',  # ADVENT TECHNOLOGIES HOLDINGS, INC.
-    'COEPW': '0001759186',  # Coeptis Therapeutics Holdings, Inc.
-    'SHOTW': '0001760903',  # Safety Shot, Inc.
-    'OBTC': '0001767057',  # Osprey Bitcoin Trust
-    'ILLRW': '0001769624',  # Triller Group Inc.
-    'ADVWW': '0001776661',  # Advantage Solutions Inc.
-    'KKRS': '0001404912',  # KKR & Co. Inc.
-    'GDL-PC': '0001378701',  # GDL FUND
-    'AUB-PA': '0000883948',  # Atlantic Union Bankshares Corp
-    'BFS-PE': '0000907254',  # SAUL CENTERS, INC.
-    'RWTN': '0000930236',  # REDWOOD TRUST INC
-    'RWTO': '0000930236',  # REDWOOD TRUST INC
-    'RWT-PA': '0000930236',  # REDWOOD TRUST INC
-    'SSRGF': '0000921638',  # SSR MINING INC.
-    'MLCMF': '0000912958',  # MILLICOM INTERNATIONAL CELLULAR SA
-    'HCIIP': '0001400810',  # HCI Group, Inc.
-    'NNDNF': '0001158967',  # NIDEC CORP
-    'PAAPU': '0001070423',  # PLAINS ALL AMERICAN PIPELINE LP
-    'RBMCF': '0001000275',  # ROYAL BANK OF CANADA
-    'RBCPF': '0001000275',  # ROYAL BANK OF CANADA
-    'RYLBF': '0001000275',  # ROYAL BANK OF CANADA
-    'WTFCP': '0001015328',  # WINTRUST FINANCIAL CORP
-    'SKMTF': '0001015650',  # SK TELECOM CO LTD
-    'ELPC': '0001041792',  # ENERGY CO OF PARANA
-    'RILYG': '0001464790',  # B. Riley Financial, Inc.
-    'RILYK': '0001464790',  # B. Riley Financial, Inc.
-    'RILYL': '0001464790',  # B. Riley Financial, Inc.
-    'RILYM': '0001464790',  # B. Riley Financial, Inc.
-    'RILYN': '0001464790',  # B. Riley Financial, Inc.
-    'SHZNF': '0001454480',  # Shenzhen Expressway Co. / ADR
-    'RILYP': '0001464790',  # B. Riley Financial, Inc.
-    'RILYT': '0001464790',  # B. Riley Financial, Inc.
-    'RILYZ': '0001464790',  # B. Riley Financial, Inc.
-    'EFC-PD': '0001411342',  # Ellington Financial Inc.
-    'EFC-PA': '0001411342',  # Ellington Financial Inc.
-    'EFC-PB': '0001411342',  # Ellington Financial Inc.
-    'EFC-PC': '0001411342',  # Ellington Financial Inc.
-    'INN-PF': '0001497645',  # Summit Hotel Properties, Inc.
-    'HWLDF': '0001483994',  # H World Group Ltd
-    'HTFB': '0001487428',  # Horizon Technology Finance Corp
-    'HTFC': '0001487428',  # Horizon Technology Finance Corp
-    'OFSSH': '0001487918',  # OFS Capital Corp
-    'CCIA': '0001517767',  # Carlyle Credit Income Fund
-    'YKLTF': '0001538118',  # Yakult Honsha Co., LTD/ADR
-    'BEPH': '0001533232',  # Brookfield Renewable Partners L.P.
-    'BEPI': '0001533232',  # Brookfield Renewable Partners L.P.
-    'BEP-PA': '0001533232',  # Brookfield Renewable Partners L.P.
-    'BRENF': '0001533232',  # Brookfield Renewable Partners L.P.
-    'BEPJ': '0001533232',  # Brookfield Renewable Partners L.P.
-    'CRSLF': '0001541309',  # carsales.com Limited/ADR
-    'BIAFW': '0001712762',  # bioAffinity Technologies, Inc.
-    'CADCX': '0001678124',  # CION Ares Diversified Credit Fund
-    'ZTOEF': '0001677250',  # ZTO Express (Cayman) Inc.
-    'SYTAW': '0001649009',  # Siyata Mobile Inc.
-    'HPE-PC': '0001645590',  # Hewlett Packard Enterprise Co
-    'DATSW': '0001648960',  # DatChat, Inc.
-    'AREBW': '0001648087',  # AMERICAN REBEL HOLDINGS INC
-    'MAPSW': '0001779474',  # WM TECHNOLOGY, INC.
-    'CPRDX': '0001762562',  # Clarion Partners Real Estate Income Fund Inc.
-    'MPLNW': '0001793229',  # MultiPlan Corp
-    'JSPRW': '0001788028',  # Jasper Therapeutics, Inc.
-    'NREF-PA': '0001786248',  # NexPoint Real Estate Finance, Inc.
-    'MNTSW': '0001781162',  # Momentus Inc.
-    'GTECW': '0001735041',  # Greenland Technologies Holding Corp.
-    'CCLFX': '0001735964',  # Cliffwater Corporate Lending Fund
-    'RVPHW': '0001742927',  # REVIVA PHARMACEUTICALS HOLDINGS, INC.
-    'ALTG-PA': '0001759824',  # ALTA EQUIPMENT GROUP INC.
-    'MVSTW': '0001760689',  # Microvast Holdings, Inc.
-    'XELAP': '0001620179',  # Exela Technologies, Inc.
-    'MBINM': '0001629019',  # Merchants Bancorp
-    'MBINL': '0001629019',  # Merchants Bancorp
-    'MBINN': '0001629019',  # Merchants Bancorp
-    'MBINO': '0001629019',  # Merchants Bancorp
-    'BWNB': '0001630805',  # Babcock & Wilcox Enterprises, Inc.
-    'BW-PA': '0001630805',  # Babcock & Wilcox Enterprises, Inc.
-    'BWSN': '0001630805',  # Babcock & Wilcox Enterprises, Inc.
-    'VJTTY': '0001582581',  # voxeljet AG
-    'NXPT': '0001588272',  # NexPoint Capital, Inc.
-    'BBAAY': '0001577552',  # Alibaba Group Holding Ltd
-    'MITN': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'MITP': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'MITT-PC': '0001514281',  # AG Mortgage Investment Trust, Inc.
-    'FSEN': '0001501729',  # FS Specialty Lending Fund
-    'CNFRZ': '0001502292',  # Conifer Holdings, Inc.
-    'DTLAP': '0001575311',  # Brookfield DTLA Fund Office Trust Investor Inc.
-    'SPNT-PB': '0001576018',  # SiriusPoint Ltd
-    'SSPFF': '0001576018',  # SiriusPoint Ltd
-    'BTGWF': '0001546538',  # BTS Group Holdings Public Co Limited/ADR
-    'BTGRF': '0001546538',  # BTS Group Holdings Public Co Limited/ADR
-    'BTLWF': '0001546538',  # BTS Group Holdings Public Co Limited/ADR
-    'LLYVB': '0001560385',  # Liberty Media Corp
-    'LLYVK': '0001560385',  # Liberty Media Corp
-    'LLYVA': '0001560385',  # Liberty Media Corp
-    'CMPOW': '0001823144',  # CompoSecure, Inc.
-    'BKKT-WT': '0001820302',  # Bakkt Holdings, Inc.
-    'GCMGW': '0001819796',  # GCM Grosvenor Inc.
-    'SRZNW': '0001824893',  # Surrozen, Inc./DE
-    'RSVRW': '0001824403',  # Reservoir Media, Inc.
-    'EVEX-WT': '0001823652',  # Eve Holding, Inc.
-    'BHILW': '0001830210',  # Benson Hill, Inc.
-    'PIIIW': '0001832511',  # P3 Health Partners Inc.
-    'DNABW': '0001830214',  # Ginkgo Bioworks Holdings, Inc.
-    'GPATW': '0001834526',  # GP-Act III Acquisition Corp.
-    'GPATU': '0001834526',  # GP-Act III Acquisition Corp.
-    'TALKW': '0001803901',  # Talkspace, Inc.
-    'TOIIW': '0001799191',  # Oncology Institute, Inc.
-    'ETWO-WT': '0001800347',  # E2open Parent Holdings, Inc.
-    'NUVB-WT': '0001811063',  # Nuvation Bio Inc.
-    'HTOOW': '0001819794',  # Fusion Fuel Green PLC
-    'SONDW': '0001819395',  # Sonder Holdings Inc.
-    'FILG': '0001852039',  # Grayscale Filecoin Trust (FIL)
-    'ANSCU': '0001854149',  # Agriculture & Natural Solutions Acquisition Corp
-    'ANSCW': '0001854149',  # Agriculture & Natural Solutions Acquisition Corp
-    'ORIB': '0001854183',  # Orion Bliss Corp.
-    'AMBP-WT': '0001845097',  # Ardagh Metal Packaging S.A.
-    'AACT-WT': '0001853138',  # Ares Acquisition Corp II
-    'AACT-UN': '0001853138',  # Ares Acquisition Corp II
-    'MOBXW': '0001855467',  # MOBIX LABS, INC
-    'KORGW': '0001855457',  # KORE Group Holdings, Inc.
-    'NVACR': '0001859807',  # NorthView Acquisition Corp
-    'NVACW': '0001859807',  # NorthView Acquisition Corp
-    'CITEU': '0001848437',  # Cartica Acquisition Corp
-    'CITEW': '0001848437',  # Cartica Acquisition Corp
-    'INTEU': '0001850262',  # Integral Acquisition Corp 1
-    'INTEW': '0001850262',  # Integral Acquisition Corp 1
-    'BNIXR': '0001845942',  # Bannix Acquisition Corp.
-    'BNIXW': '0001845942',  # Bannix Acquisition Corp.
-    'RMCOW': '0001843656',  # Royalty Management Holding Corp
-    'BSLKW': '0001841125',  # Bolt Projects Holdings, Inc.
-    'PSFE-WT': '0001833835',  # Paysafe Ltd
-    'SEVCD': '0001840416',  # Sono Group N.V.
-    'VEEAW': '0001840317',  # VEEA INC.
-    'MGNC': '0001949864',  # Mag Magna Corp
-    'FBYDW': '0001937987',  # Falcon's Beyond Global, Inc.
-    'ATMVR': '0001937891',  # AlphaVest Acquisition Corp.
-    'ATMVU': '0001937891',  # AlphaVest Acquisition Corp.
-    'ECDAW': '0001922858',  # ECD Automotive Design, Inc.
-    'NWTNW': '0001932737',  # NWTN, Inc.
-    'MDNC': '0001931055',  # Medinotec Inc.
-    'DECAU': '0001913577',  # Denali Capital Acquisition Corp.
-    'DECAW': '0001913577',  # Denali Capital Acquisition Corp.
-    'GSTK': '0001917993',  # Growth Stalk Holdings Corp
-    'RZLVW': '0001920294',  # REZOLVE AI Ltd
-    'KHOB': '0001909770',  # KHEOBA CORP.
-    'VFSWW': '0001913510',  # VinFast Auto Ltd.
-    'LEGT-UN': '0002002038',  # Legato Merger Corp. III
-    'LEGT-WT': '0002002038',  # Legato Merger Corp. III
-    'HPAIW': '0002001699',  # Helport AI Ltd
-    'NIVFW': '0001981662',  # NewGenIvf Group Ltd
-    'MNYWW': '0001974044',  # MoneyHero Ltd
-    'AFJKR': '0001979005',  # Aimei Health Technology Co., Ltd.
-    'AFJKU': '0001979005',  # Aimei Health Technology Co., Ltd.
-    'MMVWW': '0001874074',  # MultiMetaVerse Holdings Ltd
-    'SWAGW': '0001872525',  # Stran & Company, Inc.
-    'TLGUF': '0001879814',  # TLGY ACQUISITION CORP
-    'LCFYW': '0001875547',  # Locafy Ltd
-    'CSLMR': '0001875493',  # CSLM ACQUISITION CORP.
-    'CSLMU': '0001875493',  # CSLM ACQUISITION CORP.
-    'CSLMW': '0001875493',  # CSLM ACQUISITION CORP.
-    'WBX-WT': '0001866501',  # Wallbox N.V.
-    'OCEAW': '0001869974',  # Ocean Biomedical, Inc.
-    'PROCW': '0001863362',  # Procaps Group, S.A.
-    'VSEEW': '0001864531',  # VSEE HEALTH, INC.
-    'NXNVW': '0001865631',  # NEXTNAV INC.
-    'NNAVW': '0001865631',  # NEXTNAV INC.
-    'NE-WTA': '0001895262',  # Noble Corp plc
-    'NE-WT': '0001895262',  # Noble Corp plc
-    'ABPWW': '0001893219',  # Abpro Holdings, Inc.
-    'LUXHP': '0001893311',  # LUXURBAN HOTELS INC.
-    'WLDSW': '0001887673',  # Wearable Devices Ltd.
-    'TLGWF': '0001879814',  # TLGY ACQUISITION CORP
-    'GODNU': '0001895144',  # Golden Star Acquisition Corp
-    'GODNR': '0001895144',  # Golden Star Acquisition Corp
-    'NBLWF': '0001895262',  # Noble Corp plc
-    'HUBCW': '0001905660',  # Hub Cyber Security Ltd.
-    'HUBCZ': '0001905660',  # Hub Cyber Security Ltd.
-    'CLRCR': '0001903392',  # ClimateRock
-    'CLRCU': '0001903392',  # ClimateRock
-    'CLRCW': '0001903392',  # ClimateRock
-    'SBXD-UN': '0002015947',  # SilverBox Corp IV
-    'SBXD-WT': '0002015947',  # SilverBox Corp IV
-    'CUBWW': '0002015955',  # Lionheart Holdings
-    'CUBWU': '0002015955',  # Lionheart Holdings
-    'MBAVU': '0002016072',  # M3-Brigade Acquisition V Corp.
-    'MBAVW': '0002016072',  # M3-Brigade Acquisition V Corp.
-    'CHARR': '0002024459',  # Charlton Aria Acquisition Corp
-    'CHARU': '0002024459',  # Charlton Aria Acquisition Corp
-    'TAVIU': '0002020385',  # Tavia Acquisition Corp.
-    'TAVIR': '0002020385',  # Tavia Acquisition Corp.
-    'MACIW': '0002016221',  # Melar Acquisition Corp. I/Cayman
-    'MACIU': '0002016221',  # Melar Acquisition Corp. I/Cayman
-    'MLACU': '0002029492',  # Mountain Lake Acquisition Corp.
-    'RANGU': '0002035644',  # Range Capital Acquisition Corp.
-    'RANGR': '0002035644',  # Range Capital Acquisition Corp.
-}
@@ -1,9860 +0,0 @@
-# Ticker to Title mapping
-tickers_titles = {
-    'AAPL': 'Apple Inc.',
-    'NVDA': 'NVIDIA CORP',
-    'MSFT': 'MICROSOFT CORP',
-    'GOOGL': 'Alphabet Inc.',
-    'AMZN': 'AMAZON COM INC',
-    'META': 'Meta Platforms, Inc.',
-    'TSLA': 'Tesla, Inc.',
-    'AVGO': 'Broadcom Inc.',
-    'BRK-B': 'BERKSHIRE HATHAWAY INC',
-    'WMT': 'Walmart Inc.',
-    'LLY': 'ELI LILLY & Co',
-    'JPM': 'JPMORGAN CHASE & CO',
-    'V': 'VISA INC.',
-    'SPY': 'SPDR S&P 500 ETF TRUST',
-    'UNH': 'UNITEDHEALTH GROUP INC',
-    'XOM': 'EXXON MOBIL CORP',
-    'MA': 'Mastercard Inc',
-    'ORCL': 'ORACLE CORP',
-    'COST': 'COSTCO WHOLESALE CORP /NEW',
-    'HD': 'HOME DEPOT, INC.',
-    'NVO': 'NOVO NORDISK A S',
-    'PG': 'PROCTER & GAMBLE Co',
-    'NFLX': 'NETFLIX INC',
-    'BAC': 'BANK OF AMERICA CORP /DE/',
-    'JNJ': 'JOHNSON & JOHNSON',
-    'ABBV': 'AbbVie Inc.',
-    'CRM': 'Salesforce, Inc.',
-    'SAP': 'SAP SE',
-    'ASML': 'ASML HOLDING NV',
-    'RCIT': 'REELCAUSE INC',
-    'CVX': 'CHEVRON CORP',
-    'KO': 'COCA COLA CO',
-    'MRK': 'Merck & Co., Inc.',
-    'TMUS': 'T-Mobile US, Inc.',
-    'TM': 'TOYOTA MOTOR CORP/',
-    'CSCO': 'CISCO SYSTEMS, INC.',
-    'WFC': 'WELLS FARGO & COMPANY/MN',
-    'ACN': 'Accenture plc',
-    'NOW': 'ServiceNow, Inc.',
-    'AZN': 'ASTRAZENECA PLC',
-    'TMO': 'THERMO FISHER SCIENTIFIC INC.',
-    'AXP': 'AMERICAN EXPRESS CO',
-    'IBM': 'INTERNATIONAL BUSINESS MACHINES CORP',
-    'MCD': 'MCDONALDS CORP',
-    'BX': 'Blackstone Inc.',
-    'QQQ': 'INVESCO QQQ TRUST, SERIES 1',
-    'MS': 'MORGAN STANLEY',
-    'NVS': 'NOVARTIS AG',
-    'DIS': 'Walt Disney Co',
-    'LIN': 'LINDE PLC',
-    'SHEL': 'Shell plc',
-    'PEP': 'PEPSICO INC',
-    'ISRG': 'INTUITIVE SURGICAL INC',
-    'ABT': 'ABBOTT LABORATORIES',
-    'BABA': 'Alibaba Group Holding Ltd',
-    'AMD': 'ADVANCED MICRO DEVICES INC',
-    'GE': 'GENERAL ELECTRIC CO',
-    'PM': 'Philip Morris International Inc.',
-    'ADBE': 'ADOBE INC.',
-    'HSBC': 'HSBC HOLDINGS PLC',
-    'GS': 'GOLDMAN SACHS GROUP INC',
-    'INTU': 'INTUIT INC.',
-    'QCOM': 'QUALCOMM INC/DE',
-    'TXN': 'TEXAS INSTRUMENTS INC',
-    'CAT': 'CATERPILLAR INC',
-    'DHR': 'DANAHER CORP /DE/',
-    'RY': 'ROYAL BANK OF CANADA',
-    'VZ': 'VERIZON COMMUNICATIONS INC',
-    'BKNG': 'Booking Holdings Inc.',
-    'T': 'AT&T INC.',
-    'RTX': 'RTX Corp',
-    'PLTR': 'Palantir Technologies Inc.',
-    'PFE': 'PFIZER INC',
-    'HDB': 'HDFC BANK LTD',
-    'SPGI': 'S&P Global Inc.',
-    'FMX': 'MEXICAN ECONOMIC DEVELOPMENT INC',
-    'BLK': 'BlackRock, Inc.',
-    'ARM': 'ARM HOLDINGS PLC /UK',
-    'ANET': 'Arista Networks, Inc.',
-    'HON': 'HONEYWELL INTERNATIONAL INC',
-    'AMAT': 'APPLIED MATERIALS INC /DE',
-    'AMGN': 'AMGEN INC',
-    'BSX': 'BOSTON SCIENTIFIC CORP',
-    'LOW': 'LOWES COMPANIES INC',
-    'CMCSA': 'COMCAST CORP',
-    'SYK': 'STRYKER CORP',
-    'UBER': 'Uber Technologies, Inc',
-    'NEE': 'NEXTERA ENERGY INC',
-    'PGR': 'PROGRESSIVE CORP/OH/',
-    'MUFG': 'MITSUBISHI UFJ FINANCIAL GROUP INC',
-    'UNP': 'UNION PACIFIC CORP',
-    'C': 'CITIGROUP INC',
-    'ETN': 'Eaton Corp plc',
-    'TJX': 'TJX COMPANIES INC /DE/',
-    'SHOP': 'SHOPIFY INC.',
-    'SCHW': 'SCHWAB CHARLES CORP',
-    'PDD': 'PDD Holdings Inc.',
-    'COP': 'CONOCOPHILLIPS',
-    'KKR': 'KKR & Co. Inc.',
-    'BA': 'BOEING CO',
-    'TTE': 'TotalEnergies SE',
-    'EADSY': 'Airbus SE/ADR',
-    'BHP': 'BHP Group Ltd',
-    'SNY': 'Sanofi',
-    'SONY': 'Sony Group Corp',
-    'RTNTF': 'RIO TINTO LTD',
-    'ADP': 'AUTOMATIC DATA PROCESSING INC',
-    'FI': 'FISERV INC',
-    'BMY': 'BRISTOL MYERS SQUIBB CO',
-    'PANW': 'Palo Alto Networks Inc',
-    'DE': 'DEERE & CO',
-    'GILD': 'GILEAD SCIENCES, INC.',
-    'MU': 'MICRON TECHNOLOGY INC',
-    'LMT': 'LOCKHEED MARTIN CORP',
-    'APP': 'AppLovin Corp',
-    'ADI': 'ANALOG DEVICES INC',
-    'UBS': 'UBS Group AG',
-    'NKE': 'NIKE, Inc.',
-    'VRTX': 'VERTEX PHARMACEUTICALS INC / MA',
-    'UPS': 'UNITED PARCEL SERVICE INC',
-    'SBUX': 'STARBUCKS CORP',
-    'CB': 'Chubb Ltd',
-    'MDT': 'Medtronic plc',
-    'MMC': 'MARSH & MCLENNAN COMPANIES, INC.',
-    'IBN': 'ICICI BANK LTD',
-    'GEV': 'GE Vernova Inc.',
-    'MRVL': 'Marvell Technology, Inc.',
-    'LRCX': 'LAM RESEARCH CORP',
-    'CEG': 'Constellation Energy Corp',
-    'PLD': 'Prologis, Inc.',
-    'RIO': 'RIO TINTO PLC',
-    'ENB': 'ENBRIDGE INC',
-    'TD': 'TORONTO DOMINION BANK',
-    'INFY': 'Infosys Ltd',
-    'SPOT': 'Spotify Technology S.A.',
-    'AIQUY': 'L AIR LIQUIDE SA /FI',
-    'SMFG': 'SUMITOMO MITSUI FINANCIAL GROUP, INC.',
-    'KLAC': 'KLA CORP',
-    'BUD': 'Anheuser-Busch InBev SA/NV',
-    'MELI': 'MERCADOLIBRE INC',
-    'SO': 'SOUTHERN CO',
-    'ELV': 'Elevance Health, Inc.',
-    'APO': 'Apollo Global Management, Inc.',
-    'CFRUY': 'COMPAGNIE FINANCIERE RICHEMONT AG /FI',
-    'EQIX': 'EQUINIX INC',
-    'RELX': 'RELX PLC',
-    'CRWD': 'CrowdStrike Holdings, Inc.',
-    'MO': 'ALTRIA GROUP, INC.',
-    'APH': 'AMPHENOL CORP /DE/',
-    'TT': 'Trane Technologies plc',
-    'BN': 'BROOKFIELD Corp /ON/',
-    'PYPL': 'PayPal Holdings, Inc.',
-    'BP': 'BP PLC',
-    'SHW': 'SHERWIN WILLIAMS CO',
-    'INTC': 'INTEL CORP',
-    'WM': 'WASTE MANAGEMENT INC',
-    'PBR': 'PETROBRAS - PETROLEO BRASILEIRO SA',
-    'CDNS': 'CADENCE DESIGN SYSTEMS INC',
-    'CME': 'CME GROUP INC.',
-    'DUK': 'Duke Energy CORP',
-    'ICE': 'Intercontinental Exchange, Inc.',
-    'MCO': 'MOODYS CORP /DE/',
-    'MSTR': 'MICROSTRATEGY Inc',
-    'ABNB': 'Airbnb, Inc.',
-    'AMT': 'AMERICAN TOWER CORP /MA/',
-    'PH': 'PARKER HANNIFIN CORP',
-    'DELL': 'Dell Technologies Inc.',
-    'BTI': 'British American Tobacco p.l.c.',
-    'IBKR': 'Interactive Brokers Group, Inc.',
-    'TOELY': 'Tokyo Electron LTD',
-    'WELL': 'WELLTOWER INC.',
-    'CI': 'Cigna Group',
-    'CMG': 'CHIPOTLE MEXICAN GRILL INC',
-    'RACE': 'Ferrari N.V.',
-    'HCA': 'HCA Healthcare, Inc.',
-    'CTAS': 'CINTAS CORP',
-    'SNPS': 'SYNOPSYS INC',
-    'REGN': 'REGENERON PHARMACEUTICALS, INC.',
-    'MSI': 'Motorola Solutions, Inc.',
-    'AON': 'Aon plc',
-    'MDLZ': 'Mondelez International, Inc.',
-    'MAR': 'MARRIOTT INTERNATIONAL INC /MD/',
-    'PNC': 'PNC FINANCIAL SERVICES GROUP, INC.',
-    'SCCO': 'SOUTHERN COPPER CORP/',
-    'MCK': 'MCKESSON CORP',
-    'EOG': 'EOG RESOURCES INC',
-    'ZTS': 'Zoetis Inc.',
-    'USB': 'US BANCORP \DE\',
-    'FTNT': 'Fortinet, Inc.',
-    'ITW': 'ILLINOIS TOOL WORKS INC',
-    'AJG': 'Arthur J. Gallagher & Co.',
-    'GD': 'GENERAL DYNAMICS CORP',
-    'MMM': '3M CO',
-    'BMO': 'BANK OF MONTREAL /CAN/',
-    'TDG': 'TransDigm Group INC',
-    'SAN': 'Banco Santander, S.A.',
-    'DASH': 'DoorDash, Inc.',
-    'CL': 'COLGATE PALMOLIVE CO',
-    'TRI': 'THOMSON REUTERS CORP /CAN/',
-    'BNS': 'BANK OF NOVA SCOTIA',
-    'CP': 'CANADIAN PACIFIC KANSAS CITY LTD/CN',
-    'EPD': 'ENTERPRISE PRODUCTS PARTNERS L.P.',
-    'CNQ': 'CANADIAN NATURAL RESOURCES LTD',
-    'ORLY': 'O REILLY AUTOMOTIVE INC',
-    'EQNR': 'EQUINOR ASA',
-    'BDX': 'BECTON DICKINSON & CO',
-    'GSK': 'GSK plc',
-    'WMB': 'WILLIAMS COMPANIES, INC.',
-    'EMR': 'EMERSON ELECTRIC CO',
-    'COF': 'CAPITAL ONE FINANCIAL CORP',
-    'NOC': 'NORTHROP GRUMMAN CORP /DE/',
-    'WDAY': 'Workday, Inc.',
-    'ET': 'Energy Transfer LP',
-    'DEO': 'DIAGEO PLC',
-    'ECL': 'ECOLAB INC.',
-    'FDX': 'FEDEX CORP',
-    'APD': 'Air Products & Chemicals, Inc.',
-    'COIN': 'Coinbase Global, Inc.',
-    'TGT': 'TARGET CORP',
-    'RSG': 'REPUBLIC SERVICES, INC.',
-    'GLD': 'SPDR GOLD TRUST',
-    'SHECY': 'Shin-Etsu Chemical Co., Ltd.',
-    'SPG': 'SIMON PROPERTY GROUP INC /DE/',
-    'TEAM': 'Atlassian Corp',
-    'CNI': 'CANADIAN NATIONAL RAILWAY CO',
-    'SE': 'Sea Ltd',
-    'KMI': 'KINDER MORGAN, INC.',
-    'CRH': 'CRH PUBLIC LTD CO',
-    'ADSK': 'Autodesk, Inc.',
-    'CSX': 'CSX CORP',
-    'MFG': 'MIZUHO FINANCIAL GROUP INC',
-    'RCL': 'ROYAL CARIBBEAN CRUISES LTD',
-    'CVS': 'CVS HEALTH Corp',
-    'CARR': 'CARRIER GLOBAL Corp',
-    'NTES': 'NetEase, Inc.',
-    'BBVA': 'BANCO BILBAO VIZCAYA ARGENTARIA, S.A.',
-    'CM': 'CANADIAN IMPERIAL BANK OF COMMERCE /CAN/',
-    'HLT': 'Hilton Worldwide Holdings Inc.',
-    'DLR': 'DIGITAL REALTY TRUST, INC.',
-    'OKE': 'ONEOK INC /NEW/',
-    'TTD': 'Trade Desk, Inc.',
-    'VST': 'Vistra Corp.',
-    'TFC': 'TRUIST FINANCIAL CORP',
-    'AFL': 'AFLAC INC',
-    'FCX': 'FREEPORT-MCMORAN INC',
-    'PCAR': 'PACCAR INC',
-    'ARES': 'Ares Management Corp',
-    'MET': 'METLIFE INC',
-    'BK': 'Bank of New York Mellon Corp',
-    'GM': 'General Motors Co',
-    'NGG': 'NATIONAL GRID PLC',
-    'AZO': 'AUTOZONE INC',
-    'SLB': 'SCHLUMBERGER LIMITED/NV',
-    'MBGYY': 'DAIMLER AG',
-    'PTCAY': 'PT Chandra Asri Petrochemical Tbk/ADR',
-    'ROP': 'ROPER TECHNOLOGIES INC',
-    'GLNCY': 'Glencore plc/ADR',
-    'CPRT': 'COPART INC',
-    'SNOW': 'Snowflake Inc.',
-    'TRV': 'TRAVELERS COMPANIES, INC.',
-    'NSC': 'NORFOLK SOUTHERN CORP',
-    'NU': 'Nu Holdings Ltd.',
-    'JD': 'JD.com, Inc.',
-    'NXPI': 'NXP Semiconductors N.V.',
-    'GBTC': 'Grayscale Bitcoin Trust ETF',
-    'JCI': 'Johnson Controls International plc',
-    'MFC': 'MANULIFE FINANCIAL CORP',
-    'SQ': 'Block, Inc.',
-    'GWW': 'W.W. GRAINGER, INC.',
-    'FANG': 'Diamondback Energy, Inc.',
-    'PSA': 'Public Storage',
-    'LNG': 'Cheniere Energy, Inc.',
-    'AMP': 'AMERIPRISE FINANCIAL INC',
-    'ROST': 'ROSS STORES, INC.',
-    'PAYX': 'PAYCHEX INC',
-    'SRE': 'SEMPRA',
-    'AEP': 'AMERICAN ELECTRIC POWER CO INC',
-    'SU': 'SUNCOR ENERGY INC',
-    'IAU': 'ISHARES GOLD TRUST',
-    'MPLX': 'MPLX LP',
-    'CMI': 'CUMMINS INC',
-    'BMWKY': 'Bayerische Motoren Werke AG/ADR',
-    'TRP': 'TC ENERGY CORP',
-    'MNST': 'Monster Beverage Corp',
-    'VRT': 'Vertiv Holdings Co',
-    'OXY': 'OCCIDENTAL PETROLEUM CORP /DE/',
-    'ING': 'ING GROEP NV',
-    'LULU': 'lululemon athletica inc.',
-    'ALL': 'ALLSTATE CORP',
-    'CHTR': 'CHARTER COMMUNICATIONS, INC. /MO/',
-    'ATEYY': 'ADVANTEST CORP',
-    'DDOG': 'Datadog, Inc.',
-    'CTA-PA': 'EIDP, Inc.',
-    'FICO': 'FAIR ISAAC CORP',
-    'PSX': 'Phillips 66',
-    'ITUB': 'Itau Unibanco Holding S.A.',
-    'PWR': 'QUANTA SERVICES, INC.',
-    'BCS': 'BARCLAYS PLC',
-    'HWM': 'Howmet Aerospace Inc.',
-    'COR': 'Cencora, Inc.',
-    'FLUT': 'Flutter Entertainment plc',
-    'MPC': 'Marathon Petroleum Corp',
-    'WCN': 'Waste Connections, Inc.',
-    'O': 'REALTY INCOME CORP',
-    'MSCI': 'MSCI Inc.',
-    'D': 'DOMINION ENERGY, INC',
-    'HMC': 'HONDA MOTOR CO LTD',
-    'NEM': 'NEWMONT Corp /DE/',
-    'BAESY': 'BAE SYSTEMS PLC /FI/',
-    'AIG': 'AMERICAN INTERNATIONAL GROUP, INC.',
-    'DHI': 'HORTON D R INC /DE/',
-    'URI': 'UNITED RENTALS, INC.',
-    'HES': 'HESS CORP',
-    'E': 'ENI SPA',
-    'NDAQ': 'NASDAQ, INC.',
-    'EW': 'Edwards Lifesciences Corp',
-    'AXON': 'AXON ENTERPRISE, INC.',
-    'DAL': 'DELTA AIR LINES, INC.',
-    'KR': 'KROGER CO',
-    'AEM': 'AGNICO EAGLE MINES LTD',
-    'DFS': 'Discover Financial Services',
-    'CAIXY': 'CaixaBank/ADR',
-    'BKR': 'Baker Hughes Co',
-    'AMX': 'AMERICA MOVIL SAB DE CV/',
-    'PEG': 'PUBLIC SERVICE ENTERPRISE GROUP INC',
-    'TRGP': 'Targa Resources Corp.',
-    'TEL': 'TE Connectivity plc',
-    'CRARY': 'CREDIT AGRICOLE S A',
-    'FIS': 'Fidelity National Information Services, Inc.',
-    'KMB': 'KIMBERLY CLARK CORP',
-    'ALC': 'ALCON INC',
-    'HLN': 'Haleon plc',
-    'KDP': 'Keurig Dr Pepper Inc.',
-    'TAK': 'TAKEDA PHARMACEUTICAL CO LTD',
-    'TCOM': 'Trip.com Group Ltd',
-    'FAST': 'FASTENAL CO',
-    'AME': 'AMETEK INC/',
-    'PRU': 'PRUDENTIAL FINANCIAL INC',
-    'SVNDY': 'SEVEN & I HOLDINGS CO LTD',
-    'RBLX': 'Roblox Corp',
-    'GLW': 'CORNING INC /NY',
-    'GRMN': 'GARMIN LTD',
-    'VLO': 'VALERO ENERGY CORP/TX',
-    'KVUE': 'Kenvue Inc.',
-    'WTKWY': 'WOLTERS KLUWER N V /FI',
-    'ARGX': 'ARGENX SE',
-    'LYG': 'Lloyds Banking Group plc',
-    'LHX': 'L3HARRIS TECHNOLOGIES, INC. /DE/',
-    'A': 'AGILENT TECHNOLOGIES, INC.',
-    'CTVA': 'Corteva, Inc.',
-    'DNZOY': 'Denso Corp',
-    'GEHC': 'GE HealthCare Technologies Inc.',
-    'CPNG': 'Coupang, Inc.',
-    'F': 'FORD MOTOR CO',
-    'NET': 'Cloudflare, Inc.',
-    'PCG': 'PG&E Corp',
-    'VRSK': 'Verisk Analytics, Inc.',
-    'IT': 'GARTNER INC',
-    'EXC': 'EXELON CORP',
-    'ODFL': 'OLD DOMINION FREIGHT LINE, INC.',
-    'CBRE': 'CBRE GROUP, INC.',
-    'CTSH': 'COGNIZANT TECHNOLOGY SOLUTIONS CORP',
-    'EA': 'ELECTRONIC ARTS INC.',
-    'NWG': 'NatWest Group plc',
-    'IQV': 'IQVIA HOLDINGS INC.',
-    'WIT': 'WIPRO LTD',
-    'CCI': 'CROWN CASTLE INC.',
-    'XEL': 'XCEL ENERGY INC',
-    'VALE': 'Vale S.A.',
-    'HUBS': 'HUBSPOT INC',
-    'STLA': 'Stellantis N.V.',
-    'OTIS': 'Otis Worldwide Corp',
-    'SYY': 'SYSCO CORP',
-    'HOOD': 'Robinhood Markets, Inc.',
-    'VEEV': 'VEEVA SYSTEMS INC',
-    'UAL': 'United Airlines Holdings, Inc.',
-    'LEN': 'LENNAR CORP /NEW/',
-    'IR': 'Ingersoll Rand Inc.',
-    'IMO': 'IMPERIAL OIL LTD',
-    'KHC': 'Kraft Heinz Co',
-    'YUM': 'YUM BRANDS INC',
-    'CCEP': 'COCA-COLA EUROPACIFIC PARTNERS plc',
-    'OLCLY': 'Oriental Land Co., Ltd./ADR',
-    'IDXX': 'IDEXX LABORATORIES INC /DE',
-    'RMD': 'RESMED INC',
-    'LVS': 'LAS VEGAS SANDS CORP',
-    'DB': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'FERG': 'Ferguson Enterprises Inc. /DE/',
-    'DIA': 'SPDR DOW JONES INDUSTRIAL AVERAGE ETF TRUST',
-    'ACGL': 'ARCH CAPITAL GROUP LTD.',
-    'DKILY': 'Daikin Industries Ltd',
-    'OWL': 'BLUE OWL CAPITAL INC.',
-    'VMC': 'Vulcan Materials CO',
-    'SLF': 'SUN LIFE FINANCIAL INC',
-    'DSCSY': 'Disco Corporation/ADR',
-    'STZ': 'CONSTELLATION BRANDS, INC.',
-    'ETR': 'ENTERGY CORP /DE/',
-    'HUM': 'HUMANA INC',
-    'WAB': 'WESTINGHOUSE AIR BRAKE TECHNOLOGIES CORP',
-    'EXR': 'Extra Space Storage Inc.',
-    'PPERY': 'PT Bank Mandiri (Persero) Tbk / ADR',
-    'GIS': 'GENERAL MILLS INC',
-    'HSY': 'HERSHEY CO',
-    'EBAY': 'EBAY INC',
-    'CCL': 'CARNIVAL CORP',
-    'DECK': 'DECKERS OUTDOOR CORP',
-    'WTW': 'WILLIS TOWERS WATSON PLC',
-    'RJF': 'RAYMOND JAMES FINANCIAL INC',
-    'TTWO': 'TAKE TWO INTERACTIVE SOFTWARE INC',
-    'ANYYY': 'Aena S.A./ADR',
-    'MDY': 'SPDR S&P MIDCAP 400 ETF TRUST',
-    'CNC': 'CENTENE CORP',
-    'MTB': 'M&T BANK CORP',
-    'MLM': 'MARTIN MARIETTA MATERIALS INC',
-    'HPQ': 'HP INC',
-    'ROK': 'ROCKWELL AUTOMATION, INC',
-    'HIG': 'HARTFORD FINANCIAL SERVICES GROUP, INC.',
-    'FRFHF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'ED': 'CONSOLIDATED EDISON INC',
-    'DD': 'DuPont de Nemours, Inc.',
-    'DXCM': 'DEXCOM INC',
-    'ALNY': 'ALNYLAM PHARMACEUTICALS, INC.',
-    'EFX': 'EQUIFAX INC',
-    'GWLIF': 'GREAT-WEST LIFECO INC.',
-    'AVB': 'AVALONBAY COMMUNITIES INC',
-    'VICI': 'VICI PROPERTIES INC.',
-    'IRM': 'IRON MOUNTAIN INC',
-    'MCHP': 'MICROCHIP TECHNOLOGY INC',
-    'HPE': 'Hewlett Packard Enterprise Co',
-    'LYV': 'Live Nation Entertainment, Inc.',
-    'TPL': 'Texas Pacific Land Corp',
-    'ANSS': 'ANSYS INC',
-    'WDS': 'WOODSIDE ENERGY GROUP LTD',
-    'WEC': 'WEC ENERGY GROUP, INC.',
-    'FER': 'Ferrovial SE',
-    'RDDT': 'Reddit, Inc.',
-    'CAH': 'CARDINAL HEALTH INC',
-    'BSBR': 'Banco Santander (Brasil) S.A.',
-    'TSCO': 'TRACTOR SUPPLY CO /DE/',
-    'MRAAY': 'Murata Manufacturing Co., Ltd./ADR',
-    'BNTX': 'BioNTech SE',
-    'ZS': 'Zscaler, Inc.',
-    'EQT': 'EQT Corp',
-    'BRO': 'BROWN & BROWN, INC.',
-    'PPRUY': 'Kering',
-    'ABEV': 'AMBEV S.A.',
-    'MPWR': 'MONOLITHIC POWER SYSTEMS INC',
-    'TW': 'Tradeweb Markets Inc.',
-    'CSGP': 'COSTAR GROUP, INC.',
-    'FCNCA': 'FIRST CITIZENS BANCSHARES INC /DE/',
-    'CHT': 'CHUNGHWA TELECOM CO LTD',
-    'CUK': 'CARNIVAL PLC',
-    'CVE': 'CENOVUS ENERGY INC.',
-    'K': 'KELLANOVA',
-    'KEYS': 'Keysight Technologies, Inc.',
-    'GOLD': 'BARRICK GOLD CORP',
-    'XYL': 'Xylem Inc.',
-    'STT': 'STATE STREET CORP',
-    'NUE': 'NUCOR CORP',
-    'QSR': 'Restaurant Brands International Inc.',
-    'FITB': 'FIFTH THIRD BANCORP',
-    'HEI': 'HEICO CORP',
-    'BIDU': 'Baidu, Inc.',
-    'ERIC': 'ERICSSON LM TELEPHONE CO',
-    'GDDY': 'GoDaddy Inc.',
-    'DOW': 'DOW INC.',
-    'CQP': 'Cheniere Energy Partners, L.P.',
-    'SW': 'Smurfit Westrock plc',
-    'GPN': 'GLOBAL PAYMENTS INC',
-    'NTDTY': 'NTT Data Corp',
-    'EQR': 'EQUITY RESIDENTIAL',
-    'PPG': 'PPG INDUSTRIES INC',
-    'WPM': 'Wheaton Precious Metals Corp.',
-    'FTV': 'Fortive Corp',
-    'BR': 'BROADRIDGE FINANCIAL SOLUTIONS, INC.',
-    'PUBGY': 'PUBLICIS GROUPE SA',
-    'EL': 'ESTEE LAUDER COMPANIES INC',
-    'NVZMY': 'NOVOZYMES AS/FI',
-    'MTD': 'METTLER TOLEDO INTERNATIONAL INC/',
-    'FUJIY': 'FUJI PHOTO FILM CO LTD /FI',
-    'EIX': 'EDISON INTERNATIONAL',
-    'DOV': 'DOVER Corp',
-    'SYF': 'Synchrony Financial',
-    'CHD': 'CHURCH & DWIGHT CO INC /DE/',
-    'VLTO': 'Veralto Corp',
-    'LPLA': 'LPL Financial Holdings Inc.',
-    'DTE': 'DTE ENERGY CO',
-    'IOT': 'Samsara Inc.',
-    'FNV': 'FRANCO NEVADA Corp',
-    'CDW': 'CDW Corp',
-    'ADM': 'Archer-Daniels-Midland Co',
-    'NOK': 'NOKIA CORP',
-    'CPAY': 'CORPAY, INC.',
-    'WSM': 'WILLIAMS SONOMA INC',
-    'ZM': 'Zoom Communications, Inc.',
-    'GIB': 'CGI INC',
-    'SMPNY': 'Sompo Japan Nipponkoa Holdings, Inc./ADR',
-    'PHG': 'KONINKLIJKE PHILIPS NV',
-    'NVR': 'NVR INC',
-    'WST': 'WEST PHARMACEUTICAL SERVICES INC',
-    'TROW': 'PRICE T ROWE GROUP INC',
-    'VTR': 'Ventas, Inc.',
-    'NTR': 'Nutrien Ltd.',
-    'TYL': 'TYLER TECHNOLOGIES INC',
-    'FANUY': 'Fanuc Ltd',
-    'TEVA': 'TEVA PHARMACEUTICAL INDUSTRIES LTD',
-    'WBD': 'Warner Bros. Discovery, Inc.',
-    'HAL': 'HALLIBURTON CO',
-    'DVN': 'DEVON ENERGY CORP/DE',
-    'AWK': 'American Water Works Company, Inc.',
-    'EXE': 'EXPAND ENERGY Corp',
-    'NTAP': 'NetApp, Inc.',
-    'LYB': 'LyondellBasell Industries N.V.',
-    'AEE': 'AMEREN CORP',
-    'PPL': 'PPL Corp',
-    'RYAAY': 'RYANAIR HOLDINGS PLC',
-    'HBAN': 'HUNTINGTON BANCSHARES INC /MD/',
-    'EXPE': 'Expedia Group, Inc.',
-    'NTRA': 'Natera, Inc.',
-    'ON': 'ON SEMICONDUCTOR CORP',
-    'TPG': 'TPG Inc.',
-    'LI': 'Li Auto Inc.',
-    'ASX': 'ASE Technology Holding Co., Ltd.',
-    'GFS': 'GLOBALFOUNDRIES Inc.',
-    'IX': 'ORIX CORP',
-    'KB': 'KB Financial Group Inc.',
-    'HUBB': 'HUBBELL INC',
-    'WAT': 'WATERS CORP /DE/',
-    'CVNA': 'CARVANA CO.',
-    'TEF': 'TELEFONICA S A',
-    'STM': 'STMicroelectronics N.V.',
-    'ROL': 'ROLLINS INC',
-    'FE': 'FIRSTENERGY CORP',
-    'BAM': 'Brookfield Asset Management Ltd.',
-    'PHM': 'PULTEGROUP INC/MI/',
-    'DIDIY': 'DiDi Global Inc.',
-    'PTC': 'PTC INC.',
-    'TECK': 'TECK RESOURCES LTD',
-    'LII': 'LENNOX INTERNATIONAL INC',
-    'TER': 'TERADYNE, INC',
-    'WDC': 'WESTERN DIGITAL CORP',
-    'WRB': 'BERKLEY W R CORP',
-    'BIIB': 'BIOGEN INC.',
-    'ILMN': 'ILLUMINA, INC.',
-    'UI': 'Ubiquiti Inc.',
-    'FOXA': 'Fox Corp',
-    'CCJ': 'CAMECO CORP',
-    'EME': 'EMCOR Group, Inc.',
-    'NJDCY': 'NIDEC CORP',
-    'MKL': 'MARKEL GROUP INC.',
-    'ATO': 'ATMOS ENERGY CORP',
-    'TDY': 'TELEDYNE TECHNOLOGIES INC',
-    'CINF': 'CINCINNATI FINANCIAL CORP',
-    'DRI': 'DARDEN RESTAURANTS INC',
-    'YPF': 'YPF SOCIEDAD ANONIMA',
-    'SNAP': 'Snap Inc',
-    'PSTG': 'Pure Storage, Inc.',
-    'PBA': 'PEMBINA PIPELINE CORP',
-    'TS': 'TENARIS SA',
-    'BCE': 'BCE INC',
-    'RF': 'REGIONS FINANCIAL CORP',
-    'PINS': 'PINTEREST, INC.',
-    'VOD': 'VODAFONE GROUP PUBLIC LTD CO',
-    'IFF': 'INTERNATIONAL FLAVORS & FRAGRANCES INC',
-    'SBAC': 'SBA COMMUNICATIONS CORP',
-    'ZBH': 'ZIMMER BIOMET HOLDINGS, INC.',
-    'ALAB': 'Astera Labs, Inc.',
-    'ES': 'EVERSOURCE ENERGY',
-    'RKT': 'Rocket Companies, Inc.',
-    'PKG': 'PACKAGING CORP OF AMERICA',
-    'CTRA': 'Coterra Energy Inc.',
-    'FTS': 'Fortis Inc.',
-    'CNP': 'CENTERPOINT ENERGY INC',
-    'ONC': 'BeiGene, Ltd.',
-    'TU': 'TELUS CORP',
-    'ERIE': 'ERIE INDEMNITY CO',
-    'STE': 'STERIS plc',
-    'TOST': 'Toast, Inc.',
-    'NRG': 'NRG ENERGY, INC.',
-    'FSLR': 'FIRST SOLAR, INC.',
-    'CBOE': 'Cboe Global Markets, Inc.',
-    'VRSN': 'VERISIGN INC/CA',
-    'CHKP': 'CHECK POINT SOFTWARE TECHNOLOGIES LTD',
-    'BEKE': 'KE Holdings Inc.',
-    'LUV': 'SOUTHWEST AIRLINES CO',
-    'LDOS': 'Leidos Holdings, Inc.',
-    'WY': 'WEYERHAEUSER CO',
-    'ZBRA': 'ZEBRA TECHNOLOGIES CORP',
-    'NTRS': 'NORTHERN TRUST CORP',
-    'PUK': 'PRUDENTIAL PLC',
-    'MDB': 'MongoDB, Inc.',
-    'CLX': 'CLOROX CO /DE/',
-    'ULTA': 'Ulta Beauty, Inc.',
-    'CMS': 'CMS ENERGY CORP',
-    'SGSOY': 'SGS SOCIETE GENERALE DE SURVEILLANCE HOLDING SA /FI',
-    'LH': 'LABCORP HOLDINGS INC.',
-    'IHG': 'INTERCONTINENTAL HOTELS GROUP PLC /NEW/',
-    'DKNG': 'DraftKings Inc.',
-    'TSN': 'TYSON FOODS, INC.',
-    'MKC': 'MCCORMICK & CO INC',
-    'CFG': 'CITIZENS FINANCIAL GROUP INC/RI',
-    'EJPRY': 'EAST JAPAN RAILWAY CO /FI',
-    'PODD': 'INSULET CORP',
-    'YAHOY': 'Yahoo! Japan Corp',
-    'SMCI': 'Super Micro Computer, Inc.',
-    'DKS': 'DICK'S SPORTING GOODS, INC.',
-    'VIK': 'Viking Holdings Ltd',
-    'IP': 'INTERNATIONAL PAPER CO /NEW/',
-    'WSO': 'WATSCO INC',
-    'STX': 'Seagate Technology Holdings plc',
-    'KSPI': 'Joint Stock Co Kaspi.kz',
-    'INVH': 'Invitation Homes Inc.',
-    'SSNC': 'SS&C Technologies Holdings Inc',
-    'BBD': 'BANK BRADESCO',
-    'KEY': 'KEYCORP /NEW/',
-    'DOCU': 'DOCUSIGN, INC.',
-    'BURL': 'Burlington Stores, Inc.',
-    'ESS': 'ESSEX PROPERTY TRUST, INC.',
-    'ONON': 'On Holding AG',
-    'FTAI': 'FTAI Aviation Ltd.',
-    'GRAB': 'Grab Holdings Ltd',
-    'CG': 'Carlyle Group Inc.',
-    'ICLR': 'ICON PLC',
-    'TME': 'Tencent Music Entertainment Group',
-    'AER': 'AerCap Holdings N.V.',
-    'COO': 'COOPER COMPANIES, INC.',
-    'BBY': 'BEST BUY CO INC',
-    'MAA': 'MID AMERICA APARTMENT COMMUNITIES INC.',
-    'JBHT': 'HUNT J B TRANSPORT SERVICES INC',
-    'L': 'LOEWS CORP',
-    'STLD': 'STEEL DYNAMICS INC',
-    'RPRX': 'Royalty Pharma plc',
-    'CJPRY': 'CENTRAL JAPAN RAILWAY CO',
-    'SNA': 'Snap-on Inc',
-    'GFL': 'GFL Environmental Inc.',
-    'EC': 'ECOPETROL S.A.',
-    'PFG': 'PRINCIPAL FINANCIAL GROUP INC',
-    'AFRM': 'Affirm Holdings, Inc.',
-    'PHYS': 'Sprott Physical Gold Trust',
-    'JBL': 'JABIL INC',
-    'FDS': 'FACTSET RESEARCH SYSTEMS INC',
-    'MT': 'ArcelorMittal',
-    'TRMB': 'TRIMBLE INC.',
-    'DGX': 'QUEST DIAGNOSTICS INC',
-    'SHG': 'SHINHAN FINANCIAL GROUP CO LTD',
-    'CRBG': 'Corebridge Financial, Inc.',
-    'CYBR': 'CyberArk Software Ltd.',
-    'BAH': 'Booz Allen Hamilton Holding Corp',
-    'TRU': 'TransUnion',
-    'NI': 'NISOURCE INC.',
-    'AS': 'Amer Sports, Inc.',
-    'ZG': 'ZILLOW GROUP, INC.',
-    'CSL': 'CARLISLE COMPANIES INC',
-    'NTNX': 'Nutanix, Inc.',
-    'ARE': 'ALEXANDRIA REAL ESTATE EQUITIES, INC.',
-    'TWLO': 'TWILIO INC',
-    'GEN': 'Gen Digital Inc.',
-    'NMR': 'NOMURA HOLDINGS INC',
-    'HRL': 'HORMEL FOODS CORP /DE/',
-    'J': 'JACOBS SOLUTIONS INC.',
-    'RBA': 'RB GLOBAL INC.',
-    'HOLX': 'HOLOGIC INC',
-    'MOH': 'MOLINA HEALTHCARE, INC.',
-    'RYAN': 'RYAN SPECIALTY HOLDINGS, INC.',
-    'UTHR': 'UNITED THERAPEUTICS Corp',
-    'MANH': 'MANHATTAN ASSOCIATES INC',
-    'MRNA': 'Moderna, Inc.',
-    'BLDR': 'Builders FirstSource, Inc.',
-    'GPC': 'GENUINE PARTS CO',
-    'OMC': 'OMNICOM GROUP INC.',
-    'TLK': 'PERUSAHAAN PERSEROAN PERSERO PT TELEKOMUNIKASI INDONESIA TBK',
-    'BF-A': 'BROWN FORMAN CORP',
-    'PNR': 'PENTAIR plc',
-    'SUI': 'SUN COMMUNITIES INC',
-    'NWSA': 'NEWS CORP',
-    'YUMC': 'Yum China Holdings, Inc.',
-    'ALGN': 'ALIGN TECHNOLOGY INC',
-    'AZPN': 'Aspen Technology, Inc.',
-    'USFD': 'US Foods Holding Corp.',
-    'RCI': 'ROGERS COMMUNICATIONS INC',
-    'DLTR': 'DOLLAR TREE, INC.',
-    'TPR': 'TAPESTRY, INC.',
-    'FLEX': 'FLEX LTD.',
-    'KOF': 'COCA COLA FEMSA SAB DE CV',
-    'FIX': 'COMFORT SYSTEMS USA INC',
-    'DG': 'DOLLAR GENERAL CORP',
-    'XPO': 'XPO, Inc.',
-    'IEX': 'IDEX CORP /DE/',
-    'BALL': 'BALL Corp',
-    'MAS': 'MASCO CORP /DE/',
-    'RPM': 'RPM INTERNATIONAL INC/DE/',
-    'UMC': 'UNITED MICROELECTRONICS CORP',
-    'CF': 'CF Industries Holdings, Inc.',
-    'EG': 'EVEREST GROUP, LTD.',
-    'SOFI': 'SoFi Technologies, Inc.',
-    'EXPD': 'EXPEDITORS INTERNATIONAL OF WASHINGTON INC',
-    'DT': 'Dynatrace, Inc.',
-    'UDR': 'UDR, Inc.',
-    'WMG': 'Warner Music Group Corp.',
-    'EQH': 'Equitable Holdings, Inc.',
-    'SYM': 'Symbotic Inc.',
-    'ENTG': 'ENTEGRIS INC',
-    'FFIV': 'F5, INC.',
-    'SN': 'SharkNinja, Inc.',
-    'WES': 'Western Midstream Partners, LP',
-    'BAX': 'BAXTER INTERNATIONAL INC',
-    'AVY': 'Avery Dennison Corp',
-    'AMH': 'American Homes 4 Rent',
-    'HACBY': 'HACHIJUNI BANK LTD',
-    'FNF': 'Fidelity National Financial, Inc.',
-    'ARCC': 'ARES CAPITAL CORP',
-    'RL': 'RALPH LAUREN CORP',
-    'AVTR': 'Avantor, Inc.',
-    'CHWY': 'Chewy, Inc.',
-    'KIM': 'KIMCO REALTY CORP',
-    'JEF': 'Jefferies Financial Group Inc.',
-    'GME': 'GameStop Corp.',
-    'H': 'Hyatt Hotels Corp',
-    'SWKS': 'SKYWORKS SOLUTIONS, INC.',
-    'LNT': 'ALLIANT ENERGY CORP',
-    'BIP': 'Brookfield Infrastructure Partners L.P.',
-    'BEP': 'Brookfield Renewable Partners L.P.',
-    'RS': 'RELIANCE, INC.',
-    'OKTA': 'Okta, Inc.',
-    'OC': 'Owens Corning',
-    'GWRE': 'Guidewire Software, Inc.',
-    'ZTO': 'ZTO Express (Cayman) Inc.',
-    'BAP': 'CREDICORP LTD',
-    'NBIX': 'NEUROCRINE BIOSCIENCES INC',
-    'WLK': 'WESTLAKE CORP',
-    'RIVN': 'Rivian Automotive, Inc. / DE',
-    'RGA': 'REINSURANCE GROUP OF AMERICA INC',
-    'CNH': 'CNH Industrial N.V.',
-    'GMAB': 'GENMAB A/S',
-    'KKPNY': 'KONINKLIJKE KPN N V',
-    'ACM': 'AECOM',
-    'WLMIY': 'Wilmar International Ltd',
-    'TXT': 'TEXTRON INC',
-    'CASY': 'CASEYS GENERAL STORES INC',
-    'DUOL': 'Duolingo, Inc.',
-    'VTRS': 'Viatris Inc',
-    'APTV': 'Aptiv PLC',
-    'LINE': 'Lineage, Inc.',
-    'BSY': 'BENTLEY SYSTEMS INC',
-    'DPZ': 'DOMINOS PIZZA INC',
-    'RVTY': 'REVVITY, INC.',
-    'COHR': 'COHERENT CORP.',
-    'EVRG': 'Evergy, Inc.',
-    'SFM': 'Sprouts Farmers Market, Inc.',
-    'DOC': 'HEALTHPEAK PROPERTIES, INC.',
-    'GFI': 'GOLD FIELDS LTD',
-    'AMCR': 'Amcor plc',
-    'GGG': 'GRACO INC',
-    'INCY': 'INCYTE CORP',
-    'MORN': 'Morningstar, Inc.',
-    'FTI': 'TechnipFMC plc',
-    'AKAM': 'AKAMAI TECHNOLOGIES INC',
-    'RKLB': 'Rocket Lab USA, Inc.',
-    'PKX': 'POSCO HOLDINGS INC.',
-    'JHX': 'James Hardie Industries plc',
-    'FMS': 'Fresenius Medical Care AG',
-    'BZLFY': 'BUNZL PLC',
-    'CW': 'CURTISS WRIGHT CORP',
-    'PAA': 'PLAINS ALL AMERICAN PIPELINE LP',
-    'CAVA': 'CAVA GROUP, INC.',
-    'PFGC': 'Performance Food Group Co',
-    'KGC': 'KINROSS GOLD CORP',
-    'JBAXY': 'Julius Baer Group Ltd.',
-    'UNM': 'Unum Group',
-    'AU': 'AngloGold Ashanti PLC',
-    'ESLT': 'ELBIT SYSTEMS LTD',
-    'RNR': 'RENAISSANCERE HOLDINGS LTD',
-    'SMMT': 'Summit Therapeutics Inc.',
-    'OMVKY': 'OMV AKTIENGESELLSCHAFT /FI',
-    'LOGI': 'LOGITECH INTERNATIONAL S.A.',
-    'MBLY': 'Mobileye Global Inc.',
-    'EWBC': 'EAST WEST BANCORP INC',
-    'RDY': 'DR REDDYS LABORATORIES LTD',
-    'JBSAY': 'JBS S.A.',
-    'ELS': 'EQUITY LIFESTYLE PROPERTIES INC',
-    'EPAM': 'EPAM Systems, Inc.',
-    'EDPFY': 'EDP ENERGIAS DE PORTUGAL SA',
-    'BMRN': 'BIOMARIN PHARMACEUTICAL INC',
-    'JNPR': 'JUNIPER NETWORKS INC',
-    'BJ': 'BJ's Wholesale Club Holdings, Inc.',
-    'DVA': 'DAVITA INC.',
-    'RKUNY': 'Rakuten Group, Inc.',
-    'REG': 'REGENCY CENTERS CORP',
-    'PANDY': 'Pandora A/S / ADR',
-    'EBR': 'BRAZILIAN ELECTRIC POWER CO',
-    'GLPI': 'Gaming & Leisure Properties, Inc.',
-    'CAG': 'CONAGRA BRANDS INC.',
-    'JKHY': 'JACK HENRY & ASSOCIATES INC',
-    'VIV': 'TELEFONICA BRASIL S.A.',
-    'GGAL': 'GRUPO FINANCIERO GALICIA SA',
-    'SUZ': 'Suzano S.A.',
-    'CNA': 'CNA FINANCIAL CORP',
-    'POOL': 'POOL CORP',
-    'CLH': 'CLEAN HARBORS INC',
-    'CRDO': 'Credo Technology Group Holding Ltd',
-    'TOL': 'Toll Brothers, Inc.',
-    'SWK': 'STANLEY BLACK & DECKER, INC.',
-    'THC': 'TENET HEALTHCARE CORP',
-    'CLS': 'CELESTICA INC',
-    'LAMR': 'LAMAR ADVERTISING CO/NEW',
-    'SGIOY': 'SHIONOGI & CO LTD',
-    'KMX': 'CARMAX INC',
-    'PR': 'Permian Resources Corp',
-    'CHRW': 'C. H. ROBINSON WORLDWIDE, INC.',
-    'HST': 'HOST HOTELS & RESORTS, INC.',
-    'AUR': 'Aurora Innovation, Inc.',
-    'UHS': 'UNIVERSAL HEALTH SERVICES INC',
-    'WIX': 'Wix.com Ltd.',
-    'AAL': 'American Airlines Group Inc.',
-    'BXP': 'BXP, Inc.',
-    'AR': 'ANTERO RESOURCES Corp',
-    'TXRH': 'Texas Roadhouse, Inc.',
-    'SAIA': 'SAIA INC',
-    'UHAL': 'U-Haul Holding Co /NV/',
-    'SRPT': 'Sarepta Therapeutics, Inc.',
-    'HLI': 'HOULIHAN LOKEY, INC.',
-    'GMED': 'GLOBUS MEDICAL INC',
-    'WPC': 'W. P. Carey Inc.',
-    'RTO': 'RENTOKIL INITIAL PLC /FI',
-    'PRMB': 'Primo Brands Corp',
-    'CIEN': 'CIENA CORP',
-    'RBRK': 'Rubrik, Inc.',
-    'MMYT': 'MakeMyTrip Ltd',
-    'NDEKY': 'NITTO DENKO CORP / ADR/',
-    'TECH': 'BIO-TECHNE Corp',
-    'CPT': 'CAMDEN PROPERTY TRUST',
-    'INSM': 'INSMED Inc',
-    'SOLV': 'Solventum Corp',
-    'PAYC': 'Paycom Software, Inc.',
-    'RADX': 'Radiopharm Theranostics Ltd',
-    'ACI': 'Albertsons Companies, Inc.',
-    'ROKU': 'ROKU, INC',
-    'BCH': 'BANK OF CHILE',
-    'TKHVY': 'Turk Hava Yollari A.O.',
-    'XPEV': 'XPENG INC.',
-    'SSMXY': 'Sysmex Corporation/ADR',
-    'TKO': 'TKO Group Holdings, Inc.',
-    'NNGRY': 'NN Group NV/ADR',
-    'OVV': 'Ovintiv Inc.',
-    'MTZ': 'MASTEC INC',
-    'SNX': 'TD SYNNEX CORP',
-    'BG': 'Bunge Global SA',
-    'POAHY': 'Porsche Automobil Holding SE / ADR',
-    'ITT': 'ITT INC.',
-    'CART': 'Maplebear Inc.',
-    'NVT': 'nVent Electric plc',
-    'MGA': 'MAGNA INTERNATIONAL INC',
-    'NDSN': 'NORDSON CORP',
-    'CPB': 'CAMPBELL'S Co',
-    'TFII': 'TFI International Inc.',
-    'NCLH': 'Norwegian Cruise Line Holdings Ltd.',
-    'JLL': 'JONES LANG LASALLE INC',
-    'PCOR': 'PROCORE TECHNOLOGIES, INC.',
-    'SCI': 'SERVICE CORP INTERNATIONAL',
-    'JPXGY': 'Japan Exchange Group, Inc./ADR',
-    'DAY': 'Dayforce, Inc.',
-    'TTEK': 'TETRA TECH INC',
-    'COKE': 'Coca-Cola Consolidated, Inc.',
-    'PPC': 'PILGRIMS PRIDE CORP',
-    'ALLE': 'Allegion plc',
-    'AFG': 'AMERICAN FINANCIAL GROUP INC',
-    'MEDP': 'Medpace Holdings, Inc.',
-    'YMM': 'Full Truck Alliance Co. Ltd.',
-    'MNDY': 'monday.com Ltd.',
-    'TAP': 'MOLSON COORS BEVERAGE CO',
-    'SJM': 'J M SMUCKER Co',
-    'BIRK': 'Birkenstock Holding plc',
-    'FHN': 'FIRST HORIZON CORP',
-    'EMRAF': 'EMERA INC',
-    'PCTY': 'Paylocity Holding Corp',
-    'WWD': 'Woodward, Inc.',
-    'SF': 'STIFEL FINANCIAL CORP',
-    'SNN': 'SMITH & NEPHEW PLC',
-    'SKX': 'SKECHERS USA INC',
-    'DTM': 'DT Midstream, Inc.',
-    'PSO': 'PEARSON PLC',
-    'BWXT': 'BWX Technologies, Inc.',
-    'LBRDA': 'Liberty Broadband Corp',
-    'ALLY': 'Ally Financial Inc.',
-    'KVYO': 'Klaviyo, Inc.',
-    'EXAS': 'EXACT SCIENCES CORP',
-    'SQM': 'CHEMICAL & MINING CO OF CHILE INC',
-    'FUTU': 'Futu Holdings Ltd',
-    'TLN': 'Talen Energy Corp',
-    'ATR': 'APTARGROUP, INC.',
-    'VDMCY': 'Vodacom Group Ltd / ADR',
-    'LECO': 'LINCOLN ELECTRIC HOLDINGS INC',
-    'NICE': 'NICE Ltd.',
-    'ALB': 'ALBEMARLE CORP',
-    'AIZ': 'ASSURANT, INC.',
-    'EXEL': 'EXELIXIS, INC.',
-    'KIKOY': 'Kikkoman Corp',
-    'FND': 'Floor & Decor Holdings, Inc.',
-    'ITCI': 'Intra-Cellular Therapies, Inc.',
-    'EMN': 'EASTMAN CHEMICAL CO',
-    'NLY': 'ANNALY CAPITAL MANAGEMENT INC',
-    'ESTC': 'Elastic N.V.',
-    'SEIC': 'SEI INVESTMENTS CO',
-    'OHI': 'OMEGA HEALTHCARE INVESTORS INC',
-    'WBA': 'Walgreens Boots Alliance, Inc.',
-    'EDU': 'New Oriental Education & Technology Group Inc.',
-    'PAG': 'PENSKE AUTOMOTIVE GROUP, INC.',
-    'PCVX': 'Vaxcyte, Inc.',
-    'EVR': 'Evercore Inc.',
-    'BEN': 'FRANKLIN RESOURCES INC',
-    'CNM': 'Core & Main, Inc.',
-    'AAON': 'AAON, INC.',
-    'IPG': 'INTERPUBLIC GROUP OF COMPANIES, INC.',
-    'MUSA': 'Murphy USA Inc.',
-    'QGEN': 'QIAGEN N.V.',
-    'HNGKY': 'HONGKONG LAND HOLDINGS LTD /FI',
-    'APG': 'APi Group Corp',
-    'PSN': 'PARSONS CORP',
-    'VFS': 'VinFast Auto Ltd.',
-    'MTSI': 'MACOM Technology Solutions Holdings, Inc.',
-    'ULS': 'UL Solutions Inc.',
-    'SBS': 'COMPANHIA DE SANEAMENTO BASICO DO ESTADO DE SAO PAULO-SABESP',
-    'AOS': 'SMITH A O CORP',
-    'AEG': 'AEGON LTD.',
-    'RRX': 'REGAL REXNORD CORP',
-    'CACI': 'CACI INTERNATIONAL INC /DE/',
-    'GTLB': 'Gitlab Inc.',
-    'ARMK': 'Aramark',
-    'KNSL': 'Kinsale Capital Group, Inc.',
-    'DOCS': 'Doximity, Inc.',
-    'BNT': 'Brookfield Wealth Solutions Ltd.',
-    'WPP': 'WPP plc',
-    'DSGX': 'DESCARTES SYSTEMS GROUP INC',
-    'HTHT': 'H World Group Ltd',
-    'USO': 'United States Oil Fund, LP',
-    'PEN': 'Penumbra Inc',
-    'TPX': 'TEMPUR SEALY INTERNATIONAL, INC.',
-    'MGM': 'MGM Resorts International',
-    'UWMC': 'UWM Holdings Corp',
-    'CRL': 'CHARLES RIVER LABORATORIES INTERNATIONAL, INC.',
-    'AIT': 'APPLIED INDUSTRIAL TECHNOLOGIES INC',
-    'AYI': 'ACUITY BRANDS INC',
-    'BIO': 'BIO-RAD LABORATORIES, INC.',
-    'ALSN': 'Allison Transmission Holdings Inc',
-    'CCK': 'CROWN HOLDINGS, INC.',
-    'SLV': 'iShares Silver Trust',
-    'FOUR': 'Shift4 Payments, Inc.',
-    'LKQ': 'LKQ CORP',
-    'GL': 'GLOBE LIFE INC.',
-    'ALTR': 'Altair Engineering Inc.',
-    'SSB': 'SouthState Corp',
-    'PAC': 'Pacific Airport Group',
-    'WTRG': 'Essential Utilities, Inc.',
-    'ALSMY': 'ALSTOM',
-    'ONTO': 'ONTO INNOVATION INC.',
-    'VNOM': 'Viper Energy, Inc.',
-    'GNRC': 'GENERAC HOLDINGS INC.',
-    'DSEEY': 'Daiwa Securities Group Inc.',
-    'CHDN': 'Churchill Downs Inc',
-    'DOX': 'AMDOCS LTD',
-    'BLD': 'TopBuild Corp',
-    'PNW': 'PINNACLE WEST CAPITAL CORP',
-    'EDR': 'Endeavor Group Holdings, Inc.',
-    'AA': 'Alcoa Corp',
-    'CRS': 'CARPENTER TECHNOLOGY CORP',
-    'RBC': 'RBC Bearings INC',
-    'RRC': 'RANGE RESOURCES CORP',
-    'WBS': 'WEBSTER FINANCIAL CORP',
-    'EHC': 'Encompass Health Corp',
-    'BRKR': 'BRUKER CORP',
-    'LCID': 'Lucid Group, Inc.',
-    'BRBR': 'BELLRING BRANDS, INC.',
-    'CUBE': 'CubeSmart',
-    'SUM': 'Summit Materials, Inc.',
-    'ENPH': 'Enphase Energy, Inc.',
-    'CRRFY': 'CARREFOUR SA',
-    'LAD': 'LITHIA MOTORS INC',
-    'CFLT': 'Confluent, Inc.',
-    'GAP': 'GAP INC',
-    'BPYPP': 'Brookfield Property Partners L.P.',
-    'KAIKY': 'Kawasaki Kisen Kaisha Ltd',
-    'PRI': 'Primerica, Inc.',
-    'GLOB': 'Globant S.A.',
-    'PTBRY': 'PT Bank Negara Indonesia (Persero) Tbk/ADR',
-    'WYNN': 'WYNN RESORTS LTD',
-    'APPF': 'APPFOLIO INC',
-    'DBX': 'DROPBOX, INC.',
-    'CSXXY': 'carsales.com Limited/ADR',
-    'TTAN': 'ServiceTitan, Inc.',
-    'MASI': 'MASIMO CORP',
-    'RDEIY': 'Red Electrica Corporacion SA/ADR',
-    'MLI': 'MUELLER INDUSTRIES INC',
-    'KEP': 'KOREA ELECTRIC POWER CORP',
-    'VFC': 'V F CORP',
-    'GLBE': 'Global-E Online Ltd.',
-    'RGLD': 'ROYAL GOLD INC',
-    'BROS': 'Dutch Bros Inc.',
-    'GKOS': 'GLAUKOS Corp',
-    'APA': 'APA Corp',
-    'WCC': 'WESCO INTERNATIONAL INC',
-    'FYBR': 'Frontier Communications Parent, Inc.',
-    'IDKOY': 'IDEMITSU KOSAN CO., LTD',
-    'WMS': 'ADVANCED DRAINAGE SYSTEMS, INC.',
-    'BMA': 'Macro Bank Inc.',
-    'FRT': 'FEDERAL REALTY INVESTMENT TRUST',
-    'DRS': 'Leonardo DRS, Inc.',
-    'HSIC': 'HENRY SCHEIN INC',
-    'STN': 'STANTEC INC',
-    'PNFP': 'PINNACLE FINANCIAL PARTNERS INC',
-    'BSAC': 'BANCO SANTANDER CHILE',
-    'HQY': 'HEALTHEQUITY, INC.',
-    'NIO': 'NIO Inc.',
-    'RGEN': 'REPLIGEN CORP',
-    'CR': 'Crane Co',
-    'LW': 'Lamb Weston Holdings, Inc.',
-    'U': 'Unity Software Inc.',
-    'AES': 'AES CORP',
-    'WAL': 'WESTERN ALLIANCE BANCORPORATION',
-    'ALK': 'ALASKA AIR GROUP, INC.',
-    'BILL': 'BILL Holdings, Inc.',
-    'REXR': 'Rexford Industrial Realty, Inc.',
-    'FBIN': 'Fortune Brands Innovations, Inc.',
-    'INGR': 'Ingredion Inc',
-    'KD': 'Kyndryl Holdings, Inc.',
-    'PLNT': 'Planet Fitness, Inc.',
-    'CFR': 'CULLEN/FROST BANKERS, INC.',
-    'ORI': 'OLD REPUBLIC INTERNATIONAL CORP',
-    'IHICY': 'IHI Corporation/ADR',
-    'KNX': 'Knight-Swift Transportation Holdings Inc.',
-    'GTLS': 'CHART INDUSTRIES INC',
-    'NYT': 'NEW YORK TIMES CO',
-    'AGI': 'ALAMOS GOLD INC',
-    'FN': 'Fabrinet',
-    'FLR': 'FLUOR CORP',
-    'WTFC': 'WINTRUST FINANCIAL CORP',
-    'CBSH': 'COMMERCE BANCSHARES INC /MO/',
-    'CX': 'CEMEX SAB DE CV',
-    'HESM': 'Hess Midstream LP',
-    'JCYGY': 'Jardine Cycle & Carriage Ltd.',
-    'VERX': 'Vertex, Inc.',
-    'TFX': 'TELEFLEX INC',
-    'LTM': 'LATAM AIRLINES GROUP S.A.',
-    'AGNC': 'AGNC Investment Corp.',
-    'ANF': 'ABERCROMBIE & FITCH CO /DE/',
-    'MKTX': 'MARKETAXESS HOLDINGS INC',
-    'PEGA': 'PEGASYSTEMS INC',
-    'EBCOY': 'EBARA CORP /ADR/',
-    'WING': 'Wingstop Inc.',
-    'UUGRY': 'United Utilities Group plc',
-    'SKM': 'SK TELECOM CO LTD',
-    'OGE': 'OGE ENERGY CORP.',
-    'PAAS': 'PAN AMERICAN SILVER CORP',
-    'HAS': 'HASBRO, INC.',
-    'DCI': 'DONALDSON Co INC',
-    'CMA': 'COMERICA INC /NEW/',
-    'CIB': 'BANCOLOMBIA SA',
-    'EXP': 'EAGLE MATERIALS INC',
-    'SMAR': 'SMARTSHEET INC',
-    'GPK': 'GRAPHIC PACKAGING HOLDING CO',
-    'ATI': 'ATI INC',
-    'FSV': 'FirstService Corp',
-    'MOS': 'MOSAIC CO',
-    'BBWI': 'Bath & Body Works, Inc.',
-    'BRX': 'Brixmor Property Group Inc.',
-    'ZION': 'ZIONS BANCORPORATION, NATIONAL ASSOCIATION /UT/',
-    'BCUCY': 'Brunello Cucinelli S.p.A./ADR',
-    'CHE': 'CHEMED CORP',
-    'TTC': 'TORO CO',
-    'VNO': 'VORNADO REALTY TRUST',
-    'FRHC': 'Freedom Holding Corp.',
-    'WF': 'WOORI FINANCIAL GROUP INC.',
-    'WH': 'WYNDHAM HOTELS & RESORTS, INC.',
-    'KBR': 'KBR, INC.',
-    'HLNE': 'Hamilton Lane INC',
-    'ASR': 'SOUTHEAST AIRPORT GROUP',
-    'SARO': 'StandardAero, Inc.',
-    'MTCH': 'Match Group, Inc.',
-    'ROIV': 'Roivant Sciences Ltd.',
-    'RVMD': 'Revolution Medicines, Inc.',
-    'NBIS': 'Nebius Group N.V.',
-    'DJT': 'Trump Media & Technology Group Corp.',
-    'EGP': 'EASTGROUP PROPERTIES INC',
-    'X': 'UNITED STATES STEEL CORP',
-    'FLS': 'FLOWSERVE CORP',
-    'INFA': 'Informatica Inc.',
-    'ASND': 'Ascendis Pharma A/S',
-    'KT': 'KT CORP',
-    'LSCC': 'LATTICE SEMICONDUCTOR CORP',
-    'RH': 'RH',
-    'G': 'Genpact LTD',
-    'MTDR': 'Matador Resources Co',
-    'BERY': 'BERRY GLOBAL GROUP, INC.',
-    'CHRD': 'Chord Energy Corp',
-    'CAE': 'CAE INC',
-    'MNSO': 'MINISO Group Holding Ltd',
-    'OUKPY': 'Outotec OYJ',
-    'LNW': 'Light & Wonder, Inc.',
-    'PARA': 'Paramount Global',
-    'ENSG': 'ENSIGN GROUP, INC',
-    'AM': 'Antero Midstream Corp',
-    'MHK': 'MOHAWK INDUSTRIES INC',
-    'GIL': 'Gildan Activewear Inc.',
-    'ADC': 'AGREE REALTY CORP',
-    'HII': 'HUNTINGTON INGALLS INDUSTRIES, INC.',
-    'AXTA': 'Axalta Coating Systems Ltd.',
-    'IVZ': 'Invesco Ltd.',
-    'LPX': 'LOUISIANA-PACIFIC CORP',
-    'JAZZ': 'Jazz Pharmaceuticals plc',
-    'MKSI': 'MKS INSTRUMENTS INC',
-    'MDGL': 'MADRIGAL PHARMACEUTICALS, INC.',
-    'HRB': 'H&R BLOCK INC',
-    'OTEX': 'OPEN TEXT CORP',
-    'ALV': 'AUTOLIV INC',
-    'DLB': 'Dolby Laboratories, Inc.',
-    'CCCS': 'CCC Intelligent Solutions Holdings Inc.',
-    'S': 'SentinelOne, Inc.',
-    'EXLS': 'ExlService Holdings, Inc.',
-    'MIDD': 'MIDDLEBY Corp',
-    'SNV': 'SYNOVUS FINANCIAL CORP',
-    'AXS': 'AXIS CAPITAL HOLDINGS LTD',
-    'CE': 'Celanese Corp',
-    'PATH': 'UiPath, Inc.',
-    'NNN': 'NNN REIT, INC.',
-    'SIRI': 'SIRIUS XM HOLDINGS INC.',
-    'ELF': 'e.l.f. Beauty, Inc.',
-    'DDS': 'DILLARD'S, INC.',
-    'STEP': 'StepStone Group Inc.',
-    'ONB': 'OLD NATIONAL BANCORP /IN/',
-    'OLED': 'UNIVERSAL DISPLAY CORP \PA\',
-    'IONQ': 'IonQ, Inc.',
-    'HCP': 'HashiCorp, Inc.',
-    'LEVI': 'LEVI STRAUSS & CO',
-    'FRPT': 'Freshpet, Inc.',
-    'ESAB': 'ESAB Corp',
-    'PB': 'PROSPERITY BANCSHARES INC',
-    'SUN': 'Sunoco LP',
-    'TREX': 'TREX CO INC',
-    'FCN': 'FTI CONSULTING, INC',
-    'ERJ': 'EMBRAER S.A.',
-    'BZZUY': 'BUZZI UNICEM S.p.A.',
-    'BXSL': 'Blackstone Secured Lending Fund',
-    'ZK': 'ZEEKR Intelligent Technology Holding Ltd',
-    'CWST': 'CASELLA WASTE SYSTEMS INC',
-    'LKNCY': 'Luckin Coffee Inc.',
-    'RHI': 'ROBERT HALF INC.',
-    'RLI': 'RLI CORP',
-    'AN': 'AUTONATION, INC.',
-    'QRVO': 'Qorvo, Inc.',
-    'JOBY': 'Joby Aviation, Inc.',
-    'BWA': 'BORGWARNER INC',
-    'AGCO': 'AGCO CORP /DE',
-    'CWAN': 'Clearwater Analytics Holdings, Inc.',
-    'WEX': 'WEX Inc.',
-    'LOAR': 'Loar Holdings Inc.',
-    'HALO': 'HALOZYME THERAPEUTICS, INC.',
-    'CVLT': 'COMMVAULT SYSTEMS INC',
-    'WFG': 'WEST FRASER TIMBER CO., LTD',
-    'ICL': 'ICL Group Ltd.',
-    'MOG-A': 'MOOG INC.',
-    'SPSC': 'SPS COMMERCE INC',
-    'DINO': 'HF Sinclair Corp',
-    'BRRLY': 'Barry Callebaut AG/ADR',
-    'BOKF': 'BOK FINANCIAL CORP',
-    'LNTH': 'Lantheus Holdings, Inc.',
-    'CZR': 'Caesars Entertainment, Inc.',
-    'VIPS': 'Vipshop Holdings Ltd',
-    'BILI': 'Bilibili Inc.',
-    'BFAM': 'BRIGHT HORIZONS FAMILY SOLUTIONS INC.',
-    'SATS': 'EchoStar CORP',
-    'MTN': 'VAIL RESORTS INC',
-    'SSD': 'Simpson Manufacturing Co., Inc.',
-    'CHH': 'CHOICE HOTELS INTERNATIONAL INC /DE',
-    'UFPI': 'UFP INDUSTRIES INC',
-    'BPOP': 'POPULAR, INC.',
-    'FR': 'FIRST INDUSTRIAL REALTY TRUST INC',
-    'PDI': 'PIMCO Dynamic Income Fund',
-    'CIGI': 'Colliers International Group Inc.',
-    'OS': 'OneStream, Inc.',
-    'R': 'RYDER SYSTEM INC',
-    'ENLC': 'EnLink Midstream, LLC',
-    'WTS': 'WATTS WATER TECHNOLOGIES INC',
-    'JHG': 'JANUS HENDERSON GROUP PLC',
-    'WHR': 'WHIRLPOOL CORP /DE/',
-    'WSC': 'WillScot Holdings Corp',
-    'CMS-PB': 'CONSUMERS ENERGY CO',
-    'OLLI': 'Ollie's Bargain Outlet Holdings, Inc.',
-    'QXO': 'QXO, Inc.',
-    'AZEK': 'AZEK Co Inc.',
-    'UELMO': 'UNION ELECTRIC CO',
-    'WAY': 'Waystar Holding Corp.',
-    'CROX': 'Crocs, Inc.',
-    'ASTS': 'AST SpaceMobile, Inc.',
-    'SPXC': 'SPX Technologies, Inc.',
-    'STWD': 'STARWOOD PROPERTY TRUST, INC.',
-    'VOYA': 'Voya Financial, Inc.',
-    'CELH': 'Celsius Holdings, Inc.',
-    'BECN': 'BEACON ROOFING SUPPLY INC',
-    'AMKR': 'AMKOR TECHNOLOGY, INC.',
-    'NVMI': 'NOVA LTD.',
-    'CGNX': 'COGNEX CORP',
-    'MAT': 'MATTEL INC /DE/',
-    'STVN': 'Stevanato Group S.p.A.',
-    'BLCO': 'Bausch & Lomb Corp',
-    'BYD': 'BOYD GAMING CORP',
-    'BRFS': 'BRF S.A.',
-    'LEGN': 'Legend Biotech Corp',
-    'MOD': 'MODINE MANUFACTURING CO',
-    'JXN': 'Jackson Financial Inc.',
-    'EAT': 'BRINKER INTERNATIONAL, INC',
-    'FMC': 'FMC CORP',
-    'MSA': 'MSA Safety Inc',
-    'POST': 'Post Holdings, Inc.',
-    'CADE': 'Cadence Bank',
-    'AWI': 'ARMSTRONG WORLD INDUSTRIES INC',
-    'ESI': 'Element Solutions Inc',
-    'NGKSY': 'NGK Spark Plug Co., Ltd.',
-    'ADOOY': 'Adaro Energy PT/ADR/',
-    'BMI': 'BADGER METER INC',
-    'ADT': 'ADT Inc.',
-    'INSP': 'Inspire Medical Systems, Inc.',
-    'ZWS': 'Zurn Elkay Water Solutions Corp',
-    'CSWI': 'CSW INDUSTRIALS, INC.',
-    'FNMA': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'TMHC': 'Taylor Morrison Home Corp',
-    'GNTX': 'GENTEX CORP',
-    'OMF': 'OneMain Holdings, Inc.',
-    'ALTM': 'Arcadium Lithium plc',
-    'PAM': 'Pampa Energy Inc.',
-    'NXT': 'Nextracker Inc.',
-    'RHP': 'Ryman Hospitality Properties, Inc.',
-    'UGI': 'UGI CORP /PA/',
-    'PJT': 'PJT Partners Inc.',
-    'MARA': 'MARA Holdings, Inc.',
-    'HMY': 'HARMONY GOLD MINING CO LTD',
-    'VMI': 'VALMONT INDUSTRIES INC',
-    'STAG': 'STAG Industrial, Inc.',
-    'XP': 'XP Inc.',
-    'RMBS': 'RAMBUS INC',
-    'KEX': 'KIRBY CORP',
-    'FSK': 'FS KKR Capital Corp',
-    'FAF': 'First American Financial Corp',
-    'SPXSY': 'Spirax-Sarco Engineering PLC/ADR',
-    'COLD': 'AMERICOLD REALTY TRUST',
-    'ARW': 'ARROW ELECTRONICS, INC.',
-    'TEM': 'Tempus AI, Inc.',
-    'TKC': 'TURKCELL ILETISIM HIZMETLERI A S',
-    'COOP': 'Mr. Cooper Group Inc.',
-    'LFUS': 'LITTELFUSE INC /DE',
-    'LSTR': 'LANDSTAR SYSTEM INC',
-    'ETSY': 'ETSY INC',
-    'WK': 'WORKIVA INC',
-    'OSK': 'OSHKOSH CORP',
-    'CRK': 'COMSTOCK RESOURCES INC',
-    'BBAR': 'Banco BBVA Argentina S.A.',
-    'COTY': 'COTY INC.',
-    'DAR': 'DARLING INGREDIENTS INC.',
-    'MTG': 'MGIC INVESTMENT CORP',
-    'ESNT': 'Essent Group Ltd.',
-    'LITE': 'Lumentum Holdings Inc.',
-    'TRNO': 'Terreno Realty Corp',
-    'SITE': 'SiteOne Landscape Supply, Inc.',
-    'SLM': 'SLM Corp',
-    'SMTC': 'SEMTECH CORP',
-    'OBDC': 'Blue Owl Capital Corp',
-    'SAIC': 'Science Applications International Corp',
-    'DUFRY': 'Dufry AG/ADR',
-    'LB': 'LandBridge Co LLC',
-    'IDA': 'IDACORP INC',
-    'TSEM': 'TOWER SEMICONDUCTOR LTD',
-    'FUPBY': 'Fuchs Petrolub SE/ADR',
-    'FSS': 'FEDERAL SIGNAL CORP /DE/',
-    'SRAD': 'Sportradar Group AG',
-    'NFG': 'NATIONAL FUEL GAS CO',
-    'HR': 'Healthcare Realty Trust Inc',
-    'ELAN': 'Elanco Animal Health Inc',
-    'MMSI': 'MERIT MEDICAL SYSTEMS INC',
-    'GRFS': 'Grifols SA',
-    'QFIN': 'Qifu Technology, Inc.',
-    'TGS': 'GAS TRANSPORTER OF THE SOUTH INC',
-    'FIVE': 'FIVE BELOW, INC',
-    'GPI': 'GROUP 1 AUTOMOTIVE INC',
-    'BZ': 'Kanzhun Ltd',
-    'NOV': 'NOV Inc.',
-    'TX': 'Ternium S.A.',
-    'TAL': 'TAL Education Group',
-    'PVH': 'PVH CORP. /DE/',
-    'RITM': 'Rithm Capital Corp.',
-    'BPMC': 'Blueprint Medicines Corp',
-    'AMTM': 'Amentum Holdings, Inc.',
-    'HIMS': 'Hims & Hers Health, Inc.',
-    'W': 'Wayfair Inc.',
-    'GGB': 'GERDAU S.A.',
-    'YKLTY': 'Yakult Honsha Co., LTD/ADR',
-    'SMBMY': 'SembCorp Marine Ltd.',
-    'CYTK': 'CYTOKINETICS INC',
-    'COLB': 'COLUMBIA BANKING SYSTEM, INC.',
-    'TIMB': 'TIM S.A.',
-    'SHAK': 'Shake Shack Inc.',
-    'BE': 'Bloom Energy Corp',
-    'REYN': 'Reynolds Consumer Products Inc.',
-    'CRVL': 'CORVEL CORP',
-    'SIGI': 'SELECTIVE INSURANCE GROUP INC',
-    'BBIO': 'BridgeBio Pharma, Inc.',
-    'CIG': 'ENERGY CO OF MINAS GERAIS',
-    'MEJHY': 'MEIJI Holdings Co Ltd/ADR',
-    'LUMN': 'Lumen Technologies, Inc.',
-    'VIRT': 'Virtu Financial, Inc.',
-    'VNT': 'Vontier Corp',
-    'ACIW': 'ACI WORLDWIDE, INC.',
-    'GBCI': 'GLACIER BANCORP, INC.',
-    'KNF': 'Knife River Corp',
-    'SLGN': 'SILGAN HOLDINGS INC',
-    'HOMB': 'HOME BANCSHARES INC',
-    'ERELY': 'Eregli Demir ve Celik Fabrikalari TAS/ADR',
-    'QTWO': 'Q2 Holdings, Inc.',
-    'EPRT': 'ESSENTIAL PROPERTIES REALTY TRUST, INC.',
-    'MTH': 'Meritage Homes CORP',
-    'NUVL': 'Nuvalent, Inc.',
-    'NSA': 'National Storage Affiliates Trust',
-    'CMC': 'COMMERCIAL METALS Co',
-    'SITM': 'SITIME Corp',
-    'LYFT': 'Lyft, Inc.',
-    'GATX': 'GATX CORP',
-    'CRUS': 'CIRRUS LOGIC, INC.',
-    'CACC': 'CREDIT ACCEPTANCE CORP',
-    'UMBF': 'UMB FINANCIAL CORP',
-    'NOVT': 'NOVANTA INC',
-    'VG': 'Venture Global, Inc.',
-    'THG': 'HANOVER INSURANCE GROUP, INC.',
-    'AMG': 'AFFILIATED MANAGERS GROUP, INC.',
-    'GDS': 'GDS Holdings Ltd',
-    'PSLV': 'Sprott Physical Silver Trust',
-    'UPST': 'Upstart Holdings, Inc.',
-    'HXL': 'HEXCEL CORP /DE/',
-    'URBN': 'URBAN OUTFITTERS INC',
-    'IONS': 'IONIS PHARMACEUTICALS INC',
-    'USM': 'UNITED STATES CELLULAR CORP',
-    'CHX': 'ChampionX Corp',
-    'PONY': 'Pony AI Inc.',
-    'NE': 'Noble Corp plc',
-    'CORT': 'CORCEPT THERAPEUTICS INC',
-    'INTA': 'Intapp, Inc.',
-    'SOUN': 'SOUNDHOUND AI, INC.',
-    'DY': 'DYCOM INDUSTRIES INC',
-    'GXO': 'GXO Logistics, Inc.',
-    'FNB': 'FNB CORP/PA/',
-    'MSGS': 'Madison Square Garden Sports Corp.',
-    'LNC': 'LINCOLN NATIONAL CORP',
-    'RDNT': 'RadNet, Inc.',
-    'WFRD': 'Weatherford International plc',
-    'MAIN': 'Main Street Capital CORP',
-    'HRI': 'HERC HOLDINGS INC',
-    'TKR': 'TIMKEN CO',
-    'SOBO': 'South Bow Corp',
-    'KRG': 'KITE REALTY GROUP TRUST',
-    'CEF': 'Sprott Physical Gold & Silver Trust',
-    'AL': 'AIR LEASE CORP',
-    'NSIT': 'INSIGHT ENTERPRISES INC',
-    'MC': 'Moelis & Co',
-    'GTES': 'Gates Industrial Corp plc',
-    'VRNS': 'VARONIS SYSTEMS INC',
-    'BCPC': 'BALCHEM CORP',
-    'FG': 'F&G Annuities & Life, Inc.',
-    'BIPC': 'Brookfield Infrastructure Corp',
-    'STRL': 'STERLING INFRASTRUCTURE, INC.',
-    'CALM': 'CAL-MAINE FOODS INC',
-    'TLX': 'Telix Pharmaceuticals Ltd',
-    'DNB': 'Dun & Bradstreet Holdings, Inc.',
-    'SM': 'SM Energy Co',
-    'THO': 'THOR INDUSTRIES INC',
-    'MAC': 'MACERICH CO',
-    'SNDR': 'Schneider National, Inc.',
-    'SKY': 'Champion Homes, Inc.',
-    'PFSI': 'PennyMac Financial Services, Inc.',
-    'CIVI': 'CIVITAS RESOURCES, INC.',
-    'CWEN': 'Clearway Energy, Inc.',
-    'LEA': 'LEAR CORP',
-    'FFIN': 'FIRST FINANCIAL BANKSHARES INC',
-    'LRN': 'Stride, Inc.',
-    'SWX': 'Southwest Gas Holdings, Inc.',
-    'CLF': 'CLEVELAND-CLIFFS INC.',
-    'QLYS': 'QUALYS, INC.',
-    'MGY': 'Magnolia Oil & Gas Corp',
-    'LTH': 'Life Time Group Holdings, Inc.',
-    'MYTHY': 'Mytilineos Holdings S.A.',
-    'CTRE': 'CareTrust REIT, Inc.',
-    'MUR': 'MURPHY OIL CORP',
-    'BEPC': 'Brookfield Renewable Corp',
-    'PECO': 'Phillips Edison & Company, Inc.',
-    'SEE': 'SEALED AIR CORP/DE',
-    'IBP': 'Installed Building Products, Inc.',
-    'SKLTY': 'Seek Ltd',
-    'ROAD': 'Construction Partners, Inc.',
-    'UBSI': 'UNITED BANKSHARES INC/WV',
-    'PHI': 'PLDT Inc.',
-    'VLY': 'VALLEY NATIONAL BANCORP',
-    'CUYTY': 'Colruyt SA',
-    'CUZ': 'COUSINS PROPERTIES INC',
-    'ESGR': 'Enstar Group LTD',
-    'ACT': 'Enact Holdings, Inc.',
-    'BOOT': 'Boot Barn Holdings, Inc.',
-    'FCFS': 'FirstCash Holdings, Inc.',
-    'KTB': 'Kontoor Brands, Inc.',
-    'CRC': 'California Resources Corp',
-    'IDCC': 'InterDigital, Inc.',
-    'COLM': 'COLUMBIA SPORTSWEAR CO',
-    'CBT': 'CABOT CORP',
-    'OZK': 'Bank OZK',
-    'FRSH': 'Freshworks Inc.',
-    'AVAV': 'AeroVironment Inc',
-    'CLBT': 'Cellebrite DI Ltd.',
-    'LOPE': 'Grand Canyon Education, Inc.',
-    'HWC': 'HANCOCK WHITNEY CORP',
-    'ITRI': 'ITRON, INC.',
-    'WTM': 'WHITE MOUNTAINS INSURANCE GROUP LTD',
-    'NXST': 'NEXSTAR MEDIA GROUP, INC.',
-    'INGM': 'Ingram Micro Holding Corp',
-    'ABG': 'ASBURY AUTOMOTIVE GROUP INC',
-    'NARI': 'Inari Medical, Inc.',
-    'NEU': 'NEWMARKET CORP',
-    'PAGP': 'PLAINS GP HOLDINGS LP',
-    'PRCT': 'PROCEPT BioRobotics Corp',
-    'TEO': 'TELECOM ARGENTINA SA',
-    'IEP': 'ICAHN ENTERPRISES L.P.',
-    'TENB': 'Tenable Holdings, Inc.',
-    'FUN': 'Six Flags Entertainment Corporation/NEW',
-    'KBH': 'KB HOME',
-    'BGC': 'BGC Group, Inc.',
-    'MMS': 'MAXIMUS, INC.',
-    'ACHR': 'Archer Aviation Inc.',
-    'BDC': 'BELDEN INC.',
-    'AROC': 'Archrock, Inc.',
-    'LANC': 'LANCASTER COLONY CORP',
-    'RDN': 'RADIAN GROUP INC',
-    'GH': 'Guardant Health, Inc.',
-    'ITGR': 'Integer Holdings Corp',
-    'ALKS': 'Alkermes plc.',
-    'SON': 'SONOCO PRODUCTS CO',
-    'EXPO': 'EXPONENT INC',
-    'BKGFY': 'Berkeley Group Holdings plc',
-    'MATX': 'Matson, Inc.',
-    'NJR': 'NEW JERSEY RESOURCES CORP',
-    'ACA': 'Arcosa, Inc.',
-    'AVT': 'AVNET INC',
-    'PIPR': 'PIPER SANDLER COMPANIES',
-    'AEIS': 'ADVANCED ENERGY INDUSTRIES INC',
-    'MSM': 'MSC INDUSTRIAL DIRECT CO INC',
-    'IESC': 'IES Holdings, Inc.',
-    'VVV': 'VALVOLINE INC',
-    'KTOS': 'KRATOS DEFENSE & SECURITY SOLUTIONS, INC.',
-    'BOX': 'BOX INC',
-    'TGTX': 'TG THERAPEUTICS, INC.',
-    'BRZE': 'Braze, Inc.',
-    'TNET': 'TRINET GROUP, INC.',
-    'SKYW': 'SKYWEST INC',
-    'BCC': 'BOISE CASCADE Co',
-    'CNX': 'CNX Resources Corp',
-    'RELY': 'Remitly Global, Inc.',
-    'SLG': 'SL GREEN REALTY CORP',
-    'RRR': 'Red Rock Resorts, Inc.',
-    'SFBS': 'ServisFirst Bancshares, Inc.',
-    'SNRE': 'Sunrise Communications AG',
-    'AGO': 'ASSURED GUARANTY LTD',
-    'ADMA': 'ADMA BIOLOGICS, INC.',
-    'KRYS': 'Krystal Biotech, Inc.',
-    'VKTX': 'Viking Therapeutics, Inc.',
-    'PLXS': 'PLEXUS CORP',
-    'M': 'Macy's, Inc.',
-    'ASAN': 'Asana, Inc.',
-    'LBTYA': 'Liberty Global Ltd.',
-    'ROYMY': 'Royal Mail plc/ADR',
-    'GOLF': 'Acushnet Holdings Corp.',
-    'GEO': 'GEO GROUP INC',
-    'SLAB': 'SILICON LABORATORIES INC.',
-    'CNS': 'COHEN & STEERS, INC.',
-    'GLNG': 'GOLAR LNG LTD',
-    'EEFT': 'EURONET WORLDWIDE, INC.',
-    'POR': 'PORTLAND GENERAL ELECTRIC CO /OR/',
-    'RUSHA': 'RUSH ENTERPRISES INC TX',
-    'LAZ': 'Lazard, Inc.',
-    'ALGM': 'ALLEGRO MICROSYSTEMS, INC.',
-    'FELE': 'FRANKLIN ELECTRIC CO INC',
-    'KRC': 'KILROY REALTY CORP',
-    'FTDR': 'Frontdoor, Inc.',
-    'IRT': 'INDEPENDENCE REALTY TRUST, INC.',
-    'ACHC': 'Acadia Healthcare Company, Inc.',
-    'SIM': 'GRUPO SIMEC, S.A.B. de C.V.',
-    'AHR': 'American Healthcare REIT, Inc.',
-    'TXNM': 'TXNM ENERGY INC',
-    'AI': 'C3.ai, Inc.',
-    'BC': 'BRUNSWICK CORP',
-    'ZETA': 'Zeta Global Holdings Corp.',
-    'SANM': 'SANMINA CORP',
-    'PRIM': 'Primoris Services Corp',
-    'OGN': 'Organon & Co.',
-    'CBZ': 'CBIZ, Inc.',
-    'ABCB': 'Ameris Bancorp',
-    'RIOT': 'Riot Platforms, Inc.',
-    'IPAR': 'INTERPARFUMS INC',
-    'ELP': 'ENERGY CO OF PARANA',
-    'CAMT': 'CAMTEK LTD',
-    'ST': 'Sensata Technologies Holding plc',
-    'UNF': 'UNIFIRST CORP',
-    'GBTG': 'Global Business Travel Group, Inc.',
-    'TIGO': 'MILLICOM INTERNATIONAL CELLULAR SA',
-    'OPCH': 'Option Care Health, Inc.',
-    'AB': 'ALLIANCEBERNSTEIN HOLDING L.P.',
-    'NWL': 'NEWELL BRANDS INC.',
-    'VRRM': 'VERRA MOBILITY Corp',
-    'CRGY': 'Crescent Energy Co',
-    'ALVO': 'Alvotech',
-    'KMPR': 'KEMPER Corp',
-    'ASO': 'Academy Sports & Outdoors, Inc.',
-    'FLO': 'FLOWERS FOODS INC',
-    'SPR': 'Spirit AeroSystems Holdings, Inc.',
-    'KAI': 'KADANT INC',
-    'FIZZ': 'NATIONAL BEVERAGE CORP',
-    'BKH': 'BLACK HILLS CORP /SD/',
-    'NOG': 'NORTHERN OIL & GAS, INC.',
-    'PYCR': 'PAYCOR HCM, INC.',
-    'PI': 'IMPINJ INC',
-    'ENIC': 'Enel Chile S.A.',
-    'VCTR': 'Victory Capital Holdings, Inc.',
-    'ORA': 'ORMAT TECHNOLOGIES, INC.',
-    'JWN': 'NORDSTROM INC',
-    'WHD': 'Cactus, Inc.',
-    'BCO': 'BRINKS CO',
-    'CORZ': 'Core Scientific, Inc./tx',
-    'GBDC': 'GOLUB CAPITAL BDC, Inc.',
-    'SBRA': 'Sabra Health Care REIT, Inc.',
-    'TAC': 'TRANSALTA CORP',
-    'IBOC': 'INTERNATIONAL BANCSHARES CORP',
-    'RXO': 'RXO, Inc.',
-    'AXSM': 'Axsome Therapeutics, Inc.',
-    'RARE': 'Ultragenyx Pharmaceutical Inc.',
-    'JBTM': 'JBT Marel Corp',
-    'NFE': 'New Fortress Energy Inc.',
-    'FAURY': 'FORVIA SE/ADR',
-    'FRO': 'Frontline plc',
-    'ICUI': 'ICU MEDICAL INC/DE',
-    'HAE': 'HAEMONETICS CORP',
-    'ASB': 'ASSOCIATED BANC-CORP',
-    'OGS': 'ONE Gas, Inc.',
-    'NXE': 'NexGen Energy Ltd.',
-    'SMG': 'SCOTTS MIRACLE-GRO CO',
-    'ASGN': 'ASGN Inc',
-    'GVA': 'GRANITE CONSTRUCTION INC',
-    'CRNX': 'Crinetics Pharmaceuticals, Inc.',
-    'BLKB': 'BLACKBAUD INC',
-    'SR': 'SPIRE INC',
-    'SG': 'Sweetgreen, Inc.',
-    'AX': 'Axos Financial, Inc.',
-    'PAY': 'Paymentus Holdings, Inc.',
-    'ALE': 'ALLETE INC',
-    'BHVN': 'Biohaven Ltd.',
-    'HGV': 'Hilton Grand Vacations Inc.',
-    'RYN': 'RAYONIER INC',
-    'NCNO': 'nCino, Inc.',
-    'TDS': 'TELEPHONE & DATA SYSTEMS INC /DE/',
-    'DORM': 'Dorman Products, Inc.',
-    'SRRK': 'Scholar Rock Holding Corp',
-    'NNI': 'NELNET INC',
-    'YOU': 'Clear Secure, Inc.',
-    'DOOO': 'BRP Inc.',
-    'VRNA': 'Verona Pharma plc',
-    'CNO': 'CNO Financial Group, Inc.',
-    'FLG': 'FLAGSTAR FINANCIAL, INC.',
-    'CNK': 'Cinemark Holdings, Inc.',
-    'AMRX': 'Amneal Pharmaceuticals, Inc.',
-    'CARG': 'CarGurus, Inc.',
-    'SHC': 'Sotera Health Co',
-    'ACLX': 'Arcellx, Inc.',
-    'BANF': 'BANCFIRST CORP /OK/',
-    'GHC': 'Graham Holdings Co',
-    'KGS': 'Kodiak Gas Services, Inc.',
-    'GSHD': 'Goosehead Insurance, Inc.',
-    'AGYS': 'AGILYSYS INC',
-    'ROHCY': 'ROHM Co., Ltd.',
-    'PBH': 'Prestige Consumer Healthcare Inc.',
-    'OLN': 'OLIN Corp',
-    'XRAY': 'DENTSPLY SIRONA Inc.',
-    'MIR': 'Mirion Technologies, Inc.',
-    'CPA': 'Copa Holdings, S.A.',
-    'CLVT': 'CLARIVATE PLC',
-    'ALIT': 'Alight, Inc. / Delaware',
-    'MDU': 'MDU RESOURCES GROUP INC',
-    'HHH': 'Howard Hughes Holdings Inc.',
-    'GSAT': 'Globalstar, Inc.',
-    'OR': 'Osisko Gold Royalties LTD',
-    'KNTK': 'Kinetik Holdings Inc.',
-    'DXC': 'DXC Technology Co',
-    'SKT': 'TANGER INC.',
-    'ENS': 'EnerSys',
-    'BTDR': 'Bitdeer Technologies Group',
-    'IAC': 'IAC Inc.',
-    'UCB': 'UNITED COMMUNITY BANKS INC',
-    'WRD': 'WeRide Inc.',
-    'FROG': 'JFrog Ltd',
-    'HOG': 'HARLEY-DAVIDSON, INC.',
-    'IGT': 'International Game Technology PLC',
-    'CCOI': 'COGENT COMMUNICATIONS HOLDINGS, INC.',
-    'CVCO': 'CAVCO INDUSTRIES INC.',
-    'HBM': 'Hudbay Minerals Inc.',
-    'CXT': 'Crane NXT, Co.',
-    'LBRT': 'Liberty Energy Inc.',
-    'APLE': 'Apple Hospitality REIT, Inc.',
-    'PAYO': 'Payoneer Global Inc.',
-    'RIG': 'Transocean Ltd.',
-    'ATAT': 'Atour Lifestyle Holdings Ltd',
-    'BL': 'BLACKLINE, INC.',
-    'TGLS': 'Tecnoglass Inc.',
-    'AVNT': 'AVIENT CORP',
-    'SMPL': 'Simply Good Foods Co',
-    'WU': 'Western Union CO',
-    'ACVA': 'ACV Auctions Inc.',
-    'TBBB': 'BBB FOODS INC',
-    'OMAB': 'Central North Airport Group',
-    'ARLP': 'ALLIANCE RESOURCE PARTNERS LP',
-    'APLS': 'Apellis Pharmaceuticals, Inc.',
-    'ATGE': 'Adtalem Global Education Inc.',
-    'RNA': 'Avidity Biosciences, Inc.',
-    'FORM': 'FORMFACTOR INC',
-    'FULT': 'FULTON FINANCIAL CORP',
-    'OKLO': 'Oklo Inc.',
-    'ZI': 'ZoomInfo Technologies Inc.',
-    'RYTM': 'RHYTHM PHARMACEUTICALS, INC.',
-    'ALKT': 'ALKAMI TECHNOLOGY, INC.',
-    'BTG': 'B2GOLD CORP',
-    'JGSMY': 'JG Summit Holdings, Inc./ADR',
-    'OSCR': 'Oscar Health, Inc.',
-    'IMVT': 'Immunovant, Inc.',
-    'CRSP': 'CRISPR Therapeutics AG',
-    'POWI': 'POWER INTEGRATIONS INC',
-    'DNP': 'DNP SELECT INCOME FUND INC',
-    'TNL': 'Travel & Leisure Co.',
-    'USLM': 'UNITED STATES LIME & MINERALS INC',
-    'BRC': 'BRADY CORP',
-    'TFSL': 'TFS Financial CORP',
-    'MWA': 'Mueller Water Products, Inc.',
-    'NPO': 'Enpro Inc.',
-    'RLX': 'RLX Technology Inc.',
-    'KFY': 'KORN FERRY',
-    'MHO': 'M/I HOMES, INC.',
-    'HP': 'Helmerich & Payne, Inc.',
-    'VRN': 'Veren Inc.',
-    'PTCT': 'PTC THERAPEUTICS, INC.',
-    'TCBI': 'TEXAS CAPITAL BANCSHARES INC/TX',
-    'BVN': 'BUENAVENTURA MINING CO INC',
-    'GFF': 'GRIFFON CORP',
-    'SSL': 'SASOL LTD',
-    'CDP': 'COPT DEFENSE PROPERTIES',
-    'NEA': 'Nuveen AMT-Free Quality Municipal Income Fund',
-    'EPR': 'EPR PROPERTIES',
-    'FUL': 'FULLER H B CO',
-    'PRGO': 'PERRIGO Co plc',
-    'ECG': 'Everus Construction Group, Inc.',
-    'GPOR': 'GULFPORT ENERGY CORP',
-    'ESE': 'ESCO TECHNOLOGIES INC',
-    'UAA': 'Under Armour, Inc.',
-    'EGO': 'ELDORADO GOLD CORP /FI',
-    'FMCC': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'HL': 'HECLA MINING CO/DE/',
-    'AESI': 'Atlas Energy Solutions Inc.',
-    'HTGC': 'Hercules Capital, Inc.',
-    'PTEN': 'PATTERSON UTI ENERGY INC',
-    'EBC': 'Eastern Bankshares, Inc.',
-    'SIG': 'SIGNET JEWELERS LTD',
-    'IAG': 'IAMGOLD CORP',
-    'PTON': 'PELOTON INTERACTIVE, INC.',
-    'AQN': 'ALGONQUIN POWER & UTILITIES CORP.',
-    'IFS': 'Intercorp Financial Services Inc.',
-    'HASI': 'HA Sustainable Infrastructure Capital, Inc.',
-    'DV': 'DoubleVerify Holdings, Inc.',
-    'ASH': 'ASHLAND INC.',
-    'ATMU': 'Atmus Filtration Technologies Inc.',
-    'WDFC': 'WD 40 CO',
-    'REZI': 'RESIDEO TECHNOLOGIES, INC.',
-    'SLVYY': 'SOLVAY S A /ADR/',
-    'CATY': 'CATHAY GENERAL BANCORP',
-    'MP': 'MP Materials Corp. / DE',
-    'SWTX': 'SpringWorks Therapeutics, Inc.',
-    'VAL': 'Valaris Ltd',
-    'VCYT': 'VERACYTE, INC.',
-    'STR': 'Sitio Royalties Corp.',
-    'YETI': 'YETI Holdings, Inc.',
-    'IRDM': 'Iridium Communications Inc.',
-    'TPH': 'Tri Pointe Homes, Inc.',
-    'DLO': 'dLocal Ltd',
-    'MEOH': 'METHANEX CORP',
-    'FIBK': 'FIRST INTERSTATE BANCSYSTEM INC',
-    'VEON': 'VEON Ltd.',
-    'MGEE': 'MGE ENERGY INC',
-    'DEI': 'Douglas Emmett Inc',
-    'LIF': 'Life360, Inc.',
-    'HGTY': 'Hagerty, Inc.',
-    'NVST': 'Envista Holdings Corp',
-    'LPL': 'LG Display Co., Ltd.',
-    'TFPM': 'Triple Flag Precious Metals Corp.',
-    'PBF': 'PBF Energy Inc.',
-    'FHB': 'FIRST HAWAIIAN, INC.',
-    'AMBA': 'AMBARELLA INC',
-    'PTVE': 'Pactiv Evergreen Inc.',
-    'RUM': 'Rumble Inc.',
-    'SNEX': 'StoneX Group Inc.',
-    'ATHM': 'Autohome Inc.',
-    'BSM': 'Black Stone Minerals, L.P.',
-    'RSI': 'Rush Street Interactive, Inc.',
-    'DOCN': 'DigitalOcean Holdings, Inc.',
-    'EE': 'Excelerate Energy, Inc.',
-    'ABM': 'ABM INDUSTRIES INC /DE/',
-    'NWE': 'NorthWestern Energy Group, Inc.',
-    'FHI': 'FEDERATED HERMES, INC.',
-    'IPGP': 'IPG PHOTONICS CORP',
-    'AEO': 'AMERICAN EAGLE OUTFITTERS INC',
-    'AUB': 'Atlantic Union Bankshares Corp',
-    'GMS': 'GMS Inc.',
-    'HAYW': 'Hayward Holdings, Inc.',
-    'SLVM': 'Sylvamo Corp',
-    'CBU': 'COMMUNITY FINANCIAL SYSTEM, INC.',
-    'SYNA': 'SYNAPTICS Inc',
-    'HIW': 'HIGHWOODS PROPERTIES, INC.',
-    'PRKS': 'United Parks & Resorts Inc.',
-    'CAAP': 'CORPORACION AMERICA AIRPORTS S.A.',
-    'WEN': 'Wendy's Co',
-    'IRTC': 'iRhythm Technologies, Inc.',
-    'AVPT': 'AvePoint, Inc.',
-    'MRUS': 'Merus N.V.',
-    'QDEL': 'QuidelOrtho Corp',
-    'PCH': 'POTLATCHDELTIC CORP',
-    'AMED': 'AMEDISYS INC',
-    'PII': 'Polaris Inc.',
-    'OTTR': 'Otter Tail Corp',
-    'WRBY': 'Warby Parker Inc.',
-    'BTSG': 'BrightSpring Health Services, Inc.',
-    'FA': 'FIRST ADVANTAGE CORP',
-    'BNL': 'Broadstone Net Lease, Inc.',
-    'CEIX': 'CONSOL Energy Inc.',
-    'NHI': 'NATIONAL HEALTH INVESTORS INC',
-    'HAFN': 'Hafnia Ltd',
-    'FBP': 'FIRST BANCORP /PR/',
-    'GRP-UN': 'GRANITE REAL ESTATE INVESTMENT TRUST',
-    'NVCR': 'NovoCure Ltd',
-    'GRND': 'Grindr Inc.',
-    'BHC': 'Bausch Health Companies Inc.',
-    'UEC': 'URANIUM ENERGY CORP',
-    'WSFS': 'WSFS FINANCIAL CORP',
-    'VSCO': 'Victoria's Secret & Co.',
-    'CNXC': 'Concentrix Corp',
-    'CAR': 'AVIS BUDGET GROUP, INC.',
-    'SHOO': 'STEVEN MADDEN, LTD.',
-    'RNG': 'RingCentral, Inc.',
-    'BXMT': 'BLACKSTONE MORTGAGE TRUST, INC.',
-    'WD': 'Walker & Dunlop, Inc.',
-    'LFST': 'LifeStance Health Group, Inc.',
-    'TEX': 'TEREX CORP',
-    'SAM': 'BOSTON BEER CO INC',
-    'ALRM': 'Alarm.com Holdings, Inc.',
-    'MLTX': 'MoonLake Immunotherapeutics',
-    'FLNC': 'Fluence Energy, Inc.',
-    'HBI': 'Hanesbrands Inc.',
-    'XENE': 'Xenon Pharmaceuticals Inc.',
-    'OUT': 'OUTFRONT Media Inc.',
-    'TDC': 'TERADATA CORP /DE/',
-    'VAC': 'MARRIOTT VACATIONS WORLDWIDE Corp',
-    'DIOD': 'DIODES INC /DEL/',
-    'PENN': 'PENN Entertainment, Inc.',
-    'TDW': 'TIDEWATER INC',
-    'VCEL': 'Vericel Corp',
-    'EQX': 'Equinox Gold Corp.',
-    'TGNA': 'TEGNA INC',
-    'ACAD': 'ACADIA PHARMACEUTICALS INC',
-    'NMRK': 'NEWMARK GROUP, INC.',
-    'QS': 'QuantumScape Corp',
-    'AKR': 'ACADIA REALTY TRUST',
-    'TRN': 'TRINITY INDUSTRIES INC',
-    'SHZNY': 'Shenzhen Expressway Co. / ADR',
-    'APAM': 'Artisan Partners Asset Management Inc.',
-    'BFH': 'BREAD FINANCIAL HOLDINGS, INC.',
-    'ATKR': 'Atkore Inc.',
-    'SXT': 'SENSIENT TECHNOLOGIES CORP',
-    'CLSK': 'CLEANSPARK, INC.',
-    'GEF': 'GREIF, INC',
-    'PK': 'Park Hotels & Resorts Inc.',
-    'FIVN': 'Five9, Inc.',
-    'CSQ': 'CALAMOS STRATEGIC TOTAL RETURN FUND',
-    'HUN': 'Huntsman CORP',
-    'UTG': 'REAVES UTILITY INCOME FUND',
-    'SGHC': 'Super Group (SGHC) Ltd',
-    'NSP': 'INSPERITY, INC.',
-    'ZLAB': 'Zai Lab Ltd',
-    'UGP': 'ULTRAPAR HOLDINGS INC',
-    'PATK': 'PATRICK INDUSTRIES INC',
-    'GNW': 'GENWORTH FINANCIAL INC',
-    'POWL': 'POWELL INDUSTRIES INC',
-    'CPRI': 'Capri Holdings Ltd',
-    'USAC': 'USA Compression Partners, LP',
-    'AVA': 'AVISTA CORP',
-    'AAP': 'ADVANCE AUTO PARTS INC',
-    'STNG': 'Scorpio Tankers Inc.',
-    'PSMT': 'PRICESMART INC',
-    'NMIH': 'NMI Holdings, Inc.',
-    'JJSF': 'J&J SNACK FOODS CORP',
-    'BUR': 'Burford Capital Ltd',
-    'ESRT': 'Empire State Realty Trust, Inc.',
-    'BKU': 'BankUnited, Inc.',
-    'CVBF': 'CVB FINANCIAL CORP',
-    'MANU': 'Manchester United plc',
-    'COMP': 'Compass, Inc.',
-    'MGRC': 'MCGRATH RENTCORP',
-    'PDCO': 'PATTERSON COMPANIES, INC.',
-    'NAD': 'Nuveen Quality Municipal Income Fund',
-    'LAUR': 'LAUREATE EDUCATION, INC.',
-    'BHF': 'Brighthouse Financial, Inc.',
-    'DNLI': 'Denali Therapeutics Inc.',
-    'RXRX': 'RECURSION PHARMACEUTICALS, INC.',
-    'JANX': 'Janux Therapeutics, Inc.',
-    'CWK': 'Cushman & Wakefield plc',
-    'OII': 'OCEANEERING INTERNATIONAL INC',
-    'PLMR': 'Palomar Holdings, Inc.',
-    'AWR': 'AMERICAN STATES WATER CO',
-    'NAMS': 'NewAmsterdam Pharma Co N.V.',
-    'UE': 'Urban Edge Properties',
-    'JBLU': 'JETBLUE AIRWAYS CORP',
-    'PRGS': 'PROGRESS SOFTWARE CORP /MA',
-    'FOLD': 'AMICUS THERAPEUTICS, INC.',
-    'BOH': 'BANK OF HAWAII CORP',
-    'KC': 'Kingsoft Cloud Holdings Ltd',
-    'HCC': 'WARRIOR MET COAL, INC.',
-    'BTSGY': 'BTS Group Holdings Public Co Limited/ADR',
-    'AKO-A': 'ANDINA BOTTLING CO INC',
-    'CC': 'Chemours Co',
-    'PRK': 'PARK NATIONAL CORP /OH/',
-    'PLUG': 'PLUG POWER INC',
-    'MCY': 'MERCURY GENERAL CORP',
-    'HUBG': 'Hub Group, Inc.',
-    'HCM': 'HUTCHMED (China) Ltd',
-    'CPK': 'CHESAPEAKE UTILITIES CORP',
-    'IOSP': 'INNOSPEC INC.',
-    'ATS': 'ATS Corp /ATS',
-    'SFNC': 'SIMMONS FIRST NATIONAL CORP',
-    'NEOG': 'NEOGEN CORP',
-    'NVG': 'Nuveen AMT-Free Municipal Credit Income Fund',
-    'SGRY': 'Surgery Partners, Inc.',
-    'RGTI': 'Rigetti Computing, Inc.',
-    'CPRX': 'CATALYST PHARMACEUTICALS, INC.',
-    'TWST': 'Twist Bioscience Corp',
-    'HTLF': 'HEARTLAND FINANCIAL USA INC',
-    'SBSW': 'Sibanye Stillwater Ltd',
-    'MAN': 'ManpowerGroup Inc.',
-    'BKE': 'BUCKLE INC',
-    'OSIS': 'OSI SYSTEMS INC',
-    'INDB': 'INDEPENDENT BANK CORP',
-    'JOE': 'ST JOE Co',
-    'PAR': 'PAR TECHNOLOGY CORP',
-    'ESBA': 'Empire State Realty OP, L.P.',
-    'JPC': 'Nuveen Preferred & Income Opportunities Fund',
-    'LIVN': 'LivaNova PLC',
-    'FCPT': 'Four Corners Property Trust, Inc.',
-    'YELP': 'YELP INC',
-    'CON': 'Concentra Group Holdings Parent, Inc.',
-    'BANC': 'BANC OF CALIFORNIA, INC.',
-    'DRVN': 'Driven Brands Holdings Inc.',
-    'PLTK': 'Playtika Holding Corp.',
-    'ENOV': 'Enovis CORP',
-    'TTMI': 'TTM TECHNOLOGIES INC',
-    'LCII': 'LCI INDUSTRIES',
-    'GT': 'GOODYEAR TIRE & RUBBER CO /OH/',
-    'EXG': 'Eaton Vance Tax-Managed Global Diversified Equity Income Fund',
-    'NOMD': 'Nomad Foods Ltd',
-    'CDE': 'Coeur Mining, Inc.',
-    'CWT': 'CALIFORNIA WATER SERVICE GROUP',
-    'ENR': 'ENERGIZER HOLDINGS, INC.',
-    'WGS': 'GeneDx Holdings Corp.',
-    'KLIC': 'KULICKE & SOFFA INDUSTRIES INC',
-    'ENVA': 'Enova International, Inc.',
-    'AZZ': 'AZZ INC',
-    'MRCY': 'MERCURY SYSTEMS INC',
-    'CAKE': 'CHEESECAKE FACTORY INC',
-    'WAFD': 'WAFD INC',
-    'APPN': 'APPIAN CORP',
-    'DBC': 'Invesco DB Commodity Index Tracking Fund',
-    'ABR': 'ARBOR REALTY TRUST INC',
-    'KYMR': 'Kymera Therapeutics, Inc.',
-    'PSNY': 'Polestar Automotive Holding UK PLC',
-    'RPD': 'Rapid7, Inc.',
-    'CSAN': 'Cosan S.A.',
-    'ODD': 'Oddity Tech Ltd',
-    'RNW': 'ReNew Energy Global plc',
-    'ARCH': 'ARCH RESOURCES, INC.',
-    'AIN': 'ALBANY INTERNATIONAL CORP /DE/',
-    'CXW': 'CoreCivic, Inc.',
-    'CURB': 'Curbline Properties Corp.',
-    'FFBC': 'FIRST FINANCIAL BANCORP /OH/',
-    'GRBK': 'Green Brick Partners, Inc.',
-    'AVAL': 'Grupo Aval Acciones Y Valores S.A.',
-    'BWIN': 'Baldwin Insurance Group, Inc.',
-    'CALX': 'CALIX, INC',
-    'B': 'BARNES GROUP INC',
-    'BB': 'BLACKBERRY Ltd',
-    'TBBK': 'Bancorp, Inc.',
-    'PRVA': 'Privia Health Group, Inc.',
-    'AYR': 'Aircastle LTD',
-    'AIR': 'AAR CORP',
-    'VERA': 'Vera Therapeutics, Inc.',
-    'LOT': 'Lotus Technology Inc.',
-    'SMR': 'NUSCALE POWER Corp',
-    'AZTA': 'Azenta, Inc.',
-    'MRRTY': 'MARFRIG GLOBAL FOODS S.A.',
-    'GCMG': 'GCM Grosvenor Inc.',
-    'SEB': 'SEABOARD CORP /DE/',
-    'SDRL': 'Seadrill Ltd',
-    'SEM': 'SELECT MEDICAL HOLDINGS CORP',
-    'IREN': 'IREN Ltd',
-    'SHO': 'Sunstone Hotel Investors, Inc.',
-    'TNDM': 'TANDEM DIABETES CARE INC',
-    'SWI': 'SolarWinds Corp',
-    'SPB': 'Spectrum Brands Holdings, Inc.',
-    'NZF': 'Nuveen Municipal Credit Income Fund',
-    'PTY': 'PIMCO CORPORATE & INCOME OPPORTUNITY FUND',
-    'STNE': 'StoneCo Ltd.',
-    'SPNT': 'SiriusPoint Ltd',
-    'PFS': 'PROVIDENT FINANCIAL SERVICES INC',
-    'ETY': 'Eaton Vance Tax-Managed Diversified Equity Income Fund',
-    'APGE': 'Apogee Therapeutics, Inc.',
-    'AMR': 'Alpha Metallurgical Resources, Inc.',
-    'NATL': 'NCR Atleos Corp',
-    'MYRG': 'MYR GROUP INC.',
-    'LMND': 'Lemonade, Inc.',
-    'HWKN': 'HAWKINS INC',
-    'MLCO': 'Melco Resorts & Entertainment LTD',
-    'UTF': 'COHEN & STEERS INFRASTRUCTURE FUND INC',
-    'ALHC': 'Alignment Healthcare, Inc.',
-    'EWTX': 'Edgewise Therapeutics, Inc.',
-    'MPW': 'MEDICAL PROPERTIES TRUST INC',
-    'ZIM': 'ZIM Integrated Shipping Services Ltd.',
-    'BATRA': 'Atlanta Braves Holdings, Inc.',
-    'MTX': 'MINERALS TECHNOLOGIES INC',
-    'ARWR': 'ARROWHEAD PHARMACEUTICALS, INC.',
-    'CGON': 'CG Oncology, Inc.',
-    'LXP': 'LXP Industrial Trust',
-    'VC': 'VISTEON CORP',
-    'ADUS': 'Addus HomeCare Corp',
-    'ICFI': 'ICF International, Inc.',
-    'FBK': 'FB Financial Corp',
-    'ACLS': 'AXCELIS TECHNOLOGIES INC',
-    'CEPU': 'CENTRAL PUERTO S.A.',
-    'ARDT': 'Ardent Health Partners, Inc.',
-    'TMDX': 'TransMedics Group, Inc.',
-    'ADX': 'ADAMS DIVERSIFIED EQUITY FUND, INC.',
-    'WLY': 'JOHN WILEY & SONS, INC.',
-    'MCW': 'Mister Car Wash, Inc.',
-    'EXTR': 'EXTREME NETWORKS INC',
-    'STRA': 'Strategic Education, Inc.',
-    'LSPD': 'Lightspeed Commerce Inc.',
-    'ROIC': 'RETAIL OPPORTUNITY INVESTMENTS CORP',
-    'KWR': 'QUAKER CHEMICAL CORP',
-    'RUN': 'Sunrun Inc.',
-    'EPAC': 'ENERPAC TOOL GROUP CORP',
-    'HNI': 'HNI CORP',
-    'HURN': 'Huron Consulting Group Inc.',
-    'BANR': 'BANNER CORP',
-    'VSH': 'VISHAY INTERTECHNOLOGY INC',
-    'FRME': 'FIRST MERCHANTS CORP',
-    'IVT': 'InvenTrust Properties Corp.',
-    'MRX': 'Marex Group plc',
-    'ZD': 'ZIFF DAVIS, INC.',
-    'CCU': 'UNITED BREWERIES CO INC',
-    'FLYW': 'Flywire Corp',
-    'MGNI': 'MAGNITE, INC.',
-    'ENVX': 'Enovix Corp',
-    'VIAV': 'VIAVI SOLUTIONS INC.',
-    'PPBI': 'PACIFIC PREMIER BANCORP INC',
-    'BEAM': 'Beam Therapeutics Inc.',
-    'BTU': 'PEABODY ENERGY CORP',
-    'GOF': 'GUGGENHEIM STRATEGIC OPPORTUNITIES FUND',
-    'NGD': 'New Gold Inc. /FI',
-    'HUT': 'Hut 8 Corp.',
-    'PTGX': 'Protagonist Therapeutics, Inc',
-    'KYN': 'Kayne Anderson Energy Infrastructure Fund, Inc.',
-    'SBCF': 'SEACOAST BANKING CORP OF FLORIDA',
-    'CCS': 'Century Communities, Inc.',
-    'ARCB': 'ARCBEST CORP /DE/',
-    'SAH': 'SONIC AUTOMOTIVE INC',
-    'VICR': 'VICOR CORP',
-    'DKL': 'Delek Logistics Partners, LP',
-    'LION': 'Lionsgate Studios Corp.',
-    'TRMD': 'TORM plc',
-    'NHNKY': 'Nihon Kohden Corporation/ADR',
-    'BTE': 'BAYTEX ENERGY CORP.',
-    'CMBT': 'CMB.TECH NV',
-    'WB': 'WEIBO Corp',
-    'HI': 'Hillenbrand, Inc.',
-    'CNMD': 'CONMED Corp',
-    'RNST': 'RENASANT CORP',
-    'AGX': 'ARGAN INC',
-    'SXI': 'STANDEX INTERNATIONAL CORP/DE/',
-    'GDV': 'GABELLI DIVIDEND & INCOME TRUST',
-    'KLC': 'KinderCare Learning Companies, Inc.',
-    'WERN': 'WERNER ENTERPRISES INC',
-    'NBTB': 'NBT BANCORP INC',
-    'KAR': 'OPENLANE, Inc.',
-    'CXM': 'Sprinklr, Inc.',
-    'LMAT': 'LEMAITRE VASCULAR INC',
-    'CLM': 'CORNERSTONE STRATEGIC VALUE FUND INC',
-    'VSTS': 'Vestis Corp',
-    'LU': 'Lufax Holding Ltd',
-    'UPWK': 'UPWORK, INC',
-    'YY': 'JOYY Inc.',
-    'IDYA': 'IDEAYA Biosciences, Inc.',
-    'ALG': 'ALAMO GROUP INC',
-    'RVLV': 'Revolve Group, Inc.',
-    'BKV': 'BKV Corp',
-    'CNTA': 'Centessa Pharmaceuticals plc',
-    'SOC': 'Sable Offshore Corp.',
-    'PLUS': 'EPLUS INC',
-    'VTMX': 'Vesta Real Estate Corporation, S.A.B. de C.V.',
-    'WULF': 'TERAWULF INC.',
-    'SUPN': 'SUPERNUS PHARMACEUTICALS, INC.',
-    'CRTO': 'Criteo S.A.',
-    'DFH': 'Dream Finders Homes, Inc.',
-    'NEXT': 'NextDecade Corp.',
-    'TRMK': 'TRUSTMARK CORP',
-    'TARS': 'Tarsus Pharmaceuticals, Inc.',
-    'EVTC': 'EVERTEC, Inc.',
-    'CENT': 'CENTRAL GARDEN & PET CO',
-    'WSBC': 'WESBANCO INC',
-    'DBRG': 'DigitalBridge Group, Inc.',
-    'EFSC': 'ENTERPRISE FINANCIAL SERVICES CORP',
-    'MESO': 'MESOBLAST LTD',
-    'LGND': 'LIGAND PHARMACEUTICALS INC',
-    'PINC': 'Premier, Inc.',
-    'CABO': 'Cable One, Inc.',
-    'INSW': 'International Seaways, Inc.',
-    'PWP': 'Perella Weinberg Partners',
-    'PHIN': 'PHINIA INC.',
-    'MIRM': 'Mirum Pharmaceuticals, Inc.',
-    'ENLT': 'Enlight Renewable Energy Ltd.',
-    'WOR': 'WORTHINGTON ENTERPRISES, INC.',
-    'AVDX': 'AvidXchange Holdings, Inc.',
-    'AFLYY': 'AIR FRANCE-KLM /FI',
-    'PACS': 'PACS Group, Inc.',
-    'PAGS': 'PagSeguro Digital Ltd.',
-    'USA': 'LIBERTY ALL STAR EQUITY FUND',
-    'GBX': 'GREENBRIER COMPANIES INC',
-    'SYBT': 'Stock Yards Bancorp, Inc.',
-    'LGIH': 'LGI Homes, Inc.',
-    'FL': 'FOOT LOCKER, INC.',
-    'OMCL': 'OMNICELL, INC.',
-    'ZGN': 'Ermenegildo Zegna N.V.',
-    'AGIO': 'AGIOS PHARMACEUTICALS, INC.',
-    'OSW': 'ONESPAWORLD HOLDINGS Ltd',
-    'TSLX': 'Sixth Street Specialty Lending, Inc.',
-    'TRIP': 'TripAdvisor, Inc.',
-    'MTRN': 'MATERION Corp',
-    'TFIN': 'Triumph Financial, Inc.',
-    'CHEF': 'Chefs' Warehouse, Inc.',
-    'NXRT': 'NexPoint Residential Trust, Inc.',
-    'EDN': 'EDENOR',
-    'SUPV': 'Grupo Supervielle S.A.',
-    'GERN': 'GERON CORP',
-    'GOGL': 'Golden Ocean Group Ltd',
-    'HSAI': 'Hesai Group',
-    'ORLA': 'Orla Mining Ltd.',
-    'COCO': 'Vita Coco Company, Inc.',
-    'HG': 'Hamilton Insurance Group, Ltd.',
-    'RAMP': 'LiveRamp Holdings, Inc.',
-    'IOVA': 'IOVANCE BIOTHERAPEUTICS, INC.',
-    'HRMY': 'Harmony Biosciences Holdings, Inc.',
-    'MBC': 'MasterBrand, Inc.',
-    'AGM': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'NDOI': 'Endo, Inc.',
-    'GTX': 'Garrett Motion Inc.',
-    'CDLR': 'Cadeler A/S',
-    'CVI': 'CVR ENERGY INC',
-    'TALO': 'TALOS ENERGY INC.',
-    'NEO': 'NEOGENOMICS INC',
-    'VYX': 'NCR Voyix Corp',
-    'TXG': '10x Genomics, Inc.',
-    'VSEC': 'VSE CORP',
-    'CLMT': 'Calumet, Inc. /DE',
-    'WNS': 'WNS (HOLDINGS) LTD',
-    'INTR': 'Inter & Co, Inc.',
-    'GENI': 'Genius Sports Ltd',
-    'EVCM': 'EverCommerce Inc.',
-    'OXLC': 'Oxford Lane Capital Corp.',
-    'CRI': 'CARTERS INC',
-    'SLNO': 'SOLENO THERAPEUTICS INC',
-    'TRUP': 'TRUPANION, INC.',
-    'FTF': 'FRANKLIN LTD DURATION INCOME TRUST',
-    'KMT': 'KENNAMETAL INC',
-    'DAVA': 'Endava plc',
-    'UFPT': 'UFP TECHNOLOGIES INC',
-    'BWLP': 'BW LPG Ltd',
-    'ALGT': 'Allegiant Travel CO',
-    'PRM': 'Perimeter Solutions, Inc.',
-    'ULCC': 'Frontier Group Holdings, Inc.',
-    'WWW': 'WOLVERINE WORLD WIDE INC /DE/',
-    'MQ': 'Marqeta, Inc.',
-    'OFG': 'OFG BANCORP',
-    'IBTA': 'Ibotta, Inc.',
-    'PSEC': 'PROSPECT CAPITAL CORP',
-    'PEGRY': 'Pennon Group Plc / ADR',
-    'LGF-A': 'LIONS GATE ENTERTAINMENT CORP /CN/',
-    'HPK': 'HighPeak Energy, Inc.',
-    'HLMN': 'Hillman Solutions Corp.',
-    'DRH': 'DiamondRock Hospitality Co',
-    'AAT': 'American Assets Trust, Inc.',
-    'CNXN': 'PC CONNECTION INC',
-    'CLOV': 'CLOVER HEALTH INVESTMENTS, CORP. /DE',
-    'FIHL': 'Fidelis Insurance Holdings Ltd',
-    'IQ': 'iQIYI, Inc.',
-    'MSDL': 'Morgan Stanley Direct Lending Fund',
-    'RVT': 'ROYCE SMALL-CAP TRUST, INC.',
-    'SBLK': 'Star Bulk Carriers Corp.',
-    'SIMO': 'Silicon Motion Technology CORP',
-    'LZB': 'LA-Z-BOY INC',
-    'AG': 'FIRST MAJESTIC SILVER CORP',
-    'EVT': 'Eaton Vance Tax-Advantaged Dividend Income Fund',
-    'IIPR': 'INNOVATIVE INDUSTRIAL PROPERTIES INC',
-    'NUV': 'NUVEEN MUNICIPAL VALUE FUND INC',
-    'ROG': 'ROGERS CORP',
-    'AILIH': 'Ameren Illinois Co',
-    'CENX': 'CENTURY ALUMINUM CO',
-    'JAMF': 'Jamf Holding Corp.',
-    'WMK': 'WEIS MARKETS INC',
-    'IBRX': 'ImmunityBio, Inc.',
-    'SID': 'NATIONAL STEEL CO',
-    'SONO': 'Sonos Inc',
-    'IRON': 'Disc Medicine, Inc.',
-    'MNR': 'MACH NATURAL RESOURCES LP',
-    'JAG': 'Job Aire Group Inc.',
-    'SPT': 'Sprout Social, Inc.',
-    'HTH': 'Hilltop Holdings Inc.',
-    'OBDE': 'Blue Owl Capital Corp III',
-    'APLD': 'Applied Digital Corp.',
-    'MBUMY': 'Mabuchi Motor Co., Ltd./ADR',
-    'DNN': 'DENISON MINES CORP.',
-    'CASH': 'PATHWARD FINANCIAL, INC.',
-    'FINV': 'FinVolution Group',
-    'KOS': 'Kosmos Energy Ltd.',
-    'VITL': 'Vital Farms, Inc.',
-    'DHT': 'DHT Holdings, Inc.',
-    'CIFR': 'Cipher Mining Inc.',
-    'BLTE': 'BELITE BIO, INC',
-    'BBUC': 'Brookfield Business Corp',
-    'MXL': 'MAXLINEAR, INC',
-    'GDRX': 'GoodRx Holdings, Inc.',
-    'GTBIF': 'Green Thumb Industries Inc.',
-    'AMPH': 'Amphastar Pharmaceuticals, Inc.',
-    'FUBO': 'fuboTV Inc. /FL',
-    'LOMA': 'Loma Negra Compania Industrial Argentina Sociedad Anonima',
-    'CTRI': 'Centuri Holdings, Inc.',
-    'CERT': 'Certara, Inc.',
-    'CMPR': 'CIMPRESS plc',
-    'PAX': 'Patria Investments Ltd',
-    'AKRO': 'Akero Therapeutics, Inc.',
-    'TDOC': 'Teladoc Health, Inc.',
-    'PROK': 'PROKIDNEY CORP.',
-    'KN': 'Knowles Corp',
-    'GLPG': 'GALAPAGOS NV',
-    'THS': 'TreeHouse Foods, Inc.',
-    'NABL': 'N-able, Inc.',
-    'ROCK': 'GIBRALTAR INDUSTRIES, INC.',
-    'GDYN': 'GRID DYNAMICS HOLDINGS, INC.',
-    'IART': 'INTEGRA LIFESCIENCES HOLDINGS CORP',
-    'WVE': 'Wave Life Sciences Ltd.',
-    'PRDO': 'PERDOCEO EDUCATION Corp',
-    'LC': 'LendingClub Corp',
-    'SEMR': 'SEMrush Holdings, Inc.',
-    'SKWD': 'Skyward Specialty Insurance Group, Inc.',
-    'REVG': 'REV Group, Inc.',
-    'VIR': 'Vir Biotechnology, Inc.',
-    'VRE': 'Veris Residential, Inc.',
-    'FBNC': 'FIRST BANCORP /NC/',
-    'NEP': 'NEXTERA ENERGY PARTNERS, LP',
-    'MNKD': 'MANNKIND CORP',
-    'ECAT': 'BlackRock ESG Capital Allocation Term Trust',
-    'UCTT': 'Ultra Clean Holdings, Inc.',
-    'SAND': 'SANDSTORM GOLD LTD',
-    'LKFN': 'LAKELAND FINANCIAL CORP',
-    'CHCO': 'CITY HOLDING CO',
-    'XMTR': 'Xometry, Inc.',
-    'EXPI': 'EXP World Holdings, Inc.',
-    'DFIN': 'Donnelley Financial Solutions, Inc.',
-    'WBTN': 'WEBTOON Entertainment Inc.',
-    'PRG': 'PROG Holdings, Inc.',
-    'DAN': 'DANA INC',
-    'BCAT': 'BlackRock Capital Allocation Term Trust',
-    'GNL': 'Global Net Lease, Inc.',
-    'PCT': 'PureCycle Technologies, Inc.',
-    'STC': 'STEWART INFORMATION SERVICES CORP',
-    'MSGE': 'Madison Square Garden Entertainment Corp.',
-    'LOB': 'Live Oak Bancshares, Inc.',
-    'ETV': 'Eaton Vance Tax-Managed Buy-Write Opportunities Fund',
-    'BBU': 'Brookfield Business Partners L.P.',
-    'DVAX': 'DYNAVAX TECHNOLOGIES CORP',
-    'UNFI': 'UNITED NATURAL FOODS INC',
-    'KEN': 'Kenon Holdings Ltd.',
-    'LUNR': 'Intuitive Machines, Inc.',
-    'GAB': 'GABELLI EQUITY TRUST INC',
-    'SVV': 'Savers Value Village, Inc.',
-    'AMBP': 'Ardagh Metal Packaging S.A.',
-    'CLDX': 'Celldex Therapeutics, Inc.',
-    'WTTR': 'Select Water Solutions, Inc.',
-    'NAC': 'Nuveen California Quality Municipal Income Fund',
-    'BHE': 'BENCHMARK ELECTRONICS INC',
-    'TY': 'TRI-CONTINENTAL Corp',
-    'ARQT': 'Arcutis Biotherapeutics, Inc.',
-    'FTRE': 'Fortrea Holdings Inc.',
-    'RQI': 'COHEN & STEERS QUALITY INCOME REALTY FUND INC',
-    'GO': 'Grocery Outlet Holding Corp.',
-    'HEES': 'H&E Equipment Services, Inc.',
-    'BIGZ': 'BlackRock Innovation & Growth Term Trust',
-    'BCRX': 'BIOCRYST PHARMACEUTICALS INC',
-    'FCF': 'FIRST COMMONWEALTH FINANCIAL CORP /PA/',
-    'XPRO': 'EXPRO GROUP HOLDINGS N.V.',
-    'QBTS': 'D-Wave Quantum Inc.',
-    'DESP': 'Despegar.com, Corp.',
-    'DMLP': 'DORCHESTER MINERALS, L.P.',
-    'GTY': 'GETTY REALTY CORP /MD/',
-    'IAS': 'INTEGRAL AD SCIENCE HOLDING CORP.',
-    'BMEZ': 'BlackRock Health Sciences Term Trust',
-    'UPBD': 'UPBOUND GROUP, INC.',
-    'PGNY': 'Progyny, Inc.',
-    'NWBI': 'Northwest Bancshares, Inc.',
-    'PD': 'PagerDuty, Inc.',
-    'VET': 'VERMILION ENERGY INC.',
-    'PDO': 'PIMCO Dynamic Income Opportunities Fund',
-    'MBIN': 'Merchants Bancorp',
-    'CODI': 'Compass Diversified Holdings',
-    'VRNT': 'VERINT SYSTEMS INC',
-    'OI': 'O-I Glass, Inc. /DE/',
-    'XHR': 'Xenia Hotels & Resorts, Inc.',
-    'DSGR': 'Distribution Solutions Group, Inc.',
-    'PEB': 'Pebblebrook Hotel Trust',
-    'DYN': 'Dyne Therapeutics, Inc.',
-    'ARCO': 'Arcos Dorados Holdings Inc.',
-    'GLP': 'GLOBAL PARTNERS LP',
-    'MTTR': 'Matterport, Inc./DE',
-    'AAOI': 'APPLIED OPTOELECTRONICS, INC.',
-    'DNUT': 'Krispy Kreme, Inc.',
-    'TVTX': 'Travere Therapeutics, Inc.',
-    'NBHC': 'National Bank Holdings Corp',
-    'CLBK': 'Columbia Financial, Inc.',
-    'WKC': 'WORLD KINECT CORP',
-    'TNK': 'TEEKAY TANKERS LTD.',
-    'INFN': 'Infinera Corp',
-    'BSTZ': 'BlackRock Science & Technology Term Trust',
-    'EVO': 'Evotec SE',
-    'ATRC': 'AtriCure, Inc.',
-    'PHR': 'Phreesia, Inc.',
-    'NTB': 'Bank of N.T. Butterfield & Son Ltd',
-    'OPRA': 'Opera Ltd',
-    'STGW': 'Stagwell Inc',
-    'MODG': 'Topgolf Callaway Brands Corp.',
-    'DBD': 'DIEBOLD NIXDORF, Inc',
-    'ARHS': 'Arhaus, Inc.',
-    'NWN': 'Northwest Natural Holding Co',
-    'EPC': 'EDGEWELL PERSONAL CARE Co',
-    'ZUO': 'ZUORA INC',
-    'NN': 'NEXTNAV INC.',
-    'SVMB': 'Jingbo Technology, Inc.',
-    'HDL': 'SUPER HI INTERNATIONAL HOLDING LTD.',
-    'LUCK': 'Lucky Strike Entertainment Corp',
-    'BDJ': 'BlackRock Enhanced Equity Dividend Trust',
-    'NTCT': 'NETSCOUT SYSTEMS INC',
-    'NIC': 'NICOLET BANKSHARES INC',
-    'SSRM': 'SSR MINING INC.',
-    'KSS': 'KOHLS Corp',
-    'STEW': 'SRH Total Return Fund, Inc.',
-    'VECO': 'VEECO INSTRUMENTS INC',
-    'LTC': 'LTC PROPERTIES INC',
-    'CSTM': 'CONSTELLIUM SE',
-    'RLJ': 'RLJ Lodging Trust',
-    'CTS': 'CTS CORP',
-    'PLYA': 'Playa Hotels & Resorts N.V.',
-    'GB': 'Global Blue Group Holding AG',
-    'SJW': 'SJW GROUP',
-    'TNC': 'TENNANT CO',
-    'ERO': 'Ero Copper Corp.',
-    'DAC': 'Danaos Corp',
-    'BAK': 'BRASKEM SA',
-    'SILV': 'SilverCrest Metals Inc.',
-    'INDV': 'INDIVIOR PLC',
-    'PLAB': 'PHOTRONICS INC',
-    'IMCR': 'Immunocore Holdings plc',
-    'SHCO': 'Soho House & Co Inc.',
-    'NHC': 'NATIONAL HEALTHCARE CORP',
-    'KARO': 'Karooooo Ltd.',
-    'CMRE': 'Costamare Inc.',
-    'SPHR': 'Sphere Entertainment Co.',
-    'KRP': 'Kimbell Royalty Partners, LP',
-    'HMN': 'HORACE MANN EDUCATORS CORP /DE/',
-    'EVEX': 'Eve Holding, Inc.',
-    'NVAX': 'NOVAVAX INC',
-    'MAG': 'MAG SILVER CORP',
-    'VNET': 'VNET Group, Inc.',
-    'VVX': 'V2X, Inc.',
-    'MLKN': 'MILLERKNOLL, INC.',
-    'HLIT': 'HARMONIC INC',
-    'HLIO': 'HELIOS TECHNOLOGIES, INC.',
-    'XNCR': 'Xencor Inc',
-    'FDP': 'FRESH DEL MONTE PRODUCE INC',
-    'WS': 'Worthington Steel, Inc.',
-    'TICA': 'ACUREN CORP',
-    'AMC': 'AMC ENTERTAINMENT HOLDINGS, INC.',
-    'SFL': 'SFL Corp Ltd.',
-    'DXPE': 'DXP ENTERPRISES INC',
-    'ATSG': 'Air Transport Services Group, Inc.',
-    'ARIS': 'Aris Water Solutions, Inc.',
-    'SEI': 'Solaris Energy Infrastructure, Inc.',
-    'EVH': 'Evolent Health, Inc.',
-    'CSGS': 'CSG SYSTEMS INTERNATIONAL INC',
-    'ANDE': 'Andersons, Inc.',
-    'GPCR': 'Structure Therapeutics Inc.',
-    'ADEA': 'Adeia Inc.',
-    'MCRI': 'MONARCH CASINO & RESORT INC',
-    'VRDN': 'Viridian Therapeutics, Inc.DE',
-    'KNSA': 'Kiniksa Pharmaceuticals International, plc',
-    'TROX': 'Tronox Holdings plc',
-    'VRTS': 'VIRTUS INVESTMENT PARTNERS, INC.',
-    'HE': 'HAWAIIAN ELECTRIC INDUSTRIES INC',
-    'KRNT': 'Kornit Digital Ltd.',
-    'CUBI': 'Customers Bancorp, Inc.',
-    'GSG': 'iShares S&P GSCI Commodity-Indexed Trust',
-    'BV': 'BrightView Holdings, Inc.',
-    'BXMX': 'Nuveen S&P 500 BuyWrite Income Fund',
-    'HYT': 'BLACKROCK CORPORATE HIGH YIELD FUND, INC.',
-    'PX': 'P10, Inc.',
-    'SPNS': 'SAPIENS INTERNATIONAL CORP N V',
-    'TGI': 'TRIUMPH GROUP INC',
-    'MLNK': 'MeridianLink, Inc.',
-    'HELE': 'HELEN OF TROY LTD',
-    'ADNT': 'Adient plc',
-    'STEL': 'Stellar Bancorp, Inc.',
-    'SDGR': 'Schrodinger, Inc.',
-    'GSBD': 'Goldman Sachs BDC, Inc.',
-    'FSM': 'FORTUNA MINING CORP.',
-    'FLNG': 'Flex LNG Ltd.',
-    'NAVI': 'NAVIENT CORP',
-    'ETG': 'Eaton Vance Tax-Advantaged Global Dividend Income Fund',
-    'UMH': 'UMH PROPERTIES, INC.',
-    'ATEC': 'Alphatec Holdings, Inc.',
-    'DSL': 'DoubleLine Income Solutions Fund',
-    'SSII': 'SS Innovations International, Inc.',
-    'SASR': 'SANDY SPRING BANCORP INC',
-    'GIII': 'G III APPAREL GROUP LTD /DE/',
-    'LADR': 'Ladder Capital Corp',
-    'HOPE': 'HOPE BANCORP INC',
-    'NGVT': 'Ingevity Corp',
-    'NMM': 'Navios Maritime Partners L.P.',
-    'NRP': 'NATURAL RESOURCE PARTNERS LP',
-    'ATEN': 'A10 Networks, Inc.',
-    'WLFC': 'WILLIS LEASE FINANCE CORP',
-    'RES': 'RPC INC',
-    'CARCY': 'China Resources Cement Holdings Limited/ADR/',
-    'VTLE': 'Vital Energy, Inc.',
-    'CMPO': 'CompoSecure, Inc.',
-    'TASK': 'TaskUs, Inc.',
-    'DNOW': 'DNOW Inc.',
-    'ASTH': 'Astrana Health, Inc.',
-    'BLBD': 'Blue Bird Corp',
-    'SCL': 'STEPAN CO',
-    'FSCO': 'FS Credit Opportunities Corp.',
-    'BTT': 'BlackRock Municipal 2030 Target Term Trust',
-    'MYGN': 'MYRIAD GENETICS INC',
-    'AFYA': 'Afya Ltd',
-    'STBA': 'S&T BANCORP INC',
-    'KLG': 'WK Kellogg Co',
-    'AHCO': 'AdaptHealth Corp.',
-    'OXM': 'OXFORD INDUSTRIES INC',
-    'AMRC': 'Ameresco, Inc.',
-    'SRCE': '1ST SOURCE CORP',
-    'WT': 'WisdomTree, Inc.',
-    'TCBK': 'TRICO BANCSHARES /',
-    'UTI': 'UNIVERSAL TECHNICAL INSTITUTE INC',
-    'TILE': 'INTERFACE INC',
-    'RXST': 'RxSight, Inc.',
-    'LNN': 'LINDSAY CORP',
-    'IRS': 'IRSA INVESTMENTS & REPRESENTATIONS INC',
-    'VBTX': 'Veritex Holdings, Inc.',
-    'HIMX': 'Himax Technologies, Inc.',
-    'HLX': 'HELIX ENERGY SOLUTIONS GROUP INC',
-    'CMRF': 'CIM REAL ESTATE FINANCE TRUST, INC.',
-    'WINA': 'WINMARK CORP',
-    'BLX': 'FOREIGN TRADE BANK OF LATIN AMERICA, INC.',
-    'COUR': 'Coursera, Inc.',
-    'ESTA': 'ESTABLISHMENT LABS HOLDINGS INC.',
-    'MMI': 'Marcus & Millichap, Inc.',
-    'LZ': 'LEGALZOOM.COM, INC.',
-    'SGML': 'Sigma Lithium Corp',
-    'UNIT': 'Uniti Group Inc.',
-    'WABC': 'WESTAMERICA BANCORPORATION',
-    'CWH': 'Camping World Holdings, Inc.',
-    'TTGT': 'TechTarget, Inc.',
-    'AMPL': 'Amplitude, Inc.',
-    'USPH': 'U S PHYSICAL THERAPY INC /NV',
-    'HROW': 'HARROW, INC.',
-    'WGO': 'WINNEBAGO INDUSTRIES INC',
-    'CDRE': 'Cadre Holdings, Inc.',
-    'QQQX': 'Nuveen NASDAQ 100 Dynamic Overwrite Fund',
-    'CBRL': 'CRACKER BARREL OLD COUNTRY STORE, INC',
-    'SYRE': 'Spyre Therapeutics, Inc.',
-    'DCOM': 'Dime Community Bancshares, Inc. /NY/',
-    'RCUS': 'Arcus Biosciences, Inc.',
-    'LEG': 'LEGGETT & PLATT INC',
-    'QCRH': 'QCR HOLDINGS INC',
-    'CET': 'CENTRAL SECURITIES CORP',
-    'CDNA': 'CareDx, Inc.',
-    'BST': 'BlackRock Science & Technology Trust',
-    'OCUL': 'OCULAR THERAPEUTIX, INC',
-    'DCBO': 'Docebo Inc.',
-    'SABR': 'Sabre Corp',
-    'MDXG': 'MIMEDX GROUP, INC.',
-    'ARVN': 'ARVINAS, INC.',
-    'FORTY': 'FORMULA SYSTEMS (1985) LTD',
-    'PBI': 'PITNEY BOWES INC /DE/',
-    'LILA': 'Liberty Latin America Ltd.',
-    'FOR': 'Forestar Group Inc.',
-    'AIV': 'APARTMENT INVESTMENT & MANAGEMENT CO',
-    'FSLY': 'Fastly, Inc.',
-    'BFS': 'SAUL CENTERS, INC.',
-    'SILA': 'Sila Realty Trust, Inc.',
-    'DQ': 'DAQO NEW ENERGY CORP.',
-    'ELME': 'Elme Communities',
-    'SEZL': 'Sezzle Inc.',
-    'NRIX': 'Nurix Therapeutics, Inc.',
-    'TR': 'TOOTSIE ROLL INDUSTRIES INC',
-    'TPC': 'TUTOR PERINI CORP',
-    'GEL': 'GENESIS ENERGY LP',
-    'OUTKY': 'OUTOKUMPU OY /FI',
-    'ACDC': 'ProFrac Holding Corp.',
-    'SCS': 'STEELCASE INC',
-    'AAPI': 'Apple iSports Group, Inc.',
-    'AORT': 'ARTIVION, INC.',
-    'RBCAA': 'REPUBLIC BANCORP INC /KY/',
-    'BUSE': 'FIRST BUSEY CORP /NV/',
-    'UVV': 'UNIVERSAL CORP /VA/',
-    'MRTN': 'MARTEN TRANSPORT LTD',
-    'EOS': 'Eaton Vance Enhanced Equity Income Fund II',
-    'CGAU': 'Centerra Gold Inc.',
-    'AGLY': 'Atlantis Glory Inc.',
-    'NSSC': 'NAPCO SECURITY TECHNOLOGIES, INC',
-    'BLFS': 'BIOLIFE SOLUTIONS INC',
-    'GRDN': 'Guardian Pharmacy Services, Inc.',
-    'MFIC': 'MidCap Financial Investment Corp',
-    'OCSL': 'Oaktree Specialty Lending Corp',
-    'ALEX': 'Alexander & Baldwin, Inc.',
-    'KW': 'Kennedy-Wilson Holdings, Inc.',
-    'NVEE': 'NV5 Global, Inc.',
-    'JKS': 'JinkoSolar Holding Co., Ltd.',
-    'EVGO': 'EVgo Inc.',
-    'INMD': 'InMode Ltd.',
-    'EFXT': 'Enerflex Ltd.',
-    'NMZ': 'NUVEEN MUNICIPAL HIGH INCOME OPPORTUNITY FUND',
-    'IMAX': 'IMAX CORP',
-    'PRAX': 'Praxis Precision Medicines, Inc.',
-    'DK': 'Delek US Holdings, Inc.',
-    'CCB': 'COASTAL FINANCIAL CORP',
-    'UDMY': 'Udemy, Inc.',
-    'JBGS': 'JBG SMITH Properties',
-    'CRAI': 'CRA INTERNATIONAL, INC.',
-    'ARDX': 'ARDELYX, INC.',
-    'QNST': 'QUINSTREET, INC',
-    'CRCT': 'Cricut, Inc.',
-    'DEA': 'Easterly Government Properties, Inc.',
-    'BMBL': 'Bumble Inc.',
-    'THRM': 'Gentherm Inc',
-    'BY': 'BYLINE BANCORP, INC.',
-    'OLO': 'Olo Inc.',
-    'COHU': 'COHU INC',
-    'TBLA': 'Taboola.com Ltd.',
-    'IMKTA': 'INGLES MARKETS INC',
-    'SMWB': 'SIMILARWEB LTD.',
-    'DAWN': 'Day One Biopharmaceuticals, Inc.',
-    'GAM': 'GENERAL AMERICAN INVESTORS CO INC',
-    'NG': 'NOVAGOLD RESOURCES INC',
-    'MRVI': 'MARAVAI LIFESCIENCES HOLDINGS, INC.',
-    'KBDC': 'Kayne Anderson BDC, Inc.',
-    'PZZA': 'PAPA JOHNS INTERNATIONAL INC',
-    'ARI': 'Apollo Commercial Real Estate Finance, Inc.',
-    'NVGS': 'Navigator Holdings Ltd.',
-    'QUBT': 'Quantum Computing Inc.',
-    'JFR': 'NUVEEN FLOATING RATE INCOME FUND',
-    'RCKT': 'ROCKET PHARMACEUTICALS, INC.',
-    'NYAX': 'Nayax Ltd.',
-    'NFJ': 'Virtus Dividend, Interest & Premium Strategy Fund',
-    'NMFC': 'New Mountain Finance Corp',
-    'EIG': 'Employers Holdings, Inc.',
-    'SDHC': 'Smith Douglas Homes Corp.',
-    'CNNE': 'Cannae Holdings, Inc.',
-    'DOLE': 'Dole plc',
-    'EVRI': 'Everi Holdings Inc.',
-    'BHLB': 'BERKSHIRE HILLS BANCORP INC',
-    'HCI': 'HCI Group, Inc.',
-    'LEU': 'CENTRUS ENERGY CORP',
-    'FOXF': 'FOX FACTORY HOLDING CORP',
-    'FWRG': 'First Watch Restaurant Group, Inc.',
-    'PDX': 'PIMCO Dynamic Income Strategy Fund',
-    'MOMO': 'Hello Group Inc.',
-    'SPH': 'SUBURBAN PROPANE PARTNERS LP',
-    'EVV': 'Eaton Vance Ltd Duration Income Fund',
-    'ROOT': 'Root, Inc.',
-    'IDT': 'IDT CORP',
-    'TWO': 'TWO HARBORS INVESTMENT CORP.',
-    'SAFT': 'SAFETY INSURANCE GROUP INC',
-    'CNCK': 'Coincheck Group N.V.',
-    'HTZ': 'HERTZ GLOBAL HOLDINGS, INC',
-    'FVRR': 'Fiverr International Ltd.',
-    'PLSE': 'PULSE BIOSCIENCES, INC.',
-    'ANIP': 'ANI PHARMACEUTICALS INC',
-    'ARLO': 'Arlo Technologies, Inc.',
-    'KOZAY': 'Koza Altin Isletmeleri A.S./ADR',
-    'XRX': 'Xerox Holdings Corp',
-    'SBH': 'Sally Beauty Holdings, Inc.',
-    'WEAV': 'Weave Communications, Inc.',
-    'SAFE': 'Safehold Inc.',
-    'EMBC': 'Embecta Corp.',
-    'APOG': 'APOGEE ENTERPRISES, INC.',
-    'KALU': 'KAISER ALUMINUM CORP',
-    'VSAT': 'VIASAT INC',
-    'SCSC': 'SCANSOURCE, INC.',
-    'AUPH': 'Aurinia Pharmaceuticals Inc.',
-    'UP': 'Wheels Up Experience Inc.',
-    'NTST': 'NETSTREIT Corp.',
-    'UTZ': 'Utz Brands, Inc.',
-    'LPG': 'DORIAN LPG LTD.',
-    'AMWD': 'AMERICAN WOODMARK CORP',
-    'ATUS': 'Altice USA, Inc.',
-    'PENG': 'Penguin Solutions, Inc.',
-    'MRC': 'MRC GLOBAL INC.',
-    'TLRY': 'Tilray Brands, Inc.',
-    'PL': 'Planet Labs PBC',
-    'COMM': 'CommScope Holding Company, Inc.',
-    'CIM': 'CHIMERA INVESTMENT CORP',
-    'GABC': 'GERMAN AMERICAN BANCORP, INC.',
-    'SNDX': 'Syndax Pharmaceuticals Inc',
-    'SA': 'SEABRIDGE GOLD INC',
-    'STAA': 'STAAR SURGICAL CO',
-    'DSP': 'Viant Technology Inc.',
-    'EFC': 'Ellington Financial Inc.',
-    'PRSU': 'Pursuit Attractions & Hospitality, Inc.',
-    'FPF': 'First Trust Intermediate Duration Preferred & Income Fund',
-    'VTEX': 'VTEX',
-    'PGRE': 'Paramount Group, Inc.',
-    'BCSF': 'Bain Capital Specialty Finance, Inc.',
-    'PLAY': 'Dave & Buster's Entertainment, Inc.',
-    'CECO': 'CECO ENVIRONMENTAL CORP',
-    'BGM': 'BGM Group Ltd.',
-    'ULH': 'UNIVERSAL LOGISTICS HOLDINGS, INC.',
-    'SEVCF': 'Sono Group N.V.',
-    'OMI': 'OWENS & MINOR INC/VA/',
-    'LMB': 'Limbach Holdings, Inc.',
-    'GETY': 'Getty Images Holdings, Inc.',
-    'ICHR': 'ICHOR HOLDINGS, LTD.',
-    'CARS': 'Cars.com Inc.',
-    'INVA': 'Innoviva, Inc.',
-    'EOSE': 'Eos Energy Enterprises, Inc.',
-    'SPRY': 'ARS Pharmaceuticals, Inc.',
-    'RC': 'Ready Capital Corp',
-    'TUYA': 'Tuya Inc.',
-    'TIGR': 'UP Fintech Holding Ltd',
-    'PTA': 'Cohen & Steers Tax-Advantaged Preferred Securities & Income Fund',
-    'BBSI': 'BARRETT BUSINESS SERVICES INC',
-    'DAVE': 'Dave Inc./DE',
-    'ECPG': 'ENCORE CAPITAL GROUP INC',
-    'PFBC': 'Preferred Bank',
-    'SSTK': 'Shutterstock, Inc.',
-    'XPEL': 'XPEL, Inc.',
-    'MD': 'Pediatrix Medical Group, Inc.',
-    'CCEC': 'Capital Clean Energy Carriers Corp.',
-    'PEBO': 'PEOPLES BANCORP INC',
-    'PDFS': 'PDF SOLUTIONS INC',
-    'IGIC': 'International General Insurance Holdings Ltd.',
-    'AMSC': 'AMERICAN SUPERCONDUCTOR CORP /DE/',
-    'PSFE': 'Paysafe Ltd',
-    'PMT': 'PennyMac Mortgage Investment Trust',
-    'COLL': 'COLLEGIUM PHARMACEUTICAL, INC',
-    'IHS': 'IHS Holding Ltd',
-    'CTOS': 'Custom Truck One Source, Inc.',
-    'AOSL': 'ALPHA & OMEGA SEMICONDUCTOR Ltd',
-    'ELVN': 'Enliven Therapeutics, Inc.',
-    'SII': 'SPROTT INC.',
-    'DGII': 'DIGI INTERNATIONAL INC',
-    'WOOF': 'Petco Health & Wellness Company, Inc.',
-    'AMTD': 'AMTD IDEA GROUP',
-    'OPEN': 'Opendoor Technologies Inc.',
-    'NTLA': 'Intellia Therapeutics, Inc.',
-    'PUMP': 'ProPetro Holding Corp.',
-    'GOLLQ': 'Gol Intelligent Airlines Inc.',
-    'CURLF': 'Curaleaf Holdings, Inc.',
-    'INVX': 'Innovex International, Inc.',
-    'LQDA': 'Liquidia Corp',
-    'CSWC': 'CAPITAL SOUTHWEST CORP',
-    'UUUU': 'ENERGY FUELS INC',
-    'SBGI': 'Sinclair, Inc.',
-    'CSR': 'CENTERSPACE',
-    'MDRX': 'Veradigm Inc.',
-    'ASPN': 'ASPEN AEROGELS INC',
-    'NRDS': 'NERDWALLET, INC.',
-    'FBMS': 'FIRST BANCSHARES INC /MS/',
-    'FSUN': 'FIRSTSUN CAPITAL BANCORP',
-    'SKE': 'Skeena Resources Ltd',
-    'KRUS': 'KURA SUSHI USA, INC.',
-    'BOW': 'Bowhead Specialty Holdings Inc.',
-    'PRO': 'PROS Holdings, Inc.',
-    'KFRC': 'KFORCE INC',
-    'GATO': 'Gatos Silver, Inc.',
-    'PDM': 'Piedmont Office Realty Trust, Inc.',
-    'INOD': 'INNODATA INC',
-    'RDW': 'Redwire Corp',
-    'NX': 'Quanex Building Products CORP',
-    'KRO': 'KRONOS WORLDWIDE INC',
-    'AMN': 'AMN HEALTHCARE SERVICES INC',
-    'OLPX': 'OLAPLEX HOLDINGS, INC.',
-    'OCFC': 'OCEANFIRST FINANCIAL CORP',
-    'ARR': 'Armour Residential REIT, Inc.',
-    'FIGS': 'FIGS, Inc.',
-    'OPFI': 'OppFi Inc.',
-    'VMEO': 'Vimeo, Inc.',
-    'LQDT': 'LIQUIDITY SERVICES INC',
-    'BRKL': 'BROOKLINE BANCORP INC',
-    'NBXG': 'Neuberger Berman Next Generation Connectivity Fund Inc.',
-    'CRF': 'CORNERSTONE TOTAL RETURN FUND INC',
-    'MUC': 'BLACKROCK MUNIHOLDINGS CALIFORNIA QUALITY FUND, INC.',
-    'SHLS': 'Shoals Technologies Group, Inc.',
-    'OBK': 'Origin Bancorp, Inc.',
-    'AGL': 'agilon health, inc.',
-    'OPK': 'OPKO HEALTH, INC.',
-    'EXOD': 'Exodus Movement, Inc.',
-    'AGRO': 'Adecoagro S.A.',
-    'BBN': 'BlackRock Taxable Municipal Bond Trust',
-    'JBSS': 'SANFILIPPO JOHN B & SON INC',
-    'AMAL': 'Amalgamated Financial Corp.',
-    'BBDC': 'Barings BDC, Inc.',
-    'FBRT': 'Franklin BSP Realty Trust, Inc.',
-    'JBI': 'Janus International Group, Inc.',
-    'BELFA': 'BEL FUSE INC /NJ',
-    'VTOL': 'Bristow Group Inc.',
-    'CMCO': 'COLUMBUS MCKINNON CORP',
-    'BORR': 'Borr Drilling Ltd',
-    'BKD': 'Brookdale Senior Living Inc.',
-    'HEPS': 'D-MARKET Electronic Services & Trading',
-    'ACMR': 'ACM Research, Inc.',
-    'BTZ': 'BLACKROCK CREDIT ALLOCATION INCOME TRUST',
-    'ARRY': 'Array Technologies, Inc.',
-    'EAI': 'ENTERGY ARKANSAS, LLC',
-    'MFA': 'MFA FINANCIAL, INC.',
-    'DX': 'DYNEX CAPITAL INC',
-    'AHH': 'Armada Hoffler Properties, Inc.',
-    'TV': 'GRUPO TELEVISA, S.A.B.',
-    'RNP': 'COHEN & STEERS REIT & PREFERRED & INCOME FUND INC',
-    'ML': 'MONEYLION INC.',
-    'BLMN': 'Bloomin' Brands, Inc.',
-    'PARR': 'PAR PACIFIC HOLDINGS, INC.',
-    'TPB': 'Turning Point Brands, Inc.',
-    'ECC': 'Eagle Point Credit Co Inc.',
-    'AVXL': 'ANAVEX LIFE SCIENCES CORP.',
-    'ALX': 'ALEXANDERS INC',
-    'RTGN': 'RetinalGenix Technologies Inc.',
-    'SDA': 'SunCar Technology Group Inc.',
-    'REAL': 'TheRealReal, Inc.',
-    'ENFN': 'Enfusion, Inc.',
-    'HSTM': 'HEALTHSTREAM INC',
-    'GOGO': 'Gogo Inc.',
-    'CVAC': 'CureVac N.V.',
-    'ADPT': 'Adaptive Biotechnologies Corp',
-    'PHVS': 'Pharvaris N.V.',
-    'TRNS': 'TRANSCAT INC',
-    'PCRX': 'Pacira BioSciences, Inc.',
-    'GOOS': 'Canada Goose Holdings Inc.',
-    'DCO': 'DUCOMMUN INC /DE/',
-    'MSC': 'STUDIO CITY INTERNATIONAL HOLDINGS Ltd',
-    'EEX': 'Emerald Holding, Inc.',
-    'NNE': 'Nano Nuclear Energy Inc.',
-    'AIUG': 'AI Unlimited Group, Inc.',
-    'DLX': 'DELUXE CORP',
-    'GRC': 'GORMAN RUPP CO',
-    'EXK': 'ENDEAVOUR SILVER CORP',
-    'TH': 'Target Hospitality Corp.',
-    'SBR': 'SABINE ROYALTY TRUST',
-    'CRESY': 'CRESUD INC',
-    'BFC': 'Bank First Corp',
-    'LVWR': 'LiveWire Group, Inc.',
-    'AMSF': 'AMERISAFE INC',
-    'LX': 'LexinFintech Holdings Ltd.',
-    'NUVB': 'Nuvation Bio Inc.',
-    'THR': 'Thermon Group Holdings, Inc.',
-    'SERV': 'Serve Robotics Inc. /DE/',
-    'TCNNF': 'Trulieve Cannabis Corp.',
-    'VLRS': 'Controladora Vuela Compania de Aviacion, S.A.B. de C.V.',
-    'FWRD': 'FORWARD AIR CORP',
-    'TRS': 'TRIMAS CORP',
-    'BCYC': 'BICYCLE THERAPEUTICS PLC',
-    'MATW': 'MATTHEWS INTERNATIONAL CORP',
-    'IPX': 'IPERIONX Ltd',
-    'EH': 'EHang Holdings Ltd',
-    'AWF': 'ALLIANCEBERNSTEIN GLOBAL HIGH INCOME FUND INC',
-    'DMRC': 'Digimarc CORP',
-    'ETW': 'Eaton Vance Tax-Managed Global Buy-Write Opportunities Fund',
-    'SEAT': 'Vivid Seats Inc.',
-    'CGBD': 'Carlyle Secured Lending, Inc.',
-    'PFLT': 'PennantPark Floating Rate Capital Ltd.',
-    'RDFN': 'Redfin Corp',
-    'FIP': 'FTAI Infrastructure Inc.',
-    'NRK': 'NUVEEN NEW YORK AMT-FREE QUALITY MUNICIPAL INCOME FUND',
-    'KIND': 'Nextdoor Holdings, Inc.',
-    'SBSI': 'SOUTHSIDE BANCSHARES INC',
-    'TMP': 'TOMPKINS FINANCIAL CORP',
-    'ZYME': 'Zymeworks Inc.',
-    'GIC': 'GLOBAL INDUSTRIAL Co',
-    'GRNT': 'Granite Ridge Resources, Inc.',
-    'CTBI': 'COMMUNITY TRUST BANCORP INC /KY/',
-    'RDWR': 'RADWARE LTD',
-    'HSII': 'HEIDRICK & STRUGGLES INTERNATIONAL INC',
-    'PDS': 'PRECISION DRILLING Corp',
-    'PRLB': 'Proto Labs Inc',
-    'BLND': 'Blend Labs, Inc.',
-    'CBL': 'CBL & ASSOCIATES PROPERTIES INC',
-    'AAMI': 'Acadian Asset Management Inc.',
-    'AOD': 'abrdn Total Dynamic Dividend Fund',
-    'PNTG': 'Pennant Group, Inc.',
-    'OCS': 'Oculis Holding AG',
-    'NGVC': 'Natural Grocers by Vitamin Cottage, Inc.',
-    'TIXT': 'TELUS International (Cda) Inc.',
-    'NCDL': 'Nuveen Churchill Direct Lending Corp.',
-    'FNA': 'Paragon 28, Inc.',
-    'ACEL': 'Accel Entertainment, Inc.',
-    'CTKB': 'Cytek Biosciences, Inc.',
-    'SLRC': 'SLR Investment Corp.',
-    'COGT': 'Cogent Biosciences, Inc.',
-    'HY': 'HYSTER-YALE, INC.',
-    'CHY': 'CALAMOS CONVERTIBLE & HIGH INCOME FUND',
-    'ABCL': 'AbCellera Biologics Inc.',
-    'MSEX': 'MIDDLESEX WATER CO',
-    'AVAH': 'Aveanna Healthcare Holdings, Inc.',
-    'ECVT': 'Ecovyst Inc.',
-    'MUI': 'BLACKROCK MUNICIPAL INCOME FUND, INC.',
-    'BRDG': 'Bridge Investment Group Holdings Inc.',
-    'CII': 'BlackRock Enhanced Large Cap Core Fund, Inc.',
-    'HQH': 'abrdn Healthcare Investors',
-    'IE': 'Ivanhoe Electric Inc.',
-    'CHI': 'CALAMOS CONVERTIBLE OPPORTUNITIES & INCOME FUND',
-    'AVO': 'Mission Produce, Inc.',
-    'ASTL': 'Algoma Steel Group Inc.',
-    'STKL': 'SunOpta Inc.',
-    'FUFU': 'Bitfufu Inc.',
-    'GYRE': 'GYRE THERAPEUTICS, INC.',
-    'BDN': 'BRANDYWINE REALTY TRUST',
-    'PPTA': 'PERPETUA RESOURCES CORP.',
-    'DRD': 'DRDGOLD LTD',
-    'GDEN': 'GOLDEN ENTERTAINMENT, INC.',
-    'PFC': 'PREMIER FINANCIAL CORP',
-    'SNCY': 'Sun Country Airlines Holdings, Inc.',
-    'REAX': 'Real Brokerage Inc',
-    'TSAT': 'Telesat Corp',
-    'NEXA': 'Nexa Resources S.A.',
-    'DEC': 'Diversified Energy Co PLC',
-    'CAPL': 'CrossAmerica Partners LP',
-    'AVBP': 'ArriVent BioPharma, Inc.',
-    'BHRB': 'Burke & Herbert Financial Services Corp.',
-    'CLB': 'Core Laboratories Inc. /DE/',
-    'AMTB': 'Amerant Bancorp Inc.',
-    'MRNO': 'Murano Global Investments Plc',
-    'SEDG': 'SOLAREDGE TECHNOLOGIES, INC.',
-    'UTL': 'UNITIL CORP',
-    'REPL': 'Replimune Group, Inc.',
-    'HCSG': 'HEALTHCARE SERVICES GROUP INC',
-    'TRIN': 'Trinity Capital Inc.',
-    'HTLD': 'HEARTLAND EXPRESS INC',
-    'SXC': 'SunCoke Energy, Inc.',
-    'YEXT': 'Yext, Inc.',
-    'MTAL': 'MAC Copper Ltd',
-    'BASE': 'Couchbase, Inc.',
-    'MQY': 'BLACKROCK MUNIYIELD QUALITY FUND, INC.',
-    'OEC': 'Orion S.A.',
-    'SKYH': 'Sky Harbour Group Corp',
-    'CSTL': 'CASTLE BIOSCIENCES INC',
-    'EOI': 'Eaton Vance Enhanced Equity Income Fund',
-    'EYE': 'National Vision Holdings, Inc.',
-    'PRTH': 'Priority Technology Holdings, Inc.',
-    'SCVL': 'SHOE CARNIVAL INC',
-    'CNOB': 'ConnectOne Bancorp, Inc.',
-    'SANA': 'Sana Biotechnology, Inc.',
-    'FMBH': 'FIRST MID BANCSHARES, INC.',
-    'SPLP': 'STEEL PARTNERS HOLDINGS L.P.',
-    'ERII': 'Energy Recovery, Inc.',
-    'BBAI': 'BigBear.ai Holdings, Inc.',
-    'UXIN': 'Uxin Ltd',
-    'RWT': 'REDWOOD TRUST INC',
-    'WLKP': 'Westlake Chemical Partners LP',
-    'NESR': 'National Energy Services Reunited Corp.',
-    'PAHC': 'PHIBRO ANIMAL HEALTH CORP',
-    'AIO': 'Virtus Artificial Intelligence & Technology Opportunities Fund',
-    'ETWO': 'E2open Parent Holdings, Inc.',
-    'PSIX': 'POWER SOLUTIONS INTERNATIONAL, INC.',
-    'BXC': 'BlueLinx Holdings Inc.',
-    'ADTN': 'ADTRAN Holdings, Inc.',
-    'BZH': 'BEAZER HOMES USA INC',
-    'CSIQ': 'Canadian Solar Inc.',
-    'UVSP': 'UNIVEST FINANCIAL Corp',
-    'HCKT': 'HACKETT GROUP, INC.',
-    'RCAT': 'Red Cat Holdings, Inc.',
-    'SEPN': 'Septerna, Inc.',
-    'BFLY': 'Butterfly Network, Inc.',
-    'DAO': 'Youdao, Inc.',
-    'CDMO': 'Avid Bioservices, Inc.',
-    'CINT': 'CI&T Inc',
-    'THQ': 'abrdn Healthcare Opportunities Fund',
-    'UAN': 'CVR PARTNERS, LP',
-    'BCAX': 'Bicara Therapeutics Inc.',
-    'CRSR': 'Corsair Gaming, Inc.',
-    'ATLC': 'Atlanticus Holdings Corp',
-    'AXGN': 'Axogen, Inc.',
-    'GCT': 'GigaCloud Technology Inc',
-    'HFWA': 'HERITAGE FINANCIAL CORP /WA/',
-    'BJRI': 'BJs RESTAURANTS INC',
-    'IIIV': 'i3 Verticals, Inc.',
-    'INDI': 'indie Semiconductor, Inc.',
-    'ECO': 'Okeanis Eco Tankers Corp.',
-    'HTD': 'JOHN HANCOCK TAX-ADVANTAGED DIVIDEND INCOME FUND',
-    'IMTX': 'Immatics N.V.',
-    'PCN': 'PIMCO CORPORATE & INCOME STRATEGY FUND',
-    'GHLD': 'Guild Holdings Co',
-    'VTS': 'Vitesse Energy, Inc.',
-    'SITC': 'SITE Centers Corp.',
-    'NOAH': 'Noah Holdings Ltd',
-    'ADV': 'Advantage Solutions Inc.',
-    'FNKO': 'Funko, Inc.',
-    'GSL': 'Global Ship Lease, Inc.',
-    'OSBC': 'OLD SECOND BANCORP INC',
-    'ADSE': 'Ads-Tec Energy Public Ltd Co',
-    'PRAA': 'PRA GROUP INC',
-    'PHK': 'PIMCO HIGH INCOME FUND',
-    'JQC': 'Nuveen Credit Strategies Income Fund',
-    'ECX': 'ECARX Holdings Inc.',
-    'ANGI': 'Angi Inc.',
-    'RSKD': 'RISKIFIED LTD.',
-    'DLY': 'DoubleLine Yield Opportunities Fund',
-    'MGPI': 'MGP INGREDIENTS INC',
-    'AIOT': 'Powerfleet, Inc.',
-    'PLYM': 'Plymouth Industrial REIT, Inc.',
-    'TYRA': 'Tyra Biosciences, Inc.',
-    'FFC': 'Flaherty & Crumrine PREFERRED & INCOME SECURITIES FUND INC',
-    'DAKT': 'DAKTRONICS INC /SD/',
-    'CRON': 'Cronos Group Inc.',
-    'MIESY': 'Mitsui E&S Holdings Co., Ltd./ADR',
-    'AVDL': 'AVADEL PHARMACEUTICALS PLC',
-    'NTGR': 'NETGEAR, INC.',
-    'MCBS': 'MetroCity Bankshares, Inc.',
-    'HOV': 'HOVNANIAN ENTERPRISES INC',
-    'CEVA': 'CEVA INC',
-    'UPB': 'Upstream Bio, Inc.',
-    'BITF': 'Bitfarms Ltd',
-    'ETNB': '89bio, Inc.',
-    'WDI': 'Western Asset Diversified Income Fund (WDI)',
-    'SCWX': 'SecureWorks Corp',
-    'REX': 'REX AMERICAN RESOURCES Corp',
-    'GLDD': 'Great Lakes Dredge & Dock CORP',
-    'GCI': 'Gannett Co., Inc.',
-    'SWIM': 'Latham Group, Inc.',
-    'NPWR': 'NET Power Inc.',
-    'MEG': 'Montrose Environmental Group, Inc.',
-    'ARKO': 'ARKO Corp.',
-    'MLAB': 'MESA LABORATORIES INC /CO/',
-    'GSM': 'Ferroglobe PLC',
-    'CBLL': 'Ceribell, Inc.',
-    'PLRX': 'PLIANT THERAPEUTICS, INC.',
-    'TCPC': 'BlackRock TCP Capital Corp.',
-    'DBA': 'INVESCO DB AGRICULTURE FUND',
-    'BALY': 'Bally's Corp',
-    'FMCB': 'FARMERS & MERCHANTS BANCORP',
-    'RA': 'Brookfield Real Assets Income Fund Inc.',
-    'MYI': 'BLACKROCK MUNIYIELD QUALITY FUND III, INC.',
-    'NXP': 'NUVEEN SELECT TAX FREE INCOME PORTFOLIO',
-    'PRA': 'PROASSURANCE CORP',
-    'MLR': 'MILLER INDUSTRIES INC /TN/',
-    'CFFN': 'Capitol Federal Financial, Inc.',
-    'RLAY': 'Relay Therapeutics, Inc.',
-    'ASTE': 'ASTEC INDUSTRIES INC',
-    'BCX': 'BlackRock Resources & Commodities Strategy Trust',
-    'CAL': 'CALERES INC',
-    'IRMD': 'IRADIMED CORP',
-    'DJCO': 'DAILY JOURNAL CORP',
-    'BRSP': 'BrightSpire Capital, Inc.',
-    'INN': 'Summit Hotel Properties, Inc.',
-    'REPX': 'Riley Exploration Permian, Inc.',
-    'MVST': 'Microvast Holdings, Inc.',
-    'CPF': 'CENTRAL PACIFIC FINANCIAL CORP',
-    'NBBK': 'NB Bancorp, Inc.',
-    'FDUS': 'FIDUS INVESTMENT Corp',
-    'XPOF': 'Xponential Fitness, Inc.',
-    'AVNS': 'AVANOS MEDICAL, INC.',
-    'DNTH': 'Dianthus Therapeutics, Inc. /DE/',
-    'TXO': 'TXO Partners, L.P.',
-    'ASIX': 'AdvanSix Inc.',
-    'WNC': 'WABASH NATIONAL Corp',
-    'NGL': 'NGL Energy Partners LP',
-    'ETD': 'ETHAN ALLEN INTERIORS INC',
-    'CCO': 'Clear Channel Outdoor Holdings, Inc.',
-    'JACK': 'JACK IN THE BOX INC',
-    'PRTA': 'PROTHENA CORP PUBLIC LTD CO',
-    'AC': 'Associated Capital Group, Inc.',
-    'FCBC': 'FIRST COMMUNITY BANKSHARES INC /VA/',
-    'GES': 'GUESS INC',
-    'CFB': 'CROSSFIRST BANKSHARES, INC.',
-    'DDL': 'Dingdong (Cayman) Ltd',
-    'EGBN': 'EAGLE BANCORP INC',
-    'ERAS': 'Erasca, Inc.',
-    'CAC': 'CAMDEN NATIONAL CORP',
-    'GOOD': 'GLADSTONE COMMERCIAL CORP',
-    'CRML': 'Critical Metals Corp.',
-    'TIPT': 'TIPTREE INC.',
-    'OSPN': 'OneSpan Inc.',
-    'CLNE': 'Clean Energy Fuels Corp.',
-    'CVLG': 'COVENANT LOGISTICS GROUP, INC.',
-    'RBBN': 'Ribbon Communications Inc.',
-    'PAXS': 'PIMCO Access Income Fund',
-    'MAX': 'MediaAlpha, Inc.',
-    'EQBK': 'EQUITY BANCSHARES INC',
-    'CCAP': 'Crescent Capital BDC, Inc.',
-    'BFST': 'Business First Bancshares, Inc.',
-    'LAC': 'LITHIUM AMERICAS CORP.',
-    'AACT': 'Ares Acquisition Corp II',
-    'QURE': 'uniQure N.V.',
-    'SCGX': 'SAXON CAPITAL GROUP INC',
-    'KREF': 'KKR Real Estate Finance Trust Inc.',
-    'IBCP': 'INDEPENDENT BANK CORP /MI/',
-    'SLQT': 'SelectQuote, Inc.',
-    'TGB': 'TASEKO MINES LTD',
-    'WSR': 'Whitestone REIT',
-    'NPK': 'NATIONAL PRESTO INDUSTRIES INC',
-    'PUBM': 'PubMatic, Inc.',
-    'CRMD': 'CorMedix Inc.',
-    'IGR': 'CBRE GLOBAL REAL ESTATE INCOME FUND',
-    'TRTX': 'TPG RE Finance Trust, Inc.',
-    'RPAY': 'Repay Holdings Corp',
-    'NVRI': 'ENVIRI Corp',
-    'MBWM': 'MERCANTILE BANK CORP',
-    'MBUU': 'MALIBU BOATS, INC.',
-    'BH-A': 'Biglari Holdings Inc.',
-    'BTO': 'JOHN HANCOCK FINANCIAL OPPORTUNITIES FUND',
-    'SVM': 'SILVERCORP METALS INC',
-    'IMOS': 'CHIPMOS TECHNOLOGIES INC',
-    'GSBC': 'GREAT SOUTHERN BANCORP, INC.',
-    'ODP': 'ODP Corp',
-    'MNRO': 'MONRO, INC.',
-    'ZIP': 'ZIPRECRUITER, INC.',
-    'NIE': 'Virtus Equity & Convertible Income Fund',
-    'PFN': 'PIMCO Income Strategy Fund II',
-    'PHAR': 'Pharming Group N.V.',
-    'HLF': 'HERBALIFE LTD.',
-    'TK': 'TEEKAY CORP LTD',
-    'GDLC': 'Grayscale Digital Large Cap Fund LLC',
-    'CRNC': 'Cerence Inc.',
-    'HBT': 'HBT Financial, Inc.',
-    'WOLF': 'WOLFSPEED, INC.',
-    'ORRF': 'ORRSTOWN FINANCIAL SERVICES INC',
-    'AXL': 'AMERICAN AXLE & MANUFACTURING HOLDINGS INC',
-    'IRWD': 'IRONWOOD PHARMACEUTICALS INC',
-    'HKHC': 'Horizon Kinetics Holding Corp',
-    'SHEN': 'SHENANDOAH TELECOMMUNICATIONS CO/VA/',
-    'ORC': 'Orchid Island Capital, Inc.',
-    'HBNC': 'HORIZON BANCORP INC /IN/',
-    'AMRK': 'A-Mark Precious Metals, Inc.',
-    'NEXN': 'Nexxen International Ltd.',
-    'JELD': 'JELD-WEN Holding, Inc.',
-    'IMNM': 'Immunome Inc.',
-    'ESQ': 'Esquire Financial Holdings, Inc.',
-    'MAGN': 'Magnera Corp',
-    'UFCS': 'UNITED FIRE GROUP INC',
-    'OPY': 'OPPENHEIMER HOLDINGS INC',
-    'HUYA': 'HUYA Inc.',
-    'VMO': 'Invesco Municipal Opportunity Trust',
-    'ABL': 'Abacus Life, Inc.',
-    'OFIX': 'Orthofix Medical Inc.',
-    'NIPG': 'NIP Group Inc.',
-    'SSYS': 'STRATASYS LTD.',
-    'CCD': 'Calamos Dynamic Convertible & Income Fund',
-    'CGEM': 'Cullinan Therapeutics, Inc.',
-    'LENZ': 'LENZ Therapeutics, Inc.',
-    'HAFC': 'HANMI FINANCIAL CORP',
-    'USNA': 'USANA HEALTH SCIENCES INC',
-    'SVA': 'SINOVAC BIOTECH LTD',
-    'SMP': 'STANDARD MOTOR PRODUCTS, INC.',
-    'ARMN': 'Aris Mining Corp',
-    'PGY': 'Pagaya Technologies Ltd.',
-    'EZPW': 'EZCORP INC',
-    'EVER': 'EverQuote, Inc.',
-    'LIND': 'LINDBLAD EXPEDITIONS HOLDINGS, INC.',
-    'AMPS': 'Altus Power, Inc.',
-    'BOE': 'BlackRock Enhanced Global Dividend Trust',
-    'MEGI': 'NYLI CBRE Global Infrastructure Megatrends Term Fund',
-    'HBIA': 'HILLS BANCORPORATION',
-    'GLAD': 'GLADSTONE CAPITAL CORP',
-    'MYTE': 'MYT Netherlands Parent B.V.',
-    'WRLD': 'WORLD ACCEPTANCE CORP',
-    'EOLS': 'Evolus, Inc.',
-    'CGNT': 'Cognyte Software Ltd.',
-    'ITRN': 'Ituran Location & Control Ltd.',
-    'AUTL': 'Autolus Therapeutics plc',
-    'MCB': 'Metropolitan Bank Holding Corp.',
-    'MCS': 'MARCUS CORP',
-    'EVOH': 'EvoAir Holdings Inc.',
-    'NPKI': 'NPK International Inc.',
-    'YALA': 'Yalla Group Ltd',
-    'EU': 'enCore Energy Corp.',
-    'ABUS': 'Arbutus Biopharma Corp',
-    'CRGX': 'CARGO Therapeutics, Inc.',
-    'RUPRF': 'RUPERT RESOURCES LTD',
-    'ETJ': 'Eaton Vance Risk-Managed Diversified Equity Income Fund',
-    'EVTL': 'Vertical Aerospace Ltd.',
-    'PDT': 'JOHN HANCOCK PREMIUM DIVIDEND FUND',
-    'IMXI': 'International Money Express, Inc.',
-    'PTLO': 'Portillo's Inc.',
-    'VEL': 'Velocity Financial, Inc.',
-    'STRW': 'Strawberry Fields REIT, Inc.',
-    'FAX': 'ABRDN ASIA-PACIFIC INCOME FUND, INC.',
-    'GNK': 'GENCO SHIPPING & TRADING LTD',
-    'HNOI': 'HNO International, Inc.',
-    'LPRO': 'Open Lending Corp',
-    'GGN': 'GAMCO Global Gold, Natural Resources & Income Trust',
-    'NVTS': 'Navitas Semiconductor Corp',
-    'MHD': 'BLACKROCK MUNIHOLDINGS FUND, INC.',
-    'CNDT': 'CONDUENT Inc',
-    'FSBC': 'FIVE STAR BANCORP',
-    'PACB': 'PACIFIC BIOSCIENCES OF CALIFORNIA, INC.',
-    'THRY': 'Thryv Holdings, Inc.',
-    'GPRE': 'Green Plains Inc.',
-    'BVS': 'Bioventus Inc.',
-    'BYRN': 'Byrna Technologies Inc.',
-    'CTLP': 'CANTALOUPE, INC.',
-    'VHI': 'VALHI INC /DE/',
-    'NDMO': 'Nuveen Dynamic Municipal Opportunities Fund',
-    'IFN': 'INDIA FUND, INC.',
-    'HZO': 'MARINEMAX INC',
-    'DXYZ': 'Destiny Tech100 Inc.',
-    'EMO': 'ClearBridge Energy Midstream Opportunity Fund Inc.',
-    'CURV': 'Torrid Holdings Inc.',
-    'NKX': 'NUVEEN CALIFORNIA AMT-FREE QUALITY MUNICIPAL INCOME FUND',
-    'VINP': 'Vinci Partners Investments Ltd.',
-    'VVR': 'Invesco Senior Income Trust',
-    'NIKA': 'NIKA PHARMACEUTICALS, INC',
-    'NAT': 'NORDIC AMERICAN TANKERS Ltd',
-    'PLPC': 'PREFORMED LINE PRODUCTS CO',
-    'ODC': 'Oil-Dri Corp of America',
-    'RXT': 'Rackspace Technology, Inc.',
-    'KIDS': 'ORTHOPEDIATRICS CORP',
-    'KOP': 'Koppers Holdings Inc.',
-    'LAB': 'STANDARD BIOTOOLS INC.',
-    'KUBR': 'Kuber Resources Corp',
-    'HIPO': 'Hippo Holdings Inc.',
-    'EUBG': 'ENTREPRENEUR UNIVERSE BRIGHT GROUP',
-    'SMBC': 'SOUTHERN MISSOURI BANCORP, INC.',
-    'GRAL': 'GRAIL, Inc.',
-    'TECX': 'Tectonic Therapeutic, Inc.',
-    'HNST': 'Honest Company, Inc.',
-    'NBR': 'NABORS INDUSTRIES LTD',
-    'SPTN': 'SpartanNash Co',
-    'SFIX': 'Stitch Fix, Inc.',
-    'KROS': 'Keros Therapeutics, Inc.',
-    'HUMA': 'Humacyte, Inc.',
-    'CSV': 'CARRIAGE SERVICES INC',
-    'MUJ': 'BLACKROCK MUNIHOLDINGS NEW JERSEY QUALITY FUND, INC.',
-    'EIM': 'Eaton Vance Municipal Bond Fund',
-    'LDP': 'Cohen & Steers Ltd Duration Preferred & Income Fund, Inc.',
-    'CAPR': 'CAPRICOR THERAPEUTICS, INC.',
-    'CCRN': 'CROSS COUNTRY HEALTHCARE INC',
-    'MNTK': 'Montauk Renewables, Inc.',
-    'NMCO': 'Nuveen Municipal Credit Opportunities Fund',
-    'OUST': 'Ouster, Inc.',
-    'CION': 'CION Investment Corp',
-    'ZKH': 'ZKH Group Ltd',
-    'RGR': 'STURM RUGER & CO INC',
-    'RERE': 'ATRenew Inc.',
-    'TRST': 'TRUSTCO BANK CORP N Y',
-    'ACIC': 'AMERICAN COASTAL INSURANCE Corp',
-    'VZLA': 'Vizsla Silver Corp.',
-    'ZJK': 'ZJK Industrial Co., Ltd.',
-    'SIBN': 'SI-BONE, Inc.',
-    'KULR': 'KULR Technology Group, Inc.',
-    'SKYT': 'SkyWater Technology, Inc',
-    'DNA': 'Ginkgo Bioworks Holdings, Inc.',
-    'WEST': 'Westrock Coffee Co',
-    'ALTI': 'AlTi Global, Inc.',
-    'CTO': 'CTO Realty Growth, Inc.',
-    'NCMI': 'National CineMedia, Inc.',
-    'RYI': 'Ryerson Holding Corp',
-    'MTUS': 'Metallus Inc.',
-    'ORIC': 'Oric Pharmaceuticals, Inc.',
-    'CCBG': 'CAPITAL CITY BANK GROUP INC',
-    'MOFG': 'MidWestOne Financial Group, Inc.',
-    'PEO': 'ADAMS NATURAL RESOURCES FUND, INC.',
-    'BIT': 'BlackRock Multi-Sector Income Trust',
-    'BBW': 'BUILD-A-BEAR WORKSHOP INC',
-    'GPRK': 'GeoPark Ltd',
-    'TEN': 'TSAKOS ENERGY NAVIGATION LTD',
-    'WASH': 'WASHINGTON TRUST BANCORP INC',
-    'SLP': 'Simulations Plus, Inc.',
-    'CLMB': 'Climb Global Solutions, Inc.',
-    'OPAL': 'OPAL Fuels Inc.',
-    'EMD': 'WESTERN ASSET EMERGING MARKETS DEBT FUND INC.',
-    'MGIC': 'MAGIC SOFTWARE ENTERPRISES LTD',
-    'RZLV': 'REZOLVE AI Ltd',
-    'ATRO': 'ASTRONICS CORP',
-    'FLGT': 'Fulgent Genetics, Inc.',
-    'QDMI': 'QDM International Inc.',
-    'ASC': 'Ardmore Shipping Corp',
-    'FPI': 'Farmland Partners Inc.',
-    'KRT': 'Karat Packaging Inc.',
-    'KURA': 'Kura Oncology, Inc.',
-    'IIM': 'Invesco Value Municipal Income Trust',
-    'CAN': 'Canaan Inc.',
-    'GFR': 'Greenfire Resources Ltd.',
-    'ACCD': 'Accolade, Inc.',
-    'EYPT': 'EyePoint Pharmaceuticals, Inc.',
-    'INV': 'Innventure, Inc.',
-    'MMU': 'WESTERN ASSET MANAGED MUNICIPALS FUND INC.',
-    'VREX': 'Varex Imaging Corp',
-    'LAES': 'SEALSQ Corp',
-    'HTBI': 'HomeTrust Bancshares, Inc.',
-    'NOA': 'North American Construction Group Ltd.',
-    'BHK': 'BLACKROCK CORE BOND TRUST',
-    'SRDX': 'SURMODICS INC',
-    'FLX': 'BingEx Ltd',
-    'ORKA': 'Oruka Therapeutics, Inc.',
-    'TRDA': 'Entrada Therapeutics, Inc.',
-    'FRPH': 'FRP HOLDINGS, INC.',
-    'NOTR': 'Nowtransit Inc',
-    'GEVO': 'Gevo, Inc.',
-    'LYTS': 'LSI INDUSTRIES INC',
-    'LEGH': 'Legacy Housing Corp',
-    'PBT': 'PERMIAN BASIN ROYALTY TRUST',
-    'BGB': 'Blackstone Strategic Credit 2027 Term Fund',
-    'FPH': 'Five Point Holdings, LLC',
-    'DOGZ': 'Dogness (International) Corp',
-    'DIAX': 'Nuveen Dow 30sm Dynamic Overwrite Fund',
-    'PLOW': 'DOUGLAS DYNAMICS, INC',
-    'RAPP': 'Rapport Therapeutics, Inc.',
-    'OPT': 'Opthea Ltd',
-    'VGM': 'Invesco Trust for Investment Grade Municipals',
-    'FCCN': 'SPECTRAL CAPITAL Corp',
-    'LDI': 'loanDepot, Inc.',
-    'PML': 'PIMCO MUNICIPAL INCOME FUND II',
-    'EBS': 'Emergent BioSolutions Inc.',
-    'UVE': 'UNIVERSAL INSURANCE HOLDINGS, INC.',
-    'LZM': 'Lifezone Metals Ltd',
-    'LASR': 'NLIGHT, INC.',
-    'OLP': 'ONE LIBERTY PROPERTIES INC',
-    'HTBK': 'HERITAGE COMMERCE CORP',
-    'MREO': 'Mereo BioPharma Group plc',
-    'ELTP': 'ELITE PHARMACEUTICALS INC /NV/',
-    'VKQ': 'Invesco Municipal Trust',
-    'CMTG': 'Claros Mortgage Trust, Inc.',
-    'SBC': 'SBC Medical Group Holdings Inc',
-    'STK': 'Columbia Seligman Premium Technology Growth Fund, Inc.',
-    'ATEX': 'Anterix Inc.',
-    'VCV': 'Invesco California Value Municipal Income Trust',
-    'CASS': 'CASS INFORMATION SYSTEMS INC',
-    'CHCT': 'Community Healthcare Trust Inc',
-    'SPFI': 'SOUTH PLAINS FINANCIAL, INC.',
-    'FTHY': 'FIRST TRUST HIGH YIELD OPPORTUNITIES 2027 TERM FUND',
-    'SCHL': 'SCHOLASTIC CORP',
-    'LXU': 'LSB INDUSTRIES, INC.',
-    'GHY': 'PGIM Global High Yield Fund, Inc.',
-    'BME': 'BlackRock Health Sciences Trust',
-    'BLDP': 'Ballard Power Systems Inc.',
-    'AUNA': 'AUNA S.A.',
-    'EBF': 'ENNIS, INC.',
-    'OMER': 'OMEROS CORP',
-    'BUI': 'BlackRock Utilities, Infrastructure & Power Opportunities Trust',
-    'AHG': 'Akso Health Group',
-    'MPB': 'MID PENN BANCORP INC',
-    'DDI': 'DoubleDown Interactive Co., Ltd.',
-    'TBLD': 'Thornburg Income Builder Opportunities Trust',
-    'MATV': 'Mativ Holdings, Inc.',
-    'CRD-A': 'CRAWFORD & CO',
-    'PACK': 'Ranpak Holdings Corp.',
-    'AVK': 'ADVENT CONVERTIBLE & INCOME FUND',
-    'BGY': 'BlackRock Enhanced International Dividend Trust',
-    'GOTU': 'Gaotu Techedu Inc.',
-    'NNDM': 'Nano Dimension Ltd.',
-    'AMBC': 'AMBAC FINANCIAL GROUP INC',
-    'NYMT': 'NEW YORK MORTGAGE TRUST, INC.',
-    'SLSR': 'Solaris Resources Inc.',
-    'PGC': 'PEAPACK GLADSTONE FINANCIAL CORP',
-    'IQI': 'Invesco Quality Municipal Income Trust',
-    'RSVR': 'Reservoir Media, Inc.',
-    'GMRE': 'Global Medical REIT Inc.',
-    'TTI': 'TETRA TECHNOLOGIES INC',
-    'BGS': 'B&G Foods, Inc.',
-    'ANNX': 'Annexon, Inc.',
-    'BTBT': 'Bit Digital, Inc',
-    'THFF': 'FIRST FINANCIAL CORP /IN/',
-    'XERS': 'Xeris Biopharma Holdings, Inc.',
-    'DSU': 'BLACKROCK DEBT STRATEGIES FUND, INC.',
-    'BLW': 'BLACKROCK Ltd DURATION INCOME TRUST',
-    'CMP': 'COMPASS MINERALS INTERNATIONAL INC',
-    'HKD': 'AMTD Digital Inc.',
-    'TRML': 'Tourmaline Bio, Inc.',
-    'NML': 'Neuberger Berman Energy Infrastructure & Income Fund Inc.',
-    'HNRG': 'HALLADOR ENERGY CO',
-    'WIW': 'WESTERN ASSET INFLATION-LINKED OPPORTUNITIES & INCOME FUND',
-    'ASGI': 'abrdn Global Infrastructure Income Fund',
-    'DHC': 'DIVERSIFIED HEALTHCARE TRUST',
-    'SENEA': 'Seneca Foods Corp',
-    'WLDN': 'Willdan Group, Inc.',
-    'FISI': 'FINANCIAL INSTITUTIONS INC',
-    'INNV': 'InnovAge Holding Corp.',
-    'PSBD': 'Palmer Square Capital BDC Inc.',
-    'MNMD': 'Mind Medicine (MindMed) Inc.',
-    'BLE': 'BLACKROCK MUNICIPAL INCOME TRUST II',
-    'KODK': 'EASTMAN KODAK CO',
-    'RYAM': 'RAYONIER ADVANCED MATERIALS INC.',
-    'QD': 'Qudian Inc.',
-    'GUG': 'Guggenheim Active Allocation Fund',
-    'NXJ': 'NUVEEN NEW JERSEY QUALITY MUNICIPAL INCOME FUND',
-    'SMBK': 'SMARTFINANCIAL INC.',
-    'CHPT': 'ChargePoint Holdings, Inc.',
-    'HONE': 'HarborOne Bancorp, Inc.',
-    'TALK': 'Talkspace, Inc.',
-    'ALT': 'Altimmune, Inc.',
-    'ANGO': 'ANGIODYNAMICS INC',
-    'RMT': 'ROYCE MICRO-CAP TRUST, INC.',
-    'SNDL': 'SNDL Inc.',
-    'CLFD': 'Clearfield, Inc.',
-    'EVLV': 'Evolv Technologies Holdings, Inc.',
-    'ARCT': 'Arcturus Therapeutics Holdings Inc.',
-    'GRPN': 'Groupon, Inc.',
-    'SHBI': 'SHORE BANCSHARES INC',
-    'GBLI': 'Global Indemnity Group, LLC',
-    'AEHR': 'AEHR TEST SYSTEMS',
-    'DH': 'Definitive Healthcare Corp.',
-    'CANG': 'Cango Inc.',
-    'UHT': 'UNIVERSAL HEALTH REALTY INCOME TRUST',
-    'GAMB': 'Gambling.com Group Ltd',
-    'CCNE': 'CNB FINANCIAL CORP/PA',
-    'AGS': 'PlayAGS, Inc.',
-    'TREE': 'LendingTree, Inc.',
-    'RICK': 'RCI HOSPITALITY HOLDINGS, INC.',
-    'FMNB': 'FARMERS NATIONAL BANC CORP /OH/',
-    'MSBI': 'Midland States Bancorp, Inc.',
-    'DGICA': 'DONEGAL GROUP INC',
-    'GDOT': 'GREEN DOT CORP',
-    'FFIC': 'FLUSHING FINANCIAL CORP',
-    'BCAL': 'California BanCorp \ CA',
-    'MYD': 'BLACKROCK MUNIYIELD FUND, INC.',
-    'SVRA': 'Savara Inc',
-    'CYRB': 'Cyber App Solutions Corp.',
-    'KELYA': 'KELLY SERVICES INC',
-    'FARO': 'FARO TECHNOLOGIES INC',
-    'CLW': 'Clearwater Paper Corp',
-    'BIGC': 'BigCommerce Holdings, Inc.',
-    'PHAT': 'Phathom Pharmaceuticals, Inc.',
-    'SMLR': 'Semler Scientific, Inc.',
-    'GLRE': 'GREENLIGHT CAPITAL RE, LTD.',
-    'MGTX': 'MeiraGTx Holdings plc',
-    'STOK': 'Stoke Therapeutics, Inc.',
-    'METC': 'Ramaco Resources, Inc.',
-    'LVRO': 'Lavoro Ltd',
-    'TYG': 'TORTOISE ENERGY INFRASTRUCTURE CORP',
-    'HPS': 'JOHN HANCOCK PREFERRED INCOME FUND III',
-    'NNOX': 'Nano-X Imaging Ltd.',
-    'IVR': 'Invesco Mortgage Capital Inc.',
-    'RDVT': 'Red Violet, Inc.',
-    'FRA': 'BLACKROCK FLOATING RATE INCOME STRATEGIES FUND, INC.',
-    'SES': 'SES AI Corp',
-    'ALRS': 'ALERUS FINANCIAL CORP',
-    'MLYS': 'Mineralys Therapeutics, Inc.',
-    'ACCO': 'ACCO BRANDS Corp',
-    'GAIN': 'GLADSTONE INVESTMENT CORPORATION\DE',
-    'CPAC': 'CEMENTOS PACASMAYO SAA',
-    'EGY': 'VAALCO ENERGY INC /DE/',
-    'PFIS': 'PEOPLES FINANCIAL SERVICES CORP.',
-    'IIIN': 'INSTEEL INDUSTRIES INC',
-    'FFWM': 'First Foundation Inc.',
-    'PNNT': 'PENNANTPARK INVESTMENT CORP',
-    'JMIA': 'Jumia Technologies AG',
-    'LAAC': 'Lithium Americas (Argentina) Corp.',
-    'VERV': 'Verve Therapeutics, Inc.',
-    'MITK': 'MITEK SYSTEMS INC',
-    'VLGEA': 'VILLAGE SUPER MARKET INC',
-    'EBTC': 'ENTERPRISE BANCORP INC /MA/',
-    'ISD': 'PGIM High Yield Bond Fund, Inc.',
-    'PSNL': 'Personalis, Inc.',
-    'GCO': 'GENESCO INC',
-    'XFLT': 'XAI Octagon Floating Rate & Alternative Income Trust',
-    'MXCT': 'MAXCYTE, INC.',
-    'NFBK': 'Northfield Bancorp, Inc.',
-    'CGBS': 'Crown LNG Holdings Ltd',
-    'VALU': 'VALUE LINE INC',
-    'CLCO': 'Cool Co Ltd.',
-    'PRCH': 'Porch Group, Inc.',
-    'SD': 'SANDRIDGE ENERGY INC',
-    'LINC': 'LINCOLN EDUCATIONAL SERVICES CORP',
-    'CTV': 'Innovid Corp.',
-    'TMCI': 'TREACE MEDICAL CONCEPTS, INC.',
-    'CCSI': 'Consensus Cloud Solutions, Inc.',
-    'AIRJ': 'AirJoule Technologies Corp.',
-    'ESPR': 'Esperion Therapeutics, Inc.',
-    'ANSC': 'Agriculture & Natural Solutions Acquisition Corp',
-    'FLWS': '1 800 FLOWERS COM INC',
-    'NPFD': 'Nuveen Variable Rate Preferred & Income Fund',
-    'HAIN': 'HAIN CELESTIAL GROUP INC',
-    'NBB': 'Nuveen Taxable Municipal Income Fund',
-    'OBE': 'OBSIDIAN ENERGY LTD.',
-    'GHM': 'GRAHAM CORP',
-    'MBX': 'MBX Biosciences, Inc.',
-    'AIP': 'Arteris, Inc.',
-    'SCGY': 'SCIENTIFIC ENERGY, INC',
-    'NWPX': 'NORTHWEST PIPE CO',
-    'KE': 'Kimball Electronics, Inc.',
-    'EQV': 'EQV Ventures Acquisition Corp.',
-    'AAM': 'AA Mission Acquisition Corp.',
-    'GLASF': 'Glass House Brands Inc.',
-    'GCBC': 'GREENE COUNTY BANCORP INC',
-    'HPI': 'JOHN HANCOCK PREFERRED INCOME FUND',
-    'MUX': 'McEwen Mining Inc.',
-    'CBNK': 'Capital Bancorp Inc',
-    'MVF': 'BLACKROCK MUNIVEST FUND, INC.',
-    'DDD': '3D SYSTEMS CORP',
-    'CLDT': 'Chatham Lodging Trust',
-    'BHB': 'BAR HARBOR BANKSHARES',
-    'BAND': 'Bandwidth Inc.',
-    'VBNK': 'VersaBank',
-    'GHRS': 'GH Research PLC',
-    'ALLO': 'Allogene Therapeutics, Inc.',
-    'YORW': 'YORK WATER CO',
-    'SIGA': 'SIGA TECHNOLOGIES INC',
-    'ETB': 'Eaton Vance Tax-Managed Buy-Write Income Fund',
-    'KMDA': 'KAMADA LTD',
-    'FUSE': 'CSLM Holdings Inc.',
-    'UIS': 'UNISYS CORP',
-    'SWBI': 'SMITH & WESSON BRANDS, INC.',
-    'WDH': 'Waterdrop Inc.',
-    'URGN': 'UroGen Pharma Ltd.',
-    'BFK': 'BLACKROCK MUNICIPAL INCOME TRUST',
-    'DBO': 'Invesco DB Oil Fund',
-    'THW': 'abrdn World Healthcare Fund',
-    'RNAC': 'Cartesian Therapeutics, Inc.',
-    'KOD': 'Kodiak Sciences Inc.',
-    'TBPH': 'Theravance Biopharma, Inc.',
-    'ZVRA': 'ZEVRA THERAPEUTICS, INC.',
-    'NLOP': 'Net Lease Office Properties',
-    'CELC': 'Celcuity Inc.',
-    'CHW': 'Calamos Global Dynamic Income Fund',
-    'KRNY': 'Kearny Financial Corp.',
-    'MTLS': 'MATERIALISE NV',
-    'AROW': 'ARROW FINANCIAL CORP',
-    'DPG': 'Duff & Phelps Utility & Infrastructure Fund Inc.',
-    'TKNO': 'Alpha Teknova, Inc.',
-    'ATXS': 'Astria Therapeutics, Inc.',
-    'SVC': 'Service Properties Trust',
-    'ANAB': 'ANAPTYSBIO, INC',
-    'NOVA': 'Sunnova Energy International Inc.',
-    'BOC': 'BOSTON OMAHA Corp',
-    'TWFG': 'TWFG, Inc.',
-    'URG': 'UR-ENERGY INC',
-    'GRVY': 'GRAVITY Co., Ltd.',
-    'TERN': 'Terns Pharmaceuticals, Inc.',
-    'MERC': 'MERCER INTERNATIONAL INC.',
-    'HCAT': 'Health Catalyst, Inc.',
-    'MOV': 'MOVADO GROUP INC',
-    'TWI': 'TITAN INTERNATIONAL INC',
-    'QSI': 'Quantum-Si Inc',
-    'VRNOF': 'Verano Holdings Corp.',
-    'TCBX': 'Third Coast Bancshares, Inc.',
-    'ABVX': 'Abivax S.A.',
-    'CYRX': 'Cryoport, Inc.',
-    'FC': 'FRANKLIN COVEY CO',
-    'IGD': 'Voya GLOBAL EQUITY DIVIDEND & PREMIUM OPPORTUNITY FUND',
-    'BWMN': 'Bowman Consulting Group Ltd.',
-    'SPMC': 'Sound Point Meridian Capital, Inc.',
-    'XPER': 'Xperi Inc.',
-    'ASA': 'ASA Gold & Precious Metals Ltd',
-    'OABI': 'OmniAb, Inc.',
-    'MUA': 'BLACKROCK MUNIASSETS FUND, INC.',
-    'NQP': 'NUVEEN PENNSYLVANIA QUALITY MUNICIPAL INCOME FUND',
-    'LMNR': 'Limoneira CO',
-    'PRTC': 'PureTech Health plc',
-    'USAP': 'UNIVERSAL STAINLESS & ALLOY PRODUCTS INC',
-    'DCGO': 'DocGo Inc.',
-    'EAF': 'GRAFTECH INTERNATIONAL LTD',
-    'JILL': 'J.Jill, Inc.',
-    'CVGW': 'CALAVO GROWERS INC',
-    'BACQ': 'Bleichroeder Acquisition Corp. I',
-    'TCMD': 'TACTILE SYSTEMS TECHNOLOGY INC',
-    'LESL': 'Leslie's, Inc.',
-    'AMPX': 'Amprius Technologies, Inc.',
-    'CYH': 'COMMUNITY HEALTH SYSTEMS INC',
-    'CRNT': 'CERAGON NETWORKS LTD',
-    'FLYX': 'FLYEXCLUSIVE INC.',
-    'EAD': 'ALLSPRING INCOME OPPORTUNITIES FUND',
-    'ETO': 'Eaton Vance Tax-Advantaged Global Dividend Opportunities Fund',
-    'NETD': 'Nabors Energy Transition Corp. II',
-    'GUT': 'GABELLI UTILITY TRUST',
-    'LSAK': 'LESAKA TECHNOLOGIES INC',
-    'ACTG': 'ACACIA RESEARCH CORP',
-    'DFP': 'Flaherty & Crumrine Dynamic Preferred & Income Fund Inc',
-    'MCI': 'BARINGS CORPORATE INVESTORS',
-    'TRC': 'TEJON RANCH CO',
-    'LOVE': 'Lovesac Co',
-    'YRD': 'Yiren Digital Ltd.',
-    'PERI': 'Perion Network Ltd.',
-    'CLPT': 'ClearPoint Neuro, Inc.',
-    'FFA': 'FIRST TRUST ENHANCED EQUITY INCOME FUND',
-    'RWAY': 'Runway Growth Finance Corp.',
-    'DIN': 'Dine Brands Global, Inc.',
-    'ITIC': 'INVESTORS TITLE CO',
-    'CDXC': 'ChromaDex Corp.',
-    'GNE': 'Genie Energy Ltd.',
-    'AENT': 'ALLIANCE ENTERTAINMENT HOLDING CORP',
-    'CWCO': 'Consolidated Water Co. Ltd.',
-    'BWMX': 'BETTERWARE DE MEXICO, S.A.P.I. DE C.V',
-    'CDZI': 'CADIZ INC',
-    'SMC': 'Summit Midstream Corp',
-    'LE': 'LANDS' END, INC.',
-    'SNDA': 'SONIDA SENIOR LIVING, INC.',
-    'SDHY': 'PGIM Short Duration High Yield Opportunities Fund',
-    'IPXX': 'Inflection Point Acquisition Corp. II',
-    'UNTY': 'UNITY BANCORP INC /NJ/',
-    'NMAI': 'Nuveen Multi-Asset Income Fund',
-    'INRE': 'Inland Real Estate Income Trust, Inc.',
-    'EVN': 'EATON VANCE MUNICIPAL INCOME TRUST',
-    'BIOX': 'Bioceres Crop Solutions Corp.',
-    'NRC': 'NATIONAL RESEARCH CORP',
-    'BSVN': 'Bank7 Corp.',
-    'DHIL': 'DIAMOND HILL INVESTMENT GROUP INC',
-    'MYE': 'MYERS INDUSTRIES INC',
-    'BSRR': 'SIERRA BANCORP',
-    'BBCP': 'Concrete Pumping Holdings, Inc.',
-    'ALNT': 'ALLIENT INC',
-    'HIVE': 'HIVE Digital Technologies Ltd.',
-    'SOHU': 'Sohu.com Ltd',
-    'MEI': 'METHODE ELECTRONICS INC',
-    'OFLX': 'Omega Flex, Inc.',
-    'SGU': 'STAR GROUP, L.P.',
-    'AMCX': 'AMC Networks Inc.',
-    'NRIM': 'NORTHRIM BANCORP INC',
-    'OTLY': 'Oatly Group AB',
-    'EHAB': 'Enhabit, Inc.',
-    'ILLR': 'Triller Group Inc.',
-    'NFGC': 'New Found Gold Corp.',
-    'DCTH': 'DELCATH SYSTEMS, INC.',
-    'HYLN': 'Hyliion Holdings Corp.',
-    'MYN': 'BLACKROCK MUNIYIELD NEW YORK QUALITY FUND, INC.',
-    'GBAB': 'Guggenheim Taxable Municipal Bond & Investment Grade Debt Trust',
-    'KALV': 'KalVista Pharmaceuticals, Inc.',
-    'VKI': 'Invesco Advantage Municipal Income Trust II',
-    'AKBA': 'Akebia Therapeutics, Inc.',
-    'HIX': 'WESTERN ASSET HIGH INCOME FUND II INC.',
-    'PRME': 'Prime Medicine, Inc.',
-    'CCIX': 'Churchill Capital Corp IX/Cayman',
-    'NVEC': 'NVE CORP /NEW/',
-    'ORGO': 'Organogenesis Holdings Inc.',
-    'WOW': 'WideOpenWest, Inc.',
-    'POET': 'POET TECHNOLOGIES INC.',
-    'EFR': 'Eaton Vance Senior Floating-Rate Trust',
-    'TRAK': 'ReposiTrak, Inc.',
-    'ALMS': 'ALUMIS INC.',
-    'HPP': 'Hudson Pacific Properties, Inc.',
-    'CYD': 'CHINA YUCHAI INTERNATIONAL LTD',
-    'SENS': 'Senseonics Holdings, Inc.',
-    'PKST': 'Peakstone Realty Trust',
-    'AURA': 'Aura Biosciences, Inc.',
-    'LEO': 'BNY MELLON STRATEGIC MUNICIPALS, INC.',
-    'SB': 'SAFE BULKERS, INC.',
-    'LGTY': 'LOGILITY SUPPLY CHAIN SOLUTIONS, INC',
-    'MLP': 'MAUI LAND & PINEAPPLE CO INC',
-    'LAND': 'GLADSTONE LAND Corp',
-    'VENU': 'Venu Holding Corp',
-    'VALN': 'Valneva SE',
-    'CARE': 'Carter Bankshares, Inc.',
-    'HQL': 'abrdn Life Sciences Investors',
-    'RGNX': 'REGENXBIO Inc.',
-    'ZIMV': 'ZimVie Inc.',
-    'HIO': 'WESTERN ASSET HIGH INCOME OPPORTUNITY FUND INC.',
-    'ARBE': 'Arbe Robotics Ltd.',
-    'GNTY': 'GUARANTY BANCSHARES INC /TX/',
-    'CADL': 'Candel Therapeutics, Inc.',
-    'ENGN': 'enGene Holdings Inc.',
-    'PSTL': 'Postal Realty Trust, Inc.',
-    'CRMT': 'AMERICAS CARMART INC',
-    'KTF': 'DWS MUNICIPAL INCOME TRUST',
-    'JFIN': 'Jiayin Group Inc.',
-    'SCM': 'Stellus Capital Investment Corp',
-    'OLMA': 'Olema Pharmaceuticals, Inc.',
-    'VCIC': 'Vine Hill Capital Investment Corp.',
-    'TMC': 'TMC the metals Co Inc.',
-    'GTN': 'GRAY TELEVISION INC',
-    'KIO': 'KKR Income Opportunities Fund',
-    'OOMA': 'OOMA INC',
-    'THRD': 'Third Harmonic Bio, Inc.',
-    'BRY': 'Berry Corp (bry)',
-    'ALF': 'Centurion Acquisition Corp.',
-    'NL': 'NL INDUSTRIES INC',
-    'GPAT': 'GP-Act III Acquisition Corp.',
-    'HRZN': 'Horizon Technology Finance Corp',
-    'LND': 'BrasilAgro - Brazilian Agricultural Real Estate Co',
-    'MBAV': 'M3-Brigade Acquisition V Corp.',
-    'BARK': 'Bark, Inc.',
-    'CGC': 'Canopy Growth Corp',
-    'GILT': 'GILAT SATELLITE NETWORKS LTD',
-    'CDXS': 'CODEXIS, INC.',
-    'HFRO': 'HIGHLAND OPPORTUNITIES & INCOME FUND',
-    'ZUMZ': 'Zumiez Inc',
-    'TSHA': 'Taysha Gene Therapies, Inc.',
-    'QTRX': 'Quanterix Corp',
-    'NPCE': 'NeuroPace Inc',
-    'BMRC': 'Bank of Marin Bancorp',
-    'PNRG': 'PRIMEENERGY RESOURCES CORP',
-    'WALD': 'Waldencast plc',
-    'API': 'Agora, Inc.',
-    'CNL': 'Collective Mining Ltd.',
-    'SHYF': 'SHYFT GROUP, INC.',
-    'HPF': 'JOHN HANCOCK PREFERRED INCOME FUND II',
-    'NMRA': 'Neumora Therapeutics, Inc.',
-    'FBIZ': 'FIRST BUSINESS FINANCIAL SERVICES, INC.',
-    'HVT': 'HAVERTY FURNITURE COMPANIES INC',
-    'RNGR': 'Ranger Energy Services, Inc.',
-    'PAMT': 'PAMT CORP',
-    'NWBO': 'NORTHWEST BIOTHERAPEUTICS INC',
-    'MSB': 'MESABI TRUST',
-    'SOR': 'SOURCE CAPITAL INC /DE/',
-    'NYXH': 'Nyxoah SA',
-    'PANL': 'Pangaea Logistics Solutions Ltd.',
-    'XYF': 'X Financial',
-    'FOF': 'Cohen & Steers Closed-End Opportunity Fund, Inc.',
-    'AIRS': 'Airsculpt Technologies, Inc.',
-    'MFH': 'Mercurity Fintech Holding Inc.',
-    'NAN': 'NUVEEN NEW YORK QUALITY MUNICIPAL INCOME FUND',
-    'GLUE': 'Monte Rosa Therapeutics, Inc.',
-    'EWCZ': 'European Wax Center, Inc.',
-    'PFL': 'PIMCO INCOME STRATEGY FUND',
-    'SAR': 'SARATOGA INVESTMENT CORP.',
-    'BGR': 'BlackRock Energy & Resources Trust',
-    'NLCP': 'NewLake Capital Partners, Inc.',
-    'APEI': 'AMERICAN PUBLIC EDUCATION INC',
-    'ARDC': 'Ares Dynamic Credit Allocation Fund, Inc.',
-    'TBCH': 'Turtle Beach Corp',
-    'PGEN': 'PRECIGEN, INC.',
-    'RVNC': 'Revance Therapeutics, Inc.',
-    'ETON': 'Eton Pharmaceuticals, Inc.',
-    'CVRX': 'CVRx, Inc.',
-    'BWB': 'Bridgewater Bancshares Inc',
-    'EFT': 'Eaton Vance Floating-Rate Income Trust',
-    'FMAO': 'FARMERS & MERCHANTS BANCORP INC',
-    'TRVI': 'Trevi Therapeutics, Inc.',
-    'CRVS': 'Corvus Pharmaceuticals, Inc.',
-    'HLLY': 'Holley Inc.',
-    'JOUT': 'JOHNSON OUTDOORS INC',
-    'SEG': 'Seaport Entertainment Group Inc.',
-    'CTNM': 'Contineum Therapeutics, Inc.',
-    'ASG': 'LIBERTY ALL STAR GROWTH FUND INC.',
-    'ZEUS': 'OLYMPIC STEEL INC',
-    'PPT': 'PUTNAM PREMIER INCOME TRUST',
-    'HBCP': 'HOME BANCORP, INC.',
-    'EGHT': '8X8 INC /DE/',
-    'BFZ': 'BLACKROCK CALIFORNIA MUNICIPAL INCOME TRUST',
-    'ASLE': 'AerSale Corp',
-    'VLN': 'Valens Semiconductor Ltd.',
-    'WTBA': 'WEST BANCORPORATION INC',
-    'NREF': 'NexPoint Real Estate Finance, Inc.',
-    'SAGE': 'Sage Therapeutics, Inc.',
-    'ZBIO': 'Zenas BioPharma, Inc.',
-    'SNBR': 'Sleep Number Corp',
-    'ABSI': 'Absci Corp',
-    'RRBI': 'RED RIVER BANCSHARES INC',
-    'LWAY': 'Lifeway Foods, Inc.',
-    'GIG': 'GigCapital7 Corp.',
-    'CWBC': 'Community West Bancshares',
-    'HRTG': 'Heritage Insurance Holdings, Inc.',
-    'RBB': 'RBB Bancorp',
-    'RFMZ': 'RiverNorth Flexible Municipal Income Fund II, Inc.',
-    'DOYU': 'DouYu International Holdings Ltd',
-    'FREY': 'FREYR Battery, Inc. /DE/',
-    'GOCO': 'GoHealth, Inc.',
-    'JRI': 'Nuveen Real Asset Income & Growth Fund',
-    'PMTS': 'CPI Card Group Inc.',
-    'CVEO': 'Civeo Corp',
-    'NGS': 'NATURAL GAS SERVICES GROUP INC',
-    'PKOH': 'PARK OHIO HOLDINGS CORP',
-    'MTRX': 'MATRIX SERVICE CO',
-    'USCB': 'USCB FINANCIAL HOLDINGS, INC.',
-    'LNZA': 'LanzaTech Global, Inc.',
-    'MIY': 'BLACKROCK MUNIYIELD MICHIGAN QUALITY FUND, INC.',
-    'WEYS': 'WEYCO GROUP INC',
-    'LOCO': 'El Pollo Loco Holdings, Inc.',
-    'FINS': 'Angel Oak Financial Strategies Income Term Trust',
-    'NTPIF': 'NAM TAI PROPERTY INC.',
-    'QUAD': 'Quad/Graphics, Inc.',
-    'BRW': 'Saba Capital Income & Opportunities Fund',
-    'KRRO': 'Korro Bio, Inc.',
-    'ATOM': 'Atomera Inc',
-    'OIS': 'OIL STATES INTERNATIONAL, INC',
-    'LPA': 'Logistic Properties of the Americas',
-    'LXFR': 'LUXFER HOLDINGS PLC',
-    'GAU': 'Galiano Gold Inc.',
-    'RMR': 'RMR GROUP INC.',
-    'HOUS': 'Anywhere Real Estate Inc.',
-    'DADA': 'Dada Nexus Ltd',
-    'AWP': 'abrdn Global Premier Properties Fund',
-    'NAK': 'NORTHERN DYNASTY MINERALS LTD',
-    'CRLBF': 'Cresco Labs Inc.',
-    'AMBI': 'Ambipar Emergency Response',
-    'RM': 'Regional Management Corp.',
-    'EB': 'Eventbrite, Inc.',
-    'GDEV': 'GDEV Inc.',
-    'IRBT': 'IROBOT CORP',
-    'TBRG': 'TruBridge, Inc.',
-    'VACH': 'Voyager Acquisition Corp./Cayman Islands',
-    'BLZE': 'Backblaze, Inc.',
-    'HYAC': 'Haymaker Acquisition Corp. 4',
-    'BRT': 'BRT Apartments Corp.',
-    'NEWT': 'NewtekOne, Inc.',
-    'SPIR': 'Spire Global, Inc.',
-    'ASPI': 'ASP Isotopes Inc.',
-    'BDMD': 'Baird Medical Investment Holdings Ltd',
-    'CCIR': 'Cohen Circle Acquisition Corp. I',
-    'BGH': 'BARINGS GLOBAL SHORT DURATION HIGH YIELD FUND',
-    'SPOK': 'Spok Holdings, Inc',
-    'SSBK': 'Southern States Bancshares, Inc.',
-    'MHN': 'BLACKROCK MUNIHOLDINGS NEW YORK QUALITY FUND, INC.',
-    'TITN': 'Titan Machinery Inc.',
-    'SLI': 'STANDARD LITHIUM LTD.',
-    'ACNB': 'ACNB CORP',
-    'NATH': 'NATHANS FAMOUS, INC.',
-    'TNGX': 'Tango Therapeutics, Inc.',
-    'XHG': 'XChange TEC.INC',
-    'YMAB': 'Y-mAbs Therapeutics, Inc.',
-    'KLTR': 'KALTURA INC',
-    'UROY': 'Uranium Royalty Corp.',
-    'SLDP': 'Solid Power, Inc.',
-    'YSG': 'Yatsen Holding Ltd',
-    'NUS': 'NU SKIN ENTERPRISES, INC.',
-    'SPXX': 'Nuveen S&P 500 Dynamic Overwrite Fund',
-    'CUB': 'Lionheart Holdings',
-    'SMRT': 'SmartRent, Inc.',
-    'NCV': 'Virtus Convertible & Income Fund',
-    'RDUS': 'RADIUS RECYCLING, INC.',
-    'BEAG': 'Bold Eagle Acquisition Corp.',
-    'SIMA': 'SIM Acquisition Corp. I',
-    'ACP': 'abrdn Income Credit Strategies Fund',
-    'AFB': 'ALLIANCEBERNSTEIN NATIONAL MUNICIPAL INCOME FUND',
-    'OB': 'Outbrain Inc.',
-    'MBI': 'MBIA INC',
-    'VMD': 'VIEMED HEALTHCARE, INC.',
-    'ARTNA': 'ARTESIAN RESOURCES CORP',
-    'MIN': 'MFS INTERMEDIATE INCOME TRUST',
-    'NMG': 'Nouveau Monde Graphite Inc.',
-    'TPVG': 'TriplePoint Venture Growth BDC Corp.',
-    'CPZ': 'Calamos Long/Short Equity & Dynamic Income Trust',
-    'GRO': 'Brazil Potash Corp.',
-    'RFI': 'COHEN & STEERS TOTAL RETURN REALTY FUND INC',
-    'JAKK': 'JAKKS PACIFIC INC',
-    'MEC': 'Mayville Engineering Company, Inc.',
-    'RMAX': 'RE/MAX Holdings, Inc.',
-    'EIC': 'Eagle Point Income Co Inc.',
-    'MPX': 'MARINE PRODUCTS CORP',
-    'PDLB': 'Ponce Financial Group, Inc.',
-    'NODK': 'NI Holdings, Inc.',
-    'RLGT': 'RADIANT LOGISTICS, INC',
-    'BNED': 'Barnes & Noble Education, Inc.',
-    'NBH': 'NEUBERGER BERMAN MUNICIPAL FUND INC.',
-    'FSBW': 'FS Bancorp, Inc.',
-    'NPCT': 'Nuveen Core Plus Impact Fund',
-    'BKSY': 'BlackSky Technology Inc.',
-    'IOCJY': 'IOCHPE-MAXION SA /FI',
-    'BTMD': 'biote Corp.',
-    'BLDE': 'Blade Air Mobility, Inc.',
-    'ATYR': 'aTYR PHARMA INC',
-    'ASUR': 'ASURE SOFTWARE INC',
-    'JGH': 'Nuveen Global High Income Fund',
-    'MCFT': 'MasterCraft Boat Holdings, Inc.',
-    'TBN': 'Tamboran Resources Corp',
-    'COOK': 'Traeger, Inc.',
-    'ACRE': 'Ares Commercial Real Estate Corp',
-    'CERS': 'CERUS CORP',
-    'IPI': 'Intrepid Potash, Inc.',
-    'TTSH': 'TILE SHOP HOLDINGS, INC.',
-    'INVZ': 'Innoviz Technologies Ltd.',
-    'CIVB': 'CIVISTA BANCSHARES, INC.',
-    'REFI': 'Chicago Atlantic Real Estate Finance, Inc.',
-    'ZH': 'Zhihu Inc.',
-    'MTW': 'MANITOWOC CO INC',
-    'IMMP': 'IMMUTEP Ltd',
-    'ALDF': 'Aldel Financial II Inc.',
-    'LAW': 'CS Disco, Inc.',
-    'REI': 'RING ENERGY, INC.',
-    'CMRX': 'CHIMERIX INC',
-    'PMO': 'PUTNAM MUNICIPAL OPPORTUNITIES TRUST',
-    'VYGR': 'Voyager Therapeutics, Inc.',
-    'POLE': 'Andretti Acquisition Corp. II',
-    'NRGV': 'Energy Vault Holdings, Inc.',
-    'VPG': 'Vishay Precision Group, Inc.',
-    'NECB': 'NorthEast Community Bancorp, Inc./MD/',
-    'COFS': 'CHOICEONE FINANCIAL SERVICES INC',
-    'NGNE': 'Neurogene Inc.',
-    'CIX': 'COMPX INTERNATIONAL INC',
-    'ALLT': 'Allot Ltd.',
-    'OBT': 'Orange County Bancorp, Inc. /DE/',
-    'ALDX': 'Aldeyra Therapeutics, Inc.',
-    'XOMA': 'XOMA Royalty Corp',
-    'RMM': 'RiverNorth Managed Duration Municipal Income Fund, Inc.',
-    'ABIT': 'Athena Bitcoin Global',
-    'NEN': 'NEW ENGLAND REALTY ASSOCIATES LIMITED PARTNERSHIP',
-    'DENN': 'DENNY'S Corp',
-    'GRAF': 'Graf Global Corp.',
-    'RCS': 'PIMCO STRATEGIC INCOME FUND, INC.',
-    'SLN': 'Silence Therapeutics plc',
-    'GSRT': 'GSR III Acquisition Corp.',
-    'LPAA': 'Launch One Acquisition Corp.',
-    'EXFY': 'Expensify, Inc.',
-    'HOND': 'HCM II Acquisition Corp.',
-    'TRUE': 'TrueCar, Inc.',
-    'PCOK': 'Pacific Oak Strategic Opportunity REIT, Inc.',
-    'LPBB': 'Launch Two Acquisition Corp.',
-    'ATGL': 'Alpha Technology Group Ltd',
-    'JWSMF': 'Jaws Mustang Acquisition Corp',
-    'DSM': 'BNY MELLON STRATEGIC MUNICIPAL BOND FUND, INC.',
-    'BGT': 'BLACKROCK FLOATING RATE INCOME TRUST',
-    'GTE': 'GRAN TIERRA ENERGY INC.',
-    'RIGL': 'RIGEL PHARMACEUTICALS INC',
-    'SCD': 'LMP CAPITAL & INCOME FUND INC.',
-    'EHTH': 'eHealth, Inc.',
-    'JUNS': 'JUPITER NEUROSCIENCES, INC.',
-    'OIA': 'Invesco Municipal Income Opportunities Trust',
-    'SATL': 'Satellogic Inc.',
-    'UNTC': 'UNIT CORP',
-    'EDD': 'Morgan Stanley Emerging Markets Domestic Debt Fund, Inc.',
-    'SMTI': 'Sanara MedTech Inc.',
-    'USAS': 'Americas Gold & Silver Corp',
-    'DBL': 'DoubleLine Opportunistic Credit Fund',
-    'ITOS': 'iTeos Therapeutics, Inc.',
-    'IBEX': 'IBEX Ltd',
-    'ABXXF': 'Abaxx Technologies Inc.',
-    'CDRO': 'Codere Online Luxembourg, S.A.',
-    'LSEA': 'Landsea Homes Corp',
-    'ARQQ': 'Arqit Quantum Inc.',
-    'PBFS': 'Pioneer Bancorp, Inc./MD',
-    'ZVIA': 'Zevia PBC',
-    'HIT': 'Health In Tech, Inc.',
-    'BYM': 'BLACKROCK MUNICIPAL INCOME QUALITY TRUST',
-    'SNFCA': 'SECURITY NATIONAL FINANCIAL CORP',
-    'NCA': 'NUVEEN CALIFORNIA MUNICIPAL VALUE FUND',
-    'FNLC': 'First Bancorp, Inc /ME/',
-    'AUDC': 'AUDIOCODES LTD',
-    'CZNC': 'CITIZENS & NORTHERN CORP',
-    'MVIS': 'MICROVISION, INC.',
-    'SDSYA': 'SOUTH DAKOTA SOYBEAN PROCESSORS LLC',
-    'BYON': 'BEYOND, INC.',
-    'PCYO': 'PURE CYCLE CORP',
-    'JPI': 'Nuveen Preferred Securities & Income Opportunities Fund',
-    'RZLT': 'Rezolute, Inc.',
-    'ZEO': 'Zeo Energy Corp.',
-    'AVIR': 'Atea Pharmaceuticals, Inc.',
-    'DRUG': 'BRIGHT MINDS BIOSCIENCES INC.',
-    'AQST': 'Aquestive Therapeutics, Inc.',
-    'INBK': 'First Internet Bancorp',
-    'MG': 'Mistras Group, Inc.',
-    'EBFI': 'Eco Bright Future, Inc.',
-    'MMD': 'NYLI MacKay DefinedTerm Muni Opportunities Fund',
-    'TATT': 'TAT TECHNOLOGIES LTD',
-    'RGP': 'RESOURCES CONNECTION, INC.',
-    'MNDR': 'Mobile-health Network Solutions',
-    'PERF': 'Perfect Corp.',
-    'FOA': 'Finance of America Companies Inc.',
-    'SFST': 'SOUTHERN FIRST BANCSHARES INC',
-    'LXRX': 'LEXICON PHARMACEUTICALS, INC.',
-    'ZTR': 'Virtus Total Return Fund Inc.',
-    'IHRT': 'iHeartMedia, Inc.',
-    'LFVN': 'Lifevantage Corp',
-    'BCML': 'BayCom Corp',
-    'PKE': 'PARK AEROSPACE CORP',
-    'FSTR': 'FOSTER L B CO',
-    'DBI': 'Designer Brands Inc.',
-    'SSCC': 'Spirits Capital Corp',
-    'PBPB': 'POTBELLY CORP',
-    'RR': 'RICHTECH ROBOTICS INC.',
-    'OSUR': 'ORASURE TECHNOLOGIES INC',
-    'GWRS': 'Global Water Resources, Inc.',
-    'HYI': 'Western Asset High Yield Defined Opportunity Fund Inc.',
-    'FORR': 'FORRESTER RESEARCH, INC.',
-    'BRBS': 'BLUE RIDGE BANKSHARES, INC.',
-    'NAMI': 'Jinxin Technology Holding Co',
-    'PMM': 'PUTNAM MANAGED MUNICIPAL INCOME TRUST',
-    'VNDA': 'Vanda Pharmaceuticals Inc.',
-    'DOMO': 'DOMO, INC.',
-    'IMMR': 'IMMERSION CORP',
-    'FCT': 'FIRST TRUST SENIOR FLOATING RATE INCOME FUND II',
-    'ACIU': 'AC Immune SA',
-    'AFRI': 'Forafric Global PLC',
-    'LEGT': 'Legato Merger Corp. III',
-    'SLAMF': 'Slam Corp.',
-    'PAL': 'Proficient Auto Logistics, Inc',
-    'GHI': 'Greystone Housing Impact Investors LP',
-    'CZFS': 'CITIZENS FINANCIAL SERVICES INC',
-    'MCR': 'MFS CHARTER INCOME TRUST',
-    'PCB': 'PCB BANCORP',
-    'ARQ': 'Arq, Inc.',
-    'TWN': 'TAIWAN FUND INC',
-    'LUNG': 'Pulmonx Corp',
-    'NVX': 'NOVONIX Ltd',
-    'DSGN': 'Design Therapeutics, Inc.',
-    'ORN': 'Orion Group Holdings Inc',
-    'AEF': 'ABRDN EMERGING MARKETS EQUITY INCOME FUND, INC.',
-    'NATR': 'NATURES SUNSHINE PRODUCTS INC',
-    'ONTF': 'ON24 INC.',
-    'LNKB': 'LINKBANCORP, Inc.',
-    'FTK': 'FLOTEK INDUSTRIES INC/CN/',
-    'FRST': 'Primis Financial Corp.',
-    'EM': 'Smart Share Global Ltd',
-    'HDSN': 'HUDSON TECHNOLOGIES INC /NY',
-    'JMSB': 'John Marshall Bancorp, Inc.',
-    'GFLT': 'GenFlat Holdings, Inc.',
-    'EOT': 'Eaton Vance National Municipal Opportunities Trust',
-    'CBAN': 'COLONY BANKCORP INC',
-    'ACRS': 'Aclaris Therapeutics, Inc.',
-    'PRQR': 'ProQR Therapeutics N.V.',
-    'HAWEL': 'HAWAIIAN ELECTRIC CO INC',
-    'SBXD': 'SilverBox Corp IV',
-    'CDTX': 'Cidara Therapeutics, Inc.',
-    'LIEN': 'Chicago Atlantic BDC, Inc.',
-    'MMT': 'MFS MULTIMARKET INCOME TRUST',
-    'HTCO': 'Caravelle International Group',
-    'ERC': 'ALLSPRING MULTI-SECTOR INCOME FUND',
-    'TG': 'TREDEGAR CORP',
-    'PINE': 'Alpine Income Property Trust, Inc.',
-    'GMGI': 'Golden Matrix Group, Inc.',
-    'RIV': 'RIVERNORTH OPPORTUNITIES FUND, INC.',
-    'SABA': 'Saba Capital Income & Opportunities Fund II',
-    'ATLN': 'ATLANTIC INTERNATIONAL CORP.',
-    'WTI': 'W&T OFFSHORE INC',
-    'ATAI': 'ATAI Life Sciences N.V.',
-    'ISPR': 'Ispire Technology Inc.',
-    'CMPS': 'COMPASS Pathways plc',
-    'CCCC': 'C4 Therapeutics, Inc.',
-    'HLXB': 'Helix Acquisition Corp. II',
-    'FVR': 'FrontView REIT, Inc.',
-    'FDMT': '4D Molecular Therapeutics, Inc.',
-    'JCE': 'Nuveen Core Equity Alpha Fund',
-    'VLDX': 'Velo3D, Inc.',
-    'ELMD': 'Electromed, Inc.',
-    'BNTC': 'Benitec Biopharma Inc.',
-    'LAZR': 'Luminar Technologies, Inc./DE',
-    'HITI': 'High Tide Inc.',
-    'VUZI': 'Vuzix Corp',
-    'ESGH': 'ESG Inc.',
-    'AMPY': 'Amplify Energy Corp.',
-    'ZYXI': 'ZYNEX INC',
-    'NHIC': 'NewHold Investment Corp. III',
-    'FLXS': 'FLEXSTEEL INDUSTRIES INC',
-    'PLBC': 'PLUMAS BANCORP',
-    'FACT': 'FACT II Acquisition Corp.',
-    'ESEA': 'EUROSEAS LTD.',
-    'SGC': 'SUPERIOR GROUP OF COMPANIES, INC.',
-    'FLIC': 'FIRST OF LONG ISLAND CORP',
-    'VSTM': 'Verastem, Inc.',
-    'TSSI': 'TSS, Inc.',
-    'MTA': 'Metalla Royalty & Streaming Ltd.',
-    'BSEM': 'BIOSTEM TECHNOLOGIES',
-    'BNY': 'BLACKROCK NEW YORK MUNICIPAL INCOME TRUST',
-    'OACC': 'Oaktree Acquisition Corp. III Life Sciences',
-    'ICG': 'Intchains Group Ltd',
-    'MAMA': 'Mama's Creations, Inc.',
-    'NWTN': 'NWTN, Inc.',
-    'GHG': 'GreenTree Hospitality Group Ltd.',
-    'SANG': 'Sangoma Technologies Corp',
-    'CMPX': 'Compass Therapeutics, Inc.',
-    'NUW': 'Nuveen AMT-Free Municipal Value Fund',
-    'ONEW': 'OneWater Marine Inc.',
-    'AGD': 'abrdn Global Dynamic Dividend Fund',
-    'IIF': 'MORGAN STANLEY INDIA INVESTMENT FUND, INC.',
-    'SERA': 'SERA PROGNOSTICS, INC.',
-    'TEI': 'TEMPLETON EMERGING MARKETS INCOME FUND',
-    'AEVA': 'Aeva Technologies, Inc.',
-    'ELDN': 'Eledon Pharmaceuticals, Inc.',
-    'BKT': 'BLACKROCK INCOME TRUST, INC.',
-    'CRDF': 'Cardiff Oncology, Inc.',
-    'FDBC': 'FIDELITY D & D BANCORP INC',
-    'ABEO': 'ABEONA THERAPEUTICS INC.',
-    'BRCC': 'BRC Inc.',
-    'RBTK': 'ZHEN DING RESOURCES INC.',
-    'PMX': 'PIMCO MUNICIPAL INCOME FUND III',
-    'GENK': 'GEN Restaurant Group, Inc.',
-    'UHG': 'United Homes Group, Inc.',
-    'RLTY': 'Cohen & Steers Real Estate Opportunities & Income Fund',
-    'RCEL': 'AVITA Medical, Inc.',
-    'CPSS': 'CONSUMER PORTFOLIO SERVICES, INC.',
-    'JRS': 'NUVEEN REAL ESTATE INCOME FUND',
-    'NRDY': 'Nerdy Inc.',
-    'RLEA': 'Rubber Leaf Inc',
-    'IAUX': 'i-80 Gold Corp.',
-    'DSX': 'DIANA SHIPPING INC.',
-    'AMLX': 'Amylyx Pharmaceuticals, Inc.',
-    'SKIL': 'Skillsoft Corp.',
-    'TCI': 'TRANSCONTINENTAL REALTY INVESTORS INC',
-    'PSF': 'Cohen & Steers Select Preferred & Income Fund, Inc.',
-    'SGMO': 'SANGAMO THERAPEUTICS, INC',
-    'WEWA': 'WEWARDS, INC.',
-    'AZUL': 'AZUL SA',
-    'EVI': 'EVI INDUSTRIES, INC.',
-    'FHTX': 'Foghorn Therapeutics Inc.',
-    'INSE': 'Inspired Entertainment, Inc.',
-    'ONIT': 'ONITY GROUP INC.',
-    'LWLG': 'Lightwave Logic, Inc.',
-    'SBT': 'Sterling Bancorp, Inc.',
-    'NCZ': 'Virtus Convertible & Income Fund II',
-    'WSBF': 'Waterstone Financial, Inc.',
-    'EVC': 'ENTRAVISION COMMUNICATIONS CORP',
-    'TVGN': 'Tevogen Bio Holdings Inc.',
-    'CATX': 'Perspective Therapeutics, Inc.',
-    'OZ': 'Belpointe PREP, LLC',
-    'MAPS': 'WM TECHNOLOGY, INC.',
-    'NWFL': 'NORWOOD FINANCIAL CORP',
-    'ILPT': 'Industrial Logistics Properties Trust',
-    'MVBF': 'MVB FINANCIAL CORP',
-    'FULC': 'Fulcrum Therapeutics, Inc.',
-    'HRTX': 'HERON THERAPEUTICS, INC. /DE/',
-    'RMNI': 'Rimini Street, Inc.',
-    'AVNW': 'AVIAT NETWORKS, INC.',
-    'TLS': 'TELOS CORP',
-    'TZOO': 'TRAVELZOO',
-    'LRMR': 'Larimar Therapeutics, Inc.',
-    'AMRN': 'AMARIN CORP PLC\UK',
-    'ARTV': 'Artiva Biotherapeutics, Inc.',
-    'HSHP': 'Himalaya Shipping Ltd.',
-    'ATNI': 'ATN International, Inc.',
-    'CLBR': 'COLOMBIER ACQUISITION CORP. II',
-    'CPS': 'Cooper-Standard Holdings Inc.',
-    'TSI': 'TCW STRATEGIC INCOME FUND INC',
-    'PMF': 'PIMCO MUNICIPAL INCOME FUND',
-    'OCGN': 'Ocugen, Inc.',
-    'EVM': 'Eaton Vance California Municipal Bond Fund',
-    'DRTS': 'Alpha Tau Medical Ltd.',
-    'LFCR': 'LIFECORE BIOMEDICAL, INC. \DE\',
-    'PHT': 'PIONEER HIGH INCOME FUND, INC.',
-    'BYND': 'BEYOND MEAT, INC.',
-    'PROF': 'Profound Medical Corp.',
-    'CTRN': 'Citi Trends Inc',
-    'ZSPC': 'zSpace, Inc.',
-    'ACV': 'Virtus Diversified Income & Convertible Fund',
-    'NPV': 'NUVEEN VIRGINIA QUALITY MUNICIPAL INCOME FUND',
-    'ANIK': 'Anika Therapeutics, Inc.',
-    'INGN': 'Inogen Inc',
-    'GRRR': 'Gorilla Technology Group Inc.',
-    'LTCN': 'Grayscale Litecoin Trust (LTC)',
-    'NXDT': 'NEXPOINT DIVERSIFIED REAL ESTATE TRUST',
-    'WHF': 'WhiteHorse Finance, Inc.',
-    'EP': 'EMPIRE PETROLEUM CORP',
-    'NHS': 'Neuberger Berman High Yield Strategies Fund Inc.',
-    'IONR': 'ioneer Ltd',
-    'ACB': 'AURORA CANNABIS INC',
-    'GENC': 'GENCOR INDUSTRIES INC',
-    'SRG': 'Seritage Growth Properties',
-    'EVBN': 'EVANS BANCORP INC',
-    'WYHG': 'Wing Yip Food Holdings Group Ltd',
-    'NC': 'NACCO INDUSTRIES INC',
-    'TSBK': 'TIMBERLAND BANCORP INC',
-    'WRN': 'Western Copper & Gold Corp',
-    'FF': 'FutureFuel Corp.',
-    'SNWV': 'SANUWAVE Health, Inc.',
-    'KGEI': 'Kolibri Global Energy Inc.',
-    'AOMR': 'Angel Oak Mortgage REIT, Inc.',
-    'PKBK': 'PARKE BANCORP, INC.',
-    'CFNB': 'CALIFORNIA FIRST LEASING CORP',
-    'ZYBT': 'Zhengye Biotechnology Holding Ltd',
-    'UNG': 'United States Natural Gas Fund, LP',
-    'ODV': 'Osisko Development Corp.',
-    'NLST': 'NETLIST INC',
-    'DMAC': 'DiaMedica Therapeutics Inc.',
-    'VRSSF': 'Verses AI Inc.',
-    'BPRN': 'Princeton Bancorp, Inc.',
-    'DHY': 'CREDIT SUISSE HIGH YIELD BOND FUND',
-    'PWOD': 'PENNS WOODS BANCORP INC',
-    'MUE': 'BLACKROCK MUNIHOLDINGS QUALITY FUND II, INC.',
-    'BWFG': 'Bankwell Financial Group, Inc.',
-    'OVLY': 'Oak Valley Bancorp',
-    'HBB': 'Hamilton Beach Brands Holding Co',
-    'KFS': 'KINGSWAY FINANCIAL SERVICES INC',
-    'ALCO': 'ALICO, INC.',
-    'GOSS': 'Gossamer Bio, Inc.',
-    'MVT': 'BLACKROCK MUNIVEST FUND II, INC.',
-    'GLO': 'Clough Global Opportunities Fund',
-    'MFM': 'MFS MUNICIPAL INCOME TRUST',
-    'HWBK': 'HAWTHORN BANCSHARES, INC.',
-    'FCEL': 'FUELCELL ENERGY INC',
-    'MYPS': 'PLAYSTUDIOS, Inc.',
-    'FBLA': 'FB Bancorp, Inc. /MD/',
-    'ARL': 'AMERICAN REALTY INVESTORS INC',
-    'PDYN': 'Palladyne AI Corp.',
-    'RITR': 'Reitar Logtech Holdings Ltd',
-    'NAUT': 'Nautilus Biotechnology, Inc.',
-    'CFFI': 'C & F FINANCIAL CORP',
-    'MACI': 'Melar Acquisition Corp. I/Cayman',
-    'FUND': 'SPROTT FOCUS TRUST INC.',
-    'MQT': 'BLACKROCK MUNIYIELD QUALITY FUND II, INC.',
-    'OPBK': 'OP Bancorp',
-    'GASS': 'StealthGas Inc.',
-    'DC': 'Dakota Gold Corp.',
-    'MYO': 'MYOMO, INC.',
-    'WILC': 'G WILLI FOOD INTERNATIONAL LTD',
-    'VRDR': 'VERDE RESOURCES, INC.',
-    'TBI': 'TrueBlue, Inc.',
-    'REEMF': 'RARE ELEMENT RESOURCES LTD',
-    'SVCO': 'Silvaco Group, Inc.',
-    'RDCM': 'RADCOM LTD',
-    'NEWP': 'NEW PACIFIC METALS CORP',
-    'ZUUS': 'ZEUUS, INC.',
-    'KVAC': 'Keen Vision Acquisition Corp.',
-    'MHI': 'PIONEER MUNICIPAL HIGH INCOME FUND, INC.',
-    'IVA': 'Inventiva S.A.',
-    'GROY': 'Gold Royalty Corp.',
-    'JOF': 'JAPAN SMALLER CAPITALIZATION FUND INC',
-    'FVCB': 'FVCBankcorp, Inc.',
-    'ALTG': 'ALTA EQUIPMENT GROUP INC.',
-    'FINW': 'Finwise Bancorp',
-    'ONL': 'Orion Office REIT Inc.',
-    'SIFY': 'SIFY TECHNOLOGIES LTD',
-    'CHMG': 'CHEMUNG FINANCIAL CORP',
-    'AVR': 'Anteris Technologies Global Corp.',
-    'ELLO': 'Ellomay Capital Ltd.',
-    'ARAY': 'ACCURAY INC',
-    'HURA': 'TuHURA Biosciences, Inc./NV',
-    'CAF': 'Morgan Stanley China A Share Fund, Inc.',
-    'HPAI': 'Helport AI Ltd',
-    'LANV': 'Lanvin Group Holdings Ltd',
-    'OBIO': 'Orchestra BioMed Holdings, Inc.',
-    'CIA': 'CITIZENS, INC.',
-    'WNW': 'Meiwu Technology Co Ltd',
-    'MRT': 'Marti Technologies, Inc.',
-    'EOD': 'ALLSPRING GLOBAL DIVIDEND OPPORTUNITY FUND',
-    'FTEL': 'Fitell Corp',
-    'MFIN': 'MEDALLION FINANCIAL CORP',
-    'UTMD': 'UTAH MEDICAL PRODUCTS INC',
-    'LXEO': 'Lexeo Therapeutics, Inc.',
-    'FET': 'FORUM ENERGY TECHNOLOGIES, INC.',
-    'SLRN': 'ACELYRIN, Inc.',
-    'TDF': 'TEMPLETON DRAGON FUND INC',
-    'LFMD': 'LifeMD, Inc.',
-    'CEPO': 'Cantor Equity Partners I, Inc.',
-    'FXNC': 'FIRST NATIONAL CORP /VA/',
-    'KNOP': 'KNOT Offshore Partners LP',
-    'SSP': 'E.W. SCRIPPS Co',
-    'SMID': 'SMITH MIDLAND CORP',
-    'LGI': 'LAZARD GLOBAL TOTAL RETURN & INCOME FUND INC',
-    'FUNC': 'FIRST UNITED CORP/MD/',
-    'MPLN': 'MultiPlan Corp',
-    'AERG': 'APPLIED ENERGETICS, INC.',
-    'INBX': 'Inhibrx Biosciences, Inc.',
-    'MAV': 'PIONEER MUNICIPAL HIGH INCOME ADVANTAGE FUND, INC.',
-    'BLFY': 'Blue Foundry Bancorp',
-    'LCNB': 'LCNB CORP',
-    'VREOF': 'Vireo Growth Inc.',
-    'ONDS': 'Ondas Holdings Inc.',
-    'MIO': 'Pioneer Municipal High Income Opportunities Fund, Inc.',
-    'EMX': 'EMX Royalty Corp',
-    'MOLN': 'MOLECULAR PARTNERS AG',
-    'CIO': 'City Office REIT, Inc.',
-    'BHR': 'Braemar Hotels & Resorts Inc.',
-    'CORBF': 'Global Cord Blood Corp',
-    'MBCN': 'MIDDLEFIELD BANC CORP',
-    'DBP': 'Invesco DB Precious Metals Fund',
-    'RGCO': 'RGC RESOURCES INC',
-    'FGPR': 'FERRELLGAS PARTNERS L P',
-    'OPP': 'RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.',
-    'IKT': 'Inhibikase Therapeutics, Inc.',
-    'BCOV': 'BRIGHTCOVE INC',
-    'DBB': 'INVESCO DB BASE METALS FUND',
-    'KGNR': 'AMJ Global Technology',
-    'ESCA': 'ESCALADE INC',
-    'MGNX': 'MACROGENICS INC',
-    'DLNG': 'Dynagas LNG Partners LP',
-    'OGI': 'ORGANIGRAM HOLDINGS INC.',
-    'BAER': 'Bridger Aerospace Group Holdings, Inc.',
-    'TSNDF': 'TerrAscend Corp.',
-    'SKIN': 'Beauty Health Co',
-    'SJT': 'SAN JUAN BASIN ROYALTY TRUST',
-    'GPJA': 'GEORGIA POWER CO',
-    'ZNTL': 'Zentalis Pharmaceuticals, Inc.',
-    'MXF': 'MEXICO FUND INC',
-    'AZ': 'A2Z CUST2MATE SOLUTIONS CORP.',
-    'TROO': 'Troops, Inc. /Cayman Islands/',
-    'PHLT': 'Performant Healthcare Inc',
-    'BVFL': 'BV Financial, Inc.',
-    'PLL': 'Piedmont Lithium Inc.',
-    'AOUT': 'American Outdoor Brands, Inc.',
-    'GAUZ': 'Gauzy Ltd.',
-    'SWKH': 'SWK Holdings Corp',
-    'ETX': 'Eaton Vance Municipal Income 2028 Term Trust',
-    'SOPH': 'SOPHiA GENETICS SA',
-    'FXE': 'Invesco CurrencyShares Euro Trust',
-    'UMAC': 'Unusual Machines, Inc.',
-    'NKTR': 'NEKTAR THERAPEUTICS',
-    'VOR': 'Vor Biopharma Inc.',
-    'PESI': 'PERMA FIX ENVIRONMENTAL SERVICES INC',
-    'HYB': 'NEW AMERICA HIGH INCOME FUND INC',
-    'BNIGF': 'Beroni Group Ltd',
-    'TARA': 'Protara Therapeutics, Inc.',
-    'KOPN': 'KOPIN CORP',
-    'ESSA': 'ESSA Bancorp, Inc.',
-    'BKN': 'BLACKROCK INVESTMENT QUALITY MUNICIPAL TRUST, INC.',
-    'LAKE': 'LAKELAND INDUSTRIES INC',
-    'TTEC': 'TTEC Holdings, Inc.',
-    'ESOA': 'Energy Services of America CORP',
-    'FFNW': 'First Financial Northwest, Inc.',
-    'DMB': 'BNY Mellon Municipal Bond Infrastructure Fund, Inc.',
-    'APPS': 'Digital Turbine, Inc.',
-    'BSII': 'Black Spade Acquisition II Co',
-    'IVCBF': 'Investcorp Europe Acquisition Corp I',
-    'RELL': 'RICHARDSON ELECTRONICS, LTD.',
-    'PVBC': 'Provident Bancorp, Inc. /MD/',
-    'DHF': 'BNY MELLON HIGH YIELD STRATEGIES FUND',
-    'EARN': 'Ellington Credit Co',
-    'GOAI': 'Eva Live Inc',
-    'ISBA': 'ISABELLA BANK Corp',
-    'HMST': 'HomeStreet, Inc.',
-    'CLLS': 'Cellectis S.A.',
-    'EGAN': 'EGAIN Corp',
-    'RAIL': 'FreightCar America, Inc.',
-    'JYD': 'Jayud Global Logistics Ltd',
-    'SMHI': 'SEACOR Marine Holdings Inc.',
-    'BSL': 'Blackstone Senior Floating Rate 2027 Term Fund',
-    'WIA': 'WESTERN ASSET INFLATION-LINKED INCOME FUND',
-    'BDSX': 'BIODESIX INC',
-    'BCBP': 'BCB BANCORP INC',
-    'EMP': 'ENTERGY MISSISSIPPI, LLC',
-    'VSTA': 'Vasta Platform Ltd',
-    'BRLT': 'Brilliant Earth Group, Inc.',
-    'DSY': 'Big Tree Cloud Holdings Ltd',
-    'ISTR': 'Investar Holding Corp',
-    'FT': 'FRANKLIN UNIVERSAL TRUST',
-    'NOTE': 'FiscalNote Holdings, Inc.',
-    'MITT': 'AG Mortgage Investment Trust, Inc.',
-    'VABK': 'Virginia National Bankshares Corp',
-    'SEVN': 'Seven Hills Realty Trust',
-    'FSP': 'FRANKLIN STREET PROPERTIES CORP /MA/',
-    'INSI': 'Insight Select Income Fund',
-    'HQI': 'HireQuest, Inc.',
-    'ELA': 'Envela Corp',
-    'PCK': 'PIMCO CALIFORNIA MUNICIPAL INCOME FUND II',
-    'AEYE': 'AUDIOEYE INC',
-    'KRMD': 'KORU Medical Systems, Inc.',
-    'PROC': 'Procaps Group, S.A.',
-    'CCRD': 'CoreCard Corp',
-    'EQC': 'Equity Commonwealth',
-    'VPV': 'Invesco Pennsylvania Value Municipal Income Trust',
-    'AFCG': 'Advanced Flower Capital Inc.',
-    'CHGG': 'CHEGG, INC',
-    'STXS': 'Stereotaxis, Inc.',
-    'AKA': 'A.K.A. BRANDS HOLDING CORP.',
-    'ADCT': 'ADC Therapeutics SA',
-    'CYDY': 'CytoDyn Inc.',
-    'WNEB': 'Western New England Bancorp, Inc.',
-    'GNFT': 'Genfit S.A.',
-    'EPM': 'EVOLUTION PETROLEUM CORP',
-    'MDWD': 'MediWound Ltd.',
-    'EMF': 'TEMPLETON EMERGING MARKETS FUND',
-    'NTWO': 'Newbury Street II Acquisition Corp',
-    'MRCC': 'MONROE CAPITAL Corp',
-    'RMBL': 'RumbleOn, Inc.',
-    'LYEL': 'Lyell Immunopharma, Inc.',
-    'BWAY': 'Brainsway Ltd.',
-    'VXRT': 'Vaxart, Inc.',
-    'EACO': 'EACO CORP',
-    'CYBN': 'CYBIN INC.',
-    'TCX': 'TUCOWS INC /PA/',
-    'MPV': 'BARINGS PARTICIPATION INVESTORS',
-    'NHHS': 'NorthStar Healthcare Income, Inc.',
-    'IGI': 'Western Asset Investment Grade Opportunity Trust Inc.',
-    'JRVR': 'James River Group Holdings, Ltd.',
-    'KINS': 'KINGSTONE COMPANIES, INC.',
-    'CMCL': 'Caledonia Mining Corp Plc',
-    'WBX': 'Wallbox N.V.',
-    'VBF': 'Invesco Bond Fund',
-    'SPKL': 'Spark I Acquisition Corp',
-    'NEGG': 'Newegg Commerce, Inc.',
-    'BIOA': 'BioAge Labs, Inc.',
-    'FLC': 'FLAHERTY & CRUMRINE TOTAL RETURN FUND INC',
-    'SKGR': 'SK Growth Opportunities Corp',
-    'TMQ': 'Trilogy Metals Inc.',
-    'SLND': 'Southland Holdings, Inc.',
-    'LOGC': 'ContextLogic Inc.',
-    'OXSQ': 'Oxford Square Capital Corp.',
-    'ENJ': 'ENTERGY NEW ORLEANS, LLC',
-    'ALEC': 'Alector, Inc.',
-    'FSFG': 'First Savings Financial Group, Inc.',
-    'ABAT': 'AMERICAN BATTERY TECHNOLOGY Co',
-    'MED': 'MEDIFAST INC',
-    'ACRV': 'Acrivon Therapeutics, Inc.',
-    'FCCO': 'FIRST COMMUNITY CORP /SC/',
-    'ADUR': 'ADURO CLEAN TECHNOLOGIES INC.',
-    'NKSH': 'NATIONAL BANKSHARES INC',
-    'BRKH': 'BurTech Acquisition Corp.',
-    'SCPH': 'scPharmaceuticals Inc.',
-    'FATE': 'FATE THERAPEUTICS INC',
-    'CLPR': 'Clipper Realty Inc.',
-    'BCHG': 'Grayscale Bitcoin Cash Trust (BCH)',
-    'HGLB': 'HIGHLAND GLOBAL ALLOCATION FUND',
-    'BEEP': 'Mobile Infrastructure Corp',
-    'PCQ': 'PIMCO CALIFORNIA MUNICIPAL INCOME FUND',
-    'YIBO': 'Planet Image International Ltd',
-    'ENX': 'Eaton Vance New York Municipal Bond Fund',
-    'KEQU': 'KEWAUNEE SCIENTIFIC CORP /DE/',
-    'TDAC': 'Translational Development Acquisition Corp.',
-    'NUTX': 'Nutex Health, Inc.',
-    'SAMG': 'Silvercrest Asset Management Group Inc.',
-    'RRACF': 'Rigel Resource Acquisition Corp.',
-    'CHRS': 'Coherus BioSciences, Inc.',
-    'SPCE': 'Virgin Galactic Holdings, Inc',
-    'GPRO': 'GoPro, Inc.',
-    'UBFO': 'UNITED SECURITY BANCSHARES',
-    'MYFW': 'First Western Financial Inc',
-    'PSQH': 'PSQ Holdings, Inc.',
-    'CLAR': 'Clarus Corp',
-    'REKR': 'Rekor Systems, Inc.',
-    'NRO': 'NEUBERGER BERMAN REAL ESTATE SECURITIES INCOME FUND INC',
-    'EUDA': 'EUDA Health Holdings Ltd',
-    'INSG': 'INSEEGO CORP.',
-    'ORGN': 'Origin Materials, Inc.',
-    'UAMY': 'UNITED STATES ANTIMONY CORP',
-    'NKTX': 'Nkarta, Inc.',
-    'CSPI': 'CSP INC /MA/',
-    'PLX': 'Protalix BioTherapeutics, Inc.',
-    'GBUX': 'GIVBUX, INC.',
-    'FENC': 'FENNEC PHARMACEUTICALS INC.',
-    'VOXX': 'VOXX International Corp',
-    'RCKY': 'ROCKY BRANDS, INC.',
-    'SGHT': 'Sight Sciences, Inc.',
-    'FLL': 'FULL HOUSE RESORTS INC',
-    'GLSI': 'Greenwich LifeSciences, Inc.',
-    'DYNX': 'Dynamix Corp',
-    'PBYI': 'PUMA BIOTECHNOLOGY, INC.',
-    'SGMT': 'Sagimet Biosciences Inc.',
-    'MHH': 'Mastech Digital, Inc.',
-    'OPTT': 'Ocean Power Technologies, Inc.',
-    'BKKT': 'Bakkt Holdings, Inc.',
-    'CDLX': 'Cardlytics, Inc.',
-    'TRVG': 'trivago N.V.',
-    'INFU': 'InfuSystem Holdings, Inc',
-    'ACTU': 'ACTUATE THERAPEUTICS, INC.',
-    'BGX': 'Blackstone Long-Short Credit Income Fund',
-    'NANX': 'NANOPHASE TECHNOLOGIES Corp',
-    'NXG': 'NXG NextGen Infrastructure Income Fund',
-    'TEAF': 'TORTOISE SUSTAINABLE & SOCIAL IMPACT TERM FUND',
-    'FEIM': 'FREQUENCY ELECTRONICS INC',
-    'BTOC': 'Armlogi Holding Corp.',
-    'DRTTF': 'DIRTT ENVIRONMENTAL SOLUTIONS LTD',
-    'IBAC': 'IB Acquisition Corp.',
-    'REE': 'REE Automotive Ltd.',
-    'TOYO': 'TOYO Co., Ltd',
-    'VYEY': 'VICTORY CLEAN ENERGY, INC.',
-    'GLDG': 'GoldMining Inc.',
-    'EML': 'EASTERN CO',
-    'FLDD': 'FTAC Emerald Acquisition Corp.',
-    'PTLE': 'PTL Ltd',
-    'GDRZF': 'GOLD RESERVE LTD',
-    'SPE': 'SPECIAL OPPORTUNITIES FUND, INC.',
-    'BLNK': 'Blink Charging Co.',
-    'TAVI': 'Tavia Acquisition Corp.',
-    'CRGO': 'Freightos Ltd',
-    'SSTI': 'SOUNDTHINKING, INC.',
-    'MNPR': 'Monopar Therapeutics',
-    'PIM': 'PUTNAM MASTER INTERMEDIATE INCOME TRUST',
-    'CBNA': 'CHAIN BRIDGE BANCORP INC',
-    'POWW': 'AMMO, INC.',
-    'BMN': 'BlackRock 2037 Municipal Target Term Trust',
-    'TWIN': 'TWIN DISC INC',
-    'TLSI': 'TriSalus Life Sciences, Inc.',
-    'STRT': 'STRATTEC SECURITY CORP',
-    'SDST': 'Stardust Power Inc.',
-    'BXSY': 'BEXIL INVESTMENT TRUST',
-    'TCRX': 'TScan Therapeutics, Inc.',
-    'HNVR': 'Hanover Bancorp, Inc. /NY',
-    'HCVI': 'Hennessy Capital Investment Corp. VI',
-    'MSD': 'MORGAN STANLEY EMERGING MARKETS DEBT FUND INC',
-    'QRTEA': 'Qurate Retail, Inc.',
-    'CZWI': 'Citizens Community Bancorp Inc.',
-    'CIK': 'CREDIT SUISSE ASSET MANAGEMENT INCOME FUND, INC.',
-    'BZUN': 'Baozun Inc.',
-    'MRBK': 'Meridian Corp',
-    'PDEX': 'PRO DEX INC',
-    'PVLA': 'PALVELLA THERAPEUTICS, INC.',
-    'BFACF': 'Battery Future Acquisition Corp.',
-    'HFFG': 'HF Foods Group Inc.',
-    'RFAI': 'RF Acquisition Corp II',
-    'CKPT': 'Checkpoint Therapeutics, Inc.',
-    'CRAWA': 'CRAWFORD UNITED Corp',
-    'NORD': 'Nordicus Partners Corp',
-    'PAYS': 'Paysign, Inc.',
-    'TSE': 'Trinseo PLC',
-    'NNY': 'NUVEEN NEW YORK MUNICIPAL VALUE FUND',
-    'IPHA': 'Innate Pharma SA',
-    'STFS': 'Star Fashion Culture Holdings Ltd',
-    'STRO': 'SUTRO BIOPHARMA, INC.',
-    'PZC': 'PIMCO CALIFORNIA MUNICIPAL INCOME FUND III',
-    'RENE': 'Cartesian Growth Corp II',
-    'AXR': 'AMREP CORP.',
-    'STRS': 'STRATUS PROPERTIES INC',
-    'PROP': 'Prairie Operating Co.',
-    'RCMT': 'RCM TECHNOLOGIES, INC.',
-    'MPA': 'BLACKROCK MUNIYIELD PENNSYLVANIA QUALITY FUND',
-    'EHI': 'WESTERN ASSET GLOBAL HIGH INCOME FUND INC.',
-    'AKYA': 'Akoya Biosciences, Inc.',
-    'IDE': 'Voya Infrastructure, Industrials & Materials Fund',
-    'MHF': 'WESTERN ASSET MUNICIPAL HIGH INCOME FUND INC.',
-    'JYNT': 'JOINT Corp',
-    'CCFN': 'MUNCY COLUMBIA FINANCIAL Corp',
-    'BW': 'Babcock & Wilcox Enterprises, Inc.',
-    'VTN': 'Invesco Trust for Investment Grade New York Municipals',
-    'FNRN': 'FIRST NORTHERN COMMUNITY BANCORP',
-    'VIRC': 'VIRCO MFG CORPORATION',
-    'ICTSF': 'ICTS INTERNATIONAL N V',
-    'III': 'Information Services Group Inc.',
-    'MX': 'MAGNACHIP SEMICONDUCTOR Corp',
-    'PTMN': 'Portman Ridge Finance Corp',
-    'NEOV': 'NeoVolta Inc.',
-    'TDUP': 'ThredUp Inc.',
-    'AWCA': 'Awaysis Capital, Inc.',
-    'GRX': 'Gabelli Healthcare & WellnessRx Trust',
-    'ADAP': 'Adaptimmune Therapeutics PLC',
-    'CGEN': 'COMPUGEN LTD',
-    'VTYX': 'Ventyx Biosciences, Inc.',
-    'PHX': 'PHX MINERALS INC.',
-    'PEBK': 'PEOPLES BANCORP OF NORTH CAROLINA INC',
-    'EDF': 'Virtus Stone Harbor Emerging Markets Income Fund',
-    'SRI': 'STONERIDGE INC',
-    'ISSC': 'INNOVATIVE SOLUTIONS & SUPPORT INC',
-    'KYTX': 'Kyverna Therapeutics, Inc.',
-    'BANX': 'ArrowMark Financial Corp.',
-    'LDDD': 'Longduoduo Co Ltd',
-    'BOOM': 'DMC Global Inc.',
-    'CRBU': 'Caribou Biosciences, Inc.',
-    'EVG': 'Eaton Vance Short Duration Diversified Income Fund',
-    'PLBY': 'PLBY Group, Inc.',
-    'OCCI': 'OFS Credit Company, Inc.',
-    'SHIP': 'Seanergy Maritime Holdings Corp.',
-    'DMF': 'BNY MELLON MUNICIPAL INCOME, INC.',
-    'IDR': 'Idaho Strategic Resources, Inc.',
-    'HYSR': 'SUNHYDROGEN, INC.',
-    'ISRL': 'Israel Acquisitions Corp',
-    'ATLO': 'AMES NATIONAL CORP',
-    'ITRG': 'Integra Resources Corp.',
-    'KNIT': 'KINETIC GROUP INC.',
-    'LTRX': 'LANTRONIX INC',
-    'BFIN': 'BankFinancial CORP',
-    'CXDO': 'Crexendo, Inc.',
-    'DXLG': 'DESTINATION XL GROUP, INC.',
-    'MPTI': 'M-tron Industries, Inc.',
-    'MCRB': 'Seres Therapeutics, Inc.',
-    'BMEA': 'Biomea Fusion, Inc.',
-    'PFD': 'FLAHERTY & CRUMRINE PREFERRED & INCOME FUND INC',
-    'ASM': 'AVINO SILVER & GOLD MINES LTD',
-    'SLDB': 'Solid Biosciences Inc.',
-    'NBTX': 'Nanobiotix S.A.',
-    'IGA': 'Voya Global Advantage & Premium Opportunity Fund',
-    'CRBP': 'Corbus Pharmaceuticals Holdings, Inc.',
-    'EPSN': 'Epsilon Energy Ltd.',
-    'NOTV': 'Inotiv, Inc.',
-    'MDV': 'MODIV INDUSTRIAL, INC.',
-    'SEER': 'Seer, Inc.',
-    'SPPP': 'SPROTT PHYSICAL PLATINUM & PALLADIUM TRUST',
-    'CFBK': 'CF BANKSHARES INC.',
-    'AMTX': 'AEMETIS, INC',
-    'ZURA': 'Zura Bio Ltd',
-    'CHSN': 'Chanson International Holding',
-    'SKYX': 'SKYX Platforms Corp.',
-    'MCN': 'XAI Madison Equity Premium Income Fund',
-    'CSTE': 'Caesarstone Ltd.',
-    'TUSK': 'MAMMOTH ENERGY SERVICES, INC.',
-    'DOUG': 'Douglas Elliman Inc.',
-    'GGR': 'Gogoro Inc.',
-    'IFRX': 'InflaRx N.V.',
-    'MPAA': 'MOTORCAR PARTS OF AMERICA INC',
-    'HOFT': 'HOOKER FURNISHINGS Corp',
-    'PDCC': 'Pearl Diver Credit Co Inc.',
-    'SRV': 'NXG Cushing Midstream Energy Fund',
-    'NCTY': 'The9 LTD',
-    'CBFV': 'CB Financial Services, Inc.',
-    'GRUSF': 'Grown Rogue International Inc.',
-    'RILY': 'B. Riley Financial, Inc.',
-    'WKEY': 'Wisekey International Holding S.A.',
-    'SAVA': 'CASSAVA SCIENCES INC',
-    'BROG': 'Brooge Energy Ltd',
-    'FTLF': 'FITLIFE BRANDS, INC.',
-    'NEON': 'Neonode Inc.',
-    'TSQ': 'Townsquare Media, Inc.',
-    'CLYM': 'Climb Bio, Inc.',
-    'MRAM': 'EVERSPIN TECHNOLOGIES INC',
-    'NAZ': 'NUVEEN ARIZONA QUALITY MUNICIPAL INCOME FUND',
-    'FRGE': 'Forge Global Holdings, Inc.',
-    'ZENV': 'Zenvia Inc.',
-    'QMCO': 'QUANTUM CORP /DE/',
-    'UNB': 'UNION BANKSHARES INC',
-    'WHG': 'WESTWOOD HOLDINGS GROUP INC',
-    'CURR': 'Currenc Group Inc.',
-    'ACR': 'ACRES Commercial Realty Corp.',
-    'SSSS': 'SURO CAPITAL CORP.',
-    'SBFG': 'SB FINANCIAL GROUP, INC.',
-    'PLG': 'PLATINUM GROUP METALS LTD',
-    'BWG': 'BrandywineGLOBAL-Global Income Opportunities Fund Inc',
-    'STEM': 'STEM, INC.',
-    'RSSS': 'Research Solutions, Inc.',
-    'SUAC': 'ShoulderUP Technology Acquisition Corp.',
-    'ACU': 'ACME UNITED CORP',
-    'GPMT': 'Granite Point Mortgage Trust Inc.',
-    'LARK': 'LANDMARK BANCORP INC',
-    'TDTH': 'Trident Digital Tech Holdings Ltd',
-    'NIU': 'Niu Technologies',
-    'VGAS': 'Verde Clean Fuels, Inc.',
-    'RPMT': 'REGO PAYMENT ARCHITECTURES, INC.',
-    'VERI': 'Veritone, Inc.',
-    'VEEA': 'VEEA INC.',
-    'ECF': 'ELLSWORTH GROWTH & INCOME FUND LTD',
-    'BRLS': 'Borealis Foods Inc.',
-    'SATX': 'SatixFy Communications Ltd.',
-    'DMO': 'Western Asset Mortgage Opportunity Fund Inc.',
-    'PLCE': 'Childrens Place, Inc.',
-    'AVD': 'AMERICAN VANGUARD CORP',
-    'FGBI': 'First Guaranty Bancshares, Inc.',
-    'VGES': 'Vanguard Green Investment Ltd',
-    'INZY': 'Inozyme Pharma, Inc.',
-    'CMT': 'CORE MOLDING TECHNOLOGIES INC',
-    'BTA': 'BlackRock Long-Term Municipal Advantage Trust',
-    'FREVS': 'FIRST REAL ESTATE INVESTMENT TRUST OF NEW JERSEY',
-    'ZLSSF': 'Zalatoris II Acquisition Corp',
-    'LILMF': 'Lilium N.V.',
-    'ALTO': 'Alto Ingredients, Inc.',
-    'DBE': 'Invesco DB Energy Fund',
-    'RMBI': 'Richmond Mutual Bancorporation, Inc.',
-    'GGT': 'GABELLI MULTIMEDIA TRUST INC.',
-    'OPRT': 'Oportun Financial Corp',
-    'UEIC': 'UNIVERSAL ELECTRONICS INC',
-    'PHYTF': 'Pyrophyte Acquisition Corp.',
-    'QUIK': 'QUICKLOGIC Corp',
-    'DIBS': '1stdibs.com, Inc.',
-    'ZOM': 'Zomedica Corp.',
-    'MNSB': 'MainStreet Bancshares, Inc.',
-    'JHS': 'JOHN HANCOCK INCOME SECURITIES TRUST',
-    'YXT': 'YXT.COM GROUP HOLDING Ltd',
-    'MAMO': 'Massimo Group',
-    'TIL': 'Instil Bio, Inc.',
-    'LPSN': 'LIVEPERSON INC',
-    'CSLR': 'Complete Solaria, Inc.',
-    'EFSI': 'EAGLE FINANCIAL SERVICES INC',
-    'ZJYL': 'Jin Medical International Ltd.',
-    'XNET': 'Xunlei Ltd',
-    'CSBR': 'CHAMPIONS ONCOLOGY, INC.',
-    'BETR': 'Better Home & Finance Holding Co',
-    'TSVT': '2seventy bio, Inc.',
-    'SFBC': 'Sound Financial Bancorp, Inc.',
-    'RMMZ': 'RiverNorth Managed Duration Municipal Income Fund II, Inc.',
-    'PHH': 'Park Ha Biological Technology Co., Ltd.',
-    'GF': 'NEW GERMANY FUND INC',
-    'GEOS': 'GEOSPACE TECHNOLOGIES CORP',
-    'OPOF': 'OLD POINT FINANCIAL CORP',
-    'AISP': 'Airship AI Holdings, Inc.',
-    'WEA': 'WESTERN ASSET PREMIER BOND FUND',
-    'LFT': 'Lument Finance Trust, Inc.',
-    'CGTL': 'Creative Global Technology Holdings Ltd',
-    'MMLP': 'MARTIN MIDSTREAM PARTNERS L.P.',
-    'RDZN': 'Roadzen Inc.',
-    'GLQ': 'Clough Global Equity Fund',
-    'PIII': 'P3 Health Partners Inc.',
-    'TLYS': 'TILLY'S, INC.',
-    'VFL': 'abrdn National Municipal Income Fund',
-    'IGMS': 'IGM Biosciences, Inc.',
-    'QIPT': 'Quipt Home Medical Corp.',
-    'NTCL': 'NetClass Technology Inc',
-    'QNBC': 'QNB CORP',
-    'CWGL': 'Crimson Wine Group, Ltd',
-    'RPT': 'Rithm Property Trust Inc.',
-    'WLAC': 'Willow Lane Acquisition Corp.',
-    'ECBK': 'ECB Bancorp, Inc. /MD/',
-    'NTIC': 'NORTHERN TECHNOLOGIES INTERNATIONAL CORP',
-    'FMN': 'Federated Hermes Premier Municipal Income Fund',
-    'CTGO': 'Contango ORE, Inc.',
-    'NNBR': 'NN INC',
-    'QH': 'QUHUO Ltd',
-    'RMGCF': 'RMG Acquisition Corp. III',
-    'HEQ': 'John Hancock Hedged Equity & Income Fund',
-    'TELO': 'Telomir Pharmaceuticals, Inc.',
-    'LPTH': 'LIGHTPATH TECHNOLOGIES INC',
-    'FRAF': 'FRANKLIN FINANCIAL SERVICES CORP /PA/',
-    'PCF': 'HIGH INCOME SECURITIES FUND',
-    'INMB': 'Inmune Bio, Inc.',
-    'JHI': 'JOHN HANCOCK INVESTORS TRUST',
-    'ULBI': 'ULTRALIFE CORP',
-    'ASFH': 'ASIAFIN HOLDINGS CORP.',
-    'FTCO': 'Fortitude Gold Corp',
-    'BSET': 'BASSETT FURNITURE INDUSTRIES INC',
-    'CCIF': 'Carlyle Credit Income Fund',
-    'HFUS': 'Hartford Creative Group, Inc.',
-    'EMYB': 'Embassy Bancorp, Inc.',
-    'WIMI': 'WiMi Hologram Cloud Inc.',
-    'ALGS': 'Aligos Therapeutics, Inc.',
-    'SIEB': 'SIEBERT FINANCIAL CORP',
-    'FBRX': 'Forte Biosciences, Inc.',
-    'LCUT': 'LIFETIME BRANDS, INC',
-    'NVRO': 'NEVRO CORP',
-    'LCTX': 'Lineage Cell Therapeutics, Inc.',
-    'GNSS': 'Genasys Inc.',
-    'YAAS': 'Youxin Technology Ltd',
-    'QRHC': 'Quest Resource Holding Corp',
-    'NUKK': 'Nukkleus Inc.',
-    'PPIH': 'Perma-Pipe International Holdings, Inc.',
-    'RENB': 'RENOVARO INC.',
-    'PLAO': 'Patria Latin American Opportunity Acquisition Corp.',
-    'PHD': 'Pioneer Floating Rate Fund, Inc.',
-    'FXY': 'Invesco CurrencyShares Japanese Yen Trust',
-    'CSTAF': 'Constellation Acquisition Corp I',
-    'CHEB': 'Chenghe Acquisition II Co.',
-    'VOXR': 'VOX ROYALTY CORP.',
-    'CMTL': 'COMTECH TELECOMMUNICATIONS CORP /DE/',
-    'SRL': 'Scully Royalty Ltd.',
-    'FGFH': 'FORESIGHT FINANCIAL GROUP INC',
-    'AZI': 'Autozi Internet Technology (Global) Ltd.',
-    'CMCM': 'Cheetah Mobile Inc.',
-    'XBIT': 'XBiotech Inc.',
-    'LPTX': 'LEAP THERAPEUTICS, INC.',
-    'AOAO': 'Alpha One Inc.',
-    'BUKS': 'BUTLER NATIONAL CORP',
-    'HURC': 'HURCO COMPANIES INC',
-    'FNWD': 'Finward Bancorp',
-    'GCTS': 'GCT Semiconductor Holding, Inc.',
-    'VIVC': 'VIVIC CORP.',
-    'PFO': 'Flaherty & Crumrine PREFERRED & INCOME OPPORTUNITY FUND INC',
-    'GIFI': 'GULF ISLAND FABRICATION INC',
-    'VBFC': 'Village Bank & Trust Financial Corp.',
-    'MHLD': 'Maiden Holdings, Ltd.',
-    'TNYA': 'Tenaya Therapeutics, Inc.',
-    'TOUR': 'Tuniu Corp',
-    'ACHV': 'ACHIEVE LIFE SCIENCES, INC.',
-    'GECC': 'Great Elm Capital Corp.',
-    'LVO': 'LiveOne, Inc.',
-    'HTLM': 'HomesToLife Ltd',
-    'RVSB': 'RIVERVIEW BANCORP INC',
-    'GATE': 'Marblegate Acquisition Corp.',
-    'PAI': 'Western Asset Investment Grade Income Fund Inc.',
-    'TNMG': 'TNL Mediagene',
-    'EBMT': 'Eagle Bancorp Montana, Inc.',
-    'UPLD': 'Upland Software, Inc.',
-    'PLNH': 'Planet 13 Holdings Inc.',
-    'LODE': 'Comstock Inc.',
-    'CAAS': 'CHINA AUTOMOTIVE SYSTEMS INC',
-    'DTI': 'Drilling Tools International Corp',
-    'MTWO': 'M2i Global, Inc.',
-    'MGX': 'Metagenomi, Inc.',
-    'CXE': 'MFS HIGH INCOME MUNICIPAL TRUST',
-    'ACNT': 'ASCENT INDUSTRIES CO.',
-    'ELUT': 'ELUTIA INC.',
-    'ATOS': 'ATOSSA THERAPEUTICS, INC.',
-    'CHMX': 'NEXT-ChemX Corporation.',
-    'COE': '51Talk Online Education Group',
-    'PLMJ': 'Plum Acquisition Corp. III',
-    'VCSA': 'Vacasa, Inc.',
-    'BMBN': 'BENCHMARK BANKSHARES INC',
-    'COPR': 'Idaho Copper Corp',
-    'IAF': 'ABRDN AUSTRALIA EQUITY FUND, INC.',
-    'NA': 'Nano Labs Ltd',
-    'IZTC': 'Invizyne Technologies Inc',
-    'SHMD': 'SCHMID Group N.V.',
-    'ALYAF': 'Alithya Group inc',
-    'PCSC': 'Perceptive Capital Solutions Corp',
-    'NVCT': 'Nuvectis Pharma, Inc.',
-    'ZTEK': 'Zentek Ltd.',
-    'CGO': 'CALAMOS GLOBAL TOTAL RETURN FUND',
-    'AFBI': 'Affinity Bancshares, Inc.',
-    'STHO': 'Star Holdings',
-    'ANRO': 'Alto Neuroscience, Inc.',
-    'SLNG': 'Stabilis Solutions, Inc.',
-    'KVHI': 'KVH INDUSTRIES INC \DE\',
-    'IMPP': 'Imperial Petroleum Inc./Marshall Islands',
-    'SVII': 'Spring Valley Acquisition Corp. II',
-    'OVBC': 'OHIO VALLEY BANC CORP',
-    'LGO': 'Largo Inc.',
-    'TLGYF': 'TLGY ACQUISITION CORP',
-    'BKTI': 'BK Technologies Corp',
-    'EVF': 'Eaton Vance Senior Income Trust',
-    'XCH': 'XCHG Ltd',
-    'LVPA': 'LVPAI GROUP Ltd',
-    'AMWL': 'American Well Corp',
-    'WW': 'WW INTERNATIONAL, INC.',
-    'TELA': 'TELA Bio, Inc.',
-    'MIST': 'Milestone Pharmaceuticals Inc.',
-    'SBI': 'WESTERN ASSET INTERMEDIATE MUNI FUND INC.',
-    'NIM': 'NUVEEN SELECT MATURITIES MUNICIPAL FUND',
-    'PPYA': 'Papaya Growth Opportunity Corp. I',
-    'INTT': 'INTEST CORP',
-    'BDTX': 'Black Diamond Therapeutics, Inc.',
-    'YSXT': 'YSX Tech Co., Ltd',
-    'TAYD': 'TAYLOR DEVICES, INC.',
-    'CHN': 'China Fund, Inc.',
-    'ZENA': 'ZenaTech, Inc.',
-    'DLHC': 'DLH Holdings Corp.',
-    'BDCC': 'Blackwell 3D Construction Corp.',
-    'FCAP': 'FIRST CAPITAL INC',
-    'ENTA': 'ENANTA PHARMACEUTICALS INC',
-    'MAXN': 'Maxeon Solar Technologies, Ltd.',
-    'ODYS': 'Odysight.ai Inc.',
-    'OFS': 'OFS Capital Corp',
-    'NMT': 'NUVEEN MASSACHUSETTS QUALITY MUNICIPAL INCOME FUND',
-    'EPRX': 'EUPRAXIA PHARMACEUTICALS INC.',
-    'ANNA': 'AleAnna, Inc.',
-    'SRTS': 'Sensus Healthcare, Inc.',
-    'ECOR': 'electroCore, Inc.',
-    'CEP': 'Cantor Equity Partners, Inc.',
-    'BHST': 'BIOHARVEST SCIENCES INC.',
-    'VERU': 'VERU INC.',
-    'RBKB': 'Rhinebeck Bancorp, Inc.',
-    'UFI': 'UNIFI INC',
-    'JSPR': 'Jasper Therapeutics, Inc.',
-    'OSTX': 'OS Therapies Inc',
-    'LGCY': 'Legacy Education Inc.',
-    'SOL': 'Emeren Group Ltd',
-    'SILC': 'SILICOM LTD.',
-    'BCV': 'BANCROFT FUND LTD',
-    'EDIT': 'Editas Medicine, Inc.',
-    'CRDL': 'Cardiol Therapeutics Inc.',
-    'CPHC': 'Canterbury Park Holding Corp',
-    'KBLB': 'Kraig Biocraft Laboratories, Inc',
-    'WMPN': 'William Penn Bancorporation',
-    'PHUN': 'Phunware, Inc.',
-    'PROV': 'PROVIDENT FINANCIAL HOLDINGS INC',
-    'THCH': 'TH International Ltd',
-    'USGO': 'U.S. GoldMining Inc.',
-    'GAIA': 'GAIA, INC',
-    'CABA': 'Cabaletta Bio, Inc.',
-    'ATLX': 'Atlas Lithium Corp',
-    'NKLA': 'Nikola Corp',
-    'OKUR': 'OnKure Therapeutics, Inc.',
-    'FRD': 'FRIEDMAN INDUSTRIES INC',
-    'VIOT': 'Viomi Technology Co., Ltd',
-    'IVFH': 'INNOVATIVE FOOD HOLDINGS INC',
-    'SRBK': 'SR Bancorp, Inc.',
-    'DHX': 'DHI GROUP, INC.',
-    'ME': '23andMe Holding Co.',
-    'HLVX': 'HilleVax, Inc.',
-    'DLTH': 'DULUTH HOLDINGS INC.',
-    'VRA': 'Vera Bradley, Inc.',
-    'BBXIA': 'BBX Capital, Inc.',
-    'FOSL': 'Fossil Group, Inc.',
-    'DBVT': 'DBV Technologies S.A.',
-    'ABOS': 'Acumen Pharmaceuticals, Inc.',
-    'MDXH': 'MDxHealth SA',
-    'BSBK': 'Bogota Financial Corp.',
-    'CODA': 'Coda Octopus Group, Inc.',
-    'CLEU': 'China Liberal Education Holdings Ltd',
-    'BZFD': 'BuzzFeed, Inc.',
-    'TBMC': 'Trailblazer Merger Corp I',
-    'HNW': 'Pioneer Diversified High Income Fund, Inc.',
-    'ASMB': 'ASSEMBLY BIOSCIENCES, INC.',
-    'BRIA': 'BrilliA Inc',
-    'BOWN': 'Bowen Acquisition Corp',
-    'MGF': 'MFS GOVERNMENT MARKETS INCOME TRUST',
-    'JLS': 'Nuveen Mortgage & Income Fund/MA/',
-    'QSG': 'QuantaSing Group Ltd',
-    'ERH': 'ALLSPRING UTILITIES & HIGH INCOME FUND',
-    'SWZ': 'SWISS HELVETIA FUND, INC.',
-    'PFX': 'PhenixFIN Corp',
-    'OPRX': 'OptimizeRx Corp',
-    'COYA': 'Coya Therapeutics, Inc.',
-    'ELVA': 'Electrovaya Inc.',
-    'CSBB': 'CSB Bancorp, Inc.',
-    'PETS': 'PETMED EXPRESS INC',
-    'OCFT': 'ONECONNECT FINANCIAL TECHNOLOGY CO., LTD.',
-    'NOBH': 'NOBILITY HOMES INC',
-    'XFOR': 'X4 Pharmaceuticals, Inc',
-    'FONR': 'FONAR CORP',
-    'LNSR': 'LENSAR, Inc.',
-    'RMI': 'RiverNorth Opportunistic Municipal Income Fund, Inc.',
-    'MODV': 'ModivCare Inc',
-    'RECT': 'Rectitude Holdings Ltd.',
-    'PEPG': 'PepGen Inc.',
-    'AFJK': 'Aimei Health Technology Co., Ltd.',
-    'MVO': 'MV Oil Trust',
-    'OPTX': 'SYNTEC OPTICS HOLDINGS, INC.',
-    'ACOG': 'Alpha Cognition Inc.',
-    'GGZ': 'Gabelli Global Small & Mid Cap Value Trust',
-    'ORMP': 'ORAMED PHARMACEUTICALS INC.',
-    'AE': 'ADAMS RESOURCES & ENERGY, INC.',
-    'CNDA': 'Concord Acquisition Corp II',
-    'SND': 'Smart Sand, Inc.',
-    'MNOV': 'MEDICINOVA INC',
-    'PBHC': 'Pathfinder Bancorp, Inc.',
-    'EVGR': 'Evergreen Corp',
-    'NMI': 'NUVEEN MUNICIPAL INCOME FUND INC',
-    'ENBP': 'ENB Financial Corp',
-    'IVAC': 'INTEVAC INC',
-    'TRX': 'TRX GOLD Corp',
-    'LSE': 'Leishen Energy Holding Co., Ltd.',
-    'GRWG': 'GrowGeneration Corp.',
-    'GLAC': 'Global Lights Acquisition Corp',
-    'CUE': 'Cue Biopharma, Inc.',
-    'BRID': 'BRIDGFORD FOODS CORP',
-    'GORV': 'Lazydays Holdings, Inc.',
-    'TLSA': 'Tiziana Life Sciences Ltd',
-    'DSAQ': 'Direct Selling Acquisition Corp.',
-    'GDL': 'GDL FUND',
-    'WRAP': 'WRAP TECHNOLOGIES, INC.',
-    'KF': 'KOREA FUND INC',
-    'HLP': 'Hongli Group Inc.',
-    'SY': 'So-Young International Inc.',
-    'ALXO': 'ALX ONCOLOGY HOLDINGS INC',
-    'AXTI': 'AXT INC',
-    'UTGN': 'UTG INC',
-    'BEOB': 'BEO BANCORP',
-    'QETA': 'Quetta Acquisition Corp',
-    'STIM': 'Neuronetics, Inc.',
-    'CMTV': 'COMMUNITY BANCORP /VT',
-    'SUNS': 'Sunrise Realty Trust, Inc.',
-    'CVVUF': 'CANALASKA URANIUM LTD',
-    'IVCA': 'Investcorp AI Acquisition Corp.',
-    'DYCQ': 'DT Cloud Acquisition Corp',
-    'ARAT': 'Arax Holdings Corp',
-    'CURI': 'CuriosityStream Inc.',
-    'MGYR': 'Magyar Bancorp, Inc.',
-    'RRGB': 'RED ROBIN GOURMET BURGERS INC',
-    'SNCR': 'SYNCHRONOSS TECHNOLOGIES INC',
-    'THM': 'INTERNATIONAL TOWER HILL MINES LTD',
-    'IMUX': 'IMMUNIC, INC.',
-    'BKHA': 'Black Hawk Acquisition Corp',
-    'SKLZ': 'Skillz Inc.',
-    'HNNA': 'HENNESSY ADVISORS INC',
-    'BCRD': 'BlueOne Card, Inc.',
-    'SCWO': '374Water Inc.',
-    'RFM': 'RiverNorth Flexible Municipal Income Fund, Inc.',
-    'RGLS': 'Regulus Therapeutics Inc.',
-    'ENTX': 'Entera Bio Ltd.',
-    'LTBR': 'LIGHTBRIDGE Corp',
-    'IROH': 'Iron Horse Acquisitions Corp.',
-    'PRPL': 'Purple Innovation, Inc.',
-    'PYXS': 'Pyxis Oncology, Inc.',
-    'PMHG': 'Prime Meridian Holding Co',
-    'MLSS': 'MILESTONE SCIENTIFIC INC.',
-    'MRSN': 'Mersana Therapeutics, Inc.',
-    'ALOT': 'AstroNova, Inc.',
-    'ATRA': 'Atara Biotherapeutics, Inc.',
-    'FKYS': 'FIRST KEYSTONE CORP',
-    'FFMGF': 'First Mining Gold Corp.',
-    'FSHP': 'Flag Ship Acquisition Corp',
-    'ALMU': 'Aeluma, Inc.',
-    'ADVM': 'Adverum Biotechnologies, Inc.',
-    'IHD': 'Voya Emerging Markets High Dividend Equity Fund',
-    'PRKR': 'PARKERVISION INC',
-    'DTSQ': 'DT Cloud Star Acquisition Corp',
-    'DM': 'Desktop Metal, Inc.',
-    'EAXR': 'Ealixir, Inc.',
-    'GNLX': 'GENELUX Corp',
-    'CMU': 'MFS HIGH YIELD MUNICIPAL TRUST',
-    'GNT': 'GAMCO Natural Resources, Gold & Income Trust',
-    'MSW': 'Ming Shing Group Holdings Ltd',
-    'PGP': 'PIMCO Global StocksPLUS & Income Fund',
-    'PAVS': 'Paranovus Entertainment Technology Ltd.',
-    'HSPO': 'Horizon Space Acquisition I Corp.',
-    'KPTI': 'Karyopharm Therapeutics Inc.',
-    'CHMI': 'Cherry Hill Mortgage Investment Corp',
-    'PWUP': 'PowerUp Acquisition Corp.',
-    'GUTS': 'FRACTYL HEALTH, INC.',
-    'FNWB': 'First Northwest Bancorp',
-    'BLGO': 'BIOLARGO, INC.',
-    'ZNOG': 'ZION OIL & GAS INC',
-    'FAT': 'Fat Brands, Inc',
-    'MAYS': 'MAYS J W INC',
-    'KLXE': 'KLX Energy Services Holdings, Inc.',
-    'GNTA': 'Genenta Science S.p.A.',
-    'GLU': 'GABELLI GLOBAL UTILITY & INCOME TRUST',
-    'TGLO': 'THEGLOBE COM INC',
-    'MHGU': 'MERITAGE HOSPITALITY GROUP INC',
-    'CNTY': 'CENTURY CASINOS INC /CO/',
-    'KNDI': 'Kandi Technologies Group, Inc.',
-    'AADI': 'Aadi Bioscience, Inc.',
-    'RVPH': 'REVIVA PHARMACEUTICALS HOLDINGS, INC.',
-    'LEE': 'LEE ENTERPRISES, Inc',
-    'THTX': 'Theratechnologies Inc.',
-    'HUHU': 'HUHUTECH International Group Inc.',
-    'SFDL': 'SECURITY FEDERAL CORP',
-    'BYNO': 'byNordic Acquisition Corp',
-    'ALTS': 'ALT5 Sigma Corp',
-    'STKS': 'ONE Group Hospitality, Inc.',
-    'IMAB': 'I-Mab',
-    'VGI': 'Virtus Global Multi-Sector Income Fund',
-    'MCHX': 'MARCHEX INC',
-    'AAWH': 'Ascend Wellness Holdings, Inc.',
-    'PFBX': 'PEOPLES FINANCIAL CORP /MS/',
-    'BRAG': 'Bragg Gaming Group Inc.',
-    'SFWL': 'SHENGFENG DEVELOPMENT Ltd',
-    'ADAG': 'Adagene Inc.',
-    'PTHL': 'Pheton Holdings Ltd',
-    'DIT': 'AMCON DISTRIBUTING CO',
-    'IXAQF': 'IX Acquisition Corp.',
-    'BLUAF': 'BlueRiver Acquisition Corp.',
-    'ALLK': 'Allakos Inc.',
-    'VMCA': 'Valuence Merger Corp. I',
-    'AIRE': 'reAlpha Tech Corp.',
-    'UNIB': 'UNIVERSITY BANCORP INC /DE/',
-    'EHGO': 'EShallGo Inc.',
-    'CBAT': 'CBAK Energy Technology, Inc.',
-    'VFF': 'Village Farms International, Inc.',
-    'INVE': 'Identiv, Inc.',
-    'CDAQF': 'Compass Digital Acquisition Corp.',
-    'IPSC': 'Century Therapeutics, Inc.',
-    'AITR': 'AI Transportation Acquisition Corp',
-    'IH': 'iHuman Inc.',
-    'MGRM': 'Monogram Technologies Inc.',
-    'VOC': 'VOC Energy Trust',
-    'GAN': 'GAN Ltd',
-    'NWPP': 'NEW PEOPLES BANKSHARES INC',
-    'GDO': 'WESTERN ASSET GLOBAL CORPORATE OPPORTUNITY FUND INC.',
-    'IMAQ': 'International Media Acquisition Corp.',
-    'RSKIA': 'GEORGE RISK INDUSTRIES, INC.',
-    'HBIO': 'HARVARD BIOSCIENCE INC',
-    'CAMP': 'Camp4 Therapeutics Corp',
-    'BLUE': 'bluebird bio, Inc.',
-    'NXC': 'NUVEEN CALIFORNIA SELECT TAX FREE INCOME PORTFOLIO',
-    'VTGN': 'Vistagen Therapeutics, Inc.',
-    'SKYE': 'Skye Bioscience, Inc.',
-    'SPWH': 'SPORTSMAN'S WAREHOUSE HOLDINGS, INC.',
-    'PUCK': 'Goal Acquisitions Corp.',
-    'PCM': 'PCM FUND, INC.',
-    'MYND': 'Mynd.ai, Inc.',
-    'SHIM': 'Shimmick Corp',
-    'TGAAF': 'Target Global Acquisition I Corp.',
-    'CNF': 'CNFinance Holdings Ltd.',
-    'CTOR': 'CITIUS ONCOLOGY, INC.',
-    'CHCI': 'Comstock Holding Companies, Inc.',
-    'JVSA': 'JVSPAC Acquisition Corp.',
-    'PTZH': 'Photozou Holdings, Inc.',
-    'ASPC': 'ASPAC III Acquisition Corp.',
-    'NIXX': 'Nixxy, Inc.',
-    'YHNA': 'YHN Acquisition I Ltd',
-    'SQNS': 'SEQUANS COMMUNICATIONS',
-    'IRAA': 'Iris Acquisition Corp',
-    'DERM': 'Journey Medical Corp',
-    'EURK': 'Eureka Acquisition Corp',
-    'SPGX': 'Sustainable Projects Group Inc.',
-    'ICLK': 'iClick Interactive Asia Group Ltd',
-    'UBCP': 'UNITED BANCORP INC /OH/',
-    'CNTX': 'Context Therapeutics Inc.',
-    'EDAP': 'EDAP TMS SA',
-    'PNI': 'PIMCO NEW YORK MUNICIPAL INCOME FUND II',
-    'MASS': '908 Devices Inc.',
-    'BKRRF': 'BLACKROCK SILVER CORP.',
-    'AUBN': 'AUBURN NATIONAL BANCORPORATION, INC',
-    'ITMSF': 'INTERMAP TECHNOLOGIES CORP',
-    'MNTN': 'Everest Consolidator Acquisition Corp',
-    'APLT': 'Applied Therapeutics, Inc.',
-    'CAPN': 'Cayson Acquisition Corp',
-    'FBYD': 'Falcon's Beyond Global, Inc.',
-    'FCO': 'ABRDN GLOBAL INCOME FUND, INC.',
-    'DTF': 'DTF TAX-FREE INCOME 2028 TERM FUND INC',
-    'EPIX': 'ESSA Pharma Inc.',
-    'SCTH': 'Securetech Innovations, Inc.',
-    'JEQ': 'ABRDN JAPAN EQUITY FUND, INC.',
-    'QNCX': 'Quince Therapeutics, Inc.',
-    'ASRT': 'Assertio Holdings, Inc.',
-    'ATMC': 'ALPHATIME ACQUISITION CORP',
-    'PED': 'PEDEVCO CORP',
-    'INCR': 'Intercure Ltd.',
-    'OCAX': 'OCA Acquisition Corp.',
-    'ORKT': 'ORANGEKLOUD TECHNOLOGY INC.',
-    'CEE': 'CENTRAL & EASTERN EUROPE FUND, INC.',
-    'INUV': 'Inuvo, Inc.',
-    'HOUR': 'Hour Loop, Inc',
-    'MSSA': 'Metal Sky Star Acquisition Corp',
-    'LSBK': 'LAKE SHORE BANCORP, INC.',
-    'USAU': 'U.S. GOLD CORP.',
-    'IRRX': 'INTEGRATED RAIL & RESOURCES ACQUISITION CORP',
-    'SNT': 'Senstar Technologies Corp',
-    'ELTK': 'ELTEK LTD',
-    'PYRGF': 'PyroGenesis Canada Inc.',
-    'ESP': 'ESPEY MFG & ELECTRONICS CORP',
-    'MGLD': 'Marygold Companies, Inc.',
-    'IROQ': 'IF Bancorp, Inc.',
-    'FVN': 'Future Vision II Acquisition Corp.',
-    'AUGG': 'AUGUSTA GOLD CORP.',
-    'ASYS': 'AMTECH SYSTEMS INC',
-    'GSIT': 'GSI TECHNOLOGY INC',
-    'IKNA': 'Ikena Oncology, Inc.',
-    'DMA': 'Destra Multi-Alternative Fund',
-    'RANI': 'Rani Therapeutics Holdings, Inc.',
-    'RDAC': 'Rising Dragon Acquisition Corp.',
-    'ACET': 'Adicet Bio, Inc.',
-    'CTM': 'Castellum, Inc.',
-    'PMVP': 'PMV Pharmaceuticals, Inc.',
-    'TPIC': 'TPI COMPOSITES, INC',
-    'GCV': 'GABELLI CONVERTIBLE & INCOME SECURITIES FUND INC',
-    'LASE': 'Laser Photonics Corp',
-    'RCFAF': 'Perception Capital Corp. IV',
-    'AVTX': 'Avalo Therapeutics, Inc.',
-    'EZOO': 'Ezagoo Ltd',
-    'ALAR': 'Alarum Technologies Ltd.',
-    'PHCI': 'Panamera Holdings Corp',
-    'AIRG': 'AIRGAIN INC',
-    'CLSD': 'Clearside Biomedical, Inc.',
-    'STG': 'Sunlands Technology Group',
-    'TETE': 'Technology & Telecommunication Acquisition Corp',
-    'AVAI': 'AVANT TECHNOLOGIES INC.',
-    'IOR': 'INCOME OPPORTUNITY REALTY INVESTORS INC /TX/',
-    'VTSI': 'VirTra, Inc',
-    'AVTE': 'Aerovate Therapeutics, Inc.',
-    'FUSB': 'FIRST US BANCSHARES, INC.',
-    'AGEN': 'AGENUS INC',
-    'ELRE': 'Yinfu Gold Corp.',
-    'VIGL': 'Vigil Neuroscience, Inc.',
-    'NSPR': 'InspireMD, Inc.',
-    'FFIE': 'FARADAY FUTURE INTELLIGENT ELECTRIC INC.',
-    'ACRG': 'American Clean Resources Group, Inc.',
-    'ANL': 'Adlai Nortye Ltd.',
-    'CVGI': 'Commercial Vehicle Group, Inc.',
-    'RBOT': 'Vicarious Surgical Inc.',
-    'ARMP': 'Armata Pharmaceuticals, Inc.',
-    'AURX': 'Nuo Therapeutics, Inc.',
-    'ICCM': 'IceCure Medical Ltd.',
-    'STBX': 'Starbox Group Holdings Ltd.',
-    'BNR': 'Burning Rock Biotech Ltd',
-    'OWLT': 'Owlet, Inc.',
-    'HGBL': 'Heritage Global Inc.',
-    'AEAE': 'AltEnergy Acquisition Corp',
-    'CATO': 'CATO CORP',
-    'CULP': 'CULP INC',
-    'CSLM': 'CSLM ACQUISITION CORP.',
-    'VLT': 'Invesco High Income Trust II',
-    'ANIX': 'Anixa Biosciences Inc',
-    'SGA': 'SAGA COMMUNICATIONS INC',
-    'CAHO': 'Caro Holdings Inc.',
-    'ABP': 'Abpro Holdings, Inc.',
-    'NMS': 'Nuveen Minnesota Quality Municipal Income Fund',
-    'VANI': 'Vivani Medical, Inc.',
-    'TBNK': 'Territorial Bancorp Inc.',
-    'SST': 'System1, Inc.',
-    'LSF': 'Laird Superfood, Inc.',
-    'SCLX': 'Scilex Holding Co',
-    'CEV': 'EATON VANCE CALIFORNIA MUNICIPAL INCOME TRUST',
-    'INO': 'INOVIO PHARMACEUTICALS, INC.',
-    'DWNX': 'DELHI BANK CORP',
-    'FAAS': 'DIGIASIA CORP.',
-    'CBUS': 'Cibus, Inc.',
-    'STI': 'Solidion Technology Inc.',
-    'GALT': 'GALECTIN THERAPEUTICS INC',
-    'KANP': 'KAANAPALI LAND LLC',
-    'GGROU': 'Golden Growers Cooperative',
-    'CTMX': 'CytomX Therapeutics, Inc.',
-    'MSCLF': 'Satellos Bioscience Inc.',
-    'UNCY': 'Unicycive Therapeutics, Inc.',
-    'USIO': 'Usio, Inc.',
-    'OSS': 'ONE STOP SYSTEMS, INC.',
-    'XTNT': 'Xtant Medical Holdings, Inc.',
-    'HYPR': 'Hyperfine, Inc.',
-    'GLXZ': 'Galaxy Gaming, Inc.',
-    'ICCH': 'ICC Holdings, Inc.',
-    'FMBM': 'F&M BANK CORP',
-    'VNJA': 'VANJIA CORP',
-    'VGZ': 'VISTA GOLD CORP',
-    'FDSB': 'Fifth District Bancorp, Inc.',
-    'NVAC': 'NorthView Acquisition Corp',
-    'FBLG': 'FibroBiologics, Inc.',
-    'OAKU': 'Oak Woods Acquisition Corp',
-    'ANVS': 'Annovis Bio, Inc.',
-    'SPHL': 'SPRINGVIEW HOLDINGS LTD',
-    'TISI': 'TEAM INC',
-    'GSHRF': 'GOLDSHORE RESOURCES INC.',
-    'BYFC': 'BROADWAY FINANCIAL CORP DE',
-    'NCSM': 'NCS Multistage Holdings, Inc.',
-    'MKFG': 'Markforged Holding Corp',
-    'INLF': 'INLIF Ltd',
-    'CCG': 'Cheche Group Inc.',
-    'GCEH': 'Global Clean Energy Holdings, Inc.',
-    'YTRA': 'Yatra Online, Inc.',
-    'HAIAF': 'Healthcare AI Acquisition Corp.',
-    'SLBK': 'Skyline Bankshares, Inc.',
-    'RGT': 'ROYCE GLOBAL TRUST, INC.',
-    'SRFM': 'SURF AIR MOBILITY INC.',
-    'AIRRF': 'Aurion Resources Ltd.',
-    'KOSS': 'KOSS CORP',
-    'ONCY': 'ONCOLYTICS BIOTECH INC',
-    'ORRCF': 'OROCO RESOURCE CORP',
-    'GLV': 'Clough Global Dividend & Income Fund',
-    'VATE': 'INNOVATE Corp.',
-    'RMTI': 'ROCKWELL MEDICAL, INC.',
-    'IQST': 'iQSTEL Inc',
-    'SNAL': 'Snail, Inc.',
-    'TGEN': 'TECOGEN INC.',
-    'MDBH': 'MDB Capital Holdings, LLC',
-    'GTI': 'GRAPHJET TECHNOLOGY',
-    'RFL': 'Rafael Holdings, Inc.',
-    'PRE': 'Prenetics Global Ltd',
-    'NVA': 'Nova Minerals Ltd',
-    'GWH': 'ESS Tech, Inc.',
-    'PGZ': 'Principal Real Estate Income Fund',
-    'ELTX': 'Elicio Therapeutics, Inc.',
-    'IAE': 'Voya Asia Pacific High Dividend Equity Income Fund',
-    'SLS': 'SELLAS Life Sciences Group, Inc.',
-    'WPRT': 'WESTPORT FUEL SYSTEMS INC.',
-    'OPAD': 'Offerpad Solutions Inc.',
-    'HPH': 'Highest Performances Holdings Inc.',
-    'BYSI': 'BeyondSpring Inc.',
-    'NB': 'NIOCORP DEVELOPMENTS LTD',
-    'LONCF': 'Loncor Gold Inc.',
-    'IMRX': 'Immuneering Corp',
-    'GSVRF': 'GUANAJUATO SILVER CO LTD',
-    'CPTP': 'CAPITAL PROPERTIES INC /RI/',
-    'FNGR': 'FingerMotion, Inc.',
-    'PYYX': 'PYXUS INTERNATIONAL, INC.',
-    'ANEB': 'Anebulo Pharmaceuticals, Inc.',
-    'CXH': 'MFS INVESTMENT GRADE MUNICIPAL TRUST',
-    'LRFC': 'Logan Ridge Finance Corp.',
-    'SUUN': 'SolarBank Corp',
-    'FMFG': 'Farmers & Merchants Bancshares, Inc.',
-    'PORT': 'Southport Acquisition Corp',
-    'GBIO': 'Generation Bio Co.',
-    'VNRX': 'VOLITIONRX LTD',
-    'QSEP': 'QS Energy, Inc.',
-    'MURA': 'Mural Oncology plc',
-    'MATH': 'Metalpha Technology Holding Ltd',
-    'HANNF': 'Hannan Metals Ltd.',
-    'WFCF': 'Where Food Comes From, Inc.',
-    'AUID': 'authID Inc.',
-    'WOK': 'WORK Medical Technology Group LTD',
-    'RCON': 'Recon Technology, Ltd',
-    'NEUP': 'Neuphoria Therapeutics Inc.',
-    'JUVF': 'JUNIATA VALLEY FINANCIAL CORP',
-    'FGEN': 'FIBROGEN INC',
-    'XTGRF': 'XTRA-GOLD RESOURCES CORP',
-    'RGC': 'Regencell Bioscience Holdings Ltd',
-    'FTCI': 'FTC Solar, Inc.',
-    'ASCBF': 'ASPAC II Acquisition Corp.',
-    'DTC': 'Solo Brands, Inc.',
-    'SMXT': 'SolarMax Technology, Inc.',
-    'LOAN': 'MANHATTAN BRIDGE CAPITAL, INC',
-    'FNVTF': 'Finnovate Acquisition Corp.',
-    'SOTK': 'SONO TEK CORP',
-    'APT': 'ALPHA PRO TECH LTD',
-    'FORA': 'Forian Inc.',
-    'LINK': 'INTERLINK ELECTRONICS INC',
-    'HLEO': 'Helio Corp /FL/',
-    'CLOE': 'Clover Leaf Capital Corp.',
-    'OPI': 'OFFICE PROPERTIES INCOME TRUST',
-    'SSHT': 'SSHT S&T Group Ltd.',
-    'NEUE': 'NeueHealth, Inc.',
-    'AOGO': 'Arogo Capital Acquisition Corp.',
-    'AREN': 'Arena Group Holdings, Inc.',
-    'PRTS': 'CarParts.com, Inc.',
-    'NVNI': 'Nvni Group Ltd',
-    'CRT': 'CROSS TIMBERS ROYALTY TRUST',
-    'IPWR': 'Ideal Power Inc.',
-    'MIMI': 'Mint Inc Ltd',
-    'APYX': 'Apyx Medical Corp',
-    'GANX': 'Gain Therapeutics, Inc.',
-    'GBBK': 'Global Blockchain Acquisition Corp.',
-    'VRCA': 'Verrica Pharmaceuticals Inc.',
-    'FGB': 'FIRST TRUST SPECIALTY FINANCE & FINANCIAL OPPORTUNITIES FUND',
-    'BMR': 'Beamr Imaging Ltd.',
-    'CNTB': 'Connect Biopharma Holdings Ltd',
-    'CCEL': 'CRYO CELL INTERNATIONAL INC',
-    'BGSF': 'BGSF, INC.',
-    'NSTS': 'NSTS Bancorp, Inc.',
-    'IMMX': 'Immix Biopharma, Inc.',
-    'BMTX': 'BM Technologies, Inc.',
-    'HOWL': 'Werewolf Therapeutics, Inc.',
-    'LBGJ': 'Li Bang International Corp Inc.',
-    'WAI': 'Top KingWin Ltd',
-    'TORO': 'TORO CORP.',
-    'MAQC': 'Maquia Capital Acquisition Corp',
-    'CIIT': 'Tianci International, Inc.',
-    'SUP': 'SUPERIOR INDUSTRIES INTERNATIONAL INC',
-    'BRAC': 'Broad Capital Acquisition Corp',
-    'ISPO': 'Inspirato Inc',
-    'FURY': 'FURY GOLD MINES LTD',
-    'OVID': 'Ovid Therapeutics Inc.',
-    'CBKM': 'CONSUMERS BANCORP INC /OH/',
-    'RSF': 'RiverNorth Capital & Income Fund, Inc.',
-    'LSB': 'LakeShore Biopharma Co., Ltd.',
-    'BAYA': 'Bayview Acquisition Corp',
-    'FKWL': 'FRANKLIN WIRELESS CORP',
-    'PNF': 'PIMCO NEW YORK MUNICIPAL INCOME FUND',
-    'PODC': 'PodcastOne, Inc.',
-    'AVNI': 'ARVANA INC',
-    'PRLD': 'Prelude Therapeutics Inc',
-    'KRON': 'Kronos Bio, Inc.',
-    'LOMLF': 'Lion One Metals Ltd.',
-    'BOTJ': 'BANK OF THE JAMES FINANCIAL GROUP INC',
-    'REFR': 'RESEARCH FRONTIERS INC',
-    'LOOP': 'Loop Industries, Inc.',
-    'JUSHF': 'Jushi Holdings Inc.',
-    'RAND': 'RAND CAPITAL CORP',
-    'SELF': 'Global Self Storage, Inc.',
-    'RPTX': 'Repare Therapeutics Inc.',
-    'BEAT': 'HeartBeam, Inc.',
-    'ESGL': 'ESGL Holdings Ltd',
-    'STCB': 'Starco Brands, Inc.',
-    'OTLK': 'Outlook Therapeutics, Inc.',
-    'UWHR': 'UWHARRIE CAPITAL CORP',
-    'CNVS': 'Cineverse Corp.',
-    'NVNO': 'enVVeno Medical Corp',
-    'JMM': 'Nuveen Multi-Market Income Fund',
-    'NRXP': 'NRX Pharmaceuticals, Inc.',
-    'UCL': 'uCloudlink Group Inc.',
-    'STTK': 'Shattuck Labs, Inc.',
-    'GROV': 'Grove Collaborative Holdings, Inc.',
-    'RDGL': 'VIVOS INC',
-    'FBIO': 'Fortress Biotech, Inc.',
-    'ANLDF': 'ANFIELD ENERGY INC.',
-    'CLIR': 'ClearSign Technologies Corp',
-    'CPBI': 'Central Plains Bancshares, Inc.',
-    'SELX': 'Semilux International Ltd.',
-    'CCTSF': 'Cactus Acquisition Corp. 1 Ltd',
-    'IOBT': 'IO Biotech, Inc.',
-    'ELPW': 'Elong Power Holding Ltd.',
-    'YYGH': 'YY Group Holding Ltd.',
-    'TYGO': 'TIGO ENERGY, INC.',
-    'SEOVF': 'SERNOVA CORP.',
-    'CVU': 'CPI AEROSTRUCTURES INC',
-    'XGN': 'EXAGEN INC.',
-    'SPRU': 'SPRUCE POWER HOLDING CORP',
-    'RTC': 'Baijiayun Group Ltd',
-    'SDIG': 'Stronghold Digital Mining, Inc.',
-    'MAIA': 'MAIA Biotechnology, Inc.',
-    'BUJA': 'Bukit Jalil Global Acquisition 1 Ltd.',
-    'MIND': 'MIND TECHNOLOGY, INC',
-    'AGFY': 'Agrify Corp',
-    'UMEWF': 'UMeWorld Ltd',
-    'RGS': 'REGIS CORP',
-    'GTMAY': 'GRUPO TMM SAB',
-    'MESA': 'MESA AIR GROUP INC',
-    'EEA': 'EUROPEAN EQUITY FUND, INC / MD',
-    'IVVD': 'Invivyd, Inc.',
-    'BCOW': '1895 Bancorp of Wisconsin, Inc. /MD/',
-    'INLX': 'INTELLINETICS, INC.',
-    'WAVE': 'Eco Wave Power Global AB (publ)',
-    'UONE': 'URBAN ONE, INC.',
-    'AIRT': 'AIR T INC',
-    'OPTN': 'OptiNose, Inc.',
-    'SACH': 'Sachem Capital Corp.',
-    'HCIL': 'Hongchang International Co., Ltd',
-    'BIRD': 'Allbirds, Inc.',
-    'BOLD': 'Boundless Bio, Inc.',
-    'TOP': 'TOP Financial Group Ltd',
-    'MOBQ': 'Mobiquity Technologies, Inc.',
-    'BEST': 'BEST Inc.',
-    'USEG': 'US ENERGY CORP',
-    'CLRC': 'ClimateRock',
-    'SAVEQ': 'Spirit Airlines, Inc.',
-    'SPRO': 'Spero Therapeutics, Inc.',
-    'BAFN': 'BayFirst Financial Corp.',
-    'PITA': 'Heramba Electric plc',
-    'LEVGQ': 'Lion Electric Co',
-    'AIXI': 'Xiao-I Corp',
-    'LITM': 'Snow Lake Resources Ltd.',
-    'WHEN': 'WORLD HEALTH ENERGY HOLDINGS, INC.',
-    'EMCG': 'Embrace Change Acquisition Corp.',
-    'MODD': 'Modular Medical, Inc.',
-    'NHTC': 'NATURAL HEALTH TRENDS CORP',
-    'RFAC': 'RF Acquisition Corp.',
-    'NINE': 'Nine Energy Service, Inc.',
-    'BHM': 'Bluerock Homes Trust, Inc.',
-    'GEG': 'Great Elm Group, Inc.',
-    'PDSB': 'PDS Biotechnology Corp',
-    'HRBR': 'HARBOR DIVERSIFIED, INC.',
-    'NUVR': 'Nuvera Communications, Inc.',
-    'AYRWF': 'Ayr Wellness Inc.',
-    'VNCE': 'VINCE HOLDING CORP.',
-    'BCHT': 'Birchtech Corp.',
-    'SWVL': 'Swvl Holdings Corp',
-    'ANGH': 'Anghami Inc',
-    'FTII': 'FutureTech II Acquisition Corp.',
-    'CTSO': 'Cytosorbents Corp',
-    'KSCP': 'Knightscope, Inc.',
-    'MDIA': 'Mediaco Holding Inc.',
-    'HYMC': 'HYCROFT MINING HOLDING CORP',
-    'BEDU': 'Bright Scholar Education Holdings Ltd',
-    'VYNE': 'VYNE Therapeutics Inc.',
-    'TNXP': 'Tonix Pharmaceuticals Holding Corp.',
-    'WWR': 'WESTWATER RESOURCES, INC.',
-    'AREC': 'American Resources Corp',
-    'MSAI': 'MultiSensor AI Holdings, Inc.',
-    'IDN': 'Intellicheck, Inc.',
-    'SPAI': 'Safe Pro Group Inc.',
-    'GODN': 'Golden Star Acquisition Corp',
-    'ALVR': 'Allovir, Inc.',
-    'FLNT': 'Fluent, Inc.',
-    'MPU': 'Mega Matrix Inc',
-    'GGAAF': 'NeuroMind AI Corp.',
-    'LATG': 'Chenghe Acquisition I Co.',
-    'ARKR': 'ARK RESTAURANTS CORP',
-    'AHT': 'ASHFORD HOSPITALITY TRUST INC',
-    'SYHBF': 'SKYHARBOUR RESOURCES LTD',
-    'BTTC': 'Bitech Technologies Corp',
-    'CLST': 'Catalyst Bancorp, Inc.',
-    'GEDC': 'CalEthos, Inc.',
-    'ACHL': 'Achilles Therapeutics plc',
-    'ALCY': 'Alchemy Investments Acquisition Corp 1',
-    'NTZ': 'NATUZZI S P A',
-    'DYAI': 'DYADIC INTERNATIONAL INC',
-    'XLO': 'Xilio Therapeutics, Inc.',
-    'OMIC': 'Singular Genomics Systems, Inc.',
-    'DHAI': 'DIH HOLDING US, INC.',
-    'LICY': 'Li-Cycle Holdings Corp.',
-    'BEEM': 'Beam Global',
-    'XPL': 'SOLITARIO RESOURCES CORP.',
-    'DGHI': 'Digihost Technology Inc.',
-    'INTZ': 'INTRUSION INC',
-    'MPIR': 'Empire Diversified Energy Inc',
-    'ICAD': 'ICAD INC',
-    'SYPR': 'SYPRIS SOLUTIONS INC',
-    'LUCD': 'Lucid Diagnostics Inc.',
-    'OM': 'Outset Medical, Inc.',
-    'FMY': 'FIRST TRUST MORTGAGE INCOME FUND',
-    'CCLD': 'CareCloud, Inc.',
-    'PVL': 'Permianville Royalty Trust',
-    'SHLT': 'SHL TELEMEDICINE LTD',
-    'MOBX': 'MOBIX LABS, INC',
-    'CLGN': 'CollPlant Biotechnologies Ltd',
-    'GLST': 'Global Star Acquisition Inc.',
-    'CELU': 'Celularity Inc',
-    'PVCT': 'PROVECTUS BIOPHARMACEUTICALS, INC.',
-    'PRT': 'PermRock Royalty Trust',
-    'TCBS': 'Texas Community Bancshares, Inc.',
-    'KZR': 'Kezar Life Sciences, Inc.',
-    'JANL': 'JANEL CORP',
-    'UG': 'UNITED GUARDIAN INC',
-    'FSI': 'FLEXIBLE SOLUTIONS INTERNATIONAL INC',
-    'NCEW': 'New Century Logistics (BVI) Ltd',
-    'ACFN': 'ACORN ENERGY, INC.',
-    'AP': 'AMPCO PITTSBURGH CORP',
-    'ZBAO': 'Zhibao Technology Inc.',
-    'AKOM': 'Aerkomm Inc.',
-    'DUOT': 'DUOS TECHNOLOGIES GROUP, INC.',
-    'FCUV': 'FOCUS UNIVERSAL INC.',
-    'NTRB': 'NutriBand Inc.',
-    'STAI': 'ScanTech AI Systems Inc.',
-    'AMPG': 'AmpliTech Group, Inc.',
-    'BDL': 'FLANIGANS ENTERPRISES INC',
-    'NRT': 'NORTH EUROPEAN OIL ROYALTY TRUST',
-    'SCYX': 'SCYNEXIS INC',
-    'RAPT': 'RAPT Therapeutics, Inc.',
-    'CDIX': 'Cardiff Lexington Corp',
-    'ITRM': 'Iterum Therapeutics plc',
-    'CRWS': 'CROWN CRAFTS INC',
-    'FPAY': 'FlexShopper, Inc.',
-    'VIVK': 'Vivakor, Inc.',
-    'ICCC': 'IMMUCELL CORP /DE/',
-    'BLAC': 'Bellevue Life Sciences Acquisition Corp.',
-    'WELNF': 'Integrated Wellness Acquisition Corp',
-    'NEHC': 'NEW ERA HELIUM INC.',
-    'HRGN': 'Harvard Apparatus Regenerative Technology, Inc.',
-    'OPHC': 'OptimumBank Holdings, Inc.',
-    'MNY': 'MoneyHero Ltd',
-    'FSEA': 'First Seacoast Bancorp, Inc.',
-    'MRMD': 'MARIMED INC.',
-    'MDAI': 'Spectral AI, Inc.',
-    'CFSB': 'CFSB Bancorp, Inc. /MA/',
-    'ZCMD': 'Zhongchao Inc.',
-    'LGCL': 'Lucas GC Ltd',
-    'FORL': 'Four Leaf Acquisition Corp',
-    'NXN': 'NUVEEN NEW YORK SELECT TAX -FREE INCOME PORTFOLIO',
-    'IGTA': 'Inception Growth Acquisition Ltd',
-    'LVLU': 'Lulu's Fashion Lounge Holdings, Inc.',
-    'HOLO': 'MicroCloud Hologram Inc.',
-    'IRD': 'Opus Genetics, Inc.',
-    'JUNE': 'Junee Ltd',
-    'SGRP': 'SPAR Group, Inc.',
-    'PPSI': 'PIONEER POWER SOLUTIONS, INC.',
-    'SER': 'Serina Therapeutics, Inc.',
-    'OPXS': 'Optex Systems Holdings Inc',
-    'INDO': 'Indonesia Energy Corp Ltd',
-    'LEAT': 'Leatt Corp',
-    'SYT': 'SYLA Technologies Co., Ltd.',
-    'BDCO': 'BLUE DOLPHIN ENERGY CO',
-    'ETST': 'Earth Science Tech, Inc.',
-    'KTCC': 'KEY TRONIC CORP',
-    'RPID': 'RAPID MICRO BIOSYSTEMS, INC.',
-    'ESHA': 'ESH Acquisition Corp.',
-    'TACT': 'TRANSACT TECHNOLOGIES INC',
-    'ATMV': 'AlphaVest Acquisition Corp.',
-    'GLLI': 'GLOBALINK INVESTMENT INC.',
-    'UNXP': 'United Express Inc.',
-    'GRCE': 'Grace Therapeutics, Inc.',
-    'ZEPP': 'Zepp Health Corp',
-    'ICMB': 'Investcorp Credit Management BDC, Inc.',
-    'PRMLF': 'Premium Resources Ltd.',
-    'YCQH': 'YCQH Agricultural Technology Co. Ltd',
-    'PXS': 'Pyxis Tankers Inc.',
-    'ASRV': 'AMERISERV FINANCIAL INC /PA/',
-    'YI': '111, Inc.',
-    'DTIL': 'PRECISION BIOSCIENCES INC',
-    'MLAC': 'Mountain Lake Acquisition Corp.',
-    'BTCS': 'BTCS Inc.',
-    'SSVFF': 'SOUTHERN SILVER EXPLORATION CORP',
-    'ESLA': 'Estrella Immunopharma, Inc.',
-    'BCG': 'Binah Capital Group, Inc.',
-    'OMCC': 'OLD MARKET CAPITAL Corp',
-    'INVU': 'Investview, Inc.',
-    'BRZH': 'Breeze Holdings Acquisition Corp.',
-    'VRAR': 'Glimpse Group, Inc.',
-    'WSTRF': 'Western Uranium & Vanadium Corp.',
-    'BODI': 'Beachbody Company, Inc.',
-    'PXLW': 'PIXELWORKS, INC',
-    'TECTP': 'Tectonic Financial, Inc.',
-    'BRNS': 'Barinthus Biotherapeutics plc.',
-    'DWSN': 'DAWSON GEOPHYSICAL CO',
-    'LDTC': 'LeddarTech Holdings Inc.',
-    'JRSH': 'Jerash Holdings (US), Inc.',
-    'DMYY': 'dMY Squared Technology Group, Inc.',
-    'TPST': 'Tempest Therapeutics, Inc.',
-    'WAVS': 'Western Acquisition Ventures Corp.',
-    'RNLXY': 'Renalytix plc',
-    'AITX': 'Artificial Intelligence Technology Solutions Inc.',
-    'LTRN': 'Lantern Pharma Inc.',
-    'BGFV': 'BIG 5 SPORTING GOODS Corp',
-    'ARBK': 'Argo Blockchain Plc',
-    'YOTA': 'Yotta Acquisition Corp',
-    'IZEA': 'IZEA Worldwide, Inc.',
-    'CLNN': 'Clene Inc.',
-    'BWEN': 'BROADWIND, INC.',
-    'MNDO': 'MIND CTI LTD',
-    'WYY': 'WIDEPOINT CORP',
-    'CALC': 'CalciMedica, Inc.',
-    'ONEG': 'OneConstruction Group Ltd',
-    'AGAE': 'Allied Gaming & Entertainment Inc.',
-    'SHOT': 'Safety Shot, Inc.',
-    'PASG': 'Passage BIO, Inc.',
-    'CASI': 'CASI Pharmaceuticals, Inc.',
-    'FGNV': 'FORGE INNOVATION DEVELOPMENT CORP.',
-    'RFIL': 'R F INDUSTRIES LTD',
-    'RDI': 'READING INTERNATIONAL INC',
-    'RIVF': 'Rivulet Entertainment, Inc.',
-    'ATNM': 'Actinium Pharmaceuticals, Inc.',
-    'ABLV': 'Able View Global Inc.',
-    'WINV': 'WinVest Acquisition Corp.',
-    'QTTB': 'Q32 Bio Inc.',
-    'DECA': 'Denali Capital Acquisition Corp.',
-    'CMMB': 'Chemomab Therapeutics Ltd.',
-    'WTMA': 'Welsbach Technology Metals Acquisition Corp.',
-    'FEAM': '5E Advanced Materials, Inc.',
-    'HSTC': 'HST Global, Inc.',
-    'DXR': 'DAXOR CORP',
-    'MALG': 'MICROALLIANCE GROUP INC.',
-    'SCNX': 'Scienture Holdings, Inc.',
-    'HFBL': 'Home Federal Bancorp, Inc. of Louisiana',
-    'OMGA': 'Omega Therapeutics, Inc.',
-    'BIVI': 'BIOVIE INC.',
-    'ELEV': 'Elevation Oncology, Inc.',
-    'SIDU': 'Sidus Space Inc.',
-    'GDST': 'Goldenstone Acquisition Ltd.',
-    'UURAF': 'Ucore Rare Metals Inc.',
-    'HKIT': 'HiTek Global Inc.',
-    'MCAG': 'Mountain Crest Acquisition Corp. V',
-    'OKYO': 'OKYO Pharma Ltd',
-    'TLF': 'TANDY LEATHER FACTORY INC',
-    'RLYB': 'Rallybio Corp',
-    'BHLL': 'Bunker Hill Mining Corp.',
-    'DSWL': 'DESWELL INDUSTRIES INC',
-    'BTCM': 'BIT Mining Ltd',
-    'LEXX': 'Lexaria Bioscience Corp.',
-    'RAYA': 'Erayak Power Solution Group Inc.',
-    'OCC': 'OPTICAL CABLE CORP',
-    'RAVE': 'RAVE RESTAURANT GROUP, INC.',
-    'ANTX': 'AN2 Therapeutics, Inc.',
-    'GIFT': 'GIFTIFY, INC.',
-    'HHS': 'HARTE HANKS INC',
-    'GRF': 'EAGLE CAPITAL GROWTH FUND, INC.',
-    'DALN': 'DallasNews Corp',
-    'LQMT': 'LIQUIDMETAL TECHNOLOGIES INC',
-    'NXL': 'Nexalin Technology, Inc.',
-    'ITHUF': 'iANTHUS CAPITAL HOLDINGS, INC.',
-    'SOHO': 'Sotherly Hotels Inc.',
-    'FARM': 'FARMER BROTHERS CO',
-    'SRZN': 'Surrozen, Inc./DE',
-    'SJ': 'Scienjoy Holding Corp',
-    'SNYR': 'Synergy CHC Corp.',
-    'HTCR': 'HeartCore Enterprises, Inc.',
-    'CENN': 'Cenntro Inc.',
-    'MOVE': 'Movano Inc.',
-    'CUBA': 'HERZFELD CARIBBEAN BASIN FUND INC',
-    'MKZR': 'MacKenzie Realty Capital, Inc.',
-    'EBON': 'Ebang International Holdings Inc.',
-    'FRLA': 'Fortune Rise Acquisition Corp',
-    'BRFH': 'BARFRESH FOOD GROUP INC.',
-    'SABS': 'SAB Biotherapeutics, Inc.',
-    'RAIN': 'Rain Enhancement Technologies Holdco, Inc.',
-    'HSON': 'Hudson Global, Inc.',
-    'SFRX': 'SEAFARER EXPLORATION CORP',
-    'TURN': '180 DEGREE CAPITAL CORP. /NY/',
-    'AERT': 'Aeries Technology, Inc.',
-    'JG': 'Aurora Mobile Ltd',
-    'OCX': 'Oncocyte Corp',
-    'DIST': 'Distoken Acquisition Corp',
-    'INTE': 'Integral Acquisition Corp 1',
-    'MXE': 'MEXICO EQUITY & INCOME FUND INC',
-    'DEFG': 'Grayscale Decentralized Finance (DeFi) Fund LLC',
-    'ORIS': 'ORIENTAL RISE HOLDINGS Ltd',
-    'SOND': 'Sonder Holdings Inc.',
-    'VTVT': 'vTv Therapeutics Inc.',
-    'ENZ': 'ENZO BIOCHEM INC',
-    'VSTE': 'Vast Renewables Ltd',
-    'EGF': 'BlackRock Enhanced Government Fund, Inc.',
-    'CRCUF': 'Canagold Resources Ltd.',
-    'ZDGE': 'Zedge, Inc.',
-    'MTC': 'MMTec, Inc.',
-    'ECDA': 'ECD Automotive Design, Inc.',
-    'NMTC': 'NEUROONE MEDICAL TECHNOLOGIES Corp',
-    'LGL': 'LGL GROUP INC',
-    'PBBK': 'PB Bankshares, Inc.',
-    'WBQNL': 'Woodbridge Liquidation Trust',
-    'SVRSF': 'Silver Storm Mining Ltd.',
-    'KORE': 'KORE Group Holdings, Inc.',
-    'FOXX': 'Foxx Development Holdings Inc.',
-    'AUSI': 'AURA SYSTEMS INC',
-    'HBUV': 'Hubilu Venture Corp',
-    'SVMH': 'SRIVARU Holding Ltd',
-    'BIOF': 'BLUE BIOFUELS, INC.',
-    'SURG': 'SurgePays, Inc.',
-    'ISDR': 'ISSUER DIRECT CORP',
-    'PMN': 'ProMIS Neurosciences Inc.',
-    'CLOQ': 'CYBERLOQ TECHNOLOGIES, INC.',
-    'MASK': '3 E Network Technology Group Ltd',
-    'MTEN': 'Mingteng International Corp Inc.',
-    'CXAI': 'CXApp Inc.',
-    'AWRE': 'AWARE INC /MA/',
-    'CBSTF': 'Cannabist Co Holdings Inc.',
-    'TZUP': 'THUMZUP MEDIA Corp',
-    'CWPE': 'CW Petroleum Corp',
-    'SKKY': 'Skkynet Cloud Systems, Inc.',
-    'GDTC': 'CytoMed Therapeutics Ltd',
-    'FGL': 'Founder Group Ltd',
-    'CPIX': 'CUMBERLAND PHARMACEUTICALS INC',
-    'FTHM': 'Fathom Holdings Inc.',
-    'AGMH': 'AGM GROUP HOLDINGS, INC.',
-    'MBOT': 'Microbot Medical Inc.',
-    'GFGSF': 'GFG Resources Inc.',
-    'GLE': 'Global Engine Group Holding Ltd',
-    'TRSG': 'Tungray Technologies Inc',
-    'MLEC': 'Moolec Science SA',
-    'WCT': 'Wellchange Holdings Co Ltd',
-    'DTST': 'Data Storage Corp',
-    'GROW': 'U S GLOBAL INVESTORS INC',
-    'BTM': 'Bitcoin Depot Inc.',
-    'PYN': 'PIMCO NEW YORK MUNICIPAL INCOME FUND III',
-    'TOPS': 'TOP SHIPS INC.',
-    'AXREF': 'AMARC RESOURCES LTD',
-    'RENT': 'Rent the Runway, Inc.',
-    'RNXT': 'RenovoRx, Inc.',
-    'NXPL': 'NextPlat Corp',
-    'NTIP': 'NETWORK-1 TECHNOLOGIES, INC.',
-    'BNIX': 'Bannix Acquisition Corp.',
-    'IXHL': 'Incannex Healthcare Inc.',
-    'SODI': 'SOLITRON DEVICES INC',
-    'KALA': 'KALA BIO, Inc.',
-    'PXPC': 'Phoenix Plus Corp.',
-    'DRIO': 'DarioHealth Corp.',
-    'INTS': 'INTENSITY THERAPEUTICS, INC.',
-    'CRMZ': 'CREDITRISKMONITOR COM INC',
-    'BNGO': 'Bionano Genomics, Inc.',
-    'AKTX': 'Akari Therapeutics Plc',
-    'RVSN': 'Rail Vision Ltd.',
-    'KPEA': 'Kun Peng International Ltd.',
-    'XBP': 'XBP Europe Holdings, Inc.',
-    'MDCX': 'Medicus Pharma Ltd.',
-    'MTBLY': 'Moatable, Inc.',
-    'AAQL': 'Antiaging Quantum Living Inc.',
-    'CGTX': 'COGNITION THERAPEUTICS INC',
-    'ONMD': 'OneMedNet Corp',
-    'LSTA': 'LISATA THERAPEUTICS, INC.',
-    'CIF': 'MFS INTERMEDIATE HIGH INCOME FUND',
-    'GEVI': 'General Enterprise Ventures, Inc.',
-    'WKHS': 'Workhorse Group Inc.',
-    'MOGO': 'Mogo Inc.',
-    'FTEK': 'FUEL TECH, INC.',
-    'BCAB': 'BioAtla, Inc.',
-    'NTWK': 'NETSOL TECHNOLOGIES INC',
-    'LUNA': 'LUNA INNOVATIONS INC',
-    'NDLS': 'NOODLES & Co',
-    'AACG': 'ATA Creativity Global',
-    'AAME': 'ATLANTIC AMERICAN CORP',
-    'CTXR': 'Citius Pharmaceuticals, Inc.',
-    'SCOR': 'COMSCORE, INC.',
-    'POCI': 'PRECISION OPTICS CORPORATION, INC.',
-    'CLPS': 'CLPS Inc',
-    'EDRY': 'EuroDry Ltd.',
-    'APWC': 'ASIA PACIFIC WIRE & CABLE CORP LTD',
-    'PRKA': 'PARKS AMERICA, INC',
-    'AXDX': 'Accelerate Diagnostics, Inc',
-    'TPCS': 'TECHPRECISION CORP',
-    'JETMF': 'Global Crossing Airlines Group Inc.',
-    'SWIN': 'Solowin Holdings, Ltd.',
-    'COCH': 'Envoy Medical, Inc.',
-    'VPLM': 'Voip-pal.com Inc',
-    'CVM': 'CEL SCI CORP',
-    'IGXT': 'IntelGenx Technologies Corp.',
-    'ZOOZ': 'ZOOZ Power Ltd.',
-    'MRNS': 'MARINUS PHARMACEUTICALS, INC.',
-    'GVXXF': 'GoviEx Uranium Inc.',
-    'UBX': 'Unity Biotechnology, Inc.',
-    'MRKR': 'Marker Therapeutics, Inc.',
-    'SLGL': 'Sol-Gel Technologies Ltd.',
-    'XCUR': 'EXICURE, INC.',
-    'IPW': 'iPower Inc.',
-    'HYFM': 'HYDROFARM HOLDINGS GROUP, INC.',
-    'AQU': 'Aquaron Acquisition Corp.',
-    'SPAZF': 'SPANISH MOUNTAIN GOLD LTD.',
-    'MTEK': 'Maris Tech Ltd.',
-    'SFCO': 'Southern Financial Corp',
-    'BATL': 'BATTALION OIL CORP',
-    'GP': 'GREENPOWER MOTOR Co INC.',
-    'PCSV': 'PCS Edventures!, Inc.',
-    'VVOS': 'Vivos Therapeutics, Inc.',
-    'ATHE': 'ALTERITY THERAPEUTICS LTD',
-    'CVKD': 'Cadrenal Therapeutics, Inc.',
-    'PGHL': 'Primega Group Holdings Ltd',
-    'PMEC': 'Primech Holdings Ltd',
-    'MBBC': 'Marathon Bancorp, Inc. /MD/',
-    'WKSP': 'Worksport Ltd',
-    'INTG': 'INTERGROUP CORP',
-    'BGI': 'BIRKS GROUP INC.',
-    'XOS': 'Xos, Inc.',
-    'BNAI': 'Brand Engagement Network Inc.',
-    'HUIZ': 'Huize Holding Ltd',
-    'ITXXF': 'Itaconix Plc',
-    'FENG': 'Phoenix New Media Ltd',
-    'CRIS': 'CURIS INC',
-    'KPLT': 'Katapult Holdings, Inc.',
-    'LIVE': 'LIVE VENTURES Inc',
-    'GORO': 'GOLD RESOURCE CORP',
-    'INKT': 'MiNK Therapeutics, Inc.',
-    'GLGI': 'GREYSTONE LOGISTICS, INC.',
-    'JZ': 'Jianzhi Education Technology Group Co Ltd',
-    'FLUX': 'Flux Power Holdings, Inc.',
-    'TURB': 'Turbo Energy, S.A.',
-    'XAIR': 'Beyond Air, Inc.',
-    'CDIO': 'Cardio Diagnostics Holdings, Inc.',
-    'VRME': 'VerifyMe, Inc.',
-    'AGXPF': 'SILVER X MINING CORP.',
-    'CREX': 'CREATIVE REALITIES, INC.',
-    'GAME': 'GameSquare Holdings, Inc.',
-    'SVT': 'SERVOTRONICS INC /DE/',
-    'GLBS': 'GLOBUS MARITIME LTD',
-    'ROLR': 'High Roller Technologies, Inc.',
-    'PWM': 'Prestige Wealth Inc.',
-    'MTEX': 'MANNATECH INC',
-    'GFAI': 'Guardforce AI Co., Ltd.',
-    'ANY': 'Sphere 3D Corp.',
-    'VWFB': 'VWF Bancorp, Inc.',
-    'SPI': 'SPI Energy Co., Ltd.',
-    'DTCK': 'DAVIS COMMODITIES Ltd',
-    'QNTO': 'QUAINT OAK BANCORP INC',
-    'DYNR': 'DYNARESOURCE, INC.',
-    'OESX': 'ORION ENERGY SYSTEMS, INC.',
-    'CNXX': 'CONX Corp.',
-    'MDWK': 'MDWerks, Inc.',
-    'BANL': 'CBL International Ltd',
-    'COOT': 'Australian Oilseeds Holdings Ltd',
-    'HUDA': 'Hudson Acquisition I Corp.',
-    'VHC': 'VirnetX Holding Corp',
-    'EMKR': 'EMCORE CORP',
-    'NSYS': 'NORTECH SYSTEMS INC',
-    'HMBL': 'HUMBL, INC.',
-    'DZSI': 'DZS INC.',
-    'PMAX': 'Powell Max Ltd',
-    'SAG': 'SAG Holdings Ltd',
-    'CNFN': 'CFN Enterprises Inc.',
-    'NOM': 'NUVEEN MISSOURI QUALITY MUNICIPAL INCOME FUND',
-    'IRME': 'IR-Med, Inc.',
-    'DARE': 'Dare Bioscience, Inc.',
-    'LIDR': 'AEye, Inc.',
-    'AXIL': 'Axil Brands, Inc.',
-    'CMBM': 'Cambium Networks Corp',
-    'IRIX': 'IRIDEX CORP',
-    'NISN': 'Nisun International Enterprise Development Group Co., Ltd',
-    'APHP': 'American Picture House Corp',
-    'EQMEF': 'Equity Metals Corp',
-    'SKYQ': 'Sky Quarry Inc.',
-    'CTRM': 'Castor Maritime Inc.',
-    'MOB': 'Mobilicom Ltd',
-    'IGC': 'IGC Pharma, Inc.',
-    'NAHD': 'New Asia Holdings, Inc.',
-    'ABCP': 'AmBase Corp',
-    'CODX': 'Co-Diagnostics, Inc.',
-    'LITB': 'LightInTheBox Holding Co., Ltd.',
-    'LGVN': 'Longeveron Inc.',
-    'BLRX': 'BioLineRx Ltd.',
-    'SFHG': 'SAMFINE CREATION HOLDINGS GROUP Ltd',
-    'JOB': 'GEE Group Inc.',
-    'IEHC': 'IEH Corp',
-    'PTN': 'PALATIN TECHNOLOGIES INC',
-    'MXC': 'MEXCO ENERGY CORP',
-    'GTIM': 'Good Times Restaurants Inc.',
-    'FCCI': 'FAST CASUAL CONCEPTS, INC.',
-    'NAII': 'NATURAL ALTERNATIVES INTERNATIONAL INC',
-    'MHUBF': 'MineHub Technologies Inc.',
-    'AMOD': 'ALPHA MODUS HOLDINGS, INC.',
-    'LPCN': 'Lipocine Inc.',
-    'LRE': 'LEAD REAL ESTATE CO., LTD',
-    'CETI': 'Cyber Enviro-Tech, Inc.',
-    'PAYD': 'PAID INC',
-    'NAAS': 'NaaS Technology Inc.',
-    'UTSI': 'UTSTARCOM HOLDINGS CORP.',
-    'GTEC': 'Greenland Technologies Holding Corp.',
-    'SOWG': 'Sow Good Inc.',
-    'LVTX': 'LAVA Therapeutics NV',
-    'HOOK': 'HOOKIPA Pharma Inc.',
-    'EPOW': 'Sunrise New Energy Co., Ltd.',
-    'ENLV': 'Enlivex Therapeutics Ltd.',
-    'DRCT': 'Direct Digital Holdings, Inc.',
-    'FGF': 'Fundamental Global Inc.',
-    'DAIO': 'DATA I/O CORP',
-    'TMRC': 'Texas Mineral Resources Corp.',
-    'EQ': 'Equillium, Inc.',
-    'TRT': 'TRIO-TECH INTERNATIONAL',
-    'OXBR': 'OXBRIDGE RE HOLDINGS Ltd',
-    'ELBM': 'Electra Battery Materials Corp',
-    'LCGMF': 'LION COPPER & GOLD CORP.',
-    'FEMY': 'FEMASYS INC',
-    'IBIO': 'iBio, Inc.',
-    'DRRX': 'DURECT CORP',
-    'MSS': 'Maison Solutions Inc.',
-    'CHR': 'Cheer Holding, Inc.',
-    'NGLD': 'Nevada Canyon Gold Corp.',
-    'BNRG': 'Brenmiller Energy Ltd.',
-    'PZG': 'Paramount Gold Nevada Corp.',
-    'HGTXU': 'HUGOTON ROYALTY TRUST',
-    'TRAW': 'Traws Pharma, Inc.',
-    'NYC': 'American Strategic Investment Co.',
-    'UCAR': 'U Power Ltd',
-    'PRZO': 'ParaZero Technologies Ltd.',
-    'NRSN': 'NeuroSense Therapeutics Ltd.',
-    'KFFB': 'Kentucky First Federal Bancorp',
-    'HUDI': 'Huadi International Group Co., Ltd.',
-    'CVV': 'CVD EQUIPMENT CORP',
-    'MMTIF': 'MICROMEM TECHNOLOGIES INC',
-    'HCMC': 'Healthier Choices Management Corp.',
-    'SMSI': 'SMITH MICRO SOFTWARE, INC.',
-    'CNTM': 'ConnectM Technology Solutions, Inc.',
-    'RAY': 'Raytech Holding Ltd',
-    'KLNG': 'Koil Energy Solutions, Inc.',
-    'CKX': 'CKX LANDS, INC.',
-    'CPSH': 'CPS TECHNOLOGIES CORP/DE/',
-    'SCIA': 'SCI Engineered Materials, Inc.',
-    'WLGS': 'WANG & LEE GROUP, Inc.',
-    'LRDC': 'Laredo Oil, Inc.',
-    'LUDG': 'LUDWIG ENTERPRISES, INC.',
-    'RSRV': 'RESERVE PETROLEUM CO',
-    'HOVR': 'New Horizon Aircraft Ltd.',
-    'PSHG': 'Performance Shipping Inc.',
-    'NRDE': 'NU RIDE INC.',
-    'XELA': 'Exela Technologies, Inc.',
-    'BSGM': 'BioSig Technologies, Inc.',
-    'TOON': 'Kartoon Studios, Inc.',
-    'PLUR': 'Pluri Inc.',
-    'VCIG': 'VCI Global Ltd',
-    'NXGL': 'NEXGEL, INC.',
-    'REED': 'REED'S, INC.',
-    'COCP': 'Cocrystal Pharma, Inc.',
-    'IINN': 'Inspira Technologies OXY B.H.N. Ltd',
-    'GRYP': 'Gryphon Digital Mining, Inc.',
-    'TRIB': 'TRINITY BIOTECH PLC',
-    'OCG': 'Oriental Culture Holding LTD',
-    'MKTW': 'MARKETWISE, INC.',
-    'IHT': 'INNSUITES HOSPITALITY TRUST',
-    'ONEI': 'OneMeta Inc.',
-    'ZKIN': 'ZK International Group Co., Ltd.',
-    'SYNX': 'Silynxcom Ltd.',
-    'TOI': 'Oncology Institute, Inc.',
-    'TOMZ': 'TOMI Environmental Solutions, Inc.',
-    'AIFU': 'AIX Inc.',
-    'INAB': 'IN8BIO, INC.',
-    'SIF': 'SIFCO INDUSTRIES INC',
-    'HUSA': 'HOUSTON AMERICAN ENERGY CORP',
-    'CRVW': 'CareView Communications Inc',
-    'NXTC': 'NextCure, Inc.',
-    'FRSX': 'Foresight Autonomous Holdings Ltd.',
-    'DFLI': 'Dragonfly Energy Holdings Corp.',
-    'RVP': 'RETRACTABLE TECHNOLOGIES INC',
-    'KENS': 'KENILWORTH SYSTEMS CORP',
-    'SHFS': 'SHF Holdings, Inc.',
-    'CHKR': 'CHESAPEAKE GRANITE WASH TRUST',
-    'ZBAI': 'ATIF Holdings Ltd',
-    'PULM': 'Pulmatrix, Inc.',
-    'OCEA': 'Ocean Biomedical, Inc.',
-    'GDC': 'GD Culture Group Ltd',
-    'MFON': 'MOBIVITY HOLDINGS CORP.',
-    'CARA': 'Cara Therapeutics, Inc.',
-    'BTCT': 'BTC Digital Ltd.',
-    'GELS': 'Gelteq Ltd',
-    'SLNH': 'Soluna Holdings, Inc',
-    'JSDA': 'JONES SODA CO',
-    'ATHA': 'Athira Pharma, Inc.',
-    'BKUCF': 'BLUE SKY URANIUM CORP.',
-    'LSH': 'Lakeside Holding Ltd',
-    'HUBC': 'Hub Cyber Security Ltd.',
-    'GOVX': 'GeoVax Labs, Inc.',
-    'TENX': 'TENAX THERAPEUTICS, INC.',
-    'JVA': 'COFFEE HOLDING CO INC',
-    'MCVT': 'Mill City Ventures III, Ltd',
-    'KIRK': 'KIRKLAND'S, INC',
-    'BOSC': 'BOS BETTER ONLINE SOLUTIONS LTD',
-    'CETY': 'Clean Energy Technologies, Inc.',
-    'FEDU': 'Four Seasons Education (Cayman) Inc.',
-    'INIS': 'INTERNATIONAL ISOTOPES INC',
-    'KUKE': 'Kuke Music Holding Ltd',
-    'PYPD': 'PolyPid Ltd.',
-    'LTCH': 'Latch, Inc.',
-    'CCTG': 'CCSC Technology International Holdings Ltd',
-    'EZFL': 'EzFill Holdings Inc',
-    'RMCF': 'Rocky Mountain Chocolate Factory, Inc.',
-    'ASPS': 'ALTISOURCE PORTFOLIO SOLUTIONS S.A.',
-    'RNGE': 'RANGE IMPACT, INC.',
-    'STEC': 'Santech Holdings Ltd',
-    'PGTK': 'Pacific Green Technologies Inc.',
-    'FEBO': 'Fenbo Holdings Ltd',
-    'CDTG': 'CDT Environmental Technology Investment Holdings Ltd',
-    'INHD': 'INNO HOLDINGS INC.',
-    'VSEE': 'VSEE HEALTH, INC.',
-    'MLGO': 'MicroAlgo Inc.',
-    'GNRV': 'GRAND RIVER COMMERCE INC',
-    'YTFD': 'Yale Transaction Finders, Inc.',
-    'KITT': 'Nauticus Robotics, Inc.',
-    'IBO': 'IMPACT BIOMEDICAL INC.',
-    'MIRA': 'MIRA PHARMACEUTICALS, INC.',
-    'BOLT': 'Bolt Biotherapeutics, Inc.',
-    'WRPT': 'WARPSPEED TAXI INC.',
-    'ATER': 'Aterian, Inc.',
-    'NMEX': 'NORTHERN MINERALS & EXPLORATION LTD.',
-    'CXXIF': 'C21 Investments Inc.',
-    'CCM': 'Concord Medical Services Holdings Ltd',
-    'RMSG': 'Real Messenger Corp',
-    'LTRPA': 'Liberty TripAdvisor Holdings, Inc.',
-    'CYTH': 'Cyclo Therapeutics, Inc.',
-    'APRE': 'Aprea Therapeutics, Inc.',
-    'WETH': 'Wetouch Technology Inc.',
-    'BASA': 'BASANITE, INC.',
-    'AMS': 'AMERICAN SHARED HOSPITAL SERVICES',
-    'PUBC': 'PureBase Corp',
-    'VASO': 'VASO Corp',
-    'DPRO': 'Draganfly Inc.',
-    'GYRO': 'Gyrodyne, LLC',
-    'EQTRF': 'Altamira Gold Corp.',
-    'GWSO': 'Global Warming Solutions, Inc.',
-    'MOGU': 'MOGU Inc.',
-    'XITO': 'Xenous Holdings, Inc.',
-    'PETV': 'PetVivo Holdings, Inc.',
-    'LNBY': 'Landbay Inc',
-    'AIFF': 'FIREFLY NEUROSCIENCE, INC.',
-    'SUND': 'Sundance Strategies, Inc.',
-    'EVTV': 'Envirotech Vehicles, Inc.',
-    'NNVC': 'NANOVIRICIDES, INC.',
-    'AFMD': 'Affimed N.V.',
-    'BLIN': 'Bridgeline Digital, Inc.',
-    'OMEX': 'ODYSSEY MARINE EXPLORATION INC',
-    'WNDW': 'SolarWindow Technologies, Inc.',
-    'COHN': 'Cohen & Co Inc.',
-    'SOS': 'SOS Ltd',
-    'SDOT': 'Sadot Group Inc.',
-    'CLRO': 'CLEARONE INC',
-    'SPCB': 'SuperCom Ltd',
-    'CARM': 'Carisma Therapeutics Inc.',
-    'GREE': 'Greenidge Generation Holdings Inc.',
-    'CAPT': 'Captivision Inc.',
-    'ELSE': 'ELECTRO SENSORS INC',
-    'GIGM': 'GIGAMEDIA Ltd',
-    'EDTK': 'Skillful Craftsman Education Technology Ltd',
-    'RAPH': 'Raphael Pharmaceutical Inc.',
-    'NITO': 'N2OFF, Inc.',
-    'CWBHF': 'Charlotte's Web Holdings, Inc.',
-    'IZM': 'ICZOOM Group Inc.',
-    'PFSB': 'PFS Bancorp, Inc.',
-    'YYAI': 'Connexa Sports Technologies Inc.',
-    'PLAG': 'Planet Green Holdings Corp.',
-    'BTAI': 'BioXcel Therapeutics, Inc.',
-    'NWGL': 'Nature Wood Group Ltd',
-    'BFRG': 'BullFrog AI Holdings, Inc.',
-    'YHC': 'LQR House Inc.',
-    'NXTT': 'Next Technology Holding Inc.',
-    'CLIK': 'Click Holdings Ltd.',
-    'LOCL': 'Local Bounti Corporation/DE',
-    'SNTI': 'Senti Biosciences, Inc.',
-    'JFU': '9F Inc.',
-    'AASP': 'GLOBAL ACQUISITIONS Corp',
-    'XTKG': 'X3 Holdings Co., Ltd.',
-    'NNUP': 'NOCOPI TECHNOLOGIES INC/MD/',
-    'IPM': 'INTELLIGENT PROTECTION MANAGEMENT CORP.',
-    'WVVI': 'WILLAMETTE VALLEY VINEYARDS INC',
-    'RCG': 'RENN Fund, Inc.',
-    'ZEOX': 'Zeo ScientifiX, Inc.',
-    'BCTX': 'BriaCell Therapeutics Corp.',
-    'MTVA': 'MetaVia Inc.',
-    'MEIP': 'MEI Pharma, Inc.',
-    'WNLV': 'Winvest Group Ltd',
-    'RETO': 'ReTo Eco-Solutions, Inc.',
-    'BHV': 'BLACKROCK VIRGINIA MUNICIPAL BOND TRUST',
-    'JDZG': 'JIADE Ltd',
-    'MGIH': 'Millennium Group International Holdings Ltd',
-    'GLXG': 'Galaxy Payroll Group Ltd',
-    'AIEV': 'Thunder Power Holdings, Inc.',
-    'RLBY': 'RELIABILITY INC',
-    'GEBRF': 'Greenbriar Sustainable Living Inc.',
-    'DUO': 'Fangdd Network Group Ltd.',
-    'SONM': 'SONIM TECHNOLOGIES INC',
-    'EKSO': 'EKSO BIONICS HOLDINGS, INC.',
-    'NRXS': 'Neuraxis, INC',
-    'HITC': 'Healthcare Integrated Technologies Inc.',
-    'NXU': 'Nxu, Inc.',
-    'CRVO': 'CervoMed Inc.',
-    'LIQT': 'LIQTECH INTERNATIONAL INC',
-    'SPPL': 'SIMPPLE LTD.',
-    'GRFX': 'Graphex Group Ltd',
-    'DEVS': 'DevvStream Corp.',
-    'CRTG': 'CORETEC GROUP INC.',
-    'JCTC': 'JEWETT CAMERON TRADING CO LTD',
-    'GLYC': 'GLYCOMIMETICS INC',
-    'MNTS': 'Momentus Inc.',
-    'CLDI': 'Calidi Biotherapeutics, Inc.',
-    'HCWC': 'HEALTHY CHOICE WELLNESS CORP.',
-    'MDRR': 'Medalist Diversified REIT, Inc.',
-    'NKGN': 'NKGen Biotech, Inc.',
-    'SAIH': 'SAIHEAT Ltd',
-    'SGLA': 'Sino Green Land Corp.',
-    'GLAI': 'Global AI, Inc.',
-    'CPOP': 'Pop Culture Group Co., Ltd',
-    'HCWB': 'HCW Biologics Inc.',
-    'TBTC': 'TABLE TRAC INC',
-    'SYBX': 'SYNLOGIC, INC.',
-    'MIGI': 'Mawson Infrastructure Group Inc.',
-    'BBGI': 'BEASLEY BROADCAST GROUP INC',
-    'LOBO': 'LOBO EV TECHNOLOGIES LTD',
-    'BFNH': 'BIOFORCE NANOSCIENCES HOLDINGS, INC.',
-    'JL': 'J-Long Group Ltd',
-    'LFWD': 'Lifeward Ltd.',
-    'LYT': 'Lytus Technologies Holdings PTV. Ltd.',
-    'GOEV': 'Canoo Inc.',
-    'GLBZ': 'GLEN BURNIE BANCORP',
-    'FLGC': 'Flora Growth Corp.',
-    'LNKS': 'Linkers Industries Ltd',
-    'PNST': 'Pinstripes Holdings, Inc.',
-    'AQMS': 'Aqua Metals, Inc.',
-    'SUGP': 'SU Group Holdings Ltd',
-    'ABTS': 'Abits Group Inc',
-    'EXDW': 'Exceed World, Inc.',
-    'DTSS': 'DATASEA INC.',
-    'IPA': 'ImmunoPrecise Antibodies Ltd.',
-    'SKK': 'SKK Holdings Ltd',
-    'CLNV': 'Clean Vision Corp',
-    'DMN': 'Damon Inc.',
-    'YHGJ': 'YUNHONG GREEN CTI LTD.',
-    'NEPH': 'NEPHROS INC',
-    'PRPH': 'ProPhase Labs, Inc.',
-    'QMMM': 'QMMM Holdings Ltd',
-    'BRN': 'BARNWELL INDUSTRIES INC',
-    'CING': 'Cingulate Inc.',
-    'GNOLF': 'GENOIL INC',
-    'AUST': 'Austin Gold Corp.',
-    'KNW': 'KNOW LABS, INC.',
-    'DATS': 'DatChat, Inc.',
-    'CFOO': 'China Foods Holdings Ltd.',
-    'QZMRF': 'QUARTZ MOUNTAIN RESOURCES LTD',
-    'SRLZF': 'Salazar Resources Ltd',
-    'PIAC': 'PRINCETON CAPITAL CORP',
-    'PMNT': 'Perfect Moment Ltd.',
-    'ILAG': 'Intelligent Living Application Group Inc.',
-    'CDT': 'CONDUIT PHARMACEUTICALS INC.',
-    'SANW': 'S&W Seed Co',
-    'NCL': 'Northann Corp.',
-    'WISA': 'WISA TECHNOLOGIES, INC.',
-    'GXAI': 'GAXOS.AI INC.',
-    'LICN': 'Lichen China Ltd',
-    'QSJC': 'TANCHENG GROUP CO., LTD.',
-    'GUER': 'Guerrilla RF, Inc.',
-    'ENMI': 'DH ENCHANTMENT, INC.',
-    'TAIT': 'TAITRON COMPONENTS INC',
-    'SPRB': 'SPRUCE BIOSCIENCES, INC.',
-    'PT': 'Pintec Technology Holdings Ltd',
-    'CVR': 'CHICAGO RIVET & MACHINE CO',
-    'ERNA': 'Eterna Therapeutics Inc.',
-    'MEGL': 'Magic Empire Global Ltd',
-    'COEP': 'Coeptis Therapeutics Holdings, Inc.',
-    'NERV': 'Minerva Neurosciences, Inc.',
-    'ENFY': 'Enlightify Inc.',
-    'TETOF': 'Tectonic Metals Inc.',
-    'MSPR': 'MSP Recovery, Inc.',
-    'CISO': 'CISO Global, Inc.',
-    'STRM': 'STREAMLINE HEALTH SOLUTIONS INC.',
-    'XIN': 'Xinyuan Real Estate Co., Ltd.',
-    'XTLB': 'XTL BIOPHARMACEUTICALS LTD',
-    'FMST': 'Foremost Clean Energy Ltd.',
-    'HTOO': 'Fusion Fuel Green PLC',
-    'USEA': 'United Maritime Corp',
-    'RMCO': 'Royalty Management Holding Corp',
-    'QYOUF': 'QYOU Media Inc.',
-    'SWAG': 'Stran & Company, Inc.',
-    'CHHE': 'China Health Industries Holdings, Inc.',
-    'COSM': 'Cosmos Health Inc.',
-    'ARBB': 'ARB IOT Group Ltd',
-    'MYNA': 'Mynaric AG',
-    'UPYY': 'UPAY',
-    'AEON': 'AEON Biopharma, Inc.',
-    'APCX': 'AppTech Payments Corp.',
-    'RMSL': 'RemSleep Holdings Inc.',
-    'ADN': 'ADVENT TECHNOLOGIES HOLDINGS, INC.',
-    'NZERF': 'New Zealand Energy Corp.',
-    'AWX': 'AVALON HOLDINGS CORP',
-    'MSBB': 'Mercer Bancorp, Inc.',
-    'TKLF': 'Tokyo Lifestyle Co., Ltd.',
-    'CWD': 'CaliberCos Inc.',
-    'CHUC': 'Charlie's Holdings, Inc.',
-    'UEEC': 'United Health Products, Inc.',
-    'FLYE': 'Fly-E Group, Inc.',
-    'JZXN': 'Jiuzi Holdings, Inc.',
-    'AIRI': 'AIR INDUSTRIES GROUP',
-    'JRSS': 'JRSIS HEALTH CARE Corp',
-    'PHIL': 'PHI GROUP INC',
-    'GNS': 'Genius Group Ltd',
-    'EQS': 'EQUUS TOTAL RETURN, INC.',
-    'JBDI': 'JBDI Holdings Ltd',
-    'MRAI': 'Marpai, Inc.',
-    'USNU': 'Elite Health Systems Inc.',
-    'MAPPF': 'PROSTAR HOLDINGS INC. /BC',
-    'UAVS': 'AgEagle Aerial Systems Inc.',
-    'BOF': 'BranchOut Food Inc.',
-    'EDUC': 'EDUCATIONAL DEVELOPMENT CORP',
-    'QURT': 'Quarta-Rad, Inc.',
-    'SRRE': 'SUNRISE REAL ESTATE GROUP INC',
-    'KDOZF': 'KIDOZ INC.',
-    'LUCY': 'Innovative Eyewear Inc',
-    'STLY': 'HG Holdings, Inc.',
-    'JGLDF': 'Japan Gold Corp.',
-    'HOTH': 'Hoth Therapeutics, Inc.',
-    'DUKR': 'DUKE Robotics Corp.',
-    'LBCMF': 'Libero Copper & Gold Corp',
-    'SPND': 'SPINDLETOP OIL & GAS CO',
-    'VAUCF': 'Viva Gold Corp.',
-    'PHGE': 'BiomX Inc.',
-    'SNTW': 'Summit Networks Inc.',
-    'ADGM': 'Adagio Medical Holdings, Inc.',
-    'TIRX': 'TIAN RUIXIANG HOLDINGS LTD',
-    'CMLS': 'CUMULUS MEDIA INC',
-    'ACXP': 'Acurx Pharmaceuticals, Inc.',
-    'GRNQ': 'Greenpro Capital Corp.',
-    'YQ': '17 Education & Technology Group Inc.',
-    'PSIG': 'PS International Group Ltd.',
-    'MMA': 'MIXED MARTIAL ARTS GROUP LTD',
-    'AIM': 'AIM ImmunoTech Inc.',
-    'APTO': 'Aptose Biosciences Inc.',
-    'DDC': 'DDC Enterprise Ltd',
-    'KWIK': 'KwikClick, Inc.',
-    'GOVB': 'Gouverneur Bancorp, Inc./MD/',
-    'LCFY': 'Locafy Ltd',
-    'PAIYY': 'Aesthetic Medical International Holdings Group Ltd',
-    'MBIO': 'MUSTANG BIO, INC.',
-    'NCI': 'Neo-Concept International Group Holdings Ltd',
-    'SBEV': 'SPLASH BEVERAGE GROUP, INC.',
-    'PET': 'Wag! Group Co.',
-    'CNFR': 'Conifer Holdings, Inc.',
-    'BIAF': 'bioAffinity Technologies, Inc.',
-    'LYRA': 'Lyra Therapeutics, Inc.',
-    'IMNN': 'Imunon, Inc.',
-    'ABVE': 'Above Food Ingredients Inc.',
-    'CJJD': 'China Jo-Jo Drugstores, Inc.',
-    'GWTI': 'GREENWAY TECHNOLOGIES INC',
-    'TRUG': 'TruGolf Holdings, Inc.',
-    'RYDE': 'Ryde Group Ltd',
-    'EEIQ': 'EpicQuest Education Group International Ltd',
-    'RLMD': 'RELMADA THERAPEUTICS, INC.',
-    'SNSE': 'Sensei Biotherapeutics, Inc.',
-    'CRWE': 'Crown Equity Holdings, Inc.',
-    'BGXX': 'Bright Green Corp',
-    'ALUR': 'ALLURION TECHNOLOGIES, INC.',
-    'CLEV': 'Concrete Leveling Systems Inc',
-    'PETZ': 'TDH Holdings, Inc.',
-    'RIME': 'Algorhythm Holdings, Inc.',
-    'TXMD': 'TherapeuticsMD, Inc.',
-    'JUPGF': 'Jupiter Gold Corp',
-    'HWH': 'HWH International Inc.',
-    'SMTK': 'SmartKem, Inc.',
-    'TWG': 'Top Wealth Group Holding Ltd',
-    'SSKN': 'STRATA Skin Sciences, Inc.',
-    'LGCB': 'Linkage Global Inc',
-    'BHIL': 'Benson Hill, Inc.',
-    'SPRS': 'SURGE COMPONENTS INC',
-    'XERI': 'XERIANT, INC.',
-    'OTLC': 'Oncotelic Therapeutics, Inc.',
-    'CEIN': 'CAMBER ENERGY, INC.',
-    'PCST': 'PURE CAPITAL SOLUTIONS, INC.',
-    'IVDA': 'Iveda Solutions, Inc.',
-    'AGSS': 'AMERIGUARD SECURITY SERVICES, INC.',
-    'BMNR': 'BITMINE IMMERSION TECHNOLOGIES, INC.',
-    'EYEN': 'EYENOVIA, INC.',
-    'BNET': 'BION ENVIRONMENTAL TECHNOLOGIES INC',
-    'GWAV': 'Greenwave Technology Solutions, Inc.',
-    'JAGX': 'Jaguar Health, Inc.',
-    'KAPA': 'Kairos Pharma, LTD.',
-    'DLPN': 'Dolphin Entertainment, Inc.',
-    'APLM': 'Apollomics Inc.',
-    'QMCI': 'QUOTEMEDIA INC',
-    'MTR': 'MESA ROYALTY TRUST/TX',
-    'SEED': 'Origin Agritech LTD',
-    'UBXG': 'U-BX Technology Ltd.',
-    'KNGRF': 'Kingsmen Resources Ltd.',
-    'WBUY': 'WEBUY GLOBAL LTD',
-    'BPT': 'BP PRUDHOE BAY ROYALTY TRUST',
-    'BSLK': 'Bolt Projects Holdings, Inc.',
-    'CLRB': 'Cellectar Biosciences, Inc.',
-    'MI': 'NFT Ltd',
-    'CYN': 'Cyngn Inc.',
-    'GMM': 'Global Mofy AI Ltd',
-    'GITS': 'Global Interactive Technologies, Inc.',
-    'PGFF': 'Pioneer Green Farms, Inc.',
-    'PC': 'Premium Catering (Holdings) Ltd',
-    'IMTH': 'INNOVATIVE MEDTECH, INC.',
-    'UGRO': 'urban-gro, Inc.',
-    'ASTC': 'ASTROTECH Corp',
-    'BCLI': 'BRAINSTORM CELL THERAPEUTICS INC.',
-    'IVDN': 'INNOVATIVE DESIGNS INC',
-    'NCRA': 'NOCERA, INC.',
-    'IMRN': 'Immuron Ltd',
-    'INDP': 'Indaptus Therapeutics, Inc.',
-    'TSBX': 'Turnstone Biologics Corp.',
-    'BRTX': 'BioRestorative Therapies, Inc.',
-    'CSCI': 'COSCIENS Biopharma Inc.',
-    'NTRP': 'NextTrip, Inc.',
-    'CMCT': 'Creative Media & Community Trust Corp',
-    'ENZN': 'ENZON PHARMACEUTICALS, INC.',
-    'AIMD': 'Ainos, Inc.',
-    'PEV': 'PHOENIX MOTOR INC.',
-    'ATIP': 'ATI Physical Therapy, Inc.',
-    'GTII': 'GLOBAL TECH INDUSTRIES GROUP, INC.',
-    'XELB': 'XCel Brands, Inc.',
-    'BNZI': 'Banzai International, Inc.',
-    'BETRF': 'BetterLife Pharma Inc.',
-    'FFNTF': '4Front Ventures Corp.',
-    'SCND': 'SCIENTIFIC INDUSTRIES INC',
-    'KTEL': 'KonaTel, Inc.',
-    'GVH': 'Globavend Holdings Ltd',
-    'CJET': 'Chijet Motor Company, Inc.',
-    'VVPR': 'VivoPower International PLC',
-    'KLTO': 'Klotho Neurosciences, Inc.',
-    'ZONE': 'CleanCore Solutions, Inc.',
-    'CYCA': 'CYTTA CORP.',
-    'YERBF': 'YERBAE BRANDS CORP.',
-    'HAO': 'Haoxi Health Technology Ltd',
-    'PPBT': 'PURPLE BIOTECH LTD.',
-    'LMFA': 'LM FUNDING AMERICA, INC.',
-    'AWH': 'Aspira Women's Health Inc.',
-    'CUBT': 'Curative Biotechnology Inc',
-    'CLWT': 'EURO TECH HOLDINGS CO LTD',
-    'WMLLF': 'Wealth Minerals Ltd.',
-    'FDCT': 'FDCTECH, INC.',
-    'AYTU': 'AYTU BIOPHARMA, INC',
-    'GDHG': 'GOLDEN HEAVEN GROUP HOLDINGS LTD.',
-    'PMCB': 'PharmaCyte Biotech, Inc.',
-    'SCKT': 'SOCKET MOBILE, INC.',
-    'VRAX': 'Virax Biolabs Group Ltd',
-    'SGMA': 'SIGMATRON INTERNATIONAL INC',
-    'VRMMQ': 'Vroom, Inc.',
-    'CTCX': 'Carmell Corp',
-    'BURU': 'Nuburu, Inc.',
-    'ZCAR': 'Zoomcar Holdings, Inc.',
-    'TLPH': 'TALPHERA, INC.',
-    'EVGN': 'Evogene Ltd.',
-    'ILAL': 'International Land Alliance Inc.',
-    'INTI': 'Inhibitor Therapeutics, Inc.',
-    'BTCY': 'BIOTRICITY INC.',
-    'AEI': 'Alset Inc.',
-    'APDN': 'APPLIED DNA SCIENCES INC',
-    'MHUA': 'Meihua International Medical Technologies Co., Ltd.',
-    'SOAR': 'Volato Group, Inc.',
-    'BMNM': 'BIMINI CAPITAL MANAGEMENT, INC.',
-    'BHAT': 'Blue Hat Interactive Entertainment Technology',
-    'BTBD': 'BT Brands, Inc.',
-    'KPRX': 'KIORA PHARMACEUTICALS INC',
-    'ROMA': 'Roma Green Finance Ltd',
-    'OMH': 'Ohmyhome Ltd',
-    'LILIF': 'Argentina Lithium & Energy Corp.',
-    'CANF': 'Can-Fite BioPharma Ltd.',
-    'ATEK': 'Athena Technology Acquisition Corp. II',
-    'BCDA': 'BioCardia, Inc.',
-    'AIHS': 'Senmiao Technology Ltd',
-    'BREA': 'Brera Holdings PLC',
-    'ARTW': 'ARTS WAY MANUFACTURING CO INC',
-    'VS': 'Versus Systems Inc.',
-    'RVYL': 'RYVYL Inc.',
-    'QTI': 'QT IMAGING HOLDINGS, INC.',
-    'MSN': 'EMERSON RADIO CORP',
-    'MFI': 'mF International Ltd',
-    'MYNZ': 'MAINZ BIOMED N.V.',
-    'MKDW': 'MKDWELL Tech Inc.',
-    'MSTH': 'Mystic Holdings Inc./NV',
-    'APM': 'Aptorum Group Ltd',
-    'PFHO': 'PACIFIC HEALTH CARE ORGANIZATION INC',
-    'ACPS': 'AC Partners, Inc.',
-    'CREV': 'Carbon Revolution Public Ltd Co',
-    'LRHC': 'La Rosa Holdings Corp.',
-    'GHST': 'GHST World Inc.',
-    'TCRI': 'TechCom, Inc.',
-    'VINE': 'Fresh Vine Wine, Inc.',
-    'LISMF': 'LITHIUM SOUTH DEVELOPMENT Corp',
-    'INBP': 'INTEGRATED BIOPHARMA INC',
-    'HWNI': 'HIGH WIRE NETWORKS, INC.',
-    'VISL': 'Vislink Technologies, Inc.',
-    'MMTRS': 'MILLS MUSIC TRUST',
-    'PURE': 'PURE BIOSCIENCE, INC.',
-    'MOJO': 'EQUATOR Beverage Co',
-    'ENSC': 'Ensysce Biosciences, Inc.',
-    'TIKK': 'TEL INSTRUMENT ELECTRONICS CORP',
-    'MWG': 'Multi Ways Holdings Ltd',
-    'AMST': 'Amesite Inc.',
-    'CUTR': 'CUTERA INC',
-    'AEMD': 'AETHLON MEDICAL INC',
-    'XCRT': 'Xcelerate, Inc.',
-    'DXYN': 'DIXIE GROUP INC',
-    'CARV': 'CARVER BANCORP INC',
-    'SLE': 'Super League Enterprise, Inc.',
-    'CBDS': 'Dogecoin Cash, Inc.',
-    'BOXL': 'Boxlight Corp',
-    'PBSV': 'Pharma-Bio Serv, Inc.',
-    'IONI': 'I-ON Digital Corp.',
-    'POAI': 'Predictive Oncology Inc.',
-    'OP': 'OceanPal Inc.',
-    'DFCO': 'DALRADA FINANCIAL CORP',
-    'NYMXF': 'NYMOX PHARMACEUTICAL CORP',
-    'SQFT': 'Presidio Property Trust, Inc.',
-    'WINSF': 'Wins Finance Holdings Inc.',
-    'SPRC': 'SciSparc Ltd.',
-    'NROM': 'NOBLE ROMANS INC',
-    'GIPR': 'GENERATION INCOME PROPERTIES, INC.',
-    'GTHP': 'GUIDED THERAPEUTICS INC',
-    'STME': 'Stimcell Energetics Inc.',
-    'ORGS': 'Orgenesis Inc.',
-    'INTJ': 'Intelligent Group Ltd',
-    'WATT': 'Energous Corp',
-    'DPLS': 'DarkPulse, Inc.',
-    'LEDS': 'SemiLEDs Corp',
-    'PRPO': 'Precipio, Inc.',
-    'SRM': 'SRM Entertainment, Inc.',
-    'JPOTF': 'Jackpot Digital Inc.',
-    'SDCH': 'SideChannel, Inc.',
-    'EONR': 'EON Resources Inc.',
-    'KAVL': 'Kaival Brands Innovations Group, Inc.',
-    'CYCN': 'Cyclerion Therapeutics, Inc.',
-    'IDAI': 'T Stamp Inc',
-    'CTNT': 'CHEETAH NET SUPPLY CHAIN SERVICE INC.',
-    'VGFCQ': 'Very Good Food Co Inc.',
-    'ICU': 'SeaStar Medical Holding Corp',
-    'BRGX': 'BIOREGENX, INC.',
-    'CHEK': 'Check-Cap Ltd',
-    'GSIW': 'Garden Stage Ltd',
-    'NSFDF': 'NXT Energy Solutions Inc.',
-    'CNSP': 'CNS Pharmaceuticals, Inc.',
-    'MARPS': 'MARINE PETROLEUM TRUST',
-    'SOGP': 'Sound Group Inc.',
-    'BFRI': 'Biofrontera Inc.',
-    'GV': 'Visionary Holdings Inc.',
-    'HIHO': 'HIGHWAY HOLDINGS LTD',
-    'SILO': 'Silo Pharma, Inc.',
-    'HLGN': 'Heliogen, Inc.',
-    'ASNS': 'ACTELIS NETWORKS INC',
-    'YJ': 'Yunji Inc.',
-    'TRLEF': 'Trillion Energy International Inc.',
-    'ELWS': 'Earlyworks Co., Ltd.',
-    'TGCB': 'Tego Cyber, Inc.',
-    'PBMLF': 'Pacific Booker Minerals Inc.',
-    'LCTC': 'Lifeloc Technologies, Inc',
-    'ADXN': 'Addex Therapeutics Ltd.',
-    'CAUD': 'Collective Audience, Inc.',
-    'ICDX': 'Incordex Corp.',
-    'KDLY': 'Kindly MD, Inc.',
-    'NMGX': 'Nano Magic Inc.',
-    'MRM': 'Medirom Healthcare Technologies Inc.',
-    'MOND': 'Mondee Holdings, Inc.',
-    'ELVG': 'Elvictor Group, Inc.',
-    'ECTM': 'ECA Marcellus Trust I',
-    'GRAM': 'Gold Flora Corp.',
-    'PKKFF': 'Tenet Fintech Group Inc.',
-    'WTO': 'UTime Ltd',
-    'HLRTF': 'Hillcrest Energy Technologies Ltd.',
-    'KSEZ': 'Kinetic Seas Inc.',
-    'POLA': 'Polar Power, Inc.',
-    'BLMZ': 'BloomZ Inc.',
-    'SNGX': 'SOLIGENIX, INC.',
-    'GLVT': 'GREENLIT VENTURES INC.',
-    'IMG': 'CIMG Inc.',
-    'NURO': 'NeuroMetrix, Inc.',
-    'FXBY': 'FOXBY CORP.',
-    'LWLW': 'Longwen Group Corp.',
-    'NUVI': 'Emo Capital Corp.',
-    'TESI': 'Titan Environmental Solutions Inc.',
-    'CERO': 'CERO THERAPEUTICS HOLDINGS, INC.',
-    'IBG': 'Innovation Beverage Group Ltd',
-    'GURE': 'GULF RESOURCES, INC.',
-    'FGI': 'FGI Industries Ltd.',
-    'OPGN': 'OPGEN INC',
-    'AIAD': 'AiAdvertising, Inc.',
-    'THMG': 'THUNDER MOUNTAIN GOLD INC',
-    'LDWY': 'LENDWAY, INC.',
-    'JNVR': 'Janover Inc.',
-    'SKAS': 'Saker Aviation Services, Inc.',
-    'AHNR': 'ATHENA GOLD CORP',
-    'TPET': 'Trio Petroleum Corp.',
-    'RDHL': 'RedHill Biopharma Ltd.',
-    'IMCC': 'IM Cannabis Corp.',
-    'PBM': 'PSYENCE BIOMEDICAL LTD.',
-    'RDGA': 'RIDGEFIELD ACQUISITION CORP',
-    'DSNY': 'DESTINY MEDIA TECHNOLOGIES INC',
-    'QNTM': 'Quantum Biopharma Ltd.',
-    'HOFV': 'Hall of Fame Resort & Entertainment Co',
-    'ECRO': 'ECC Capital CORP',
-    'MITQ': 'MOVING iMAGE TECHNOLOGIES INC.',
-    'OTRK': 'Ontrak, Inc.',
-    'XWEL': 'XWELL, Inc.',
-    'NFTN': 'NFiniTi inc.',
-    'WAFU': 'Wah Fu Education Group Ltd',
-    'IPDN': 'Professional Diversity Network, Inc.',
-    'SGLY': 'Singularity Future Technology Ltd.',
-    'SRAX': 'SRAX, Inc.',
-    'MTPP': 'MOUNTAIN TOP PROPERTIES, INC.',
-    'TCTM': 'TCTM Kids IT Education Inc.',
-    'NBIO': 'Nascent Biotech Inc.',
-    'DSS': 'DSS, INC.',
-    'JCSE': 'JE Cleantech Holdings Ltd',
-    'HYZN': 'Hyzon Motors Inc.',
-    'DOMH': 'Dominari Holdings Inc.',
-    'FHLD': 'Freedom Holdings, Inc.',
-    'APVO': 'Aptevo Therapeutics Inc.',
-    'PTOP': 'Peer To Peer Network',
-    'STRR': 'STAR EQUITY HOLDINGS, INC.',
-    'VIRX': 'Viracta Therapeutics, Inc.',
-    'AAUAF': 'ALMADEN MINERALS LTD',
-    'CASK': 'Heritage Distilling Holding Company, Inc.',
-    'PNBK': 'PATRIOT NATIONAL BANCORP INC',
-    'SMREF': 'SUN SUMMIT MINERALS CORP.',
-    'BTOG': 'BIT ORIGIN Ltd',
-    'VINC': 'Vincerx Pharma, Inc.',
-    'SLTN': 'SILVERTON ENERGY, INC.',
-    'LIFD': 'LFTD PARTNERS INC.',
-    'VMAR': 'Vision Marine Technologies Inc.',
-    'BLTH': 'AMERICAN BATTERY MATERIALS, INC.',
-    'GLTO': 'Galecto, Inc.',
-    'GOGR': 'Go Green Global Technologies Corp.',
-    'LXEH': 'Lixiang Education Holding Co. Ltd.',
-    'TNLX': 'TRANS LUX Corp',
-    'RKDA': 'Arcadia Biosciences, Inc.',
-    'MFBI': 'Monroe Federal Bancorp, Inc.',
-    'TIGCF': 'Triumph Gold Corp.',
-    'EFOI': 'ENERGY FOCUS, INC/DE',
-    'KZIA': 'KAZIA THERAPEUTICS LTD',
-    'TGL': 'TREASURE GLOBAL INC',
-    'TTOO': 'T2 Biosystems, Inc.',
-    'SRNW': 'Stratos Renewables Corp',
-    'ANTE': 'AIRNET TECHNOLOGY INC.',
-    'PSTV': 'PLUS THERAPEUTICS, INC.',
-    'PCMC': 'PUBLIC CO MANAGEMENT CORP',
-    'SSY': 'SUNLINK HEALTH SYSTEMS INC',
-    'VBIX': 'Viewbix Inc.',
-    'PAVM': 'PAVmed Inc.',
-    'GRI': 'GRI Bio, Inc.',
-    'VEEE': 'Twin Vee PowerCats, Co.',
-    'MGRX': 'MANGOCEUTICALS, INC.',
-    'GNPX': 'Genprex, Inc.',
-    'GULTU': 'Gulf Coast Ultra Deep Royalty Trust',
-    'BON': 'Bon Natural Life Ltd',
-    'CMND': 'Clearmind Medicine Inc.',
-    'MRIN': 'MARIN SOFTWARE INC',
-    'CRKN': 'Crown Electrokinetics Corp.',
-    'BZYR': 'BURZYNSKI RESEARCH INSTITUTE INC',
-    'KRKR': '36Kr Holdings Inc.',
-    'BLBX': 'BLACKBOXSTOCKS INC.',
-    'JWEL': 'Jowell Global Ltd.',
-    'ULY': 'Urgent.ly Inc.',
-    'ADIL': 'ADIAL PHARMACEUTICALS, INC.',
-    'RSMXF': 'Regency Silver Corp.',
-    'TWOH': 'Two Hands Corp',
-    'CHNR': 'CHINA NATURAL RESOURCES INC',
-    'FFLO': 'Free Flow USA, Inc.',
-    'CEAD': 'CEA Industries Inc.',
-    'NLSP': 'NLS Pharmaceutics Ltd.',
-    'EVOK': 'Evoke Pharma Inc',
-    'TRXA': 'T-REX Acquisition Corp.',
-    'ELAB': 'PMGC Holdings Inc.',
-    'AMBO': 'Ambow Education Holding Ltd.',
-    'CBIH': 'Cannabis Bioscience International Holdings, Inc.',
-    'ABVC': 'ABVC BIOPHARMA, INC.',
-    'FOXO': 'FOXO TECHNOLOGIES INC.',
-    'VERB': 'Verb Technology Company, Inc.',
-    'QIND': 'Quality Industrial Corp.',
-    'MCUJF': 'MEDICURE INC',
-    'EGTYF': 'Eguana Technologies Inc.',
-    'ONVO': 'ORGANOVO HOLDINGS, INC.',
-    'ONFO': 'Onfolio Holdings, Inc',
-    'GBR': 'New Concept Energy, Inc.',
-    'VSMR': 'VERIFY SMART CORP.',
-    'XBIO': 'Xenetic Biosciences, Inc.',
-    'EDSA': 'Edesa Biotech, Inc.',
-    'AEHL': 'Antelope Enterprise Holdings Ltd',
-    'PNYG': 'Pony Group Inc.',
-    'ALZN': 'Alzamend Neuro, Inc.',
-    'CVSI': 'CV Sciences, Inc.',
-    'BGLC': 'BioNexus Gene Lab Corp',
-    'BABB': 'BAB, INC.',
-    'JTAI': 'Jet.AI Inc.',
-    'LIMX': 'Limitless X Holdings Inc.',
-    'PLRZ': 'Polyrizon Ltd.',
-    'SYRS': 'Syros Pharmaceuticals, Inc.',
-    'FTFT': 'Future FinTech Group Inc.',
-    'CREG': 'Smart Powerr Corp.',
-    'HCTI': 'Healthcare Triangle, Inc.',
-    'FORD': 'Forward Industries, Inc.',
-    'ANVI': 'ANVI GLOBAL HOLDINGS, INC.',
-    'BMTM': 'Bright Mountain Media, Inc.',
-    'KLYG': 'Kelyniam Global, Inc.',
-    'GRHI': 'GOLD ROCK HOLDINGS, INC.',
-    'GTBP': 'GT Biopharma, Inc.',
-    'BKYI': 'BIO KEY INTERNATIONAL INC',
-    'APYP': 'APPYEA, INC',
-    'TRBMF': 'TORQ RESOURCES INC.',
-    'SBFM': 'Sunshine Biopharma Inc.',
-    'EDBL': 'Edible Garden AG Inc',
-    'VMNT': 'Vemanti Group, Inc.',
-    'BENF': 'Beneficient',
-    'CNEY': 'CN ENERGY GROUP. INC.',
-    'VEST': 'Vestiage, Inc.',
-    'BRQSF': 'Borqs Technologies, Inc.',
-    'INBS': 'INTELLIGENT BIO SOLUTIONS INC.',
-    'TNON': 'Tenon Medical, Inc.',
-    'BMRA': 'BIOMERICA INC',
-    'LBSR': 'LIBERTY STAR URANIUM & METALS CORP.',
-    'ASRE': 'Astra Energy, Inc.',
-    'SPFX': 'STANDARD PREMIUM FINANCE HOLDINGS, INC.',
-    'PALI': 'PALISADE BIO, INC.',
-    'BIGGQ': 'BIG LOTS INC',
-    'CHRO': 'Channel Therapeutics Corp',
-    'UNQL': 'Unique Logistics International, Inc.',
-    'SYRA': 'Syra Health Corp',
-    'HSTA': 'Hestia Insight Inc.',
-    'VRPX': 'Virpax Pharmaceuticals, Inc.',
-    'YGMZ': 'MingZhu Logistics Holdings Ltd',
-    'KIQSF': 'KELSO TECHNOLOGIES INC',
-    'EJH': 'E-Home Household Service Holdings Ltd',
-    'GSUN': 'Golden Sun Health Technology Group Ltd',
-    'LTRY': 'Lottery.com Inc.',
-    'OVTZ': 'OCULUS VISIONTECH INC.',
-    'MBRX': 'Moleculin Biotech, Inc.',
-    'REBN': 'Reborn Coffee, Inc.',
-    'AIJTY': 'Jianpu Technology Inc.',
-    'ZDPY': 'Zoned Properties, Inc.',
-    'ADMT': 'ADM TRONICS UNLIMITED, INC.',
-    'IVP': 'INSPIRE VETERINARY PARTNERS, INC.',
-    'BLMH': 'BLUM HOLDINGS, INC.',
-    'ECIA': 'ENCISION INC',
-    'UUU': 'UNIVERSAL SECURITY INSTRUMENTS INC',
-    'CISS': 'C3is Inc.',
-    'CETX': 'CEMTREX INC',
-    'VSME': 'VS MEDIA Holdings Ltd',
-    'MGOL': 'MGO Global Inc.',
-    'VADP': 'Vado Corp.',
-    'DROR': 'Dror Ortho-Design, Inc.',
-    'NMREF': 'Namibia Critical Metals Inc.',
-    'BAOS': 'Baosheng Media Group Holdings Ltd',
-    'JXG': 'JX Luxventure Group Inc.',
-    'BICX': 'BioCorRx Inc.',
-    'LIXT': 'LIXTE BIOTECHNOLOGY HOLDINGS, INC.',
-    'EVAX': 'Evaxion Biotech A/S',
-    'AGTX': 'Agentix Corp.',
-    'LKCO': 'Luokung Technology Corp.',
-    'QWTR': 'Quest Water Global, Inc.',
-    'STEK': 'Stemtech Corp',
-    'MSGM': 'Motorsport Games Inc.',
-    'FWFW': 'FLYWHEEL ADVANCED TECHNOLOGY, INC.',
-    'BBLR': 'Bubblr Inc.',
-    'MARK': 'REMARK HOLDINGS, INC.',
-    'VIPZ': 'VIP Play, Inc.',
-    'SNTG': 'Sentage Holdings Inc.',
-    'SIGY': 'Sigyn Therapeutics, Inc.',
-    'KANT': 'KINETA, INC./DE',
-    'CLSH': 'CLS Holdings USA, Inc.',
-    'MVNC': 'Marvion Inc.',
-    'AMIX': 'Autonomix Medical, Inc.',
-    'LEBGF': 'Legible Inc.',
-    'ATPC': 'Agape ATP Corp',
-    'QNRX': 'Quoin Pharmaceuticals, Ltd.',
-    'ZAPP': 'Zapp Electric Vehicles Group Ltd',
-    'OLKR': 'OpenLocker Holdings, Inc.',
-    'GLMD': 'Galmed Pharmaceuticals Ltd.',
-    'EFSH': '1847 Holdings LLC',
-    'RBTC': 'Rubicon Technologies, Inc.',
-    'PRTG': 'PORTAGE BIOTECH INC.',
-    'KWE': 'KWESST Micro Systems Inc.',
-    'NMHI': 'Nature's Miracle Holding Inc.',
-    'DNMR': 'Danimer Scientific, Inc.',
-    'ROYL': 'Royale Energy, Inc.',
-    'STKH': 'Steakholder Foods Ltd.',
-    'INTV': 'INTEGRATED VENTURES, INC.',
-    'XYLB': 'XY Labs, Inc.',
-    'AYRO': 'AYRO, Inc.',
-    'NIVF': 'NewGenIvf Group Ltd',
-    'SONN': 'Sonnet BioTherapeutics Holdings, Inc.',
-    'ATNF': '180 Life Sciences Corp.',
-    'EDXC': 'Endexx Corp',
-    'PNXP': 'PINEAPPLE EXPRESS CANNABIS Co',
-    'FOMI': 'FORMATION MINERALS, INC.',
-    'PRSO': 'Peraso Inc.',
-    'FVTI': 'Fortune Valley Treasures, Inc.',
-    'JFBR': 'Jeffs' Brands Ltd',
-    'BMXI': 'BROOKMOUNT EXPLORATIONS INC',
-    'GARWF': 'Golden Arrow Resources Corp',
-    'CTHR': 'CHARLES & COLVARD LTD',
-    'CPMD': 'CANNAPHARMARX, INC.',
-    'GPUS': 'Hyperscale Data, Inc.',
-    'ALLR': 'Allarity Therapeutics, Inc.',
-    'BLNC': 'Balance Labs, Inc.',
-    'MITI': 'Mitesco, Inc.',
-    'IFBD': 'Infobird Co., Ltd',
-    'SHMY': 'Synergy Empire Ltd',
-    'ASST': 'Asset Entities Inc.',
-    'LNTO': 'LELANTOS HOLDINGS INC.',
-    'OHCS': 'Optimus Healthcare Services, Inc.',
-    'SINT': 'Sintx Technologies, Inc.',
-    'BKUH': 'Bakhu Holdings, Corp.',
-    'LFLY': 'Leafly Holdings, Inc. /DE',
-    'CRYM': 'Cryomass Technologies, Inc.',
-    'NUWE': 'Nuwellis, Inc.',
-    'YJGJ': 'YIJIA GROUP CORP.',
-    'XPON': 'Expion360 Inc.',
-    'ILUS': 'Ilustrato Pictures International Inc.',
-    'HYEX': 'HEALTHY EXTRACTS INC.',
-    'RYES': 'Rise Gold Corp.',
-    'NCNA': 'NuCana plc',
-    'NVFY': 'Nova Lifestyle, Inc.',
-    'AAMTF': 'Armada Mercantile Ltd',
-    'KNOS': 'KRONOS ADVANCED TECHNOLOGIES INC',
-    'ATXG': 'ADDENTAX GROUP CORP.',
-    'INKW': 'Greene Concepts, Inc',
-    'GTLL': 'GLOBAL TECHNOLOGIES LTD',
-    'IMTE': 'Integrated Media Technology Ltd',
-    'LVRLF': 'CordovaCann Corp.',
-    'BWMG': 'Brownie's Marine Group, Inc',
-    'ABTI': 'ALTEROLA BIOTECH INC.',
-    'HLYK': 'HealthLynked Corp',
-    'CPMV': 'Mosaic ImmunoEngineering Inc.',
-    'OST': 'Ostin Technology Group Co., Ltd.',
-    'PW': 'Power REIT',
-    'SNPX': 'Synaptogenix, Inc.',
-    'PSYCF': 'Psyched Wellness Ltd.',
-    'ITP': 'IT TECH PACKAGING, INC.',
-    'MGON': 'MEGOLA INC',
-    'VTAK': 'Catheter Precision, Inc.',
-    'MDCE': 'Medical Care Technologies Inc.',
-    'URZEF': 'URZ3 ENERGY CORP.',
-    'RSCF': 'REFLECT SCIENTIFIC, INC.',
-    'YOSH': 'Yoshiharu Global Co.',
-    'CVAT': 'Cavitation Technologies, Inc.',
-    'REVB': 'REVELATION BIOSCIENCES, INC.',
-    'WLDS': 'Wearable Devices Ltd.',
-    'STSS': 'Sharps Technology Inc.',
-    'ENVB': 'Enveric Biosciences, Inc.',
-    'SRCO': 'SPARTA COMMERCIAL SERVICES, INC.',
-    'OGEN': 'ORAGENICS INC',
-    'MYCB': 'My City Builders, Inc.',
-    'YBGJ': 'Yubo International Biotech Ltd',
-    'CBMJ': 'CONSERVATIVE BROADCAST MEDIA & PUBLISHING, INC.',
-    'OCTO': 'Eightco Holdings Inc.',
-    'RHE': 'REGIONAL HEALTH PROPERTIES, INC',
-    'TOVX': 'Theriva Biologics, Inc.',
-    'OBLG': 'Oblong, Inc.',
-    'XRTX': 'XORTX Therapeutics Inc.',
-    'DQWS': 'DSwiss Inc',
-    'BPTH': 'BIO-PATH HOLDINGS, INC.',
-    'XONI': 'Xtreme One Entertainment, Inc.',
-    'SUNE': 'SUNation Energy, Inc.',
-    'ACUT': 'Accustem Sciences Inc.',
-    'OCLN': 'ORIGINCLEAR, INC.',
-    'MULN': 'MULLEN AUTOMOTIVE INC.',
-    'UPXI': 'UPEXI, INC.',
-    'OZSC': 'OZOP ENERGY SOLUTIONS, INC.',
-    'ONCO': 'Onconetix, Inc.',
-    'RNVA': 'Rennova Health, Inc.',
-    'LMRMF': 'Lomiko Metals Inc.',
-    'CPHI': 'CHINA PHARMA HOLDINGS, INC.',
-    'TPHS': 'Trinity Place Holdings Inc.',
-    'LGHL': 'Lion Group Holding Ltd',
-    'CELZ': 'CREATIVE MEDICAL TECHNOLOGY HOLDINGS, INC.',
-    'SBIG': 'SpringBig Holdings, Inc.',
-    'LTUM': 'Lithium Corp',
-    'BTTR': 'Better Choice Co Inc.',
-    'TRNR': 'Interactive Strength, Inc.',
-    'PAPL': 'Pineapple Financial Inc.',
-    'IDXG': 'INTERPACE BIOSCIENCES, INC.',
-    'FAMI': 'Farmmi, Inc.',
-    'EAST': 'Eastside Distilling, Inc.',
-    'HIRU': 'HIRU Corp',
-    'GETR': 'Getaround, Inc',
-    'THAR': 'Tharimmune, Inc.',
-    'AVCRF': 'Avricore Health Inc.',
-    'GRST': 'ETHEMA HEALTH Corp',
-    'RGFC': 'Real Good Food Company, Inc.',
-    'ALID': 'Allied Corp.',
-    'TRCC': 'TRACCOM INC.',
-    'LUVU': 'Luvu Brands, Inc.',
-    'TBLT': 'Toughbuilt Industries, Inc',
-    'ZVSA': 'ZyVersa Therapeutics, Inc.',
-    'HEPA': 'Hepion Pharmaceuticals, Inc.',
-    'ALRTF': 'ALR Technologies SG Ltd.',
-    'ATXI': 'AVENUE THERAPEUTICS, INC.',
-    'SVBL': 'SILVER BULL RESOURCES, INC.',
-    'CNTGF': 'Centogene N.V.',
-    'ALBT': 'Avalon GloboCare Corp.',
-    'BUDZ': 'WEED, INC.',
-    'BQ': 'Boqii Holding Ltd',
-    'OLB': 'OLB GROUP, INC.',
-    'SHMP': 'NaturalShrimp Inc',
-    'PTPI': 'Petros Pharmaceuticals, Inc.',
-    'SEAV': 'SEATech Ventures Corp.',
-    'ABCFF': 'ABACUS MINING & EXPLORATION CORP',
-    'CCCP': 'Crona Corp.',
-    'SMX': 'SMX (Security Matters) Public Ltd Co',
-    'PKTX': 'ProtoKinetix, Inc.',
-    'IGEX': 'Indo Global Exchange(s) Pte, Ltd.',
-    'HGYN': 'HONG YUAN HOLDING GROUP',
-    'NAYA': 'NAYA Biosciences, Inc.',
-    'CNET': 'ZW Data Action Technologies Inc.',
-    'FUST': 'FUSE GROUP HOLDING INC.',
-    'AGRI': 'AGRIFORCE GROWING SYSTEMS LTD.',
-    'AREB': 'AMERICAN REBEL HOLDINGS INC',
-    'LIPO': 'LIPELLA PHARMACEUTICALS INC.',
-    'ARTL': 'ARTELO BIOSCIENCES, INC.',
-    'UCLE': 'US NUCLEAR CORP.',
-    'LGMK': 'LogicMark, Inc.',
-    'IWSH': 'Wright Investors Service Holdings, Inc.',
-    'BRST': 'Broad Street Realty, Inc.',
-    'ASTI': 'Ascent Solar Technologies, Inc.',
-    'MYSZ': 'My Size, Inc.',
-    'TNFA': 'TNF Pharmaceuticals, Inc.',
-    'SGD': 'Safe & Green Development Corp',
-    'SNOA': 'Sonoma Pharmaceuticals, Inc.',
-    'VRVR': 'VIRTUAL INTERACTIVE TECHNOLOGIES CORP.',
-    'HCNWF': 'Hypercharge Networks Corp.',
-    'STAF': 'Staffing 360 Solutions, Inc.',
-    'GESI': 'General European Strategic Investments, Inc.',
-    'ORMNF': 'OREX MINERALS INC',
-    'TOFB': 'TOFUTTI BRANDS INC',
-    'NCNCF': 'noco-noco Inc.',
-    'AAUGF': 'AERO ENERGY Ltd',
-    'NBY': 'NovaBay Pharmaceuticals, Inc.',
-    'SOPA': 'SOCIETY PASS INCORPORATED.',
-    'HSCS': 'HeartSciences Inc.',
-    'PTIX': 'Protagenic Therapeutics, Inc.\new',
-    'GEGP': 'GOLD ENTERTAINMENT GROUP INC',
-    'KTTA': 'Pasithea Therapeutics Corp.',
-    'NCPL': 'Netcapital Inc.',
-    'ICON': 'Icon Energy Corp',
-    'FRGT': 'Freight Technologies, Inc.',
-    'LGIQ': 'LOGIQ, INC.',
-    'LPTV': 'Loop Media, Inc.',
-    'CANN': 'TREES Corp (Colorado)',
-    'DHCC': 'DIAMONDHEAD CASINO CORP',
-    'SHPH': 'Shuttle Pharmaceuticals Holdings, Inc.',
-    'TCBP': 'TC BioPharm (Holdings) plc',
-    'WHLR': 'Wheeler Real Estate Investment Trust, Inc.',
-    'BITTF': 'BITTERROOT RESOURCES LTD',
-    'INM': 'InMed Pharmaceuticals Inc.',
-    'MTNB': 'Matinas BioPharma Holdings, Inc.',
-    'SENR': 'Strategic Environmental & Energy Resources, Inc.',
-    'RELI': 'Reliance Global Group, Inc.',
-    'ATCH': 'AtlasClear Holdings, Inc.',
-    'RSLS': 'ReShape Lifesciences Inc.',
-    'WORX': 'SCWorx Corp.',
-    'ALTX': 'ALTEX INDUSTRIES INC',
-    'BCAN': 'Femto Technologies Inc.',
-    'DWTX': 'Dogwood Therapeutics, Inc.',
-    'SNES': 'SenesTech, Inc.',
-    'NUGN': 'Livento Group, Inc.',
-    'SLXN': 'Silexion Therapeutics Corp',
-    'QLGN': 'Qualigen Therapeutics, Inc.',
-    'NDRA': 'ENDRA Life Sciences Inc.',
-    'SISI': 'SHINECO, INC.',
-    'CIPI': 'Correlate Energy Corp.',
-    'GNLN': 'Greenlane Holdings, Inc.',
-    'XYLO': 'XYLO TECHNOLOGIES LTD',
-    'SYTA': 'Siyata Mobile Inc.',
-    'CBLO': 'C2 Blockchain,Inc.',
-    'NEWH': 'NewHydrogen, Inc.',
-    'AQB': 'AQUABOUNTY TECHNOLOGIES INC',
-    'EOSS': 'EOS INC.',
-    'FUNI': 'Hypha Labs, Inc.',
-    'SCNI': 'Scinai Immunotherapeutics Ltd.',
-    'YCBD': 'cbdMD, Inc.',
-    'STTDF': 'Standard Uranium Ltd.',
-    'UOKA': 'MDJM LTD',
-    'SNAX': 'STRYVE FOODS, INC.',
-    'BMMJ': 'BODY & MIND INC.',
-    'TTNP': 'TITAN PHARMACEUTICALS INC',
-    'VERO': 'Venus Concept Inc.',
-    'LUXH': 'LUXURBAN HOTELS INC.',
-    'CLRI': 'Cleartronic, Inc.',
-    'AUUD': 'AUDDIA INC.',
-    'PHIO': 'Phio Pharmaceuticals Corp.',
-    'TIVC': 'Tivic Health Systems, Inc.',
-    'WOLV': 'Wolverine Resources Corp.',
-    'CYAN': 'CYANOTECH CORP',
-    'BRVO': 'Bravo Multinational Inc.',
-    'FHSEY': 'First High-School Education Group Co., Ltd.',
-    'KXIN': 'Kaixin Holdings',
-    'ICCT': 'iCoreConnect Inc.',
-    'NRRWF': 'Nuran Wireless Inc.',
-    'ENTO': 'Entero Therapeutics, Inc.',
-    'ALCE': 'Alternus Clean Energy, Inc.',
-    'GRTX': 'Galera Therapeutics, Inc.',
-    'EBYH': 'Strainsforpains, Inc.',
-    'CNNN': 'ConneXionONE Corp.',
-    'PRFX': 'PAINREFORM LTD.',
-    'XXII': '22nd Century Group, Inc.',
-    'SPGC': 'Sacks Parente Golf, Inc.',
-    'AZTR': 'Azitra, Inc.',
-    'TARSF': 'Silver North Resources Ltd.',
-    'TCRT': 'Alaunos Therapeutics, Inc.',
-    'LDSN': 'Luduson G Inc.',
-    'ALDA': 'ATLANTICA INC',
-    'EGMCF': 'EMERGENT METALS CORP.',
-    'PCSA': 'Processa Pharmaceuticals, Inc.',
-    'CYCC': 'Cyclacel Pharmaceuticals, Inc.',
-    'VYND': 'Vynleads, Inc.',
-    'QRON': 'Qrons Inc.',
-    'BLFR': 'Bluefire Equipment Corp',
-    'GPOX': 'GPO Plus, Inc.',
-    'SGBX': 'SAFE & GREEN HOLDINGS CORP.',
-    'BACK': 'IMAC Holdings, Inc.',
-    'NVVE': 'Nuvve Holding Corp.',
-    'ISPC': 'iSpecimen Inc.',
-    'HWKE': 'Hawkeye Systems, Inc.',
-    'NULGF': 'NuLegacy Gold Corp',
-    'SNRG': 'SusGlobal Energy Corp.',
-    'AVRW': 'Avenir Wellness Solutions, Inc.',
-    'DRMA': 'Dermata Therapeutics, Inc.',
-    'BLIS': 'NAPC Defense, Inc.',
-    'BDRX': 'Biodexa Pharmaceuticals Plc',
-    'VEVMQ': 'VICINITY MOTOR CORP',
-    'TLLTF': 'TILT Holdings Inc.',
-    'SVRE': 'SaverOne 2014 Ltd.',
-    'ADTX': 'Aditxt, Inc.',
-    'ODYY': 'Odyssey Health, Inc.',
-    'TC': 'TuanChe Ltd',
-    'ENSV': 'Enservco Corp',
-    'BBLG': 'Bone Biologics Corp',
-    'VIRA': 'NEURALBASE AI LTD.',
-    'HSDT': 'HELIUS MEDICAL TECHNOLOGIES, INC.',
-    'DGLY': 'DIGITAL ALLY, INC.',
-    'SXTP': '60 DEGREES PHARMACEUTICALS, INC.',
-    'VCNX': 'VACCINEX, INC.',
-    'WHLT': 'CHASE PACKAGING CORP',
-    'SUIC': 'SUIC Worldwide Holdings Ltd.',
-    'WINT': 'WINDTREE THERAPEUTICS INC /DE/',
-    'STQN': 'STRATEGIC ACQUISITIONS INC /NV/',
-    'VYCO': 'VYCOR MEDICAL INC',
-    'FERN': 'Fernhill Corp',
-    'SMCE': 'SMC Entertainment, Inc.',
-    'VPRB': 'VPR Brands, LP.',
-    'SLRX': 'Salarius Pharmaceuticals, Inc.',
-    'TAOP': 'Taoping Inc.',
-    'RNAZ': 'Transcode Therapeutics, Inc.',
-    'TRCK': 'Track Group, Inc.',
-    'AHRO': 'Authentic Holdings, Inc.',
-    'OMQS': 'OMNIQ Corp.',
-    'VLCN': 'Volcon, Inc.',
-    'HGAS': 'Global Gas Corp',
-    'BPTSY': 'Biophytis SA',
-    'FMNJ': 'Franklin Mining, Inc.',
-    'AKAN': 'AKANDA CORP.',
-    'MAGE': 'MAGELLAN COPPER & GOLD INC.',
-    'ZPHYF': 'ZEPHYR MINERALS LTD.',
-    'LOGQ': 'Coyni, Inc.',
-    'AAGH': 'America Great Health',
-    'USAQ': 'QHSLab, Inc.',
-    'FEMFF': 'FE Battery Metals Corp.',
-    'SBET': 'SharpLink Gaming, Inc.',
-    'FRES': 'Fresh2 Group Ltd',
-    'CHEV': 'Charging Robotics Inc.',
-    'OWPC': 'One World Products, Inc.',
-    'HMMR': 'HAMMER FIBER OPTICS HOLDINGS CORP',
-    'TOGI': 'TurnOnGreen, Inc.',
-    'KCRD': 'Kindcard, Inc.',
-    'VPER': 'VIPER NETWORKS INC',
-    'BJDX': 'Bluejay Diagnostics, Inc.',
-    'ALDS': 'APPlife Digital Solutions Inc',
-    'SXTC': 'China SXT Pharmaceuticals, Inc.',
-    'CRCE': 'Circle Energy, Inc./NV',
-    'NAOV': 'NanoVibronix, Inc.',
-    'SGN': 'Signing Day Sports, Inc.',
-    'BRWC': 'Birdie Win Corp',
-    'AVGR': 'Avinger Inc',
-    'GCTK': 'Glucotrack, Inc.',
-    'SRSG': 'SPIRITS TIME INTERNATIONAL, INC.',
-    'SCPX': 'Scorpius Holdings, Inc.',
-    'ENGC': 'ENGLOBAL CORP',
-    'WLYW': 'Wally World Media, Inc',
-    'VTNRQ': 'Vertex Energy Inc.',
-    'ABQQ': 'AB INTERNATIONAL GROUP CORP.',
-    'LBUY': 'LEAFBUYER TECHNOLOGIES, INC.',
-    'ATMH': 'ALL THINGS MOBILE ANALYTIC, INC.',
-    'SNBH': 'SENTIENT BRANDS HOLDINGS INC.',
-    'RAASY': 'Cloopen Group Holding Ltd',
-    'MINM': 'MINIM, INC.',
-    'BGAVF': 'Bravada Gold Corp',
-    'NVOS': 'Novo Integrated Sciences, Inc.',
-    'ILST': 'INTERNATIONAL STAR INC',
-    'PBLA': 'Panbela Therapeutics, Inc.',
-    'KRFG': 'OneSolution Technology Inc.',
-    'MMND': 'MASTERMIND, INC.',
-    'JEWL': 'Adamas One Corp.',
-    'EEGI': 'Eline Entertainment Group, Inc.',
-    'YBCN': 'Yong Bai Chao New Retail Corp',
-    'GTCH': 'GBT Technologies Inc.',
-    'RMESF': 'RED METAL RESOURCES, LTD.',
-    'UK': 'Ucommune International Ltd',
-    'OILCF': 'Permex Petroleum Corp',
-    'CRGH': 'Carriage House Event Center, Inc.',
-    'EAWD': 'Energy & Water Development Corp',
-    'CMGR': 'Clubhouse Media Group, Inc.',
-    'GBLX': 'GB SCIENCES INC',
-    'TRVN': 'TREVENA INC',
-    'SHWZ': 'Medicine Man Technologies, Inc.',
-    'REOS': 'ReoStar Energy CORP',
-    'HUML': 'Humble Energy, Inc./FL',
-    'SONG': 'Music Licensing Inc.',
-    'CRCW': 'Crypto Co',
-    'TSOI': 'THERAPEUTIC SOLUTIONS INTERNATIONAL, INC.',
-    'EZGO': 'EZGO Technologies Ltd.',
-    'MNTR': 'Mentor Capital, Inc.',
-    'MRNJ': 'METATRON APPS, INC.',
-    'NRIS': 'Norris Industries, Inc.',
-    'AUMN': 'Golden Minerals Co',
-    'AFIB': 'Acutus Medical, Inc.',
-    'ATYG': 'Saxon Capital Group, Inc./DE',
-    'PMVC': 'PMV Consumer Acquisition Corp.',
-    'SKVI': 'SKINVISIBLE, INC.',
-    'NVSGF': 'Nevada Sunrise Metals Corp.',
-    'KRBP': 'Kiromic Biopharma, Inc.',
-    'EQOSQ': 'EQONEX Ltd',
-    'FECOF': 'FEC Resources Inc.',
-    'GMER': 'GOOD GAMING, INC.',
-    'HHHEF': '37 CAPITAL INC',
-    'TANH': 'TANTECH HOLDINGS LTD',
-    'MRPT': 'MACREPORT NET INC',
-    'ASII': 'Accredited Solutions, Inc.',
-    'UPC': 'Universe Pharmaceuticals INC',
-    'ACON': 'Aclarion, Inc.',
-    'BEGI': 'BLACKSTAR ENTERPRISE GROUP, INC.',
-    'PRSI': 'PORTSMOUTH SQUARE INC',
-    'LAAB': 'Startech Labs, Inc.',
-    'ARRT': 'Artisan Consumer Goods, Inc.',
-    'AETHF': 'Aether Global Innovations Corp.',
-    'HLLK': 'HALLMARK VENTURE GROUP, INC.',
-    'KAYS': 'Kaya Holdings, Inc.',
-    'CAPC': 'CAPSTONE COMPANIES, INC.',
-    'LQWC': 'LIFEQUEST WORLD CORP.',
-    'GLFH': 'Galenfeha, Inc.',
-    'IMII': 'INCEPTION MINING INC.',
-    'VYST': 'Vystar Corp',
-    'CWBR': 'CohBar, Inc.',
-    'PLSH': 'PANACEA LIFE SCIENCES HOLDINGS, INC.',
-    'GNTOF': 'GENTOR RESOURCES INC.',
-    'PGOL': 'PATRIOT GOLD CORP',
-    'SRGZ': 'Star Gold Corp.',
-    'SONX': 'Sonendo, Inc.',
-    'PTCO': 'PetroGas Co',
-    'BSPK': 'Bespoke Extracts, Inc.',
-    'VEII': 'Value Exchange International, Inc.',
-    'PAXH': 'PREAXIA HEALTH CARE PAYMENT SYSTEMS INC.',
-    'AVPMF': 'AVRUPA MINERALS LTD.',
-    'NGTF': 'NightFood Holdings, Inc.',
-    'SPEV': 'SHOREPOWER TECHNOLOGIES INC.',
-    'CBDL': 'CBD Life Sciences Inc.',
-    'ADD': 'Color Star Technology Co., Ltd.',
-    'ENRT': 'Enertopia Corp.',
-    'DREM': 'Dream Homes & Development Corp.',
-    'NWCN': 'NETWORK CN INC',
-    'DBGI': 'Digital Brands Group, Inc.',
-    'CSUI': 'CANNABIS SUISSE CORP.',
-    'RGBP': 'Regen BioPharma Inc',
-    'ASFT': 'Appsoft Technologies, Inc.',
-    'MVLA': 'Movella Holdings Inc.',
-    'DYNT': 'DYNATRONICS CORP',
-    'ATAO': 'ALTAIR INTERNATIONAL CORP.',
-    'GRTSQ': 'Gritstone bio, Inc.',
-    'BSFC': 'Blue Star Foods Corp.',
-    'MMEX': 'MMEX Resources Corp',
-    'EBZT': 'Everything Blockchain, Inc.',
-    'ESMC': 'ESCALON MEDICAL CORP',
-    'ISCO': 'International Stem Cell CORP',
-    'LADX': 'LadRx Corp',
-    'EVFM': 'Evofem Biosciences, Inc.',
-    'WAST': 'WASTE ENERGY CORP.',
-    'FMHS': 'FARMHOUSE, INC. /NV',
-    'MCOM': 'micromobility.com Inc.',
-    'CAMG': 'CAM GROUP, INC.',
-    'MLRT': 'Metalert, Inc.',
-    'BOTY': 'LINGERIE FIGHTING CHAMPIONSHIPS, INC.',
-    'EMMA': 'Emmaus Life Sciences, Inc.',
-    'JPPYY': 'Jupai Holdings Ltd',
-    'CONC': 'CONECTISYS CORP',
-    'VNUE': 'VNUE, Inc.',
-    'AKTSQ': 'Akoustis Technologies, Inc.',
-    'CBDY': 'Target Group Inc.',
-    'ADIA': 'Adia Nutrition, Inc.',
-    'JFIL': 'Jubilant Flame International, Ltd',
-    'SOBR': 'SOBR Safe, Inc.',
-    'RGTPQ': 'POLARITYTE, INC.',
-    'YCRM': 'Yuenglings Ice Cream Corp',
-    'GLAE': 'GlassBridge Enterprises, Inc.',
-    'FRCB': 'FIRST REPUBLIC BANK',
-    'PIKM': 'KIDPIK CORP.',
-    'WDDD': 'WORLDS INC',
-    'NUMD': 'Nu-Med Plus, Inc.',
-    'CMGO': 'CMG HOLDINGS GROUP, INC.',
-    'NXEN': 'NEXIEN BIOPHARMA, INC.',
-    'GRLF': 'GREEN LEAF INNOVATIONS INC',
-    'ACAN': 'AmeriCann, Inc.',
-    'ARTH': 'Arch Therapeutics, Inc.',
-    'BTAX': 'Biostax Corp.',
-    'MEXGF': 'Mexican Gold Mining Corp.',
-    'VHAI': 'Vocodia Holdings Corp',
-    'CBDW': '1606 CORP.',
-    'SYIN': 'Synbio International, Inc.',
-    'SAML': 'Samsara Luggage, Inc.',
-    'PXMD': 'PaxMedica, Inc.',
-    'GSPI': 'Green Star Products, Inc.',
-    'IPSI': 'Innovative Payment Solutions, Inc.',
-    'KDCE': 'KID CASTLE EDUCATIONAL CORP',
-    'CLOW': 'Cloudweb, Inc.',
-    'QPRC': 'QUEST PATENT RESEARCH CORP',
-    'FRZT': 'Freeze Tag, Inc.',
-    'TPTW': 'TPT GLOBAL TECH, INC.',
-    'DBMM': 'Digital Brand Media & Marketing Group, Inc.',
-    'VNTH': 'Nano Mobile Healthcare, Inc.',
-    'GCAN': 'Greater Cannabis Company, Inc.',
-    'BOTH': 'BIOETHICS LTD',
-    'GSTX': 'Graphene & Solar Technologies Ltd',
-    'DTII': 'DEFENSE TECHNOLOGIES INTERNATIONAL CORP.',
-    'CLDVF': 'Web3 Ventures Inc.',
-    'GRVE': 'GROOVE BOTANICALS INC.',
-    'PAPA': 'Papa Medical Inc.',
-    'TLSS': 'Transportation & Logistics Systems, Inc.',
-    'NRHI': 'Natural Resource Holdings, Inc.',
-    'EMDF': 'E Med Future, Inc.',
-    'CCTC': 'Catalyst Crew Technologies Corp.',
-    'GFMH': 'Goliath Film & Media Holdings',
-    'SSOK': 'Sunstock, Inc.',
-    'LEJUY': 'Leju Holdings Ltd',
-    'KATX': 'KAT EXPLORATION, INC.',
-    'MRZM': 'MARIZYME, INC.',
-    'KEGS': '1812 Brewing Company, Inc.',
-    'MTLK': 'METALINK LTD',
-    'CBNT': 'C-Bond Systems, Inc',
-    'NBND': 'NetBrands Corp.',
-    'CYTOF': 'Altamira Therapeutics Ltd.',
-    'RWGI': 'Rodedawg International Industries, Inc.',
-    'VISM': 'VISIUM TECHNOLOGIES, INC.',
-    'HIGR': 'Hi-Great Group Holding Co',
-    'MGTI': 'MGT CAPITAL INVESTMENTS, INC.',
-    'ZRFY': 'Zerify, Inc.',
-    'BLPG': 'Blue Line Protection Group, Inc.',
-    'BDPT': 'BIOADAPTIVES, INC.',
-    'SLDC': 'Telco Cuba, Inc.',
-    'TBIO': 'Telesis Bio Inc.',
-    'NSTM': 'NovelStem International Corp.',
-    'TUPBQ': 'TUPPERWARE BRANDS CORP',
-    'SATT': 'SATIVUS TECH CORP.',
-    'AAGR': 'African Agriculture Holdings Inc.',
-    'VSOLF': 'THREE SIXTY SOLAR LTD.',
-    'VINOQ': 'Gaucho Group Holdings, Inc.',
-    'AIXN': 'AiXin Life International, Inc.',
-    'USLG': 'U.S. Lighting Group, Inc.',
-    'MHTX': 'MANHATTAN SCIENTIFICS INC',
-    'ITOX': 'IIOT-OXYS, Inc.',
-    'BISA': 'BALTIC INTERNATIONAL USA INC',
-    'OMTK': 'Omnitek Engineering Corp',
-    'SKFG': 'Stark Focus Group, Inc.',
-    'NIHK': 'Video River Networks, Inc.',
-    'CAPS': 'Capstone Holding Corp.',
-    'LGCP': 'Legion Capital Corp',
-    'GMPW': 'GIVEMEPOWER CORP',
-    'EMAX': 'Ecomax, Inc',
-    'NNAX': 'New Momentum Corp.',
-    'SPEC': 'Spectaire Holdings Inc.',
-    'LSMG': 'Lode-Star Mining Inc.',
-    'QTTOY': 'Qutoutiao Inc.',
-    'STAL': 'Star Alliance International Corp.',
-    'TMGI': 'Marquie Group, Inc.',
-    'ATVK': 'Ameritek Ventures, Inc.',
-    'GSAC': 'GELSTAT CORP',
-    'ECPL': 'ECOPLUS INC',
-    'GSTC': 'GlobeStar Therapeutics Corp',
-    'DLOC': 'Digital Locations, Inc.',
-    'NIMU': 'NON INVASIVE MONITORING SYSTEMS INC /FL/',
-    'BFYW': 'Better For You Wellness, Inc.',
-    'RMTG': 'Regenerative Medical Technology Group Inc.',
-    'PDPG': 'Performance Drink Group, Inc.',
-    'SMME': 'SmartMetric, Inc.',
-    'GRPS': 'Trans American Aquaculture, Inc',
-    'GAHC': 'Global Arena Holding, Inc.',
-    'RSPI': 'RespireRx Pharmaceuticals Inc.',
-    'BIOLQ': 'BIOLASE, INC',
-    'DCLT': 'Data Call Technologies',
-    'KOAN': 'Resonate Blends, Inc.',
-    'INQD': 'Indoor Harvest Corp',
-    'BETSF': 'Bit Brother Ltd',
-    'BRGO': 'Bergio International, Inc.',
-    'FLXT': 'FLEXPOINT SENSOR SYSTEMS INC',
-    'KITL': 'Kisses From Italy Inc.',
-    'JKSM': 'Jacksam Corp',
-    'CBIA': 'Blue Heaven Coffee, Inc.',
-    'DXFFY': 'Dunxin Financial Holdings Ltd',
-    'LOWLF': 'Lowell Farms Inc.',
-    'CTKYY': 'CooTek(Cayman)Inc.',
-    'PLTYF': 'Plastec Technologies, Ltd.',
-    'EMED': 'Electromedical Technologies, Inc',
-    'RAKR': 'Rainmaker Worldwide Inc.',
-    'VRTC': 'VERITEC INC',
-    'SEELQ': 'SEELOS THERAPEUTICS, INC.',
-    'PPCB': 'Propanc Biopharma, Inc.',
-    'CNBX': 'CNBX Pharmaceuticals Inc.',
-    'LEEN': 'Leopard Energy, Inc.',
-    'AOXY': 'ADVANCED OXYGEN TECHNOLOGIES INC',
-    'VMHG': 'VICTORY MARINE HOLDINGS CORP',
-    'TLCC': 'TWINLAB CONSOLIDATED HOLDINGS, INC.',
-    'NTBLQ': 'Notable Labs, Ltd.',
-    'FINR': 'Fintech Scion Ltd',
-    'PTOS': 'P2 Solar, Inc.',
-    'GPAK': 'Gamer Pakistan Inc',
-    'INND': 'INNERSCOPE HEARING TECHNOLOGIES, INC.',
-    'SANP': 'SANTO MINING CORP.',
-    'BRSHF': 'Bruush Oral Care Inc.',
-    'USCTF': 'Roth CH Acquisition Co.',
-    'DGWR': 'Deep Green Waste & Recycling, Inc.',
-    'MTEM': 'Molecular Templates, Inc.',
-    'SPOWF': 'Strata Power Corp',
-    'YTENQ': 'YIELD10 BIOSCIENCE, INC.',
-    'TMPOQ': 'Tempo Automation Holdings, Inc.',
-    'PBIO': 'PRESSURE BIOSCIENCES INC',
-    'NEXI': 'NexImmune, Inc.',
-    'FCHS': 'First Choice Healthcare Solutions, Inc.',
-    'SHRG': 'SHARING SERVICES GLOBAL Corp',
-    'CWNOF': 'CHINESEWORLDNET COM INC',
-    'SING': 'SinglePoint Inc.',
-    'GTRL': 'Get Real USA, Inc.',
-    'IONM': 'Assure Holdings Corp.',
-    'CMAXQ': 'CareMax, Inc.',
-    'BOMO': 'bowmo, Inc.',
-    'SDCCQ': 'SmileDirectClub, Inc.',
-    'MGAM': 'Mobile Global Esports, Inc.',
-    'AMMJ': 'American Cannabis Company, Inc.',
-    'NUVOQ': 'Holdco Nuvo Group D.G Ltd.',
-    'TPIA': 'Mycotopia Therapies, Inc.',
-    'XTIA': 'XTI Aerospace, Inc.',
-    'ATDS': 'Data443 Risk Mitigation, Inc.',
-    'IPIX': 'Innovation Pharmaceuticals Inc.',
-    'CIRX': 'CIRTRAN CORP',
-    'BANT': 'Bantec, Inc.',
-    'FSTJ': 'First America Resources Corp',
-    'DBRM': 'DAYBREAK OIL & GAS, INC.',
-    'DCFCQ': 'Tritium DCFC Ltd',
-    'STRG': 'STARGUIDE GROUP, INC.',
-    'CUEN': 'Cuentas Inc.',
-    'ELYS': 'Elys BMG Group, Inc.',
-    'GGEI': 'Green Giant Inc.',
-    'ACUR': 'ACURA PHARMACEUTICALS, INC',
-    'XSNX': 'NovAccess Global Inc.',
-    'EBET': 'EBET, Inc.',
-    'TTCFQ': 'Tattooed Chef, Inc.',
-    'ISUNQ': 'ISUN, INC.',
-    'GPLDF': 'GREAT PANTHER MINING Ltd',
-    'GROM': 'Grom Social Enterprises, Inc.',
-    'ELIQQ': 'Electriq Power Holdings, Inc.',
-    'NMRD': 'Nemaura Medical Inc.',
-    'UPHL': 'UpHealth, Inc.',
-    'ARVLF': 'Arrival',
-    'DMTKQ': 'DermTech, Inc.',
-    'BFICQ': 'BurgerFi International, Inc.',
-    'BBIG': 'Vinco Ventures, Inc.',
-    'RIBT': 'RiceBran Technologies',
-    'BIMI': 'BIMI Holdings Inc.',
-    'FUVV': 'Arcimoto Inc',
-    'DLAPQ': 'DELTA APPAREL, INC',
-    'MMATQ': 'META MATERIALS INC.',
-    'WTRV': 'White River Energy Corp.',
-    'SUNWQ': 'Sunworks, Inc.',
-    'ELOX': 'Eloxx Pharmaceuticals, Inc.',
-    'NTHI': 'NEONC TECHNOLOGIES HOLDINGS, INC.',
-    'DGNX': 'Diginex Ltd',
-    'HLTHQ': 'Cue Health Inc.',
-    'IGOT': 'FOMO WORLDWIDE, INC.',
-    'NICH': 'NITCHES INC',
-    'COTI': 'CORETAG, INC.',
-    'BABY': 'PishPosh, Inc.',
-    'AAAU': 'Goldman Sachs Physical Gold ETF',
-    'AIDG': 'AIS Holdings Group, Inc.',
-    'TFSA': 'Terra Income Fund 6, LLC',
-    'BIORQ': 'BIORA THERAPEUTICS, INC.',
-    'CAST': 'FreeCast, Inc.',
-    'MOMC': 'BLOCKHOLD CAPITAL CORP',
-    'BBNX': 'Beta Bionics, Inc',
-    'AAGO': 'Aspargo Labs, Inc.',
-    'BAR': 'GraniteShares Gold Trust',
-    'ARAI': 'Arrive AI Inc.',
-    'AILEQ': 'iLearningEngines, Inc.',
-    'OAK-PA': 'Brookfield Oaktree Holdings, LLC',
-    'UNL': 'United States 12 Month Natural Gas Fund, LP',
-    'GLNS': 'Golden Star Resource Corp.',
-    'UDN': 'INVESCO DB US DOLLAR INDEX BEARISH FUND',
-    'UUP': 'Invesco DB US Dollar Index Bullish Fund',
-    'GJT': 'STRATS(SM) Trust for Allstate Corp Securities, Series 2006-3',
-    'GJO': 'STRATS SM TRUST FOR WAL-MART STORES, INC. SECURITIES, SERIES 2005-4',
-    'BNO': 'United States Brent Oil Fund, LP',
-    'LVDW': 'LiquidValue Development Inc.',
-    'JTGEY': 'Citibank,N.A./ADR',
-    'PALL': 'abrdn Palladium ETF Trust',
-    'FETH': 'Fidelity Ethereum Fund',
-    'PRGY': 'IGTA Merger Sub Ltd',
-    'IOTR': 'iOThree Ltd',
-    'TLIH': 'Ten-League International Holdings Ltd',
-    'ENGS': 'Energys Group Ltd',
-    'MTSR': 'Metsera, Inc.',
-    'YZRY': 'Gansu Yunzhao Ruyi Technology Development Co., Ltd.',
-    'LOKV': 'Live Oak Acquisition Corp. V',
-    'KFII': 'K&F GROWTH ACQUISITION CORP. II',
-    'LFS': 'LEIFRAS Co., Ltd.',
-    'AACB': 'Artius II Acquisition Inc.',
-    'LGPS': 'LOGPROSTYLE INC.',
-    'DLXY': 'Delixy Holdings Ltd',
-    'RYOJ': 'rYojbaba Co., Ltd.',
-    'AURS': 'Aurous Resources',
-    'WXM': 'WF International Ltd.',
-    'NUTR': 'NUSATRIP Inc',
-    'JFB': 'JFB Construction Holdings',
-    'FCHL': 'Fitness Champs Holdings Ltd',
-    'TGHL': 'GrowHub Ltd',
-    'DMNT': 'DMINT, Inc.',
-    'BTC': 'Grayscale Bitcoin Mini Trust ETF',
-    'TMDE': 'TMD Energy Ltd',
-    'SDM': 'Smart Digital Group Ltd',
-    'COLA': 'Columbus Acquisition Corp/Cayman Islands',
-    'POAS': 'Phaos Technology (Cayman) Holdings Ltd',
-    'TOPW': 'Top Win International Ltd',
-    'SVCC': 'Stellar V Capital Corp. (Cayman Islands)',
-    'MAYA': 'Maywood Acquisition Corp.',
-    'MGRT': 'Mega Fortune Co Ltd',
-    'JACS': 'Jackson Acquisition Co II',
-    'AHJK': 'Aimei Health Technology II Co., Ltd.',
-    'MJID': 'Majestic Ideal Holdings Ltd',
-    'FBGL': 'FBS Global Ltd',
-    'CRGT': 'Cortigent, Inc.',
-    'TOPP': 'Toppoint Holdings Inc.',
-    'SLRA': 'SOLERA CORP.',
-    'EIIA': 'Eagle Point Institutional Income Fund',
-    'MANA': 'Grayscale Decentraland Trust (MANA)',
-    'GLIV': 'Grayscale Livepeer Trust (LPT)',
-    'GLNK': 'Grayscale Chainlink Trust (LINK)',
-    'ETHV': 'VanEck Ethereum ETF',
-    'TSLVF': 'TIER ONE SILVER INC.',
-    'HVII': 'Hennessy Capital Investment Corp. VII',
-    'HODL': 'VanEck Bitcoin ETF',
-    'PYT': 'PPLUS Trust Series GSC-2',
-    'KTN': 'STRUCTURED PRODUCTS CORP CRED ENHANCE CORTS TR FOR AON CAP A',
-    'PMHS': 'Polomar Health Services, Inc.',
-    'CHSCP': 'CHS INC',
-    'CDRPB': 'CEDAR REALTY TRUST, INC.',
-    'ULVR': 'UNILEVER PLC',
-    'CTBB': 'QWEST CORP',
-    'GMCG': 'GLAMOORE Capital Group Co Ltd.',
-    'DXST': 'Decent Holding Inc.',
-    'RCT': 'RedCloud Holdings plc',
-    'GRAN': 'Grande Group Ltd/HK',
-    'XHLD': 'TEN Holdings, Inc.',
-    'SKBL': 'Skyline Builders Group Holding Ltd',
-    'TTG': 'Transten Global Group Ltd',
-    'YDES': 'YD Bio Ltd',
-    'TWNP': 'Twin Hospitality Group Inc.',
-    'WTF': 'Waton Financial Ltd',
-    'PN': 'Skycorp Solar Group Ltd',
-    'LBRJ': 'Libera Gaming Operations, Inc',
-    'DEFI': 'Tidal Commodities Trust I',
-    'IBIT': 'iShares Bitcoin Trust ETF',
-    'PICW': 'Pictureworks International Holdings Ltd',
-    'MRP': 'Millrose Properties, Inc.',
-    'UFG': 'Uni-Fuels Holdings Ltd',
-    'ATHR': 'Aether Holdings, Inc.',
-    'NAMM': 'Namib Minerals',
-    'WGRX': 'Wellgistics Health, Inc.',
-    'EZBC': 'Franklin Templeton Digital Holdings Trust',
-    'KMYGY': 'Kumyang Co., Ltd./ADR',
-    'CRE': 'Cre8 Enterprise Ltd',
-    'ETHW': 'Bitwise Ethereum ETF',
-    'EWSB': 'EWSB Bancorp, Inc. /MD/',
-    'SFDX': 'SFIDA X, Inc.',
-    'KYTFY': 'Kyoto Financial Group Inc/ADR',
-    'YTTA': 'Nidar Infrastructure Ltd',
-    'BELR': 'Bell Rose Capital, Inc.',
-    'STAK': 'STAK Inc.',
-    'YB': 'Yuanbao Inc.',
-    'SPHA': 'Shepherd Ave Capital Acquisition Corp',
-    'BLIV': 'BeLive Holdings',
-    'TMGX': 'Thoughtful Media Group Inc.',
-    'AAPG': 'ASCENTAGE PHARMA GROUP INTERNATIONAL',
-    'SNDK': 'Sandisk Corp',
-    'GFTTY': 'GFT Technologies SE/ADR',
-    'ATII': 'Archimedes Tech SPAC Partners II Co.',
-    'DMAA': 'Drugs Made In America Acquisition Corp.',
-    'CGGJ': 'Guo Jin Sheng Shi Gold Jewelry Group Holding Ltd',
-    'GTSG': 'GATES GROUP Inc.',
-    'DAIC ': 'CID Holdco, Inc.',
-    'RHLD': 'Resolute Holdings Management, Inc.',
-    'WSBK': 'Winchester Bancorp, Inc./MD/',
-    'ELOG': 'Eastern International Ltd.',
-    'FTRK': 'Fast Track Group',
-    'MB': 'MASTERBEEF GROUP',
-    'DRDB': 'Roman DBDR Acquisition Corp. II',
-    'MTNE': 'CH4 Natural Solutions Acquisition Corp',
-    'JHKC': 'JuHe KC Holdings Ltd',
-    'CJMB': 'CALLAN JMB INC.',
-    'EHLD': 'Euroholdings Ltd.',
-    'HSPT': 'Horizon Space Acquisition II Corp.',
-    'MAMK': 'MaxsMaking Inc.',
-    'EZET': 'Franklin Ethereum Trust',
-    'ZGM': 'Zenta Group Co Ltd',
-    'MKR': '707 Cayman Holdings Ltd.',
-    'PCLA': 'PicoCELA Inc.',
-    'NCT': 'Intercont (Cayman) Ltd',
-    'KIDZ': 'Classover Holdings, Inc.',
-    'HPOT': 'Great Restaurant Development Holdings Ltd',
-    'CABI': 'EL-0713 Fund I, a series of Roll Up Vehicles, LP',
-    'SLGB': 'Smart Logistics Global Ltd',
-    'SYNSY': 'Syensqo SA/ADR',
-    'FGO': 'FG Holdings Ltd',
-    'BMGL': 'Basel Medical Group Ltd',
-    'HKPD': 'Hong Kong Pharma Digital Technology Holdings Ltd',
-    'GMHS': 'Gamehaus Holdings Inc.',
-    'ETHA': 'iShares Ethereum Trust ETF',
-    'SCAG': 'Scage Future',
-    'ICR-PA': 'InPoint Commercial Real Estate Income, Inc.',
-    'OUNZ': 'VanEck Merk Gold ETF',
-    'CBGGF': 'Chain Bridge I',
-    'CUPR': 'Cuprina Holdings (Cayman) LTD',
-    'KWM': 'K Wave Media Ltd.',
-    'CETH': '21Shares Core Ethereum ETF',
-    'QETH': 'Invesco Galaxy Ethereum ETF',
-    'LHAI': 'Linkhome Holdings Inc.',
-    'AGH': 'Aureus Greenway Holdings Inc',
-    'SYH': 'Mountain&Sea Health Inc.',
-    'KBSX': 'FST Corp.',
-    'MOLD': 'Molida Holding Group Co., Ltd',
-    'CFND': 'C1 Fund Inc.',
-    'NCG': 'HTL Capital Ltd.',
-    'ALPS': 'Alps Global Holding Pubco',
-    'CURX': 'Curanex Pharmaceuticals Inc',
-    'MDER': 'KVAC (Cayman) Ltd',
-    'MCTR': 'CTRL GROUP Ltd',
-    'WFF': 'WF Holding Ltd',
-    'HWEP': 'HW Electro Co., Ltd.',
-    'NNNN': 'Anbio Biotechnology',
-    'KNRX': 'KNOREX LTD.',
-    'FBIC': 'Functional Brands Inc.',
-    'KACLF': 'Kairous Acquisition Corp. Ltd',
-    'APXIF': 'APx Acquisition Corp. I',
-    'ESPA': 'Expectation Acquisition Corp',
-    'MAZE': 'Maze Therapeutics, Inc.',
-    'BTCO': 'Invesco Galaxy Bitcoin ETF',
-    'GSOL': 'Grayscale Solana Trust (SOL)',
-    'GACW': 'GACW Inc',
-    'FGDL': 'Franklin Templeton Holdings Trust',
-    'FFSH': 'Flag Fish Acquisition Corp',
-    'SUNH': 'Xuhang Holdings Ltd',
-    'AIMA': 'Aimfinity Investment Corp. I',
-    'MMCP': 'Mag Mile Capital, Inc.',
-    'PIF': 'North Haven Private Income Fund LLC',
-    'BTCW': 'WisdomTree Bitcoin Fund',
-    'XSIAX': 'VOYA CREDIT INCOME FUND',
-    'NRUC': 'NATIONAL RURAL UTILITIES COOPERATIVE FINANCE CORP /DC/',
-    'FXB': 'Invesco CurrencyShares British Pound Sterling Trust',
-    'FXC': 'Invesco CurrencyShares Canadian Dollar Trust',
-    'ELC': 'ENTERGY LOUISIANA, LLC',
-    'GEHDF': 'Great Eastern Holdings Ltd',
-    'ZCSH': 'Grayscale Zcash Trust (ZEC)',
-    'TSM': 'TAIWAN SEMICONDUCTOR MANUFACTURING CO LTD',
-    'CGEH': 'Capstone Green Energy Holdings, Inc.',
-    'CNCL': 'CANCER CAPITAL CORP',
-    'GJH': 'STRATS SM TRUST FOR U S CELL CORP SEC SERIES 2004 6',
-    'QVCD': 'QVC INC',
-    'MIFF': 'MIFFLINBURG BANCORP INC',
-    'IVHI': 'Invech Holdings, Inc.',
-    'ZLME': 'Zhanling International Ltd',
-    'GLTR': 'abrdn Precious Metals Basket ETF Trust',
-    'SFD': 'SMITHFIELD FOODS INC',
-    'BNPZY': 'BNP PARIBAS',
-    'NHPAP': 'National Healthcare Properties, Inc.',
-    'KTH': 'STRUCTURED PRODUCTS CORP CORTS TR FOR PECO ENERGY CAP TR III',
-    'GJP': 'STRATS(SM) TRUST FOR DOMINION RESOURCES, INC. SECURITIES, SERIES 2005-6',
-    'GJS': 'STRATS(SM) Trust for Goldman Sachs Group Securities, Series 2006-2',
-    'RNTX': 'Rein Therapeutics, Inc.',
-    'GPLB': 'Green Planet Bio Engineering Co. Ltd.',
-    'UGA': 'United States Gasoline Fund, LP',
-    'ODRS': 'Outdoor Specialty Products, Inc.',
-    'CSAI': 'CLOUDASTRUCTURE, INC.',
-    'ETCG': 'Grayscale Ethereum Classic Trust (ETC)',
-    'SIVR': 'abrdn Silver ETF Trust',
-    'SGOL': 'abrdn Gold ETF Trust',
-    'ETI-P': 'ENTERGY TEXAS, INC.',
-    'FXA': 'Invesco CurrencyShares Australian Dollar Trust',
-    'FXF': 'Invesco CurrencyShares Swiss Franc Trust',
-    'HDLMY': 'HeidelbergCement AG',
-    'IPB': 'MERRILL LYNCH DEPOSITOR INC INDEXPLUS TRUST SERIES 2003-1',
-    'JBK': 'LEHMAN ABS CORP GOLDMAN SACHS CAP 1 SEC BACKED SER 2004-6',
-    'HZEN': 'Grayscale Horizen Trust (ZEN)',
-    'TCSGQ': 'Container Store Group, Inc.',
-    'BITB': 'Bitwise Bitcoin ETF',
-    'IAUM': 'iShares Gold Trust Micro',
-    'GJR': 'STRATS(SM) Trust for Procter & Gamble Securities, Series 2006-1',
-    'USL': 'United States 12 Month Oil Fund, LP',
-    'PPLT': 'abrdn Platinum ETF Trust',
-    'ICDIQ': 'Independence Contract Drilling, Inc.',
-    'CPXTF': 'Siam Makro Public Co Limited/ADR',
-    'WETO': 'Webus International Ltd.',
-    'HXHX': 'Haoxin Holdings Ltd',
-    'ETHE': 'Grayscale Ethereum Trust ETF',
-    'TPTA': 'Terra Property Trust, Inc.',
-    'GLDM': 'World Gold Trust',
-    'NOEM': 'CO2 Energy Transition Corp.',
-    'PDSRX': 'Principal Real Asset Fund',
-    'GXLM': 'Grayscale Stellar Lumens Trust (XLM)',
-    'BYLT': 'Elite Performance Holding Corp',
-    'XPTFX': 'Federated Hermes Project & Trade Finance Tender Fund',
-    'ARKB': 'Ark 21Shares Bitcoin ETF',
-    'DDCIU': 'Diffuse Digital 30, LP',
-    'YMAT': 'J-Star Holding Co., Ltd.',
-    'FBTC': 'Fidelity Wise Origin Bitcoin Fund',
-    'ALSAF': 'Alpha Star Acquisition Corp',
-    'FPAQ': 'FPA ENERGY ACQUISITION CORP.',
-    'OCAC': 'Ocean Capital Acquisition Corp',
-    'EPWK': 'EPWK Holdings Ltd.',
-    'RYET': 'Ruanyun Edai Technology Inc.',
-    'APUS': 'Apimeds Pharmaceuticals US, Inc.',
-    'DIMR': 'DIAMIR BIOSCIENCES CORP.',
-    'PLTM': 'GraniteShares Platinum Trust',
-    'BITW': 'Bitwise 10 Crypto Index Fund',
-    'VISTA': 'Vista Energy, S.A.B. de C.V.',
-    'WDSP': 'World Scan Project, Inc.',
-    'ITRE': 'IntriEnergy, Inc.',
-    'GBAT': 'Grayscale Basic Attention Token Trust (BAT)',
-    'BRRR': 'CoinShares Valkyrie Bitcoin Fund',
-    'CRTAF': 'Cartica Acquisition Corp',
-    'LIMN': 'Iris Parent Holding Corp.',
-    'FFFZ': 'Fuxing China Group Ltd',
-    'MGN': 'Megan Holdings Ltd.',
-    'EFB': 'Everfront Biotech Holding Co Ltd',
-    'CIGL': 'Concorde International Group Ltd.',
-    'USIC': 'Uncle's Ice Cream',
-    'FOFA': 'Qualis Innovations, Inc.',
-    'MMVVF': 'MultiMetaVerse Holdings Ltd',
-    'OHHH': 'Orion Haus Homes & Hotels Inc.',
-    'TREO': 'Plum III Merger Corp.',
-    'RIBB': 'Ribbon Acquisition Corp.',
-    'FLOC': 'Flowco Holdings Inc.',
-    'RANG': 'Range Capital Acquisition Corp.',
-    'INR': 'INFINITY NATURAL RESOURCES, INC.',
-    'SAGT': 'SAGTEC GLOBAL Ltd',
-    'HMR': 'Heidmar Maritime Holdings Corp.',
-    'CHPG': 'ChampionsGate Acquisition Corp',
-    'FMFC': 'Kandal M Venture Ltd',
-    'ETH': 'Grayscale Ethereum Mini Trust ETF',
-    'CHAR': 'Charlton Aria Acquisition Corp',
-    'MSGY': 'Masonglory Ltd',
-    'OMSE': 'OMS Energy Technologies Inc.',
-    'IPCX': 'Inflection Point Acquisition Corp. III',
-    'GCL': 'GCL Global Holdings Ltd',
-    'EMPG': 'Empro Group Inc.',
-    'GOOG': 'Alphabet Inc.',
-    'BMYMP': 'BRISTOL MYERS SQUIBB CO',
-    'USB-PA': 'US BANCORP \DE\',
-    'BRK-A': 'BERKSHIRE HATHAWAY INC',
-    'TSMWF': 'TAIWAN SEMICONDUCTOR MANUFACTURING CO LTD',
-    'NONOF': 'NOVO NORDISK A S',
-    'JPM-PC': 'JPMORGAN CHASE & CO',
-    'JPM-PD': 'JPMORGAN CHASE & CO',
-    'BML-PH': 'BANK OF AMERICA CORP /DE/',
-    'BML-PG': 'BANK OF AMERICA CORP /DE/',
-    'ASMLF': 'ASML HOLDING NV',
-    'SAPGF': 'SAP SE',
-    'BAC-PE': 'BANK OF AMERICA CORP /DE/',
-    'BML-PJ': 'BANK OF AMERICA CORP /DE/',
-    'BML-PL': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PB': 'BANK OF AMERICA CORP /DE/',
-    'TOYOF': 'TOYOTA MOTOR CORP/',
-    'BAC-PK': 'BANK OF AMERICA CORP /DE/',
-    'PCCYF': 'PETROCHINA CO LTD',
-    'AZNCF': 'ASTRAZENECA PLC',
-    'NVSEF': 'NOVARTIS AG',
-    'RYDAF': 'Shell plc',
-    'WFC-PY': 'WELLS FARGO & COMPANY/MN',
-    'BABAF': 'Alibaba Group Holding Ltd',
-    'WFC-PL': 'WELLS FARGO & COMPANY/MN',
-    'HBCYF': 'HSBC HOLDINGS PLC',
-    'TBB': 'AT&T INC.',
-    'MBFJF': 'MITSUBISHI UFJ FINANCIAL GROUP INC',
-    'UL': 'UNILEVER PLC',
-    'UNLYF': 'UNILEVER PLC',
-    'BUDFF': 'Anheuser-Busch InBev SA/NV',
-    'EADSF': 'Airbus SE/ADR',
-    'TTFNF': 'TotalEnergies SE',
-    'SNEJF': 'Sony Group Corp',
-    'SNYNF': 'Sanofi',
-    'BHPLF': 'BHP Group Ltd',
-    'WFC-PC': 'WELLS FARGO & COMPANY/MN',
-    'CILJF': 'CHINA LIFE INSURANCE CO LTD',
-    'BPAQF': 'BP PLC',
-    'RTPPF': 'RIO TINTO PLC',
-    'NCRRP': 'NCR Voyix Corp',
-    'NTTYY': 'NIPPON TELEGRAPH & TELEPHONE CORP',
-    'ABLZF': 'ABB LTD',
-    'ABBNY': 'ABB LTD',
-    'SMFNF': 'SUMITOMO MITSUI FINANCIAL GROUP, INC.',
-    'AIQUF': 'L AIR LIQUIDE SA /FI',
-    'CFRHF': 'COMPAGNIE FINANCIERE RICHEMONT AG /FI',
-    'STOHF': 'EQUINOR ASA',
-    'SNPMF': 'CHINA PETROLEUM & CHEMICAL CORP',
-    'GS-PA': 'GOLDMAN SACHS GROUP INC',
-    'MBGAF': 'DAIMLER AG',
-    'MS-PA': 'MORGAN STANLEY',
-    'GS-PD': 'GOLDMAN SACHS GROUP INC',
-    'BTAFF': 'British American Tobacco p.l.c.',
-    'USB-PH': 'US BANCORP \DE\',
-    'EBBNF': 'ENBRIDGE INC',
-    'TOELF': 'Tokyo Electron LTD',
-    'BNPQF': 'BNP PARIBAS',
-    'CTA-PB': 'EIDP, Inc.',
-    'USB-PP': 'US BANCORP \DE\',
-    'PPRUF': 'Kering',
-    'BCDRF': 'Banco Santander, S.A.',
-    'AMXOF': 'AMERICA MOVIL SAB DE CV/',
-    'GLCNF': 'Glencore plc/ADR',
-    'GLAXF': 'GSK plc',
-    'BNPQY': 'BNP PARIBAS',
-    'MS-PK': 'MORGAN STANLEY',
-    'DGEAF': 'DIAGEO PLC',
-    'MS-PI': 'MORGAN STANLEY',
-    'PBR-A': 'PETROBRAS - PETROLEO BRASILEIRO SA',
-    'MS-PF': 'MORGAN STANLEY',
-    'MS-PE': 'MORGAN STANLEY',
-    'FMCCT': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'RLXXF': 'RELX PLC',
-    'DUK-PA': 'Duke Energy CORP',
-    'NETTF': 'NetEase, Inc.',
-    'EIPAF': 'ENI SPA',
-    'JDCMF': 'JD.com, Inc.',
-    'CCZ': 'COMCAST CORP',
-    'BSQKZ': 'Block, Inc.',
-    'WEBNF': 'WESTPAC BANKING CORP',
-    'MZHOF': 'MIZUHO FINANCIAL GROUP INC',
-    'SCHW-PD': 'SCHWAB CHARLES CORP',
-    'PPWLM': 'PACIFICORP /OR/',
-    'NGGTF': 'NATIONAL GRID PLC',
-    'BYMOF': 'Bayerische Motoren Werke AG/ADR',
-    'BAMXF': 'Bayerische Motoren Werke AG/ADR',
-    'DKILF': 'Daikin Industries Ltd',
-    'BECEF': 'BCE INC',
-    'SPG-PJ': 'SIMON PROPERTY GROUP INC /DE/',
-    'TNCAF': 'TC ENERGY CORP',
-    'INGVF': 'ING GROEP NV',
-    'MET-PA': 'METLIFE INC',
-    'HNDAF': 'HONDA MOTOR CO LTD',
-    'BAESF': 'BAE SYSTEMS PLC /FI/',
-    'MET-PE': 'METLIFE INC',
-    'TKPHF': 'TAKEDA PHARMACEUTICAL CO LTD',
-    'TRPCF': 'Trip.com Group Ltd',
-    'LLDTF': 'Lloyds Banking Group plc',
-    'PLDGP': 'Prologis, Inc.',
-    'WOPEF': 'WOODSIDE ENERGY GROUP LTD',
-    'BBVXF': 'BANCO BILBAO VIZCAYA ARGENTARIA, S.A.',
-    'HLNCF': 'Haleon plc',
-    'DNZOF': 'Denso Corp',
-    'TCANF': 'TC ENERGY CORP',
-    'PSA-PH': 'Public Storage',
-    'PPWLO': 'PACIFICORP /OR/',
-    'SVNDF': 'SEVEN & I HOLDINGS CO LTD',
-    'PUKPF': 'PRUDENTIAL PLC',
-    'BAMGF': 'BROOKFIELD Corp /ON/',
-    'MRAAF': 'Murata Manufacturing Co., Ltd./ADR',
-    'TCKRF': 'TECK RESOURCES LTD',
-    'CRARF': 'CREDIT AGRICOLE S A',
-    'ALL-PH': 'ALLSTATE CORP',
-    'PSA-PK': 'Public Storage',
-    'RBSPF': 'NatWest Group plc',
-    'ALL-PB': 'ALLSTATE CORP',
-    'FNCTF': 'ORANGE',
-    'FUJIF': 'FUJI PHOTO FILM CO LTD /FI',
-    'LEN-B': 'LENNAR CORP /NEW/',
-    'CAJPY': 'CANON INC',
-    'CIXPF': 'CaixaBank/ADR',
-    'FCNCB': 'FIRST CITIZENS BANCSHARES INC /DE/',
-    'BCLYF': 'BARCLAYS PLC',
-    'RSMDF': 'RESMED INC',
-    'ERIXF': 'ERICSSON LM TELEPHONE CO',
-    'HEI-A': 'HEICO CORP',
-    'LAAOF': 'Li Auto Inc.',
-    'ORXCF': 'ORIX CORP',
-    'TEFOF': 'TELEFONICA S A',
-    'BBDO': 'BANK BRADESCO',
-    'GNMSF': 'GENMAB A/S',
-    'BAIDF': 'Baidu, Inc.',
-    'ANNSF': 'Aena S.A./ADR',
-    'DLR-PK': 'DIGITAL REALTY TRUST, INC.',
-    'RCIAF': 'ROGERS COMMUNICATIONS INC',
-    'NOKBF': 'NOKIA CORP',
-    'HDELY': 'HeidelbergCement AG',
-    'CJPRF': 'CENTRAL JAPAN RAILWAY CO',
-    'AMSYF': 'ArcelorMittal',
-    'STMEF': 'STMicroelectronics N.V.',
-    'DLR-PJ': 'DIGITAL REALTY TRUST, INC.',
-    'RYAOF': 'RYANAIR HOLDINGS PLC',
-    'MKC-V': 'MCCORMICK & CO INC',
-    'TNRSF': 'TENARIS SA',
-    'RSTRF': 'Restaurant Brands International Limited Partnership',
-    'FWONK': 'Liberty Media Corp',
-    'FWONA': 'Liberty Media Corp',
-    'CAJFF': 'CANON INC',
-    'SOJC': 'SOUTHERN CO',
-    'YAHOF': 'Yahoo! Japan Corp',
-    'VODPF': 'VODAFONE GROUP PUBLIC LTD CO',
-    'FOX': 'Fox Corp',
-    'COCSF': 'COCA COLA FEMSA SAB DE CV',
-    'STT-PG': 'STATE STREET CORP',
-    'PGPEF': 'PUBLICIS GROUPE SA',
-    'WLMIF': 'Wilmar International Ltd',
-    'EJPRF': 'EAST JAPAN RAILWAY CO /FI',
-    'FWONB': 'Liberty Media Corp',
-    'HIG-PG': 'HARTFORD FINANCIAL SERVICES GROUP, INC.',
-    'FITBI': 'FIFTH THIRD BANCORP',
-    'DUKH': 'Duke Energy CORP',
-    'POAHF': 'Porsche Automobil Holding SE / ADR',
-    'RKLIF': 'RENTOKIL INITIAL PLC /FI',
-    'HRNNF': 'Hydro One Ltd',
-    'OMVJF': 'OMV AKTIENGESELLSCHAFT /FI',
-    'NRSCF': 'NOMURA HOLDINGS INC',
-    'SGSOF': 'SGS SOCIETE GENERALE DE SURVEILLANCE HOLDING SA /FI',
-    'Z': 'ZILLOW GROUP, INC.',
-    'JHIUF': 'James Hardie Industries plc',
-    'PPERF': 'PT Bank Mandiri (Persero) Tbk / ADR',
-    'SPXSF': 'Spirax-Sarco Engineering PLC/ADR',
-    'RYLPF': 'KONINKLIJKE PHILIPS NV',
-    'AMCCF': 'Amcor plc',
-    'FAXXF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'NWS': 'NEWS CORP',
-    'BF-B': 'BROWN FORMAN CORP',
-    'BIO-B': 'BIO-RAD LABORATORIES, INC.',
-    'CHEAF': 'CHINA EASTERN AIRLINES CORP LTD',
-    'FNMAS': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'CHKIF': 'CHINA SOUTHERN AIRLINES CO LTD',
-    'ADTTF': 'ADVANTEST CORP',
-    'HLBZF': 'HeidelbergCement AG',
-    'KEY-PK': 'KEYCORP /NEW/',
-    'KKPNF': 'KONINKLIJKE KPN N V',
-    'TEVJF': 'TEVA PHARMACEUTICAL INDUSTRIES LTD',
-    'SSMXF': 'Sysmex Corporation/ADR',
-    'CRERF': 'CARREFOUR SA',
-    'FRFGF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'FNMAJ': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'KEY-PJ': 'KEYCORP /NEW/',
-    'FNMAH': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'NLY-PG': 'ANNALY CAPITAL MANAGEMENT INC',
-    'JBARF': 'Julius Baer Group Ltd.',
-    'SGIOF': 'SHIONOGI & CO LTD',
-    'NHOLF': 'Sompo Japan Nipponkoa Holdings, Inc./ADR',
-    'FRFFF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'PTPIF': 'PT Chandra Asri Petrochemical Tbk/ADR',
-    'NLY-PF': 'ANNALY CAPITAL MANAGEMENT INC',
-    'HKHGF': 'HONGKONG LAND HOLDINGS LTD /FI',
-    'NVZMF': 'NOVOZYMES AS/FI',
-    'APO-PA': 'Apollo Global Management, Inc.',
-    'KEY-PI': 'KEYCORP /NEW/',
-    'FNGD': 'BANK OF MONTREAL /CAN/',
-    'GFIOF': 'GOLD FIELDS LTD',
-    'FRFXF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'NCSYF': 'NICE Ltd.',
-    'SVYSF': 'SOLVAY S A /ADR/',
-    'EBR-B': 'BRAZILIAN ELECTRIC POWER CO',
-    'ACGLO': 'ARCH CAPITAL GROUP LTD.',
-    'WSO-B': 'WATSCO INC',
-    'FMCQF': 'Fresenius Medical Care AG',
-    'MAA-PI': 'MID AMERICA APARTMENT COMMUNITIES INC.',
-    'LBRDB': 'Liberty Broadband Corp',
-    'RF-PC': 'REGIONS FINANCIAL CORP',
-    'SNNUF': 'SMITH & NEPHEW PLC',
-    'SHECF': 'Shin-Etsu Chemical Co., Ltd.',
-    'HUNGF': 'HUANENG POWER INTERNATIONAL INC',
-    'LBRDK': 'Liberty Broadband Corp',
-    'BZLFF': 'BUNZL PLC',
-    'ALMMF': 'ALUMINUM CORP OF CHINA LTD',
-    'ERRAF': 'EMERA INC',
-    'XPNGF': 'XPENG INC.',
-    'OLCLF': 'Oriental Land Co., Ltd./ADR',
-    'UHAL-B': 'U-Haul Holding Co /NV/',
-    'TAP-A': 'MOLSON COORS BEVERAGE CO',
-    'PBNNF': 'PT Bank Negara Indonesia (Persero) Tbk/ADR',
-    'WPPGF': 'WPP plc',
-    'NNGPF': 'NN Group NV/ADR',
-    'AOMFF': 'ALSTOM',
-    'KIKOF': 'Kikkoman Corp',
-    'AEGOF': 'AEGON LTD.',
-    'CUKPF': 'CARNIVAL PLC',
-    'FREJO': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'YAMHF': 'Yamaha Motor Co., Ltd.',
-    'NDEKF': 'NITTO DENKO CORP / ADR/',
-    'RDEIF': 'Red Electrica Corporacion SA/ADR',
-    'JGSHF': 'JG Summit Holdings, Inc./ADR',
-    'LBTYB': 'Liberty Global Ltd.',
-    'GS-PC': 'GOLDMAN SACHS GROUP INC',
-    'GPAEF': 'Pacific Airport Group',
-    'UEPCN': 'UNION ELECTRIC CO',
-    'CXMSF': 'CEMEX SAB DE CV',
-    'OUKPF': 'Outotec OYJ',
-    'NIOIF': 'NIO Inc.',
-    'PSORF': 'PEARSON PLC',
-    'AGNCM': 'AGNC Investment Corp.',
-    'AGNCN': 'AGNC Investment Corp.',
-    'RZB': 'REINSURANCE GROUP OF AMERICA INC',
-    'UEPEO': 'UNION ELECTRIC CO',
-    'UEPEP': 'UNION ELECTRIC CO',
-    'FRT-PC': 'FEDERAL REALTY INVESTMENT TRUST',
-    'PSNYW': 'Polestar Automotive Holding UK PLC',
-    'SASOF': 'SASOL LTD',
-    'VNORP': 'VORNADO REALTY TRUST',
-    'ROHCF': 'ROHM Co., Ltd.',
-    'AMH-PH': 'American Homes 4 Rent',
-    'OSCUF': 'Japan Exchange Group, Inc./ADR',
-    'AMH-PG': 'American Homes 4 Rent',
-    'VNO-PL': 'VORNADO REALTY TRUST',
-    'ASRMF': 'SOUTHEAST AIRPORT GROUP',
-    'UEPCP': 'UNION ELECTRIC CO',
-    'VNO-PM': 'VORNADO REALTY TRUST',
-    'FMCCI': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'ATH-PA': 'Athene Holding Ltd.',
-    'PARAA': 'Paramount Global',
-    'RKUNF': 'Rakuten Group, Inc.',
-    'FMCKI': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'UEPEM': 'UNION ELECTRIC CO',
-    'UEPEN': 'UNION ELECTRIC CO',
-    'GIFLF': 'Grifols SA',
-    'PADEF': 'Adaro Energy PT/ADR/',
-    'GIFOF': 'Grifols SA',
-    'RNR-PF': 'RENAISSANCERE HOLDINGS LTD',
-    'VOYA-PB': 'Voya Financial, Inc.',
-    'BLBLF': 'Bilibili Inc.',
-    'KIM-PM': 'KIMCO REALTY CORP',
-    'JCYCF': 'Jardine Cycle & Carriage Ltd.',
-    'DSECF': 'Daiwa Securities Group Inc.',
-    'CMSA': 'CMS ENERGY CORP',
-    'MEJHF': 'MEIJI Holdings Co Ltd/ADR',
-    'KIM-PL': 'KIMCO REALTY CORP',
-    'SLG-PI': 'SL GREEN REALTY CORP',
-    'FANUF': 'Fanuc Ltd',
-    'BCUCF': 'Brunello Cucinelli S.p.A./ADR',
-    'KAKKF': 'Kawasaki Kisen Kaisha Ltd',
-    'PCG-PA': 'PG&E Corp',
-    'FUPEF': 'Fuchs Petrolub SE/ADR',
-    'GIKLY': 'Grifols SA',
-    'QBCRF': 'QUEBECOR MEDIA INC',
-    'QBCAF': 'QUEBECOR MEDIA INC',
-    'CIG-C': 'ENERGY CO OF MINAS GERAIS',
-    'PCG-PB': 'PG&E Corp',
-    'VIST': 'Vista Energy, S.A.B. de C.V.',
-    'OAK-PB': 'Brookfield Oaktree Holdings, LLC',
-    'UNMA': 'Unum Group',
-    'BKGFF': 'Berkeley Group Holdings plc',
-    'BPOPO': 'POPULAR, INC.',
-    'SNV-PD': 'SYNOVUS FINANCIAL CORP',
-    'JSM': 'NAVIENT CORP',
-    'PCG-PE': 'PG&E Corp',
-    'HGMCF': 'HARMONY GOLD MINING CO LTD',
-    'CWEN-A': 'Clearway Energy, Inc.',
-    'PHTCF': 'PLDT Inc.',
-    'THNPY': 'Technip Energies N.V.',
-    'ATGFF': 'AltaGas Ltd.',
-    'PPENF': 'Pampa Energy Inc.',
-    'TCMFF': 'TELECOM ARGENTINA SA',
-    'BHFAL': 'Brighthouse Financial, Inc.',
-    'GAB-PG': 'GABELLI EQUITY TRUST INC',
-    'PCG-PD': 'PG&E Corp',
-    'EPR-PG': 'EPR PROPERTIES',
-    'PCG-PC': 'PG&E Corp',
-    'FNMFN': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'AFRAF': 'AIR FRANCE-KLM /FI',
-    'PCG-PH': 'PG&E Corp',
-    'BZZUF': 'BUZZI UNICEM S.p.A.',
-    'TKAYF': 'Just Eat Takeaway.com N.V.',
-    'FURCF': 'FORVIA SE/ADR',
-    'LBTYK': 'Liberty Global Ltd.',
-    'PCG-PG': 'PG&E Corp',
-    'GAERF': 'Central North Airport Group',
-    'RUSHB': 'RUSH ENTERPRISES INC TX',
-    'AXS-PE': 'AXIS CAPITAL HOLDINGS LTD',
-    'DTW': 'DTE ENERGY CO',
-    'SR-PA': 'SPIRE INC',
-    'DFRYF': 'Dufry AG/ADR',
-    'PCG-PI': 'PG&E Corp',
-    'JBT': 'JBT Marel Corp',
-    'DISPF': 'Disco Corporation/ADR',
-    'SLMBP': 'SLM Corp',
-    'REXR-PB': 'Rexford Industrial Realty, Inc.',
-    'THNPF': 'Technip Energies N.V.',
-    'SF-PB': 'STIFEL FINANCIAL CORP',
-    'TWO-PC': 'TWO HARBORS INVESTMENT CORP.',
-    'BHFAP': 'Brighthouse Financial, Inc.',
-    'JTKWY': 'Just Eat Takeaway.com N.V.',
-    'WTFCM': 'WINTRUST FINANCIAL CORP',
-    'PBI-PB': 'PITNEY BOWES INC /DE/',
-    'CIM-PD': 'CHIMERA INVESTMENT CORP',
-    'CIM-PB': 'CHIMERA INVESTMENT CORP',
-    'UA': 'Under Armour, Inc.',
-    'CIM-PC': 'CHIMERA INVESTMENT CORP',
-    'LIFX': 'Life360, Inc.',
-    'MOG-B': 'MOOG INC.',
-    'ESGRP': 'Enstar Group LTD',
-    'TWO-PB': 'TWO HARBORS INVESTMENT CORP.',
-    'MYTHF': 'Mytilineos Holdings S.A.',
-    'TWO-PA': 'TWO HARBORS INVESTMENT CORP.',
-    'CIXXF': 'CI Financial Corp.',
-    'VLYPP': 'VALLEY NATIONAL BANCORP',
-    'SPTJF': 'SINOPEC SHANGHAI PETROCHEMICAL CO LTD',
-    'WRB-PE': 'BERKLEY W R CORP',
-    'WBS-PF': 'WEBSTER FINANCIAL CORP',
-    'ESGRO': 'Enstar Group LTD',
-    'GEF-B': 'GREIF, INC',
-    'VLYPO': 'VALLEY NATIONAL BANCORP',
-    'RLJ-PA': 'RLJ Lodging Trust',
-    'PEB-PF': 'Pebblebrook Hotel Trust',
-    'PEB-PE': 'Pebblebrook Hotel Trust',
-    'ASB-PE': 'ASSOCIATED BANC-CORP',
-    'CIM-PA': 'CHIMERA INVESTMENT CORP',
-    'ROYMF': 'Royal Mail plc/ADR',
-    'PEGRF': 'Pennon Group Plc / ADR',
-    'MFA-PB': 'MFA FINANCIAL, INC.',
-    'AKO-B': 'ANDINA BOTTLING CO INC',
-    'TY-P': 'TRI-CONTINENTAL Corp',
-    'GNGYF': 'GUANGSHEN RAILWAY CO LTD',
-    'HOVNP': 'HOVNANIAN ENTERPRISES INC',
-    'HMDCF': 'HUTCHMED (China) Ltd',
-    'FMCCG': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'SBYSF': 'Sibanye Stillwater Ltd',
-    'FNMAM': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'SOCGP': 'SOUTHERN CALIFORNIA GAS CO',
-    'AILLI': 'Ameren Illinois Co',
-    'NSA-PA': 'National Storage Affiliates Trust',
-    'BATRB': 'Atlanta Braves Holdings, Inc.',
-    'WELPP': 'WISCONSIN ELECTRIC POWER CO',
-    'TRTN-PA': 'Triton International Ltd',
-    'AILLM': 'Ameren Illinois Co',
-    'AILLN': 'Ameren Illinois Co',
-    'BATRK': 'Atlanta Braves Holdings, Inc.',
-    'FNMAN': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'TROLB': 'TOOTSIE ROLL INDUSTRIES INC',
-    'SRG-PA': 'Seritage Growth Properties',
-    'AILIM': 'Ameren Illinois Co',
-    'FMCCJ': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FNMAI': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'NHNKF': 'Nihon Kohden Corporation/ADR',
-    'CODQL': 'Coronado Global Resources Inc.',
-    'AILLO': 'Ameren Illinois Co',
-    'LXP-PC': 'LXP Industrial Trust',
-    'TKCM': 'TOKEN COMMUNITIES LTD.',
-    'CENTA': 'CENTRAL GARDEN & PET CO',
-    'FNMAT': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'AILIN': 'Ameren Illinois Co',
-    'FNMAK': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'FNMAL': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'IVR-PC': 'Invesco Mortgage Capital Inc.',
-    'FNMFM': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'AILLP': 'Ameren Illinois Co',
-    'AGM-A': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'GLPGF': 'GALAPAGOS NV',
-    'WLYB': 'JOHN WILEY & SONS, INC.',
-    'FNMAO': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'FNMAG': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'FNMFO': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'LGF-B': 'LIONS GATE ENTERTAINMENT CORP /CN/',
-    'ALTB': 'Alpine Auto Brokers Inc.',
-    'NGL-PB': 'NGL Energy Partners LP',
-    'GDV-PH': 'GABELLI DIVIDEND & INCOME TRUST',
-    'FISK': 'Empire State Realty OP, L.P.',
-    'GRPFF': 'GRUPO TELEVISA, S.A.B.',
-    'EVOTF': 'Evotec SE',
-    'NGL-PC': 'NGL Energy Partners LP',
-    'BFS-PD': 'SAUL CENTERS, INC.',
-    'FMCCL': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'OGCP': 'Empire State Realty OP, L.P.',
-    'FMCKL': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'PMT-PA': 'PennyMac Mortgage Investment Trust',
-    'GNL-PA': 'Global Net Lease, Inc.',
-    'PMT-PB': 'PennyMac Mortgage Investment Trust',
-    'STSFF': 'SmartStop Self Storage REIT, Inc.',
-    'GAB-PH': 'GABELLI EQUITY TRUST INC',
-    'HCXY': 'Hercules Capital, Inc.',
-    'LILAB': 'Liberty Latin America Ltd.',
-    'FMCCS': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'LILAK': 'Liberty Latin America Ltd.',
-    'MHLA': 'Maiden Holdings, Ltd.',
-    'ASAI': 'Sendas Distributor S.A.',
-    'FMCCO': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'AHL-PD': 'ASPEN INSURANCE HOLDINGS LTD',
-    'CODI-PA': 'Compass Diversified Holdings',
-    'NYMTN': 'NEW YORK MORTGAGE TRUST, INC.',
-    'GEAR': 'Revelyst, Inc.',
-    'CODI-PB': 'Compass Diversified Holdings',
-    'FMCKN': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FREJN': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FMCCN': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FMCKO': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'GLOP-PB': 'GasLog Partners LP',
-    'FMCKJ': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FMCKM': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'GLOP-PC': 'GasLog Partners LP',
-    'FREGP': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'GLOP-PA': 'GasLog Partners LP',
-    'FMCCH': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FMCCK': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'HL-PB': 'HECLA MINING CO/DE/',
-    'FMCCP': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FMCCM': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'INN-PE': 'Summit Hotel Properties, Inc.',
-    'AHH-PA': 'Armada Hoffler Properties, Inc.',
-    'FMCKP': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'BELFB': 'BEL FUSE INC /NJ',
-    'PLLTL': 'Piedmont Lithium Inc.',
-    'GRAF-UN': 'Graf Global Corp.',
-    'KBSR': 'KBS Real Estate Investment Trust III, Inc.',
-    'PSTX': 'Poseida Therapeutics, Inc.',
-    'IIPR-PA': 'INNOVATIVE INDUSTRIAL PROPERTIES INC',
-    'IRET': 'CENTERSPACE',
-    'GAM-PB': 'GENERAL AMERICAN INVESTORS CO INC',
-    'DEFTF': 'Defi Technologies, Inc.',
-    'HOVVB': 'HOVNANIAN ENTERPRISES INC',
-    'GTN-A': 'GRAY TELEVISION INC',
-    'SMBMF': 'SembCorp Marine Ltd.',
-    'MEOBF': 'MESOBLAST LTD',
-    'DRDGF': 'DRDGOLD LTD',
-    'BH': 'Biglari Holdings Inc.',
-    'KELYB': 'KELLY SERVICES INC',
-    'CMRE-PB': 'Costamare Inc.',
-    'AGM-PD': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'CMRE-PC': 'Costamare Inc.',
-    'CMRE-PD': 'Costamare Inc.',
-    'CELJF': 'Cellcom Israel Ltd.',
-    'EXTO': 'Almacenes Exito S.A.',
-    'HLTC': 'National Healthcare Properties, Inc.',
-    'HVT-A': 'HAVERTY FURNITURE COMPANIES INC',
-    'GGT-PE': 'GABELLI MULTIMEDIA TRUST INC.',
-    'GAMI': 'GAMCO INVESTORS, INC. ET AL',
-    'ATROB': 'ASTRONICS CORP',
-    'GGN-PB': 'GAMCO Global Gold, Natural Resources & Income Trust',
-    'ARTNB': 'ARTESIAN RESOURCES CORP',
-    'DGICB': 'DONEGAL GROUP INC',
-    'BRSYF': 'Brainsway Ltd.',
-    'UMH-PD': 'UMH PROPERTIES, INC.',
-    'MITT-PA': 'AG Mortgage Investment Trust, Inc.',
-    'CUBI-PE': 'Customers Bancorp, Inc.',
-    'ECCX': 'Eagle Point Credit Co Inc.',
-    'CUBI-PF': 'Customers Bancorp, Inc.',
-    'MITT-PB': 'AG Mortgage Investment Trust, Inc.',
-    'NEWTI': 'NewtekOne, Inc.',
-    'OXLCO': 'Oxford Lane Capital Corp.',
-    'AIRTP': 'AIR T INC',
-    'CRD-B': 'CRAWFORD & CO',
-    'PTCHF': 'PureTech Health plc',
-    'NCV-PA': 'Virtus Convertible & Income Fund',
-    'GMRE-PA': 'Global Medical REIT Inc.',
-    'WBHC': 'WILSON BANK HOLDING CO',
-    'LANDM': 'GLADSTONE LAND Corp',
-    'SENEB': 'Seneca Foods Corp',
-    'SPLP-PA': 'STEEL PARTNERS HOLDINGS L.P.',
-    'ERLFF': 'Entree Resources Ltd.',
-    'CIO-PA': 'City Office REIT, Inc.',
-    'THPTF': 'Techpoint, Inc.',
-    'GAINL': 'GLADSTONE INVESTMENT CORPORATION\DE',
-    'AVHHL': 'AVITA Medical, Inc.',
-    'GUT-PC': 'GABELLI UTILITY TRUST',
-    'VSOGF': 'Vista Energy, S.A.B. de C.V.',
-    'HEAR': 'Turtle Beach Corp',
-    'CKDXF': 'Opthea Ltd',
-    'CNTHP': 'CONNECTICUT LIGHT & POWER CO',
-    'IHRTB': 'iHeartMedia, Inc.',
-    'CNLPL': 'CONNECTICUT LIGHT & POWER CO',
-    'NCZ-PA': 'Virtus Convertible & Income Fund II',
-    'DFPH': 'Oncology Institute, Inc.',
-    'DSX-PB': 'DIANA SHIPPING INC.',
-    'CNTHO': 'CONNECTICUT LIGHT & POWER CO',
-    'CHMI-PB': 'Cherry Hill Mortgage Investment Corp',
-    'HAWLN': 'HAWAIIAN ELECTRIC CO INC',
-    'BHR-PD': 'Braemar Hotels & Resorts Inc.',
-    'CNTHN': 'CONNECTICUT LIGHT & POWER CO',
-    'SLNCF': 'Silence Therapeutics plc',
-    'HAWEN': 'HAWAIIAN ELECTRIC CO INC',
-    'BHR-PB': 'Braemar Hotels & Resorts Inc.',
-    'NVNXF': 'NOVONIX Ltd',
-    'CNLHO': 'CONNECTICUT LIGHT & POWER CO',
-    'APLMW': 'Apollomics Inc.',
-    'CNLHP': 'CONNECTICUT LIGHT & POWER CO',
-    'ARCXF': 'ArcelorMittal',
-    'CNLTP': 'CONNECTICUT LIGHT & POWER CO',
-    'AHT-PF': 'ASHFORD HOSPITALITY TRUST INC',
-    'MIESF': 'Mitsui E&S Holdings Co., Ltd./ADR',
-    'GSCCF': 'ioneer Ltd',
-    'CNLTL': 'CONNECTICUT LIGHT & POWER CO',
-    'IPHYF': 'Innate Pharma SA',
-    'CNPWM': 'CONNECTICUT LIGHT & POWER CO',
-    'PRTHU': 'Priority Technology Holdings, Inc.',
-    'CHMI-PA': 'Cherry Hill Mortgage Investment Corp',
-    'AHT-PI': 'ASHFORD HOSPITALITY TRUST INC',
-    'CNPWP': 'CONNECTICUT LIGHT & POWER CO',
-    'AHT-PH': 'ASHFORD HOSPITALITY TRUST INC',
-    'LANDP': 'GLADSTONE LAND Corp',
-    'CNLPM': 'CONNECTICUT LIGHT & POWER CO',
-    'RVRF': 'River Financial Corp',
-    'AHT-PG': 'ASHFORD HOSPITALITY TRUST INC',
-    'CNLTN': 'CONNECTICUT LIGHT & POWER CO',
-    'AHT-PD': 'ASHFORD HOSPITALITY TRUST INC',
-    'MVXM': 'MOVEIX INC.',
-    'ENO': 'ENTERGY NEW ORLEANS, LLC',
-    'FGPRB': 'FERRELLGAS PARTNERS L P',
-    'CNLHN': 'CONNECTICUT LIGHT & POWER CO',
-    'IVEVF': 'Inventiva S.A.',
-    'PIIVX': 'Private Shares Fund',
-    'SB-PC': 'SAFE BULKERS, INC.',
-    'SB-PD': 'SAFE BULKERS, INC.',
-    'EBRCZ': 'EBR Systems, Inc.',
-    'SRNE': 'Sorrento Therapeutics, Inc.',
-    'QRTEB': 'Qurate Retail, Inc.',
-    'DLNG-PA': 'Dynagas LNG Partners LP',
-    'AONC': 'American Oncology Network, Inc.',
-    'MOYFF': 'Mynaric AG',
-    'CDR-PC': 'CEDAR REALTY TRUST, INC.',
-    'LTRPB': 'Liberty TripAdvisor Holdings, Inc.',
-    'CDR-PB': 'CEDAR REALTY TRUST, INC.',
-    'BBXIB': 'BBX Capital, Inc.',
-    'LKCRU': 'LAKE AREA CORN PROCESSORS LLC',
-    'VOLT': 'VOLT INFORMATION SCIENCES, INC.',
-    'WONDF': 'WonderFi Technologies Inc.',
-    'TDACU': 'Translational Development Acquisition Corp.',
-    'RTNXF': 'Renalytix plc',
-    'PFIE': 'PROFIRE ENERGY INC',
-    'ECF-PA': 'ELLSWORTH GROWTH & INCOME FUND LTD',
-    'RDIB': 'READING INTERNATIONAL INC',
-    'FATBB': 'Fat Brands, Inc',
-    'SOHOO': 'Sotherly Hotels Inc.',
-    'NSRCF': 'NextSource Materials Inc.',
-    'BCV-PA': 'BANCROFT FUND LTD',
-    'LGYV': 'LEGACY VENTURES INTERNATIONAL INC.',
-    'RGBPP': 'Regen BioPharma Inc',
-    'GLU-PB': 'GABELLI GLOBAL UTILITY & INCOME TRUST',
-    'CITE': 'Cartica Acquisition Corp',
-    'GNTLF': 'GENETIC TECHNOLOGIES LTD',
-    'RLFTF': 'Relief Therapeutics Holding SA',
-    'ZHYBF': 'Zhong Yuan Bio-Technology Holdings Ltd',
-    'OFSTF': 'Carbon Streaming Corp',
-    'GSL-PB': 'Global Ship Lease, Inc.',
-    'BCTF': 'Bancorp 34, Inc.',
-    'DLNG-PB': 'Dynagas LNG Partners LP',
-    'MPVDF': 'Mountain Province Diamonds Inc.',
-    'ILLMF': 'illumin Holdings Inc.',
-    'STCN': 'Steel Connect, Inc.',
-    'SOHON': 'Sotherly Hotels Inc.',
-    'SOHOB': 'Sotherly Hotels Inc.',
-    'MDNAF': 'Medicenna Therapeutics Corp.',
-    'BKSC': 'BANK OF SOUTH CAROLINA CORP',
-    'BHAC': 'Focus Impact BH3 Acquisition Co',
-    'TCBC': 'TC Bancshares, Inc.',
-    'ZIVO': 'Zivo Bioscience, Inc.',
-    'CULL': 'Cullman Bancorp, Inc. /MD/',
-    'KLDI': 'KLDiscovery Inc.',
-    'GWIN': 'GLORYWIN ENTERTAINMENT GROUP, INC.',
-    'OFED': 'Oconee Federal Financial Corp.',
-    'UBOH': 'UNITED BANCSHARES INC/OH',
-    'MTMV': 'Motomova Inc',
-    'FFBW': 'FFBW, Inc. /MD/',
-    'RLFTY': 'Relief Therapeutics Holding SA',
-    'GFASY': 'Gafisa S.A.',
-    'UONEK': 'URBAN ONE, INC.',
-    'HAFG': 'Holistic Asset Finance Group Co., Ltd.',
-    'CIZN': 'CITIZENS HOLDING CO /MS/',
-    'CPTN': 'Cepton, Inc.',
-    'LCHD': 'Leader Capital Holdings Corp.',
-    'MPAD': 'MICROPAC INDUSTRIES INC',
-    'YELLQ': 'Yellow Corp',
-    'SMTSF': 'Sierra Metals Inc.',
-    'AZREF': 'Azure Power Global Ltd',
-    'NZEOF': 'New Zealand Oil & Gas Ltd/ADR',
-    'ALRN': 'Rein Therapeutics, Inc.',
-    'CHTH': 'CNL Healthcare Properties, Inc.',
-    'AATC': 'AUTOSCOPE TECHNOLOGIES CORP',
-    'MSVB': 'Mid-Southern Bancorp, Inc.',
-    'AVLNF': 'Avalon Advanced Materials Inc.',
-    'IDWM': 'IDW MEDIA HOLDINGS, INC.',
-    'WSKEF': 'Wisekey International Holding S.A.',
-    'FBIOP': 'Fortress Biotech, Inc.',
-    'YQAI': 'YOUNEEQAI TECHNICAL SERVICES, INC.',
-    'GBNY': 'Generations Bancorp NY, Inc.',
-    'BIOE': 'Bio Essence Corp',
-    'ARBKF': 'Argo Blockchain Plc',
-    'DSHK': 'Drive Shack Inc.',
-    'ACMB': 'AGRO CAPITAL MANAGEMENT CORP.',
-    'GWLL': 'GOLDENWELL BIOTECH, INC.',
-    'ENDI': 'ENDI Corp.',
-    'TETAA': 'Teton Advisors, Inc.',
-    'OSBK': 'OCONEE FINANCIAL CORP',
-    'HSTI': 'High Sierra Technologies, Inc.',
-    'XTXXF': 'Adastra Holdings Ltd.',
-    'RSCI': 'Redwood Scientific Technologies, Inc.',
-    'WVVIP': 'WILLAMETTE VALLEY VINEYARDS INC',
-    'INFT': 'Infinity Bancorp',
-    'FIGI': 'Freedom Internet Group Inc.',
-    'PGID': 'PEREGRINE INDUSTRIES INC',
-    'BQST': 'Bioquest Corp',
-    'SKYI': 'Sky Century Investment, Inc.',
-    'TBBA': 'TEB Bancorp, Inc.',
-    'AFGC': 'AMERICAN FINANCIAL GROUP INC',
-    'RGF': 'Real Good Food Company, Inc.',
-    'WVFC': 'WVS FINANCIAL CORP',
-    'SALM': 'SALEM MEDIA GROUP, INC. /DE/',
-    'IMUC': 'EOM Pharmaceutical Holdings, Inc.',
-    'PWCO': 'PwrCor, Inc.',
-    'WHLM': 'Wilhelmina International, Inc.',
-    'PALT': 'INTELLIGENT PROTECTION MANAGEMENT CORP.',
-    'TETAB': 'Teton Advisors, Inc.',
-    'ARRKF': 'ARRAS MINERALS CORP.',
-    'SGTM': 'Sustainable Green Team, Ltd.',
-    'GLACU': 'Global Lights Acquisition Corp',
-    'MMV': 'MultiMetaVerse Holdings Ltd',
-    'FNCH': 'Finch Therapeutics Group, Inc.',
-    'OWVI': 'One World Ventures Inc',
-    'NPLS': 'NP Life Sciences Health Industry Group Inc.',
-    'CSSI': 'Standard Dental Labs Inc.',
-    'CATG': 'Capstone Technologies Group Inc.',
-    'CYCCP': 'Cyclacel Pharmaceuticals, Inc.',
-    'WHLRD': 'Wheeler Real Estate Investment Trust, Inc.',
-    'EGLXF': 'Enthusiast Gaming Holdings Inc. / Canada',
-    'GBCS': 'SELECTIS HEALTH, INC.',
-    'SFWJ': 'Software Effective Solutions, Corp.',
-    'ODDAF': 'Odd Burger Corp',
-    'SFES': 'SAFEGUARD SCIENTIFICS INC',
-    'SPTY': 'SPECIFICITY, INC.',
-    'PMDI': 'PSYCHEMEDICS CORP',
-    'ZKGCF': 'ZKGC New Energy Ltd',
-    'PRNAF': 'ALTERITY THERAPEUTICS LTD',
-    'WBSR': 'Webstar Technology Group Inc.',
-    'FZMD': 'Fuse Medical, Inc.',
-    'ERKH': 'Eureka Homestead Bancorp, Inc.',
-    'MCLE': 'Medicale Corp.',
-    'BNSOF': 'BONSO ELECTRONICS INTERNATIONAL INC',
-    'TVE': 'Tennessee Valley Authority',
-    'TVC': 'Tennessee Valley Authority',
-    'LNDZF': 'EVOME MEDICAL TECHNOLOGIES INC.',
-    'MARX': 'Mars Acquisition Corp.',
-    'BRCNF': 'Burcon NutraScience Corp',
-    'SGLDF': 'KIDOZ INC.',
-    'ARMC': 'Un Monde International Ltd.',
-    'EXNRF': 'EXCELLON RESOURCES INC',
-    'EVTK': 'EVENTIKO INC.',
-    'FGCO': 'Financial Gravity Companies, Inc.',
-    'EGRX': 'EAGLE PHARMACEUTICALS, INC.',
-    'EVOL': 'Symbolic Logic, Inc.',
-    'CJAX': 'CoJax Oil & Gas Corp',
-    'PQEFF': 'PETROTEQ ENERGY INC.',
-    'VQSSF': 'VIQ Solutions Inc.',
-    'FULO': 'FULLNET COMMUNICATIONS INC',
-    'SHVLF': 'STARCORE INTERNATIONAL MINES LTD.',
-    'SGIC': 'Strategic Realty Trust, Inc.',
-    'NEXCF': 'Nextech3D.AI Corp.',
-    'HGLD': 'Patagonia Gold Corp.',
-    'BIXT': 'BIOXYTRAN, INC',
-    'FBDS': 'Fuss Brands Corp.',
-    'FALC': 'FALCONSTOR SOFTWARE INC',
-    'SILEF': 'Silver Elephant Mining Corp.',
-    'ADMQ': 'ADM ENDEAVORS, INC.',
-    'UCASU': 'UC Asset LP',
-    'SITS': 'SOUTHERN ITS INTERNATIONAL, INC.',
-    'VIDE': 'VIDEO DISPLAY CORP',
-    'MVCO': 'Metavesco, Inc.',
-    'GLUC': 'Glucose Health, Inc.',
-    'BLYQ': 'BALLY, CORP.',
-    'SIPN': 'SIPP International Industries, Inc.',
-    'JETR': 'Star Jets International Inc.',
-    'FXLV': 'F45 Training Holdings Inc.',
-    'FRTX': 'Fresh Tracks Therapeutics, Inc.',
-    'NVDEF': 'URZ3 ENERGY CORP.',
-    'PNPL': 'PINEAPPLE, INC.',
-    'UCIX': 'Umbra Companies, Inc.',
-    'PRPI': 'PERPETUAL INDUSTRIES INC.',
-    'ZPTA': 'Zapata Computing Holdings Inc.',
-    'CMOT': 'Curtiss Motorcycle Company, Inc.',
-    'SCYYF': 'SCANDIUM INTERNATIONAL MINING CORP.',
-    'SNNC': 'Sibannac, Inc.',
-    'WDLF': 'Decentral Life, Inc.',
-    'RBCN': 'Rubicon Technology, Inc.',
-    'RSHN': 'RushNet, Inc.',
-    'SWISF': 'Sekur Private Data Ltd.',
-    'AMTY': 'AMERITYRE CORP',
-    'TLIS': 'Talis Biomedical Corp',
-    'CANB': 'Can B Corp',
-    'MTTCF': 'Steakholder Foods Ltd.',
-    'AMMX': 'Ameramex International Inc',
-    'HALB': 'Halberd Corp',
-    'JSHG': 'JOSHUA GOLD RESOURCES INC',
-    'GRDAF': 'Guardforce AI Co., Ltd.',
-    'GEMZ': 'Gemxx Corp.',
-    'TGNT': 'Totaligent, Inc.',
-    'MCOA': 'Marijuana Co of America, Inc.',
-    'SMKG': 'SmartCard Marketing Systems Inc',
-    'ACRL': 'Atacama Resources International, Inc.',
-    'JFTH': 'Japan Food Tech Holdings, Inc.',
-    'FTRS': 'Futuris Co',
-    'LTES': 'Leet Technology Inc.',
-    'CETXP': 'CEMTREX INC',
-    'DTGI': 'Digerati Technologies, Inc.',
-    'SRMX': 'SADDLE RANCH MEDIA, INC.',
-    'MRGE': 'Mirage Energy Corp',
-    'CAPV': 'CABO VERDE CAPITAL INC.',
-    'SPQS': 'SportsQuest, Inc.',
-    'CRTD': 'Creatd, Inc.',
-    'RTON': 'Right On Brands, Inc.',
-    'ELRA': 'ELRAY RESOURCES, INC.',
-    'GPFT': 'Grapefruit USA, Inc',
-    'TKOI': 'TELKONET INC',
-    'SVVC': 'Firsthand Technology Value Fund, Inc.',
-    'SNWR': 'Sanwire Corp',
-    'PWDY': 'POWERDYNE INTERNATIONAL, INC.',
-    'BYOC': 'Beyond Commerce, Inc.',
-    'DCSX': 'Direct Communication Solutions, Inc.',
-    'PMEDF': 'Predictmedix Inc.',
-    'PCYN': 'PROCYON CORP',
-    'PAANF': 'Pan American Energy Corp. (Canada)',
-    'RDAR': 'RAADR, INC.',
-    'AGNPF': 'Algernon Pharmaceuticals Inc.',
-    'IGPK': 'Integrated Cannabis Solutions, Inc.',
-    'WHLRP': 'Wheeler Real Estate Investment Trust, Inc.',
-    'RELT': 'Reliant Holdings, Inc.',
-    'BDRL': 'BLONDER TONGUE LABORATORIES INC',
-    'TNBI': 'Tanke Biosciences Corp',
-    'USDP': 'USD Partners LP',
-    'BMXC': 'Bemax, Inc.',
-    'BRLL': 'Barrel Energy Inc.',
-    'MOBBW': 'Mobilicom Ltd',
-    'CNNC': 'Cannonau Corp.',
-    'DROP': 'Fuse Science, Inc.',
-    'IMPM': 'IMPAC MORTGAGE HOLDINGS INC',
-    'CGAC': 'CODE GREEN APPAREL CORP',
-    'ADXS': 'Ayala Pharmaceuticals, Inc.',
-    'GYST': 'GRAYSTONE COMPANY, INC.',
-    'KGKG': 'KONA GOLD BEVERAGE, INC.',
-    'WNFT': 'Worldwide NFT Inc.',
-    'ANDR': 'ANDREA ELECTRONICS CORP',
-    'MMMW': 'MASS MEGAWATTS WIND POWER INC',
-    'RHE-PA': 'REGIONAL HEALTH PROPERTIES, INC',
-    'SIRC': 'SOLAR INTEGRATED ROOFING CORP.',
-    'RKFL': 'ROCKETFUEL BLOCKCHAIN, INC.',
-    'WCUI': 'Wellness Center USA, Inc.',
-    'NSTC': 'Northern Star Investment Corp. III',
-    'GMZP': 'GEMZ Corp. NV',
-    'MGHL': 'MORGAN GROUP HOLDING CO',
-    'EHVVF': 'Ehave, Inc.',
-    'VIVE': 'VIVEVE MEDICAL, INC.',
-    'AXIM': 'AXIM BIOTECHNOLOGIES, INC.',
-    'ELST': 'ELECTRONIC SYSTEMS TECHNOLOGY INC',
-    'IWAL': 'iWallet Corp',
-    'CNCT': 'China Teletech Holding Inc',
-    'TLIF': 'TOCCA LIFE HOLDINGS, INC.',
-    'GMBL': 'ESPORTS ENTERTAINMENT GROUP, INC.',
-    'FKST': 'Flowerkist Skin Care & Cosmetics, Inc.',
-    'COUV': 'CORPORATE UNIVERSE INC',
-    'INNI': 'Innovaro, Inc.',
-    'TKMO': 'Tekumo, Inc.',
-    'PHBI': 'Pharmagreen Biotech Inc.',
-    'CBGL': 'CANNABIS GLOBAL, INC.',
-    'CDSG': 'China Dongsheng International, Inc.',
-    'SNPW': 'Sun Pacific Holding Corp.',
-    'NHMD': 'NATE'S FOOD CO.',
-    'GYGC': 'Guyana Gold Corp',
-    'SLHGF': 'Skylight Health Group Inc.',
-    'SCPS': 'Scopus BioPharma Inc.',
-    'NTRR': 'NEUTRA CORP.',
-    'APSI': 'AQUA POWER SYSTEMS INC.',
-    'RLBD': 'Real Brands, Inc.',
-    'DCAC': 'Daniels Corporate Advisory Company, Inc.',
-    'SHGI': 'Sparx Holdings Group, Inc.',
-    'FORZ': 'Forza Innovations Inc',
-    'ENDV': 'ENDONOVO THERAPEUTICS, INC.',
-    'CALA': 'Calithera Biosciences, Inc.',
-    'PLPL': 'Plandai Biotechnology, Inc.',
-    'PVNNF': 'PV Nano Cell, Ltd.',
-    'OXBRW': 'OXBRIDGE RE HOLDINGS Ltd',
-    'ALPP': 'ALPINE 4 HOLDINGS, INC.',
-    'EFTR': 'eFFECTOR Therapeutics, Inc.',
-    'BTZI': 'BOTS, Inc./PR',
-    'BZWR': 'Business Warrior Corp',
-    'MASN': 'Maison Luxe, Inc.',
-    'DPUI': 'DISCOUNT PRINT USA, INC.',
-    'CLRD': 'Clearday, Inc.',
-    'MMNFQ': 'MedMen Enterprises, Inc.',
-    'AERS': 'Aerius International Inc.',
-    'PRST': 'Presto Automation Inc.',
-    'LCCN': 'LeapCharger Corp',
-    'TMNA': 'AGRI-FINTECH HOLDINGS, INC.',
-    'LFAP': 'LGBTQ Loyalty Holdings, Inc.',
-    'ECOX': 'ECO INNOVATION GROUP, INC.',
-    'MLLOF': 'Medallion Resources Ltd',
-    'CLCS': 'Cell Source, Inc.',
-    'THCT': 'THC Therapeutics, Inc.',
-    'WTII': 'Water Technologies International,Inc.',
-    'SNHO': 'SHONGHOYA INTERNATIONAL GROUP INC.',
-    'GZIC': 'GZ6G Technologies Corp.',
-    'SUWN': 'SUNWIN STEVIA INTERNATIONAL, INC.',
-    'FAVO': 'Favo Capital, Inc.',
-    'GIPL': 'Global Innovative Platforms Inc.',
-    'TIOG': 'Tingo Group, Inc.',
-    'HPCO': 'Hempacco Co., Inc.',
-    'DWAY': 'Driveitaway Holdings, Inc.',
-    'JMTM': 'James Maritime Holdings Inc.',
-    'AMIH': 'AMERICAN INTERNATIONAL HOLDINGS CORP.',
-    'RENO': 'RENOVARE ENVIRONMENTAL, INC.',
-    'LBTI': 'Lithium & Boron Technology, Inc.',
-    'SFRT': 'Appreciate Holdings, Inc.',
-    'RTSL': 'Rapid Therapeutic Science Laboratories, Inc.',
-    'GMVDF': 'G Medical Innovations Holdings Ltd.',
-    'ESSI': 'ECO SCIENCE SOLUTIONS, INC.',
-    'EWLL': 'eWELLNESS HEALTHCARE Corp',
-    'ADGO': 'Advantego Corp',
-    'DSGT': 'DSG Global Inc.',
-    'QBIO': 'Q BioMed Inc.',
-    'VBIVQ': 'VBI Vaccines Inc/BC',
-    'VAXX': 'Vaxxinity, Inc.',
-    'BTIM': 'BOATIM INC.',
-    'THMO': 'ThermoGenesis Holdings, Inc.',
-    'ICNB': 'Iconic Brands, Inc.',
-    'TKLS': 'Trutankless, Inc.',
-    'INLB': 'Item 9 Labs Corp.',
-    'ECXJ': 'CXJ GROUP CO., Ltd',
-    'EGOXF': 'Next.e.GO N.V.',
-    'INFIQ': 'INFINITY PHARMACEUTICALS, INC.',
-    'SINC': 'Sincerity Applied Materials Holdings Corp.',
-    'RNGC': 'Ranger Gold Corp.',
-    'MAXD': 'Max Sound Corp',
-    'ASPU': 'ASPEN GROUP, INC.',
-    'STAB': 'Statera Biopharma, Inc.',
-    'ARDS': 'Aridis Pharmaceuticals, Inc.',
-    'BXRXQ': 'Baudax Bio, Inc.',
-    'PLYN': 'Palayan Resources, Inc.',
-    'FDBL': 'Friendable, Inc.',
-    'KBNT': 'Kubient, Inc.',
-    'WINR': 'SIMPLICITY ESPORTS & GAMING Co',
-    'WEIDY': 'Weidai Ltd.',
-    'VRUS': 'VERUS INTERNATIONAL, INC.',
-    'MOTS': 'Motus GI Holdings, Inc.',
-    'SECOY': 'Secoo Holding Ltd',
-    'JUVAF': 'JUVA LIFE INC./Canada',
-    'ALFIQ': 'Alfi, Inc.',
-    'BZRD': 'Blubuzzard, Inc.',
-    'WTER': 'ALKALINE WATER Co INC',
-    'SMFL': 'SMART FOR LIFE, INC.',
-    'AUVIQ': 'Applied UV, Inc.',
-    'CSSEQ': 'Chicken Soup for the Soul Entertainment, Inc.',
-    'AEYGQ': 'ADDVANTAGE TECHNOLOGIES GROUP INC',
-    'NAVB': 'NAVIDEA BIOPHARMACEUTICALS, INC.',
-    'ATHXQ': 'ATHERSYS, INC / NEW',
-    'BAC-PL': 'BANK OF AMERICA CORP /DE/',
-    'MER-PK': 'BANK OF AMERICA CORP /DE/',
-    'BACRP': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PM': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PN': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PO': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PP': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PQ': 'BANK OF AMERICA CORP /DE/',
-    'BAC-PS': 'BANK OF AMERICA CORP /DE/',
-    'MNESP': 'MSA Safety Inc',
-    'INPAP': 'INTERNATIONAL PAPER CO /NEW/',
-    'CTO-PA': 'CTO Realty Growth, Inc.',
-    'FHN-PB': 'FIRST HORIZON CORP',
-    'FHN-PC': 'FIRST HORIZON CORP',
-    'FHN-PE': 'FIRST HORIZON CORP',
-    'FHN-PF': 'FIRST HORIZON CORP',
-    'USB-PQ': 'US BANCORP \DE\',
-    'USB-PR': 'US BANCORP \DE\',
-    'USB-PS': 'US BANCORP \DE\',
-    'FACTU': 'FACT II Acquisition Corp.',
-    'FACTW': 'FACT II Acquisition Corp.',
-    'GSRTU': 'GSR III Acquisition Corp.',
-    'GSRTR': 'GSR III Acquisition Corp.',
-    'GIGGU': 'GigCapital7 Corp.',
-    'GIGGW': 'GigCapital7 Corp.',
-    'BACQR': 'Bleichroeder Acquisition Corp. I',
-    'BACQU': 'Bleichroeder Acquisition Corp. I',
-    'DMAAU': 'Drugs Made In America Acquisition Corp.',
-    'DYNXW': 'Dynamix Corp',
-    'DYNXU': 'Dynamix Corp',
-    'LPBBW': 'Launch Two Acquisition Corp.',
-    'LPBBU': 'Launch Two Acquisition Corp.',
-    'HONDW': 'HCM II Acquisition Corp.',
-    'HONDU': 'HCM II Acquisition Corp.',
-    'CGBSW': 'Crown LNG Holdings Ltd',
-    'PITAW': 'Heramba Electric plc',
-    'MRNOW': 'Murano Global Investments Plc',
-    'BDMDW': 'Baird Medical Investment Holdings Ltd',
-    'CCIXU': 'Churchill Capital Corp IX/Cayman',
-    'CCIXW': 'Churchill Capital Corp IX/Cayman',
-    'LPAAU': 'Launch One Acquisition Corp.',
-    'LPAAW': 'Launch One Acquisition Corp.',
-    'SPHIF': 'SUPER HI INTERNATIONAL HOLDING LTD.',
-    'IBACR': 'IB Acquisition Corp.',
-    'CLBR-UN': 'COLOMBIER ACQUISITION CORP. II',
-    'CLBR-WT': 'COLOMBIER ACQUISITION CORP. II',
-    'BUJAW': 'Bukit Jalil Global Acquisition 1 Ltd.',
-    'BUJAU': 'Bukit Jalil Global Acquisition 1 Ltd.',
-    'BUJAR': 'Bukit Jalil Global Acquisition 1 Ltd.',
-    'LZM-WT': 'Lifezone Metals Ltd',
-    'CREVW': 'Carbon Revolution Public Ltd Co',
-    'LDTCW': 'LeddarTech Holdings Inc.',
-    'QETAU': 'Quetta Acquisition Corp',
-    'QETAR': 'Quetta Acquisition Corp',
-    'GFRWF': 'Greenfire Resources Ltd.',
-    'ATCHW': 'AtlasClear Holdings, Inc.',
-    'ALDFU': 'Aldel Financial II Inc.',
-    'ALDFW': 'Aldel Financial II Inc.',
-    'INVLW': 'Innventure, Inc.',
-    'PDPA': 'Pearl Diver Credit Co Inc.',
-    'SHMDW': 'SCHMID Group N.V.',
-    'ACZT': 'Aceztech Corp',
-    'MKDWW': 'MKDWELL Tech Inc.',
-    'NETDW': 'Nabors Energy Transition Corp. II',
-    'NETDU': 'Nabors Energy Transition Corp. II',
-    'HYAC-UN': 'Haymaker Acquisition Corp. 4',
-    'HYAC-WT': 'Haymaker Acquisition Corp. 4',
-    'KYFGF': 'Kyoto Financial Group Inc/ADR',
-    'TLPPF': 'Telix Pharmaceuticals Ltd',
-    'SPHAU': 'Shepherd Ave Capital Acquisition Corp',
-    'FOXXW': 'Foxx Development Holdings Inc.',
-    'RMSGW': 'Real Messenger Corp',
-    'BAYAR': 'Bayview Acquisition Corp',
-    'BAYAU': 'Bayview Acquisition Corp',
-    'AITRU': 'AI Transportation Acquisition Corp',
-    'AITRR': 'AI Transportation Acquisition Corp',
-    'GAFC': 'Guru App Factory Corp',
-    'DSYWW': 'Big Tree Cloud Holdings Ltd',
-    'ZOOZW': 'ZOOZ Power Ltd.',
-    'MGSD': 'Maitong Sunshine Cultural Development Co., Ltd',
-    'ALFUW': 'Centurion Acquisition Corp.',
-    'ALFUU': 'Centurion Acquisition Corp.',
-    'AEFC': 'AEGON LTD.',
-    'PAASF': 'PAN AMERICAN SILVER CORP',
-    'FCNCO': 'FIRST CITIZENS BANCSHARES INC /DE/',
-    'FCNCP': 'FIRST CITIZENS BANCSHARES INC /DE/',
-    'WOLTF': 'WOLTERS KLUWER N V /FI',
-    'IDEXQ': 'IDEANOMICS, INC.',
-    'CHSCL': 'CHS INC',
-    'CHSCM': 'CHS INC',
-    'CHSCN': 'CHS INC',
-    'CHSCO': 'CHS INC',
-    'WSBCP': 'WESBANCO INC',
-    'T-PA': 'AT&T INC.',
-    'T-PC': 'AT&T INC.',
-    'CDZIP': 'CADIZ INC',
-    'FITBO': 'FIFTH THIRD BANCORP',
-    'FITBP': 'FIFTH THIRD BANCORP',
-    'CFR-PB': 'CULLEN/FROST BANKERS, INC.',
-    'CTDD': 'QWEST CORP',
-    'RONN': 'Lee Pharmaceuticals, Inc.',
-    'LGL-WT': 'LGL GROUP INC',
-    'LNC-PD': 'LINCOLN NATIONAL CORP',
-    'SNV-PE': 'SYNOVUS FINANCIAL CORP',
-    'KIM-PN': 'KIMCO REALTY CORP',
-    'AP-WT': 'AMPCO PITTSBURGH CORP',
-    'FNMAP': 'FEDERAL NATIONAL MORTGAGE ASSOCIATION FANNIE MAE',
-    'UEPCO': 'UNION ELECTRIC CO',
-    'PNMXO': 'PUBLIC SERVICE CO OF NEW MEXICO',
-    'TDDWW': 'TIDEWATER INC',
-    'TDGMW': 'TIDEWATER INC',
-    'FRMEP': 'FIRST MERCHANTS CORP',
-    'SF-PD': 'STIFEL FINANCIAL CORP',
-    'SFB': 'STIFEL FINANCIAL CORP',
-    'BCEFF': 'BCE INC',
-    'BCEPF': 'BCE INC',
-    'BCEXF': 'BCE INC',
-    'BCAEF': 'BCE INC',
-    'BCEIF': 'BCE INC',
-    'BCPPF': 'BCE INC',
-    'OTRKP': 'Ontrak, Inc.',
-    'RHEPB': 'REGIONAL HEALTH PROPERTIES, INC',
-    'AFGD': 'AMERICAN FINANCIAL GROUP INC',
-    'AFGE': 'AMERICAN FINANCIAL GROUP INC',
-    'AFGB': 'AMERICAN FINANCIAL GROUP INC',
-    'SWKHL': 'SWK Holdings Corp',
-    'MOBQW': 'Mobiquity Technologies, Inc.',
-    'STNDF': 'Santander UK plc',
-    'SNTUF': 'Santander UK plc',
-    'IRS-WT': 'IRSA INVESTMENTS & REPRESENTATIONS INC',
-    'COF-PK': 'CAPITAL ONE FINANCIAL CORP',
-    'COF-PL': 'CAPITAL ONE FINANCIAL CORP',
-    'COF-PN': 'CAPITAL ONE FINANCIAL CORP',
-    'COF-PI': 'CAPITAL ONE FINANCIAL CORP',
-    'COF-PJ': 'CAPITAL ONE FINANCIAL CORP',
-    'WCC-PA': 'WESCO INTERNATIONAL INC',
-    'SPE-PC': 'SPECIAL OPPORTUNITIES FUND, INC.',
-    'SF-PC': 'STIFEL FINANCIAL CORP',
-    'NPPXF': 'NIPPON TELEGRAPH & TELEPHONE CORP',
-    'WBS-PG': 'WEBSTER FINANCIAL CORP',
-    'GOVXW': 'GeoVax Labs, Inc.',
-    'UCB-PI': 'UNITED COMMUNITY BANKS INC',
-    'MFA-PC': 'MFA FINANCIAL, INC.',
-    'MFAN': 'MFA FINANCIAL, INC.',
-    'MFAO': 'MFA FINANCIAL, INC.',
-    'ZIVOW': 'Zivo Bioscience, Inc.',
-    'MET-PF': 'METLIFE INC',
-    'TEN-PE': 'TSAKOS ENERGY NAVIGATION LTD',
-    'TEN-PF': 'TSAKOS ENERGY NAVIGATION LTD',
-    'ARES-PB': 'Ares Management Corp',
-    'CNO-PA': 'CNO Financial Group, Inc.',
-    'ABR-PD': 'ARBOR REALTY TRUST INC',
-    'ABR-PE': 'ARBOR REALTY TRUST INC',
-    'ABR-PF': 'ARBOR REALTY TRUST INC',
-    'RF-PE': 'REGIONS FINANCIAL CORP',
-    'RF-PF': 'REGIONS FINANCIAL CORP',
-    'DLR-PL': 'DIGITAL REALTY TRUST, INC.',
-    'CADE-PA': 'Cadence Bank',
-    'PREJF': 'PARTNERRE LTD',
-    'ADC-PA': 'AGREE REALTY CORP',
-    'VNO-PN': 'VORNADO REALTY TRUST',
-    'VNO-PO': 'VORNADO REALTY TRUST',
-    'MS-PQ': 'MORGAN STANLEY',
-    'MSTLW': 'MORGAN STANLEY',
-    'MS-PL': 'MORGAN STANLEY',
-    'MS-PO': 'MORGAN STANLEY',
-    'MS-PP': 'MORGAN STANLEY',
-    'FCELB': 'FUELCELL ENERGY INC',
-    'GERNW': 'GERON CORP',
-    'BNH': 'BROOKFIELD Corp /ON/',
-    'BNJ': 'BROOKFIELD Corp /ON/',
-    'BROXF': 'BROOKFIELD Corp /ON/',
-    'BXDIF': 'BROOKFIELD Corp /ON/',
-    'BAMKF': 'BROOKFIELD Corp /ON/',
-    'BKAMF': 'BROOKFIELD Corp /ON/',
-    'BKFAF': 'BROOKFIELD Corp /ON/',
-    'BKFPF': 'BROOKFIELD Corp /ON/',
-    'BRCFF': 'BROOKFIELD Corp /ON/',
-    'BKFDF': 'BROOKFIELD Corp /ON/',
-    'BKFOF': 'BROOKFIELD Corp /ON/',
-    'BRPSF': 'BROOKFIELD Corp /ON/',
-    'POWWP': 'AMMO, INC.',
-    'CHNEY': 'CHINA EASTERN AIRLINES CORP LTD',
-    'SREA': 'SEMPRA',
-    'CRESW': 'CRESUD INC',
-    'ML-WT': 'MONEYLION INC.',
-    'NLSPW': 'NLS Pharmaceutics Ltd.',
-    'NUKKW': 'Nukkleus Inc.',
-    'ATCOL': 'Atlas Corp.',
-    'ATCO-PD': 'Atlas Corp.',
-    'ATCO-PH': 'Atlas Corp.',
-    'BENFW': 'Beneficient',
-    'BEATW': 'HeartBeam, Inc.',
-    'OUSTZ': 'Ouster, Inc.',
-    'OUSTW': 'Ouster, Inc.',
-    'ATIPW': 'ATI Physical Therapy, Inc.',
-    'MSOGF': 'MINISO Group Holding Ltd',
-    'HGASW': 'Global Gas Corp',
-    'RDW-WT': 'Redwire Corp',
-    'EVGOW': 'EVgo Inc.',
-    'JOBY-WT': 'Joby Aviation, Inc.',
-    'AENTW': 'ALLIANCE ENTERTAINMENT HOLDING CORP',
-    'SKYH-WT': 'Sky Harbour Group Corp',
-    'TSPH': 'TuSimple Holdings Inc.',
-    'PVOZ': 'Park View OZ REIT Inc',
-    'IONQ-WT': 'IonQ, Inc.',
-    'SVMHW': 'SRIVARU Holding Ltd',
-    'ARLTF': 'Arcadium Lithium plc',
-    'LGSP': 'LEGEND SPICES, INC.',
-    'SEPSF': 'Asep Medical Holdings Inc.',
-    'LOTWW': 'Lotus Technology Inc.',
-    'VSTEW': 'Vast Renewables Ltd',
-    'TLSIW': 'TriSalus Life Sciences, Inc.',
-    'IINNW': 'Inspira Technologies OXY B.H.N. Ltd',
-    'WALDW': 'Waldencast plc',
-    'GEGGL': 'Great Elm Group, Inc.',
-    'BLUAW': 'BlueRiver Acquisition Corp.',
-    'BLUVF': 'BlueRiver Acquisition Corp.',
-    'ZPTAW': 'Zapata Computing Holdings Inc.',
-    'SOUNW': 'SOUNDHOUND AI, INC.',
-    'COCHW': 'Envoy Medical, Inc.',
-    'ESLAW': 'Estrella Immunopharma, Inc.',
-    'LNZAW': 'LanzaTech Global, Inc.',
-    'CBRRF': 'Chain Bridge I',
-    'CBRGF': 'Chain Bridge I',
-    'ANNAW': 'AleAnna, Inc.',
-    'MAQCU': 'Maquia Capital Acquisition Corp',
-    'MAQCW': 'Maquia Capital Acquisition Corp',
-    'LUNRW': 'Intuitive Machines, Inc.',
-    'OPFI-WT': 'OppFi Inc.',
-    'CXAIW': 'CXApp Inc.',
-    'SCLXW': 'Scilex Holding Co',
-    'ONFOW': 'Onfolio Holdings, Inc',
-    'ONFOP': 'Onfolio Holdings, Inc',
-    'SSRT': 'Streetex Corp.',
-    'UHGWW': 'United Homes Group, Inc.',
-    'GFAIW': 'Guardforce AI Co., Ltd.',
-    'TMCWW': 'TMC the metals Co Inc.',
-    'FFIEW': 'FARADAY FUTURE INTELLIGENT ELECTRIC INC.',
-    'DTSQU': 'DT Cloud Star Acquisition Corp',
-    'DTSQR': 'DT Cloud Star Acquisition Corp',
-    'EQV-WT': 'EQV Ventures Acquisition Corp.',
-    'EQV-UN': 'EQV Ventures Acquisition Corp.',
-    'BKHAU': 'Black Hawk Acquisition Corp',
-    'BKHAR': 'Black Hawk Acquisition Corp',
-    'FREY-WT': 'FREYR Battery, Inc. /DE/',
-    'GMTH': 'GMTech Inc.',
-    'AFBL': 'AFB Ltd',
-    'HYMCL': 'HYCROFT MINING HOLDING CORP',
-    'FROPX': 'Flat Rock Opportunity Fund',
-    'STSSW': 'Sharps Technology Inc.',
-    'ASCIX': 'Angel Oak Strategic Credit Fund',
-    'HYMCW': 'HYCROFT MINING HOLDING CORP',
-    'SLXNW': 'Silexion Therapeutics Corp',
-    'TNMWF': 'TNL Mediagene',
-    'AAM-WT': 'AA Mission Acquisition Corp.',
-    'AAM-UN': 'AA Mission Acquisition Corp.',
-    'HSPTU': 'Horizon Space Acquisition II Corp.',
-    'ADMWF': 'ACUREN CORP',
-    'DRDBU': 'Roman DBDR Acquisition Corp. II',
-    'WLACU': 'Willow Lane Acquisition Corp.',
-    'WLACW': 'Willow Lane Acquisition Corp.',
-    'RDACR': 'Rising Dragon Acquisition Corp.',
-    'RDACU': 'Rising Dragon Acquisition Corp.',
-    'MNSBP': 'MainStreet Bancshares, Inc.',
-    'IPXXW': 'Inflection Point Acquisition Corp. II',
-    'IPXXU': 'Inflection Point Acquisition Corp. II',
-    'ENGNW': 'enGene Holdings Inc.',
-    'BOWNR': 'Bowen Acquisition Corp',
-    'BOWNU': 'Bowen Acquisition Corp',
-    'RMXI': 'Reticulate Micro, Inc.',
-    'MRKY': 'MARKY CORP.',
-    'EURKR': 'Eureka Acquisition Corp',
-    'EURKU': 'Eureka Acquisition Corp',
-    'MDCXW': 'Medicus Pharma Ltd.',
-    'BEIGF': 'BeiGene, Ltd.',
-    'ICRP': 'InPoint Commercial Real Estate Income, Inc.',
-    'LMND-WT': 'Lemonade, Inc.',
-    'LBRDP': 'Liberty Broadband Corp',
-    'PAVMZ': 'PAVmed Inc.',
-    'SYF-PA': 'Synchrony Financial',
-    'SYF-PB': 'Synchrony Financial',
-    'NXLIW': 'Nexalin Technology, Inc.',
-    'SKILW': 'Skillsoft Corp.',
-    'NUWEW': 'Nuwellis, Inc.',
-    'OZKAP': 'Bank OZK',
-    'PPLOF': 'PEMBINA PIPELINE CORP',
-    'PBNAF': 'PEMBINA PIPELINE CORP',
-    'PMBPF': 'PEMBINA PIPELINE CORP',
-    'PMMBF': 'PEMBINA PIPELINE CORP',
-    'PPLAF': 'PEMBINA PIPELINE CORP',
-    'LFT-PA': 'Lument Finance Trust, Inc.',
-    'WHFCL': 'WhiteHorse Finance, Inc.',
-    'PNSTW': 'Pinstripes Holdings, Inc.',
-    'RFACW': 'RF Acquisition Corp.',
-    'BRQL': 'brooqLy, Inc.',
-    'AIRJW': 'AirJoule Technologies Corp.',
-    'ICUCW': 'SeaStar Medical Holding Corp',
-    'CLDWW': 'Calidi Biotherapeutics, Inc.',
-    'BHACU': 'Focus Impact BH3 Acquisition Co',
-    'BHACW': 'Focus Impact BH3 Acquisition Co',
-    'GDEVW': 'GDEV Inc.',
-    'PHYUF': 'Pyrophyte Acquisition Corp.',
-    'PHYWF': 'Pyrophyte Acquisition Corp.',
-    'SAIHW': 'SAIHEAT Ltd',
-    'PSQH-WT': 'PSQ Holdings, Inc.',
-    'RFACR': 'RF Acquisition Corp.',
-    'RFACU': 'RF Acquisition Corp.',
-    'GDLG': 'Glidelogic Corp.',
-    'GHBWF': 'Glass House Brands Inc.',
-    'BZFDW': 'BuzzFeed, Inc.',
-    'ASAIY': 'Sendas Distributor S.A.',
-    'INVZW': 'Innoviz Technologies Ltd.',
-    'LEVWQ': 'Lion Electric Co',
-    'LEGWQ': 'Lion Electric Co',
-    'GSLR': 'GeoSolar Technologies, Inc.',
-    'SVIIR': 'Spring Valley Acquisition Corp. II',
-    'SVIIU': 'Spring Valley Acquisition Corp. II',
-    'SPECW': 'Spectaire Holdings Inc.',
-    'SVIIW': 'Spring Valley Acquisition Corp. II',
-    'JETBF': 'Global Crossing Airlines Group Inc.',
-    'SBIGW': 'SpringBig Holdings, Inc.',
-    'SST-WT': 'System1, Inc.',
-    'EOSEW': 'Eos Energy Enterprises, Inc.',
-    'TRINZ': 'Trinity Capital Inc.',
-    'TRINL': 'Trinity Capital Inc.',
-    'TRINI': 'Trinity Capital Inc.',
-    'PMVCW': 'PMV Consumer Acquisition Corp.',
-    'PMVCD': 'PMV Consumer Acquisition Corp.',
-    'BURUW': 'Nuburu, Inc.',
-    'BRZHW': 'Breeze Holdings Acquisition Corp.',
-    'BRZHR': 'Breeze Holdings Acquisition Corp.',
-    'BARK-WT': 'Bark, Inc.',
-    'CIFRW': 'Cipher Mining Inc.',
-    'CLNNW': 'Clene Inc.',
-    'OPADW': 'Offerpad Solutions Inc.',
-    'ARKOW': 'ARKO Corp.',
-    'BNZIW': 'Banzai International, Inc.',
-    'PDYNW': 'Palladyne AI Corp.',
-    'ISRLU': 'Israel Acquisitions Corp',
-    'ISRLW': 'Israel Acquisitions Corp',
-    'GRRRW': 'Gorilla Technology Group Inc.',
-    'JOCM': 'JOCOM HOLDINGS CORP.',
-    'ALCYW': 'Alchemy Investments Acquisition Corp 1',
-    'ALCYU': 'Alchemy Investments Acquisition Corp 1',
-    'AMPX-WT': 'Amprius Technologies, Inc.',
-    'GGROW': 'Gogoro Inc.',
-    'KWESW': 'KWESST Micro Systems Inc.',
-    'PGYWW': 'Pagaya Technologies Ltd.',
-    'VHAIW': 'Vocodia Holdings Corp',
-    'VHABW': 'Vocodia Holdings Corp',
-    'CINGW': 'Cingulate Inc.',
-    'VLN-WT': 'Valens Semiconductor Ltd.',
-    'KACRF': 'Kairous Acquisition Corp. Ltd',
-    'KACUF': 'Kairous Acquisition Corp. Ltd',
-    'KACWF': 'Kairous Acquisition Corp. Ltd',
-    'EMCGW': 'Embrace Change Acquisition Corp.',
-    'EVTWF': 'Vertical Aerospace Ltd.',
-    'WAVSU': 'Western Acquisition Ventures Corp.',
-    'WAVSW': 'Western Acquisition Ventures Corp.',
-    'ALLGF': 'Allego N.V.',
-    'EMCGR': 'Embrace Change Acquisition Corp.',
-    'EMCGU': 'Embrace Change Acquisition Corp.',
-    'LILWF': 'Lilium N.V.',
-    'SHFSW': 'SHF Holdings, Inc.',
-    'MINR': 'Minerva Gold Inc.',
-    'IVCAU': 'Investcorp AI Acquisition Corp.',
-    'IVCAW': 'Investcorp AI Acquisition Corp.',
-    'BRLSW': 'Borealis Foods Inc.',
-    'NPWR-WT': 'NET Power Inc.',
-    'QTIWW': 'QT IMAGING HOLDINGS, INC.',
-    'NKGNW': 'NKGen Biotech, Inc.',
-    'DFLIW': 'Dragonfly Energy Holdings Corp.',
-    'OABIW': 'OmniAb, Inc.',
-    'IMAQR': 'International Media Acquisition Corp.',
-    'IMAQU': 'International Media Acquisition Corp.',
-    'IMAQW': 'International Media Acquisition Corp.',
-    'PETWW': 'Wag! Group Co.',
-    'FLYX-WT': 'FLYEXCLUSIVE INC.',
-    'RGTIW': 'Rigetti Computing, Inc.',
-    'HLGNW': 'Heliogen, Inc.',
-    'MDAIW': 'Spectral AI, Inc.',
-    'CTV-WT': 'Innovid Corp.',
-    'NVVEW': 'Nuvve Holding Corp.',
-    'CPPTL': 'Copper Property CTL Pass Through Trust',
-    'BETRW': 'Better Home & Finance Holding Co',
-    'PL-WT': 'Planet Labs PBC',
-    'AQUNR': 'Aquaron Acquisition Corp.',
-    'AQUNU': 'Aquaron Acquisition Corp.',
-    'ARBEW': 'Arbe Robotics Ltd.',
-    'ZEOWW': 'Zeo Energy Corp.',
-    'RDZNW': 'Roadzen Inc.',
-    'ARQQW': 'Arqit Quantum Inc.',
-    'MACT': 'MachTen, Inc.',
-    'COOTW': 'Australian Oilseeds Holdings Ltd',
-    'ALVOW': 'Alvotech',
-    'RENEU': 'Cartesian Growth Corp II',
-    'RENEW': 'Cartesian Growth Corp II',
-    'ATMCR': 'ALPHATIME ACQUISITION CORP',
-    'ATMCU': 'ALPHATIME ACQUISITION CORP',
-    'ATMCW': 'ALPHATIME ACQUISITION CORP',
-    'SSUNF': 'SIGNA Sports United N.V.',
-    'IMPPP': 'Imperial Petroleum Inc./Marshall Islands',
-    'SUACU': 'ShoulderUP Technology Acquisition Corp.',
-    'SUACW': 'ShoulderUP Technology Acquisition Corp.',
-    'LANV-WT': 'Lanvin Group Holdings Ltd',
-    'SKGRU': 'SK Growth Opportunities Corp',
-    'SKGRW': 'SK Growth Opportunities Corp',
-    'BTMWW': 'Bitcoin Depot Inc.',
-    'AFRIW': 'Forafric Global PLC',
-    'GLSTR': 'Global Star Acquisition Inc.',
-    'GLSTU': 'Global Star Acquisition Inc.',
-    'GLSTW': 'Global Star Acquisition Inc.',
-    'RLNDF': 'RoyaLand Co Ltd.',
-    'FORLW': 'Four Leaf Acquisition Corp',
-    'FORLU': 'Four Leaf Acquisition Corp',
-    'NAMSW': 'NewAmsterdam Pharma Co N.V.',
-    'OCSAW': 'Oculis Holding AG',
-    'SMXWW': 'SMX (Security Matters) Public Ltd Co',
-    'LVROW': 'Lavoro Ltd',
-    'ZAPPW': 'Zapp Electric Vehicles Group Ltd',
-    'EXTOY': 'Almacenes Exito S.A.',
-    'ITOR': 'Intorio, Corp.',
-    'RNWWW': 'ReNew Energy Global plc',
-    'DJTWW': 'Trump Media & Technology Group Corp.',
-    'APOS': 'Apollo Global Management, Inc.',
-    'GRABW': 'Grab Holdings Ltd',
-    'IVCUF': 'Investcorp Europe Acquisition Corp I',
-    'IVCWF': 'Investcorp Europe Acquisition Corp I',
-    'NVAWW': 'Nova Minerals Ltd',
-    'NVAAF': 'Nova Minerals Ltd',
-    'WINVR': 'WinVest Acquisition Corp.',
-    'WINVU': 'WinVest Acquisition Corp.',
-    'WINVW': 'WinVest Acquisition Corp.',
-    'NRSNW': 'NeuroSense Therapeutics Ltd.',
-    'CDIOW': 'Cardio Diagnostics Holdings, Inc.',
-    'ANGHW': 'Anghami Inc',
-    'MIBE': 'MIAMI BREEZE CAR CARE INC',
-    'ADSEW': 'Ads-Tec Energy Public Ltd Co',
-    'TCRG': 'Cannaisseur Group Inc.',
-    'ASCWF': 'ASPAC II Acquisition Corp.',
-    'ASCRF': 'ASPAC II Acquisition Corp.',
-    'ASUUF': 'ASPAC II Acquisition Corp.',
-    'FGIWW': 'FGI Industries Ltd.',
-    'GGAWF': 'NeuroMind AI Corp.',
-    'GGAUF': 'NeuroMind AI Corp.',
-    'BTSGU': 'BrightSpring Health Services, Inc.',
-    'RCFUF': 'Perception Capital Corp. IV',
-    'RCFWF': 'Perception Capital Corp. IV',
-    'CDTTW': 'CONDUIT PHARMACEUTICALS INC.',
-    'AIMAU': 'Aimfinity Investment Corp. I',
-    'AIMAW': 'Aimfinity Investment Corp. I',
-    'AIMBU': 'Aimfinity Investment Corp. I',
-    'PERF-WT': 'Perfect Corp.',
-    'YOTAU': 'Yotta Acquisition Corp',
-    'YOTAW': 'Yotta Acquisition Corp',
-    'TPGXL': 'TPG Inc.',
-    'DHAIW': 'DIH HOLDING US, INC.',
-    'MSSAR': 'Metal Sky Star Acquisition Corp',
-    'MSSAU': 'Metal Sky Star Acquisition Corp',
-    'MSSAW': 'Metal Sky Star Acquisition Corp',
-    'GBBKR': 'Global Blockchain Acquisition Corp.',
-    'GBBKW': 'Global Blockchain Acquisition Corp.',
-    'VMCAU': 'Valuence Merger Corp. I',
-    'VMCAW': 'Valuence Merger Corp. I',
-    'FLDDW': 'FTAC Emerald Acquisition Corp.',
-    'FLDDU': 'FTAC Emerald Acquisition Corp.',
-    'SLND-WT': 'Southland Holdings, Inc.',
-    'RAJAF': 'Cordyceps Sunshine Biotech Holdings Co., Ltd.',
-    'NMHIW': 'Nature's Miracle Holding Inc.',
-    'HSPOR': 'Horizon Space Acquisition I Corp.',
-    'HSPOU': 'Horizon Space Acquisition I Corp.',
-    'HSPOW': 'Horizon Space Acquisition I Corp.',
-    'BAERW': 'Bridger Aerospace Group Holdings, Inc.',
-    'KMFG': 'KEEMO Fashion Group Ltd',
-    'AMBI-WT': 'Ambipar Emergency Response',
-    'YOTAR': 'Yotta Acquisition Corp',
-    'CNCKW': 'Coincheck Group N.V.',
-    'SBCWW': 'SBC Medical Group Holdings Inc',
-    'TBMCR': 'Trailblazer Merger Corp I',
-    'SPMA': 'Sound Point Meridian Capital, Inc.',
-    'ESHAR': 'ESH Acquisition Corp.',
-    'PSA-PR': 'Public Storage',
-    'PSA-PS': 'Public Storage',
-    'PSA-PL': 'Public Storage',
-    'PSA-PM': 'Public Storage',
-    'PSA-PN': 'Public Storage',
-    'PSA-PO': 'Public Storage',
-    'PSA-PP': 'Public Storage',
-    'PSA-PQ': 'Public Storage',
-    'PSA-PF': 'Public Storage',
-    'PSA-PG': 'Public Storage',
-    'PSA-PI': 'Public Storage',
-    'PSA-PJ': 'Public Storage',
-    'CODI-PC': 'Compass Diversified Holdings',
-    'BWBBP': 'Bridgewater Bancshares Inc',
-    'DRH-PA': 'DiamondRock Hospitality Co',
-    'NBRWF': 'NABORS INDUSTRIES LTD',
-    'TCEYF': 'TC ENERGY CORP',
-    'TRPPF': 'TC ENERGY CORP',
-    'TRPEF': 'TC ENERGY CORP',
-    'TCENF': 'TC ENERGY CORP',
-    'TCNCF': 'TC ENERGY CORP',
-    'TRPRF': 'TC ENERGY CORP',
-    'NCPLW': 'Netcapital Inc.',
-    'PNFPP': 'PINNACLE FINANCIAL PARTNERS INC',
-    'ARR-PC': 'Armour Residential REIT, Inc.',
-    'GLADZ': 'GLADSTONE CAPITAL CORP',
-    'DEENF': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'ADZCF': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'OLOXF': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'DGP': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'DGZ': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'DZZ': 'DEUTSCHE BANK AKTIENGESELLSCHAFT',
-    'BXNCP': 'BOX INC',
-    'GRBK-PA': 'Green Brick Partners, Inc.',
-    'IVDAW': 'Iveda Solutions, Inc.',
-    'HROWL': 'HARROW, INC.',
-    'HROWM': 'HARROW, INC.',
-    'TOGIW': 'TurnOnGreen, Inc.',
-    'TFINP': 'Triumph Financial, Inc.',
-    'MBUMF': 'Mabuchi Motor Co., Ltd./ADR',
-    'NIOBW': 'NIOCORP DEVELOPMENTS LTD',
-    'CGABL': 'Carlyle Group Inc.',
-    'RCD': 'Ready Capital Corp',
-    'RCB': 'Ready Capital Corp',
-    'RCC': 'Ready Capital Corp',
-    'RC-PC': 'Ready Capital Corp',
-    'RC-PE': 'Ready Capital Corp',
-    'NEWTG': 'NewtekOne, Inc.',
-    'NEWTH': 'NewtekOne, Inc.',
-    'WYTC': 'WYTEC INTERNATIONAL INC',
-    'TIPLX': 'Bluerock Total Income (plus) Real Estate Fund',
-    'OXLCL': 'Oxford Lane Capital Corp.',
-    'OXLCN': 'Oxford Lane Capital Corp.',
-    'OXLCI': 'Oxford Lane Capital Corp.',
-    'OXLCP': 'Oxford Lane Capital Corp.',
-    'OXLCZ': 'Oxford Lane Capital Corp.',
-    'CIVII': 'CIVITAS RESOURCES, INC.',
-    'CIVIW': 'CIVITAS RESOURCES, INC.',
-    'EP-PC': 'KINDER MORGAN, INC.',
-    'ACP-PA': 'abrdn Income Credit Strategies Fund',
-    'GNT-PA': 'GAMCO Natural Resources, Gold & Income Trust',
-    'PEB-PG': 'Pebblebrook Hotel Trust',
-    'PEB-PH': 'Pebblebrook Hotel Trust',
-    'HSCSW': 'HeartSciences Inc.',
-    'CPTNW': 'Cepton, Inc.',
-    'MAJI': 'GRN Holding Corp',
-    'CEADW': 'CEA Industries Inc.',
-    'PMT-PC': 'PennyMac Mortgage Investment Trust',
-    'JTGLF': 'Citibank,N.A./ADR',
-    'PMTU': 'PennyMac Mortgage Investment Trust',
-    'VODAF': 'Vodacom Group Ltd / ADR',
-    'YMHAY': 'Yamaha Motor Co., Ltd.',
-    'CIMO': 'CHIMERA INVESTMENT CORP',
-    'CIMN': 'CHIMERA INVESTMENT CORP',
-    'BDRY': 'Amplify Commodity Trust',
-    'BWET': 'Amplify Commodity Trust',
-    'NEWTZ': 'NewtekOne, Inc.',
-    'CUYTF': 'Colruyt SA',
-    'ODVWZ': 'Osisko Development Corp.',
-    'BBLGW': 'Bone Biologics Corp',
-    'UWMC-WT': 'UWM Holdings Corp',
-    'CURIW': 'CuriosityStream Inc.',
-    'CMXWQ': 'CareMax, Inc.',
-    'FOXOW': 'FOXO TECHNOLOGIES INC.',
-    'MKFGW': 'Markforged Holding Corp',
-    'GB-WT': 'Global Blue Group Holding AG',
-    'AEVA-WT': 'Aeva Technologies, Inc.',
-    'CNROX': 'City National Rochdale Strategic Credit Fund',
-    'TMEF': 'Tipmefast, Inc.',
-    'PMFAX': 'PIMCO Flexible Municipal Income Fund',
-    'KARX': 'Karbon-X Corp.',
-    'XALCX': 'BNY Mellon Alcentra Global Multi-Strategy Credit Fund, Inc.',
-    'RVSNW': 'Rail Vision Ltd.',
-    'GOEVW': 'Canoo Inc.',
-    'NEOVW': 'NeoVolta Inc.',
-    'BALY-T': 'Bally's Corp',
-    'SNAXW': 'STRYVE FOODS, INC.',
-    'OPP-PA': 'RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.',
-    'OPP-PB': 'RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.',
-    'DBRG-PH': 'DigitalBridge Group, Inc.',
-    'DBRG-PI': 'DigitalBridge Group, Inc.',
-    'DBRG-PJ': 'DigitalBridge Group, Inc.',
-    'ENSCW': 'Ensysce Biosciences, Inc.',
-    'OCCIM': 'OFS Credit Company, Inc.',
-    'OCCIN': 'OFS Credit Company, Inc.',
-    'OCCIO': 'OFS Credit Company, Inc.',
-    'VGASW': 'Verde Clean Fuels, Inc.',
-    'GRDV': 'Golden Royal Development Inc.',
-    'LVCE': 'LiveCare, Inc.',
-    'ANKM': 'Ankam, Inc.',
-    'AVPTW': 'AvePoint, Inc.',
-    'RBOT-WT': 'Vicarious Surgical Inc.',
-    'EDBLW': 'Edible Garden AG Inc',
-    'REVBW': 'REVELATION BIOSCIENCES, INC.',
-    'ORGNW': 'Origin Materials, Inc.',
-    'KCLHF': 'Kingsoft Cloud Holdings Ltd',
-    'SVIX': 'VS Trust',
-    'UVIX': 'VS Trust',
-    'MSPRW': 'MSP Recovery, Inc.',
-    'MSPRZ': 'MSP Recovery, Inc.',
-    'BTCTW': 'BTC Digital Ltd.',
-    'BYNOU': 'byNordic Acquisition Corp',
-    'BYNOW': 'byNordic Acquisition Corp',
-    'BBAI-WT': 'BigBear.ai Holdings, Inc.',
-    'SABSW': 'SAB Biotherapeutics, Inc.',
-    'LOCLW': 'Local Bounti Corporation/DE',
-    'AONCW': 'American Oncology Network, Inc.',
-    'CORZW': 'Core Scientific, Inc./tx',
-    'CORZZ': 'Core Scientific, Inc./tx',
-    'CORZR': 'Core Scientific, Inc./tx',
-    'DAVEW': 'Dave Inc./DE',
-    'HCVIU': 'Hennessy Capital Investment Corp. VI',
-    'HCVIW': 'Hennessy Capital Investment Corp. VI',
-    'NOTE-WT': 'FiscalNote Holdings, Inc.',
-    'ACHR-WT': 'Archer Aviation Inc.',
-    'HIPOW': 'Hippo Holdings Inc.',
-    'RUMBW': 'Rumble Inc.',
-    'WGSWW': 'GeneDx Holdings Corp.',
-    'XOSWW': 'Xos, Inc.',
-    'WSUPW': 'Wheels Up Experience Inc.',
-    'ISPOW': 'Inspirato Inc',
-    'SSST': 'SmartStop Self Storage REIT, Inc.',
-    'SRRIX': 'Stone Ridge Trust II',
-    'CCLDO': 'CareCloud, Inc.',
-    'CCLDP': 'CareCloud, Inc.',
-    'PETVW': 'PetVivo Holdings, Inc.',
-    'UNOV': 'Earth Science Tech, Inc.',
-    'MSCF': 'MSC INCOME FUND, INC.',
-    'TRTX-PC': 'TPG RE Finance Trust, Inc.',
-    'BHLD': 'BLOCKHOLD CAPITAL CORP',
-    'FCRX': 'Crescent Capital BDC, Inc.',
-    'YCBD-PA': 'cbdMD, Inc.',
-    'MDV-PA': 'MODIV INDUSTRIAL, INC.',
-    'GIPRW': 'GENERATION INCOME PROPERTIES, INC.',
-    'PXSAW': 'Pyxis Tankers Inc.',
-    'KREF-PA': 'KKR Real Estate Finance Trust Inc.',
-    'OPP-PC': 'RiverNorth/DoubleLine Strategic Opportunity Fund, Inc.',
-    'MDRRP': 'Medalist Diversified REIT, Inc.',
-    'NSA-PB': 'National Storage Affiliates Trust',
-    'DTEAF': 'DAVIDsTEA Inc.',
-    'AMJT': 'AMJ Global Technology',
-    'CEDAX': 'BlueBay Destra International Event-Driven Credit Fund',
-    'NICHX': 'Variant Alternative Income Fund',
-    'FTCHQ': 'Farfetch Ltd',
-    'TCMEF': 'Tencent Music Entertainment Group',
-    'EIOAX': 'ELLINGTON INCOME OPPORTUNITIES FUND',
-    'TRSO': 'TRANSUITE.ORG INC.',
-    'EICB': 'Eagle Point Income Co Inc.',
-    'EICC': 'Eagle Point Income Co Inc.',
-    'EICA': 'Eagle Point Income Co Inc.',
-    'ATGAF': 'AltaGas Ltd.',
-    'ATGPF': 'AltaGas Ltd.',
-    'HFRO-PA': 'HIGHLAND OPPORTUNITIES & INCOME FUND',
-    'CDAWF': 'Compass Digital Acquisition Corp.',
-    'CDAUF': 'Compass Digital Acquisition Corp.',
-    'CNDAW': 'Concord Acquisition Corp II',
-    'CNDAU': 'Concord Acquisition Corp II',
-    'KITTW': 'Nauticus Robotics, Inc.',
-    'CLOER': 'Clover Leaf Capital Corp.',
-    'CLOEU': 'Clover Leaf Capital Corp.',
-    'DRMAW': 'Dermata Therapeutics, Inc.',
-    'HMELF': 'Hold Me Ltd',
-    'BFRIW': 'Biofrontera Inc.',
-    'TVGNW': 'Tevogen Bio Holdings Inc.',
-    'RRAWF': 'Rigel Resource Acquisition Corp.',
-    'RRAUF': 'Rigel Resource Acquisition Corp.',
-    'BRACR': 'Broad Capital Acquisition Corp',
-    'BRACU': 'Broad Capital Acquisition Corp',
-    'LATGF': 'Chenghe Acquisition I Co.',
-    'LATGU': 'Chenghe Acquisition I Co.',
-    'TCBPW': 'TC BioPharm (Holdings) plc',
-    'BRKHU': 'BurTech Acquisition Corp.',
-    'BRKHW': 'BurTech Acquisition Corp.',
-    'MTEKW': 'Maris Tech Ltd.',
-    'SATLW': 'Satellogic Inc.',
-    'OFSWF': 'Carbon Streaming Corp',
-    'ASTLW': 'Algoma Steel Group Inc.',
-    'MSAIW': 'MultiSensor AI Holdings, Inc.',
-    'WTMAR': 'Welsbach Technology Metals Acquisition Corp.',
-    'WTMAU': 'Welsbach Technology Metals Acquisition Corp.',
-    'OPTXW': 'SYNTEC OPTICS HOLDINGS, INC.',
-    'IGTAR': 'Inception Growth Acquisition Ltd',
-    'IGTAU': 'Inception Growth Acquisition Ltd',
-    'IGTAW': 'Inception Growth Acquisition Ltd',
-    'XBPEW': 'XBP Europe Holdings, Inc.',
-    'DMXCF': 'District Metals Corp.',
-    'GETRW': 'Getaround, Inc',
-    'BLACR': 'Bellevue Life Sciences Acquisition Corp.',
-    'BLACU': 'Bellevue Life Sciences Acquisition Corp.',
-    'BLACW': 'Bellevue Life Sciences Acquisition Corp.',
-    'HOLOW': 'MicroCloud Hologram Inc.',
-    'TBLAW': 'Taboola.com Ltd.',
-    'KTTAW': 'Pasithea Therapeutics Corp.',
-    'CTCXW': 'Carmell Corp',
-    'LIDRW': 'AEye, Inc.',
-    'MYPSW': 'PLAYSTUDIOS, Inc.',
-    'DISTR': 'Distoken Acquisition Corp',
-    'DISTW': 'Distoken Acquisition Corp',
-    'BODYW': 'Beachbody Company, Inc.',
-    'FOACW': 'Finance of America Companies Inc.',
-    'SDSTW': 'Stardust Power Inc.',
-    'LIANY': 'LianBio',
-    'JWSWF': 'Jaws Mustang Acquisition Corp',
-    'JWSUF': 'Jaws Mustang Acquisition Corp',
-    'QBTS-WT': 'D-Wave Quantum Inc.',
-    'CRGOW': 'Freightos Ltd',
-    'FMSTW': 'Foremost Clean Energy Ltd.',
-    'GREEL': 'Greenidge Generation Holdings Inc.',
-    'FRLAU': 'Fortune Rise Acquisition Corp',
-    'FRLAW': 'Fortune Rise Acquisition Corp',
-    'TGAWF': 'Target Global Acquisition I Corp.',
-    'PWUPU': 'PowerUp Acquisition Corp.',
-    'TGAUF': 'Target Global Acquisition I Corp.',
-    'PWUPW': 'PowerUp Acquisition Corp.',
-    'AOGOU': 'Arogo Capital Acquisition Corp.',
-    'AOGOW': 'Arogo Capital Acquisition Corp.',
-    'WLSS': 'Welsis Corp.',
-    'CCIRU': 'Cohen Circle Acquisition Corp. I',
-    'CCIRW': 'Cohen Circle Acquisition Corp. I',
-    'GLACR': 'Global Lights Acquisition Corp',
-    'PPYAU': 'Papaya Growth Opportunity Corp. I',
-    'PPYAW': 'Papaya Growth Opportunity Corp. I',
-    'FTIIU': 'FutureTech II Acquisition Corp.',
-    'FTIIW': 'FutureTech II Acquisition Corp.',
-    'CRBD': 'Corebridge Financial, Inc.',
-    'HUDAR': 'Hudson Acquisition I Corp.',
-    'HUDAU': 'Hudson Acquisition I Corp.',
-    'AERTW': 'Aeries Technology, Inc.',
-    'GCTS-WT': 'GCT Semiconductor Holding, Inc.',
-    'AEAEU': 'AltEnergy Acquisition Corp',
-    'AEAEW': 'AltEnergy Acquisition Corp',
-    'IXQUF': 'IX Acquisition Corp.',
-    'IXQWF': 'IX Acquisition Corp.',
-    'USTWF': 'Roth CH Acquisition Co.',
-    'PORTU': 'Southport Acquisition Corp',
-    'ECXWW': 'ECARX Holdings Inc.',
-    'SOARW': 'Volato Group, Inc.',
-    'GDSTR': 'Goldenstone Acquisition Ltd.',
-    'GDSTU': 'Goldenstone Acquisition Ltd.',
-    'GDSTW': 'Goldenstone Acquisition Ltd.',
-    'WELWF': 'Integrated Wellness Acquisition Corp',
-    'WELUF': 'Integrated Wellness Acquisition Corp',
-    'PRENW': 'Prenetics Global Ltd',
-    'CEROW': 'CERO THERAPEUTICS HOLDINGS, INC.',
-    'PORTW': 'Southport Acquisition Corp',
-    'JFBRW': 'Jeffs' Brands Ltd',
-    'KVACU': 'Keen Vision Acquisition Corp.',
-    'KVACW': 'Keen Vision Acquisition Corp.',
-    'ATEKW': 'Athena Technology Acquisition Corp. II',
-    'BFQUF': 'Battery Future Acquisition Corp.',
-    'BFQWF': 'Battery Future Acquisition Corp.',
-    'JACS-UN': 'Jackson Acquisition Co II',
-    'RAINW': 'Rain Enhancement Technologies Holdco, Inc.',
-    'NEHCW': 'NEW ERA HELIUM INC.',
-    'ABLVW': 'Able View Global Inc.',
-    'ESGLW': 'ESGL Holdings Ltd',
-    'NCNWF': 'noco-noco Inc.',
-    'CCGWW': 'Cheche Group Inc.',
-    'ABVEW': 'Above Food Ingredients Inc.',
-    'NUVWQ': 'Holdco Nuvo Group D.G Ltd.',
-    'SIMAW': 'SIM Acquisition Corp. I',
-    'SIMAU': 'SIM Acquisition Corp. I',
-    'CAPNU': 'Cayson Acquisition Corp',
-    'CAPNR': 'Cayson Acquisition Corp',
-    'NTWOW': 'Newbury Street II Acquisition Corp',
-    'NTWOU': 'Newbury Street II Acquisition Corp',
-    'RPDL': 'Rapid Line Inc.',
-    'MLECW': 'Moolec Science SA',
-    'GLTK': 'GlobalTech Corp',
-    'GRAF-WT': 'Graf Global Corp.',
-    'IROHR': 'Iron Horse Acquisitions Corp.',
-    'IROHW': 'Iron Horse Acquisitions Corp.',
-    'IROHU': 'Iron Horse Acquisitions Corp.',
-    'BAKR': 'Baker Global Asset Management Inc.',
-    'CRMLW': 'Critical Metals Corp.',
-    'ALUR-WT': 'ALLURION TECHNOLOGIES, INC.',
-    'NVNIW': 'Nvni Group Ltd',
-    'NXNT': 'Nexscient, Inc.',
-    'LSBPW': 'LakeShore Biopharma Co., Ltd.',
-    'ALMP': 'Almco Plumbing Inc',
-    'JAGL': 'JAAG Enterprises Ltd.',
-    'DYCQU': 'DT Cloud Acquisition Corp',
-    'DYCQR': 'DT Cloud Acquisition Corp',
-    'CAPTW': 'Captivision Inc.',
-    'PBMWW': 'PSYENCE BIOMEDICAL LTD.',
-    'TBNRL': 'Tamboran Resources Corp',
-    'VACHU': 'Voyager Acquisition Corp./Cayman Islands',
-    'VACHW': 'Voyager Acquisition Corp./Cayman Islands',
-    'FVNNU': 'Future Vision II Acquisition Corp.',
-    'FVNNR': 'Future Vision II Acquisition Corp.',
-    'BSIIW': 'Black Spade Acquisition II Co',
-    'BSIIU': 'Black Spade Acquisition II Co',
-    'YHNAR': 'YHN Acquisition I Ltd',
-    'YHNAU': 'YHN Acquisition I Ltd',
-    'RFAIU': 'RF Acquisition Corp II',
-    'RFAIR': 'RF Acquisition Corp II',
-    'CHEB-WT': 'Chenghe Acquisition II Co.',
-    'CHEB-UN': 'Chenghe Acquisition II Co.',
-    'POLEU': 'Andretti Acquisition Corp. II',
-    'POLEW': 'Andretti Acquisition Corp. II',
-    'VCICU': 'Vine Hill Capital Investment Corp.',
-    'VCICW': 'Vine Hill Capital Investment Corp.',
-    'OACCU': 'Oaktree Acquisition Corp. III Life Sciences',
-    'OACCW': 'Oaktree Acquisition Corp. III Life Sciences',
-    'HWM-P': 'Howmet Aerospace Inc.',
-    'SENEM': 'Seneca Foods Corp',
-    'SENEL': 'Seneca Foods Corp',
-    'MOVAA': 'MOVADO GROUP INC',
-    'CSWCZ': 'CAPITAL SOUTHWEST CORP',
-    'BA-PA': 'BOEING CO',
-    'AMJB': 'JPMORGAN CHASE & CO',
-    'JPM-PJ': 'JPMORGAN CHASE & CO',
-    'JPM-PK': 'JPMORGAN CHASE & CO',
-    'JPM-PL': 'JPMORGAN CHASE & CO',
-    'JPM-PM': 'JPMORGAN CHASE & CO',
-    'UZD': 'UNITED STATES CELLULAR CORP',
-    'UZE': 'UNITED STATES CELLULAR CORP',
-    'UZF': 'UNITED STATES CELLULAR CORP',
-    'FRBKQ': 'REPUBLIC FIRST BANCORP INC',
-    'DX-PC': 'DYNEX CAPITAL INC',
-    'GSCE': 'GOLDMAN SACHS GROUP INC',
-    'HWCPZ': 'HANCOCK WHITNEY CORP',
-    'GL-PD': 'GLOBE LIFE INC.',
-    'VLYPN': 'VALLEY NATIONAL BANCORP',
-    'CNOBP': 'ConnectOne Bancorp, Inc.',
-    'STRRP': 'STAR EQUITY HOLDINGS, INC.',
-    'EBCOF': 'EBARA CORP /ADR/',
-    'PCG-PX': 'PG&E Corp',
-    'PTIXW': 'Protagenic Therapeutics, Inc.\new',
-    'APCXW': 'AppTech Payments Corp.',
-    'CYTHW': 'Cyclo Therapeutics, Inc.',
-    'HTLFP': 'HEARTLAND FINANCIAL USA INC',
-    'XXAAU': 'AEI INCOME & GROWTH FUND XXI LTD PARTNERSHIP',
-    'MBNKP': 'MEDALLION FINANCIAL CORP',
-    'TDBKF': 'TORONTO DOMINION BANK',
-    'TDOMF': 'TORONTO DOMINION BANK',
-    'TDOPF': 'TORONTO DOMINION BANK',
-    'TDBCP': 'TORONTO DOMINION BANK',
-    'RZC': 'REINSURANCE GROUP OF AMERICA INC',
-    'FLG-PU': 'FLAGSTAR FINANCIAL, INC.',
-    'FLG-PA': 'FLAGSTAR FINANCIAL, INC.',
-    'FRSPF': 'First Phosphate Corp.',
-    'CJRCF': 'China Resources Cement Holdings Limited/ADR/',
-    'KUSA': 'Kashin, Inc.',
-    'RMHI': 'Retrieve Medical Holdings, Inc.',
-    'NIXXW': 'Nixxy, Inc.',
-    'NZEOY': 'New Zealand Oil & Gas Ltd/ADR',
-    'UUGWF': 'United Utilities Group plc',
-    'IHETW': 'iHeartMedia, Inc.',
-    'FGBIP': 'First Guaranty Bancshares, Inc.',
-    'ICCRW': 'iCoreConnect Inc.',
-    'ICNP': 'iCoreConnect Inc.',
-    'DTSTW': 'Data Storage Corp',
-    'DSX-WT': 'DIANA SHIPPING INC.',
-    'EQH-PA': 'Equitable Holdings, Inc.',
-    'EQH-PC': 'Equitable Holdings, Inc.',
-    'GLP-PB': 'GLOBAL PARTNERS LP',
-    'NMPRY': 'Navios Maritime Holdings Inc.',
-    'NMPGY': 'Navios Maritime Holdings Inc.',
-    'AIZN': 'ASSURANT, INC.',
-    'ZNOGW': 'ZION OIL & GAS INC',
-    'SNCRL': 'SYNCHRONOSS TECHNOLOGIES INC',
-    'BANC-PF': 'BANC OF CALIFORNIA, INC.',
-    'EMRJF': 'EMERA INC',
-    'EMICF': 'EMERA INC',
-    'EMRPF': 'EMERA INC',
-    'ARGD': 'Argo Group International Holdings, Inc.',
-    'ARGO-PA': 'Argo Group International Holdings, Inc.',
-    'INVUP': 'Investview, Inc.',
-    'NXGLW': 'NEXGEL, INC.',
-    'XCAPX': 'ACAP Strategic Fund',
-    'CUBB': 'Customers Bancorp, Inc.',
-    'UNTCW': 'UNIT CORP',
-    'SOCGM': 'SOUTHERN CALIFORNIA GAS CO',
-    'VAL-WT': 'Valaris Ltd',
-    'LTSV': 'Lightstone Value Plus REIT IV, Inc.',
-    'VIASP': 'Via Renewables, Inc.',
-    'BAFBF': 'Balfour Beatty plc/ADR',
-    'BLFBY': 'Balfour Beatty plc/ADR',
-    'CTTRF': 'Controladora Vuela Compania de Aviacion, S.A.B. de C.V.',
-    'AAMCF': 'Altisource Asset Management Corp',
-    'SBEV-WT': 'SPLASH BEVERAGE GROUP, INC.',
-    'MPLXP': 'MPLX LP',
-    'LGNZZ': 'LIGAND PHARMACEUTICALS INC',
-    'LGNDZ': 'LIGAND PHARMACEUTICALS INC',
-    'LGNXZ': 'LIGAND PHARMACEUTICALS INC',
-    'LGNYZ': 'LIGAND PHARMACEUTICALS INC',
-    'CLSKW': 'CLEANSPARK, INC.',
-    'ALL-PI': 'ALLSTATE CORP',
-    'ALL-PJ': 'ALLSTATE CORP',
-    'SOJD': 'SOUTHERN CO',
-    'SOJE': 'SOUTHERN CO',
-    'HAWLI': 'HAWAIIAN ELECTRIC CO INC',
-    'HAWLL': 'HAWAIIAN ELECTRIC CO INC',
-    'HAWLM': 'HAWAIIAN ELECTRIC CO INC',
-    'HAWEM': 'HAWAIIAN ELECTRIC CO INC',
-    'ASB-PF': 'ASSOCIATED BANC-CORP',
-    'WRB-PF': 'BERKLEY W R CORP',
-    'WRB-PG': 'BERKLEY W R CORP',
-    'WRB-PH': 'BERKLEY W R CORP',
-    'ASBA': 'ASSOCIATED BANC-CORP',
-    'CELG-RI': 'BRISTOL MYERS SQUIBB CO',
-    'NSARO': 'NSTAR ELECTRIC CO',
-    'NSARP': 'NSTAR ELECTRIC CO',
-    'AILIO': 'Ameren Illinois Co',
-    'AILIP': 'Ameren Illinois Co',
-    'WFC-PD': 'WELLS FARGO & COMPANY/MN',
-    'HBANP': 'HUNTINGTON BANCSHARES INC /MD/',
-    'HBANL': 'HUNTINGTON BANCSHARES INC /MD/',
-    'HBANM': 'HUNTINGTON BANCSHARES INC /MD/',
-    'HACBF': 'HACHIJUNI BANK LTD',
-    'WFC-PZ': 'WELLS FARGO & COMPANY/MN',
-    'WFCNP': 'WELLS FARGO & COMPANY/MN',
-    'WFC-PA': 'WELLS FARGO & COMPANY/MN',
-    'SIGIP': 'SELECTIVE INSURANCE GROUP INC',
-    'ATMP': 'BARCLAYS BANK PLC',
-    'BWVTF': 'BARCLAYS BANK PLC',
-    'COWTF': 'BARCLAYS BANK PLC',
-    'DJP': 'BARCLAYS BANK PLC',
-    'VXX': 'BARCLAYS BANK PLC',
-    'VXZ': 'BARCLAYS BANK PLC',
-    'PGMFF': 'BARCLAYS BANK PLC',
-    'GRN': 'BARCLAYS BANK PLC',
-    'JJCTF': 'BARCLAYS BANK PLC',
-    'JJETF': 'BARCLAYS BANK PLC',
-    'JJGTF': 'BARCLAYS BANK PLC',
-    'OXY-WT': 'OCCIDENTAL PETROLEUM CORP /DE/',
-    'MHGUP': 'MERITAGE HOSPITALITY GROUP INC',
-    'LAWIL': 'Light & Wonder, Inc.',
-    'BANFP': 'BANCFIRST CORP /OK/',
-    'BPOPM': 'POPULAR, INC.',
-    'FULTP': 'FULTON FINANCIAL CORP',
-    'KGCRF': 'KINROSS GOLD CORP',
-    'SCHW-PJ': 'SCHWAB CHARLES CORP',
-    'KEY-PL': 'KEYCORP /NEW/',
-    'TFC-PI': 'TRUIST FINANCIAL CORP',
-    'TFC-PO': 'TRUIST FINANCIAL CORP',
-    'TFC-PR': 'TRUIST FINANCIAL CORP',
-    'DDT': 'DILLARD'S, INC.',
-    'SLNHP': 'Soluna Holdings, Inc',
-    'KMPB': 'KEMPER Corp',
-    'AERGP': 'APPLIED ENERGETICS, INC.',
-    'GTLS-PB': 'CHART INDUSTRIES INC',
-    'CTLPP': 'CANTALOUPE, INC.',
-    'GPUS-PD': 'Hyperscale Data, Inc.',
-    'FXFHF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'RNR-PG': 'RENAISSANCERE HOLDINGS LTD',
-    'FAXRF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'FFHPF': 'FAIRFAX FINANCIAL HOLDINGS LTD/ CAN',
-    'NMPWP': 'NATIONAL GRID PLC',
-    'NMKCP': 'NATIONAL GRID PLC',
-    'NMKBP': 'NATIONAL GRID PLC',
-    'NEWEN': 'NATIONAL GRID PLC',
-    'MHNC': 'Maiden Holdings, Ltd.',
-    'AGQ': 'ProShares Trust II',
-    'BOIL': 'ProShares Trust II',
-    'EUO': 'ProShares Trust II',
-    'GLL': 'ProShares Trust II',
-    'UVXY': 'ProShares Trust II',
-    'VIXM': 'ProShares Trust II',
-    'VIXY': 'ProShares Trust II',
-    'YCL': 'ProShares Trust II',
-    'YCS': 'ProShares Trust II',
-    'ZSL': 'ProShares Trust II',
-    'SCO': 'ProShares Trust II',
-    'SVXY': 'ProShares Trust II',
-    'UCO': 'ProShares Trust II',
-    'UGL': 'ProShares Trust II',
-    'ULE': 'ProShares Trust II',
-    'KOLD': 'ProShares Trust II',
-    'LEXXW': 'Lexaria Bioscience Corp.',
-    'NFTM': 'Buildablock Corp.',
-    'RGPX': 'REGENEREX PHARMA, INC.',
-    'IDKOF': 'IDEMITSU KOSAN CO., LTD',
-    'GFSAY': 'Gafisa S.A.',
-    'BIPJ': 'Brookfield Infrastructure Partners L.P.',
-    'BRIPF': 'Brookfield Infrastructure Partners L.P.',
-    'BIPH': 'Brookfield Infrastructure Partners L.P.',
-    'BIPI': 'Brookfield Infrastructure Partners L.P.',
-    'BIP-PA': 'Brookfield Infrastructure Partners L.P.',
-    'BIP-PB': 'Brookfield Infrastructure Partners L.P.',
-    'PTNRF': 'PARTNER COMMUNICATIONS CO LTD',
-    'TCBIO': 'TEXAS CAPITAL BANCSHARES INC/TX',
-    'NXPLW': 'NextPlat Corp',
-    'TDS-PU': 'TELEPHONE & DATA SYSTEMS INC /DE/',
-    'TDS-PV': 'TELEPHONE & DATA SYSTEMS INC /DE/',
-    'ELCPF': 'EDP ENERGIAS DE PORTUGAL SA',
-    'HNNAZ': 'HENNESSY ADVISORS INC',
-    'GLU-PA': 'GABELLI GLOBAL UTILITY & INCOME TRUST',
-    'ET-PI': 'Energy Transfer LP',
-    'NYMTL': 'NEW YORK MORTGAGE TRUST, INC.',
-    'NYMTM': 'NEW YORK MORTGAGE TRUST, INC.',
-    'OXSQG': 'Oxford Square Capital Corp.',
-    'OXSQZ': 'Oxford Square Capital Corp.',
-    'NYMTZ': 'NEW YORK MORTGAGE TRUST, INC.',
-    'NYMTI': 'NEW YORK MORTGAGE TRUST, INC.',
-    'QVCC': 'QVC INC',
-    'VCRRX': 'Versus Capital Real Assets Fund LLC',
-    'FSREI': 'FS Credit Real Estate Income Trust, Inc.',
-    'FSREM': 'FS Credit Real Estate Income Trust, Inc.',
-    'XFLT-PA': 'XAI Octagon Floating Rate & Alternative Income Trust',
-    'BYCBF': 'Barry Callebaut AG/ADR',
-    'COBA': 'Chilean Cobalt Corp.',
-    'BAZNF': 'Baozun Inc.',
-    'ACONW': 'Aclarion, Inc.',
-    'BSTT': 'Blackstone Real Estate Income Trust, Inc.',
-    'FRTSF': 'Fortis Inc.',
-    'FTPSF': 'Fortis Inc.',
-    'FORFF': 'Fortis Inc.',
-    'FTRSF': 'Fortis Inc.',
-    'AIMDW': 'Ainos, Inc.',
-    'XAEIU': 'AEI INCOME & GROWTH FUND XXII LTD PARTNERSHIP',
-    'ORANY': 'ORANGE',
-    'CBDBY': 'BRAZILIAN DISTRIBUTION CO COMPANHIA BRASILEIRA DE DISTR CBD',
-    'EFSCP': 'ENTERPRISE FINANCIAL SERVICES CORP',
-    'EPR-PC': 'EPR PROPERTIES',
-    'EPR-PE': 'EPR PROPERTIES',
-    'EPDU': 'ENTERPRISE PRODUCTS PARTNERS L.P.',
-    'GGT-PG': 'GABELLI MULTIMEDIA TRUST INC.',
-    'BERZ': 'BANK OF MONTREAL /CAN/',
-    'FNGO': 'BANK OF MONTREAL /CAN/',
-    'FNGS': 'BANK OF MONTREAL /CAN/',
-    'WINTW': 'WINDTREE THERAPEUTICS INC /DE/',
-    'MGRE': 'AFFILIATED MANAGERS GROUP, INC.',
-    'MGR': 'AFFILIATED MANAGERS GROUP, INC.',
-    'MGRB': 'AFFILIATED MANAGERS GROUP, INC.',
-    'MGRD': 'AFFILIATED MANAGERS GROUP, INC.',
-    'BULZ': 'BANK OF MONTREAL /CAN/',
-    'DULL': 'BANK OF MONTREAL /CAN/',
-    'JETU': 'BANK OF MONTREAL /CAN/',
-    'JETD': 'BANK OF MONTREAL /CAN/',
-    'CARD': 'BANK OF MONTREAL /CAN/',
-    'CARU': 'BANK OF MONTREAL /CAN/',
-    'WTID': 'BANK OF MONTREAL /CAN/',
-    'WTIU': 'BANK OF MONTREAL /CAN/',
-    'OILD': 'BANK OF MONTREAL /CAN/',
-    'OILU': 'BANK OF MONTREAL /CAN/',
-    'SHNY': 'BANK OF MONTREAL /CAN/',
-    'FNGU': 'BANK OF MONTREAL /CAN/',
-    'GDXD': 'BANK OF MONTREAL /CAN/',
-    'GDXU': 'BANK OF MONTREAL /CAN/',
-    'FLYD': 'BANK OF MONTREAL /CAN/',
-    'FLYU': 'BANK OF MONTREAL /CAN/',
-    'LHTV': 'Lightstone Value Plus REIT I, Inc.',
-    'SHO-PH': 'Sunstone Hotel Investors, Inc.',
-    'SHO-PI': 'Sunstone Hotel Investors, Inc.',
-    'DUKB': 'Duke Energy CORP',
-    'ISMCF': 'iShares S&P GSCI Commodity-Indexed Trust',
-    'FOSLL': 'Fossil Group, Inc.',
-    'FIISO': 'FINANCIAL INSTITUTIONS INC',
-    'FIISP': 'FINANCIAL INSTITUTIONS INC',
-    'BUCRF': 'Burcon NutraScience Corp',
-    'LLOBF': 'Lloyds Banking Group plc',
-    'NEMCL': 'NEWMONT Corp /DE/',
-    'TRNTF': 'TRANSALTA CORP',
-    'TSLTF': 'TRANSALTA CORP',
-    'TACPF': 'TRANSALTA CORP',
-    'VIRAD': 'NEURALBASE AI LTD.',
-    'GDV-PK': 'GABELLI DIVIDEND & INCOME TRUST',
-    'RCKTW': 'ROCKET PHARMACEUTICALS, INC.',
-    'VRMEW': 'VerifyMe, Inc.',
-    'CSDX': 'CS DIAGNOSTICS CORP.',
-    'SLFQF': 'SUN LIFE FINANCIAL INC',
-    'SLFIF': 'SUN LIFE FINANCIAL INC',
-    'SUNFF': 'SUN LIFE FINANCIAL INC',
-    'AMUB': 'UBS AG',
-    'BDCX': 'UBS AG',
-    'BDCZ': 'UBS AG',
-    'CEFD': 'UBS AG',
-    'UCIB': 'UBS AG',
-    'USML': 'UBS AG',
-    'SCDL': 'UBS AG',
-    'SMHB': 'UBS AG',
-    'MVRL': 'UBS AG',
-    'PFFL': 'UBS AG',
-    'QULL': 'UBS AG',
-    'MLPB': 'UBS AG',
-    'MLPR': 'UBS AG',
-    'MTUL': 'UBS AG',
-    'IWDL': 'UBS AG',
-    'IWFL': 'UBS AG',
-    'IWML': 'UBS AG',
-    'HDLB': 'UBS AG',
-    'IFED': 'UBS AG',
-    'NLY-PI': 'ANNALY CAPITAL MANAGEMENT INC',
-    'SQFTP': 'Presidio Property Trust, Inc.',
-    'SQFTW': 'Presidio Property Trust, Inc.',
-    'MNLCF': 'MANULIFE FINANCIAL CORP',
-    'MNQFF': 'MANULIFE FINANCIAL CORP',
-    'MNUFF': 'MANULIFE FINANCIAL CORP',
-    'CWLXF': 'C21 Investments Inc.',
-    'C-PN': 'CITIGROUP INC',
-    'AGM-PE': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'AGM-PF': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'AGM-PG': 'FEDERAL AGRICULTURAL MORTGAGE CORP',
-    'ALIV': 'AUTOLIV INC',
-    'ANG-PB': 'American National Group Inc.',
-    'ANG-PA': 'American National Group Inc.',
-    'AMNGL': 'American National Group Inc.',
-    'GELPP': 'GENESIS ENERGY LP',
-    'EXEEZ': 'EXPAND ENERGY Corp',
-    'EXEEW': 'EXPAND ENERGY Corp',
-    'EXEEL': 'EXPAND ENERGY Corp',
-    'DCOMP': 'Dime Community Bancshares, Inc. /NY/',
-    'DCOMG': 'Dime Community Bancshares, Inc. /NY/',
-    'GRWTF': 'GREAT-WEST LIFECO INC.',
-    'GWLPF': 'GREAT-WEST LIFECO INC.',
-    'GRWLF': 'GREAT-WEST LIFECO INC.',
-    'ENBNF': 'ENBRIDGE INC',
-    'ENBHF': 'ENBRIDGE INC',
-    'ENBMF': 'ENBRIDGE INC',
-    'ENBOF': 'ENBRIDGE INC',
-    'ENBSF': 'ENBRIDGE INC',
-    'EBRZF': 'ENBRIDGE INC',
-    'EBGEF': 'ENBRIDGE INC',
-    'EBRGF': 'ENBRIDGE INC',
-    'ENBFF': 'ENBRIDGE INC',
-    'ENBGF': 'ENBRIDGE INC',
-    'ENBRF': 'ENBRIDGE INC',
-    'ENNPF': 'ENBRIDGE INC',
-    'EBBGF': 'ENBRIDGE INC',
-    'ALB-PA': 'ALBEMARLE CORP',
-    'OUTFF': 'OUTOKUMPU OY /FI',
-    'REGCO': 'REGENCY CENTERS CORP',
-    'REGCP': 'REGENCY CENTERS CORP',
-    'WAFDP': 'WAFD INC',
-    'DTB': 'DTE ENERGY CO',
-    'DTG': 'DTE ENERGY CO',
-    'ACGLN': 'ARCH CAPITAL GROUP LTD.',
-    'LFMDP': 'LifeMD, Inc.',
-    'OCFCP': 'OCEANFIRST FINANCIAL CORP',
-    'XOMAO': 'XOMA Royalty Corp',
-    'XOMAP': 'XOMA Royalty Corp',
-    'NEE-PS': 'NEXTERA ENERGY INC',
-    'NEE-PT': 'NEXTERA ENERGY INC',
-    'NEE-PN': 'NEXTERA ENERGY INC',
-    'NEE-PR': 'NEXTERA ENERGY INC',
-    'MSEXP': 'MIDDLESEX WATER CO',
-    'BOH-PA': 'BANK OF HAWAII CORP',
-    'BOH-PB': 'BANK OF HAWAII CORP',
-    'MTB-PJ': 'M&T BANK CORP',
-    'MTB-PH': 'M&T BANK CORP',
-    'CMSC': 'CMS ENERGY CORP',
-    'CMSD': 'CMS ENERGY CORP',
-    'CMS-PC': 'CMS ENERGY CORP',
-    'GAB-PK': 'GABELLI EQUITY TRUST INC',
-    'CCNEP': 'CNB FINANCIAL CORP/PA',
-    'CFG-PE': 'CITIZENS FINANCIAL GROUP INC/RI',
-    'CFG-PH': 'CITIZENS FINANCIAL GROUP INC/RI',
-    'ONBPO': 'OLD NATIONAL BANCORP /IN/',
-    'ONBPP': 'OLD NATIONAL BANCORP /IN/',
-    'RJF-PB': 'RAYMOND JAMES FINANCIAL INC',
-    'ZIONP': 'ZIONS BANCORPORATION, NATIONAL ASSOCIATION /UT/',
-    'WELPM': 'WISCONSIN ELECTRIC POWER CO',
-    'NTRSO': 'NORTHERN TRUST CORP',
-    'SCE-PN': 'SOUTHERN CALIFORNIA EDISON Co',
-    'SCE-PM': 'SOUTHERN CALIFORNIA EDISON Co',
-    'SCE-PL': 'SOUTHERN CALIFORNIA EDISON Co',
-    'SCE-PG': 'SOUTHERN CALIFORNIA EDISON Co',
-    'SCE-PJ': 'SOUTHERN CALIFORNIA EDISON Co',
-    'SCE-PK': 'SOUTHERN CALIFORNIA EDISON Co',
-    'F-PB': 'FORD MOTOR CO',
-    'F-PC': 'FORD MOTOR CO',
-    'F-PD': 'FORD MOTOR CO',
-    'DHCNI': 'DIVERSIFIED HEALTHCARE TRUST',
-    'DHCNL': 'DIVERSIFIED HEALTHCARE TRUST',
-    'FCUL': 'Golden Star Enterprises Ltd.',
-    'BC-PA': 'BRUNSWICK CORP',
-    'BC-PB': 'BRUNSWICK CORP',
-    'BC-PC': 'BRUNSWICK CORP',
-    'GLDI': 'CREDIT SUISSE AG',
-    'SLVO': 'CREDIT SUISSE AG',
-    'USOI': 'CREDIT SUISSE AG',
-    'FMCKK': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'FREJP': 'FEDERAL HOME LOAN MORTGAGE CORP',
-    'HPKEW': 'HighPeak Energy, Inc.',
-    'MCOMW': 'micromobility.com Inc.',
-    'LFLYW': 'Leafly Holdings, Inc. /DE',
-    'QSIAW': 'Quantum-Si Inc',
-    'RELIW': 'Reliance Global Group, Inc.',
-    'EVLVW': 'Evolv Technologies Holdings, Inc.',
-    'SKLTF': 'Seek Ltd',
-    'HPP-PC': 'Hudson Pacific Properties, Inc.',
-    'CPER': 'United States Commodity Index Funds Trust',
-    'USCI': 'United States Commodity Index Funds Trust',
-    'PFXNZ': 'PhenixFIN Corp',
-    'NMFCZ': 'New Mountain Finance Corp',
-    'LSEAW': 'Landsea Homes Corp',
-    'BMTX-WT': 'BM Technologies, Inc.',
-    'BKSY-WT': 'BlackSky Technology Inc.',
-    'HMLPF': 'Hoegh LNG Partners LP',
-    'HSDTW': 'HELIUS MEDICAL TECHNOLOGIES, INC.',
-    'BCTXW': 'BriaCell Therapeutics Corp.',
-    'WAL-PA': 'WESTERN ALLIANCE BANCORPORATION',
-    'PSEC-PA': 'PROSPECT CAPITAL CORP',
-    'SEAL-PA': 'Seapeak LLC',
-    'SEAL-PB': 'Seapeak LLC',
-    'MSBIP': 'Midland States Bancorp, Inc.',
-    'NWOEF': 'New Oriental Education & Technology Group Inc.',
-    'SAT': 'SARATOGA INVESTMENT CORP.',
-    'SAY': 'SARATOGA INVESTMENT CORP.',
-    'SAZ': 'SARATOGA INVESTMENT CORP.',
-    'SAJ': 'SARATOGA INVESTMENT CORP.',
-    'NGKSF': 'NGK Spark Plug Co., Ltd.',
-    'ATLEW': 'ARTELO BIOSCIENCES, INC.',
-    'FBRT-PE': 'Franklin BSP Realty Trust, Inc.',
-    'GLFHD': 'Galenfeha, Inc.',
-    'VCMIX': 'Versus Capital Real Estate Fund LLC',
-    'AMPGW': 'AmpliTech Group, Inc.',
-    'RIV-PA': 'RIVERNORTH OPPORTUNITIES FUND, INC.',
-    'SSSSL': 'SURO CAPITAL CORP.',
-    'TAX': 'Franchise Group, Inc.',
-    'GNL-PE': 'Global Net Lease, Inc.',
-    'GNL-PD': 'Global Net Lease, Inc.',
-    'GNL-PB': 'Global Net Lease, Inc.',
-    'ATHS': 'Athene Holding Ltd.',
-    'ATH-PB': 'Athene Holding Ltd.',
-    'ATH-PC': 'Athene Holding Ltd.',
-    'ATH-PD': 'Athene Holding Ltd.',
-    'ATH-PE': 'Athene Holding Ltd.',
-    'CICB': 'CION Investment Corp',
-    'TRIC': 'TriLinc Global Impact Fund LLC',
-    'TRLC': 'TriLinc Global Impact Fund LLC',
-    'WHLRL': 'Wheeler Real Estate Investment Trust, Inc.',
-    'GDHLF': 'GDS Holdings Ltd',
-    'PNDZF': 'Pandora A/S / ADR',
-    'GMBLP': 'ESPORTS ENTERTAINMENT GROUP, INC.',
-    'GMBLW': 'ESPORTS ENTERTAINMENT GROUP, INC.',
-    'GMBLZ': 'ESPORTS ENTERTAINMENT GROUP, INC.',
-    'OPINL': 'OFFICE PROPERTIES INCOME TRUST',
-    'LTAFX': 'Alternative Strategies Income Fund',
-    'LTCFX': 'Alternative Strategies Income Fund',
-    'CLDT-PA': 'Chatham Lodging Trust',
-    'FGFPP': 'Fundamental Global Inc.',
-    'FTAIM': 'FTAI Aviation Ltd.',
-    'FTAIN': 'FTAI Aviation Ltd.',
-    'FTAIO': 'FTAI Aviation Ltd.',
-    'REXR-PC': 'Rexford Industrial Realty, Inc.',
-    'FUPEY': 'Fuchs Petrolub SE/ADR',
-    'FUPPF': 'Fuchs Petrolub SE/ADR',
-    'PW-PA': 'Power REIT',
-    'CGBDL': 'Carlyle Secured Lending, Inc.',
-    'BPYPM': 'Brookfield Property Partners L.P.',
-    'BPYPN': 'Brookfield Property Partners L.P.',
-    'BPYPO': 'Brookfield Property Partners L.P.',
-    'CPAXF': 'Siam Makro Public Co Limited/ADR',
-    'AUUDW': 'AUDDIA INC.',
-    'INBKZ': 'First Internet Bancorp',
-    'KDLYW': 'Kindly MD, Inc.',
-    'SXTPW': '60 DEGREES PHARMACEUTICALS, INC.',
-    'LMMY': 'LAMY',
-    'LVWR-WT': 'LiveWire Group, Inc.',
-    'FEAV': '5E Advanced Materials, Inc.',
-    'ASPCU': 'ASPAC III Acquisition Corp.',
-    'ASPCR': 'ASPAC III Acquisition Corp.',
-    'GLLIR': 'GLOBALINK INVESTMENT INC.',
-    'GLLIU': 'GLOBALINK INVESTMENT INC.',
-    'GLLIW': 'GLOBALINK INVESTMENT INC.',
-    'TETEU': 'Technology & Telecommunication Acquisition Corp',
-    'TETEW': 'Technology & Telecommunication Acquisition Corp',
-    'KLTOW': 'Klotho Neurosciences, Inc.',
-    'FUFUW': 'Bitfufu Inc.',
-    'DMYY-UN': 'dMY Squared Technology Group, Inc.',
-    'DMYY-WT': 'dMY Squared Technology Group, Inc.',
-    'STXYF': 'SatixFy Communications Ltd.',
-    'EUDAW': 'EUDA Health Holdings Ltd',
-    'HAIUF': 'Healthcare AI Acquisition Corp.',
-    'HAIWF': 'Healthcare AI Acquisition Corp.',
-    'BLDEW': 'Blade Air Mobility, Inc.',
-    'SLDPW': 'Solid Power, Inc.',
-    'PLMJW': 'Plum Acquisition Corp. III',
-    'PLMJU': 'Plum Acquisition Corp. III',
-    'AOMN': 'Angel Oak Mortgage REIT, Inc.',
-    'ZCARW': 'Zoomcar Holdings, Inc.',
-    'DC-WT': 'Dakota Gold Corp.',
-    'ALSUF': 'Alpha Star Acquisition Corp',
-    'ALSTF': 'Alpha Star Acquisition Corp',
-    'ALSWF': 'Alpha Star Acquisition Corp',
-    'DSAQW': 'Direct Selling Acquisition Corp.',
-    'GLEI': 'Galaxy Enterprises Inc. /WY/',
-    'RBTCW': 'Rubicon Technologies, Inc.',
-    'DSAQU': 'Direct Selling Acquisition Corp.',
-    'LARAX': 'Lord Abbett Credit Opportunities Fund',
-    'CELUW': 'Celularity Inc',
-    'PSPX': 'Pacific Sports Exchange Inc.',
-    'PDSKX': 'Principal Real Asset Fund',
-    'NRXPW': 'NRX Pharmaceuticals, Inc.',
-    'FATBP': 'Fat Brands, Inc',
-    'FATBW': 'Fat Brands, Inc',
-    'GPMT-PA': 'Granite Point Mortgage Trust Inc.',
-    'NVNBW': 'enVVeno Medical Corp',
-    'HTZWW': 'HERTZ GLOBAL HOLDINGS, INC',
-    'LENDX': 'Stone Ridge Trust V',
-    'METCZ': 'Ramaco Resources, Inc.',
-    'METCB': 'Ramaco Resources, Inc.',
-    'LTRYW': 'Lottery.com Inc.',
-    'METCL': 'Ramaco Resources, Inc.',
-    'NESRW': 'National Energy Services Reunited Corp.',
-    'TFLM': 'Tofla Megaline Inc.',
-    'LSEB': 'LSEB Creative Corp.',
-    'UHGI': 'Ultimate Holdings Group, Inc.',
-    'PLSAY': 'Polestar Automotive Holding UK PLC',
-    'ACLEW': 'Alternus Clean Energy, Inc.',
-    'SPKLU': 'Spark I Acquisition Corp',
-    'SPKLW': 'Spark I Acquisition Corp',
-    'DRTSW': 'Alpha Tau Medical Ltd.',
-    'GRAMW': 'Gold Flora Corp.',
-    'SWVLW': 'Swvl Holdings Corp',
-    'CDROW': 'Codere Online Luxembourg, S.A.',
-    'FGN': 'F&G Annuities & Life, Inc.',
-    'SDAWW': 'SunCar Technology Group Inc.',
-    'HOVRW': 'New Horizon Aircraft Ltd.',
-    'TANAF': 'Tian'an Technology Group Ltd',
-    'OAKUW': 'Oak Woods Acquisition Corp',
-    'OAKUR': 'Oak Woods Acquisition Corp',
-    'SVREW': 'SaverOne 2014 Ltd.',
-    'EVGRU': 'Evergreen Corp',
-    'EVGRW': 'Evergreen Corp',
-    'PGDE': 'PGD ECO SOLUTIONS',
-    'MCAGR': 'Mountain Crest Acquisition Corp. V',
-    'MCAGU': 'Mountain Crest Acquisition Corp. V',
-    'FNVWF': 'Finnovate Acquisition Corp.',
-    'FNVUF': 'Finnovate Acquisition Corp.',
-    'DCFWQ': 'Tritium DCFC Ltd',
-    'AMODW': 'ALPHA MODUS HOLDINGS, INC.',
-    'CTSUF': 'Cactus Acquisition Corp. 1 Ltd',
-    'CTSWF': 'Cactus Acquisition Corp. 1 Ltd',
-    'JVSAU': 'JVSPAC Acquisition Corp.',
-    'JVSAR': 'JVSPAC Acquisition Corp.',
-    'SEATW': 'Vivid Seats Inc.',
-    'PUCKU': 'Goal Acquisitions Corp.',
-    'PUCKW': 'Goal Acquisitions Corp.',
-    'GATEU': 'Marblegate Acquisition Corp.',
-    'GATEW': 'Marblegate Acquisition Corp.',
-    'UKOMW': 'Ucommune International Ltd',
-    'HLLY-WT': 'Holley Inc.',
-    'FRBP': 'Franklin BSP Capital Corp',
-    'OCAXU': 'OCA Acquisition Corp.',
-    'OCAXW': 'OCA Acquisition Corp.',
-    'GRND-WT': 'Grindr Inc.',
-    'SES-WT': 'SES AI Corp',
-    'BFRGW': 'BullFrog AI Holdings, Inc.',
-    'AUROW': 'Aurora Innovation, Inc.',
-    'PCTTU': 'PureCycle Technologies, Inc.',
-    'PCTTW': 'PureCycle Technologies, Inc.',
-    'IRAAU': 'Iris Acquisition Corp',
-    'IRAAW': 'Iris Acquisition Corp',
-    'GLCP': 'GLOBAL LEADERS CORP',
-    'RCIAX': 'Alternative Credit Income Fund',
-    'QTZM': 'Quantumzyme Corp.',
-    'NOEMU': 'CO2 Energy Transition Corp.',
-    'BCGWW': 'Binah Capital Group, Inc.',
-    'QLUNF': 'Qilun Group Inc.',
-    'OAKUU': 'Oak Woods Acquisition Corp',
-    'SRKKS': 'Public Shrek Royalties LLC',
-    'USGOW': 'U.S. GoldMining Inc.',
-    'RDPTF': 'Radiopharm Theranostics Ltd',
-    'CLGDF': 'Aris Mining Corp',
-    'BHFAM': 'Brighthouse Financial, Inc.',
-    'BHFAN': 'Brighthouse Financial, Inc.',
-    'BHFAO': 'Brighthouse Financial, Inc.',
-    'HHEGF': 'Huahui Education Group Ltd',
-    'VFLEX': 'FIRST TRUST ALTERNATIVE OPPORTUNITIES FUND',
-    'FCREX': 'FS Credit Income Fund',
-    'STSR': 'Strategic Student & Senior Housing Trust, Inc.',
-    'AMLIF': 'American Lithium Corp.',
-    'OWSCX': '1WS Credit Income Fund',
-    'GSMGW': 'Cheer Holding, Inc.',
-    'HOFVW': 'Hall of Fame Resort & Entertainment Co',
-    'AGNCO': 'AGNC Investment Corp.',
-    'AGNCP': 'AGNC Investment Corp.',
-    'AGNCL': 'AGNC Investment Corp.',
-    'KPHMW': 'KIORA PHARMACEUTICALS INC',
-    'SBFMW': 'Sunshine Biopharma Inc.',
-    'GNRSQ': 'Greenrose Holding Co Inc.',
-    'KPLTW': 'Katapult Holdings, Inc.',
-    'VENAF': 'MicroAlgo Inc.',
-    'BFLY-WT': 'Butterfly Network, Inc.',
-    'LGHLW': 'Lion Group Holding Ltd',
-    'LUCYW': 'Innovative Eyewear Inc',
-    'ABLLL': 'Abacus Life, Inc.',
-    'ABLLW': 'Abacus Life, Inc.',
-    'IMTXW': 'Immatics N.V.',
-    'OWLTW': 'Owlet, Inc.',
-    'GWH-WT': 'ESS Tech, Inc.',
-    'HUMAW': 'Humacyte, Inc.',
-    'JXN-PA': 'Jackson Financial Inc.',
-    'QRTEP': 'Qurate Retail, Inc.',
-    'GIGGF': 'Giga Metals Corp',
-    'DESLF': 'DIRTT ENVIRONMENTAL SOLUTIONS LTD',
-    'GAINN': 'GLADSTONE INVESTMENT CORPORATION\DE',
-    'GAINZ': 'GLADSTONE INVESTMENT CORPORATION\DE',
-    'GAINI': 'GLADSTONE INVESTMENT CORPORATION\DE',
-    'BKDT': 'Brookdale Senior Living Inc.',
-    'LIXTW': 'LIXTE BIOTECHNOLOGY HOLDINGS, INC.',
-    'AQNB': 'ALGONQUIN POWER & UTILITIES CORP.',
-    'AGQPF': 'ALGONQUIN POWER & UTILITIES CORP.',
-    'PFH': 'PRUDENTIAL FINANCIAL INC',
-    'NHPBP': 'National Healthcare Properties, Inc.',
-    'TNONW': 'Tenon Medical, Inc.',
-    'PRH': 'PRUDENTIAL FINANCIAL INC',
-    'PRS': 'PRUDENTIAL FINANCIAL INC',
-    'RITM-PA': 'Rithm Capital Corp.',
-    'RITM-PB': 'Rithm Capital Corp.',
-    'RITM-PC': 'Rithm Capital Corp.',
-    'RITM-PD': 'Rithm Capital Corp.',
-    'PRIF-PJ': 'Priority Income Fund, Inc.',
-    'PRIF-PK': 'Priority Income Fund, Inc.',
-    'PRIF-PL': 'Priority Income Fund, Inc.',
-    'PRIF-PD': 'Priority Income Fund, Inc.',
-    'PRIF-PF': 'Priority Income Fund, Inc.',
-    'PRIF-PH': 'Priority Income Fund, Inc.',
-    'PRIF-PI': 'Priority Income Fund, Inc.',
-    'VSSYW': 'Versus Systems Inc.',
-    'BTBDW': 'BT Brands, Inc.',
-    'ATNFW': '180 Life Sciences Corp.',
-    'PFFLX': 'PIMCO Flexible Credit Income Fund',
-    'SACH-PA': 'Sachem Capital Corp.',
-    'SCCC': 'Sachem Capital Corp.',
-    'SCCD': 'Sachem Capital Corp.',
-    'SCCE': 'Sachem Capital Corp.',
-    'SCCF': 'Sachem Capital Corp.',
-    'SCCG': 'Sachem Capital Corp.',
-    'TRTN-PB': 'Triton International Ltd',
-    'NRSAX': 'NEXPOINT REAL ESTATE STRATEGIES FUND',
-    'GECCI': 'Great Elm Capital Corp.',
-    'GECCH': 'Great Elm Capital Corp.',
-    'GECCZ': 'Great Elm Capital Corp.',
-    'NTRBW': 'NutriBand Inc.',
-    'GECCO': 'Great Elm Capital Corp.',
-    'CVE-WT': 'CENOVUS ENERGY INC.',
-    'CNVEF': 'CENOVUS ENERGY INC.',
-    'SBBA': 'Scorpio Tankers Inc.',
-    'WLLBW': 'Chord Energy Corp',
-    'LANDO': 'GLADSTONE LAND Corp',
-    'CANE': 'Teucrium Commodity Trust',
-    'TAGS': 'Teucrium Commodity Trust',
-    'WEAT': 'Teucrium Commodity Trust',
-    'SOYB': 'Teucrium Commodity Trust',
-    'CORN': 'Teucrium Commodity Trust',
-    'ATLCL': 'Atlanticus Holdings Corp',
-    'ATLCP': 'Atlanticus Holdings Corp',
-    'ATLCZ': 'Atlanticus Holdings Corp',
-    'NTTDF': 'NTT Data Corp',
-    'HYZNW': 'Hyzon Motors Inc.',
-    'IHICF': 'IHI Corporation/ADR',
-    'FSHPU': 'Flag Ship Acquisition Corp',
-    'FSHPR': 'Flag Ship Acquisition Corp',
-    'BEAGR': 'Bold Eagle Acquisition Corp.',
-    'BEAGU': 'Bold Eagle Acquisition Corp.',
-    'TTTPF': 'Nexxen International Ltd.',
-    'ONMDW': 'OneMedNet Corp',
-    'AYWWF': 'Ayr Wellness Inc.',
-    'OKMN': 'OKMIN RESOURCES, INC.',
-    'MITAU': 'Coliseum Acquisition Corp.',
-    'CSTUF': 'Constellation Acquisition Corp I',
-    'CSTWF': 'Constellation Acquisition Corp I',
-    'GROY-WT': 'Gold Royalty Corp.',
-    'SLMUF': 'Slam Corp.',
-    'SLMWF': 'Slam Corp.',
-    'ARBKL': 'Argo Blockchain Plc',
-    'BNAIW': 'Brand Engagement Network Inc.',
-    'CSLRW': 'Complete Solaria, Inc.',
-    'FIGP': 'Forge Group, Inc.',
-    'AISPW': 'Airship AI Holdings, Inc.',
-    'FAASW': 'DIGIASIA CORP.',
-    'GROVW': 'Grove Collaborative Holdings, Inc.',
-    'EONR-WT': 'EON Resources Inc.',
-    'SQLLW': 'ATLANTIC INTERNATIONAL CORP.',
-    'PSOIX': 'Palmer Square Opportunistic Income Fund',
-    'ECCC': 'Eagle Point Credit Co Inc.',
-    'ECC-PD': 'Eagle Point Credit Co Inc.',
-    'ECCV': 'Eagle Point Credit Co Inc.',
-    'ECCF': 'Eagle Point Credit Co Inc.',
-    'ECCU': 'Eagle Point Credit Co Inc.',
-    'ECCW': 'Eagle Point Credit Co Inc.',
-    'CTRVP': 'Hepion Pharmaceuticals, Inc.',
-    'RWAYL': 'Runway Growth Finance Corp.',
-    'TRTN-PC': 'Triton International Ltd',
-    'TRTN-PD': 'Triton International Ltd',
-    'TRTN-PE': 'Triton International Ltd',
-    'RWAYZ': 'Runway Growth Finance Corp.',
-    'RVMDW': 'Revolution Medicines, Inc.',
-    'CRTDW': 'Creatd, Inc.',
-    'NXDT-PA': 'NEXPOINT DIVERSIFIED REAL ESTATE TRUST',
-    'ACR-PC': 'ACRES Commercial Realty Corp.',
-    'ACR-PD': 'ACRES Commercial Realty Corp.',
-    'AHL-PE': 'ASPEN INSURANCE HOLDINGS LTD',
-    'AHL-PF': 'ASPEN INSURANCE HOLDINGS LTD',
-    'MFICL': 'MidCap Financial Investment Corp',
-    'DSHKN': 'Drive Shack Inc.',
-    'DSHKO': 'Drive Shack Inc.',
-    'DSHKP': 'Drive Shack Inc.',
-    'DNMRW': 'Danimer Scientific, Inc.',
-    'GOODN': 'GLADSTONE COMMERCIAL CORP',
-    'GOODO': 'GLADSTONE COMMERCIAL CORP',
-    'ADNWW': 'ADVENT TECHNOLOGIES HOLDINGS, INC.',
-    'COEPW': 'Coeptis Therapeutics Holdings, Inc.',
-    'SHOTW': 'Safety Shot, Inc.',
-    'OBTC': 'Osprey Bitcoin Trust',
-    'ILLRW': 'Triller Group Inc.',
-    'ADVWW': 'Advantage Solutions Inc.',
-    'KKRS': 'KKR & Co. Inc.',
-    'GDL-PC': 'GDL FUND',
-    'AUB-PA': 'Atlantic Union Bankshares Corp',
-    'BFS-PE': 'SAUL CENTERS, INC.',
-    'RWTN': 'REDWOOD TRUST INC',
-    'RWTO': 'REDWOOD TRUST INC',
-    'RWT-PA': 'REDWOOD TRUST INC',
-    'SSRGF': 'SSR MINING INC.',
-    'MLCMF': 'MILLICOM INTERNATIONAL CELLULAR SA',
-    'HCIIP': 'HCI Group, Inc.',
-    'NNDNF': 'NIDEC CORP',
-    'PAAPU': 'PLAINS ALL AMERICAN PIPELINE LP',
-    'RBMCF': 'ROYAL BANK OF CANADA',
-    'RBCPF': 'ROYAL BANK OF CANADA',
-    'RYLBF': 'ROYAL BANK OF CANADA',
-    'WTFCP': 'WINTRUST FINANCIAL CORP',
-    'SKMTF': 'SK TELECOM CO LTD',
-    'ELPC': 'ENERGY CO OF PARANA',
-    'RILYG': 'B. Riley Financial, Inc.',
-    'RILYK': 'B. Riley Financial, Inc.',
-    'RILYL': 'B. Riley Financial, Inc.',
-    'RILYM': 'B. Riley Financial, Inc.',
-    'RILYN': 'B. Riley Financial, Inc.',
-    'SHZNF': 'Shenzhen Expressway Co. / ADR',
-    'RILYP': 'B. Riley Financial, Inc.',
-    'RILYT': 'B. Riley Financial, Inc.',
-    'RILYZ': 'B. Riley Financial, Inc.',
-    'EFC-PD': 'Ellington Financial Inc.',
-    'EFC-PA': 'Ellington Financial Inc.',
-    'EFC-PB': 'Ellington Financial Inc.',
-    'EFC-PC': 'Ellington Financial Inc.',
-    'INN-PF': 'Summit Hotel Properties, Inc.',
-    'HWLDF': 'H World Group Ltd',
-    'HTFB': 'Horizon Technology Finance Corp',
-    'HTFC': 'Horizon Technology Finance Corp',
-    'OFSSH': 'OFS Capital Corp',
-    'CCIA': 'Carlyle Credit Income Fund',
-    'YKLTF': 'Yakult Honsha Co., LTD/ADR',
-    'BEPH': 'Brookfield Renewable Partners L.P.',
-    'BEPI': 'Brookfield Renewable Partners L.P.',
-    'BEP-PA': 'Brookfield Renewable Partners L.P.',
-    'BRENF': 'Brookfield Renewable Partners L.P.',
-    'BEPJ': 'Brookfield Renewable Partners L.P.',
-    'CRSLF': 'carsales.com Limited/ADR',
-    'BIAFW': 'bioAffinity Technologies, Inc.',
-    'CADCX': 'CION Ares Diversified Credit Fund',
-    'ZTOEF': 'ZTO Express (Cayman) Inc.',
-    'SYTAW': 'Siyata Mobile Inc.',
-    'HPE-PC': 'Hewlett Packard Enterprise Co',
-    'DATSW': 'DatChat, Inc.',
-    'AREBW': 'AMERICAN REBEL HOLDINGS INC',
-    'MAPSW': 'WM TECHNOLOGY, INC.',
-    'CPRDX': 'Clarion Partners Real Estate Income Fund Inc.',
-    'MPLNW': 'MultiPlan Corp',
-    'JSPRW': 'Jasper Therapeutics, Inc.',
-    'NREF-PA': 'NexPoint Real Estate Finance, Inc.',
-    'MNTSW': 'Momentus Inc.',
-    'GTECW': 'Greenland Technologies Holding Corp.',
-    'CCLFX': 'Cliffwater Corporate Lending Fund',
-    'RVPHW': 'REVIVA PHARMACEUTICALS HOLDINGS, INC.',
-    'ALTG-PA': 'ALTA EQUIPMENT GROUP INC.',
-    'MVSTW': 'Microvast Holdings, Inc.',
-    'XELAP': 'Exela Technologies, Inc.',
-    'MBINM': 'Merchants Bancorp',
-    'MBINL': 'Merchants Bancorp',
-    'MBINN': 'Merchants Bancorp',
-    'MBINO': 'Merchants Bancorp',
-    'BWNB': 'Babcock & Wilcox Enterprises, Inc.',
-    'BW-PA': 'Babcock & Wilcox Enterprises, Inc.',
-    'BWSN': 'Babcock & Wilcox Enterprises, Inc.',
-    'VJTTY': 'voxeljet AG',
-    'NXPT': 'NexPoint Capital, Inc.',
-    'BBAAY': 'Alibaba Group Holding Ltd',
-    'MITN': 'AG Mortgage Investment Trust, Inc.',
-    'MITP': 'AG Mortgage Investment Trust, Inc.',
-    'MITT-PC': 'AG Mortgage Investment Trust, Inc.',
-    'FSEN': 'FS Specialty Lending Fund',
-    'CNFRZ': 'Conifer Holdings, Inc.',
-    'DTLAP': 'Brookfield DTLA Fund Office Trust Investor Inc.',
-    'SPNT-PB': 'SiriusPoint Ltd',
-    'SSPFF': 'SiriusPoint Ltd',
-    'BTGWF': 'BTS Group Holdings Public Co Limited/ADR',
-    'BTGRF': 'BTS Group Holdings Public Co Limited/ADR',
-    'BTLWF': 'BTS Group Holdings Public Co Limited/ADR',
-    'LLYVB': 'Liberty Media Corp',
-    'LLYVK': 'Liberty Media Corp',
-    'LLYVA': 'Liberty Media Corp',
-    'CMPOW': 'CompoSecure, Inc.',
-    'BKKT-WT': 'Bakkt Holdings, Inc.',
-    'GCMGW': 'GCM Grosvenor Inc.',
-    'SRZNW': 'Surrozen, Inc./DE',
-    'RSVRW': 'Reservoir Media, Inc.',
-    'EVEX-WT': 'Eve Holding, Inc.',
-    'BHILW': 'Benson Hill, Inc.',
-    'PIIIW': 'P3 Health Partners Inc.',
-    'DNABW': 'Ginkgo Bioworks Holdings, Inc.',
-    'GPATW': 'GP-Act III Acquisition Corp.',
-    'GPATU': 'GP-Act III Acquisition Corp.',
-    'TALKW': 'Talkspace, Inc.',
-    'TOIIW': 'Oncology Institute, Inc.',
-    'ETWO-WT': 'E2open Parent Holdings, Inc.',
-    'NUVB-WT': 'Nuvation Bio Inc.',
-    'HTOOW': 'Fusion Fuel Green PLC',
-    'SONDW': 'Sonder Holdings Inc.',
-    'FILG': 'Grayscale Filecoin Trust (FIL)',
-    'ANSCU': 'Agriculture & Natural Solutions Acquisition Corp',
-    'ANSCW': 'Agriculture & Natural Solutions Acquisition Corp',
-    'ORIB': 'Orion Bliss Corp.',
-    'AMBP-WT': 'Ardagh Metal Packaging S.A.',
-    'AACT-WT': 'Ares Acquisition Corp II',
-    'AACT-UN': 'Ares Acquisition Corp II',
-    'MOBXW': 'MOBIX LABS, INC',
-    'KORGW': 'KORE Group Holdings, Inc.',
-    'NVACR': 'NorthView Acquisition Corp',
-    'NVACW': 'NorthView Acquisition Corp',
-    'CITEU': 'Cartica Acquisition Corp',
-    'CITEW': 'Cartica Acquisition Corp',
-    'INTEU': 'Integral Acquisition Corp 1',
-    'INTEW': 'Integral Acquisition Corp 1',
-    'BNIXR': 'Bannix Acquisition Corp.',
-    'BNIXW': 'Bannix Acquisition Corp.',
-    'RMCOW': 'Royalty Management Holding Corp',
-    'BSLKW': 'Bolt Projects Holdings, Inc.',
-    'PSFE-WT': 'Paysafe Ltd',
-    'SEVCD': 'Sono Group N.V.',
-    'VEEAW': 'VEEA INC.',
-    'MGNC': 'Mag Magna Corp',
-    'FBYDW': 'Falcon's Beyond Global, Inc.',
-    'ATMVR': 'AlphaVest Acquisition Corp.',
-    'ATMVU': 'AlphaVest Acquisition Corp.',
-    'ECDAW': 'ECD Automotive Design, Inc.',
-    'NWTNW': 'NWTN, Inc.',
-    'MDNC': 'Medinotec Inc.',
-    'DECAU': 'Denali Capital Acquisition Corp.',
-    'DECAW': 'Denali Capital Acquisition Corp.',
-    'GSTK': 'Growth Stalk Holdings Corp',
-    'RZLVW': 'REZOLVE AI Ltd',
-    'KHOB': 'KHEOBA CORP.',
-    'VFSWW': 'VinFast Auto Ltd.',
-    'LEGT-UN': 'Legato Merger Corp. III',
-    'LEGT-WT': 'Legato Merger Corp. III',
-    'HPAIW': 'Helport AI Ltd',
-    'NIVFW': 'NewGenIvf Group Ltd',
-    'MNYWW': 'MoneyHero Ltd',
-    'AFJKR': 'Aimei Health Technology Co., Ltd.',
-    'AFJKU': 'Aimei Health Technology Co., Ltd.',
-    'MMVWW': 'MultiMetaVerse Holdings Ltd',
-    'SWAGW': 'Stran & Company, Inc.',
-    'TLGUF': 'TLGY ACQUISITION CORP',
-    'LCFYW': 'Locafy Ltd',
-    'CSLMR': 'CSLM ACQUISITION CORP.',
-    'CSLMU': 'CSLM ACQUISITION CORP.',
-    'CSLMW': 'CSLM ACQUISITION CORP.',
-    'WBX-WT': 'Wallbox N.V.',
-    'OCEAW': 'Ocean Biomedical, Inc.',
-    'PROCW': 'Procaps Group, S.A.',
-    'VSEEW': 'VSEE HEALTH, INC.',
-    'NXNVW': 'NEXTNAV INC.',
-    'NNAVW': 'NEXTNAV INC.',
-    'NE-WTA': 'Noble Corp plc',
-    'NE-WT': 'Noble Corp plc',
-    'ABPWW': 'Abpro Holdings, Inc.',
-    'LUXHP': 'LUXURBAN HOTELS INC.',
-    'WLDSW': 'Wearable Devices Ltd.',
-    'TLGWF': 'TLGY ACQUISITION CORP',
-    'GODNU': 'Golden Star Acquisition Corp',
-    'GODNR': 'Golden Star Acquisition Corp',
-    'NBLWF': 'Noble Corp plc',
-    'HUBCW': 'Hub Cyber Security Ltd.',
-    'HUBCZ': 'Hub Cyber Security Ltd.',
-    'CLRCR': 'ClimateRock',
-    'CLRCU': 'ClimateRock',
-    'CLRCW': 'ClimateRock',
-    'SBXD-UN': 'SilverBox Corp IV',
-    'SBXD-WT': 'SilverBox Corp IV',
-    'CUBWW': 'Lionheart Holdings',
-    'CUBWU': 'Lionheart Holdings',
-    'MBAVU': 'M3-Brigade Acquisition V Corp.',
-    'MBAVW': 'M3-Brigade Acquisition V Corp.',
-    'CHARR': 'Charlton Aria Acquisition Corp',
-    'CHARU': 'Charlton Aria Acquisition Corp',
-    'TAVIU': 'Tavia Acquisition Corp.',
-    'TAVIR': 'Tavia Acquisition Corp.',
-    'MACIW': 'Melar Acquisition Corp. I/Cayman',
-    'MACIU': 'Melar Acquisition Corp. I/Cayman',
-    'MLACU': 'Mountain Lake Acquisition Corp.',
-    'RANGU': 'Range Capital Acquisition Corp.',
-    'RANGR': 'Range Capital Acquisition Corp.',
-}
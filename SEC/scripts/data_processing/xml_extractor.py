@@ -1,7 +1,13 @@
 import csv
 import os
+import sys
 import requests
 
+# Add the repository root to the system path for the tracing spans
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from tracing import span
+
 # Define the relative path to the CSV file and the directory to save the XML files
 csv_file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'CSV', 'combined', 'filings.csv')
 output_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'XML', 'raw')
@@ -25,7 +31,10 @@ def download_xml_files(csv_file_path, output_dir):
             file_path = os.path.join(output_dir, filename)
             
             # Download the XML file
-            response = requests.get(xml_url, headers=headers)
+            with span("edgar.download_xml", accession=accession_number) as s:
+                response = requests.get(xml_url, headers=headers)
+                s.set(status=response.status_code)
+                s.count("bytes", len(response.content))
             if response.status_code == 200:
                 with open(file_path, 'wb') as file:
                     file.write(response.content)
@@ -34,4 +43,5 @@ def download_xml_files(csv_file_path, output_dir):
                 print(f"Failed to download: {xml_url}")
 
 # Run the function to download and save XML files
-download_xml_files(csv_file_path, output_dir)
\ No newline at end of file
+with span("sec.xml_extractor"):
+    download_xml_files(csv_file_path, output_dir)
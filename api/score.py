@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler
+
+# Serverless scoring entry point for Vercel (see vercel.json). It is deployed with
+# only api/requirements.txt and the files .vercelignore keeps. Imports are kept to
+# the standard library so cold starts stay fast; the quantized model runtime is
+# only imported when a model has been exported with export_onnx.py.
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Add the repository root to the system path for the keyword fallback
+sys.path.append(os.path.join(base_dir, '..'))
+
+from keyword_sentiment import simple_sentiment_classifier
+
+# 🔹 Directory of the int8 ONNX model, its tokenizer.json and config.json
+ONNX_MODEL_DIR = os.environ.get("ONNX_MODEL_DIR", os.path.join(base_dir, "model"))
+
+MAX_LENGTH = 256  # Tokens per text, as truncated by the tokenizer
+BATCH_SIZE = 32
+
+# 🔹 Request limits, the same as inference_server.py
+MAX_REQUEST_TEXTS = 1024
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+# Loaded on the first request and kept while the function instance stays warm
+_classifier = None
+_model_name = None
+
+def load_onnx_classifier(model_dir):
+    """
+    Returns a classifier running the quantized ONNX model in model_dir with
+    onnxruntime and the tokenizers library, scoring like the sentiment-analysis
+    pipeline: one {"label": ..., "score": ...} dict per text.
+    """
+    import numpy as np
+    import onnxruntime
+    from tokenizers import Tokenizer
+
+    tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+    tokenizer.enable_truncation(MAX_LENGTH)
+    pad_id = tokenizer.token_to_id("[PAD]") or 0
+    tokenizer.enable_padding(pad_id=pad_id, pad_token="[PAD]")
+
+    labels = ["NEGATIVE", "POSITIVE"]
+    config_path = os.path.join(model_dir, "config.json")
+    if os.path.exists(config_path):
+        with open(config_path, encoding="utf-8") as file:
+            id2label = json.load(file).get("id2label", {})
+        if id2label:
+            labels = [id2label[str(i)] for i in range(len(id2label))]
+
+    session = onnxruntime.InferenceSession(os.path.join(model_dir, "model.onnx"), providers=["CPUExecutionProvider"])
+    input_names = {i.name for i in session.get_inputs()}
+
+    def classify(texts):
+        if not isinstance(texts, list):
+            texts = [texts]
+        results = []
+        for i in range(0, len(texts), BATCH_SIZE):
+            encodings = tokenizer.encode_batch([str(text) for text in texts[i:i + BATCH_SIZE]])
+            feeds = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            logits = session.run(None, {name: value for name, value in feeds.items() if name in input_names})[0]
+            # Softmax over the labels, shifted for numerical stability
+            exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+            probs = exp / exp.sum(axis=1, keepdims=True)
+            for row in probs:
+                best = int(row.argmax())
+                # Labels match the sentiment-analysis pipeline's, whatever case the model uses
+                results.append({"label": labels[best].upper(), "score": float(row[best])})
+        return results
+
+    return classify
+
+def get_classifier():
+    """
+    Returns the quantized model if one has been exported and its runtime is
+    installed, otherwise the keyword fallback, and a name for it.
+    """
+    global _classifier, _model_name
+    if _classifier is None:
+        try:
+            _classifier = load_onnx_classifier(ONNX_MODEL_DIR)
+            _model_name = os.path.basename(ONNX_MODEL_DIR)
+        except Exception as e:
+            print(f"Quantized model unavailable ({e}). Using simple fallback classifier.")
+            _classifier = simple_sentiment_classifier
+            _model_name = "keyword-fallback"
+    return _classifier, _model_name
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/healthz"):
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+        _, model_name = get_classifier()
+        self.send_json(200, {"status": "ok", "model": model_name})
+
+    def do_POST(self):
+        if self.path != "/v1/score":
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self.send_json(413, {"error": f"Request body over {MAX_BODY_BYTES} bytes"})
+        try:
+            texts = json.loads(self.rfile.read(length))["texts"]
+            if not isinstance(texts, list):
+                raise ValueError("'texts' must be a list")
+        except (ValueError, KeyError, TypeError) as e:
+            return self.send_json(400, {"error": f"Expected a JSON body {{\"texts\": [...]}}: {e}"})
+        if len(texts) > MAX_REQUEST_TEXTS:
+            return self.send_json(413, {"error": f"At most {MAX_REQUEST_TEXTS} texts per request"})
+
+        classifier, model_name = get_classifier()
+        try:
+            results = classifier([str(text) for text in texts]) if texts else []
+        except Exception as e:
+            return self.send_json(503, {"error": f"Scoring failed: {e}"})
+        self.send_json(200, {"model": model_name, "results": results})
+
+    def send_json(self, status, body):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
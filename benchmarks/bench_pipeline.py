@@ -0,0 +1,221 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import requests
+
+from common import base_dir, new_report, peak_rss_mb, run_isolated, save_report
+
+# Tickers with recorded EDGAR submissions and filings for the stub server
+DEFAULT_TICKERS = ["NVDA", "AAPL", "LLY", "BBW"]
+
+# Left out of the scratch copy the flow runs in
+COPY_IGNORE = shutil.ignore_patterns('.git', '__pycache__', '.cache', 'results', 'history', '*.sqlite*')
+
+def copy_tree(target_dir):
+    """
+    Copies the repository to target_dir. The SEC scripts and full.py write to
+    fixed paths inside the tree, so the flow runs in the copy and leaves the
+    checked-in data untouched. Returns the root of the copy.
+    """
+    root = os.path.join(target_dir, 'repo')
+    shutil.copytree(base_dir, root, ignore=COPY_IGNORE)
+    return root
+
+def start_stub_server(root, latency_ms, jitter_ms, timeout=30):
+    """
+    Starts the stub APIs of the copy in their own process, so their socket
+    traffic and memory stay out of the flow's measurements. Returns the process and its URL.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "stubs.server", "--port", str(port), "--quiet",
+         "--latency-ms", str(latency_ms), "--jitter-ms", str(jitter_ms)],
+        cwd=root, stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"{url}/_stats", timeout=1)
+            return process, url
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"Stub server did not start on {url}")
+
+def read_io():
+    """
+    Returns the bytes this process and its waited-for children read and wrote:
+    to storage (read_bytes/write_bytes) and through read/write calls (rchar/wchar).
+    Returns None where /proc/self/io is unavailable.
+    """
+    try:
+        with open('/proc/self/io', encoding='utf-8') as file:
+            counters = dict(line.split(': ') for line in file.read().splitlines())
+    except OSError:
+        return None
+    return {key: int(counters[key]) for key in ('rchar', 'wchar', 'read_bytes', 'write_bytes')}
+
+def interpreter_startup_seconds(runs=5):
+    """
+    Returns the median time to start and exit a bare interpreter, the floor on
+    the cost of every subprocess stage.
+    """
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+class StageTimer:
+    """
+    Collects wall time, subprocess calls and I/O of each named stage. Peak memory
+    only exists per process, so it is reported per run, not per stage.
+    """
+
+    def __init__(self):
+        self.stages = []
+        self.spawns = 0
+
+    @contextmanager
+    def stage(self, name):
+        io_before = read_io()
+        spawns_before = self.spawns
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            io_after = read_io()
+            self.stages.append({
+                "stage": name,
+                "seconds": elapsed,
+                "subprocesses": self.spawns - spawns_before,
+                "io": {key: io_after[key] - io_before[key] for key in io_after} if io_before else None,
+            })
+
+    def count_spawns(self, run):
+        """
+        Wraps subprocess.run so every call made by the flow is counted.
+        """
+        def counted(*args, **kwargs):
+            self.spawns += 1
+            return run(*args, **kwargs)
+        return counted
+
+def summarize_run(ticker, flow, timer, elapsed, startup):
+    io = [s["io"] for s in timer.stages if s["io"]]
+    return {
+        "ticker": ticker,
+        "flow": flow,
+        "seconds": elapsed,
+        "stages": timer.stages,
+        "subprocesses": timer.spawns,
+        # Interpreter start-up alone; module imports inside the scripts come on top
+        "spawn_overhead_seconds": timer.spawns * startup,
+        "io": {key: sum(i[key] for i in io) for key in io[0]} if io else None,
+        # Each run has its own process, so these peaks belong to this ticker and flow alone
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_child_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+def run_stocks_flow(pipeline, ticker, stage):
+    """
+    Runs the Stocks page steps of pipeline.run_stock_pipeline, without writing the history store.
+    """
+    with stage("sec"):
+        insider_sentiment = pipeline.run_sec_stage(ticker)
+    if insider_sentiment is None:
+        return
+    with stage("sources"):
+        results, _ = pipeline.score_sources(ticker)
+    with stage("weighted_average"):
+        pipeline.weighted_average(results, insider_sentiment)
+
+def run_config(config):
+    """
+    Runs one flow for one ticker in this process, importing the flow from the
+    scratch copy, and returns its stats.
+    """
+    sys.path.insert(0, config["root"])
+    import full
+    import pipeline
+
+    timer = StageTimer()
+    subprocess.run = timer.count_spawns(subprocess.run)
+    started = time.perf_counter()
+    if config["flow"] == "full":
+        full.run(config["ticker"], config["ticker"], stage=timer.stage)
+    else:
+        run_stocks_flow(pipeline, config["ticker"], timer.stage)
+    elapsed = time.perf_counter() - started
+    return summarize_run(config["ticker"], config["flow"], timer, elapsed, config["startup"])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the full.py / Stocks page flow against the stub APIs.")
+    parser.add_argument("--tickers", nargs="+", default=DEFAULT_TICKERS)
+    parser.add_argument("--flows", nargs="+", default=["full"], choices=["full", "stocks"],
+                        help="full.py's flow, and/or the Stocks page flow with sentiment scoring")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latency of every stub API response")
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--output", help="Path of the JSON results (default: benchmarks/results/pipeline-<time>.json)")
+    parser.add_argument("--config", help=argparse.SUPPRESS)  # One flow and ticker, run by run_isolated
+    args = parser.parse_args()
+
+    if args.config:
+        print(json.dumps(run_config(json.loads(args.config))))
+        return
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        root = copy_tree(work_dir)
+
+        # The flow runs from the copy, with the connectors pointed at the stubs
+        server, url = start_stub_server(root, args.latency_ms, args.jitter_ms)
+        try:
+            os.environ["STUB_SERVER_URL"] = url
+            os.environ["API_CACHE_TTL"] = "0"  # Every run fetches, as on a cold cache
+            os.environ["YOUTUBE_DAILY_QUOTA"] = os.environ["GOOGLE_DAILY_QUOTA"] = str(10 ** 9)
+
+            startup = interpreter_startup_seconds()
+            report = new_report(
+                "pipeline",
+                tickers=args.tickers,
+                stub_latency_ms=args.latency_ms,
+                stub_jitter_ms=args.jitter_ms,
+                interpreter_startup_seconds=startup,
+            )
+
+            # Each run gets its own process, so its memory peaks and I/O are its own
+            for flow in args.flows:
+                for ticker in args.tickers:
+                    stats = run_isolated(__file__, {"root": root, "flow": flow, "ticker": ticker, "startup": startup})
+                    if stats is None:
+                        continue
+                    report["results"].append(stats)
+                    stages = "  ".join(f"{s['stage']} {s['seconds']:.2f}s" for s in stats["stages"])
+                    print(
+                        f"{flow:<6} {ticker:<6} total {stats['seconds']:.2f}s  {stages}  "
+                        f"rss {stats['peak_rss_mb']:.0f} MB (children {stats['peak_child_rss_mb']:.0f} MB)"
+                    )
+            report["stub_requests"] = requests.get(f"{url}/_stats", timeout=5).json()
+        finally:
+            server.terminate()
+            server.wait()
+
+    save_report(report, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import argparse
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the SEC scripts directory to the system path
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+data_processing_path = os.path.join(base_dir, 'SEC', 'scripts', 'data_processing')
+sys.path.append(data_processing_path)
+
+# Add the repository root to the system path for the stub market caps
+sys.path.append(base_dir)
+
+import Summarize
+from read_xml import extract_form4_data
+from common import new_report, peak_rss_mb, run_isolated, save_report
+
+# The stub APIs' fixed market caps replace the live yfinance lookup, so runs are
+# offline, repeatable and consistent with stub-backed pipeline runs
+from stubs.server import DEFAULT_MARKET_CAP, MARKET_CAPS
+
+XML_DIR = os.path.join(base_dir, 'SEC', 'data', 'XML', 'raw')
+
+TRANSACTION_FIELDS = [
+    'company_name',
+    'relationship_to_issuer',
+    'title_of_security',
+    'transaction_date',
+    'transaction_code',
+    'acquired_or_disposed',
+    'transaction_shares',
+    'transaction_price',
+    'shares_owned_after',
+]
+
+def replicate_filings(xml_dir, target_dir, copies):
+    """
+    Fills target_dir with copies of every bundled filing. File names keep the
+    ticker prefix read_xml derives the company from. Returns the file paths.
+    """
+    paths = []
+    for filename in sorted(os.listdir(xml_dir)):
+        if not filename.endswith('.xml'):
+            continue
+        source = os.path.join(xml_dir, filename)
+        if copies == 1:
+            paths.append(source)
+            continue
+        stem = os.path.splitext(filename)[0]
+        for i in range(copies):
+            target = os.path.join(target_dir, f"{stem}_{i}.xml")
+            shutil.copyfile(source, target)
+            paths.append(target)
+    return paths
+
+def traced_peak_mb(trace_memory):
+    """
+    Returns the peak traced allocation in MB and stops tracing, or None when tracing is off.
+    """
+    if not trace_memory:
+        return None
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def bench_parse(paths, trace_memory=False):
+    """
+    Runs read_xml.extract_form4_data over every file and returns the stats and the transactions.
+    """
+    transactions = []
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for path in paths:
+        transactions.extend(extract_form4_data(path))
+    elapsed = time.perf_counter() - started
+    peak = traced_peak_mb(trace_memory)
+
+    return {
+        "stage": "parse",
+        "files": len(paths),
+        "transactions": len(transactions),
+        "seconds": elapsed,
+        "files_per_sec": len(paths) / elapsed if elapsed else None,
+        "transactions_per_sec": len(transactions) / elapsed if elapsed else None,
+        "peak_traced_mb": peak,
+        "peak_rss_mb": peak_rss_mb(),
+    }, transactions
+
+def latest_transaction_date(transactions):
+    dates = [Summarize.parse_date(tx['transaction_date'].strip()) for tx in transactions]
+    dates = [date for date in dates if date]
+    return max(dates) if dates else None
+
+def bench_summarize(transactions, work_dir, trace_memory=False):
+    """
+    Writes the transactions CSV and runs Summarize.process_form4_data for every
+    ticker in it, with market caps stubbed. The six-month window ends at the
+    latest bundled transaction so the filings stay in range as they age.
+    """
+    input_csv = os.path.join(work_dir, 'form4_data.csv')
+    with open(input_csv, mode='w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=TRANSACTION_FIELDS)
+        writer.writeheader()
+        writer.writerows(transactions)
+
+    tickers = sorted({tx['company_name'] for tx in transactions})
+    as_of = latest_transaction_date(transactions)
+    Summarize.fetch_market_cap = lambda ticker: MARKET_CAPS.get(ticker.upper(), DEFAULT_MARKET_CAP)
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for ticker in tickers:
+        Summarize.process_form4_data(ticker, os.path.join(work_dir, f"summary_{ticker}.csv"), input_csv=input_csv, as_of=as_of)
+    elapsed = time.perf_counter() - started
+    peak = traced_peak_mb(trace_memory)
+
+    # process_form4_data rereads the whole CSV once per ticker
+    rows_read = len(transactions) * len(tickers)
+    return {
+        "stage": "summarize",
+        "tickers": len(tickers),
+        "transactions": len(transactions),
+        "seconds": elapsed,
+        "tickers_per_sec": len(tickers) / elapsed if elapsed else None,
+        "transactions_per_sec": rows_read / elapsed if elapsed else None,
+        "peak_traced_mb": peak,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def run_config(config):
+    """
+    Runs one replication count in this process and returns its parse and summarize stats.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = replicate_filings(config["xml_dir"], work_dir, config["copies"])
+        parse_stats, transactions = bench_parse(paths, config["trace_memory"])
+        summarize_stats = bench_summarize(transactions, work_dir, config["trace_memory"])
+    return [parse_stats, summarize_stats]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Form 4 parsing and summarization on the bundled filings.")
+    parser.add_argument("--copies", nargs="+", type=int, default=[1, 10], help="Times each bundled filing is replicated")
+    parser.add_argument("--xml-dir", default=XML_DIR, help="Directory of Form 4 XML filings")
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Also report peak Python allocations (tracemalloc slows the timed stages)"
+    )
+    parser.add_argument("--output", help="Path of the JSON results (default: benchmarks/results/sec-<time>.json)")
+    parser.add_argument("--config", help=argparse.SUPPRESS)  # One replication count, run by run_isolated
+    args = parser.parse_args()
+
+    if args.config:
+        print(json.dumps(run_config(json.loads(args.config))))
+        return
+
+    report = new_report("sec", xml_dir=os.path.relpath(args.xml_dir, base_dir))
+
+    # Each replication count runs in its own process, so its peak RSS is its own
+    for copies in args.copies:
+        results = run_isolated(__file__, {"copies": copies, "xml_dir": args.xml_dir, "trace_memory": args.trace_memory})
+        if results is None:
+            continue
+        parse_stats, summarize_stats = results
+
+        for stats in (parse_stats, summarize_stats):
+            stats["copies"] = copies
+            report["results"].append(stats)
+
+        print(
+            f"copies={copies:<5} parse: {parse_stats['files_per_sec']:.1f} files/s, "
+            f"{parse_stats['transactions_per_sec']:.1f} transactions/s | "
+            f"summarize: {summarize_stats['transactions_per_sec']:.1f} transactions/s | rss {summarize_stats['peak_rss_mb']:.0f} MB"
+        )
+
+    save_report(report, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the repository root to the system path
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(base_dir)
+
+from keyword_sentiment import simple_sentiment_classifier
+from common import new_report, peak_rss_mb, run_isolated, save_report
+
+FIXTURE_PATH = os.path.join(base_dir, 'aggregated_data.feather')
+RESULTS_PAGE_PATH = os.path.join(base_dir, 'pages', '3_Sentiment_Analysis_Results.py')
+MODEL_NAME = "distilbert-base-uncased-finetuned-sst-2-english"
+
+def load_fixture(path=FIXTURE_PATH, scale=1, seed=0):
+    """
+    Returns the checked-in aggregated texts, or a synthetic variant scale times as
+    large. Scaled-up texts shuffle the words of real titles, so lengths and
+    vocabulary stay realistic without repeating identical strings.
+    """
+    texts = pd.read_feather(path)['text'].dropna().astype(str).tolist()
+    if scale <= 1:
+        return texts
+
+    rng = random.Random(seed)
+    scaled = list(texts)
+    while len(scaled) < len(texts) * scale:
+        words = rng.choice(texts).split()
+        rng.shuffle(words)
+        scaled.append(" ".join(words))
+    return scaled
+
+def load_backend(name, threads):
+    """
+    Returns (classify, count_tokens) for a backend. classify takes a list of texts
+    and returns the pipeline's label/score dicts. Returns None if the backend cannot load.
+    """
+    if name == "keyword":
+        return simple_sentiment_classifier, lambda texts: sum(len(text.split()) for text in texts)
+
+    if name == "transformers":
+        try:
+            import torch
+            from transformers import pipeline
+        except ImportError as e:
+            print(f"Skipping transformers backend: {e}")
+            return None
+        torch.set_num_threads(threads)
+        try:
+            classifier = pipeline("sentiment-analysis", model=MODEL_NAME)
+        except Exception as e:
+            print(f"Skipping transformers backend: {e}")
+            return None
+        tokenizer = classifier.tokenizer
+        return (
+            # Without batch_size the pipeline runs the texts of a batch one at a time
+            lambda texts: classifier(texts, batch_size=len(texts), truncation=True),
+            lambda texts: sum(len(ids) for ids in tokenizer(texts, truncation=True)["input_ids"]),
+        )
+
+    raise ValueError(f"Unknown backend: {name}")
+
+def bench_backend(classify, count_tokens, texts, batch_size, warmup=1):
+    """
+    Classifies texts in batches of batch_size and returns the throughput and batch latency stats.
+    """
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    for batch in batches[:warmup]:
+        classify(batch)
+
+    latencies = []
+    started = time.perf_counter()
+    for batch in batches:
+        batch_started = time.perf_counter()
+        classify(batch)
+        latencies.append(time.perf_counter() - batch_started)
+    elapsed = time.perf_counter() - started
+
+    tokens = count_tokens(texts)
+    return {
+        "texts": len(texts),
+        "tokens": tokens,
+        "batches": len(batches),
+        "seconds": elapsed,
+        "texts_per_sec": len(texts) / elapsed if elapsed else None,
+        "tokens_per_sec": tokens / elapsed if elapsed else None,
+        "batch_latency_p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "batch_latency_p99_ms": float(np.percentile(latencies, 99) * 1000),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def bench_v6_main(texts):
+    """
+    Times sentimentAnalysisV6.main end to end (with whichever model it loads) on one source.
+    """
+    started = time.perf_counter()
+    import sentimentAnalysisV6
+    load_seconds = time.perf_counter() - started
+
+    df = pd.DataFrame({'source': 'benchmark', 'text': texts})
+    started = time.perf_counter()
+    sentimentAnalysisV6.main(df, 'text')
+    elapsed = time.perf_counter() - started
+    return {
+        "texts": len(texts),
+        "model_load_seconds": load_seconds,
+        "seconds": elapsed,
+        "texts_per_sec": len(texts) / elapsed if elapsed else None,
+        "fallback": sentimentAnalysisV6.sentiment_pipeline is simple_sentiment_classifier,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def bench_results_page(texts):
+    """
+    Times run_sentiment_analysis of the Results page end to end (with whichever
+    model the page loads) on one source. The page is imported outside Streamlit,
+    where its st calls do nothing.
+    """
+    started = time.perf_counter()
+    spec = importlib.util.spec_from_file_location("results_page", RESULTS_PAGE_PATH)
+    page = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(page)
+    load_seconds = time.perf_counter() - started
+
+    df = pd.DataFrame({'source': 'benchmark', 'text': texts})
+    started = time.perf_counter()
+    page.run_sentiment_analysis(df, 'text')
+    elapsed = time.perf_counter() - started
+    return {
+        "texts": len(texts),
+        "model_load_seconds": load_seconds,
+        "seconds": elapsed,
+        "texts_per_sec": len(texts) / elapsed if elapsed else None,
+        "fallback": page.sentiment_pipeline is simple_sentiment_classifier,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+# End-to-end entry points timed with --v6-main and --results-page
+ENTRY_POINTS = {
+    "sentimentAnalysisV6.main": bench_v6_main,
+    "results_page.run_sentiment_analysis": bench_results_page,
+}
+
+def run_config(config):
+    """
+    Runs one configuration in this process and returns its stats, or None if its backend cannot load.
+    """
+    texts = load_fixture(config["fixture"], config["scale"])
+    if config["backend"] in ENTRY_POINTS:
+        return ENTRY_POINTS[config["backend"]](texts)
+
+    loaded = load_backend(config["backend"], config["threads"])
+    if loaded is None:
+        return None
+    classify, count_tokens = loaded
+    return bench_backend(classify, count_tokens, texts, config["batch_size"])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment inference on the aggregated data.")
+    parser.add_argument("--backends", nargs="+", default=["keyword", "transformers"], choices=["keyword", "transformers"])
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32, 64])
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, os.cpu_count() or 1])
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10], help="Fixture size multipliers")
+    parser.add_argument("--fixture", default=FIXTURE_PATH, help="Feather file with a 'text' column")
+    parser.add_argument("--v6-main", action="store_true", help="Also time sentimentAnalysisV6.main end to end")
+    parser.add_argument("--results-page", action="store_true", help="Also time the Results page's run_sentiment_analysis end to end")
+    parser.add_argument("--output", help="Path of the JSON results (default: benchmarks/results/sentiment-<time>.json)")
+    parser.add_argument("--config", help=argparse.SUPPRESS)  # One configuration, run by run_isolated
+    args = parser.parse_args()
+
+    if args.config:
+        print(json.dumps(run_config(json.loads(args.config))))
+        return
+
+    report = new_report("sentiment", fixture=os.path.relpath(args.fixture, base_dir))
+
+    # Every configuration runs in its own process, so its peak RSS is not the
+    # running maximum of the ones before it
+    for backend in args.backends:
+        # The keyword fallback is single-threaded pure Python; thread counts only apply to torch
+        configs = [
+            {"backend": backend, "threads": threads, "scale": scale, "batch_size": batch_size}
+            for threads in (args.threads if backend == "transformers" else [1])
+            for scale in args.scales
+            for batch_size in args.batch_sizes
+        ]
+        for config in configs:
+            stats = run_isolated(__file__, dict(config, fixture=args.fixture))
+            if stats is None:
+                continue
+            stats.update(config)
+            report["results"].append(stats)
+            print(
+                f"{backend:<12} threads={config['threads']:<3} scale={config['scale']:<4} batch={config['batch_size']:<4} "
+                f"{stats['texts_per_sec']:>10.1f} texts/s  p50 {stats['batch_latency_p50_ms']:.2f} ms  "
+                f"p99 {stats['batch_latency_p99_ms']:.2f} ms  rss {stats['peak_rss_mb']:.0f} MB"
+            )
+
+    entry_points = [name for name, enabled in (
+        ("sentimentAnalysisV6.main", args.v6_main),
+        ("results_page.run_sentiment_analysis", args.results_page),
+    ) if enabled]
+    for name in entry_points:
+        scale = min(args.scales)
+        stats = run_isolated(__file__, {"backend": name, "scale": scale, "fixture": args.fixture})
+        if stats is not None:
+            stats.update({"backend": name, "scale": scale})
+            report["results"].append(stats)
+            print(f"{name}: {stats['texts_per_sec']:.1f} texts/s (model load {stats['model_load_seconds']:.1f} s)")
+
+    save_report(report, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+RESULTS_DIR = os.path.join(base_dir, 'benchmarks', 'results')
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of this process in MB. The peak covers the
+    whole process lifetime, so run each configuration with run_isolated to measure it alone.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_isolated(script, config):
+    """
+    Runs one benchmark configuration in a fresh interpreter, as
+    `python script --config <json>`, so its peak RSS is its own. The script prints
+    its result as JSON on the last line of its output. Returns the result, or None.
+    """
+    completed = subprocess.run(
+        [sys.executable, script, "--config", json.dumps(config)], capture_output=True, text=True
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        print(f"Configuration {config} failed:\n{completed.stderr.strip()}")
+        return None
+    # Anything printed before the result (e.g. a skipped backend) is passed on
+    for line in lines[:-1]:
+        print(line)
+    return json.loads(lines[-1])
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=base_dir, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+def new_report(benchmark, **fields):
+    """
+    Returns the header of a benchmark report: what ran, where and on which revision.
+    """
+    report = {
+        "benchmark": benchmark,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    report.update(fields)
+    report["results"] = []
+    return report
+
+def save_report(report, output=None):
+    """
+    Writes a report as JSON, by default to benchmarks/results/<benchmark>-<time>.json.
+    Returns the path written.
+    """
+    output = output or os.path.join(
+        RESULTS_DIR, f"{report['benchmark']}-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {output}")
+    return output
@@ -0,0 +1,125 @@
+import html
+import json
+import streamlit.components.v1 as components
+
+# Score bands of the interpretation and gauge, from the lowest score up
+SENTIMENT_BANDS = [
+    (-1.0, -0.5, "Very Negative", "red"),
+    (-0.5, -0.2, "Negative", "orange"),
+    (-0.2, 0.2, "Neutral", "gray"),
+    (0.2, 0.5, "Positive", "lightgreen"),
+    (0.5, 1.0, "Very Positive", "green"),
+]
+
+_TEMPLATE = """
+<div id="combined-score" style="font-family: sans-serif; color: #31333F;">
+  <div id="sliders"></div>
+  <div style="display: flex; gap: 24px; align-items: center; flex-wrap: wrap;">
+    <div style="flex: 2; min-width: 220px;">
+      <h4 style="margin: 8px 0;">Calculation</h4>
+      <ul id="components" style="margin: 0; padding-left: 20px;"></ul>
+      <p><b>Final Score: <span id="score"></span></b></p>
+      <p><b>Interpretation:</b> <span id="sentiment"></span></p>
+    </div>
+    <svg id="gauge" viewBox="0 0 220 130" style="flex: 3; max-width: 360px;"></svg>
+  </div>
+</div>
+<script>
+const DATA = __DATA__;
+const slidersEl = document.getElementById("sliders");
+const weights = {};
+
+// The score of every source and the SEC insider sentiment, with its slider
+const parts = DATA.sources.concat([{label: "SEC Insider", score: DATA.insider, weight: DATA.sec_weight}]);
+parts.forEach((part, i) => {
+  weights[i] = part.weight;
+  const row = document.createElement("label");
+  row.style = "display: flex; align-items: center; gap: 12px; margin: 4px 0;";
+  row.innerHTML = `<span style="width: 150px;">${part.label} Weight</span>
+    <input type="range" min="0" max="1" step="0.05" value="${part.weight}" style="flex: 1;">
+    <span style="width: 40px; text-align: right;">${part.weight.toFixed(2)}</span>`;
+  const input = row.querySelector("input");
+  const value = row.querySelector("span:last-child");
+  input.addEventListener("input", () => {
+    weights[i] = parseFloat(input.value);
+    value.textContent = weights[i].toFixed(2);
+    render();
+  });
+  slidersEl.appendChild(row);
+});
+
+function band(score) {
+  return DATA.bands.find(b => score <= b[1]) || DATA.bands[DATA.bands.length - 1];
+}
+
+function point(score, radius) {
+  // Map -1..1 onto the half circle from left to right
+  const angle = Math.PI * (1 - (score + 1) / 2);
+  return [110 + radius * Math.cos(angle), 115 - radius * Math.sin(angle)];
+}
+
+function arc(from, to, color) {
+  const [x1, y1] = point(from, 90);
+  const [x2, y2] = point(to, 90);
+  return `<path d="M ${x1} ${y1} A 90 90 0 0 1 ${x2} ${y2}" stroke="${color}" stroke-width="22" fill="none"/>`;
+}
+
+function render() {
+  // The weights are normalized by their total, sources without results included
+  // (they score 0 but keep their weight). The default weights sum to 1, so the
+  // score then equals sentiment_stats.weighted_average
+  let score = 0;
+  let total = 0;
+  const items = parts.map((part, i) => {
+    score += part.score * weights[i];
+    total += weights[i];
+    const note = part.missing ? " (no results)" : "";
+    return `<li>${part.label}: ${part.score.toFixed(2)} × ${weights[i].toFixed(2)}${note}</li>`;
+  });
+  score = total > 0 ? Math.max(-1, Math.min(1, score / total)) : 0;
+  const [, , label, color] = band(score);
+
+  document.getElementById("components").innerHTML = items.join("");
+  document.getElementById("score").textContent = score.toFixed(2);
+  document.getElementById("sentiment").textContent = label;
+
+  const [nx, ny] = point(score, 80);
+  document.getElementById("gauge").innerHTML =
+    DATA.bands.map(b => arc(b[0], b[1], b[3])).join("") +
+    `<line x1="110" y1="115" x2="${nx}" y2="${ny}" stroke="black" stroke-width="4"/>` +
+    `<circle cx="110" cy="115" r="6" fill="black"/>` +
+    `<text x="110" y="105" text-anchor="middle" font-size="18" fill="${color}" font-weight="bold">${score.toFixed(2)}</text>`;
+}
+
+render();
+</script>
+"""
+
+def combined_score(source_scores, insider_sentiment, weights, sec_weight, height=None):
+    """
+    Renders the weighted combination of per-source average scores and the SEC
+    insider sentiment, with a slider per weight. The stats are sent to the
+    browser once; moving a slider recomputes the score and gauge client-side
+    without rerunning the Streamlit script. The weights are normalized by their
+    total; with the default weights, which sum to 1, the score equals
+    sentiment_stats.weighted_average, so it matches the stored history.
+    """
+    sources = [
+        {
+            "label": html.escape(source),
+            "score": float(source_scores.get(source, 0)),
+            "weight": float(weight),
+            "missing": source not in source_scores,
+        }
+        for source, weight in weights.items()
+    ]
+    data = {
+        "sources": sources,
+        "insider": float(insider_sentiment),
+        "sec_weight": float(sec_weight),
+        "bands": SENTIMENT_BANDS,
+    }
+    # Escape '</' so a source name can never close the script tag
+    payload = json.dumps(data).replace("</", "<\\/")
+    height = height or 260 + 34 * (len(sources) + 1)
+    components.html(_TEMPLATE.replace("__DATA__", payload), height=height)
@@ -0,0 +1,20 @@
+import os
+import streamlit as st
+from profiling import PROFILE_RUNS, profile_run
+
+def profiled_page(name, main):
+    """
+    Runs a page's main() under the profiler while the sidebar toggle is ticked
+    (on by default with PROFILE_RUNS) and offers the report for download.
+    """
+    enabled = st.sidebar.checkbox(
+        "Profile this run", value=PROFILE_RUNS,
+        help="Saves a cProfile profile and the top memory allocations of every run of this page while on.",
+    )
+    with profile_run(name, enabled=enabled) as profile:
+        main()
+
+    if profile:
+        st.sidebar.caption(f"Profile saved to {profile['dir']}")
+        with open(os.path.join(profile['dir'], "report.txt"), encoding="utf-8") as file:
+            st.sidebar.download_button("Download profile report", file.read(), file_name=f"{name}-profile.txt")
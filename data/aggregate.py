@@ -1,48 +1,173 @@
 import os
+import sys
+import threading
 import pandas as pd
+import pyarrow as pa
 
-def aggregate_csv_data(root_dir, output_file):
-    # List to store each CSV file's data
-    data_frames = []
-    
-    # Walk through all subdirectories in the root directory
+# Add the repository root to the system path so the script also runs standalone
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data.dedup import dedupe_texts
+from tracing import span
+
+# Columns of the long-format table shared by the aggregation and sentiment stages:
+# one row per unique text, tagged with the source it came from
+AGGREGATED_COLUMNS = ['source', 'text']
+
+# The aggregated file is Arrow IPC (Feather v2), so readers get UTF-8 text and
+# column types back without sniffing the encoding. 'count' is the number of
+# duplicate texts a row stands for; the rest is the record metadata, null for CSV sources.
+AGGREGATED_SCHEMA = pa.schema(
+    [(column, pa.string()) for column in AGGREGATED_COLUMNS]
+    + [
+        ('count', pa.int64()),
+        ('query', pa.string()),
+        ('id', pa.string()),
+        ('published_at', pa.timestamp('us', tz='UTC')),
+        ('channel', pa.string()),
+    ]
+)
+
+def to_long_format(df, source):
+    """
+    Converts one source's CSV (text in the first column, metadata in the rest)
+    to long format: a 'source' column, a 'text' column and the metadata columns.
+    """
+    text_column = df.columns[0]
+    long_df = df.rename(columns={text_column: 'text'})
+    long_df.insert(0, 'source', source)
+    long_df = long_df.dropna(subset=['text'])
+    long_df['text'] = long_df['text'].astype(str)
+    return long_df
+
+def records_to_long_format(records, source):
+    """
+    Converts the records a connector yields to long format. The 'source' and
+    'text' columns come first, and the other record fields follow as metadata.
+    """
+    df = pd.DataFrame.from_records(list(records))
+    if df.empty:
+        return pd.DataFrame(columns=AGGREGATED_COLUMNS)
+
+    df['source'] = source
+    metadata_columns = [column for column in df.columns if column not in AGGREGATED_COLUMNS]
+    long_df = df.reindex(columns=AGGREGATED_COLUMNS + metadata_columns)
+    long_df = long_df.dropna(subset=['text'])
+    long_df['text'] = long_df['text'].astype(str)
+    return long_df
+
+def to_aggregated_table(df):
+    """
+    Converts a long-format DataFrame to an Arrow table with the aggregated schema.
+    """
+    frame = df.reindex(columns=AGGREGATED_SCHEMA.names)
+    frame['count'] = frame['count'].fillna(1).astype('int64')
+    frame['published_at'] = pd.to_datetime(frame['published_at'], utc=True, format='ISO8601', errors='coerce')
+    return pa.Table.from_pandas(frame, schema=AGGREGATED_SCHEMA, preserve_index=False)
+
+def iter_connector_sources(query, connectors, n=None):
+    """
+    Yields (source, DataFrame) pairs in long format by calling each connector in-process.
+    connectors maps source names to fetch(query, n) functions; n=None uses each connector's default.
+    Duplicate texts are collapsed into one row with a 'count' before they reach the sentiment model.
+    A source that returns nothing (e.g. an exhausted quota) is yielded as an empty DataFrame.
+    """
+    for source, fetch in connectors.items():
+        with span("search.fetch", source=source, query=query) as s:
+            records = fetch(query) if n is None else fetch(query, n)
+            df = records_to_long_format(records, source)
+            s.count("records", len(df))
+        with span("aggregate.dedupe", source=source) as s:
+            df = dedupe_texts(df)
+            s.count("texts", len(df))
+        yield source, df
+
+def iter_csv_sources(root_dir):
+    """
+    Yields (source, DataFrame) pairs in long format, reading one CSV under root_dir at a time.
+    The source is named after the CSV's first column header (e.g. 'YouTubeSearch').
+    Duplicate texts are collapsed into one row with a 'count' before they reach the sentiment model.
+    """
     for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
+        for filename in sorted(filenames):
             if filename.endswith(".csv"):
                 file_path = os.path.join(dirpath, filename)
-                
+
                 # Read the CSV file
                 try:
                     df = pd.read_csv(file_path)
-                    data_frames.append(df)  # Append the DataFrame
                 except Exception as e:
                     print(f"Could not read {file_path}: {e}")
+                    continue
 
-    # Check if we have any data to aggregate
-    if not data_frames:
-        print("No CSV files found to aggregate.")
-        return
-    
-    # Concatenate all DataFrames side by side
-    try:
-        aggregate_df = pd.concat(data_frames, axis=1)
-    except Exception as e:
-        print(f"Error during concatenation: {e}")
-        return
+                if len(df.columns) == 0:
+                    continue
+
+                source = df.columns[0]
+                yield source, dedupe_texts(to_long_format(df, source))
+
+def stream_sources(sources, output_file=None):
+    """
+    Passes (source, DataFrame) pairs through unchanged, writing each one to the
+    Feather file output_file as a record batch so the sentiment stage never waits on a re-read.
+    The file is written to a temporary path and only replaces output_file once every
+    source has been written, so readers never see a partial file.
+    """
+    writer = None
+    if output_file:
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        # Opening the writer up front replaces stale data even when there are no sources
+        temp_path = f"{output_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        writer = pa.ipc.new_file(temp_path, AGGREGATED_SCHEMA)
 
-    # Save the aggregated DataFrame to the output file
+    completed = False
     try:
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        aggregate_df.to_csv(output_file, index=False)
+        for source, df in sources:
+            if writer is not None:
+                writer.write_table(to_aggregated_table(df))
+            yield source, df
+        completed = True
+    finally:
+        if writer is not None:
+            writer.close()
+            if completed:
+                os.replace(temp_path, output_file)
+            else:
+                os.remove(temp_path)
+
+def aggregate_csv_data(root_dir, output_file):
+    """
+    Aggregates every CSV under root_dir into one long-format Feather file at output_file.
+    Returns the number of aggregated rows.
+    """
+    total_rows = 0
+    for source, df in stream_sources(iter_csv_sources(root_dir), output_file):
+        total_rows += len(df)
+
+    if total_rows:
         print(f"Aggregated data saved to {output_file}")
-    except Exception as e:
-        print(f"Could not save aggregated data: {e}")
+    else:
+        print("No CSV files found to aggregate.")
+    return total_rows
+
+def aggregate_connector_data(query, connectors, output_file, n=None):
+    """
+    Fetches query from every connector and aggregates the results into one
+    long-format Feather file at output_file. Returns the number of aggregated rows.
+    """
+    total_rows = 0
+    for source, df in stream_sources(iter_connector_sources(query, connectors, n), output_file):
+        print(f"{source}: {len(df)} results")
+        total_rows += len(df)
+
+    print(f"Aggregated data saved to {output_file}")
+    return total_rows
 
 if __name__ == "__main__":
     # Root directory where the data subdirectories are stored
-    root_dir = "C:/Users/sebas/Desktop/ie_dev/IE_Year_3/EDEN/sentimentalWarhammer/data"  # Adjust this to the path of your "data" directory
-    
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+
     # Output file for the aggregated data
-    output_file = "C:/Users/sebas/Desktop/ie_dev/IE_Year_3/EDEN/sentimentalWarhammer/aggregated_data.csv"
-    
+    output_file = os.path.join(root_dir, '..', 'aggregated_data.feather')
+
     aggregate_csv_data(root_dir, output_file)
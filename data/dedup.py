@@ -0,0 +1,121 @@
+import hashlib
+import html
+import re
+import unicodedata
+import numpy as np
+
+# MinHash signature length, split into LSH bands of ROWS_PER_BAND rows. With 8 bands
+# of 8 rows, pairs above roughly 0.77 Jaccard similarity land in a shared bucket.
+NUM_PERM = 64
+ROWS_PER_BAND = 8
+
+# Estimated Jaccard similarity of character shingles above which two texts are one text
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# Length of the character shingles compared between texts
+SHINGLE_SIZE = 4
+
+# Parameters of the (a * h + b) mod p permutations. p is the largest 32-bit prime and
+# the shingle hashes are reduced below it, so a * h + b always fits in 64 bits.
+_PRIME = np.uint64(4294967291)
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 4294967291, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, 4294967291, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+def clean_text(text):
+    """
+    Decodes HTML entities (e.g. '&#39;' and '&amp;') left in API titles.
+    """
+    return html.unescape(str(text)).strip()
+
+def normalize_text(text):
+    """
+    Returns the form two texts are compared in: entities decoded, Unicode folded,
+    lowercase, punctuation dropped and whitespace collapsed.
+    """
+    text = unicodedata.normalize("NFKC", clean_text(text)).casefold()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+def text_hash(normalized):
+    """
+    Returns the exact-duplicate key of a normalized text.
+    """
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+def minhash_signature(normalized):
+    """
+    Returns the MinHash signature (NUM_PERM uint64 values) of a normalized text's character shingles.
+    """
+    if len(normalized) <= SHINGLE_SIZE:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles],
+        dtype=np.uint64
+    ) % _PRIME
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _PRIME
+    return permuted.min(axis=0)
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def near_duplicate_groups(normalized_texts):
+    """
+    Groups near-duplicate texts with MinHash LSH. Returns, for each text, the
+    position of the first text in its group.
+    """
+    signatures = [minhash_signature(text) for text in normalized_texts]
+    parent = list(range(len(signatures)))
+
+    for start in range(0, NUM_PERM, ROWS_PER_BAND):
+        buckets = {}
+        for i, signature in enumerate(signatures):
+            buckets.setdefault(signature[start:start + ROWS_PER_BAND].tobytes(), []).append(i)
+
+        for candidates in buckets.values():
+            first = candidates[0]
+            for i in candidates[1:]:
+                root_first, root_i = _find(parent, first), _find(parent, i)
+                if root_first == root_i:
+                    continue
+                # Confirm the candidate pair on the full signature before merging
+                if np.mean(signatures[first] == signatures[i]) >= NEAR_DUPLICATE_THRESHOLD:
+                    parent[max(root_first, root_i)] = min(root_first, root_i)
+
+    return [_find(parent, i) for i in range(len(parent))]
+
+def dedupe_texts(df, text_column='text'):
+    """
+    Collapses exact and near-duplicate texts into the first occurrence of each.
+    The kept rows carry a 'count' column with the number of rows they stand for
+    (existing counts are summed), so statistics can still be weighted by it.
+    """
+    df = df.reset_index(drop=True)
+    if 'count' not in df.columns:
+        df['count'] = 1
+    if df.empty:
+        return df
+
+    df[text_column] = df[text_column].map(clean_text)
+    normalized = df[text_column].map(normalize_text)
+
+    # Exact duplicates share a normalized hash; only one of each is MinHashed
+    exact_keys = normalized.map(text_hash)
+    unique_positions = ~exact_keys.duplicated()
+    unique_texts = normalized[unique_positions].tolist()
+    unique_keys = exact_keys[unique_positions].tolist()
+
+    groups = near_duplicate_groups(unique_texts)
+    group_of_key = {key: unique_keys[group] for key, group in zip(unique_keys, groups)}
+    group_keys = exact_keys.map(group_of_key)
+
+    counts = df['count'].groupby(group_keys).sum()
+    deduped = df[~group_keys.duplicated()].copy()
+    deduped['count'] = group_keys[deduped.index].map(counts).astype('int64')
+    return deduped
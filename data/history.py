@@ -0,0 +1,170 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+import pandas as pd
+
+# 🔹 Define the store location (the repo is read-only on Streamlit Cloud)
+if "STREAMLIT_SERVER" in os.environ:
+    HISTORY_PATH = os.path.join("/tmp", "sentiment_history.sqlite")
+else:
+    HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history", "sentiment_history.sqlite")
+
+# Whether this process has created the history tables yet
+_initialized = False
+_init_lock = threading.Lock()
+
+def _connect():
+    global _initialized
+    with _init_lock:
+        if not _initialized:
+            os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+            with closing(sqlite3.connect(HISTORY_PATH, timeout=30)) as conn, conn:
+                # WAL lets the pages chart history while a run is being appended
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS runs ("
+                    "run_id INTEGER PRIMARY KEY AUTOINCREMENT, subject TEXT, kind TEXT, run_at REAL, "
+                    "weighted_score REAL, insider_sentiment REAL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS source_stats ("
+                    "run_id INTEGER, subject TEXT, run_at REAL, source TEXT, total_count INTEGER, "
+                    "positive_percentage REAL, negative_percentage REAL, average_score REAL, "
+                    "PRIMARY KEY (run_id, source))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS items ("
+                    "run_id INTEGER, subject TEXT, run_at REAL, source TEXT, text TEXT, count INTEGER, "
+                    "sentiment TEXT, score REAL, adjusted_score REAL, item_id TEXT, published_at TEXT)"
+                )
+                # Every read is a range query on one subject's runs
+                conn.execute("CREATE INDEX IF NOT EXISTS runs_subject_time ON runs (subject, run_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS source_stats_subject_time ON source_stats (subject, run_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS items_subject_time ON items (subject, run_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS items_run ON items (run_id)")
+            _initialized = True
+
+    conn = sqlite3.connect(HISTORY_PATH, timeout=30)
+    # A lost history write costs at most one run, so skip the fsync on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _optional(value):
+    return None if pd.isna(value) else str(value)
+
+def record_run(subject, kind, results, weighted_score, insider_sentiment, scored=None, run_at=None):
+    """
+    Appends one pipeline run to the store and returns its run_id.
+    results holds the (source, total_count, positive%, negative%, averageScore) tuples the
+    pages display; scored optionally maps each source to its scored DataFrame.
+    """
+    run_at = run_at or time.time()
+
+    with closing(_connect()) as conn, conn:
+        run_id = conn.execute(
+            "INSERT INTO runs (subject, kind, run_at, weighted_score, insider_sentiment) VALUES (?, ?, ?, ?, ?)",
+            (subject, kind, run_at, float(weighted_score), float(insider_sentiment)),
+        ).lastrowid
+
+        conn.executemany(
+            "INSERT INTO source_stats (run_id, subject, run_at, source, total_count, "
+            "positive_percentage, negative_percentage, average_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, subject, run_at, source, int(total_count), float(positive), float(negative), float(average))
+                for source, total_count, positive, negative, average in results
+            ],
+        )
+
+        for source, df in (scored or {}).items():
+            if df is None or df.empty:
+                continue
+            counts = df['count'] if 'count' in df.columns else pd.Series(1, index=df.index)
+            conn.executemany(
+                "INSERT INTO items (run_id, subject, run_at, source, text, count, sentiment, score, "
+                "adjusted_score, item_id, published_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id, subject, run_at, source, row.text, int(count), row.sentiment,
+                        float(row.score), float(row.adjustedScore),
+                        _optional(getattr(row, 'id', None)), _optional(getattr(row, 'published_at', None)),
+                    )
+                    for row, count in zip(df.itertuples(index=False), counts)
+                ],
+            )
+    return run_id
+
+def _range_query(table, columns, subject, start=None, end=None):
+    query = f"SELECT {columns} FROM {table} WHERE subject = ?"
+    params = [subject]
+    if start is not None:
+        query += " AND run_at >= ?"
+        params.append(start)
+    if end is not None:
+        query += " AND run_at <= ?"
+        params.append(end)
+    query += " ORDER BY run_at"
+
+    with closing(_connect()) as conn:
+        df = pd.read_sql_query(query, conn, params=params)
+    df['run_at'] = pd.to_datetime(df['run_at'], unit='s', utc=True)
+    return df
+
+def get_runs(subject, start=None, end=None):
+    """
+    Returns the runs of a subject (ticker or search query) between two Unix times, oldest first.
+    """
+    return _range_query(
+        "runs", "run_id, subject, kind, run_at, weighted_score, insider_sentiment", subject, start, end
+    )
+
+def get_source_stats(subject, start=None, end=None):
+    """
+    Returns the per-source statistics of a subject's runs between two Unix times, oldest first.
+    """
+    return _range_query(
+        "source_stats",
+        "run_id, run_at, source, total_count, positive_percentage, negative_percentage, average_score",
+        subject, start, end,
+    )
+
+def get_items(subject, start=None, end=None):
+    """
+    Returns the individual scored items of a subject's runs between two Unix times, oldest first.
+    """
+    return _range_query(
+        "items",
+        "run_id, run_at, source, text, count, sentiment, score, adjusted_score, item_id, published_at",
+        subject, start, end,
+    )
+
+def score_history(subject, start=None, end=None):
+    """
+    Returns one row per run indexed by run time: the weighted score, the SEC
+    insider sentiment and the average score of each source. Ready to chart.
+    """
+    runs = get_runs(subject, start, end)
+    if runs.empty:
+        return pd.DataFrame()
+
+    history = runs.set_index('run_id')[['run_at', 'weighted_score', 'insider_sentiment']]
+    stats = get_source_stats(subject, start, end)
+    if not stats.empty:
+        averages = stats.pivot_table(index='run_id', columns='source', values='average_score')
+        history = history.join(averages)
+    return history.set_index('run_at')
+
+def list_subjects(kind=None):
+    """
+    Returns the subjects with stored runs, most recently run first.
+    """
+    query = "SELECT subject FROM runs"
+    params = []
+    if kind:
+        query += " WHERE kind = ?"
+        params.append(kind)
+    query += " GROUP BY subject ORDER BY MAX(run_at) DESC"
+
+    with closing(_connect()) as conn:
+        return [row[0] for row in conn.execute(query, params)]
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+import pandas as pd
+
+# 🔹 Define the store location (the repo is read-only on Streamlit Cloud)
+if "STREAMLIT_SERVER" in os.environ:
+    PERF_PATH = os.path.join("/tmp", "perf_stats.sqlite")
+else:
+    PERF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history", "perf_stats.sqlite")
+
+# Whether this process has created the performance tables yet
+_initialized = False
+_init_lock = threading.Lock()
+
+def _connect():
+    global _initialized
+    with _init_lock:
+        if not _initialized:
+            os.makedirs(os.path.dirname(PERF_PATH), exist_ok=True)
+            with closing(sqlite3.connect(PERF_PATH, timeout=30)) as conn, conn:
+                # WAL lets the dashboard read while a run is being rolled up
+                conn.execute("PRAGMA journal_mode=WAL")
+                # One row per day, subject and stage, so reads stay small however many runs there were.
+                # runs counts the runs with the stage and calls its spans; max_seconds is the slowest run.
+                # depth is how far below the run's root span the stage sits (1 for its direct
+                # children), or NULL for spans of worker threads and subprocesses
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS stage_daily ("
+                    "day TEXT, subject TEXT, stage TEXT, runs INTEGER DEFAULT 0, calls INTEGER DEFAULT 0, "
+                    "seconds REAL DEFAULT 0, max_seconds REAL DEFAULT 0, items INTEGER DEFAULT 0, "
+                    "bytes INTEGER DEFAULT 0, depth INTEGER, PRIMARY KEY (day, subject, stage))"
+                )
+            _initialized = True
+
+    conn = sqlite3.connect(PERF_PATH, timeout=30)
+    # A lost rollup costs at most one run's timings, so skip the fsync on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def span_depths(spans):
+    """
+    Returns the depth of each span below the root span of its run, by span_id:
+    0 for the root, 1 for its direct children and so on. Spans not nested in the
+    root (the top spans of worker threads and subprocesses) are left out.
+    """
+    by_id = {record["span_id"]: record for record in spans}
+    depths = {}
+
+    def depth(record):
+        span_id = record["span_id"]
+        if span_id not in depths:
+            if span_id == record.get("run_id"):
+                depths[span_id] = 0
+            else:
+                parent = by_id.get(record["parent_id"])
+                parent_depth = depth(parent) if parent else None
+                depths[span_id] = None if parent_depth is None else parent_depth + 1
+        return depths[span_id]
+
+    for record in spans:
+        depth(record)
+    return {span_id: d for span_id, d in depths.items() if d is not None}
+
+def summarize_spans(spans):
+    """
+    Sums the spans of one run by name: calls, seconds, items processed and bytes
+    transferred, and the least depth below the run's root at which the name ran.
+    """
+    depths = span_depths(spans)
+    stages = {}
+    for record in spans:
+        stage = stages.setdefault(record["name"], {"calls": 0, "seconds": 0.0, "items": 0, "bytes": 0, "depth": None})
+        stage["calls"] += 1
+        stage["seconds"] += record["duration_s"]
+        for counter, n in record["counts"].items():
+            stage["bytes" if counter == "bytes" else "items"] += n
+        depth = depths.get(record["span_id"])
+        if depth is not None and (stage["depth"] is None or depth < stage["depth"]):
+            stage["depth"] = depth
+    return stages
+
+def record_stage_timings(subject, spans, run_at=None):
+    """
+    Adds the spans of one traced run to the daily aggregates of its subject.
+    """
+    day = datetime.fromtimestamp(run_at or time.time()).date().isoformat()
+    stages = summarize_spans(spans)
+
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT INTO stage_daily (day, subject, stage, runs, calls, seconds, max_seconds, items, bytes, depth) "
+            "VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (day, subject, stage) DO UPDATE SET runs = runs + 1, calls = calls + excluded.calls, "
+            "seconds = seconds + excluded.seconds, max_seconds = MAX(max_seconds, excluded.max_seconds), "
+            "items = items + excluded.items, bytes = bytes + excluded.bytes, "
+            "depth = COALESCE(MIN(depth, excluded.depth), depth, excluded.depth)",
+            [
+                (day, subject, stage, s["calls"], s["seconds"], s["seconds"], s["items"], s["bytes"], s["depth"])
+                for stage, s in stages.items()
+            ],
+        )
+
+def get_stage_daily(days=30):
+    """
+    Returns the daily stage aggregates of the last days, oldest first, with the
+    average seconds per run added.
+    """
+    since = (datetime.now().date() - timedelta(days=days)).isoformat()
+    with closing(_connect()) as conn:
+        df = pd.read_sql_query(
+            "SELECT day, subject, stage, runs, calls, seconds, max_seconds, items, bytes, depth "
+            "FROM stage_daily WHERE day >= ? ORDER BY day",
+            conn, params=(since,),
+        )
+    df['day'] = pd.to_datetime(df['day'])
+    df['seconds_per_run'] = df['seconds'] / df['runs']
+    return df
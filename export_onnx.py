@@ -0,0 +1,70 @@
+import argparse
+import os
+import zlib
+
+import torch
+from onnxruntime.quantization import QuantType, quantize_dynamic
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+# 🔹 Default model: a 4-layer TinyBERT distilled from BERT on SST-2, whose int8
+# export is a few MB and fits the 50mb maxLambdaSize of vercel.json together with
+# onnxruntime, tokenizers and numpy. The pipeline's DistilBERT
+# (distilbert-base-uncased-finetuned-sst-2-english) exports to about 65 MB and does not.
+MODEL_NAME = "philschmid/tiny-bert-sst2-distilled"
+
+# Where api/score.py looks for the model by default
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "api", "model")
+
+# 🔹 Compressed size the model may take up in the function bundle
+MODEL_BUDGET_MB = 20
+
+def export(output_dir, model_name=MODEL_NAME):
+    """
+    Exports a sentiment model to ONNX, quantizes its weights to int8 and saves
+    it with its tokenizer.json and config.json for api/score.py.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+    tokenizer.save_pretrained(output_dir)
+    model.config.save_pretrained(output_dir)
+
+    # BERT models also take token_type_ids, DistilBERT models do not
+    sample = tokenizer(["The market reacted well to the earnings report."], return_tensors="pt")
+    input_names = list(sample.keys())
+    fp32_path = os.path.join(output_dir, "model-fp32.onnx")
+    torch.onnx.export(
+        model, (dict(sample),), fp32_path,
+        input_names=input_names, output_names=["logits"],
+        dynamic_axes={
+            **{name: {0: "batch", 1: "sequence"} for name in input_names},
+            "logits": {0: "batch"},
+        },
+        opset_version=14,
+    )
+
+    model_path = os.path.join(output_dir, "model.onnx")
+    quantize_dynamic(fp32_path, model_path, weight_type=QuantType.QInt8)
+    os.remove(fp32_path)
+
+    # The fast tokenizer is all api/score.py needs; drop the slow tokenizer files
+    for name in ("vocab.txt", "tokenizer_config.json", "special_tokens_map.json"):
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    # The bundle limit applies to the compressed function, so estimate the model's share of it
+    size_mb = os.path.getsize(model_path) / (1024 * 1024)
+    with open(model_path, "rb") as file:
+        compressed_mb = len(zlib.compress(file.read(), 6)) / (1024 * 1024)
+    print(f"Saved the quantized model to {model_path} ({size_mb:.1f} MB, about {compressed_mb:.1f} MB compressed)")
+    if compressed_mb > MODEL_BUDGET_MB:
+        print(f"Warning: {model_name} is over the {MODEL_BUDGET_MB} MB model budget and will not fit "
+              "the maxLambdaSize of vercel.json.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a sentiment model as an int8 ONNX model for api/score.py.")
+    parser.add_argument("--model", default=MODEL_NAME, help="Hugging Face sequence classification model to export")
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    args = parser.parse_args()
+    export(args.output, args.model)
@@ -1,123 +1,92 @@
+import argparse
 import sys
 import os
 import subprocess
-import pandas as pd
+from contextlib import nullcontext
 
 # Add the data_processing directory to the system path
 data_processing_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'SEC', 'scripts', 'data_processing'))
 sys.path.append(data_processing_path)
 
-from tickers_ciks import tickers_ciks
-from csv_extractor import fetch_edgar_data, save_filings_to_csv
-
-def aggregate_csv_data(root_dir, output_file):
-    # List to store each CSV file's data
-    data_frames = []
-    
-    # Walk through all subdirectories in the root directory
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if filename.endswith(".csv"):
-                file_path = os.path.join(dirpath, filename)
-                
-                # Read the CSV file
-                try:
-                    df = pd.read_csv(file_path)
-                    data_frames.append(df)  # Append the DataFrame
-                except Exception as e:
-                    print(f"Could not read {file_path}: {e}")
-
-    # Check if we have any data to aggregate
-    if not data_frames:
-        print("No CSV files found to aggregate.")
-        return
-    
-    # Concatenate all DataFrames side by side
-    try:
-        aggregate_df = pd.concat(data_frames, axis=1)
-    except Exception as e:
-        print(f"Error during concatenation: {e}")
-        return
-
-    # Save the aggregated DataFrame to the output file
-    try:
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        aggregate_df.to_csv(output_file, index=False)
-        print(f"Aggregated data saved to {output_file}")
-    except Exception as e:
-        print(f"Could not save aggregated data: {e}")
-
-def main():
-    # Get the stock symbol and query from the user
-    stock_symbol = input("Enter the stock symbol: ")
-    query = input("Enter the search query: ")
+# Add the APIs directory to the system path for the search connectors
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'APIs'))
 
+from ticker_lookup import get_cik
+from csv_extractor import fetch_edgar_data, save_filings_to_csv
+from connectors import CONNECTORS
+from data.aggregate import aggregate_connector_data
+from tracing import span, subprocess_env, trace_run
+from profiling import profile_run, python_command
+
+def run(stock_symbol, query, stage=nullcontext):
+    """
+    Runs the full flow for a stock symbol: SEC filings and Form 4 processing,
+    then the aggregated search results for query. Each step runs inside
+    stage(<step name>), so callers such as benchmarks/bench_pipeline.py can time it.
+    """
     # Get the CIK for the given stock symbol
-    cik = tickers_ciks.get(stock_symbol.upper())
+    with stage("ticker_lookup"):
+        cik = get_cik(stock_symbol)
     if not cik:
-        print(f"Stock symbol {stock_symbol} not found in tickers_ciks.")
+        print(f"Stock symbol {stock_symbol} not found in the SEC ticker lookup.")
         return
 
     # Fetch the EDGAR data for the given CIK
-    form_4_df = fetch_edgar_data(cik)
+    with stage("edgar_fetch"):
+        form_4_df = fetch_edgar_data(cik)
 
-    if not form_4_df.empty:
-        # Save the DataFrame to a CSV file named after the stock symbol
-        save_filings_to_csv(stock_symbol, form_4_df)
-    else:
-        print(f"No filings found for {stock_symbol}")
+        if not form_4_df.empty:
+            # Save the DataFrame to a CSV file named after the stock symbol
+            save_filings_to_csv(stock_symbol, form_4_df)
+        else:
+            print(f"No filings found for {stock_symbol}")
 
     # Call read_csv.py to process the saved CSV files
-    read_csv_script = os.path.join(data_processing_path, 'read_csv.py')
-    python_interpreter = sys.executable  # Get the path to the current Python interpreter
-    subprocess.run([python_interpreter, read_csv_script, stock_symbol])
+    with stage("read_csv"):
+        read_csv_script = os.path.join(data_processing_path, 'read_csv.py')
+        subprocess.run(python_command(read_csv_script, stock_symbol), env=subprocess_env())
 
     # Call xml_extractor.py to download and save XML files
-    xml_extractor_script = os.path.join(data_processing_path, 'xml_extractor.py')
-    subprocess.run([python_interpreter, xml_extractor_script])
+    with stage("xml_extractor"):
+        xml_extractor_script = os.path.join(data_processing_path, 'xml_extractor.py')
+        subprocess.run(python_command(xml_extractor_script), env=subprocess_env())
 
     # Call read_xml.py to process the downloaded XML files
-    read_xml_script = os.path.join(data_processing_path, 'read_xml.py')
-    subprocess.run([python_interpreter, read_xml_script, stock_symbol])
+    with stage("read_xml"):
+        read_xml_script = os.path.join(data_processing_path, 'read_xml.py')
+        subprocess.run(python_command(read_xml_script, stock_symbol), env=subprocess_env())
 
     # Call Summarize.py to generate the summary CSV
-    summarize_script = os.path.join(data_processing_path, 'Summarize.py')
-    subprocess.run([python_interpreter, summarize_script, stock_symbol])
+    with stage("summarize"):
+        summarize_script = os.path.join(data_processing_path, 'Summarize.py')
+        subprocess.run(python_command(summarize_script, stock_symbol), env=subprocess_env())
 
     # Additional functionality from input.py
-    # Define paths to the YouTube script
+    # Fetch YouTube titles in-process through the search connector
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    youtube_script = os.path.join(base_dir, "APIs", "youtube_api", "youtubeAPI.py")
-
-    # Check if the YouTube script exists
-    if not os.path.exists(youtube_script):
-        print(f"Error: {youtube_script} not found.")
-        return
+    connectors = {"YouTubeSearch": CONNECTORS["YouTubeSearch"]}
 
-    # Run the YouTube script
-    youtube_process = subprocess.Popen(
-        [python_interpreter, youtube_script, query],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-
-    # Wait for the YouTube script to complete
-    youtube_stdout, youtube_stderr = youtube_process.communicate()
-
-    # Print the output from the YouTube script
-    print("\n--- YouTube API Output ---")
-    print(youtube_stdout.decode())
-    if youtube_stderr:
-        print("\nErrors:")
-        print(youtube_stderr.decode())
-
-    # Aggregate CSV files
-    print("\nAggregating CSV files...")
-    root_dir = os.path.join(base_dir, "data")  # Directory containing CSV files
-    output_file = os.path.join(base_dir, "aggregated_data.csv")  # Output file path
-    aggregate_csv_data(root_dir, output_file)
+    # Aggregate the search results
+    print("\nAggregating search results...")
+    output_file = os.path.join(base_dir, "aggregated_data.feather")  # Output file path
+    with stage("aggregate"):
+        aggregate_connector_data(query, connectors, output_file)
 
     #### HERE WILL BE THE CODE TO RUN THE SENTIMENT ANALYSIS AND SEC MODEL ####
 
+def main():
+    parser = argparse.ArgumentParser(description="Run the SEC and search pipeline for one stock.")
+    parser.add_argument("--profile", action="store_true", help="Save a cProfile profile and allocation report of the run")
+    args = parser.parse_args()
+
+    # Get the stock symbol and query from the user
+    stock_symbol = input("Enter the stock symbol: ")
+    query = input("Enter the search query: ")
+
+    # With TRACE_DIR set, every step is recorded as a span of the run
+    subject = stock_symbol.strip().upper()
+    with trace_run("full", subject=subject), profile_run(f"full-{subject}", enabled=args.profile or None):
+        run(stock_symbol, query, stage=lambda name: span(f"full.{name}"))
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,29 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# Texts per request; the service accepts up to 1024
+CHUNK_SIZE = 256
+REQUEST_TIMEOUT = 120
+
+def remote_pipeline(url, chunk_size=CHUNK_SIZE):
+    """
+    Returns a classifier that scores texts through the inference service at url
+    (see inference_server.py). Like the sentiment-analysis pipeline, it takes a
+    text or a list of them and returns one {"label": ..., "score": ...} dict per text.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    endpoint = f"{url.rstrip('/')}/v1/score"
+
+    def classify(texts):
+        if not isinstance(texts, list):
+            texts = [texts]
+        results = []
+        for i in range(0, len(texts), chunk_size):
+            response = session.post(endpoint, json={"texts": texts[i:i + chunk_size]}, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            results.extend(response.json()["results"])
+        return results
+
+    return classify
@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tracing import span
+
+# 🔹 Batching limits: a batch is scored once it holds MAX_BATCH texts or the
+# oldest request in it has waited MAX_WAIT_MS
+MAX_BATCH = int(os.environ.get("INFERENCE_MAX_BATCH", 64))
+MAX_WAIT_MS = float(os.environ.get("INFERENCE_MAX_WAIT_MS", 10))
+
+# 🔹 Request limits
+MAX_REQUEST_TEXTS = 1024
+MAX_BODY_BYTES = 4 * 1024 * 1024
+REQUEST_TIMEOUT = 60  # Seconds a request waits for its batch to be scored
+
+DEFAULT_PORT = 8000
+
+class MicroBatcher:
+    """
+    Coalesces the texts of concurrent requests into shared model batches. One
+    worker thread owns the model; requests wait on a Future for their slice of
+    the batch results.
+    """
+
+    def __init__(self, classify, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.classify = classify
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.pending = queue.Queue()
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "largest_batch": 0, "inference_seconds": 0.0}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="micro-batcher", daemon=True).start()
+
+    def submit(self, texts):
+        """
+        Queues texts for scoring and returns a Future of their label/score dicts.
+        """
+        future = Future()
+        self.pending.put((texts, future))
+        return future
+
+    def _collect(self):
+        # Block for the first request, then take more until the batch is full or its deadline passes
+        batch = [self.pending.get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self.pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            texts = [text for request_texts, _ in batch for text in request_texts]
+
+            started = time.perf_counter()
+            try:
+                with span("inference.batch", requests=len(batch)) as s:
+                    results = self.classify(texts) if texts else []
+                    s.count("texts", len(texts))
+            except Exception:
+                # Score each request on its own, so only the one that breaks the model fails
+                self._score_separately(batch)
+            else:
+                offset = 0
+                for request_texts, future in batch:
+                    future.set_result(results[offset:offset + len(request_texts)])
+                    offset += len(request_texts)
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self.stats["requests"] += len(batch)
+                self.stats["texts"] += len(texts)
+                self.stats["batches"] += 1
+                self.stats["largest_batch"] = max(self.stats["largest_batch"], len(texts))
+                self.stats["inference_seconds"] += elapsed
+
+    def _score_separately(self, batch):
+        for request_texts, future in batch:
+            try:
+                future.set_result(self.classify(request_texts) if request_texts else [])
+            except Exception as e:
+                future.set_exception(e)
+
+    def snapshot_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+        stats["queued"] = self.pending.qsize()
+        stats["mean_batch"] = stats["texts"] / stats["batches"] if stats["batches"] else 0
+        return stats
+
+def load_classifier(max_batch=MAX_BATCH):
+    """
+    Returns a classifier running the sentiment pipeline of sentimentAnalysisV6
+    (the DistilBERT model, or its keyword fallback) and a name for it. The model
+    scores each coalesced batch in one pass of up to max_batch texts, truncating
+    texts longer than it accepts.
+    """
+    # This process is the inference service, so it must not forward to one itself
+    os.environ.pop("INFERENCE_URL", None)
+    import sentimentAnalysisV6
+    pipeline = sentimentAnalysisV6.sentiment_pipeline
+    if not hasattr(pipeline, "tokenizer"):
+        return pipeline, getattr(pipeline, "__name__", "classifier")
+
+    # The pipeline was built with batch_size=32; without truncation a text over
+    # 512 tokens would fail its whole batch
+    def classify(texts):
+        return pipeline(texts, batch_size=max_batch, truncation=True)
+    return classify, pipeline.model.name_or_path
+
+class InferenceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep client connections alive between batches
+
+    def do_GET(self):
+        if self.path != "/healthz":
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+        self.send_json(200, {"status": "ok", "model": self.server.model_name, **self.server.batcher.snapshot_stats()})
+
+    def do_POST(self):
+        if self.path != "/v1/score":
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self.send_json(413, {"error": f"Request body over {MAX_BODY_BYTES} bytes"})
+        try:
+            texts = json.loads(self.rfile.read(length))["texts"]
+            if not isinstance(texts, list):
+                raise ValueError("'texts' must be a list")
+        except (ValueError, KeyError, TypeError) as e:
+            return self.send_json(400, {"error": f"Expected a JSON body {{\"texts\": [...]}}: {e}"})
+        if len(texts) > MAX_REQUEST_TEXTS:
+            return self.send_json(413, {"error": f"At most {MAX_REQUEST_TEXTS} texts per request"})
+
+        try:
+            results = self.server.batcher.submit([str(text) for text in texts]).result(timeout=REQUEST_TIMEOUT)
+        except Exception as e:
+            return self.send_json(503, {"error": f"Scoring failed: {e}"})
+        self.send_json(200, {"model": self.server.model_name, "results": results})
+
+    def send_json(self, status, body):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+class InferenceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, classifier, model_name, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS, quiet=False):
+        super().__init__(address, InferenceHandler)
+        self.batcher = MicroBatcher(classifier, max_batch, max_wait_ms)
+        self.model_name = model_name
+        self.quiet = quiet
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the sentiment model over HTTP, batching concurrent requests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="Texts per model batch")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help="Longest a request waits for others to join its batch")
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request")
+    args = parser.parse_args()
+
+    print("Loading the sentiment model...")
+    classifier, model_name = load_classifier(args.max_batch)
+    server = InferenceServer(
+        (args.host, args.port), classifier, model_name,
+        max_batch=args.max_batch, max_wait_ms=args.max_wait_ms, quiet=args.quiet,
+    )
+    print(f"Scoring with {model_name} on http://{args.host}:{args.port}/v1/score")
+    print(f"Point the pipeline at it with: export INFERENCE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,26 @@
 import sys
 import os
-import subprocess
-import pandas as pd
 import streamlit as st
-import time
-import chardet
 from dotenv import load_dotenv
 from sentimentAnalysisV6 import main as run_sentiment_analysis
+from data.history import score_history
+from pipeline import AGGREGATED_PATH, run_stock
+from sentiment_stats import SOURCE_WEIGHTS, SEC_WEIGHT
+from components.combined_score import combined_score
+from components.profile_toggle import profiled_page
+from single_flight import in_flight
 
 # Add the SEC scripts directory to the system path
 data_processing_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'SEC', 'scripts', 'data_processing'))
 sys.path.append(data_processing_path)
 
-from tickers_ciks import tickers_ciks
-from csv_extractor import fetch_edgar_data, save_filings_to_csv
+from ticker_lookup import get_cik
+from ticker_search import load_index, search
+
+# Add the APIs directory to the system path for the search connectors
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'APIs')))
+
+from connectors import CONNECTORS
 
 # Fetch API key, CX, and Base URL from environment variables
 if 'GOOGLE_SEARCH_API_KEY' not in os.environ or 'YOUTUBE_API_KEY' not in os.environ or 'CX' not in os.environ:
@@ -24,47 +31,83 @@ else:
     CX = os.environ.get("CX")
     BASE_URL = os.environ.get("BASE_URL", "https://www.googleapis.com/customsearch/v1")  # Default BASE_URL if not provided
 
-def update_progress(progress_bar, start, end, delay=0.1):
-    """Function to gradually update a progress bar in the sidebar"""
-    for percent in range(start, end + 1, 5):
-        time.sleep(delay)
-        progress_bar.progress(percent)
-
-def aggregate_csv_data(root_dir, output_file, progress_bar):
-    """Aggregate CSV data from various sources"""
-    data_frames = []
-    
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if filename.endswith(".csv"):
-                file_path = os.path.join(dirpath, filename)
-                try:
-                    df = pd.read_csv(file_path)
-                    data_frames.append(df)
-                except Exception as e:
-                    st.sidebar.error(f"Could not read {file_path}: {e}")
-
-    if not data_frames:
-        st.sidebar.warning("No CSV files found to aggregate.")
-        return None
-    
-    try:
-        aggregate_df = pd.concat(data_frames, axis=1)
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        aggregate_df.to_csv(output_file, index=False)
-        update_progress(progress_bar, 50, 100)  # Finish progress update
-        st.sidebar.success(f"Aggregated data saved to {output_file}")
-        return output_file
-    except Exception as e:
-        st.sidebar.error(f"Error during concatenation: {e}")
+@st.cache_resource
+def load_search_index():
+    """Load the company name search index once per server process"""
+    return load_index()
+
+def show_history(subject):
+    """Show the latest stored score and history of a subject, without recomputing anything"""
+    history = score_history(subject)
+    if history.empty:
+        return
+    st.subheader("Sentiment History")
+
+    # Runs from the refresh daemon make this instant for watchlist subjects
+    latest = history['weighted_score'].iloc[-1]
+    delta = latest - history['weighted_score'].iloc[-2] if len(history) > 1 else None
+    st.metric("Latest Weighted Score", f"{latest:.2f}", None if delta is None else f"{delta:+.2f}")
+    st.caption(f"Last refreshed {history.index[-1]:%Y-%m-%d %H:%M} UTC")
+    st.line_chart(history)
+
+def run_pipeline(stock_symbol, query):
+    """
+    Run the stock pipeline of pipeline.py, showing its stages in the sidebar. A run
+    of the same stock and query elsewhere (another session or the refresh daemon)
+    is joined instead of repeated. Returns the run's results and insider sentiment, or None
+    """
+    # Check if we're using the fallback classifier
+    is_using_fallback = False
+    if hasattr(run_sentiment_analysis, "__module__") and run_sentiment_analysis.__module__ == "__main__":
+        is_using_fallback = True
+    elif callable(run_sentiment_analysis) and not hasattr(run_sentiment_analysis, "tokenizer"):
+        is_using_fallback = True
+
+    if is_using_fallback:
+        st.warning("⚠️ Using simplified sentiment analysis due to HuggingFace connection issues. Results may be less accurate than normal.")
+
+    status = st.sidebar.empty()
+    if in_flight(("pipeline.stock", stock_symbol, query or stock_symbol)):
+        status.info(f"A run for {stock_symbol} with this query is already in progress elsewhere. Its results will be shown here.")
+
+    # Each source is appended to the aggregated file for the Results page as it arrives
+    with st.spinner("Running the pipeline..."):
+        outcome, shared = run_stock(stock_symbol, query, AGGREGATED_PATH, progress=status.info)
+    status.empty()
+
+    if outcome is None:
+        if shared:
+            st.sidebar.warning(f"The run for {stock_symbol} elsewhere did not complete.")
+        else:
+            st.sidebar.warning(f"The run for {stock_symbol} did not complete: its SEC filings could not be processed or no source returned results.")
         return None
 
+    _, results, insider_sentiment = outcome
+    scored_sources = {res[0] for res in results}
+    for source in CONNECTORS:
+        if source not in scored_sources:
+            st.sidebar.error(f"No results from {source}; it may have run out of API requests. Please try again later.")
+    return results, insider_sentiment
+
 def main():
     st.title("Stock Data Aggregation & Sentiment Analysis: Pipeline 7")
 
     # Sidebar Inputs
     st.sidebar.title("Pipeline Execution")
-    stock_symbol = st.text_input("Enter the stock symbol:")
+    stock_input = st.text_input("Enter the stock symbol or company name:")
+    stock_symbol = stock_input.strip()
+
+    # Suggest tickers when the input is not an exact symbol
+    if stock_symbol and not get_cik(stock_symbol):
+        suggestions = search(stock_symbol, index=load_search_index())
+        if suggestions:
+            choice = st.selectbox(
+                "Matching companies:",
+                suggestions,
+                format_func=lambda match: f"{match['ticker']} - {match['title']}"
+            )
+            stock_symbol = choice['ticker']
+
     query = st.text_input("Enter the search query:")
 
     if st.button("Run Pipeline"):
@@ -72,181 +115,15 @@ def main():
             st.sidebar.error("Please enter a stock symbol.")
             return
 
-        cik = tickers_ciks.get(stock_symbol.upper())
-        if not cik:
-            st.sidebar.error(f"Stock symbol {stock_symbol} not found in tickers_ciks.")
-            return
-
-        python_interpreter = sys.executable
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-
-        ### **SEC Filings Processing**
-        st.sidebar.info("Fetching SEC filings...")
-        sec_progress = st.sidebar.progress(0)
-        update_progress(sec_progress, 0, 30)
-
-        form_4_df = fetch_edgar_data(cik)
-        if not form_4_df.empty:
-            save_filings_to_csv(stock_symbol, form_4_df)
-            st.sidebar.success(f"Saved SEC filings for {stock_symbol}.")
-        else:
-            st.sidebar.warning(f"No SEC filings found for {stock_symbol}.")
-            return
-
-        update_progress(sec_progress, 30, 100)
-
-        ### **Processing SEC CSV Files**
-        processing_scripts = ["read_csv.py", "xml_extractor.py", "read_xml.py", "Summarize.py"]
-        process_progress = st.sidebar.progress(0)
-
-        for i, script_name in enumerate(processing_scripts):
-            script_path = os.path.join(data_processing_path, script_name)
-            if not os.path.exists(script_path):
-                st.sidebar.error(f"Error: {script_path} not found.")
-                return
-            subprocess.run([python_interpreter, script_path, stock_symbol])
-            
-            next_progress = min((i + 1) * 25, 100)
-            update_progress(process_progress, i * 25, next_progress)
-
-        ### **YouTube API Processing**
-        st.sidebar.info("Running YouTube API script...")
-        youtube_progress = st.sidebar.progress(0)
-
-        youtube_script = os.path.join(base_dir, "APIs", "youtube_api", "youtubeAPI.py")
-        if not os.path.exists(youtube_script):
-            st.sidebar.error(f"Error: {youtube_script} not found.")
+        stock_symbol = stock_symbol.upper()
+        if not get_cik(stock_symbol):
+            st.sidebar.error(f"Stock symbol {stock_symbol} not found in the SEC ticker lookup.")
             return
 
-        total_results = 50
-        youtube_process = subprocess.Popen(
-            [python_interpreter, youtube_script, query, str(total_results)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        update_progress(youtube_progress, 0, 50)
-        youtube_stdout, youtube_stderr = youtube_process.communicate()
-        update_progress(youtube_progress, 50, 100)
-
-        st.sidebar.subheader("YouTube API Output")
-        if youtube_stdout:
-            st.sidebar.text(youtube_stdout.decode())
-        if youtube_stderr:
-            st.sidebar.error("Error in YouTube API")
-            st.sidebar.text(youtube_stderr.decode())
-
-        ### **Google Search API Processing**
-        st.sidebar.info("Running Google Search API script...")
-        google_progress = st.sidebar.progress(0)
-
-        google_script = os.path.join(base_dir, "APIs", "google_search", "googleAPI.py")
-        if not os.path.exists(google_script):
-            st.sidebar.error(f"Error: {google_script} not found.")
+        outcome = run_pipeline(stock_symbol, query.strip())
+        if outcome is None:
             return
-
-        google_process = subprocess.Popen(
-            [python_interpreter, google_script, query],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        update_progress(google_progress, 0, 50)
-        google_stdout, google_stderr = google_process.communicate()
-        update_progress(google_progress, 50, 100)
-
-        st.sidebar.subheader("Google Search API Output")
-        if google_stdout:
-            st.sidebar.text(google_stdout.decode())
-        if google_stderr:
-            st.sidebar.error("Error in Google Search API")
-            st.sidebar.text(google_stderr.decode())
-
-        ### **CSV Aggregation**
-        st.sidebar.info("Aggregating CSV files...")
-        aggregate_progress = st.sidebar.progress(0)
-
-        root_dir = os.path.join(base_dir, "data")
-        output_file = os.path.join(base_dir, "aggregated_data.csv")
-
-        update_progress(aggregate_progress, 0, 50)
-        aggregated = aggregate_csv_data(root_dir, output_file, aggregate_progress)
-        update_progress(aggregate_progress, 50, 100)
-
-        if aggregated:
-            st.sidebar.success("Aggregation complete.")
-
-        ### **Sentiment Analysis**
-        st.sidebar.info("Performing sentiment analysis...")
-        sentiment_progress = st.sidebar.progress(0)
-
-        # Check if aggregated data file exists
-        aggregated_file = os.path.join(base_dir, "aggregated_data.csv")
-        if not os.path.exists(aggregated_file):
-            st.sidebar.error(f"Error: '{aggregated_file}' not found.")
-            return
-
-        # Read the aggregated CSV file
-        try:
-            # Try to detect encoding
-            with open(aggregated_file, 'rb') as f:
-                result = chardet.detect(f.read(10000))
-                encoding = result['encoding']
-            
-            # Read with detected encoding
-            df = pd.read_csv(aggregated_file, encoding=encoding)
-            update_progress(sentiment_progress, 25, 50)
-        except Exception as e:
-            try:
-                # Fallback to utf-8
-                df = pd.read_csv(aggregated_file, encoding='utf-8')
-                update_progress(sentiment_progress, 25, 50)
-            except Exception as e:
-                try:
-                    # Fallback to latin1
-                    df = pd.read_csv(aggregated_file, encoding='latin1')
-                    update_progress(sentiment_progress, 25, 50)
-                except Exception as e:
-                    st.sidebar.error(f"Error reading aggregated data: {e}")
-                    return
-
-        # Read SEC data
-        sec_file_path = os.path.join(base_dir, 'SEC', 'data', 'form4transactions', 'summary', 'summary_data.csv')
-        try:
-            sec_df = pd.read_csv(sec_file_path, encoding=encoding)
-            first_company = sec_df.iloc[0]
-            insider_sentiment = first_company['sentiment_score']
-        except Exception as e:
-            st.sidebar.warning(f"Could not read SEC data: {e}")
-            insider_sentiment = 0
-
-        # Run sentiment analysis directly
-        update_progress(sentiment_progress, 50, 75)
-        
-        # Check if we're using the fallback classifier
-        is_using_fallback = False
-        if hasattr(run_sentiment_analysis, "__module__") and run_sentiment_analysis.__module__ == "__main__":
-            is_using_fallback = True
-        elif callable(run_sentiment_analysis) and not hasattr(run_sentiment_analysis, "tokenizer"):
-            is_using_fallback = True
-            
-        if is_using_fallback:
-            st.warning("⚠️ Using simplified sentiment analysis due to HuggingFace connection issues. Results may be less accurate than normal.")
-        
-        results = []
-        for col in df.columns:
-            try:
-                total_count, positive_percentage, negative_percentage, averageScore = run_sentiment_analysis(df, col)
-                results.append((col, total_count, positive_percentage, negative_percentage, averageScore))
-            except Exception as e:
-                st.sidebar.error(f"Error processing column '{col}': {e}")
-        
-        update_progress(sentiment_progress, 75, 100)
-        
-        # Calculate weighted average
-        google_score = next((res[4] for res in results if res[0] == "GoogleSearch"), 0)
-        youtube_score = next((res[4] for res in results if res[0] == "YouTube"), 0)
-        weighted_score = (google_score * 0.5) + (youtube_score * 0.4) + (insider_sentiment * 0.1)
+        results, insider_sentiment = outcome
         
         st.subheader("Sentiment Analysis Results")
         
@@ -271,34 +148,8 @@ def main():
             
             # Display the combined weighted average
             with tabs[-1]:
-                st.metric("Weighted Average Score", f"{weighted_score:.2f}")
-                
-                # Interpret the score
-                if weighted_score > 0.5:
-                    sentiment = "Very Positive"
-                    color = "green"
-                elif weighted_score > 0.2:
-                    sentiment = "Positive"
-                    color = "lightgreen"
-                elif weighted_score > -0.2:
-                    sentiment = "Neutral"
-                    color = "gray"
-                elif weighted_score > -0.5:
-                    sentiment = "Negative"
-                    color = "orange"
-                else:
-                    sentiment = "Very Negative"
-                    color = "red"
-                
-                st.markdown(f"<h3 style='color: {color}'>Overall Sentiment: {sentiment}</h3>", unsafe_allow_html=True)
-                
-                # Show weight distribution
-                st.write("### Weight Distribution")
-                st.write("The weighted score is calculated as:")
-                st.write(f"- GoogleSearch: {google_score:.2f} × 0.5 = {google_score * 0.5:.2f}")
-                st.write(f"- YouTube: {youtube_score:.2f} × 0.4 = {youtube_score * 0.4:.2f}")
-                st.write(f"- SEC Insider: {insider_sentiment:.2f} × 0.1 = {insider_sentiment * 0.1:.2f}")
-                st.write(f"**Final Score: {weighted_score:.2f}**")
+                # Weights are adjusted in the browser; the stats are sent once
+                combined_score({res[0]: res[4] for res in results}, insider_sentiment, SOURCE_WEIGHTS, SEC_WEIGHT)
                 
                 st.info("For a more detailed analysis with charts and customizable weights, please visit the 'Combined Analysis' page.")
         else:
@@ -306,5 +157,9 @@ def main():
 
         st.sidebar.success("Pipeline execution complete!")
 
+    # Chart the stored runs for this subject, including the one just made
+    if stock_symbol:
+        show_history(stock_symbol.upper())
+
 if __name__ == "__main__":
-    main()
+    profiled_page("stocks_page", main)
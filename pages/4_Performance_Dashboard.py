@@ -0,0 +1,117 @@
+import sys
+import os
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from data.perf import get_stage_daily
+
+# Add the APIs directory to the system path for the response cache ledger
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'APIs')))
+
+from api_cache import quota_usage
+
+# Root spans of full.py and pipeline.py runs: their duration is the run's total latency
+RUN_STAGES = ["full", "pipeline.stock", "pipeline.macro"]
+INFERENCE_STAGE = "sentiment.inference"
+
+st.set_page_config(page_title="Performance Dashboard", page_icon="⏱️")
+
+st.title("Performance Dashboard")
+st.write("Run latency, stage timings, cache hit rates and inference throughput of traced pipeline runs.")
+
+days = st.sidebar.selectbox("Time range", [7, 30, 90, 365], index=1, format_func=lambda d: f"Last {d} days")
+
+@st.cache_data(ttl=60)
+def load_stage_daily(days):
+    """Load the daily stage aggregates of the last days"""
+    return get_stage_daily(days)
+
+@st.cache_data(ttl=60)
+def load_cache_usage(days):
+    """Load the daily response cache hits and misses of each API"""
+    usage = pd.DataFrame(quota_usage(days), columns=['day', 'api', 'units', 'hits', 'misses'])
+    usage['day'] = pd.to_datetime(usage['day'])
+    lookups = usage['hits'] + usage['misses']
+    usage['hit_rate'] = (usage['hits'] / lookups.where(lookups > 0)).fillna(0) * 100
+    return usage.sort_values('day')
+
+def weighted_daily(df, by):
+    """Average seconds per run of each day and group, weighting each subject by its runs"""
+    daily = df.groupby(['day', by], as_index=False)[['seconds', 'runs']].sum()
+    daily['seconds_per_run'] = daily['seconds'] / daily['runs']
+    return daily
+
+stages = load_stage_daily(days)
+
+# ----------------------------------------
+# Run latency
+# ----------------------------------------
+st.subheader("Run Latency")
+runs = stages[stages['stage'].isin(RUN_STAGES)]
+if runs.empty:
+    st.info("No traced runs yet. Runs are recorded here when TRACE_DIR is set, e.g. for the refresh daemon.")
+else:
+    subjects = sorted(runs['subject'].unique())
+    selected = st.multiselect("Tickers and queries", subjects, default=subjects[:5])
+    if selected:
+        runs = runs[runs['subject'].isin(selected)]
+        stages = stages[stages['subject'].isin(selected)]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Runs", int(runs['runs'].sum()))
+    col2.metric("Average run", f"{runs['seconds'].sum() / max(runs['runs'].sum(), 1):.1f} s")
+    col3.metric("Slowest run", f"{runs['max_seconds'].max():.1f} s")
+
+    by_subject = weighted_daily(runs, 'subject')
+    fig = px.line(by_subject, x='day', y='seconds_per_run', color='subject', markers=True,
+                  labels={'day': 'Day', 'seconds_per_run': 'Seconds per run', 'subject': 'Subject'})
+    st.plotly_chart(fig, use_container_width=True)
+
+    # ----------------------------------------
+    # Stage breakdown
+    # ----------------------------------------
+    st.subheader("Stage Breakdown")
+    steps = stages[~stages['stage'].isin(RUN_STAGES)]
+    # Only the direct children of a run are stacked; nested spans are already part of their parents' time
+    by_stage = weighted_daily(steps[steps['depth'] == 1], 'stage')
+    fig = px.bar(by_stage, x='day', y='seconds_per_run', color='stage',
+                 labels={'day': 'Day', 'seconds_per_run': 'Seconds per run', 'stage': 'Stage'})
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.caption("All traced steps, including the nested ones (depth > 1) and those of worker threads and subprocesses (no depth):")
+    totals = steps.groupby('stage', as_index=False).agg(
+        runs=('runs', 'sum'), calls=('calls', 'sum'), seconds=('seconds', 'sum'),
+        items=('items', 'sum'), bytes=('bytes', 'sum'), depth=('depth', 'min'),
+    )
+    totals['seconds_per_run'] = totals['seconds'] / totals['runs']
+    st.dataframe(
+        totals.sort_values(['depth', 'seconds'], ascending=[True, False], na_position='last')[
+            ['stage', 'depth', 'seconds_per_run', 'calls', 'items', 'bytes']
+        ],
+        hide_index=True, use_container_width=True,
+    )
+
+    # ----------------------------------------
+    # Inference throughput
+    # ----------------------------------------
+    st.subheader("Inference Throughput")
+    inference = stages[stages['stage'] == INFERENCE_STAGE].groupby('day', as_index=False)[['items', 'seconds']].sum()
+    if inference.empty:
+        st.write("No inference spans in this range.")
+    else:
+        inference['texts_per_sec'] = inference['items'] / inference['seconds']
+        fig = px.line(inference, x='day', y='texts_per_sec', markers=True,
+                      labels={'day': 'Day', 'texts_per_sec': 'Texts per second'})
+        st.plotly_chart(fig, use_container_width=True)
+
+# ----------------------------------------
+# Cache hit rates
+# ----------------------------------------
+st.subheader("API Cache Hit Rate")
+usage = load_cache_usage(days)
+if usage.empty:
+    st.write("No API requests recorded yet.")
+else:
+    fig = px.line(usage, x='day', y='hit_rate', color='api', markers=True,
+                  labels={'day': 'Day', 'hit_rate': 'Hit rate (%)', 'api': 'API'})
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,203 @@
+import sys
+import os
+import subprocess
+import threading
+import pandas as pd
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Add the SEC scripts directory to the system path
+data_processing_path = os.path.join(base_dir, 'SEC', 'scripts', 'data_processing')
+sys.path.append(data_processing_path)
+
+# Add the APIs directory to the system path for the search connectors
+sys.path.append(os.path.join(base_dir, 'APIs'))
+
+from ticker_lookup import get_cik
+from csv_extractor import fetch_edgar_data, save_filings_to_csv
+from edgar_index import fetch_index_filings, load_form4_index
+from connectors import CONNECTORS
+from data.aggregate import iter_connector_sources, stream_sources
+from data.history import record_run
+from tracing import span, subprocess_env, trace_run
+from profiling import profile_run, python_command
+from sentiment_stats import weighted_average
+from single_flight import run_once
+
+# SEC processing scripts, run in order with the stock symbol as argument
+SEC_SCRIPTS = ["read_csv.py", "xml_extractor.py", "read_xml.py", "Summarize.py"]
+SEC_SUMMARY_PATH = os.path.join(base_dir, 'SEC', 'data', 'form4transactions', 'summary', 'summary_data.csv')
+
+# 🔹 Set FORM4_INDEX to a Form 4 index built by edgar_index.py from the bulk
+# submissions files, so each ticker's filings are looked up locally instead of
+# with one EDGAR request per ticker
+FORM4_INDEX = os.environ.get("FORM4_INDEX")
+
+# Aggregated sources of the last page run, read by the Results page
+AGGREGATED_PATH = os.path.join(base_dir, "aggregated_data.feather")
+
+# The SEC scripts share their working directories, so one ticker is processed at a time
+_sec_lock = threading.Lock()
+
+# One sentiment model is shared by every refresh; inference is CPU-bound, so
+# concurrent refreshes only overlap their API fetches
+_model_lock = threading.Lock()
+
+def read_insider_sentiment(sec_file_path=SEC_SUMMARY_PATH):
+    """
+    Returns the SEC insider sentiment_score of the first company in the summary, or 0.
+    """
+    try:
+        sec_df = pd.read_csv(sec_file_path, encoding='utf-8')
+        return sec_df.iloc[0]['sentiment_score']
+    except Exception as e:
+        print(f"Could not read SEC data: {e}")
+        return 0
+
+def run_sec_stage(stock_symbol, index_path=FORM4_INDEX):
+    """
+    Fetches the SEC filings of a stock symbol and runs the Form 4 processing scripts.
+    With index_path (default: FORM4_INDEX), the filings come from that local Form 4
+    index instead of the EDGAR submissions API.
+    Returns the insider sentiment, or None if the symbol or its filings were not
+    found or a processing script failed.
+    """
+    cik = get_cik(stock_symbol)
+    if not cik:
+        print(f"Stock symbol {stock_symbol} not found in the SEC ticker lookup.")
+        return None
+
+    with _sec_lock:
+        if index_path:
+            form_4_df = fetch_index_filings(cik, load_form4_index(index_path))
+        else:
+            form_4_df = fetch_edgar_data(cik)
+        if form_4_df.empty:
+            print(f"No SEC filings found for {stock_symbol}.")
+            return None
+        if not index_path:
+            save_filings_to_csv(stock_symbol, form_4_df)
+
+        # The summary is shared by every ticker; never let a failed run read the previous one's
+        if os.path.exists(SEC_SUMMARY_PATH):
+            os.remove(SEC_SUMMARY_PATH)
+
+        for script_name in SEC_SCRIPTS:
+            args = [stock_symbol]
+            if index_path and script_name == "read_csv.py":
+                args += ["--index", index_path]
+            # The script records its own spans; this one includes the interpreter start-up
+            with span("sec.subprocess", script=script_name):
+                completed = subprocess.run(
+                    python_command(os.path.join(data_processing_path, script_name), *args),
+                    env=subprocess_env(),
+                )
+            if completed.returncode != 0:
+                print(f"{script_name} failed for {stock_symbol} with exit code {completed.returncode}.")
+                return None
+
+        return read_insider_sentiment()
+
+def score_sources(query, connectors=CONNECTORS, output_file=None, progress=None):
+    """
+    Fetches query from every connector and scores each source, writing the
+    aggregated sources to output_file when given. progress, when given, is called
+    with a message as each source is scored.
+    Returns the (source, total_count, positive%, negative%, averageScore) results
+    and a dict of the scored DataFrames by source.
+    """
+    # Imported here so loading the module does not load the model
+    from sentimentAnalysisV6 import score_texts, summarize_scores
+
+    results = []
+    scored = {}
+    for source, source_df in stream_sources(iter_connector_sources(query, connectors), output_file):
+        if source_df.empty:
+            print(f"No results from {source} for '{query}'.")
+            continue
+
+        if progress:
+            progress(f"Scoring {len(source_df)} texts from {source}...")
+        with _model_lock:
+            scored_df = score_texts(source_df, 'text')
+        if scored_df is None:
+            continue
+        scored[source] = scored_df
+        results.append((source, *summarize_scores(scored_df)))
+    return results, scored
+
+def run_stock_pipeline(stock_symbol, query=None):
+    """
+    Refreshes one stock: SEC filings, search sources and sentiment, appended to
+    the history store. query defaults to the stock symbol. Returns the run_id, or None.
+    A call made while the same refresh is running waits for it and returns its run_id.
+    """
+    run, _ = run_stock(stock_symbol, query)
+    return run[0] if run else None
+
+def run_stock(stock_symbol, query=None, output_file=None, progress=None):
+    """
+    Refreshes one stock like run_stock_pipeline, for callers that show the results.
+    output_file and progress are passed to score_sources; a call that joins a
+    running refresh gets neither, only its results.
+    Returns ((run_id, results, insider_sentiment), shared), with None for a run
+    that did not complete and shared telling whether another caller's run was joined.
+    """
+    stock_symbol = stock_symbol.strip().upper()
+    query = query.strip() if query and query.strip() else stock_symbol
+    return run_once(
+        ("pipeline.stock", stock_symbol, query),
+        _run_stock_pipeline, stock_symbol, query, output_file, progress,
+    )
+
+def _run_stock_pipeline(stock_symbol, query, output_file=None, progress=None):
+    with trace_run("pipeline.stock", subject=stock_symbol), profile_run(f"stock-{stock_symbol}"):
+        if progress:
+            progress(f"Fetching and processing the SEC filings of {stock_symbol}...")
+        insider_sentiment = run_sec_stage(stock_symbol)
+        if insider_sentiment is None:
+            return None
+
+        if progress:
+            progress(f"Fetching search results for '{query}'...")
+        results, scored = score_sources(query, output_file=output_file, progress=progress)
+        if not results:
+            return None
+
+        weighted_score = weighted_average(results, insider_sentiment)
+        run_id = record_run(stock_symbol, "stock", results, weighted_score, insider_sentiment, scored)
+        return run_id, results, insider_sentiment
+
+def run_macro_pipeline(query):
+    """
+    Refreshes one macro query: search sources and sentiment, appended to the
+    history store. Returns the run_id, or None. A call made while the same
+    refresh is running waits for it and returns its run_id.
+    """
+    run, _ = run_macro(query)
+    return run[0] if run else None
+
+def run_macro(query, output_file=None, progress=None):
+    """
+    Refreshes one macro query like run_macro_pipeline, for callers that show the
+    results. output_file and progress are passed to score_sources; a call that
+    joins a running refresh gets neither, only its results.
+    Returns ((run_id, results, insider_sentiment), shared), with None for a run
+    that did not complete and shared telling whether another caller's run was joined.
+    """
+    query = query.strip()
+    return run_once(("pipeline.macro", query), _run_macro_pipeline, query, output_file, progress)
+
+def _run_macro_pipeline(query, output_file=None, progress=None):
+    with trace_run("pipeline.macro", subject=query), profile_run(f"macro-{query}"):
+        if progress:
+            progress(f"Fetching search results for '{query}'...")
+        results, scored = score_sources(query, output_file=output_file, progress=progress)
+        if not results:
+            return None
+
+        with _sec_lock:
+            insider_sentiment = read_insider_sentiment()
+        weighted_score = weighted_average(results, insider_sentiment)
+        run_id = record_run(query, "macro", results, weighted_score, insider_sentiment, scored)
+        return run_id, results, insider_sentiment
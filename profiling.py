@@ -0,0 +1,113 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 🔹 PROFILE_RUNS=1 profiles every pipeline run; otherwise only runs asked for
+# explicitly (full.py --profile, the sidebar toggle of the model pages) are profiled
+PROFILE_RUNS = os.environ.get("PROFILE_RUNS", "").lower() in ("1", "true", "yes")
+
+# 🔹 Define where profiles are saved (the repo is read-only on Streamlit Cloud)
+if "STREAMLIT_SERVER" in os.environ:
+    PROFILE_DIR = os.path.join("/tmp", "profiles")
+else:
+    PROFILE_DIR = os.environ.get("PROFILE_DIR", os.path.join(base_dir, "profiles"))
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 10
+
+# The interpreter allows one profiler at a time, so concurrent runs are not profiled
+_profile_lock = threading.Lock()
+
+# Directory of the profiled run in progress on each thread, where the run's
+# subprocesses save their profiles too. Other sessions' runs are not profiled.
+_local = threading.local()
+
+def _slug(name):
+    # Run names include user queries; keep them to one safe path component
+    return re.sub(r"[^A-Za-z0-9_-]+", "-", name).strip("-")[:80] or "run"
+
+def python_command(script_path, *args):
+    """
+    Returns the command line that runs a Python script as a subprocess. During
+    a profiled run the script runs under cProfile and saves its profile next to the run's.
+    """
+    active_dir = getattr(_local, "active_dir", None)
+    if active_dir is None:
+        return [sys.executable, script_path, *args]
+    output = os.path.join(active_dir, f"{os.path.splitext(os.path.basename(script_path))[0]}.prof")
+    return [sys.executable, "-m", "cProfile", "-o", output, script_path, *args]
+
+def write_report(path, name, elapsed, profiler, snapshot, peak):
+    """
+    Writes the text report of a profiled run: the slowest functions by
+    cumulative time and the source lines holding the most memory at the end.
+    """
+    stats_text = io.StringIO()
+    pstats.Stats(profiler, stream=stats_text).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"Run: {name}\n")
+        file.write(f"Wall time: {elapsed:.2f} s\n")
+        file.write(f"Peak traced memory: {peak / (1024 * 1024):.1f} MB\n\n")
+        file.write(f"Top {TOP_ALLOCATIONS} allocation sites (memory held at the end of the run)\n")
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            file.write(f"  {stat}\n")
+        file.write(f"\nTop {TOP_FUNCTIONS} functions by cumulative time\n")
+        file.write(stats_text.getvalue())
+
+@contextmanager
+def profile_run(name, enabled=None):
+    """
+    Profiles the enclosed run with cProfile and tracemalloc when enabled
+    (default: PROFILE_RUNS) and saves profile.prof and report.txt to a new
+    directory under PROFILE_DIR. Yields a dict with the 'dir' of the run's
+    profiles, or None when the run is not profiled; off, it adds nothing to the run.
+    """
+    enabled = PROFILE_RUNS if enabled is None else enabled
+    if not enabled:
+        yield None
+        return
+    if not _profile_lock.acquire(blocking=False):
+        print(f"Another run is being profiled; running {name} without the profiler.")
+        yield None
+        return
+
+    try:
+        run_dir = os.path.join(PROFILE_DIR, f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{_slug(name)}")
+        os.makedirs(run_dir, exist_ok=True)
+        profile = {"dir": run_dir}
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        profiler = cProfile.Profile()
+        _local.active_dir = run_dir
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield profile
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            _local.active_dir = None
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+
+            profiler.dump_stats(os.path.join(run_dir, "profile.prof"))
+            write_report(os.path.join(run_dir, "report.txt"), name, elapsed, profiler, snapshot, peak)
+            print(f"Profile of {name} saved to {run_dir}")
+    finally:
+        _profile_lock.release()
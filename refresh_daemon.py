@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from data.history import get_runs
+from pipeline import run_stock_pipeline, run_macro_pipeline
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 🔹 Watchlist of tickers and macro queries to keep fresh
+WATCHLIST_PATH = os.environ.get("WATCHLIST_PATH", os.path.join(base_dir, "watchlist.json"))
+
+# 🔹 Seconds between refreshes of each subject
+REFRESH_INTERVAL = int(os.environ.get("REFRESH_INTERVAL", 60 * 60))
+
+# 🔹 Subjects refreshed at once. Each refresh spends API quota, so keep this small.
+MAX_WORKERS = int(os.environ.get("REFRESH_WORKERS", 2))
+
+def load_watchlist(path=WATCHLIST_PATH):
+    """
+    Returns the refresh jobs of a watchlist as (kind, subject, query) tuples.
+    """
+    with open(path, encoding="utf-8") as file:
+        watchlist = json.load(file)
+
+    jobs = []
+    for stock in watchlist.get("stocks", []):
+        if isinstance(stock, str):
+            stock = {"symbol": stock}
+        jobs.append(("stock", stock["symbol"].strip().upper(), stock.get("query")))
+    for query in watchlist.get("macro", []):
+        jobs.append(("macro", query.strip(), query.strip()))
+    return jobs
+
+def is_fresh(subject, max_age):
+    """
+    Whether the subject already has a run from the last max_age seconds (e.g. from a page).
+    """
+    return not get_runs(subject, start=time.time() - max_age).empty
+
+def refresh(kind, subject, query):
+    """
+    Runs the pipeline of one watchlist entry. Returns the run_id, or None.
+    """
+    try:
+        if kind == "stock":
+            return run_stock_pipeline(subject, query)
+        return run_macro_pipeline(query)
+    except Exception as e:
+        print(f"Error refreshing {subject}: {e}")
+        return None
+
+def refresh_all(jobs, interval=REFRESH_INTERVAL, max_workers=MAX_WORKERS):
+    """
+    Refreshes every stale watchlist entry, at most max_workers at a time.
+    Entries run within the last half interval are skipped, so a page run
+    defers the refresh without the previous cycle's runs doing the same.
+    """
+    stale = [job for job in jobs if not is_fresh(job[1], interval / 2)]
+    print(f"Refreshing {len(stale)} of {len(jobs)} watchlist entries...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(refresh, *job): job for job in stale}
+        for future, (kind, subject, _) in futures.items():
+            run_id = future.result()
+            if run_id is None:
+                print(f"❌ {subject}: refresh failed")
+            else:
+                print(f"✅ {subject}: stored run {run_id}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Periodically refresh the sentiment of a watchlist.")
+    parser.add_argument("--watchlist", default=WATCHLIST_PATH, help="Path to the watchlist JSON file")
+    parser.add_argument("--interval", type=int, default=REFRESH_INTERVAL, help="Seconds between refreshes")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Subjects refreshed at once")
+    parser.add_argument("--once", action="store_true", help="Refresh stale entries once and exit")
+    args = parser.parse_args()
+
+    while True:
+        started = time.time()
+        # Re-read every cycle so watchlist edits apply without a restart
+        refresh_all(load_watchlist(args.watchlist), args.interval, args.workers)
+        if args.once:
+            break
+        time.sleep(max(0, args.interval - (time.time() - started)))
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("Refresh daemon stopped.")
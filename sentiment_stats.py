@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+# The adjusted score runs from -1 (strongly negative) to 1 (strongly positive)
+SCORE_RANGE = (-1.0, 1.0)
+HISTOGRAM_BINS = 20
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+# Weight of each source's average score in the combined score; the SEC insider
+# sentiment makes up the rest
+SOURCE_WEIGHTS = {"GoogleSearch": 0.5, "YouTubeSearch": 0.4}
+SEC_WEIGHT = 0.1
+
+def _counts(sub_df):
+    # Each unique text stands for 'count' duplicate texts
+    return sub_df['count'] if 'count' in sub_df.columns else pd.Series(1, index=sub_df.index)
+
+def summarize_scores(sub_df):
+    """
+    Computes statistics (positive%, negative%, averageScore) of scored rows and
+    returns counts and averages for them.
+    """
+
+    # Identify strong positives/negatives (score > 0.85)
+    strong_positive = sub_df[(sub_df['sentiment'] == "POSITIVE") & (sub_df['score'] > 0.85)]
+    strong_negative = sub_df[(sub_df['sentiment'] == "NEGATIVE") & (sub_df['score'] > 0.85)]
+
+    # Calculate statistics, weighting each unique text by the duplicates it stands for
+    counts = _counts(sub_df)
+    total_count = int(counts.sum())
+    positive_count = counts[strong_positive.index].sum()
+    negative_count = counts[strong_negative.index].sum()
+
+    # Avoid zero-division if total_count = 0
+    if total_count > 0:
+        positive_percentage = positive_count / total_count * 100
+        negative_percentage = negative_count / total_count * 100
+        averageScore = np.average(sub_df['adjustedScore'], weights=counts)
+    else:
+        positive_percentage = 0
+        negative_percentage = 0
+        averageScore = 0
+
+    return total_count, positive_percentage, negative_percentage, averageScore
+
+def score_histogram(sub_df, bins=HISTOGRAM_BINS):
+    """
+    Bins the adjusted scores of scored rows into equal-width bins over SCORE_RANGE.
+    Returns one row per bin (bin_start, bin_end, count), so charts stay the same
+    size however many texts were scored.
+    """
+    counts, edges = np.histogram(sub_df['adjustedScore'], bins=bins, range=SCORE_RANGE, weights=_counts(sub_df))
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts.astype('int64')})
+
+def score_quantiles(sub_df, quantiles=QUANTILES):
+    """
+    Returns the count-weighted quantiles of the adjusted scores, keyed by quantile.
+    """
+    if sub_df.empty:
+        return {q: 0.0 for q in quantiles}
+
+    order = np.argsort(sub_df['adjustedScore'].to_numpy())
+    scores = sub_df['adjustedScore'].to_numpy()[order]
+    cumulative = np.cumsum(_counts(sub_df).to_numpy()[order])
+    positions = np.searchsorted(cumulative, [q * cumulative[-1] for q in quantiles])
+    return {q: float(scores[min(p, len(scores) - 1)]) for q, p in zip(quantiles, positions)}
+
+def weighted_average(results, insider_sentiment, weights=SOURCE_WEIGHTS, sec_weight=SEC_WEIGHT):
+    """
+    Combines the average score of each source and the SEC insider sentiment
+    with weights and sec_weight. A source without results counts as 0 and keeps its weight.
+    """
+    scores = {res[0]: res[4] for res in results}
+    return sum(scores.get(source, 0) * weight for source, weight in weights.items()) + insider_sentiment * sec_weight
@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import Future
+
+# Runs in progress in this process by key. Streamlit sessions run their scripts
+# on threads of one server process, so every session sees the same runs.
+_in_flight = {}
+_lock = threading.Lock()
+
+class _Abandoned(Exception):
+    """Set on a run's future when its caller was stopped (e.g. a Streamlit rerun) before it finished."""
+
+def in_flight(key):
+    """
+    Whether a run with this key is in progress.
+    """
+    with _lock:
+        return key in _in_flight
+
+def run_once(key, fn, *args, **kwargs):
+    """
+    Runs fn(*args, **kwargs) unless a run with the same key is already in
+    progress, in which case waits for that run and returns its result instead.
+    Returns (result, shared), where shared tells whether the result came from
+    another caller's run. Errors of the run are raised to every caller.
+    """
+    while True:
+        with _lock:
+            future = _in_flight.get(key)
+            if future is None:
+                future = _in_flight[key] = Future()
+                break
+        try:
+            return future.result(), True
+        except _Abandoned:
+            # The run was stopped before it finished; run it here instead
+            continue
+
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    except BaseException:
+        # Stopping this caller must not stop the others waiting on the run
+        future.set_exception(_Abandoned())
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _lock:
+            _in_flight.pop(key, None)
+    return result, False
@@ -0,0 +1,2 @@
+# Offline stand-ins for the EDGAR, YouTube, Google Search and market cap APIs.
+# Start one with `python -m stubs.server` and set STUB_SERVER_URL to point the connectors at it.
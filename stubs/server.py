@@ -0,0 +1,360 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 🔹 Recorded responses replayed by the stand-in APIs
+YOUTUBE_TITLES_PATH = os.path.join(base_dir, 'data', 'youtube_csv', 'youtube_titles.csv')
+GOOGLE_RESULTS_PATH = os.path.join(base_dir, 'data', 'google_search_csv', 'google_search_results.csv')
+FILINGS_DIR = os.path.join(base_dir, 'SEC', 'data', 'CSV', 'raw')
+XML_DIR = os.path.join(base_dir, 'SEC', 'data', 'XML', 'raw')
+COMPANY_TICKERS_PATH = os.path.join(base_dir, 'SEC', 'data', 'company_tickers.json')
+
+# Market caps served in place of the yfinance lookup, also used by benchmarks/bench_sec.py
+MARKET_CAPS = {
+    "NVDA": 3_000_000_000_000,
+    "AAPL": 3_400_000_000_000,
+    "LLY": 700_000_000_000,
+    "BBW": 500_000_000,
+}
+DEFAULT_MARKET_CAP = 10_000_000_000
+
+DEFAULT_PORT = 8765
+MAX_GOOGLE_RESULTS = 100  # Custom Search rejects start indexes past the 100th result
+
+# Routes of every stand-in API, matched against the request path in order
+ROUTES = [
+    ("youtube", re.compile(r"^/youtube/v3/search$")),
+    ("google", re.compile(r"^/customsearch/v1$")),
+    ("edgar", re.compile(r"^/submissions/CIK(?P<cik>\d+)\.json$")),
+    ("archives", re.compile(r"^/Archives/edgar/data/(?P<cik>\d+)/(?P<accession>\d+)/.+$")),
+    ("quote", re.compile(r"^/v7/finance/quote$")),
+]
+
+# Dates in the rendered Form 4 documents (Month/Day/Year)
+FORM_DATE = re.compile(rb"\b(\d{2})/(\d{2})/(\d{4})\b")
+
+def read_titles(path):
+    """
+    Returns the titles of a connector CSV (one source-name header, then one title per row).
+    """
+    with open(path, mode='r', newline='', encoding='utf-8') as csvfile:
+        return [row[0] for row in list(csv.reader(csvfile))[1:] if row]
+
+def load_fixtures():
+    """
+    Loads the recorded responses: search titles, each company's submissions
+    (saved by csv_extractor.py) and the Form 4 documents by accession number.
+    """
+    with open(COMPANY_TICKERS_PATH, 'r', encoding='utf-8') as file:
+        ciks = {info['ticker'].upper(): int(info['cik_str']) for info in json.load(file).values()}
+
+    filings = {}
+    for filename in sorted(os.listdir(FILINGS_DIR)):
+        if not filename.endswith('_form_4_filings.csv'):
+            continue
+        ticker = filename.split('_')[0].upper()
+        if ticker not in ciks:
+            continue
+        with open(os.path.join(FILINGS_DIR, filename), mode='r', newline='', encoding='utf-8') as csvfile:
+            filings[ciks[ticker]] = {"ticker": ticker, "rows": list(csv.DictReader(csvfile))}
+
+    # xml_extractor.py saves each filing as <ticker>_<accession number without dashes>.xml
+    documents = {
+        os.path.splitext(filename)[0].split('_')[-1]: os.path.join(XML_DIR, filename)
+        for filename in os.listdir(XML_DIR)
+        if filename.endswith('.xml')
+    }
+
+    # Recorded filings are moved forward in time so they stay within the six-month window
+    filing_dates = [row['filingDate'] for company in filings.values() for row in company['rows']]
+    newest = max((date.fromisoformat(d) for d in filing_dates), default=date.today())
+
+    return {
+        "youtube": read_titles(YOUTUBE_TITLES_PATH),
+        "google": read_titles(GOOGLE_RESULTS_PATH),
+        "filings": filings,
+        "documents": documents,
+        "date_shift": date.today() - timedelta(days=1) - newest,
+    }
+
+def _video_id(title):
+    return hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest()[:11]
+
+def youtube_search(fixtures, params):
+    """
+    Returns a search.list page of the recorded titles, paged by nextPageToken.
+    Every query replays the same titles.
+    """
+    titles = fixtures["youtube"]
+    start = int(params.get("pageToken") or 0)
+    count = min(int(params.get("maxResults") or 5), 50)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    items = [
+        {
+            "kind": "youtube#searchResult",
+            "id": {"kind": "youtube#video", "videoId": _video_id(title)},
+            "snippet": {
+                "publishedAt": (now - timedelta(hours=start + i)).isoformat().replace("+00:00", "Z"),
+                "title": title,
+                "channelTitle": "Stub Channel",
+            },
+        }
+        for i, title in enumerate(titles[start:start + count])
+    ]
+    body = {
+        "kind": "youtube#searchListResponse",
+        "pageInfo": {"totalResults": len(titles), "resultsPerPage": count},
+        "items": items,
+    }
+    if start + count < len(titles):
+        body["nextPageToken"] = str(start + count)
+    return 200, body
+
+def google_search(fixtures, params):
+    """
+    Returns a Custom Search page of the recorded results. Like the real API, the
+    response has no items once the results run out.
+    """
+    start = int(params.get("start") or 1)
+    count = min(int(params.get("num") or 10), 10)
+    if start + count - 1 > MAX_GOOGLE_RESULTS:
+        return 400, {"error": {"code": 400, "message": "Request contains an invalid argument."}}
+
+    titles = fixtures["google"][start - 1:start - 1 + count]
+    body = {"kind": "customsearch#search", "queries": {}}
+    if titles:
+        body["items"] = [
+            {
+                "kind": "customsearch#result",
+                "title": title,
+                "link": f"https://example.com/{_video_id(title)}",
+                "displayLink": "example.com",
+                "snippet": title,
+            }
+            for title in titles
+        ]
+    return 200, body
+
+def edgar_submissions(fixtures, cik):
+    """
+    Returns a company's recorded submissions in the data.sec.gov layout, with
+    the filing dates moved forward by the fixtures' date shift.
+    """
+    company = fixtures["filings"].get(int(cik))
+    if company is None:
+        return 404, {"error": f"No recorded submissions for CIK {cik}"}
+
+    recent = {}
+    for row in company["rows"]:
+        for column, value in row.items():
+            if column == 'filingDate':
+                value = (date.fromisoformat(value) + fixtures["date_shift"]).isoformat()
+            elif column in ('size', 'isXBRL', 'isInlineXBRL'):
+                value = int(value or 0)
+            recent.setdefault(column, []).append(value)
+
+    return 200, {
+        "cik": str(int(cik)),
+        "tickers": [company["ticker"]],
+        "filings": {"recent": recent, "files": []},
+    }
+
+def shift_document_dates(content, date_shift):
+    """
+    Moves every Month/Day/Year date of a rendered Form 4 document forward by
+    date_shift, like the filing dates of the submissions, so its transactions
+    stay within Summarize.py's six-month window.
+    """
+    def shift(match):
+        month, day, year = (int(group) for group in match.groups())
+        try:
+            shifted = date(year, month, day) + date_shift
+        except ValueError:
+            return match.group(0)
+        return shifted.strftime("%m/%d/%Y").encode('ascii')
+    return FORM_DATE.sub(shift, content)
+
+def market_caps(params):
+    """
+    Returns market caps in the layout of Yahoo Finance's quote endpoint.
+    """
+    symbols = [s.strip().upper() for s in params.get("symbols", "").split(",") if s.strip()]
+    result = [{"symbol": s, "marketCap": MARKET_CAPS.get(s, DEFAULT_MARKET_CAP)} for s in symbols]
+    return 200, {"quoteResponse": {"result": result, "error": None}}
+
+class RateLimiter:
+    """
+    Token bucket per API: each allows rate requests a second, in bursts of up to
+    rate (at least one, so rates below one request a second still let requests through).
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def allow(self, api):
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            burst = max(1.0, self.rate)
+            tokens, updated = self.buckets.get(api, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            self.buckets[api] = (tokens - 1 if allowed else tokens, now)
+            return allowed
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive, like the real APIs
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/_stats":
+            return self.send_json(200, server.snapshot_stats())
+
+        for api, pattern in ROUTES:
+            match = pattern.match(url.path)
+            if match:
+                break
+        else:
+            return self.send_json(404, {"error": f"Unknown path {url.path}"})
+
+        # 🔹 Simulated network latency, rate limits and server errors
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.random_uniform(0, server.jitter))
+        if not server.limiter.allow(api):
+            status, body = 429, {"error": {"code": 429, "message": "Rate limit exceeded."}}
+        elif server.random_uniform(0, 1) < server.error_rate:
+            status, body = 503, {"error": {"code": 503, "message": "The service is currently unavailable."}}
+        elif api == "youtube":
+            status, body = youtube_search(server.fixtures, params)
+        elif api == "google":
+            status, body = google_search(server.fixtures, params)
+        elif api == "edgar":
+            status, body = edgar_submissions(server.fixtures, match["cik"])
+        elif api == "quote":
+            status, body = market_caps(params)
+        else:
+            path = server.fixtures["documents"].get(match["accession"])
+            if path is None:
+                status, body = 404, {"error": f"No recorded filing {match['accession']}"}
+            else:
+                server.count(api, 200)
+                with open(path, 'rb') as file:
+                    content = shift_document_dates(file.read(), server.fixtures["date_shift"])
+                return self.send_body(200, content, "text/html; charset=utf-8")
+
+        server.count(api, status)
+        self.send_json(status, body)
+
+    def send_json(self, status, body):
+        self.send_body(status, json.dumps(body).encode('utf-8'), "application/json; charset=UTF-8")
+
+    def send_body(self, status, content, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, jitter_ms=0, error_rate=0.0, rate_limit=None, seed=None, quiet=False):
+        super().__init__(address, StubHandler)
+        self.fixtures = load_fixtures()
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.limiter = RateLimiter(rate_limit)
+        self.quiet = quiet
+        self.stats = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def random_uniform(self, low, high):
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    def count(self, api, status):
+        with self._lock:
+            counts = self.stats.setdefault(api, {})
+            counts[str(status)] = counts.get(str(status), 0) + 1
+
+    def snapshot_stats(self):
+        """
+        Returns the number of responses served per API and status code.
+        """
+        with self._lock:
+            return {api: dict(counts) for api, counts in self.stats.items()}
+
+def start_server(host="127.0.0.1", port=0, **options):
+    """
+    Starts a stub server on a background thread and returns it; port 0 picks a
+    free port. Point the connectors at server.url through STUB_SERVER_URL and
+    call server.shutdown() when done.
+    """
+    options.setdefault("quiet", True)
+    server = StubServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded EDGAR, YouTube, Google Search and market cap responses.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Extra random delay of up to this much")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 503")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second allowed per API before answering 429")
+    parser.add_argument("--seed", type=int, help="Seed of the latency and error draws")
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request")
+    args = parser.parse_args()
+
+    server = StubServer(
+        (args.host, args.port),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        quiet=args.quiet,
+    )
+    print(f"Stub APIs listening on {server.url}")
+    print(f"Point the connectors at it with: export STUB_SERVER_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
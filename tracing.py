@@ -0,0 +1,320 @@
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: metrics exports of concurrent processes are not serialized
+
+# 🔹 Tracing is on when TRACE_DIR is set. The SEC scripts inherit it (and the
+# run and trace IDs, see subprocess_env) as subprocesses, so their spans land in the same files.
+TRACE_DIR = os.environ.get("TRACE_DIR")
+TRACING = bool(TRACE_DIR)
+if TRACING:
+    # Absolute, so subprocesses started from another directory write to the same place
+    TRACE_DIR = os.environ["TRACE_DIR"] = os.path.abspath(TRACE_DIR)
+
+SPANS_FILE = "spans.jsonl"
+METRICS_FILE = "metrics.prom"
+METRICS_STATE_FILE = "metrics_state.json"  # Running totals behind METRICS_FILE
+METRIC_PREFIX = "sentiment"
+
+class _NoopSpan:
+    """
+    The span handed out while tracing is off: entering, counting and tagging do nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def count(self, name, n=1):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+class Span:
+    """
+    One timed step of a run. Counts add up things processed in the step
+    (filings, titles, texts); attrs describe it (ticker, query, batch size).
+    """
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.counts = {}
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = None
+
+    def __enter__(self):
+        stack = _stack()
+        self.parent_id = stack[-1].span_id if stack else None
+        stack.append(self)
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._started
+        _stack().pop()
+        _record({
+            "trace_id": current_trace_id(),
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_s": duration,
+            "pid": os.getpid(),
+            "thread": threading.current_thread().name,
+            "run_id": current_run_id(),
+            "error": exc_type.__name__ if exc_type else None,
+            "counts": self.counts,
+            "attrs": self.attrs,
+        })
+        return False
+
+    def count(self, name, n=1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+# Open spans of each thread, innermost last
+_local = threading.local()
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+# Finished spans not yet written to SPANS_FILE
+_pending = []
+_lock = threading.Lock()
+
+# Runs open in this process, by run ID, with the spans recorded for each so far
+_open_runs = {}
+
+# Trace ID of each open run; every run is its own trace
+_run_traces = {}
+
+def current_run_id():
+    """
+    Returns the ID of the run the calling code belongs to, or None outside a run.
+    """
+    run_id = getattr(_local, "run_id", None)
+    if run_id:
+        return run_id
+    # The SEC scripts learn their run from the environment (see subprocess_env)
+    if "TRACE_RUN" in os.environ:
+        return os.environ["TRACE_RUN"]
+    # Worker threads, such as concurrent search pages, belong to the only open run
+    runs = list(_open_runs)
+    return runs[0] if len(runs) == 1 else None
+
+def current_trace_id():
+    """
+    Returns the trace ID of the current run, or of this process outside a run.
+    """
+    return _run_traces.get(current_run_id()) or PROCESS_TRACE_ID
+
+def subprocess_env():
+    """
+    Returns the environment for a subprocess of the current run, so the spans it
+    records are attributed to the run. None (inherit everything) with tracing off.
+    """
+    run_id = current_run_id() if TRACING else None
+    if not run_id:
+        return None
+    return dict(os.environ, TRACE_RUN=run_id, TRACE_ID=current_trace_id())
+
+def _record(record):
+    with _lock:
+        _pending.append(record)
+        if record["run_id"] in _open_runs:
+            _open_runs[record["run_id"]].append(record)
+        # Flush when a top-level span ends, so long runs export as they go
+        if record["parent_id"] is None:
+            _flush_locked()
+
+def _flush_locked():
+    global _pending
+    if not _pending:
+        return
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    lines = "".join(json.dumps(record, default=str) + "\n" for record in _pending)
+    # One append per flush keeps the lines of concurrent processes whole
+    with open(os.path.join(TRACE_DIR, SPANS_FILE), "a", encoding="utf-8") as file:
+        file.write(lines)
+    _pending = []
+
+def span(name, **attrs):
+    """
+    Returns a context manager that times a step of the run as a span nested in
+    the enclosing one. With tracing off this is a shared no-op object.
+
+        with span("edgar.fetch_submissions", cik=cik) as s:
+            ...
+            s.count("filings", len(filings))
+    """
+    if not TRACING:
+        return _NOOP_SPAN
+    return Span(name, attrs)
+
+def load_spans(trace_dir=TRACE_DIR, offset=0):
+    """
+    Returns the spans recorded in trace_dir, in the order they finished,
+    starting offset bytes into the spans file.
+    """
+    path = os.path.join(trace_dir, SPANS_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as file:
+        file.seek(offset)
+        return [json.loads(line) for line in file if line.strip()]
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _read_new_spans(path, offset):
+    # Returns the complete span lines after offset, and the offset past them
+    with open(path, "rb") as file:
+        file.seek(offset)
+        data = file.read()
+    end = data.rfind(b"\n") + 1
+    records = [json.loads(line) for line in data[:end].decode("utf-8").splitlines() if line.strip()]
+    return records, offset + end
+
+@contextmanager
+def _export_lock(trace_dir):
+    # Serializes exports across processes, so running totals are never counted twice
+    os.makedirs(trace_dir, exist_ok=True)
+    with open(os.path.join(trace_dir, ".metrics.lock"), "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _write_atomic(path, text):
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_path, path)
+
+def write_openmetrics(trace_dir=TRACE_DIR, output=None):
+    """
+    Summarizes the spans of trace_dir as an OpenMetrics text file: the count
+    and total duration of each span name, and the totals of its counts.
+    Running totals are kept in METRICS_STATE_FILE with the spans file offset
+    they cover, so each export only reads the spans recorded since the last one.
+    Returns the path written.
+    """
+    spans_path = os.path.join(trace_dir, SPANS_FILE)
+    state_path = os.path.join(trace_dir, METRICS_STATE_FILE)
+    empty = {"offset": 0, "durations": {}, "counters": {}}
+
+    with _export_lock(trace_dir):
+        try:
+            with open(state_path, encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            state = empty
+        size = os.path.getsize(spans_path) if os.path.exists(spans_path) else 0
+        if size < state["offset"]:
+            # The spans file was truncated or replaced, so start the totals over
+            state = empty
+
+        records = []
+        if size:
+            records, state["offset"] = _read_new_spans(spans_path, state["offset"])
+        durations, counters = state["durations"], state["counters"]
+        for record in records:
+            count, total = durations.get(record["name"], (0, 0.0))
+            durations[record["name"]] = (count + 1, total + record["duration_s"])
+            for counter, n in record["counts"].items():
+                span_counters = counters.setdefault(record["name"], {})
+                span_counters[counter] = span_counters.get(counter, 0) + n
+
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_span_duration_seconds summary",
+            f"# UNIT {METRIC_PREFIX}_span_duration_seconds seconds",
+            f"# HELP {METRIC_PREFIX}_span_duration_seconds Time spent in each traced step.",
+        ]
+        for name, (count, total) in sorted(durations.items()):
+            lines.append(f'{METRIC_PREFIX}_span_duration_seconds_count{{span="{_label(name)}"}} {count}')
+            lines.append(f'{METRIC_PREFIX}_span_duration_seconds_sum{{span="{_label(name)}"}} {total:.6f}')
+        lines += [
+            f"# TYPE {METRIC_PREFIX}_span_items counter",
+            f"# HELP {METRIC_PREFIX}_span_items Items processed in each traced step.",
+        ]
+        for name, span_counters in sorted(counters.items()):
+            for counter, n in sorted(span_counters.items()):
+                lines.append(f'{METRIC_PREFIX}_span_items_total{{span="{_label(name)}",item="{_label(counter)}"}} {n}')
+        lines.append("# EOF")
+
+        output = output or os.path.join(trace_dir, METRICS_FILE)
+        _write_atomic(output, "\n".join(lines) + "\n")
+        _write_atomic(state_path, json.dumps(state))
+    return output
+
+@contextmanager
+def trace_run(name, subject=None, **attrs):
+    """
+    Runs a whole pipeline run as the root span. When it ends, the OpenMetrics
+    file is refreshed and, given a subject (ticker or query), the run's spans
+    are added to the daily stage timings in data/perf.py. Does nothing with tracing off.
+    """
+    if not TRACING:
+        yield _NOOP_SPAN
+        return
+
+    root = Span(name, attrs)
+    spans_path = os.path.join(TRACE_DIR, SPANS_FILE)
+    offset = os.path.getsize(spans_path) if os.path.exists(spans_path) else 0
+    with _lock:
+        _open_runs[root.span_id] = []
+        _run_traces[root.span_id] = uuid.uuid4().hex
+    previous_run = getattr(_local, "run_id", None)
+    _local.run_id = root.span_id
+    try:
+        with root:
+            yield root
+    finally:
+        _local.run_id = previous_run
+        with _lock:
+            spans = _open_runs.pop(root.span_id)
+            _run_traces.pop(root.span_id)
+            _flush_locked()
+        # The run's subprocesses appended their spans to the file while it ran
+        spans += [
+            record for record in load_spans(TRACE_DIR, offset)
+            if record.get("run_id") == root.span_id and record["pid"] != os.getpid()
+        ]
+        write_openmetrics()
+        if subject:
+            from data.perf import record_stage_timings
+            record_stage_timings(subject, spans, run_at=root.start)
+
+def _export_at_exit():
+    with _lock:
+        _flush_locked()
+    write_openmetrics()
+
+# Trace ID of spans outside a run: the parent run's for a subprocess started with
+# subprocess_env, otherwise one for the whole process
+PROCESS_TRACE_ID = os.environ.get("TRACE_ID") or uuid.uuid4().hex
+
+if TRACING:
+    atexit.register(_export_at_exit)